@@ -0,0 +1,12014 @@
+/* Generated by Cython 0.12.1 on Sat Oct 17 08:29:00 2026 */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+#include "structmember.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#else
+
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#if PY_VERSION_HEX < 0x02040000
+  #define METH_COEXIST 0
+  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
+  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  typedef int Py_ssize_t;
+  #define PY_SSIZE_T_MAX INT_MAX
+  #define PY_SSIZE_T_MIN INT_MIN
+  #define PY_FORMAT_SIZE_T ""
+  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
+  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
+  #define PyNumber_Index(o)    PyNumber_Int(o)
+  #define PyIndex_Check(o)     PyNumber_Check(o)
+  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
+#endif
+
+#if PY_VERSION_HEX < 0x02060000
+  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
+  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
+  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
+  #define PyVarObject_HEAD_INIT(type, size) \
+          PyObject_HEAD_INIT(type) size,
+  #define PyType_Modified(t)
+
+  typedef struct {
+     void *buf;
+     PyObject *obj;
+     Py_ssize_t len;
+     Py_ssize_t itemsize;
+     int readonly;
+     int ndim;
+     char *format;
+     Py_ssize_t *shape;
+     Py_ssize_t *strides;
+     Py_ssize_t *suboffsets;
+     void *internal;
+  } Py_buffer;
+
+  #define PyBUF_SIMPLE 0
+  #define PyBUF_WRITABLE 0x0001
+  #define PyBUF_FORMAT 0x0004
+  #define PyBUF_ND 0x0008
+  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
+  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
+  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
+  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
+  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
+
+#endif
+
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define Py_TPFLAGS_CHECKTYPES 0
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+
+#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#else
+  #define PyBytes_Type                 PyString_Type
+  #define PyBytes_CheckExact           PyString_CheckExact
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
+#endif
+
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#else
+  #define _USE_MATH_DEFINES
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
+  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
+  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
+#else
+  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
+  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
+  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  #define __Pyx_NAMESTR(n) ((char *)(n))
+  #define __Pyx_DOCSTR(n)  ((char *)(n))
+#else
+  #define __Pyx_NAMESTR(n) (n)
+  #define __Pyx_DOCSTR(n)  (n)
+#endif
+#ifdef __cplusplus
+#define __PYX_EXTERN_C extern "C"
+#else
+#define __PYX_EXTERN_C extern
+#endif
+#include <math.h>
+#define __PYX_HAVE_API__cpyamf__amf0
+
+#ifndef CYTHON_INLINE
+  #if defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #else
+    #define CYTHON_INLINE 
+  #endif
+#endif
+
+typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
+
+
+/* Type Conversion Predeclarations */
+
+#if PY_MAJOR_VERSION < 3
+#define __Pyx_PyBytes_FromString          PyString_FromString
+#define __Pyx_PyBytes_FromStringAndSize   PyString_FromStringAndSize
+#define __Pyx_PyBytes_AsString            PyString_AsString
+#else
+#define __Pyx_PyBytes_FromString          PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize   PyBytes_FromStringAndSize
+#define __Pyx_PyBytes_AsString            PyBytes_AsString
+#endif
+
+#define __Pyx_PyBytes_FromUString(s)      __Pyx_PyBytes_FromString((char*)s)
+#define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
+
+#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
+
+#if !defined(T_PYSSIZET)
+#if PY_VERSION_HEX < 0x02050000
+#define T_PYSSIZET T_INT
+#elif !defined(T_LONGLONG)
+#define T_PYSSIZET \
+        ((sizeof(Py_ssize_t) == sizeof(int))  ? T_INT  : \
+        ((sizeof(Py_ssize_t) == sizeof(long)) ? T_LONG : -1))
+#else
+#define T_PYSSIZET \
+        ((sizeof(Py_ssize_t) == sizeof(int))          ? T_INT      : \
+        ((sizeof(Py_ssize_t) == sizeof(long))         ? T_LONG     : \
+        ((sizeof(Py_ssize_t) == sizeof(PY_LONG_LONG)) ? T_LONGLONG : -1)))
+#endif
+#endif
+
+
+#if !defined(T_ULONGLONG)
+#define __Pyx_T_UNSIGNED_INT(x) \
+        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
+        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
+        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
+        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : -1))))
+#else
+#define __Pyx_T_UNSIGNED_INT(x) \
+        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
+        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
+        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
+        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : \
+        ((sizeof(x) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))))
+#endif
+#if !defined(T_LONGLONG)
+#define __Pyx_T_SIGNED_INT(x) \
+        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
+        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
+        ((sizeof(x) == sizeof(int))   ? T_INT : \
+        ((sizeof(x) == sizeof(long))  ? T_LONG : -1))))
+#else
+#define __Pyx_T_SIGNED_INT(x) \
+        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
+        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
+        ((sizeof(x) == sizeof(int))   ? T_INT : \
+        ((sizeof(x) == sizeof(long))  ? T_LONG : \
+        ((sizeof(x) == sizeof(PY_LONG_LONG))   ? T_LONGLONG : -1)))))
+#endif
+
+#define __Pyx_T_FLOATING(x) \
+        ((sizeof(x) == sizeof(float)) ? T_FLOAT : \
+        ((sizeof(x) == sizeof(double)) ? T_DOUBLE : -1))
+
+#if !defined(T_SIZET)
+#if !defined(T_ULONGLONG)
+#define T_SIZET \
+        ((sizeof(size_t) == sizeof(unsigned int))  ? T_UINT  : \
+        ((sizeof(size_t) == sizeof(unsigned long)) ? T_ULONG : -1))
+#else
+#define T_SIZET \
+        ((sizeof(size_t) == sizeof(unsigned int))          ? T_UINT      : \
+        ((sizeof(size_t) == sizeof(unsigned long))         ? T_ULONG     : \
+        ((sizeof(size_t) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))
+#endif
+#endif
+
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
+
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+
+
+#ifdef __GNUC__
+/* Test for GCC > 2.95 */
+#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
+#define likely(x)   __builtin_expect(!!(x), 1)
+#define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* __GNUC__ > 2 ... */
+#define likely(x)   (x)
+#define unlikely(x) (x)
+#endif /* __GNUC__ > 2 ... */
+#else /* __GNUC__ */
+#define likely(x)   (x)
+#define unlikely(x) (x)
+#endif /* __GNUC__ */
+    
+static PyObject *__pyx_m;
+static PyObject *__pyx_b;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+static const char **__pyx_f;
+
+
+/* Type declarations */
+
+/* "/root/package/cpyamf/util.pxd":32
+ *     cdef int at_eof(self) except? -1
+ *     cdef inline Py_ssize_t remaining(self) except? -1
+ *     cdef int seek(self, Py_ssize_t pos, int mode=*) except? -1             # <<<<<<<<<<<<<<
+ *     cdef object getvalue(self)
+ *     cdef int peek(self, char **buf, Py_ssize_t size) except? -1
+ */
+
+struct __pyx_opt_args_6cpyamf_4util_19cBufferedByteStream_seek {
+  int __pyx_n;
+  int mode;
+};
+
+/* "/root/package/cpyamf/codec.pxd":7
+ * 
+ * 
+ * cdef class Codec:             # <<<<<<<<<<<<<<
+ *     cdef public cBufferedByteStream stream
+ *     cdef public object context
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Codec {
+  PyObject_HEAD
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *stream;
+  PyObject *context;
+  PyObject *strict;
+  PyObject *timezone_offset;
+};
+
+/* "/root/package/cpyamf/codec.pxd":22
+ * 
+ * 
+ * cdef class Decoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef object _readElement(self)
+ *     cdef object readType(self, unsigned char t)
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Decoder {
+  struct __pyx_obj_6cpyamf_5codec_Codec __pyx_base;
+  struct __pyx_vtabstruct_6cpyamf_5codec_Decoder *__pyx_vtab;
+};
+
+/* "/root/package/cpyamf/codec.pxd":14
+ * 
+ * 
+ * cdef class Encoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef dict _func_cache
+ * 
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Encoder {
+  struct __pyx_obj_6cpyamf_5codec_Codec __pyx_base;
+  struct __pyx_vtabstruct_6cpyamf_5codec_Encoder *__pyx_vtab;
+  PyObject *_func_cache;
+};
+
+/* "/root/package/cpyamf/amf0.pyx":147
+ * 
+ * 
+ * cdef class Encoder(codec.Encoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Encodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Encoder}
+ */
+
+struct __pyx_obj_6cpyamf_4amf0_Encoder {
+  struct __pyx_obj_6cpyamf_5codec_Encoder __pyx_base;
+  PyObject *use_amf3;
+};
+
+/* "/root/package/cpyamf/amf0.pyx":676
+ * 
+ * 
+ * cdef class Decoder(codec.Decoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Decodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Decoder}
+ */
+
+struct __pyx_obj_6cpyamf_4amf0_Decoder {
+  struct __pyx_obj_6cpyamf_5codec_Decoder __pyx_base;
+};
+
+/* "/root/package/cpyamf/util.pxd":9
+ * 
+ * 
+ * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
+ *     cdef char _endian
+ *     cdef char *buffer
+ */
+
+struct __pyx_obj_6cpyamf_4util_cBufferedByteStream {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *__pyx_vtab;
+  char _endian;
+  char *buffer;
+  int closed;
+  Py_ssize_t pos;
+  Py_ssize_t size;
+  Py_ssize_t length;
+  int wrapped;
+  PyObject *_source;
+  PyObject *_export;
+};
+
+/* "/root/package/cpyamf/util.pxd":66
+ * 
+ * 
+ * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
+ *     cdef int use_hash
+ *     cdef PyObject **data
+ */
+
+struct __pyx_obj_6cpyamf_4util_cIndexedCollection {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *__pyx_vtab;
+  int use_hash;
+  PyObject **data;
+  PyObject *refs;
+  Py_ssize_t size;
+  Py_ssize_t length;
+};
+
+
+/* "/root/package/cpyamf/codec.pxd":22
+ * 
+ * 
+ * cdef class Decoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef object _readElement(self)
+ *     cdef object readType(self, unsigned char t)
+ */
+
+struct __pyx_vtabstruct_6cpyamf_5codec_Decoder {
+  PyObject *(*_readElement)(struct __pyx_obj_6cpyamf_5codec_Decoder *);
+  PyObject *(*readType)(struct __pyx_obj_6cpyamf_5codec_Decoder *, unsigned char);
+};
+static struct __pyx_vtabstruct_6cpyamf_5codec_Decoder *__pyx_vtabptr_6cpyamf_5codec_Decoder;
+
+
+/* "/root/package/cpyamf/codec.pxd":14
+ * 
+ * 
+ * cdef class Encoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef dict _func_cache
+ * 
+ */
+
+struct __pyx_vtabstruct_6cpyamf_5codec_Encoder {
+  PyObject *(*getCustomTypeFunc)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+  PyObject *(*getTypeFunc)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+  PyObject *(*resolveType)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+};
+static struct __pyx_vtabstruct_6cpyamf_5codec_Encoder *__pyx_vtabptr_6cpyamf_5codec_Encoder;
+
+
+/* "/root/package/cpyamf/amf0.pyx":147
+ * 
+ * 
+ * cdef class Encoder(codec.Encoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Encodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Encoder}
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder {
+  struct __pyx_vtabstruct_6cpyamf_5codec_Encoder __pyx_base;
+  int (*_writeElement)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeString)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *, int);
+  Py_ssize_t (*_writeReference)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeArray)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeDict)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeEndObject)(struct __pyx_obj_6cpyamf_4amf0_Encoder *);
+  int (*_writeMixedArray)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeDictionary)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeObject)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeDate)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeXML)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+  int (*_writeAMF3)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *);
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *__pyx_vtabptr_6cpyamf_4amf0_Encoder;
+
+
+/* "/root/package/cpyamf/util.pxd":66
+ * 
+ * 
+ * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
+ *     cdef int use_hash
+ *     cdef PyObject **data
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection {
+  int (*_increase_size)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *);
+  void (*_clear)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *);
+  int (*clear)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *);
+  PyObject *(*_ref)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
+  PyObject *(*getByReference)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
+  Py_ssize_t (*getReferenceTo)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
+  Py_ssize_t (*append)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
+  int (*truncate)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
+};
+static struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *__pyx_vtabptr_6cpyamf_4util_cIndexedCollection;
+
+
+/* "/root/package/cpyamf/util.pxd":9
+ * 
+ * 
+ * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
+ *     cdef char _endian
+ *     cdef char *buffer
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream {
+  int (*wrap)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *);
+  int (*_own)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  PyObject *(*read_view)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
+  Py_ssize_t (*tell)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*close)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*write)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char *, Py_ssize_t);
+  int (*complain_if_closed)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*_increase_buffer)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
+  int (*has_available)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
+  int (*read)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char **, Py_ssize_t);
+  int (*at_eof)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  Py_ssize_t (*remaining)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*seek)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t, struct __pyx_opt_args_6cpyamf_4util_19cBufferedByteStream_seek *__pyx_optional_args);
+  PyObject *(*getvalue)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*peek)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char **, Py_ssize_t);
+  int (*truncate)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
+  int (*consume)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  int (*unpack_int)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, int, long *);
+  int (*unpack_uint)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, int, unsigned long *);
+  int (*pack_int)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, int, long);
+  int (*pack_uint)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, int, unsigned long);
+  int (*read_uchar)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned char *);
+  int (*read_char)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char *);
+  int (*read_ushort)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned short *);
+  int (*read_short)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, short *);
+  int (*read_ulong)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned long *);
+  int (*read_long)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long *);
+  int (*read_24bit_uint)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned long *);
+  int (*read_24bit_int)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long *);
+  int (*write_uchar)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned char);
+  int (*write_char)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char);
+  int (*write_ushort)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned short);
+  int (*write_short)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, short);
+  int (*write_ulong)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned long);
+  int (*write_long)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long);
+  int (*write_24bit_uint)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned long);
+  int (*write_24bit_int)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long);
+  PyObject *(*read_utf8_string)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, unsigned int);
+  int (*write_utf8_string)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *);
+  int (*read_double)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, double *);
+  int (*write_double)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, double);
+  int (*read_float)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, float *);
+  int (*write_float)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, float);
+  int (*append)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *);
+};
+static struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream;
+
+
+/* "/root/package/cpyamf/amf0.pyx":676
+ * 
+ * 
+ * cdef class Decoder(codec.Decoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Decodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Decoder}
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder {
+  struct __pyx_vtabstruct_6cpyamf_5codec_Decoder __pyx_base;
+  PyObject *(*_readNumber)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readBoolean)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readString)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readLongString)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  int (*_readObject)(struct __pyx_obj_6cpyamf_4amf0_Decoder *, PyObject *, PyObject *);
+  PyObject *(*_readASObject)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readReference)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readList)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readMixedArray)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readDate)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readXML)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readTypedObject)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+  PyObject *(*_readAMF3)(struct __pyx_obj_6cpyamf_4amf0_Decoder *);
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *__pyx_vtabptr_6cpyamf_4amf0_Decoder;
+
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct * __Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule((char *)modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+  end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+  }
+  #define __Pyx_RefNannySetupContext(name)           void *__pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r) __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r) __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r) __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XDECREF(r) do { if((r) != NULL) {__Pyx_DECREF(r);} } while(0)
+#else
+  #define __Pyx_RefNannySetupContext(name)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+#endif /* CYTHON_REFNANNY */
+#define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
+#define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
+
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
+    const char* function_name, int kw_allowed); /*proto*/
+
+static PyObject* __Pyx_PyEval_CallObjectWithKeywords(PyObject*, PyObject*, PyObject*); /*proto*/
+
+static double __Pyx__PyObject_AsDouble(PyObject* obj); /* proto */
+
+#define __Pyx_PyObject_AsDouble(obj) \
+    ((likely(PyFloat_CheckExact(obj))) ? \
+     PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
+
+static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
+static int __Pyx_EndUnpack(PyObject *); /*proto*/
+
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+
+
+#define __Pyx_GetItemInt_List(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_List_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+            PyObject *r = PyList_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Tuple_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+
+#define __Pyx_GetItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    PyObject *r;
+    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
+        r = PySequence_GetItem(o, i);
+    }
+    else {
+        r = __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+    }
+    return r;
+}
+
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name, PyObject* kw_name); /*proto*/
+
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
+
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
+
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; /* this is just to have an accurate signature */
+    }
+    else {
+        PyObject *r, *m;
+        m = __Pyx_GetAttrString(L, "append");
+        if (!m) return NULL;
+        r = PyObject_CallFunctionObjArgs(m, x, NULL);
+        Py_DECREF(m);
+        return r;
+    }
+}
+
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
+
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
+
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
+
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
+
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
+
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
+
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
+
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
+
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
+
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
+
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
+
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
+
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
+
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
+
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
+
+static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, long size, int strict);  /*proto*/
+
+static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
+
+static int __Pyx_GetVtable(PyObject *dict, void *vtabptr); /*proto*/
+
+static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
+
+static void __Pyx_AddTraceback(const char *funcname); /*proto*/
+
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
+/* Module declarations from cpyamf.util */
+
+static PyTypeObject *__pyx_ptype_6cpyamf_4util_cBufferedByteStream = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_4util_cIndexedCollection = 0;
+/* Module declarations from cpyamf */
+
+/* Module declarations from cpyamf.codec */
+
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Codec = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Encoder = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Decoder = 0;
+/* Module declarations from cpyamf.amf0 */
+
+static PyTypeObject *__pyx_ptype_6cpyamf_4amf0_Encoder = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_4amf0_Decoder = 0;
+static PyObject *__pyx_v_6cpyamf_4amf0_amf0 = 0;
+static PyObject *__pyx_v_6cpyamf_4amf0_Context = 0;
+static PyObject *__pyx_v_6cpyamf_4amf0_Dictionary = 0;
+static int __pyx_v_6cpyamf_4amf0_float_broken;
+static PyObject *__pyx_v_6cpyamf_4amf0_FUNC_TYPES = 0;
+static PyObject *__pyx_v_6cpyamf_4amf0_DATE_TYPES = 0;
+static PyObject *__pyx_v_6cpyamf_4amf0_CLASS_TYPES = 0;
+static int __pyx_f_6cpyamf_4amf0__init_module(void); /*proto*/
+static Py_ssize_t __pyx_f_6cpyamf_4amf0__get_object_reference(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf0__get_object(PyObject *, Py_ssize_t); /*proto*/
+static int __pyx_f_6cpyamf_4amf0__add_object(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf0__read_bytes(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t, int); /*proto*/
+#define __Pyx_MODULE_NAME "cpyamf.amf0"
+int __pyx_module_is_main_cpyamf__amf0 = 0;
+
+/* Implementation of cpyamf.amf0 */
+static PyObject *__pyx_builtin_basestring;
+static PyObject *__pyx_builtin_ord;
+static PyObject *__pyx_builtin_IOError;
+static PyObject *__pyx_builtin_chr;
+static PyObject *__pyx_builtin_ValueError;
+static char __pyx_k_1[] = "hasAMF3ObjectReference";
+static char __pyx_k_2[] = "Cannot find encoder func for %r";
+static char __pyx_k_3[] = "getEncodableAttributes";
+static char __pyx_k_4[] = "A datetime.time instance was found but AMF0 has no way to encode time objects. Please use datetime.datetime instead (got:%r)";
+static char __pyx_k_5[] = "utf-8";
+static char __pyx_k_6[] = "Callables cannot be serialised";
+static char __pyx_k_8[] = "";
+static char __pyx_k_9[] = "Attempted to read %d bytes from the buffer but only %d remain";
+static char __pyx_k_10[] = "Unsupported ActionScript type %r";
+static char __pyx_k_11[] = "Unknown reference %d";
+static char __pyx_k_12[] = "\nC-extension for L{pyamf.amf0} Python module in L{PyAMF<pyamf>}.\n\n@since: 0.6\n";
+static char __pyx_k_13[] = "Encoder.writeElement (line 500)";
+static char __pyx_k_14[] = "Encoder.writeType (line 510)";
+static char __pyx_k_15[] = "Encoder.writeUndefined (line 519)";
+static char __pyx_k_16[] = "Encoder.writeFunc (line 526)";
+static char __pyx_k_17[] = "Encoder.writeRawAMF (line 532)";
+static char __pyx_k_18[] = "Encoder.writeUnsupported (line 549)";
+static char __pyx_k_19[] = "Encoder.writeNull (line 556)";
+static char __pyx_k_20[] = "Encoder.writeArray (line 562)";
+static char __pyx_k_21[] = "Encoder.writeNumber (line 568)";
+static char __pyx_k_22[] = "Encoder.writeBoolean (line 575)";
+static char __pyx_k_23[] = "Encoder.writeString (line 586)";
+static char __pyx_k_24[] = "Encoder.writeReference (line 599)";
+static char __pyx_k_25[] = "Encoder.writeMixedArray (line 612)";
+static char __pyx_k_26[] = "Encoder.writeObject (line 618)";
+static char __pyx_k_27[] = "Encoder.writeDictionary (line 624)";
+static char __pyx_k_28[] = "Encoder.writeDate (line 631)";
+static char __pyx_k_29[] = "Encoder.writeXML (line 637)";
+static char __pyx_k_30[] = "Encoder.writeAMF3 (line 643)";
+static char __pyx_k_31[] = "Decoder.readNumber (line 899)";
+static char __pyx_k_32[] = "Decoder.readBoolean (line 907)";
+static char __pyx_k_33[] = "Decoder.readNull (line 913)";
+static char __pyx_k_34[] = "Decoder.readUndefined (line 919)";
+static char __pyx_k_35[] = "Decoder.readMixedArray (line 925)";
+static char __pyx_k_36[] = "Decoder.readList (line 933)";
+static char __pyx_k_37[] = "Decoder.readTypedObject (line 939)";
+static char __pyx_k_38[] = "Decoder.readAMF3 (line 946)";
+static char __pyx_k_39[] = "Decoder.readString (line 952)";
+static char __pyx_k_40[] = "Decoder.readObject (line 958)";
+static char __pyx_k_41[] = "Decoder.readReference (line 966)";
+static char __pyx_k_42[] = "Decoder.readDate (line 974)";
+static char __pyx_k_43[] = "Decoder.readLongString (line 980)";
+static char __pyx_k_44[] = "Decoder.readXML (line 986)";
+static char __pyx_k__s[] = "s";
+static char __pyx_k__ET[] = "ET";
+static char __pyx_k__chr[] = "chr";
+static char __pyx_k__ord[] = "ord";
+static char __pyx_k__pop[] = "pop";
+static char __pyx_k__pos[] = "pos";
+static char __pyx_k__AMF3[] = "AMF3";
+static char __pyx_k__amf0[] = "amf0";
+static char __pyx_k__amf3[] = "amf3";
+static char __pyx_k__data[] = "data";
+static char __pyx_k__date[] = "date";
+static char __pyx_k__keys[] = "keys";
+static char __pyx_k__time[] = "time";
+static char __pyx_k__utf8[] = "utf8";
+static char __pyx_k__util[] = "util";
+static char __pyx_k__alias[] = "alias";
+static char __pyx_k__array[] = "array";
+static char __pyx_k__codec[] = "codec";
+static char __pyx_k__pyamf[] = "pyamf";
+static char __pyx_k__types[] = "types";
+static char __pyx_k__write[] = "write";
+static char __pyx_k__RawAMF[] = "RawAMF";
+static char __pyx_k__append[] = "append";
+static char __pyx_k__buffer[] = "buffer";
+static char __pyx_k__encode[] = "encode";
+static char __pyx_k__length[] = "length";
+static char __pyx_k__stream[] = "stream";
+static char __pyx_k__strict[] = "strict";
+static char __pyx_k__Context[] = "Context";
+static char __pyx_k__Decoder[] = "Decoder";
+static char __pyx_k__Encoder[] = "Encoder";
+static char __pyx_k__IOError[] = "IOError";
+static char __pyx_k__compile[] = "compile";
+static char __pyx_k__context[] = "context";
+static char __pyx_k__objects[] = "objects";
+static char __pyx_k__readXML[] = "readXML";
+static char __pyx_k__ASObject[] = "ASObject";
+static char __pyx_k__TypeType[] = "TypeType";
+static char __pyx_k____init__[] = "__init__";
+static char __pyx_k____main__[] = "__main__";
+static char __pyx_k____test__[] = "__test__";
+static char __pyx_k___readXML[] = "_readXML";
+static char __pyx_k__datetime[] = "datetime";
+static char __pyx_k__encoding[] = "encoding";
+static char __pyx_k__external[] = "external";
+static char __pyx_k__readAMF3[] = "readAMF3";
+static char __pyx_k__readDate[] = "readDate";
+static char __pyx_k__readList[] = "readList";
+static char __pyx_k__readNull[] = "readNull";
+static char __pyx_k__tostring[] = "tostring";
+static char __pyx_k__use_amf3[] = "use_amf3";
+static char __pyx_k__writeXML[] = "writeXML";
+static char __pyx_k__ArrayType[] = "ArrayType";
+static char __pyx_k__ClassType[] = "ClassType";
+static char __pyx_k__Undefined[] = "Undefined";
+static char __pyx_k____class__[] = "__class__";
+static char __pyx_k___readAMF3[] = "_readAMF3";
+static char __pyx_k___readDate[] = "_readDate";
+static char __pyx_k___readList[] = "_readList";
+static char __pyx_k___writeXML[] = "_writeXML";
+static char __pyx_k__addObject[] = "addObject";
+static char __pyx_k__addRawAMF[] = "addRawAMF";
+static char __pyx_k__anonymous[] = "anonymous";
+static char __pyx_k__getObject[] = "getObject";
+static char __pyx_k__iteritems[] = "iteritems";
+static char __pyx_k__set_attrs[] = "set_attrs";
+static char __pyx_k__writeAMF3[] = "writeAMF3";
+static char __pyx_k__writeDate[] = "writeDate";
+static char __pyx_k__writeFunc[] = "writeFunc";
+static char __pyx_k__writeNull[] = "writeNull";
+static char __pyx_k__writeType[] = "writeType";
+static char __pyx_k__Dictionary[] = "Dictionary";
+static char __pyx_k__LambdaType[] = "LambdaType";
+static char __pyx_k__MethodType[] = "MethodType";
+static char __pyx_k__MixedArray[] = "MixedArray";
+static char __pyx_k__ModuleType[] = "ModuleType";
+static char __pyx_k__ObjectType[] = "ObjectType";
+static char __pyx_k__ValueError[] = "ValueError";
+static char __pyx_k___writeAMF3[] = "_writeAMF3";
+static char __pyx_k___writeDate[] = "_writeDate";
+static char __pyx_k___writeDict[] = "_writeDict";
+static char __pyx_k__basestring[] = "basestring";
+static char __pyx_k__fromstring[] = "fromstring";
+static char __pyx_k__readNumber[] = "readNumber";
+static char __pyx_k__readObject[] = "readObject";
+static char __pyx_k__readString[] = "readString";
+static char __pyx_k__read_short[] = "read_short";
+static char __pyx_k__read_uchar[] = "read_uchar";
+static char __pyx_k__read_ulong[] = "read_ulong";
+static char __pyx_k__writeArray[] = "writeArray";
+static char __pyx_k__writeClass[] = "writeClass";
+static char __pyx_k__DecodeError[] = "DecodeError";
+static char __pyx_k__EncodeError[] = "EncodeError";
+static char __pyx_k__StringTypes[] = "StringTypes";
+static char __pyx_k__TypedObject[] = "TypedObject";
+static char __pyx_k___readNumber[] = "_readNumber";
+static char __pyx_k___readObject[] = "_readObject";
+static char __pyx_k___readString[] = "_readString";
+static char __pyx_k___writeArray[] = "_writeArray";
+static char __pyx_k__getTypeFunc[] = "getTypeFunc";
+static char __pyx_k__get_context[] = "get_context";
+static char __pyx_k__get_decoder[] = "get_decoder";
+static char __pyx_k__get_encoder[] = "get_encoder";
+static char __pyx_k__readBoolean[] = "readBoolean";
+static char __pyx_k__readElement[] = "readElement";
+static char __pyx_k__read_double[] = "read_double";
+static char __pyx_k__read_ushort[] = "read_ushort";
+static char __pyx_k__writeNumber[] = "writeNumber";
+static char __pyx_k__writeObject[] = "writeObject";
+static char __pyx_k__writeRawAMF[] = "writeRawAMF";
+static char __pyx_k__writeString[] = "writeString";
+static char __pyx_k__write_short[] = "write_short";
+static char __pyx_k__write_uchar[] = "write_uchar";
+static char __pyx_k__write_ulong[] = "write_ulong";
+static char __pyx_k__FunctionType[] = "FunctionType";
+static char __pyx_k__InstanceType[] = "InstanceType";
+static char __pyx_k___readBoolean[] = "_readBoolean";
+static char __pyx_k___readElement[] = "_readElement";
+static char __pyx_k___writeObject[] = "_writeObject";
+static char __pyx_k___writeString[] = "_writeString";
+static char __pyx_k__amf3_context[] = "amf3_context";
+static char __pyx_k__amf3_decoder[] = "amf3_decoder";
+static char __pyx_k__amf3_encoder[] = "amf3_encoder";
+static char __pyx_k__encode_attrs[] = "encode_attrs";
+static char __pyx_k__get_datetime[] = "get_datetime";
+static char __pyx_k__static_attrs[] = "static_attrs";
+static char __pyx_k__writeBoolean[] = "writeBoolean";
+static char __pyx_k__writeElement[] = "writeElement";
+static char __pyx_k__write_double[] = "write_double";
+static char __pyx_k__write_ushort[] = "write_ushort";
+static char __pyx_k__GeneratorType[] = "GeneratorType";
+static char __pyx_k___readASObject[] = "_readASObject";
+static char __pyx_k___writeElement[] = "_writeElement";
+static char __pyx_k__addAMF3Object[] = "addAMF3Object";
+static char __pyx_k__getClassAlias[] = "getClassAlias";
+static char __pyx_k__get_timestamp[] = "get_timestamp";
+static char __pyx_k__is_ET_element[] = "is_ET_element";
+static char __pyx_k__readReference[] = "readReference";
+static char __pyx_k__readUndefined[] = "readUndefined";
+static char __pyx_k__ReferenceError[] = "ReferenceError";
+static char __pyx_k___check_for_int[] = "_check_for_int";
+static char __pyx_k___readReference[] = "_readReference";
+static char __pyx_k__createInstance[] = "createInstance";
+static char __pyx_k__getByReference[] = "getByReference";
+static char __pyx_k__getReferenceTo[] = "getReferenceTo";
+static char __pyx_k__readLongString[] = "readLongString";
+static char __pyx_k__readMixedArray[] = "readMixedArray";
+static char __pyx_k__writeReference[] = "writeReference";
+static char __pyx_k__writeUndefined[] = "writeUndefined";
+static char __pyx_k___readLongString[] = "_readLongString";
+static char __pyx_k___readMixedArray[] = "_readMixedArray";
+static char __pyx_k___writeEndObject[] = "_writeEndObject";
+static char __pyx_k___writeReference[] = "_writeReference";
+static char __pyx_k__applyAttributes[] = "applyAttributes";
+static char __pyx_k__get_class_alias[] = "get_class_alias";
+static char __pyx_k__is_float_broken[] = "is_float_broken";
+static char __pyx_k__readTypedObject[] = "readTypedObject";
+static char __pyx_k__timezone_offset[] = "timezone_offset";
+static char __pyx_k__writeDictionary[] = "writeDictionary";
+static char __pyx_k__writeMixedArray[] = "writeMixedArray";
+static char __pyx_k___readTypedObject[] = "_readTypedObject";
+static char __pyx_k___writeDictionary[] = "_writeDictionary";
+static char __pyx_k___writeMixedArray[] = "_writeMixedArray";
+static char __pyx_k__writeUnsupported[] = "writeUnsupported";
+static char __pyx_k__BuiltinMethodType[] = "BuiltinMethodType";
+static char __pyx_k__UnknownClassAlias[] = "UnknownClassAlias";
+static char __pyx_k__getEncodableValues[] = "getEncodableValues";
+static char __pyx_k__getObjectReference[] = "getObjectReference";
+static char __pyx_k__BuiltinFunctionType[] = "BuiltinFunctionType";
+static PyObject *__pyx_n_s_1;
+static PyObject *__pyx_kp_s_10;
+static PyObject *__pyx_kp_s_11;
+static PyObject *__pyx_kp_u_13;
+static PyObject *__pyx_kp_u_14;
+static PyObject *__pyx_kp_u_15;
+static PyObject *__pyx_kp_u_16;
+static PyObject *__pyx_kp_u_17;
+static PyObject *__pyx_kp_u_18;
+static PyObject *__pyx_kp_u_19;
+static PyObject *__pyx_kp_s_2;
+static PyObject *__pyx_kp_u_20;
+static PyObject *__pyx_kp_u_21;
+static PyObject *__pyx_kp_u_22;
+static PyObject *__pyx_kp_u_23;
+static PyObject *__pyx_kp_u_24;
+static PyObject *__pyx_kp_u_25;
+static PyObject *__pyx_kp_u_26;
+static PyObject *__pyx_kp_u_27;
+static PyObject *__pyx_kp_u_28;
+static PyObject *__pyx_kp_u_29;
+static PyObject *__pyx_n_s_3;
+static PyObject *__pyx_kp_u_30;
+static PyObject *__pyx_kp_u_31;
+static PyObject *__pyx_kp_u_32;
+static PyObject *__pyx_kp_u_33;
+static PyObject *__pyx_kp_u_34;
+static PyObject *__pyx_kp_u_35;
+static PyObject *__pyx_kp_u_36;
+static PyObject *__pyx_kp_u_37;
+static PyObject *__pyx_kp_u_38;
+static PyObject *__pyx_kp_u_39;
+static PyObject *__pyx_kp_s_4;
+static PyObject *__pyx_kp_u_40;
+static PyObject *__pyx_kp_u_41;
+static PyObject *__pyx_kp_u_42;
+static PyObject *__pyx_kp_u_43;
+static PyObject *__pyx_kp_u_44;
+static PyObject *__pyx_kp_s_5;
+static PyObject *__pyx_kp_s_6;
+static PyObject *__pyx_kp_s_8;
+static PyObject *__pyx_kp_u_8;
+static PyObject *__pyx_kp_s_9;
+static PyObject *__pyx_n_s__AMF3;
+static PyObject *__pyx_n_s__ASObject;
+static PyObject *__pyx_n_s__ArrayType;
+static PyObject *__pyx_n_s__BuiltinFunctionType;
+static PyObject *__pyx_n_s__BuiltinMethodType;
+static PyObject *__pyx_n_s__ClassType;
+static PyObject *__pyx_n_s__Context;
+static PyObject *__pyx_n_s__DecodeError;
+static PyObject *__pyx_n_s__Decoder;
+static PyObject *__pyx_n_s__Dictionary;
+static PyObject *__pyx_n_s__ET;
+static PyObject *__pyx_n_s__EncodeError;
+static PyObject *__pyx_n_s__Encoder;
+static PyObject *__pyx_n_s__FunctionType;
+static PyObject *__pyx_n_s__GeneratorType;
+static PyObject *__pyx_n_s__IOError;
+static PyObject *__pyx_n_s__InstanceType;
+static PyObject *__pyx_n_s__LambdaType;
+static PyObject *__pyx_n_s__MethodType;
+static PyObject *__pyx_n_s__MixedArray;
+static PyObject *__pyx_n_s__ModuleType;
+static PyObject *__pyx_n_s__ObjectType;
+static PyObject *__pyx_n_s__RawAMF;
+static PyObject *__pyx_n_s__ReferenceError;
+static PyObject *__pyx_n_s__StringTypes;
+static PyObject *__pyx_n_s__TypeType;
+static PyObject *__pyx_n_s__TypedObject;
+static PyObject *__pyx_n_s__Undefined;
+static PyObject *__pyx_n_s__UnknownClassAlias;
+static PyObject *__pyx_n_s__ValueError;
+static PyObject *__pyx_n_s____class__;
+static PyObject *__pyx_n_s____init__;
+static PyObject *__pyx_n_s____main__;
+static PyObject *__pyx_n_s____test__;
+static PyObject *__pyx_n_s___check_for_int;
+static PyObject *__pyx_n_s___readAMF3;
+static PyObject *__pyx_n_s___readASObject;
+static PyObject *__pyx_n_s___readBoolean;
+static PyObject *__pyx_n_s___readDate;
+static PyObject *__pyx_n_s___readElement;
+static PyObject *__pyx_n_s___readList;
+static PyObject *__pyx_n_s___readLongString;
+static PyObject *__pyx_n_s___readMixedArray;
+static PyObject *__pyx_n_s___readNumber;
+static PyObject *__pyx_n_s___readObject;
+static PyObject *__pyx_n_s___readReference;
+static PyObject *__pyx_n_s___readString;
+static PyObject *__pyx_n_s___readTypedObject;
+static PyObject *__pyx_n_s___readXML;
+static PyObject *__pyx_n_s___writeAMF3;
+static PyObject *__pyx_n_s___writeArray;
+static PyObject *__pyx_n_s___writeDate;
+static PyObject *__pyx_n_s___writeDict;
+static PyObject *__pyx_n_s___writeDictionary;
+static PyObject *__pyx_n_s___writeElement;
+static PyObject *__pyx_n_s___writeEndObject;
+static PyObject *__pyx_n_s___writeMixedArray;
+static PyObject *__pyx_n_s___writeObject;
+static PyObject *__pyx_n_s___writeReference;
+static PyObject *__pyx_n_s___writeString;
+static PyObject *__pyx_n_s___writeXML;
+static PyObject *__pyx_n_s__addAMF3Object;
+static PyObject *__pyx_n_s__addObject;
+static PyObject *__pyx_n_s__addRawAMF;
+static PyObject *__pyx_n_s__alias;
+static PyObject *__pyx_n_s__amf0;
+static PyObject *__pyx_n_s__amf3;
+static PyObject *__pyx_n_s__amf3_context;
+static PyObject *__pyx_n_s__amf3_decoder;
+static PyObject *__pyx_n_s__amf3_encoder;
+static PyObject *__pyx_n_s__anonymous;
+static PyObject *__pyx_n_s__append;
+static PyObject *__pyx_n_s__applyAttributes;
+static PyObject *__pyx_n_s__array;
+static PyObject *__pyx_n_s__basestring;
+static PyObject *__pyx_n_s__buffer;
+static PyObject *__pyx_n_s__chr;
+static PyObject *__pyx_n_s__codec;
+static PyObject *__pyx_n_s__compile;
+static PyObject *__pyx_n_s__context;
+static PyObject *__pyx_n_s__createInstance;
+static PyObject *__pyx_n_s__data;
+static PyObject *__pyx_n_s__date;
+static PyObject *__pyx_n_s__datetime;
+static PyObject *__pyx_n_s__encode;
+static PyObject *__pyx_n_s__encode_attrs;
+static PyObject *__pyx_n_s__encoding;
+static PyObject *__pyx_n_s__external;
+static PyObject *__pyx_n_s__fromstring;
+static PyObject *__pyx_n_s__getByReference;
+static PyObject *__pyx_n_s__getClassAlias;
+static PyObject *__pyx_n_s__getEncodableValues;
+static PyObject *__pyx_n_s__getObject;
+static PyObject *__pyx_n_s__getObjectReference;
+static PyObject *__pyx_n_s__getReferenceTo;
+static PyObject *__pyx_n_s__getTypeFunc;
+static PyObject *__pyx_n_s__get_class_alias;
+static PyObject *__pyx_n_s__get_context;
+static PyObject *__pyx_n_s__get_datetime;
+static PyObject *__pyx_n_s__get_decoder;
+static PyObject *__pyx_n_s__get_encoder;
+static PyObject *__pyx_n_s__get_timestamp;
+static PyObject *__pyx_n_s__is_ET_element;
+static PyObject *__pyx_n_s__is_float_broken;
+static PyObject *__pyx_n_s__iteritems;
+static PyObject *__pyx_n_s__keys;
+static PyObject *__pyx_n_s__length;
+static PyObject *__pyx_n_s__objects;
+static PyObject *__pyx_n_s__ord;
+static PyObject *__pyx_n_s__pop;
+static PyObject *__pyx_n_s__pos;
+static PyObject *__pyx_n_s__pyamf;
+static PyObject *__pyx_n_s__readAMF3;
+static PyObject *__pyx_n_s__readBoolean;
+static PyObject *__pyx_n_s__readDate;
+static PyObject *__pyx_n_s__readElement;
+static PyObject *__pyx_n_s__readList;
+static PyObject *__pyx_n_s__readLongString;
+static PyObject *__pyx_n_s__readMixedArray;
+static PyObject *__pyx_n_s__readNull;
+static PyObject *__pyx_n_s__readNumber;
+static PyObject *__pyx_n_s__readObject;
+static PyObject *__pyx_n_s__readReference;
+static PyObject *__pyx_n_s__readString;
+static PyObject *__pyx_n_s__readTypedObject;
+static PyObject *__pyx_n_s__readUndefined;
+static PyObject *__pyx_n_s__readXML;
+static PyObject *__pyx_n_s__read_double;
+static PyObject *__pyx_n_s__read_short;
+static PyObject *__pyx_n_s__read_uchar;
+static PyObject *__pyx_n_s__read_ulong;
+static PyObject *__pyx_n_s__read_ushort;
+static PyObject *__pyx_n_s__s;
+static PyObject *__pyx_n_s__set_attrs;
+static PyObject *__pyx_n_s__static_attrs;
+static PyObject *__pyx_n_s__stream;
+static PyObject *__pyx_n_s__strict;
+static PyObject *__pyx_n_s__time;
+static PyObject *__pyx_n_s__timezone_offset;
+static PyObject *__pyx_n_s__tostring;
+static PyObject *__pyx_n_s__types;
+static PyObject *__pyx_n_s__use_amf3;
+static PyObject *__pyx_n_s__utf8;
+static PyObject *__pyx_n_s__util;
+static PyObject *__pyx_n_s__write;
+static PyObject *__pyx_n_s__writeAMF3;
+static PyObject *__pyx_n_s__writeArray;
+static PyObject *__pyx_n_s__writeBoolean;
+static PyObject *__pyx_n_s__writeClass;
+static PyObject *__pyx_n_s__writeDate;
+static PyObject *__pyx_n_s__writeDictionary;
+static PyObject *__pyx_n_s__writeElement;
+static PyObject *__pyx_n_s__writeFunc;
+static PyObject *__pyx_n_s__writeMixedArray;
+static PyObject *__pyx_n_s__writeNull;
+static PyObject *__pyx_n_s__writeNumber;
+static PyObject *__pyx_n_s__writeObject;
+static PyObject *__pyx_n_s__writeRawAMF;
+static PyObject *__pyx_n_s__writeReference;
+static PyObject *__pyx_n_s__writeString;
+static PyObject *__pyx_n_s__writeType;
+static PyObject *__pyx_n_s__writeUndefined;
+static PyObject *__pyx_n_s__writeUnsupported;
+static PyObject *__pyx_n_s__writeXML;
+static PyObject *__pyx_n_s__write_double;
+static PyObject *__pyx_n_s__write_short;
+static PyObject *__pyx_n_s__write_uchar;
+static PyObject *__pyx_n_s__write_ulong;
+static PyObject *__pyx_n_s__write_ushort;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_int_5;
+static PyObject *__pyx_int_6;
+static PyObject *__pyx_int_7;
+static PyObject *__pyx_int_8;
+static PyObject *__pyx_int_9;
+static PyObject *__pyx_int_10;
+static PyObject *__pyx_int_11;
+static PyObject *__pyx_int_12;
+static PyObject *__pyx_int_13;
+static PyObject *__pyx_k_7;
+
+/* "/root/package/cpyamf/amf0.pyx":99
+ * 
+ * 
+ * cdef int _init_module() except -1:             # <<<<<<<<<<<<<<
+ *     global amf0, Context, Dictionary, float_broken
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0__init_module(void) {
+  PyObject *__pyx_v_mod;
+  PyObject *__pyx_v_amf3;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("_init_module");
+  __pyx_v_mod = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_amf3 = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":102
+ *     global amf0, Context, Dictionary, float_broken
+ * 
+ *     if amf0 is not None:             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_6cpyamf_4amf0_amf0 != Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":103
+ * 
+ *     if amf0 is not None:
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     from pyamf import amf0 as mod
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":105
+ *         return 0
+ * 
+ *     from pyamf import amf0 as mod             # <<<<<<<<<<<<<<
+ *     from pyamf import amf3
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__amf0));
+  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__amf0));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__amf0));
+  __pyx_t_3 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__amf0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_v_mod);
+  __pyx_v_mod = __pyx_t_2;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":106
+ * 
+ *     from pyamf import amf0 as mod
+ *     from pyamf import amf3             # <<<<<<<<<<<<<<
+ * 
+ *     amf0 = mod
+ */
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__amf3));
+  PyList_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_n_s__amf3));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__amf3));
+  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__amf3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_amf3);
+  __pyx_v_amf3 = __pyx_t_3;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":108
+ *     from pyamf import amf3
+ * 
+ *     amf0 = mod             # <<<<<<<<<<<<<<
+ *     Context = mod.Context
+ *     Dictionary = amf3.Dictionary
+ */
+  __Pyx_INCREF(__pyx_v_mod);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_amf0);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_amf0);
+  __Pyx_GIVEREF(__pyx_v_mod);
+  __pyx_v_6cpyamf_4amf0_amf0 = __pyx_v_mod;
+
+  /* "/root/package/cpyamf/amf0.pyx":109
+ * 
+ *     amf0 = mod
+ *     Context = mod.Context             # <<<<<<<<<<<<<<
+ *     Dictionary = amf3.Dictionary
+ *     float_broken = util.is_float_broken()
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s__Context); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_Context);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_Context);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf0_Context = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":110
+ *     amf0 = mod
+ *     Context = mod.Context
+ *     Dictionary = amf3.Dictionary             # <<<<<<<<<<<<<<
+ *     float_broken = util.is_float_broken()
+ * 
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_amf3, __pyx_n_s__Dictionary); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_Dictionary);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_Dictionary);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf0_Dictionary = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":111
+ *     Context = mod.Context
+ *     Dictionary = amf3.Dictionary
+ *     float_broken = util.is_float_broken()             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__is_float_broken); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_6cpyamf_4amf0_float_broken = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf0.pyx":113
+ *     float_broken = util.is_float_broken()
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0._init_module");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_mod);
+  __Pyx_DECREF(__pyx_v_amf3);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":119
+ * # directly, any other context class goes through its public methods.
+ * 
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
+ */
+
+static  Py_ssize_t __pyx_f_6cpyamf_4amf0__get_object_reference(PyObject *__pyx_v_context, PyObject *__pyx_v_obj) {
+  PyObject *__pyx_v_ref;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_get_object_reference");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_v_ref = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":120
+ * 
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
+ * 
+ */
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf0_Context);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":121
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)             # <<<<<<<<<<<<<<
+ * 
+ *     ref = context.getObjectReference(obj)
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getReferenceTo(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":123
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
+ * 
+ *     ref = context.getObjectReference(obj)             # <<<<<<<<<<<<<<
+ * 
+ *     if ref is None:
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getObjectReference); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_obj);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+  __Pyx_GIVEREF(__pyx_v_obj);
+  __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_ref);
+  __pyx_v_ref = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":125
+ *     ref = context.getObjectReference(obj)
+ * 
+ *     if ref is None:             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_ref == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":126
+ * 
+ *     if ref is None:
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ *     return ref
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":128
+ *         return -1
+ * 
+ *     return ref             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_ref); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0._get_object_reference");
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ref);
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":131
+ * 
+ * 
+ * cdef object _get_object(object context, Py_ssize_t ref):             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0__get_object(PyObject *__pyx_v_context, Py_ssize_t __pyx_v_ref) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("_get_object");
+  __Pyx_INCREF(__pyx_v_context);
+
+  /* "/root/package/cpyamf/amf0.pyx":132
+ * 
+ * cdef object _get_object(object context, Py_ssize_t ref):
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
+ * 
+ */
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf0_Context);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":133
+ * cdef object _get_object(object context, Py_ssize_t ref):
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)             # <<<<<<<<<<<<<<
+ * 
+ *     return context.getObject(ref)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_ref); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":135
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
+ * 
+ *     return context.getObject(ref)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getObject); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ref); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0._get_object");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":138
+ * 
+ * 
+ * cdef int _add_object(object context, object obj) except -1:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.objects).append(obj)
+ */
+
+static  int __pyx_f_6cpyamf_4amf0__add_object(PyObject *__pyx_v_context, PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_add_object");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_obj);
+
+  /* "/root/package/cpyamf/amf0.pyx":139
+ * 
+ * cdef int _add_object(object context, object obj) except -1:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         (<cIndexedCollection>context.objects).append(obj)
+ *     else:
+ */
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf0_Context);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":140
+ * cdef int _add_object(object context, object obj) except -1:
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.objects).append(obj)             # <<<<<<<<<<<<<<
+ *     else:
+ *         context.addObject(obj)
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->append(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":142
+ *         (<cIndexedCollection>context.objects).append(obj)
+ *     else:
+ *         context.addObject(obj)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__addObject); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":144
+ *         context.addObject(obj)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0._add_object");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":162
+ *     cdef public object use_amf3
+ * 
+ *     def __init__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         _init_module()
+ * 
+ */
+
+static int __pyx_pf_6cpyamf_4amf0_7Encoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_6cpyamf_4amf0_7Encoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("__init__");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 1))) return -1;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return -1;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf0.pyx":163
+ * 
+ *     def __init__(self, *args, **kwargs):
+ *         _init_module()             # <<<<<<<<<<<<<<
+ * 
+ *         self.use_amf3 = kwargs.pop('use_amf3', False)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf0__init_module(); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":165
+ *         _init_module()
+ * 
+ *         self.use_amf3 = kwargs.pop('use_amf3', False)             # <<<<<<<<<<<<<<
+ * 
+ *         codec.Encoder.__init__(self, *args, **kwargs)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_kwargs, __pyx_n_s__pop); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__use_amf3));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_n_s__use_amf3));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__use_amf3));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->use_amf3);
+  __Pyx_DECREF(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->use_amf3);
+  ((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->use_amf3 = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":167
+ *         self.use_amf3 = kwargs.pop('use_amf3', False)
+ * 
+ *         codec.Encoder.__init__(self, *args, **kwargs)             # <<<<<<<<<<<<<<
+ * 
+ *     def buildContext(self):
+ */
+  __pyx_t_3 = PyObject_GetAttr(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_5codec_Encoder)), __pyx_n_s____init__); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  __pyx_t_2 = PySequence_Tuple(__pyx_v_args); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_5 = PyNumber_Add(__pyx_t_4, ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_5, __pyx_v_kwargs); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.__init__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":169
+ *         codec.Encoder.__init__(self, *args, **kwargs)
+ * 
+ *     def buildContext(self):             # <<<<<<<<<<<<<<
+ *         return amf0.Context()
+ * 
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_buildContext(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_buildContext(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("buildContext");
+
+  /* "/root/package/cpyamf/amf0.pyx":170
+ * 
+ *     def buildContext(self):
+ *         return amf0.Context()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object resolveType(self, object data):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf0_amf0, __pyx_n_s__Context); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.buildContext");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":172
+ *         return amf0.Context()
+ * 
+ *     cdef object resolveType(self, object data):             # <<<<<<<<<<<<<<
+ *         if isinstance(data, FUNC_TYPES):
+ *             return ENC_FUNC
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Encoder_resolveType(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("resolveType");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_data);
+
+  /* "/root/package/cpyamf/amf0.pyx":173
+ * 
+ *     cdef object resolveType(self, object data):
+ *         if isinstance(data, FUNC_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_FUNC
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf0_FUNC_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":174
+ *     cdef object resolveType(self, object data):
+ *         if isinstance(data, FUNC_TYPES):
+ *             return ENC_FUNC             # <<<<<<<<<<<<<<
+ * 
+ *         if data is None:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_10);
+    __pyx_r = __pyx_int_10;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":176
+ *             return ENC_FUNC
+ * 
+ *         if data is None:             # <<<<<<<<<<<<<<
+ *             return ENC_NULL
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_data == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":177
+ * 
+ *         if data is None:
+ *             return ENC_NULL             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, bool):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_1);
+    __pyx_r = __pyx_int_1;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":179
+ *             return ENC_NULL
+ * 
+ *         if isinstance(data, bool):             # <<<<<<<<<<<<<<
+ *             return ENC_BOOL
+ * 
+ */
+  __pyx_t_1 = PyObject_TypeCheck(__pyx_v_data, ((PyTypeObject *)((PyObject*)&PyBool_Type))); 
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":180
+ * 
+ *         if isinstance(data, bool):
+ *             return ENC_BOOL             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, (int, long, float)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_2);
+    __pyx_r = __pyx_int_2;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":182
+ *             return ENC_BOOL
+ * 
+ *         if isinstance(data, (int, long, float)):             # <<<<<<<<<<<<<<
+ *             return ENC_NUMBER
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyInt_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)((PyObject*)&PyInt_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyInt_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyLong_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)((PyObject*)&PyLong_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyLong_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyFloat_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 2, ((PyObject *)((PyObject*)&PyFloat_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyFloat_Type)));
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":183
+ * 
+ *         if isinstance(data, (int, long, float)):
+ *             return ENC_NUMBER             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, types.StringTypes):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_3);
+    __pyx_r = __pyx_int_3;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf0.pyx":185
+ *             return ENC_NUMBER
+ * 
+ *         if isinstance(data, types.StringTypes):             # <<<<<<<<<<<<<<
+ *             return ENC_STRING
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__StringTypes); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":186
+ * 
+ *         if isinstance(data, types.StringTypes):
+ *             return ENC_STRING             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, pyamf.ASObject):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_4);
+    __pyx_r = __pyx_int_4;
+    goto __pyx_L0;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/amf0.pyx":188
+ *             return ENC_STRING
+ * 
+ *         if isinstance(data, pyamf.ASObject):             # <<<<<<<<<<<<<<
+ *             return ENC_OBJECT
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ASObject); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":189
+ * 
+ *         if isinstance(data, pyamf.ASObject):
+ *             return ENC_OBJECT             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, pyamf.MixedArray):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_8);
+    __pyx_r = __pyx_int_8;
+    goto __pyx_L0;
+    goto __pyx_L8;
+  }
+  __pyx_L8:;
+
+  /* "/root/package/cpyamf/amf0.pyx":191
+ *             return ENC_OBJECT
+ * 
+ *         if isinstance(data, pyamf.MixedArray):             # <<<<<<<<<<<<<<
+ *             return ENC_MIXEDARRAY
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__MixedArray); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":192
+ * 
+ *         if isinstance(data, pyamf.MixedArray):
+ *             return ENC_MIXEDARRAY             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, (list, tuple, array.ArrayType)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_7);
+    __pyx_r = __pyx_int_7;
+    goto __pyx_L0;
+    goto __pyx_L9;
+  }
+  __pyx_L9:;
+
+  /* "/root/package/cpyamf/amf0.pyx":194
+ *             return ENC_MIXEDARRAY
+ * 
+ *         if isinstance(data, (list, tuple, array.ArrayType)):             # <<<<<<<<<<<<<<
+ *             return ENC_ARRAY
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ArrayType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyList_Type)));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)((PyObject*)&PyList_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyList_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyTuple_Type)));
+  PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)((PyObject*)&PyTuple_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyTuple_Type)));
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":195
+ * 
+ *         if isinstance(data, (list, tuple, array.ArrayType)):
+ *             return ENC_ARRAY             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, DATE_TYPES):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_6);
+    __pyx_r = __pyx_int_6;
+    goto __pyx_L0;
+    goto __pyx_L10;
+  }
+  __pyx_L10:;
+
+  /* "/root/package/cpyamf/amf0.pyx":197
+ *             return ENC_ARRAY
+ * 
+ *         if isinstance(data, DATE_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_DATE
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf0_DATE_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":198
+ * 
+ *         if isinstance(data, DATE_TYPES):
+ *             return ENC_DATE             # <<<<<<<<<<<<<<
+ * 
+ *         if util.is_ET_element(data):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_5);
+    __pyx_r = __pyx_int_5;
+    goto __pyx_L0;
+    goto __pyx_L11;
+  }
+  __pyx_L11:;
+
+  /* "/root/package/cpyamf/amf0.pyx":200
+ *             return ENC_DATE
+ * 
+ *         if util.is_ET_element(data):             # <<<<<<<<<<<<<<
+ *             return ENC_XML
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__is_ET_element); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":201
+ * 
+ *         if util.is_ET_element(data):
+ *             return ENC_XML             # <<<<<<<<<<<<<<
+ * 
+ *         if data is pyamf.Undefined:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_9);
+    __pyx_r = __pyx_int_9;
+    goto __pyx_L0;
+    goto __pyx_L12;
+  }
+  __pyx_L12:;
+
+  /* "/root/package/cpyamf/amf0.pyx":203
+ *             return ENC_XML
+ * 
+ *         if data is pyamf.Undefined:             # <<<<<<<<<<<<<<
+ *             return ENC_UNDEFINED
+ * 
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__Undefined); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = (__pyx_v_data == __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":204
+ * 
+ *         if data is pyamf.Undefined:
+ *             return ENC_UNDEFINED             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, pyamf.RawAMF):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf0.pyx":206
+ *             return ENC_UNDEFINED
+ * 
+ *         if isinstance(data, pyamf.RawAMF):             # <<<<<<<<<<<<<<
+ *             return ENC_RAW
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__RawAMF); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":207
+ * 
+ *         if isinstance(data, pyamf.RawAMF):
+ *             return ENC_RAW             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, CLASS_TYPES):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_12);
+    __pyx_r = __pyx_int_12;
+    goto __pyx_L0;
+    goto __pyx_L14;
+  }
+  __pyx_L14:;
+
+  /* "/root/package/cpyamf/amf0.pyx":209
+ *             return ENC_RAW
+ * 
+ *         if isinstance(data, CLASS_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_CLASS
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf0_CLASS_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":210
+ * 
+ *         if isinstance(data, CLASS_TYPES):
+ *             return ENC_CLASS             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, Dictionary):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_11);
+    __pyx_r = __pyx_int_11;
+    goto __pyx_L0;
+    goto __pyx_L15;
+  }
+  __pyx_L15:;
+
+  /* "/root/package/cpyamf/amf0.pyx":212
+ *             return ENC_CLASS
+ * 
+ *         if isinstance(data, Dictionary):             # <<<<<<<<<<<<<<
+ *             return ENC_DICTIONARY
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf0_Dictionary); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":213
+ * 
+ *         if isinstance(data, Dictionary):
+ *             return ENC_DICTIONARY             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_13);
+    __pyx_r = __pyx_int_13;
+    goto __pyx_L0;
+    goto __pyx_L16;
+  }
+  __pyx_L16:;
+
+  /* "/root/package/cpyamf/amf0.pyx":215
+ *             return ENC_DICTIONARY
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):             # <<<<<<<<<<<<<<
+ *             return ENC_OBJECT
+ * 
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__InstanceType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__ObjectType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_3 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":216
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):
+ *             return ENC_OBJECT             # <<<<<<<<<<<<<<
+ * 
+ *         return None
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_8);
+    __pyx_r = __pyx_int_8;
+    goto __pyx_L0;
+    goto __pyx_L17;
+  }
+  __pyx_L17:;
+
+  /* "/root/package/cpyamf/amf0.pyx":218
+ *             return ENC_OBJECT
+ * 
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeElement(self, object data) except -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_None);
+  __pyx_r = Py_None;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.resolveType");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":220
+ *         return None
+ * 
+ *     cdef int _writeElement(self, object data) except -1:             # <<<<<<<<<<<<<<
+ *         cdef object func
+ *         cdef long t
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeElement(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_v_func;
+  long __pyx_v_t;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  double __pyx_t_8;
+  __Pyx_RefNannySetupContext("_writeElement");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_data);
+  __pyx_v_func = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":227
+ *         # context there is an array of amf3_objs that contain references to
+ *         # objects that are to be encoded in amf3.
+ *         if self.use_amf3 and self.context.hasAMF3ObjectReference(data):             # <<<<<<<<<<<<<<
+ *             return self._writeAMF3(data)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->use_amf3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+  } else {
+    __pyx_t_6 = __pyx_t_1;
+  }
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/amf0.pyx":228
+ *         # objects that are to be encoded in amf3.
+ *         if self.use_amf3 and self.context.hasAMF3ObjectReference(data):
+ *             return self._writeAMF3(data)             # <<<<<<<<<<<<<<
+ * 
+ *         func = self.getTypeFunc(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeAMF3(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":230
+ *             return self._writeAMF3(data)
+ * 
+ *         func = self.getTypeFunc(data)             # <<<<<<<<<<<<<<
+ * 
+ *         if func is None:
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.getTypeFunc(((struct __pyx_obj_6cpyamf_5codec_Encoder *)__pyx_v_self), __pyx_v_data); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_v_func);
+  __pyx_v_func = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":232
+ *         func = self.getTypeFunc(data)
+ * 
+ *         if func is None:             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError("Cannot find encoder func for %r" % (data,))
+ * 
+ */
+  __pyx_t_6 = (__pyx_v_func == Py_None);
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/amf0.pyx":233
+ * 
+ *         if func is None:
+ *             raise pyamf.EncodeError("Cannot find encoder func for %r" % (data,))             # <<<<<<<<<<<<<<
+ * 
+ *         if PyInt_CheckExact(func) == 0:
+ */
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":235
+ *             raise pyamf.EncodeError("Cannot find encoder func for %r" % (data,))
+ * 
+ *         if PyInt_CheckExact(func) == 0:             # <<<<<<<<<<<<<<
+ *             func(data)
+ * 
+ */
+  __pyx_t_6 = (PyInt_CheckExact(__pyx_v_func) == 0);
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/amf0.pyx":236
+ * 
+ *         if PyInt_CheckExact(func) == 0:
+ *             func(data)             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyObject_Call(__pyx_v_func, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":238
+ *             func(data)
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         t = PyInt_AS_LONG(func)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":240
+ *             return 0
+ * 
+ *         t = PyInt_AS_LONG(func)             # <<<<<<<<<<<<<<
+ * 
+ *         if t == ENC_STRING:
+ */
+  __pyx_v_t = PyInt_AS_LONG(__pyx_v_func);
+
+  /* "/root/package/cpyamf/amf0.pyx":242
+ *         t = PyInt_AS_LONG(func)
+ * 
+ *         if t == ENC_STRING:             # <<<<<<<<<<<<<<
+ *             return self._writeString(data, 1)
+ *         elif t == ENC_NUMBER:
+ */
+  switch (__pyx_v_t) {
+    case 4:
+
+    /* "/root/package/cpyamf/amf0.pyx":243
+ * 
+ *         if t == ENC_STRING:
+ *             return self._writeString(data, 1)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_NUMBER:
+ *             self.stream.write_uchar(TYPE_NUMBER)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_data, 1); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":244
+ *         if t == ENC_STRING:
+ *             return self._writeString(data, 1)
+ *         elif t == ENC_NUMBER:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_NUMBER)
+ * 
+ */
+    case 3:
+
+    /* "/root/package/cpyamf/amf0.pyx":245
+ *             return self._writeString(data, 1)
+ *         elif t == ENC_NUMBER:
+ *             self.stream.write_uchar(TYPE_NUMBER)             # <<<<<<<<<<<<<<
+ * 
+ *             return self.stream.write_double(float(data))
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf0.pyx":247
+ *             self.stream.write_uchar(TYPE_NUMBER)
+ * 
+ *             return self.stream.write_double(float(data))             # <<<<<<<<<<<<<<
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data)
+ */
+    __pyx_t_8 = __Pyx_PyObject_AsDouble(__pyx_v_data); if (unlikely(__pyx_t_8 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_double(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_8); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":248
+ * 
+ *             return self.stream.write_double(float(data))
+ *         elif t == ENC_OBJECT:             # <<<<<<<<<<<<<<
+ *             return self._writeObject(data)
+ *         elif t == ENC_ARRAY:
+ */
+    case 8:
+
+    /* "/root/package/cpyamf/amf0.pyx":249
+ *             return self.stream.write_double(float(data))
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_ARRAY:
+ *             return self._writeArray(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeObject(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":250
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data)
+ *         elif t == ENC_ARRAY:             # <<<<<<<<<<<<<<
+ *             return self._writeArray(data)
+ *         elif t == ENC_BOOL:
+ */
+    case 6:
+
+    /* "/root/package/cpyamf/amf0.pyx":251
+ *             return self._writeObject(data)
+ *         elif t == ENC_ARRAY:
+ *             return self._writeArray(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_BOOL:
+ *             self.stream.write_uchar(TYPE_BOOL)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeArray(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":252
+ *         elif t == ENC_ARRAY:
+ *             return self._writeArray(data)
+ *         elif t == ENC_BOOL:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_BOOL)
+ * 
+ */
+    case 2:
+
+    /* "/root/package/cpyamf/amf0.pyx":253
+ *             return self._writeArray(data)
+ *         elif t == ENC_BOOL:
+ *             self.stream.write_uchar(TYPE_BOOL)             # <<<<<<<<<<<<<<
+ * 
+ *             if data:
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf0.pyx":255
+ *             self.stream.write_uchar(TYPE_BOOL)
+ * 
+ *             if data:             # <<<<<<<<<<<<<<
+ *                 return self.stream.write_uchar(1)
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_data); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_6) {
+
+      /* "/root/package/cpyamf/amf0.pyx":256
+ * 
+ *             if data:
+ *                 return self.stream.write_uchar(1)             # <<<<<<<<<<<<<<
+ * 
+ *             return self.stream.write_uchar(0)
+ */
+      __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_r = __pyx_t_7;
+      goto __pyx_L0;
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf0.pyx":258
+ *                 return self.stream.write_uchar(1)
+ * 
+ *             return self.stream.write_uchar(0)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":259
+ * 
+ *             return self.stream.write_uchar(0)
+ *         elif t == ENC_NULL:             # <<<<<<<<<<<<<<
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_MIXEDARRAY:
+ */
+    case 1:
+
+    /* "/root/package/cpyamf/amf0.pyx":260
+ *             return self.stream.write_uchar(0)
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_MIXEDARRAY:
+ *             return self._writeMixedArray(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 5); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":261
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_MIXEDARRAY:             # <<<<<<<<<<<<<<
+ *             return self._writeMixedArray(data)
+ *         elif t == ENC_DATE:
+ */
+    case 7:
+
+    /* "/root/package/cpyamf/amf0.pyx":262
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_MIXEDARRAY:
+ *             return self._writeMixedArray(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeMixedArray(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":263
+ *         elif t == ENC_MIXEDARRAY:
+ *             return self._writeMixedArray(data)
+ *         elif t == ENC_DATE:             # <<<<<<<<<<<<<<
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:
+ */
+    case 5:
+
+    /* "/root/package/cpyamf/amf0.pyx":264
+ *             return self._writeMixedArray(data)
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDate(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":265
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:             # <<<<<<<<<<<<<<
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_XML:
+ */
+    case 0:
+
+    /* "/root/package/cpyamf/amf0.pyx":266
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 6); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":267
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_XML:             # <<<<<<<<<<<<<<
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:
+ */
+    case 9:
+
+    /* "/root/package/cpyamf/amf0.pyx":268
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeXML(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":269
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:             # <<<<<<<<<<<<<<
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:
+ */
+    case 12:
+
+    /* "/root/package/cpyamf/amf0.pyx":270
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)
+ */
+    __pyx_t_4 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeRawAMF); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":271
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:             # <<<<<<<<<<<<<<
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:
+ */
+    case 10:
+
+    /* "/root/package/cpyamf/amf0.pyx":272
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_CLASS:
+ *             self.writeClass(data)
+ */
+    __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeFunc); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":273
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:             # <<<<<<<<<<<<<<
+ *             self.writeClass(data)
+ *         elif t == ENC_DICTIONARY:
+ */
+    case 11:
+
+    /* "/root/package/cpyamf/amf0.pyx":274
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:
+ *             self.writeClass(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_DICTIONARY:
+ *             return self._writeDictionary(data)
+ */
+    __pyx_t_4 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeClass); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":275
+ *         elif t == ENC_CLASS:
+ *             self.writeClass(data)
+ *         elif t == ENC_DICTIONARY:             # <<<<<<<<<<<<<<
+ *             return self._writeDictionary(data)
+ * 
+ */
+    case 13:
+
+    /* "/root/package/cpyamf/amf0.pyx":276
+ *             self.writeClass(data)
+ *         elif t == ENC_DICTIONARY:
+ *             return self._writeDictionary(data)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDictionary(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_7;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":278
+ *             return self._writeDictionary(data)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeString(self, object s, bint writeType) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeElement");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_func);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":280
+ *         return 0
+ * 
+ *     cdef int _writeString(self, object s, bint writeType) except -1:             # <<<<<<<<<<<<<<
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeString(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_s, int __pyx_v_writeType) {
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("_writeString");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_s);
+
+  /* "/root/package/cpyamf/amf0.pyx":281
+ * 
+ *     cdef int _writeString(self, object s, bint writeType) except -1:
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ * 
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf0.pyx":282
+ *     cdef int _writeString(self, object s, bint writeType) except -1:
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if PyUnicode_Check(s):
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":284
+ *         cdef Py_ssize_t l = 0
+ * 
+ *         if PyUnicode_Check(s):             # <<<<<<<<<<<<<<
+ *             s = PyUnicode_AsUTF8String(s)
+ *         elif not PyString_Check(s):
+ */
+  __pyx_t_1 = PyUnicode_Check(__pyx_v_s);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":285
+ * 
+ *         if PyUnicode_Check(s):
+ *             s = PyUnicode_AsUTF8String(s)             # <<<<<<<<<<<<<<
+ *         elif not PyString_Check(s):
+ *             s = unicode(s).encode('utf8')
+ */
+    __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_s); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_v_s);
+    __pyx_v_s = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L3;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":286
+ *         if PyUnicode_Check(s):
+ *             s = PyUnicode_AsUTF8String(s)
+ *         elif not PyString_Check(s):             # <<<<<<<<<<<<<<
+ *             s = unicode(s).encode('utf8')
+ * 
+ */
+  __pyx_t_3 = (!PyString_Check(__pyx_v_s));
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":287
+ *             s = PyUnicode_AsUTF8String(s)
+ *         elif not PyString_Check(s):
+ *             s = unicode(s).encode('utf8')             # <<<<<<<<<<<<<<
+ * 
+ *         PyString_AsStringAndSize(s, &buf, &l)
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_s);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_s);
+    __Pyx_GIVEREF(__pyx_v_s);
+    __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyUnicode_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(__pyx_t_4 == Py_None)) {
+      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'encode'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
+    }
+    __pyx_t_2 = ((PyObject *)PyUnicode_AsUTF8String(((PyObject *)__pyx_t_4))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_v_s);
+    __pyx_v_s = ((PyObject *)__pyx_t_2);
+    __pyx_t_2 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":289
+ *             s = unicode(s).encode('utf8')
+ * 
+ *         PyString_AsStringAndSize(s, &buf, &l)             # <<<<<<<<<<<<<<
+ * 
+ *         if l > 0xffff:
+ */
+  __pyx_t_1 = PyString_AsStringAndSize(__pyx_v_s, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":291
+ *         PyString_AsStringAndSize(s, &buf, &l)
+ * 
+ *         if l > 0xffff:             # <<<<<<<<<<<<<<
+ *             if writeType:
+ *                 self.stream.write_uchar(TYPE_LONGSTRING)
+ */
+  __pyx_t_3 = (__pyx_v_l > 0xffff);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":292
+ * 
+ *         if l > 0xffff:
+ *             if writeType:             # <<<<<<<<<<<<<<
+ *                 self.stream.write_uchar(TYPE_LONGSTRING)
+ * 
+ */
+    __pyx_t_3 = __pyx_v_writeType;
+    if (__pyx_t_3) {
+
+      /* "/root/package/cpyamf/amf0.pyx":293
+ *         if l > 0xffff:
+ *             if writeType:
+ *                 self.stream.write_uchar(TYPE_LONGSTRING)             # <<<<<<<<<<<<<<
+ * 
+ *             self.stream.write_ulong(l)
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 12); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/cpyamf/amf0.pyx":295
+ *                 self.stream.write_uchar(TYPE_LONGSTRING)
+ * 
+ *             self.stream.write_ulong(l)             # <<<<<<<<<<<<<<
+ *         else:
+ *             if writeType:
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_l); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L4;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":297
+ *             self.stream.write_ulong(l)
+ *         else:
+ *             if writeType:             # <<<<<<<<<<<<<<
+ *                 self.stream.write_uchar(TYPE_STRING)
+ * 
+ */
+    __pyx_t_3 = __pyx_v_writeType;
+    if (__pyx_t_3) {
+
+      /* "/root/package/cpyamf/amf0.pyx":298
+ *         else:
+ *             if writeType:
+ *                 self.stream.write_uchar(TYPE_STRING)             # <<<<<<<<<<<<<<
+ * 
+ *             self.stream.write_ushort(l)
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 2); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf0.pyx":300
+ *                 self.stream.write_uchar(TYPE_STRING)
+ * 
+ *             self.stream.write_ushort(l)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write(buf, l)
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ushort(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_l); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":302
+ *             self.stream.write_ushort(l)
+ * 
+ *         return self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t _writeReference(self, object o) except -2:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeString");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_s);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":304
+ *         return self.stream.write(buf, l)
+ * 
+ *     cdef Py_ssize_t _writeReference(self, object o) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a reference to C{o} if it has already been encoded.
+ */
+
+static  Py_ssize_t __pyx_f_6cpyamf_4amf0_7Encoder__writeReference(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_o) {
+  Py_ssize_t __pyx_v_idx;
+  Py_ssize_t __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("_writeReference");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
+
+  /* "/root/package/cpyamf/amf0.pyx":310
+ *         @return: The reference index or C{-1} if C{o} is not referenced.
+ *         """
+ *         cdef Py_ssize_t idx = _get_object_reference(self.context, o)             # <<<<<<<<<<<<<<
+ * 
+ *         if idx == -1:
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf0__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_o); if (unlikely(__pyx_t_1 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_idx = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf0.pyx":312
+ *         cdef Py_ssize_t idx = _get_object_reference(self.context, o)
+ * 
+ *         if idx == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_idx == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":313
+ * 
+ *         if idx == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_REFERENCE)
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":315
+ *             return -1
+ * 
+ *         self.stream.write_uchar(TYPE_REFERENCE)             # <<<<<<<<<<<<<<
+ *         self.stream.write_ushort(idx)
+ * 
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 7); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":316
+ * 
+ *         self.stream.write_uchar(TYPE_REFERENCE)
+ *         self.stream.write_ushort(idx)             # <<<<<<<<<<<<<<
+ * 
+ *         return idx
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ushort(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_idx); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":318
+ *         self.stream.write_ushort(idx)
+ * 
+ *         return idx             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeArray(self, object a) except -1:
+ */
+  __pyx_r = __pyx_v_idx;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeReference");
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":320
+ *         return idx
+ * 
+ *     cdef int _writeArray(self, object a) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t i, l
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeArray(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_a) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_v_alias;
+  PyObject *__pyx_v_x;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7;
+  PyObject *__pyx_t_8;
+  __Pyx_RefNannySetupContext("_writeArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_a);
+  __pyx_v_alias = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":323
+ *         cdef Py_ssize_t i, l
+ * 
+ *         alias = self.context.getClassAlias(a.__class__)             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.external:
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__getClassAlias); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_a, __pyx_n_s____class__); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_alias);
+  __pyx_v_alias = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":325
+ *         alias = self.context.getClassAlias(a.__class__)
+ * 
+ *         if alias.external:             # <<<<<<<<<<<<<<
+ *             # a is a subclassed list with a registered alias - push to the
+ *             # correct method
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__external); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf0.pyx":328
+ *             # a is a subclassed list with a registered alias - push to the
+ *             # correct method
+ *             return self._writeObject(a)             # <<<<<<<<<<<<<<
+ * 
+ *         if self._writeReference(a) != -1:
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeObject(__pyx_v_self, __pyx_v_a); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":330
+ *             return self._writeObject(a)
+ * 
+ *         if self._writeReference(a) != -1:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeReference(__pyx_v_self, __pyx_v_a); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = (__pyx_t_6 != -1);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf0.pyx":331
+ * 
+ *         if self._writeReference(a) != -1:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, a)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":333
+ *             return 0
+ * 
+ *         _add_object(self.context, a)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_a); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":335
+ *         _add_object(self.context, a)
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)             # <<<<<<<<<<<<<<
+ *         self.stream.write_ulong(len(a))
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 10); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":336
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ *         self.stream.write_ulong(len(a))             # <<<<<<<<<<<<<<
+ * 
+ *         if PyList_CheckExact(a):
+ */
+  __pyx_t_6 = PyObject_Length(__pyx_v_a); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_6); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":338
+ *         self.stream.write_ulong(len(a))
+ * 
+ *         if PyList_CheckExact(a):             # <<<<<<<<<<<<<<
+ *             l = PyList_GET_SIZE(a)
+ * 
+ */
+  __pyx_t_5 = PyList_CheckExact(__pyx_v_a);
+  if (__pyx_t_5) {
+
+    /* "/root/package/cpyamf/amf0.pyx":339
+ * 
+ *         if PyList_CheckExact(a):
+ *             l = PyList_GET_SIZE(a)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < l:
+ */
+    __pyx_v_l = PyList_GET_SIZE(__pyx_v_a);
+
+    /* "/root/package/cpyamf/amf0.pyx":341
+ *             l = PyList_GET_SIZE(a)
+ * 
+ *             for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(<object>PyList_GET_ITEM(a, i))
+ *         elif PyTuple_CheckExact(a):
+ */
+    __pyx_t_6 = __pyx_v_l;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_6; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf0.pyx":342
+ * 
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyList_GET_ITEM(a, i))             # <<<<<<<<<<<<<<
+ *         elif PyTuple_CheckExact(a):
+ *             l = PyTuple_GET_SIZE(a)
+ */
+      __pyx_t_7 = PyList_GET_ITEM(__pyx_v_a, __pyx_v_i);
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, ((PyObject *)__pyx_t_7)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    goto __pyx_L5;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":343
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyList_GET_ITEM(a, i))
+ *         elif PyTuple_CheckExact(a):             # <<<<<<<<<<<<<<
+ *             l = PyTuple_GET_SIZE(a)
+ * 
+ */
+  __pyx_t_5 = PyTuple_CheckExact(__pyx_v_a);
+  if (__pyx_t_5) {
+
+    /* "/root/package/cpyamf/amf0.pyx":344
+ *                 self._writeElement(<object>PyList_GET_ITEM(a, i))
+ *         elif PyTuple_CheckExact(a):
+ *             l = PyTuple_GET_SIZE(a)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < l:
+ */
+    __pyx_v_l = PyTuple_GET_SIZE(__pyx_v_a);
+
+    /* "/root/package/cpyamf/amf0.pyx":346
+ *             l = PyTuple_GET_SIZE(a)
+ * 
+ *             for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(a, i))
+ *         else:
+ */
+    __pyx_t_6 = __pyx_v_l;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_6; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf0.pyx":347
+ * 
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(a, i))             # <<<<<<<<<<<<<<
+ *         else:
+ *             for x in a:
+ */
+      __pyx_t_8 = PyTuple_GET_ITEM(__pyx_v_a, __pyx_v_i);
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, ((PyObject *)__pyx_t_8)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    goto __pyx_L5;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":349
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(a, i))
+ *         else:
+ *             for x in a:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(x)
+ * 
+ */
+    if (PyList_CheckExact(__pyx_v_a) || PyTuple_CheckExact(__pyx_v_a)) {
+      __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_a; __Pyx_INCREF(__pyx_t_2);
+    } else {
+      __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_a); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else {
+        __pyx_t_3 = PyIter_Next(__pyx_t_2);
+        if (!__pyx_t_3) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_DECREF(__pyx_v_x);
+      __pyx_v_x = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":350
+ *         else:
+ *             for x in a:
+ *                 self._writeElement(x)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_x); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":352
+ *                 self._writeElement(x)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDict(self, object o) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeArray");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_x);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_a);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":354
+ *         return 0
+ * 
+ *     cdef int _writeDict(self, object o) except -1:             # <<<<<<<<<<<<<<
+ *         for key, val in o.iteritems():
+ *             self._writeString(key, 0)
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeDict(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_o) {
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_v_val;
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_writeDict");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_val = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":355
+ * 
+ *     cdef int _writeDict(self, object o) except -1:
+ *         for key, val in o.iteritems():             # <<<<<<<<<<<<<<
+ *             self._writeString(key, 0)
+ *             self._writeElement(val)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_o, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
+    __pyx_t_1 = 0; __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
+      PyObject* tuple = __pyx_t_3;
+      __pyx_t_4 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_5 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_4;
+      __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_v_val);
+      __pyx_v_val = __pyx_t_5;
+      __pyx_t_5 = 0;
+    } else {
+      __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_6, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_6, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      if (__Pyx_EndUnpack(__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_4;
+      __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_v_val);
+      __pyx_v_val = __pyx_t_5;
+      __pyx_t_5 = 0;
+    }
+
+    /* "/root/package/cpyamf/amf0.pyx":356
+ *     cdef int _writeDict(self, object o) except -1:
+ *         for key, val in o.iteritems():
+ *             self._writeString(key, 0)             # <<<<<<<<<<<<<<
+ *             self._writeElement(val)
+ * 
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_key, 0); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf0.pyx":357
+ *         for key, val in o.iteritems():
+ *             self._writeString(key, 0)
+ *             self._writeElement(val)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_val); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":359
+ *             self._writeElement(val)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeEndObject(self) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeDict");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF(__pyx_v_val);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":361
+ *         return 0
+ * 
+ *     cdef int _writeEndObject(self) except -1:             # <<<<<<<<<<<<<<
+ *         self.stream.write_ushort(0)
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeEndObject(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self) {
+  int __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_writeEndObject");
+
+  /* "/root/package/cpyamf/amf0.pyx":362
+ * 
+ *     cdef int _writeEndObject(self) except -1:
+ *         self.stream.write_ushort(0)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write_uchar(TYPE_OBJECTTERM)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ushort(__pyx_v_self->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":364
+ *         self.stream.write_ushort(0)
+ * 
+ *         return self.stream.write_uchar(TYPE_OBJECTTERM)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeMixedArray(self, object o) except -1:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 9); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeEndObject");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":366
+ *         return self.stream.write_uchar(TYPE_OBJECTTERM)
+ * 
+ *     cdef int _writeMixedArray(self, object o) except -1:             # <<<<<<<<<<<<<<
+ *         cdef object max_index = 0
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeMixedArray(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_o) {
+  PyObject *__pyx_v_max_index = 0;
+  PyObject *__pyx_v_key;
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  unsigned long __pyx_t_8;
+  __Pyx_RefNannySetupContext("_writeMixedArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":367
+ * 
+ *     cdef int _writeMixedArray(self, object o) except -1:
+ *         cdef object max_index = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if self._writeReference(o) != -1:
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_max_index = __pyx_int_0;
+
+  /* "/root/package/cpyamf/amf0.pyx":369
+ *         cdef object max_index = 0
+ * 
+ *         if self._writeReference(o) != -1:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeReference(__pyx_v_self, __pyx_v_o); if (unlikely(__pyx_t_1 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 != -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":370
+ * 
+ *         if self._writeReference(o) != -1:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, o)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":372
+ *             return 0
+ * 
+ *         _add_object(self.context, o)             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(TYPE_MIXEDARRAY)
+ * 
+ */
+  __pyx_t_3 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_o); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":373
+ * 
+ *         _add_object(self.context, o)
+ *         self.stream.write_uchar(TYPE_MIXEDARRAY)             # <<<<<<<<<<<<<<
+ * 
+ *         # work out the highest integer index
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 8); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":376
+ * 
+ *         # work out the highest integer index
+ *         for key in o:             # <<<<<<<<<<<<<<
+ *             if isinstance(key, (int, long)) and key > max_index:
+ *                 max_index = key
+ */
+  if (PyList_CheckExact(__pyx_v_o) || PyTuple_CheckExact(__pyx_v_o)) {
+    __pyx_t_1 = 0; __pyx_t_4 = __pyx_v_o; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++;
+    } else {
+      __pyx_t_5 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_5) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_DECREF(__pyx_v_key);
+    __pyx_v_key = __pyx_t_5;
+    __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":377
+ *         # work out the highest integer index
+ *         for key in o:
+ *             if isinstance(key, (int, long)) and key > max_index:             # <<<<<<<<<<<<<<
+ *                 max_index = key
+ * 
+ */
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyInt_Type)));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)((PyObject*)&PyInt_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyInt_Type)));
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyLong_Type)));
+    PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)((PyObject*)&PyLong_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyLong_Type)));
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_key, __pyx_t_5); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_2) {
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_key, __pyx_v_max_index, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_7 = __pyx_t_6;
+    } else {
+      __pyx_t_7 = __pyx_t_2;
+    }
+    if (__pyx_t_7) {
+
+      /* "/root/package/cpyamf/amf0.pyx":378
+ *         for key in o:
+ *             if isinstance(key, (int, long)) and key > max_index:
+ *                 max_index = key             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_ulong(max_index)
+ */
+      __Pyx_INCREF(__pyx_v_key);
+      __Pyx_DECREF(__pyx_v_max_index);
+      __pyx_v_max_index = __pyx_v_key;
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":380
+ *                 max_index = key
+ * 
+ *         self.stream.write_ulong(max_index)             # <<<<<<<<<<<<<<
+ * 
+ *         self._writeDict(o)
+ */
+  __pyx_t_8 = __Pyx_PyInt_AsUnsignedLong(__pyx_v_max_index); if (unlikely((__pyx_t_8 == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_8); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":382
+ *         self.stream.write_ulong(max_index)
+ * 
+ *         self._writeDict(o)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._writeEndObject()
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDict(__pyx_v_self, __pyx_v_o); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 382; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":384
+ *         self._writeDict(o)
+ * 
+ *         return self._writeEndObject()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDictionary(self, object d) except -1:
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeEndObject(__pyx_v_self); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeMixedArray");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_max_index);
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":386
+ *         return self._writeEndObject()
+ * 
+ *     cdef int _writeDictionary(self, object d) except -1:             # <<<<<<<<<<<<<<
+ *         if not self.use_amf3:
+ *             for key in d:
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeDictionary(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_d) {
+  PyObject *__pyx_v_key;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("_writeDictionary");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_d);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":387
+ * 
+ *     cdef int _writeDictionary(self, object d) except -1:
+ *         if not self.use_amf3:             # <<<<<<<<<<<<<<
+ *             for key in d:
+ *                 if not isinstance(key, basestring):
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->use_amf3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (!__pyx_t_1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":388
+ *     cdef int _writeDictionary(self, object d) except -1:
+ *         if not self.use_amf3:
+ *             for key in d:             # <<<<<<<<<<<<<<
+ *                 if not isinstance(key, basestring):
+ *                     break
+ */
+    if (PyList_CheckExact(__pyx_v_d) || PyTuple_CheckExact(__pyx_v_d)) {
+      __pyx_t_3 = 0; __pyx_t_4 = __pyx_v_d; __Pyx_INCREF(__pyx_t_4);
+    } else {
+      __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
+      } else {
+        __pyx_t_5 = PyIter_Next(__pyx_t_4);
+        if (!__pyx_t_5) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_5;
+      __pyx_t_5 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":389
+ *         if not self.use_amf3:
+ *             for key in d:
+ *                 if not isinstance(key, basestring):             # <<<<<<<<<<<<<<
+ *                     break
+ *             else:
+ */
+      __pyx_t_2 = PyObject_IsInstance(__pyx_v_key, __pyx_builtin_basestring); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 389; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = (!__pyx_t_2);
+      if (__pyx_t_1) {
+
+        /* "/root/package/cpyamf/amf0.pyx":390
+ *             for key in d:
+ *                 if not isinstance(key, basestring):
+ *                     break             # <<<<<<<<<<<<<<
+ *             else:
+ *                 return self._writeMixedArray(d)
+ */
+        goto __pyx_L5_break;
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+    /*else*/ {
+
+      /* "/root/package/cpyamf/amf0.pyx":392
+ *                     break
+ *             else:
+ *                 return self._writeMixedArray(d)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._writeAMF3(d)
+ */
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeMixedArray(__pyx_v_self, __pyx_v_d); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_r = __pyx_t_6;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      goto __pyx_L0;
+    }
+    __pyx_L5_break:;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":394
+ *                 return self._writeMixedArray(d)
+ * 
+ *         return self._writeAMF3(d)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeObject(self, object o) except -1:
+ */
+  __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeAMF3(__pyx_v_self, __pyx_v_d); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_6;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeDictionary");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_d);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":396
+ *         return self._writeAMF3(d)
+ * 
+ *     cdef int _writeObject(self, object o) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t i, l
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeObject(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_o) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_v_alias;
+  PyObject *__pyx_v_keys;
+  PyObject *__pyx_v_values;
+  PyObject *__pyx_v_attrs;
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_v_value;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  __Pyx_RefNannySetupContext("_writeObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
+  __pyx_v_alias = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_keys = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_values = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attrs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_value = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":399
+ *         cdef Py_ssize_t i, l
+ * 
+ *         if self.use_amf3:             # <<<<<<<<<<<<<<
+ *             return self._writeAMF3(o)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->use_amf3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":400
+ * 
+ *         if self.use_amf3:
+ *             return self._writeAMF3(o)             # <<<<<<<<<<<<<<
+ * 
+ *         if self._writeReference(o) != -1:
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeAMF3(__pyx_v_self, __pyx_v_o); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":402
+ *             return self._writeAMF3(o)
+ * 
+ *         if self._writeReference(o) != -1:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeReference(__pyx_v_self, __pyx_v_o); if (unlikely(__pyx_t_3 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = (__pyx_t_3 != -1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":403
+ * 
+ *         if self._writeReference(o) != -1:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, o)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":405
+ *             return 0
+ * 
+ *         _add_object(self.context, o)             # <<<<<<<<<<<<<<
+ *         alias = self.context.getClassAlias(o.__class__)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_o); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":406
+ * 
+ *         _add_object(self.context, o)
+ *         alias = self.context.getClassAlias(o.__class__)             # <<<<<<<<<<<<<<
+ * 
+ *         alias.compile()
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__getClassAlias); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_o, __pyx_n_s____class__); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_v_alias);
+  __pyx_v_alias = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":408
+ *         alias = self.context.getClassAlias(o.__class__)
+ * 
+ *         alias.compile()             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.amf3:
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__compile); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":410
+ *         alias.compile()
+ * 
+ *         if alias.amf3:             # <<<<<<<<<<<<<<
+ *             return self._writeAMF3(o)
+ * 
+ */
+  __pyx_t_6 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__amf3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":411
+ * 
+ *         if alias.amf3:
+ *             return self._writeAMF3(o)             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.anonymous:
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeAMF3(__pyx_v_self, __pyx_v_o); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":413
+ *             return self._writeAMF3(o)
+ * 
+ *         if alias.anonymous:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_OBJECT)
+ *         else:
+ */
+  __pyx_t_6 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__anonymous); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":414
+ * 
+ *         if alias.anonymous:
+ *             self.stream.write_uchar(TYPE_OBJECT)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.stream.write_uchar(TYPE_TYPEDOBJECT)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 3); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":416
+ *             self.stream.write_uchar(TYPE_OBJECT)
+ *         else:
+ *             self.stream.write_uchar(TYPE_TYPEDOBJECT)             # <<<<<<<<<<<<<<
+ *             self._writeString(alias.alias, 0)
+ * 
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 16); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf0.pyx":417
+ *         else:
+ *             self.stream.write_uchar(TYPE_TYPEDOBJECT)
+ *             self._writeString(alias.alias, 0)             # <<<<<<<<<<<<<<
+ * 
+ *         keys = alias.encode_attrs
+ */
+    __pyx_t_6 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__alias); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_6, 0); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf0.pyx":419
+ *             self._writeString(alias.alias, 0)
+ * 
+ *         keys = alias.encode_attrs             # <<<<<<<<<<<<<<
+ * 
+ *         if keys is not None:
+ */
+  __pyx_t_6 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__encode_attrs); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_v_keys);
+  __pyx_v_keys = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":421
+ *         keys = alias.encode_attrs
+ * 
+ *         if keys is not None:             # <<<<<<<<<<<<<<
+ *             # a sealed class, the static attributes come first
+ *             values = alias.getEncodableValues(o)
+ */
+  __pyx_t_1 = (__pyx_v_keys != Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":423
+ *         if keys is not None:
+ *             # a sealed class, the static attributes come first
+ *             values = alias.getEncodableValues(o)             # <<<<<<<<<<<<<<
+ *             l = len(keys)
+ * 
+ */
+    __pyx_t_6 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__getEncodableValues); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_v_o);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_o);
+    __Pyx_GIVEREF(__pyx_v_o);
+    __pyx_t_4 = PyObject_Call(__pyx_t_6, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_v_values);
+    __pyx_v_values = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":424
+ *             # a sealed class, the static attributes come first
+ *             values = alias.getEncodableValues(o)
+ *             l = len(keys)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < l:
+ */
+    __pyx_t_3 = PyObject_Length(__pyx_v_keys); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_l = __pyx_t_3;
+
+    /* "/root/package/cpyamf/amf0.pyx":426
+ *             l = len(keys)
+ * 
+ *             for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeString(keys[i], 0)
+ *                 self._writeElement(values[i])
+ */
+    __pyx_t_3 = __pyx_v_l;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf0.pyx":427
+ * 
+ *             for i from 0 <= i < l:
+ *                 self._writeString(keys[i], 0)             # <<<<<<<<<<<<<<
+ *                 self._writeElement(values[i])
+ * 
+ */
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_keys, __pyx_v_i, sizeof(Py_ssize_t), PyInt_FromSsize_t); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_4, 0); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":428
+ *             for i from 0 <= i < l:
+ *                 self._writeString(keys[i], 0)
+ *                 self._writeElement(values[i])             # <<<<<<<<<<<<<<
+ * 
+ *             return self._writeEndObject()
+ */
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_values, __pyx_v_i, sizeof(Py_ssize_t), PyInt_FromSsize_t); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_4); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+
+    /* "/root/package/cpyamf/amf0.pyx":430
+ *                 self._writeElement(values[i])
+ * 
+ *             return self._writeEndObject()             # <<<<<<<<<<<<<<
+ * 
+ *         attrs = alias.getEncodableAttributes(o, codec=self)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeEndObject(__pyx_v_self); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/amf0.pyx":432
+ *             return self._writeEndObject()
+ * 
+ *         attrs = alias.getEncodableAttributes(o, codec=self)             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.static_attrs and attrs:
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_o);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_o);
+  __Pyx_GIVEREF(__pyx_v_o);
+  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_6));
+  if (PyDict_SetItem(__pyx_t_6, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_5, ((PyObject *)__pyx_t_6)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_v_attrs);
+  __pyx_v_attrs = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":434
+ *         attrs = alias.getEncodableAttributes(o, codec=self)
+ * 
+ *         if alias.static_attrs and attrs:             # <<<<<<<<<<<<<<
+ *             for key in alias.static_attrs:
+ *                 value = attrs.pop(key)
+ */
+  __pyx_t_7 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__pyx_t_1) {
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_v_attrs); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_9 = __pyx_t_8;
+  } else {
+    __pyx_t_9 = __pyx_t_1;
+  }
+  if (__pyx_t_9) {
+
+    /* "/root/package/cpyamf/amf0.pyx":435
+ * 
+ *         if alias.static_attrs and attrs:
+ *             for key in alias.static_attrs:             # <<<<<<<<<<<<<<
+ *                 value = attrs.pop(key)
+ * 
+ */
+    __pyx_t_7 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    if (PyList_CheckExact(__pyx_t_7) || PyTuple_CheckExact(__pyx_t_7)) {
+      __pyx_t_3 = 0; __pyx_t_6 = __pyx_t_7; __Pyx_INCREF(__pyx_t_6);
+    } else {
+      __pyx_t_3 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_6))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_6)) break;
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_6))) {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++;
+      } else {
+        __pyx_t_7 = PyIter_Next(__pyx_t_6);
+        if (!__pyx_t_7) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_7);
+      }
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_7;
+      __pyx_t_7 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":436
+ *         if alias.static_attrs and attrs:
+ *             for key in alias.static_attrs:
+ *                 value = attrs.pop(key)             # <<<<<<<<<<<<<<
+ * 
+ *                 self._writeString(key, 0)
+ */
+      __pyx_t_7 = PyObject_GetAttr(__pyx_v_attrs, __pyx_n_s__pop); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_v_key);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_key);
+      __Pyx_GIVEREF(__pyx_v_key);
+      __pyx_t_4 = PyObject_Call(__pyx_t_7, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_v_value);
+      __pyx_v_value = __pyx_t_4;
+      __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":438
+ *                 value = attrs.pop(key)
+ * 
+ *                 self._writeString(key, 0)             # <<<<<<<<<<<<<<
+ *                 self._writeElement(value)
+ * 
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_key, 0); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/cpyamf/amf0.pyx":439
+ * 
+ *                 self._writeString(key, 0)
+ *                 self._writeElement(value)             # <<<<<<<<<<<<<<
+ * 
+ *         if attrs:
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_value); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    goto __pyx_L10;
+  }
+  __pyx_L10:;
+
+  /* "/root/package/cpyamf/amf0.pyx":441
+ *                 self._writeElement(value)
+ * 
+ *         if attrs:             # <<<<<<<<<<<<<<
+ *             for key, value in attrs.iteritems():
+ *                 self._writeString(key, 0)
+ */
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_v_attrs); if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_9) {
+
+    /* "/root/package/cpyamf/amf0.pyx":442
+ * 
+ *         if attrs:
+ *             for key, value in attrs.iteritems():             # <<<<<<<<<<<<<<
+ *                 self._writeString(key, 0)
+ *                 self._writeElement(value)
+ */
+    __pyx_t_6 = PyObject_GetAttr(__pyx_v_attrs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = PyObject_Call(__pyx_t_6, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
+      __pyx_t_3 = 0; __pyx_t_6 = __pyx_t_4; __Pyx_INCREF(__pyx_t_6);
+    } else {
+      __pyx_t_3 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_6))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_6)) break;
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_6))) {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
+      } else {
+        __pyx_t_4 = PyIter_Next(__pyx_t_6);
+        if (!__pyx_t_4) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      if (PyTuple_CheckExact(__pyx_t_4) && likely(PyTuple_GET_SIZE(__pyx_t_4) == 2)) {
+        PyObject* tuple = __pyx_t_4;
+        __pyx_t_5 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_5);
+        __pyx_t_7 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_v_key);
+        __pyx_v_key = __pyx_t_5;
+        __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_v_value);
+        __pyx_v_value = __pyx_t_7;
+        __pyx_t_7 = 0;
+      } else {
+        __pyx_t_10 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_10, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_10, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        if (__Pyx_EndUnpack(__pyx_t_10) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_v_key);
+        __pyx_v_key = __pyx_t_5;
+        __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_v_value);
+        __pyx_v_value = __pyx_t_7;
+        __pyx_t_7 = 0;
+      }
+
+      /* "/root/package/cpyamf/amf0.pyx":443
+ *         if attrs:
+ *             for key, value in attrs.iteritems():
+ *                 self._writeString(key, 0)             # <<<<<<<<<<<<<<
+ *                 self._writeElement(value)
+ * 
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_key, 0); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/cpyamf/amf0.pyx":444
+ *             for key, value in attrs.iteritems():
+ *                 self._writeString(key, 0)
+ *                 self._writeElement(value)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._writeEndObject()
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_value); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf0.pyx":446
+ *                 self._writeElement(value)
+ * 
+ *         return self._writeEndObject()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDate(self, object d) except -1:
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeEndObject(__pyx_v_self); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeObject");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_keys);
+  __Pyx_DECREF(__pyx_v_values);
+  __Pyx_DECREF(__pyx_v_attrs);
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF(__pyx_v_value);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":448
+ *         return self._writeEndObject()
+ * 
+ *     cdef int _writeDate(self, object d) except -1:             # <<<<<<<<<<<<<<
+ *         if isinstance(d, datetime.time):
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeDate(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_d) {
+  PyObject *__pyx_v_secs;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  double __pyx_t_6;
+  __Pyx_RefNannySetupContext("_writeDate");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_d);
+  __pyx_v_secs = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":449
+ * 
+ *     cdef int _writeDate(self, object d) except -1:
+ *         if isinstance(d, datetime.time):             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '
+ *                 'AMF0 has no way to encode time objects. Please use '
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__time); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = PyObject_IsInstance(__pyx_v_d, __pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":450
+ *     cdef int _writeDate(self, object d) except -1:
+ *         if isinstance(d, datetime.time):
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '             # <<<<<<<<<<<<<<
+ *                 'AMF0 has no way to encode time objects. Please use '
+ *                 'datetime.datetime instead (got:%r)' % (d,))
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":452
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '
+ *                 'AMF0 has no way to encode time objects. Please use '
+ *                 'datetime.datetime instead (got:%r)' % (d,))             # <<<<<<<<<<<<<<
+ * 
+ *         # According to the Red5 implementation of AMF0, dates references are
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_d);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_d);
+    __Pyx_GIVEREF(__pyx_v_d);
+    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_4), __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":456
+ *         # According to the Red5 implementation of AMF0, dates references are
+ *         # created, but not used.
+ *         if self.timezone_offset is not None:             # <<<<<<<<<<<<<<
+ *             d -= self.timezone_offset
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_self->__pyx_base.__pyx_base.timezone_offset != Py_None);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":457
+ *         # created, but not used.
+ *         if self.timezone_offset is not None:
+ *             d -= self.timezone_offset             # <<<<<<<<<<<<<<
+ * 
+ *         secs = util.get_timestamp(d)
+ */
+    __pyx_t_4 = PyNumber_InPlaceSubtract(__pyx_v_d, __pyx_v_self->__pyx_base.__pyx_base.timezone_offset); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_d);
+    __pyx_v_d = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":459
+ *             d -= self.timezone_offset
+ * 
+ *         secs = util.get_timestamp(d)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_DATE)
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__get_timestamp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_d);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_d);
+  __Pyx_GIVEREF(__pyx_v_d);
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_secs);
+  __pyx_v_secs = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":461
+ *         secs = util.get_timestamp(d)
+ * 
+ *         self.stream.write_uchar(TYPE_DATE)             # <<<<<<<<<<<<<<
+ *         self.stream.write_double(secs * 1000.0)
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 11); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":462
+ * 
+ *         self.stream.write_uchar(TYPE_DATE)
+ *         self.stream.write_double(secs * 1000.0)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write_short(0)
+ */
+  __pyx_t_1 = PyFloat_FromDouble(1000.0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyNumber_Multiply(__pyx_v_secs, __pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_double(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_6); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":464
+ *         self.stream.write_double(secs * 1000.0)
+ * 
+ *         return self.stream.write_short(0)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeXML(self, object e) except -1:
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_short(__pyx_v_self->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeDate");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_secs);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_d);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":466
+ *         return self.stream.write_short(0)
+ * 
+ *     cdef int _writeXML(self, object e) except -1:             # <<<<<<<<<<<<<<
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeXML(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_e) {
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_v_data;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_writeXML");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_e);
+  __pyx_v_data = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":467
+ * 
+ *     cdef int _writeXML(self, object e) except -1:
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ * 
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf0.pyx":468
+ *     cdef int _writeXML(self, object e) except -1:
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if self.use_amf3 is True:
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":470
+ *         cdef Py_ssize_t l = 0
+ * 
+ *         if self.use_amf3 is True:             # <<<<<<<<<<<<<<
+ *             return self._writeAMF3(e)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_v_self->use_amf3 == __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":471
+ * 
+ *         if self.use_amf3 is True:
+ *             return self._writeAMF3(e)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_XML)
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeAMF3(__pyx_v_self, __pyx_v_e); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_3;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":473
+ *             return self._writeAMF3(e)
+ * 
+ *         self.stream.write_uchar(TYPE_XML)             # <<<<<<<<<<<<<<
+ * 
+ *         data = util.ET.tostring(e, 'utf-8')
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 15); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":475
+ *         self.stream.write_uchar(TYPE_XML)
+ * 
+ *         data = util.ET.tostring(e, 'utf-8')             # <<<<<<<<<<<<<<
+ *         PyString_AsStringAndSize(data, &buf, &l)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__ET); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__tostring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_e);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_e);
+  __Pyx_GIVEREF(__pyx_v_e);
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, ((PyObject *)__pyx_kp_s_5));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
+  __pyx_t_5 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_data);
+  __pyx_v_data = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":476
+ * 
+ *         data = util.ET.tostring(e, 'utf-8')
+ *         PyString_AsStringAndSize(data, &buf, &l)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_ulong(l)
+ */
+  __pyx_t_3 = PyString_AsStringAndSize(__pyx_v_data, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":478
+ *         PyString_AsStringAndSize(data, &buf, &l)
+ * 
+ *         self.stream.write_ulong(l)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write(buf, l)
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_l); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":480
+ *         self.stream.write_ulong(l)
+ * 
+ *         return self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeAMF3(self, object data) except -1:
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeXML");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_e);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":482
+ *         return self.stream.write(buf, l)
+ * 
+ *     cdef int _writeAMF3(self, object data) except -1:             # <<<<<<<<<<<<<<
+ *         context = self.context
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Encoder__writeAMF3(struct __pyx_obj_6cpyamf_4amf0_Encoder *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_v_context;
+  PyObject *__pyx_v_encoder;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_writeAMF3");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_data);
+  __pyx_v_context = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_encoder = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":483
+ * 
+ *     cdef int _writeAMF3(self, object data) except -1:
+ *         context = self.context             # <<<<<<<<<<<<<<
+ * 
+ *         if not hasattr(context, 'amf3_context'):
+ */
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.context);
+  __Pyx_DECREF(__pyx_v_context);
+  __pyx_v_context = __pyx_v_self->__pyx_base.__pyx_base.context;
+
+  /* "/root/package/cpyamf/amf0.pyx":485
+ *         context = self.context
+ * 
+ *         if not hasattr(context, 'amf3_context'):             # <<<<<<<<<<<<<<
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)
+ * 
+ */
+  __pyx_t_1 = PyObject_HasAttr(__pyx_v_context, ((PyObject *)__pyx_n_s__amf3_context)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (!__pyx_t_1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":486
+ * 
+ *         if not hasattr(context, 'amf3_context'):
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)             # <<<<<<<<<<<<<<
+ * 
+ *         if not hasattr(context, 'amf3_encoder'):
+ */
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__get_context); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (PyObject_SetAttr(__pyx_v_context, __pyx_n_s__amf3_context, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 486; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":488
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)
+ * 
+ *         if not hasattr(context, 'amf3_encoder'):             # <<<<<<<<<<<<<<
+ *             context.amf3_encoder = pyamf.get_encoder(
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ */
+  __pyx_t_2 = PyObject_HasAttr(__pyx_v_context, ((PyObject *)__pyx_n_s__amf3_encoder)); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = (!__pyx_t_2);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":489
+ * 
+ *         if not hasattr(context, 'amf3_encoder'):
+ *             context.amf3_encoder = pyamf.get_encoder(             # <<<<<<<<<<<<<<
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ */
+    __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__get_encoder); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":490
+ *         if not hasattr(context, 'amf3_encoder'):
+ *             context.amf3_encoder = pyamf.get_encoder(
+ *                 pyamf.AMF3, self.stream, context.amf3_context)             # <<<<<<<<<<<<<<
+ * 
+ *         context.addAMF3Object(data)
+ */
+    __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__amf3_context); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    PyTuple_SET_ITEM(__pyx_t_6, 1, ((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":489
+ * 
+ *         if not hasattr(context, 'amf3_encoder'):
+ *             context.amf3_encoder = pyamf.get_encoder(             # <<<<<<<<<<<<<<
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ */
+    if (PyObject_SetAttr(__pyx_v_context, __pyx_n_s__amf3_encoder, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":492
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ *         context.addAMF3Object(data)             # <<<<<<<<<<<<<<
+ *         encoder = context.amf3_encoder
+ * 
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__addAMF3Object); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":493
+ * 
+ *         context.addAMF3Object(data)
+ *         encoder = context.amf3_encoder             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_AMF3)
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__amf3_encoder); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_encoder);
+  __pyx_v_encoder = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":495
+ *         encoder = context.amf3_encoder
+ * 
+ *         self.stream.write_uchar(TYPE_AMF3)             # <<<<<<<<<<<<<<
+ *         encoder.writeElement(data)
+ * 
+ */
+  __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 17); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":496
+ * 
+ *         self.stream.write_uchar(TYPE_AMF3)
+ *         encoder.writeElement(data)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_encoder, __pyx_n_s__writeElement); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":498
+ *         encoder.writeElement(data)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def writeElement(self, data):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder._writeAMF3");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_encoder);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":500
+ *         return 0
+ * 
+ *     def writeElement(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes the data.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeElement(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeElement[] = "\n        Writes the data.\n\n        @type data: C{mixed}\n        @param data: The data to be encoded to the AMF0 data stream.\n        @raise EncodeError: Cannot find encoder func.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeElement(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeElement");
+
+  /* "/root/package/cpyamf/amf0.pyx":508
+ *         @raise EncodeError: Cannot find encoder func.
+ *         """
+ *         self._writeElement(data)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeType(self, t):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeElement(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_data); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeElement");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":510
+ *         self._writeElement(data)
+ * 
+ *     def writeType(self, t):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes the type to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeType(PyObject *__pyx_v_self, PyObject *__pyx_v_t); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeType[] = "\n        Writes the type to the stream.\n\n        @type   t: C{str}\n        @param  t: ActionScript type.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeType(PyObject *__pyx_v_self, PyObject *__pyx_v_t) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  unsigned char __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("writeType");
+
+  /* "/root/package/cpyamf/amf0.pyx":517
+ *         @param  t: ActionScript type.
+ *         """
+ *         self.stream.write_uchar(ord(t))             # <<<<<<<<<<<<<<
+ * 
+ *     def writeUndefined(self, data):
+ */
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_t);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_t);
+  __Pyx_GIVEREF(__pyx_v_t);
+  __pyx_t_2 = PyObject_Call(__pyx_builtin_ord, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyInt_AsUnsignedChar(__pyx_t_2); if (unlikely((__pyx_t_3 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, __pyx_t_3); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeType");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":519
+ *         self.stream.write_uchar(ord(t))
+ * 
+ *     def writeUndefined(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes the L{undefined<pyamf.amf0.TYPE_UNDEFINED>} data type to the
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeUndefined(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeUndefined[] = "\n        Writes the L{undefined<pyamf.amf0.TYPE_UNDEFINED>} data type to the\n        stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeUndefined(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeUndefined");
+
+  /* "/root/package/cpyamf/amf0.pyx":524
+ *         stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_UNDEFINED)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeFunc(self, *args, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 6); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeUndefined");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":526
+ *         self.stream.write_uchar(TYPE_UNDEFINED)
+ * 
+ *     def writeFunc(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Functions cannot be serialised.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeFunc(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeFunc[] = "\n        Functions cannot be serialised.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeFunc(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("writeFunc");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "writeFunc", 1))) return NULL;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf0.pyx":530
+ *         Functions cannot be serialised.
+ *         """
+ *         raise pyamf.EncodeError("Callables cannot be serialised")             # <<<<<<<<<<<<<<
+ * 
+ *     def writeRawAMF(self, raw):
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
+  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_6));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_Raise(__pyx_t_3, 0, 0);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeFunc");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":532
+ *         raise pyamf.EncodeError("Callables cannot be serialised")
+ * 
+ *     def writeRawAMF(self, raw):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a pre-encoded element to the stream, AMF3 fragments are
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeRawAMF(PyObject *__pyx_v_self, PyObject *__pyx_v_raw); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeRawAMF[] = "\n        Writes a pre-encoded element to the stream, AMF3 fragments are\n        preceded by L{TYPE_AMF3<pyamf.amf0.TYPE_AMF3>}.\n\n        @since: 0.6\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeRawAMF(PyObject *__pyx_v_self, PyObject *__pyx_v_raw) {
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("writeRawAMF");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_raw);
+
+  /* "/root/package/cpyamf/amf0.pyx":539
+ *         @since: 0.6
+ *         """
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ * 
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf0.pyx":540
+ *         """
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if raw.encoding == pyamf.AMF3:
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":542
+ *         cdef Py_ssize_t l = 0
+ * 
+ *         if raw.encoding == pyamf.AMF3:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_AMF3)
+ * 
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_raw, __pyx_n_s__encoding); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf0.pyx":543
+ * 
+ *         if raw.encoding == pyamf.AMF3:
+ *             self.stream.write_uchar(TYPE_AMF3)             # <<<<<<<<<<<<<<
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 17); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":545
+ *             self.stream.write_uchar(TYPE_AMF3)
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)             # <<<<<<<<<<<<<<
+ *         self.stream.write(buf, l)
+ *         self.context.addRawAMF(raw)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_raw, __pyx_n_s__data); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyString_AsStringAndSize(__pyx_t_2, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":546
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ *         self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ *         self.context.addRawAMF(raw)
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":547
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ *         self.stream.write(buf, l)
+ *         self.context.addRawAMF(raw)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeUnsupported(self, data):
+ */
+  __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.context, __pyx_n_s__addRawAMF); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_raw);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_raw);
+  __Pyx_GIVEREF(__pyx_v_raw);
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeRawAMF");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_raw);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":549
+ *         self.context.addRawAMF(raw)
+ * 
+ *     def writeUnsupported(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes L{unsupported<pyamf.amf0.TYPE_UNSUPPORTED>} data type to the
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeUnsupported(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeUnsupported[] = "\n        Writes L{unsupported<pyamf.amf0.TYPE_UNSUPPORTED>} data type to the\n        stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeUnsupported(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeUnsupported");
+
+  /* "/root/package/cpyamf/amf0.pyx":554
+ *         stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_UNSUPPORTED)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeNull(self, n):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 13); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeUnsupported");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":556
+ *         self.stream.write_uchar(TYPE_UNSUPPORTED)
+ * 
+ *     def writeNull(self, n):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write null type to data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeNull(PyObject *__pyx_v_self, PyObject *__pyx_v_n); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeNull[] = "\n        Write null type to data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeNull(PyObject *__pyx_v_self, PyObject *__pyx_v_n) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeNull");
+
+  /* "/root/package/cpyamf/amf0.pyx":560
+ *         Write null type to data stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_NULL)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeArray(self, a):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 5); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeNull");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":562
+ *         self.stream.write_uchar(TYPE_NULL)
+ * 
+ *     def writeArray(self, a):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write array to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeArray(PyObject *__pyx_v_self, PyObject *__pyx_v_a); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeArray[] = "\n        Write array to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeArray(PyObject *__pyx_v_self, PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeArray");
+
+  /* "/root/package/cpyamf/amf0.pyx":566
+ *         Write array to the stream.
+ *         """
+ *         self._writeArray(a)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeNumber(self, n):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeArray(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_a); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 566; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":568
+ *         self._writeArray(a)
+ * 
+ *     def writeNumber(self, n):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write number to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeNumber(PyObject *__pyx_v_self, PyObject *__pyx_v_n); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeNumber[] = "\n        Write number to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeNumber(PyObject *__pyx_v_self, PyObject *__pyx_v_n) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  double __pyx_t_2;
+  __Pyx_RefNannySetupContext("writeNumber");
+
+  /* "/root/package/cpyamf/amf0.pyx":572
+ *         Write number to the data stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_NUMBER)             # <<<<<<<<<<<<<<
+ *         self.stream.write_double(float(n))
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":573
+ *         """
+ *         self.stream.write_uchar(TYPE_NUMBER)
+ *         self.stream.write_double(float(n))             # <<<<<<<<<<<<<<
+ * 
+ *     def writeBoolean(self, b):
+ */
+  __pyx_t_2 = __Pyx_PyObject_AsDouble(__pyx_v_n); if (unlikely(__pyx_t_2 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_double(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, __pyx_t_2); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeNumber");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":575
+ *         self.stream.write_double(float(n))
+ * 
+ *     def writeBoolean(self, b):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write boolean to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeBoolean(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeBoolean[] = "\n        Write boolean to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeBoolean(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("writeBoolean");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_b);
+
+  /* "/root/package/cpyamf/amf0.pyx":579
+ *         Write boolean to the data stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_BOOL)             # <<<<<<<<<<<<<<
+ * 
+ *         if b:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 579; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":581
+ *         self.stream.write_uchar(TYPE_BOOL)
+ * 
+ *         if b:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(1)
+ *         else:
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_b); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":582
+ * 
+ *         if b:
+ *             self.stream.write_uchar(1)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.stream.write_uchar(0)
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L5;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":584
+ *             self.stream.write_uchar(1)
+ *         else:
+ *             self.stream.write_uchar(0)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeString(self, s, writeType=True):
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L5:;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeBoolean");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_b);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":586
+ *             self.stream.write_uchar(0)
+ * 
+ *     def writeString(self, s, writeType=True):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write string to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeString[] = "\n        Write string to the data stream.\n\n        @param s: The string data to be encoded to the AMF0 data stream.\n        @type writeType: C{bool}\n        @param writeType: Write data type.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_s = 0;
+  PyObject *__pyx_v_writeType = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__s,&__pyx_n_s__writeType,0};
+  __Pyx_RefNannySetupContext("writeString");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = __pyx_k_7;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__s);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__writeType);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeString") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_s = values[0];
+    __pyx_v_writeType = values[1];
+  } else {
+    __pyx_v_writeType = __pyx_k_7;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_writeType = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_s = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeString", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeString");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_s);
+  __Pyx_INCREF(__pyx_v_writeType);
+
+  /* "/root/package/cpyamf/amf0.pyx":594
+ *         @param writeType: Write data type.
+ *         """
+ *         if writeType:             # <<<<<<<<<<<<<<
+ *             self._writeString(s, 1)
+ *         else:
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_writeType); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":595
+ *         """
+ *         if writeType:
+ *             self._writeString(s, 1)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._writeString(s, 0)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeString(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_s, 1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":597
+ *             self._writeString(s, 1)
+ *         else:
+ *             self._writeString(s, 0)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeReference(self, o):
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeString(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_s, 0); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L6:;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_s);
+  __Pyx_DECREF(__pyx_v_writeType);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":599
+ *             self._writeString(s, 0)
+ * 
+ *     def writeReference(self, o):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write reference to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeReference(PyObject *__pyx_v_self, PyObject *__pyx_v_o); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeReference[] = "\n        Write reference to the data stream.\n\n        @return: The reference index or C{None} if C{o} is not referenced.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeReference(PyObject *__pyx_v_self, PyObject *__pyx_v_o) {
+  Py_ssize_t __pyx_v_idx;
+  PyObject *__pyx_r = NULL;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("writeReference");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
+
+  /* "/root/package/cpyamf/amf0.pyx":605
+ *         @return: The reference index or C{None} if C{o} is not referenced.
+ *         """
+ *         cdef Py_ssize_t idx = self._writeReference(o)             # <<<<<<<<<<<<<<
+ * 
+ *         if idx == -1:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeReference(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_o); if (unlikely(__pyx_t_1 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_idx = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf0.pyx":607
+ *         cdef Py_ssize_t idx = self._writeReference(o)
+ * 
+ *         if idx == -1:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_idx == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":608
+ * 
+ *         if idx == -1:
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         return idx
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":610
+ *             return None
+ * 
+ *         return idx             # <<<<<<<<<<<<<<
+ * 
+ *     def writeMixedArray(self, o):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_idx); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeReference");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":612
+ *         return idx
+ * 
+ *     def writeMixedArray(self, o):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write mixed array to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeMixedArray(PyObject *__pyx_v_self, PyObject *__pyx_v_o); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeMixedArray[] = "\n        Write mixed array to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeMixedArray(PyObject *__pyx_v_self, PyObject *__pyx_v_o) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeMixedArray");
+
+  /* "/root/package/cpyamf/amf0.pyx":616
+ *         Write mixed array to the data stream.
+ *         """
+ *         self._writeMixedArray(o)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeObject(self, o):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeMixedArray(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_o); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeMixedArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":618
+ *         self._writeMixedArray(o)
+ * 
+ *     def writeObject(self, o):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write object to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeObject(PyObject *__pyx_v_self, PyObject *__pyx_v_o); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeObject[] = "\n        Write object to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeObject(PyObject *__pyx_v_self, PyObject *__pyx_v_o) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeObject");
+
+  /* "/root/package/cpyamf/amf0.pyx":622
+ *         Write object to the stream.
+ *         """
+ *         self._writeObject(o)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeDictionary(self, d):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeObject(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_o); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeObject");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":624
+ *         self._writeObject(o)
+ * 
+ *     def writeDictionary(self, d):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an L{amf3.Dictionary<pyamf.amf3.Dictionary>}, see
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeDictionary(PyObject *__pyx_v_self, PyObject *__pyx_v_d); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeDictionary[] = "\n        Writes an L{amf3.Dictionary<pyamf.amf3.Dictionary>}, see\n        L{pyamf.amf0.Encoder.writeDictionary}.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeDictionary(PyObject *__pyx_v_self, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeDictionary");
+
+  /* "/root/package/cpyamf/amf0.pyx":629
+ *         L{pyamf.amf0.Encoder.writeDictionary}.
+ *         """
+ *         self._writeDictionary(d)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeDate(self, d):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDictionary(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_d); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 629; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeDictionary");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":631
+ *         self._writeDictionary(d)
+ * 
+ *     def writeDate(self, d):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a date to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeDate(PyObject *__pyx_v_self, PyObject *__pyx_v_d); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeDate[] = "\n        Writes a date to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeDate(PyObject *__pyx_v_self, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeDate");
+
+  /* "/root/package/cpyamf/amf0.pyx":635
+ *         Writes a date to the data stream.
+ *         """
+ *         self._writeDate(d)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeXML(self, e):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDate(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_d); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 635; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeDate");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":637
+ *         self._writeDate(d)
+ * 
+ *     def writeXML(self, e):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write XML to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeXML(PyObject *__pyx_v_self, PyObject *__pyx_v_e); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeXML[] = "\n        Write XML to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeXML(PyObject *__pyx_v_self, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeXML");
+
+  /* "/root/package/cpyamf/amf0.pyx":641
+ *         Write XML to the data stream.
+ *         """
+ *         self._writeXML(e)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeAMF3(self, data):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeXML(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_e); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeXML");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":643
+ *         self._writeXML(e)
+ * 
+ *     def writeAMF3(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an element to the datastream in L{AMF3<pyamf.amf3>} format.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeAMF3(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Encoder_writeAMF3[] = "\n        Writes an element to the datastream in L{AMF3<pyamf.amf3>} format.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Encoder_writeAMF3(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeAMF3");
+
+  /* "/root/package/cpyamf/amf0.pyx":647
+ *         Writes an element to the datastream in L{AMF3<pyamf.amf3>} format.
+ *         """
+ *         self._writeAMF3(data)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder *)((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeAMF3(((struct __pyx_obj_6cpyamf_4amf0_Encoder *)__pyx_v_self), __pyx_v_data); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf0.Encoder.writeAMF3");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":650
+ * 
+ * 
+ * cdef object _read_bytes(cBufferedByteStream stream, Py_ssize_t l, bint unicode_):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads C{l} bytes from C{stream}, decoding them from UTF-8 if C{unicode_}
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0__read_bytes(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream, Py_ssize_t __pyx_v_l, int __pyx_v_unicode_) {
+  char *__pyx_v_buf;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_read_bytes");
+  __Pyx_INCREF((PyObject *)__pyx_v_stream);
+
+  /* "/root/package/cpyamf/amf0.pyx":657
+ *     cdef char *buf
+ * 
+ *     if l == 0:             # <<<<<<<<<<<<<<
+ *         if unicode_:
+ *             return u''
+ */
+  __pyx_t_1 = (__pyx_v_l == 0);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":658
+ * 
+ *     if l == 0:
+ *         if unicode_:             # <<<<<<<<<<<<<<
+ *             return u''
+ * 
+ */
+    __pyx_t_1 = __pyx_v_unicode_;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf0.pyx":659
+ *     if l == 0:
+ *         if unicode_:
+ *             return u''             # <<<<<<<<<<<<<<
+ * 
+ *         return ''
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_8));
+      __pyx_r = ((PyObject *)__pyx_kp_u_8);
+      goto __pyx_L0;
+      goto __pyx_L4;
+    }
+    __pyx_L4:;
+
+    /* "/root/package/cpyamf/amf0.pyx":661
+ *             return u''
+ * 
+ *         return ''             # <<<<<<<<<<<<<<
+ * 
+ *     if l < 0 or l > stream.length - stream.pos:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
+    __pyx_r = ((PyObject *)__pyx_kp_s_8);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":663
+ *         return ''
+ * 
+ *     if l < 0 or l > stream.length - stream.pos:             # <<<<<<<<<<<<<<
+ *         raise IOError('Attempted to read %d bytes from the buffer but only '
+ *             '%d remain' % (l, stream.length - stream.pos))
+ */
+  __pyx_t_1 = (__pyx_v_l < 0);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_l > (__pyx_v_stream->length - __pyx_v_stream->pos));
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":665
+ *     if l < 0 or l > stream.length - stream.pos:
+ *         raise IOError('Attempted to read %d bytes from the buffer but only '
+ *             '%d remain' % (l, stream.length - stream.pos))             # <<<<<<<<<<<<<<
+ * 
+ *     buf = stream.buffer + stream.pos
+ */
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_l); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_stream->length - __pyx_v_stream->pos)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_6); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":667
+ *             '%d remain' % (l, stream.length - stream.pos))
+ * 
+ *     buf = stream.buffer + stream.pos             # <<<<<<<<<<<<<<
+ *     stream.pos += l
+ * 
+ */
+  __pyx_v_buf = (__pyx_v_stream->buffer + __pyx_v_stream->pos);
+
+  /* "/root/package/cpyamf/amf0.pyx":668
+ * 
+ *     buf = stream.buffer + stream.pos
+ *     stream.pos += l             # <<<<<<<<<<<<<<
+ * 
+ *     if unicode_:
+ */
+  __pyx_v_stream->pos += __pyx_v_l;
+
+  /* "/root/package/cpyamf/amf0.pyx":670
+ *     stream.pos += l
+ * 
+ *     if unicode_:             # <<<<<<<<<<<<<<
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')
+ * 
+ */
+  __pyx_t_3 = __pyx_v_unicode_;
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":671
+ * 
+ *     if unicode_:
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')             # <<<<<<<<<<<<<<
+ * 
+ *     return PyString_FromStringAndSize(buf, l)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_5 = PyUnicode_DecodeUTF8(__pyx_v_buf, __pyx_v_l, __pyx_k__strict); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf0.pyx":673
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')
+ * 
+ *     return PyString_FromStringAndSize(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_l); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf0._read_bytes");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_stream);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":687
+ *     """
+ * 
+ *     def __init__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         _init_module()
+ * 
+ */
+
+static int __pyx_pf_6cpyamf_4amf0_7Decoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_6cpyamf_4amf0_7Decoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("__init__");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 1))) return -1;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return -1;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf0.pyx":688
+ * 
+ *     def __init__(self, *args, **kwargs):
+ *         _init_module()             # <<<<<<<<<<<<<<
+ * 
+ *         codec.Decoder.__init__(self, *args, **kwargs)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf0__init_module(); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":690
+ *         _init_module()
+ * 
+ *         codec.Decoder.__init__(self, *args, **kwargs)             # <<<<<<<<<<<<<<
+ * 
+ *     def buildContext(self):
+ */
+  __pyx_t_2 = PyObject_GetAttr(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_5codec_Decoder)), __pyx_n_s____init__); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  __pyx_t_4 = PySequence_Tuple(__pyx_v_args); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+  __pyx_t_5 = PyNumber_Add(__pyx_t_3, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_5, __pyx_v_kwargs); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.__init__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":692
+ *         codec.Decoder.__init__(self, *args, **kwargs)
+ * 
+ *     def buildContext(self):             # <<<<<<<<<<<<<<
+ *         return amf0.Context()
+ * 
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_buildContext(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_buildContext(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("buildContext");
+
+  /* "/root/package/cpyamf/amf0.pyx":693
+ * 
+ *     def buildContext(self):
+ *         return amf0.Context()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object readType(self, unsigned char t):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf0_amf0, __pyx_n_s__Context); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.buildContext");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":695
+ *         return amf0.Context()
+ * 
+ *     cdef object readType(self, unsigned char t):             # <<<<<<<<<<<<<<
+ *         if t == TYPE_STRING:
+ *             return self._readString()
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder_readType(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self, unsigned char __pyx_v_t) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("readType");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/amf0.pyx":696
+ * 
+ *     cdef object readType(self, unsigned char t):
+ *         if t == TYPE_STRING:             # <<<<<<<<<<<<<<
+ *             return self._readString()
+ *         elif t == TYPE_NUMBER:
+ */
+  switch (__pyx_v_t) {
+    case 2:
+
+    /* "/root/package/cpyamf/amf0.pyx":697
+ *     cdef object readType(self, unsigned char t):
+ *         if t == TYPE_STRING:
+ *             return self._readString()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 697; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":698
+ *         if t == TYPE_STRING:
+ *             return self._readString()
+ *         elif t == TYPE_NUMBER:             # <<<<<<<<<<<<<<
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:
+ */
+    case 0:
+
+    /* "/root/package/cpyamf/amf0.pyx":699
+ *             return self._readString()
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_OBJECT:
+ *             return self._readASObject()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readNumber(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 699; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":700
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:             # <<<<<<<<<<<<<<
+ *             return self._readASObject()
+ *         elif t == TYPE_BOOL:
+ */
+    case 3:
+
+    /* "/root/package/cpyamf/amf0.pyx":701
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:
+ *             return self._readASObject()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_BOOL:
+ *             return self._readBoolean()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readASObject(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 701; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":702
+ *         elif t == TYPE_OBJECT:
+ *             return self._readASObject()
+ *         elif t == TYPE_BOOL:             # <<<<<<<<<<<<<<
+ *             return self._readBoolean()
+ *         elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:
+ */
+    case 1:
+
+    /* "/root/package/cpyamf/amf0.pyx":703
+ *             return self._readASObject()
+ *         elif t == TYPE_BOOL:
+ *             return self._readBoolean()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:
+ *             return None
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readBoolean(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":704
+ *         elif t == TYPE_BOOL:
+ *             return self._readBoolean()
+ *         elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:             # <<<<<<<<<<<<<<
+ *             return None
+ *         elif t == TYPE_UNDEFINED:
+ */
+    case 5:
+    case 13:
+
+    /* "/root/package/cpyamf/amf0.pyx":705
+ *             return self._readBoolean()
+ *         elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:
+ *             return None             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":706
+ *         elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:
+ *             return None
+ *         elif t == TYPE_UNDEFINED:             # <<<<<<<<<<<<<<
+ *             return pyamf.Undefined
+ *         elif t == TYPE_REFERENCE:
+ */
+    case 6:
+
+    /* "/root/package/cpyamf/amf0.pyx":707
+ *             return None
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_REFERENCE:
+ *             return self._readReference()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 707; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__Undefined); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 707; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":708
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined
+ *         elif t == TYPE_REFERENCE:             # <<<<<<<<<<<<<<
+ *             return self._readReference()
+ *         elif t == TYPE_ARRAY:
+ */
+    case 7:
+
+    /* "/root/package/cpyamf/amf0.pyx":709
+ *             return pyamf.Undefined
+ *         elif t == TYPE_REFERENCE:
+ *             return self._readReference()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_ARRAY:
+ *             return self._readList()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readReference(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":710
+ *         elif t == TYPE_REFERENCE:
+ *             return self._readReference()
+ *         elif t == TYPE_ARRAY:             # <<<<<<<<<<<<<<
+ *             return self._readList()
+ *         elif t == TYPE_MIXEDARRAY:
+ */
+    case 10:
+
+    /* "/root/package/cpyamf/amf0.pyx":711
+ *             return self._readReference()
+ *         elif t == TYPE_ARRAY:
+ *             return self._readList()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_MIXEDARRAY:
+ *             return self._readMixedArray()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readList(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":712
+ *         elif t == TYPE_ARRAY:
+ *             return self._readList()
+ *         elif t == TYPE_MIXEDARRAY:             # <<<<<<<<<<<<<<
+ *             return self._readMixedArray()
+ *         elif t == TYPE_DATE:
+ */
+    case 8:
+
+    /* "/root/package/cpyamf/amf0.pyx":713
+ *             return self._readList()
+ *         elif t == TYPE_MIXEDARRAY:
+ *             return self._readMixedArray()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readMixedArray(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 713; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":714
+ *         elif t == TYPE_MIXEDARRAY:
+ *             return self._readMixedArray()
+ *         elif t == TYPE_DATE:             # <<<<<<<<<<<<<<
+ *             return self._readDate()
+ *         elif t == TYPE_LONGSTRING:
+ */
+    case 11:
+
+    /* "/root/package/cpyamf/amf0.pyx":715
+ *             return self._readMixedArray()
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_LONGSTRING:
+ *             return self._readLongString()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readDate(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 715; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":716
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()
+ *         elif t == TYPE_LONGSTRING:             # <<<<<<<<<<<<<<
+ *             return self._readLongString()
+ *         elif t == TYPE_XML:
+ */
+    case 12:
+
+    /* "/root/package/cpyamf/amf0.pyx":717
+ *             return self._readDate()
+ *         elif t == TYPE_LONGSTRING:
+ *             return self._readLongString()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_XML:
+ *             return self._readXML()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readLongString(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 717; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":718
+ *         elif t == TYPE_LONGSTRING:
+ *             return self._readLongString()
+ *         elif t == TYPE_XML:             # <<<<<<<<<<<<<<
+ *             return self._readXML()
+ *         elif t == TYPE_TYPEDOBJECT:
+ */
+    case 15:
+
+    /* "/root/package/cpyamf/amf0.pyx":719
+ *             return self._readLongString()
+ *         elif t == TYPE_XML:
+ *             return self._readXML()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_TYPEDOBJECT:
+ *             return self._readTypedObject()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readXML(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":720
+ *         elif t == TYPE_XML:
+ *             return self._readXML()
+ *         elif t == TYPE_TYPEDOBJECT:             # <<<<<<<<<<<<<<
+ *             return self._readTypedObject()
+ *         elif t == TYPE_AMF3:
+ */
+    case 16:
+
+    /* "/root/package/cpyamf/amf0.pyx":721
+ *             return self._readXML()
+ *         elif t == TYPE_TYPEDOBJECT:
+ *             return self._readTypedObject()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_AMF3:
+ *             return self._readAMF3()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readTypedObject(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf0.pyx":722
+ *         elif t == TYPE_TYPEDOBJECT:
+ *             return self._readTypedObject()
+ *         elif t == TYPE_AMF3:             # <<<<<<<<<<<<<<
+ *             return self._readAMF3()
+ * 
+ */
+    case 17:
+
+    /* "/root/package/cpyamf/amf0.pyx":723
+ *             return self._readTypedObject()
+ *         elif t == TYPE_AMF3:
+ *             return self._readAMF3()             # <<<<<<<<<<<<<<
+ * 
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readAMF3(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":725
+ *             return self._readAMF3()
+ * 
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readNumber(self):
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__DecodeError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_builtin_chr, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_Raise(__pyx_t_2, 0, 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readType");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":727
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+ * 
+ *     cdef object _readNumber(self):             # <<<<<<<<<<<<<<
+ *         cdef double x
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readNumber(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  double __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_readNumber");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/amf0.pyx":730
+ *         cdef double x
+ * 
+ *         if float_broken:             # <<<<<<<<<<<<<<
+ *             return amf0._check_for_int((<object>self.stream).read_double())
+ * 
+ */
+  __pyx_t_1 = __pyx_v_6cpyamf_4amf0_float_broken;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":731
+ * 
+ *         if float_broken:
+ *             return amf0._check_for_int((<object>self.stream).read_double())             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_double(&x)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf0_amf0, __pyx_n_s___check_for_int); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 731; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream), __pyx_n_s__read_double); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 731; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 731; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 731; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 731; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":733
+ *             return amf0._check_for_int((<object>self.stream).read_double())
+ * 
+ *         self.stream.read_double(&x)             # <<<<<<<<<<<<<<
+ * 
+ *         # There is no way in AMF0 to distinguish between integers and floats
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_double(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_x)); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":736
+ * 
+ *         # There is no way in AMF0 to distinguish between integers and floats
+ *         if -MAX_EXACT_INT <= x <= MAX_EXACT_INT and <double>(<long>x) == x:             # <<<<<<<<<<<<<<
+ *             return PyInt_FromLong(<long>x)
+ * 
+ */
+  __pyx_t_1 = ((-9007199254740992.0) <= __pyx_v_x);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_x <= 9007199254740992.0);
+  }
+  if (__pyx_t_1) {
+    __pyx_t_6 = (((double)((long)__pyx_v_x)) == __pyx_v_x);
+    __pyx_t_7 = __pyx_t_6;
+  } else {
+    __pyx_t_7 = __pyx_t_1;
+  }
+  if (__pyx_t_7) {
+
+    /* "/root/package/cpyamf/amf0.pyx":737
+ *         # There is no way in AMF0 to distinguish between integers and floats
+ *         if -MAX_EXACT_INT <= x <= MAX_EXACT_INT and <double>(<long>x) == x:
+ *             return PyInt_FromLong(<long>x)             # <<<<<<<<<<<<<<
+ * 
+ *         return amf0._check_for_int(PyFloat_FromDouble(x))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_4 = PyInt_FromLong(((long)__pyx_v_x)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 737; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":739
+ *             return PyInt_FromLong(<long>x)
+ * 
+ *         return amf0._check_for_int(PyFloat_FromDouble(x))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readBoolean(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf0_amf0, __pyx_n_s___check_for_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 739; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 739; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 739; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 739; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readNumber");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":741
+ *         return amf0._check_for_int(PyFloat_FromDouble(x))
+ * 
+ *     cdef object _readBoolean(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned char b
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readBoolean(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned char __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  unsigned char __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("_readBoolean");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/amf0.pyx":744
+ *         cdef unsigned char b
+ * 
+ *         self.stream.read_uchar(&b)             # <<<<<<<<<<<<<<
+ * 
+ *         if b:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_b)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 744; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":746
+ *         self.stream.read_uchar(&b)
+ * 
+ *         if b:             # <<<<<<<<<<<<<<
+ *             return True
+ * 
+ */
+  __pyx_t_2 = __pyx_v_b;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":747
+ * 
+ *         if b:
+ *             return True             # <<<<<<<<<<<<<<
+ * 
+ *         return False
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 747; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":749
+ *             return True
+ * 
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readString(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readBoolean");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":751
+ *         return False
+ * 
+ *     cdef object _readString(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned short l
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readString(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned short __pyx_v_l;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("_readString");
+
+  /* "/root/package/cpyamf/amf0.pyx":754
+ *         cdef unsigned short l
+ * 
+ *         self.stream.read_ushort(&l)             # <<<<<<<<<<<<<<
+ * 
+ *         return _read_bytes(self.stream, l, 1)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_ushort(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":756
+ *         self.stream.read_ushort(&l)
+ * 
+ *         return _read_bytes(self.stream, l, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readLongString(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf0__read_bytes(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_l, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readString");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":758
+ *         return _read_bytes(self.stream, l, 1)
+ * 
+ *     cdef object _readLongString(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long l
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readLongString(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned long __pyx_v_l;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("_readLongString");
+
+  /* "/root/package/cpyamf/amf0.pyx":761
+ *         cdef unsigned long l
+ * 
+ *         self.stream.read_ulong(&l)             # <<<<<<<<<<<<<<
+ * 
+ *         return _read_bytes(self.stream, l, 1)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 761; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":763
+ *         self.stream.read_ulong(&l)
+ * 
+ *         return _read_bytes(self.stream, l, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _readObject(self, object obj, object alias) except -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf0__read_bytes(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_l, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readLongString");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":765
+ *         return _read_bytes(self.stream, l, 1)
+ * 
+ *     cdef int _readObject(self, object obj, object alias) except -1:             # <<<<<<<<<<<<<<
+ *         cdef cBufferedByteStream stream = self.stream
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf0_7Decoder__readObject(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_alias) {
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream = 0;
+  PyObject *__pyx_v_obj_attrs;
+  PyObject *__pyx_v_key;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_readObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_obj);
+  __Pyx_INCREF(__pyx_v_alias);
+  __pyx_v_obj_attrs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":766
+ * 
+ *     cdef int _readObject(self, object obj, object alias) except -1:
+ *         cdef cBufferedByteStream stream = self.stream             # <<<<<<<<<<<<<<
+ * 
+ *         obj_attrs = {}
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+  __pyx_v_stream = __pyx_v_self->__pyx_base.__pyx_base.stream;
+
+  /* "/root/package/cpyamf/amf0.pyx":768
+ *         cdef cBufferedByteStream stream = self.stream
+ * 
+ *         obj_attrs = {}             # <<<<<<<<<<<<<<
+ * 
+ *         key = self._readString().encode('utf8')
+ */
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_v_obj_attrs);
+  __pyx_v_obj_attrs = ((PyObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":770
+ *         obj_attrs = {}
+ * 
+ *         key = self._readString().encode('utf8')             # <<<<<<<<<<<<<<
+ * 
+ *         while stream.pos >= stream.length or stream.buffer[stream.pos] != TYPE_OBJECTTERM:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__encode); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__utf8));
+  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__utf8));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__utf8));
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_key);
+  __pyx_v_key = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":772
+ *         key = self._readString().encode('utf8')
+ * 
+ *         while stream.pos >= stream.length or stream.buffer[stream.pos] != TYPE_OBJECTTERM:             # <<<<<<<<<<<<<<
+ *             obj_attrs[key] = self._readElement()
+ *             key = self._readString().encode('utf8')
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_stream->pos >= __pyx_v_stream->length);
+    if (!__pyx_t_4) {
+      __pyx_t_5 = ((__pyx_v_stream->buffer[__pyx_v_stream->pos]) != 9);
+      __pyx_t_6 = __pyx_t_5;
+    } else {
+      __pyx_t_6 = __pyx_t_4;
+    }
+    if (!__pyx_t_6) break;
+
+    /* "/root/package/cpyamf/amf0.pyx":773
+ * 
+ *         while stream.pos >= stream.length or stream.buffer[stream.pos] != TYPE_OBJECTTERM:
+ *             obj_attrs[key] = self._readElement()             # <<<<<<<<<<<<<<
+ *             key = self._readString().encode('utf8')
+ * 
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 773; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    if (PyObject_SetItem(__pyx_v_obj_attrs, __pyx_v_key, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 773; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":774
+ *         while stream.pos >= stream.length or stream.buffer[stream.pos] != TYPE_OBJECTTERM:
+ *             obj_attrs[key] = self._readElement()
+ *             key = self._readString().encode('utf8')             # <<<<<<<<<<<<<<
+ * 
+ *         # discard the end marker (TYPE_OBJECTTERM)
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__encode); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)__pyx_n_s__utf8));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_n_s__utf8));
+    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__utf8));
+    __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_key);
+    __pyx_v_key = __pyx_t_2;
+    __pyx_t_2 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":777
+ * 
+ *         # discard the end marker (TYPE_OBJECTTERM)
+ *         stream.pos += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if alias:
+ */
+  __pyx_v_stream->pos += 1;
+
+  /* "/root/package/cpyamf/amf0.pyx":779
+ *         stream.pos += 1
+ * 
+ *         if alias:             # <<<<<<<<<<<<<<
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)
+ *         else:
+ */
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_alias); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 779; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/amf0.pyx":780
+ * 
+ *         if alias:
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)             # <<<<<<<<<<<<<<
+ *         else:
+ *             util.set_attrs(obj, obj_attrs)
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__applyAttributes); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __Pyx_INCREF(__pyx_v_obj_attrs);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_obj_attrs);
+    __Pyx_GIVEREF(__pyx_v_obj_attrs);
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_3, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    goto __pyx_L5;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf0.pyx":782
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)
+ *         else:
+ *             util.set_attrs(obj, obj_attrs)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__set_attrs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __Pyx_INCREF(__pyx_v_obj_attrs);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_obj_attrs);
+    __Pyx_GIVEREF(__pyx_v_obj_attrs);
+    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf0.pyx":784
+ *             util.set_attrs(obj, obj_attrs)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readASObject(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readObject");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_stream);
+  __Pyx_DECREF(__pyx_v_obj_attrs);
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":786
+ *         return 0
+ * 
+ *     cdef object _readASObject(self):             # <<<<<<<<<<<<<<
+ *         obj = pyamf.ASObject()
+ *         _add_object(self.context, obj)
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readASObject(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  PyObject *__pyx_v_obj;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("_readASObject");
+  __pyx_v_obj = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":787
+ * 
+ *     cdef object _readASObject(self):
+ *         obj = pyamf.ASObject()             # <<<<<<<<<<<<<<
+ *         _add_object(self.context, obj)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__ASObject); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_obj);
+  __pyx_v_obj = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":788
+ *     cdef object _readASObject(self):
+ *         obj = pyamf.ASObject()
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         self._readObject(obj, None)
+ */
+  __pyx_t_3 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":790
+ *         _add_object(self.context, obj)
+ * 
+ *         self._readObject(obj, None)             # <<<<<<<<<<<<<<
+ * 
+ *         return obj
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readObject(__pyx_v_self, __pyx_v_obj, Py_None); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":792
+ *         self._readObject(obj, None)
+ * 
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readReference(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readASObject");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":794
+ *         return obj
+ * 
+ *     cdef object _readReference(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned short idx
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readReference(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned short __pyx_v_idx;
+  PyObject *__pyx_v_o;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_readReference");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_o = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":797
+ *         cdef unsigned short idx
+ * 
+ *         self.stream.read_ushort(&idx)             # <<<<<<<<<<<<<<
+ * 
+ *         o = _get_object(self.context, idx)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_ushort(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_idx)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 797; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":799
+ *         self.stream.read_ushort(&idx)
+ * 
+ *         o = _get_object(self.context, idx)             # <<<<<<<<<<<<<<
+ * 
+ *         if o is None:
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf0__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_idx); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_v_o);
+  __pyx_v_o = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":801
+ *         o = _get_object(self.context, idx)
+ * 
+ *         if o is None:             # <<<<<<<<<<<<<<
+ *             raise pyamf.ReferenceError('Unknown reference %d' % (idx,))
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_o == Py_None);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf0.pyx":802
+ * 
+ *         if o is None:
+ *             raise pyamf.ReferenceError('Unknown reference %d' % (idx,))             # <<<<<<<<<<<<<<
+ * 
+ *         return o
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__ReferenceError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyInt_FromLong(__pyx_v_idx); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_11), __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":804
+ *             raise pyamf.ReferenceError('Unknown reference %d' % (idx,))
+ * 
+ *         return o             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readList(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_o);
+  __pyx_r = __pyx_v_o;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readReference");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_o);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":806
+ *         return o
+ * 
+ *     cdef object _readList(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long l, i
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readList(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned long __pyx_v_l;
+  unsigned long __pyx_v_i;
+  PyObject *__pyx_v_obj;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  unsigned long __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("_readList");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_obj = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":809
+ *         cdef unsigned long l, i
+ * 
+ *         obj = []             # <<<<<<<<<<<<<<
+ *         _add_object(self.context, obj)
+ * 
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 809; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_v_obj);
+  __pyx_v_obj = ((PyObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":810
+ * 
+ *         obj = []
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_ulong(&l)
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":812
+ *         _add_object(self.context, obj)
+ * 
+ *         self.stream.read_ulong(&l)             # <<<<<<<<<<<<<<
+ * 
+ *         for i from 0 <= i < l:
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_l)); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 812; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":814
+ *         self.stream.read_ulong(&l)
+ * 
+ *         for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *             obj.append(self._readElement())
+ * 
+ */
+  __pyx_t_3 = __pyx_v_l;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/amf0.pyx":815
+ * 
+ *         for i from 0 <= i < l:
+ *             obj.append(self._readElement())             # <<<<<<<<<<<<<<
+ * 
+ *         return obj
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 815; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyObject_Append(__pyx_v_obj, __pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 815; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":817
+ *             obj.append(self._readElement())
+ * 
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readMixedArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readList");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":819
+ *         return obj
+ * 
+ *     cdef object _readMixedArray(self):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long l
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readMixedArray(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  unsigned long __pyx_v_l;
+  PyObject *__pyx_v_obj;
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_v_ikey;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_readMixedArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_obj = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_ikey = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":822
+ *         cdef unsigned long l
+ * 
+ *         self.stream.read_ulong(&l)             # <<<<<<<<<<<<<<
+ * 
+ *         obj = pyamf.MixedArray()
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_ulong(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 822; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":824
+ *         self.stream.read_ulong(&l)
+ * 
+ *         obj = pyamf.MixedArray()             # <<<<<<<<<<<<<<
+ *         _add_object(self.context, obj)
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__MixedArray); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_obj);
+  __pyx_v_obj = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":825
+ * 
+ *         obj = pyamf.MixedArray()
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         self._readObject(obj, None)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 825; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":827
+ *         _add_object(self.context, obj)
+ * 
+ *         self._readObject(obj, None)             # <<<<<<<<<<<<<<
+ * 
+ *         for key in obj.keys():
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readObject(__pyx_v_self, __pyx_v_obj, Py_None); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":829
+ *         self._readObject(obj, None)
+ * 
+ *         for key in obj.keys():             # <<<<<<<<<<<<<<
+ *             try:
+ *                 ikey = int(key)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s__keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
+    __pyx_t_4 = 0; __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_DECREF(__pyx_v_key);
+    __pyx_v_key = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":830
+ * 
+ *         for key in obj.keys():
+ *             try:             # <<<<<<<<<<<<<<
+ *                 ikey = int(key)
+ *             except ValueError:
+ */
+    {
+      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+      __Pyx_XGOTREF(__pyx_save_exc_type);
+      __Pyx_XGOTREF(__pyx_save_exc_value);
+      __Pyx_XGOTREF(__pyx_save_exc_tb);
+      /*try:*/ {
+
+        /* "/root/package/cpyamf/amf0.pyx":831
+ *         for key in obj.keys():
+ *             try:
+ *                 ikey = int(key)             # <<<<<<<<<<<<<<
+ *             except ValueError:
+ *                 continue
+ */
+        __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_v_key);
+        PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_key);
+        __Pyx_GIVEREF(__pyx_v_key);
+        __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_v_ikey);
+        __pyx_v_ikey = __pyx_t_5;
+        __pyx_t_5 = 0;
+      }
+      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+      goto __pyx_L12_try_end;
+      __pyx_L5_error:;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":832
+ *             try:
+ *                 ikey = int(key)
+ *             except ValueError:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      __pyx_t_1 = PyErr_ExceptionMatches(__pyx_builtin_ValueError);
+      if (__pyx_t_1) {
+        __Pyx_AddTraceback("cpyamf.amf0.Decoder._readMixedArray");
+        if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_3, &__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_GOTREF(__pyx_t_6);
+
+        /* "/root/package/cpyamf/amf0.pyx":833
+ *                 ikey = int(key)
+ *             except ValueError:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             obj[ikey] = obj[key]
+ */
+        goto __pyx_L14_except_continue;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        goto __pyx_L6_exception_handled;
+        __pyx_L14_except_continue:;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        goto __pyx_L11_try_continue;
+      }
+      __pyx_L7_except_error:;
+      __Pyx_XGIVEREF(__pyx_save_exc_type);
+      __Pyx_XGIVEREF(__pyx_save_exc_value);
+      __Pyx_XGIVEREF(__pyx_save_exc_tb);
+      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+      goto __pyx_L1_error;
+      __pyx_L11_try_continue:;
+      __Pyx_XGIVEREF(__pyx_save_exc_type);
+      __Pyx_XGIVEREF(__pyx_save_exc_value);
+      __Pyx_XGIVEREF(__pyx_save_exc_tb);
+      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+      goto __pyx_L3_continue;
+      __pyx_L6_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_save_exc_type);
+      __Pyx_XGIVEREF(__pyx_save_exc_value);
+      __Pyx_XGIVEREF(__pyx_save_exc_tb);
+      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+      __pyx_L12_try_end:;
+    }
+
+    /* "/root/package/cpyamf/amf0.pyx":835
+ *                 continue
+ * 
+ *             obj[ikey] = obj[key]             # <<<<<<<<<<<<<<
+ *             del obj[key]
+ * 
+ */
+    __pyx_t_6 = PyObject_GetItem(__pyx_v_obj, __pyx_v_key); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    if (PyObject_SetItem(__pyx_v_obj, __pyx_v_ikey, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":836
+ * 
+ *             obj[ikey] = obj[key]
+ *             del obj[key]             # <<<<<<<<<<<<<<
+ * 
+ *         return obj
+ */
+    if (PyObject_DelItem(__pyx_v_obj, __pyx_v_key) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_L3_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":838
+ *             del obj[key]
+ * 
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readDate(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readMixedArray");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF(__pyx_v_ikey);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":840
+ *         return obj
+ * 
+ *     cdef object _readDate(self):             # <<<<<<<<<<<<<<
+ *         cdef double ms
+ *         cdef short tz
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readDate(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  double __pyx_v_ms;
+  short __pyx_v_tz;
+  PyObject *__pyx_v_d;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("_readDate");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_d = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":844
+ *         cdef short tz
+ * 
+ *         self.stream.read_double(&ms)             # <<<<<<<<<<<<<<
+ *         # Timezones are ignored
+ *         self.stream.read_short(&tz)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_double(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_ms)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":846
+ *         self.stream.read_double(&ms)
+ *         # Timezones are ignored
+ *         self.stream.read_short(&tz)             # <<<<<<<<<<<<<<
+ * 
+ *         d = util.get_datetime(ms / 1000.0)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_short(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_tz)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 846; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":848
+ *         self.stream.read_short(&tz)
+ * 
+ *         d = util.get_datetime(ms / 1000.0)             # <<<<<<<<<<<<<<
+ * 
+ *         if self.timezone_offset:
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__get_datetime); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyFloat_FromDouble((__pyx_v_ms / 1000.0)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_d);
+  __pyx_v_d = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":850
+ *         d = util.get_datetime(ms / 1000.0)
+ * 
+ *         if self.timezone_offset:             # <<<<<<<<<<<<<<
+ *             d = d + self.timezone_offset
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_self->__pyx_base.__pyx_base.timezone_offset); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 850; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_5) {
+
+    /* "/root/package/cpyamf/amf0.pyx":851
+ * 
+ *         if self.timezone_offset:
+ *             d = d + self.timezone_offset             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, d)
+ */
+    __pyx_t_2 = PyNumber_Add(__pyx_v_d, __pyx_v_self->__pyx_base.__pyx_base.timezone_offset); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 851; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_v_d);
+    __pyx_v_d = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":853
+ *             d = d + self.timezone_offset
+ * 
+ *         _add_object(self.context, d)             # <<<<<<<<<<<<<<
+ * 
+ *         return d
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_d); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":855
+ *         _add_object(self.context, d)
+ * 
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readXML(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_d);
+  __pyx_r = __pyx_v_d;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readDate");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_d);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":857
+ *         return d
+ * 
+ *     cdef object _readXML(self):             # <<<<<<<<<<<<<<
+ *         data = self._readLongString()
+ *         xml = util.ET.fromstring(data)
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readXML(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  PyObject *__pyx_v_data;
+  PyObject *__pyx_v_xml;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_readXML");
+  __pyx_v_data = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_xml = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":858
+ * 
+ *     cdef object _readXML(self):
+ *         data = self._readLongString()             # <<<<<<<<<<<<<<
+ *         xml = util.ET.fromstring(data)
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readLongString(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 858; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_data);
+  __pyx_v_data = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":859
+ *     cdef object _readXML(self):
+ *         data = self._readLongString()
+ *         xml = util.ET.fromstring(data)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, xml)
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__ET); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__fromstring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_xml);
+  __pyx_v_xml = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":861
+ *         xml = util.ET.fromstring(data)
+ * 
+ *         _add_object(self.context, xml)             # <<<<<<<<<<<<<<
+ * 
+ *         return xml
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_xml); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 861; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":863
+ *         _add_object(self.context, xml)
+ * 
+ *         return xml             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readTypedObject(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_xml);
+  __pyx_r = __pyx_v_xml;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readXML");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_DECREF(__pyx_v_xml);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":865
+ *         return xml
+ * 
+ *     cdef object _readTypedObject(self):             # <<<<<<<<<<<<<<
+ *         classname = self._readString()
+ *         alias = None
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readTypedObject(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  PyObject *__pyx_v_classname;
+  PyObject *__pyx_v_alias;
+  PyObject *__pyx_v_ret;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("_readTypedObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_classname = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_alias = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":866
+ * 
+ *     cdef object _readTypedObject(self):
+ *         classname = self._readString()             # <<<<<<<<<<<<<<
+ *         alias = None
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_classname);
+  __pyx_v_classname = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":867
+ *     cdef object _readTypedObject(self):
+ *         classname = self._readString()
+ *         alias = None             # <<<<<<<<<<<<<<
+ * 
+ *         try:
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_alias);
+  __pyx_v_alias = Py_None;
+
+  /* "/root/package/cpyamf/amf0.pyx":869
+ *         alias = None
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             alias = pyamf.get_class_alias(classname)
+ * 
+ */
+  {
+    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+    __Pyx_XGOTREF(__pyx_save_exc_type);
+    __Pyx_XGOTREF(__pyx_save_exc_value);
+    __Pyx_XGOTREF(__pyx_save_exc_tb);
+    /*try:*/ {
+
+      /* "/root/package/cpyamf/amf0.pyx":870
+ * 
+ *         try:
+ *             alias = pyamf.get_class_alias(classname)             # <<<<<<<<<<<<<<
+ * 
+ *             ret = alias.createInstance(codec=self)
+ */
+      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__get_class_alias); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_v_classname);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_classname);
+      __Pyx_GIVEREF(__pyx_v_classname);
+      __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_v_alias);
+      __pyx_v_alias = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "/root/package/cpyamf/amf0.pyx":872
+ *             alias = pyamf.get_class_alias(classname)
+ * 
+ *             ret = alias.createInstance(codec=self)             # <<<<<<<<<<<<<<
+ *         except pyamf.UnknownClassAlias:
+ *             if self.strict:
+ */
+      __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__createInstance); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+      if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_t_2 = PyEval_CallObjectWithKeywords(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_v_ret);
+      __pyx_v_ret = __pyx_t_2;
+      __pyx_t_2 = 0;
+    }
+    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+    goto __pyx_L10_try_end;
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":873
+ * 
+ *             ret = alias.createInstance(codec=self)
+ *         except pyamf.UnknownClassAlias:             # <<<<<<<<<<<<<<
+ *             if self.strict:
+ *                 raise
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 873; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__UnknownClassAlias); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 873; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = PyErr_ExceptionMatches(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("cpyamf.amf0.Decoder._readTypedObject");
+      if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 873; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_t_3);
+
+      /* "/root/package/cpyamf/amf0.pyx":874
+ *             ret = alias.createInstance(codec=self)
+ *         except pyamf.UnknownClassAlias:
+ *             if self.strict:             # <<<<<<<<<<<<<<
+ *                 raise
+ * 
+ */
+      __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_self->__pyx_base.__pyx_base.strict); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 874; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      if (__pyx_t_5) {
+
+        /* "/root/package/cpyamf/amf0.pyx":875
+ *         except pyamf.UnknownClassAlias:
+ *             if self.strict:
+ *                 raise             # <<<<<<<<<<<<<<
+ * 
+ *             ret = pyamf.TypedObject(classname)
+ */
+        __Pyx_GIVEREF(__pyx_t_1);
+        __Pyx_GIVEREF(__pyx_t_2);
+        __Pyx_GIVEREF(__pyx_t_3);
+        __Pyx_ErrRestore(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+        __pyx_t_1 = 0; __pyx_t_2 = 0; __pyx_t_3 = 0; 
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+        goto __pyx_L13;
+      }
+      __pyx_L13:;
+
+      /* "/root/package/cpyamf/amf0.pyx":877
+ *                 raise
+ * 
+ *             ret = pyamf.TypedObject(classname)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, ret)
+ */
+      __pyx_t_6 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyObject_GetAttr(__pyx_t_6, __pyx_n_s__TypedObject); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_v_classname);
+      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_classname);
+      __Pyx_GIVEREF(__pyx_v_classname);
+      __pyx_t_8 = PyObject_Call(__pyx_t_7, __pyx_t_6, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_v_ret);
+      __pyx_v_ret = __pyx_t_8;
+      __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L4_exception_handled;
+    }
+    __pyx_L5_except_error:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L1_error;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    __pyx_L10_try_end:;
+  }
+
+  /* "/root/package/cpyamf/amf0.pyx":879
+ *             ret = pyamf.TypedObject(classname)
+ * 
+ *         _add_object(self.context, ret)             # <<<<<<<<<<<<<<
+ *         self._readObject(ret, alias)
+ * 
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf0__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_ret); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 879; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":880
+ * 
+ *         _add_object(self.context, ret)
+ *         self._readObject(ret, alias)             # <<<<<<<<<<<<<<
+ * 
+ *         return ret
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readObject(__pyx_v_self, __pyx_v_ret, __pyx_v_alias); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 880; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf0.pyx":882
+ *         self._readObject(ret, alias)
+ * 
+ *         return ret             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readAMF3(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_ret);
+  __pyx_r = __pyx_v_ret;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readTypedObject");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_classname);
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_ret);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":884
+ *         return ret
+ * 
+ *     cdef object _readAMF3(self):             # <<<<<<<<<<<<<<
+ *         context = self.context
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf0_7Decoder__readAMF3(struct __pyx_obj_6cpyamf_4amf0_Decoder *__pyx_v_self) {
+  PyObject *__pyx_v_context;
+  PyObject *__pyx_v_element;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_readAMF3");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_context = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_element = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf0.pyx":885
+ * 
+ *     cdef object _readAMF3(self):
+ *         context = self.context             # <<<<<<<<<<<<<<
+ * 
+ *         if not hasattr(context, 'amf3_context'):
+ */
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.context);
+  __Pyx_DECREF(__pyx_v_context);
+  __pyx_v_context = __pyx_v_self->__pyx_base.__pyx_base.context;
+
+  /* "/root/package/cpyamf/amf0.pyx":887
+ *         context = self.context
+ * 
+ *         if not hasattr(context, 'amf3_context'):             # <<<<<<<<<<<<<<
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)
+ * 
+ */
+  __pyx_t_1 = PyObject_HasAttr(__pyx_v_context, ((PyObject *)__pyx_n_s__amf3_context)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 887; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (!__pyx_t_1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf0.pyx":888
+ * 
+ *         if not hasattr(context, 'amf3_context'):
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)             # <<<<<<<<<<<<<<
+ * 
+ *         if not hasattr(context, 'amf3_decoder'):
+ */
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__get_context); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (PyObject_SetAttr(__pyx_v_context, __pyx_n_s__amf3_context, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf0.pyx":890
+ *             context.amf3_context = pyamf.get_context(pyamf.AMF3)
+ * 
+ *         if not hasattr(context, 'amf3_decoder'):             # <<<<<<<<<<<<<<
+ *             context.amf3_decoder = pyamf.get_decoder(
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ */
+  __pyx_t_2 = PyObject_HasAttr(__pyx_v_context, ((PyObject *)__pyx_n_s__amf3_decoder)); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = (!__pyx_t_2);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf0.pyx":891
+ * 
+ *         if not hasattr(context, 'amf3_decoder'):
+ *             context.amf3_decoder = pyamf.get_decoder(             # <<<<<<<<<<<<<<
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ */
+    __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__get_decoder); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":892
+ *         if not hasattr(context, 'amf3_decoder'):
+ *             context.amf3_decoder = pyamf.get_decoder(
+ *                 pyamf.AMF3, self.stream, context.amf3_context)             # <<<<<<<<<<<<<<
+ * 
+ *         element = context.amf3_decoder.readElement()
+ */
+    __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 892; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 892; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__amf3_context); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 892; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    PyTuple_SET_ITEM(__pyx_t_6, 1, ((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "/root/package/cpyamf/amf0.pyx":891
+ * 
+ *         if not hasattr(context, 'amf3_decoder'):
+ *             context.amf3_decoder = pyamf.get_decoder(             # <<<<<<<<<<<<<<
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ */
+    if (PyObject_SetAttr(__pyx_v_context, __pyx_n_s__amf3_decoder, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf0.pyx":894
+ *                 pyamf.AMF3, self.stream, context.amf3_context)
+ * 
+ *         element = context.amf3_decoder.readElement()             # <<<<<<<<<<<<<<
+ *         context.addAMF3Object(element)
+ * 
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__amf3_decoder); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 894; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__readElement); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 894; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_6, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 894; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_v_element);
+  __pyx_v_element = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":895
+ * 
+ *         element = context.amf3_decoder.readElement()
+ *         context.addAMF3Object(element)             # <<<<<<<<<<<<<<
+ * 
+ *         return element
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__addAMF3Object); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 895; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 895; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_INCREF(__pyx_v_element);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_element);
+  __Pyx_GIVEREF(__pyx_v_element);
+  __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 895; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":897
+ *         context.addAMF3Object(element)
+ * 
+ *         return element             # <<<<<<<<<<<<<<
+ * 
+ *     def readNumber(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_element);
+  __pyx_r = __pyx_v_element;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder._readAMF3");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_element);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":899
+ *         return element
+ * 
+ *     def readNumber(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a ActionScript C{Number} value.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readNumber(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readNumber[] = "\n        Reads a ActionScript C{Number} value.\n\n        @rtype: C{int} or C{float}\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readNumber(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readNumber");
+
+  /* "/root/package/cpyamf/amf0.pyx":905
+ *         @rtype: C{int} or C{float}
+ *         """
+ *         return self._readNumber()             # <<<<<<<<<<<<<<
+ * 
+ *     def readBoolean(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readNumber(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 905; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readNumber");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":907
+ *         return self._readNumber()
+ * 
+ *     def readBoolean(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a ActionScript C{Boolean} value.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readBoolean(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readBoolean[] = "\n        Reads a ActionScript C{Boolean} value.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readBoolean(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readBoolean");
+
+  /* "/root/package/cpyamf/amf0.pyx":911
+ *         Reads a ActionScript C{Boolean} value.
+ *         """
+ *         return self._readBoolean()             # <<<<<<<<<<<<<<
+ * 
+ *     def readNull(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readBoolean(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readBoolean");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":913
+ *         return self._readBoolean()
+ * 
+ *     def readNull(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a ActionScript C{null} value.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readNull(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readNull[] = "\n        Reads a ActionScript C{null} value.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readNull(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannySetupContext("readNull");
+
+  /* "/root/package/cpyamf/amf0.pyx":917
+ *         Reads a ActionScript C{null} value.
+ *         """
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     def readUndefined(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_None);
+  __pyx_r = Py_None;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":919
+ *         return None
+ * 
+ *     def readUndefined(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads an ActionScript C{undefined} value.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readUndefined(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readUndefined[] = "\n        Reads an ActionScript C{undefined} value.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readUndefined(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readUndefined");
+
+  /* "/root/package/cpyamf/amf0.pyx":923
+ *         Reads an ActionScript C{undefined} value.
+ *         """
+ *         return pyamf.Undefined             # <<<<<<<<<<<<<<
+ * 
+ *     def readMixedArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 923; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__Undefined); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 923; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readUndefined");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":925
+ *         return pyamf.Undefined
+ * 
+ *     def readMixedArray(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read mixed array.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readMixedArray(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readMixedArray[] = "\n        Read mixed array.\n\n        @rtype: L{pyamf.MixedArray}\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readMixedArray(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readMixedArray");
+
+  /* "/root/package/cpyamf/amf0.pyx":931
+ *         @rtype: L{pyamf.MixedArray}
+ *         """
+ *         return self._readMixedArray()             # <<<<<<<<<<<<<<
+ * 
+ *     def readList(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readMixedArray(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readMixedArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":933
+ *         return self._readMixedArray()
+ * 
+ *     def readList(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read a C{list} from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readList(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readList[] = "\n        Read a C{list} from the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readList(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readList");
+
+  /* "/root/package/cpyamf/amf0.pyx":937
+ *         Read a C{list} from the data stream.
+ *         """
+ *         return self._readList()             # <<<<<<<<<<<<<<
+ * 
+ *     def readTypedObject(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readList(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 937; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readList");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":939
+ *         return self._readList()
+ * 
+ *     def readTypedObject(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads an ActionScript object from the stream and attempts to
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readTypedObject(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readTypedObject[] = "\n        Reads an ActionScript object from the stream and attempts to\n        'cast' it.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readTypedObject(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readTypedObject");
+
+  /* "/root/package/cpyamf/amf0.pyx":944
+ *         'cast' it.
+ *         """
+ *         return self._readTypedObject()             # <<<<<<<<<<<<<<
+ * 
+ *     def readAMF3(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readTypedObject(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 944; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readTypedObject");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":946
+ *         return self._readTypedObject()
+ * 
+ *     def readAMF3(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read AMF3 elements from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readAMF3(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readAMF3[] = "\n        Read AMF3 elements from the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readAMF3(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readAMF3");
+
+  /* "/root/package/cpyamf/amf0.pyx":950
+ *         Read AMF3 elements from the data stream.
+ *         """
+ *         return self._readAMF3()             # <<<<<<<<<<<<<<
+ * 
+ *     def readString(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readAMF3(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 950; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readAMF3");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":952
+ *         return self._readAMF3()
+ * 
+ *     def readString(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a string from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readString(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readString[] = "\n        Reads a string from the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readString(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readString");
+
+  /* "/root/package/cpyamf/amf0.pyx":956
+ *         Reads a string from the data stream.
+ *         """
+ *         return self._readString()             # <<<<<<<<<<<<<<
+ * 
+ *     def readObject(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readString(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 956; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":958
+ *         return self._readString()
+ * 
+ *     def readObject(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads an object from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readObject(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readObject[] = "\n        Reads an object from the data stream.\n\n        @rtype: L{ASObject<pyamf.ASObject>}\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readObject(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readObject");
+
+  /* "/root/package/cpyamf/amf0.pyx":964
+ *         @rtype: L{ASObject<pyamf.ASObject>}
+ *         """
+ *         return self._readASObject()             # <<<<<<<<<<<<<<
+ * 
+ *     def readReference(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readASObject(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 964; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readObject");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":966
+ *         return self._readASObject()
+ * 
+ *     def readReference(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a reference from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readReference(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readReference[] = "\n        Reads a reference from the data stream.\n\n        @raise pyamf.ReferenceError: Unknown reference.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readReference(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readReference");
+
+  /* "/root/package/cpyamf/amf0.pyx":972
+ *         @raise pyamf.ReferenceError: Unknown reference.
+ *         """
+ *         return self._readReference()             # <<<<<<<<<<<<<<
+ * 
+ *     def readDate(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readReference(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readReference");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":974
+ *         return self._readReference()
+ * 
+ *     def readDate(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a UTC date from the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readDate(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readDate[] = "\n        Reads a UTC date from the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readDate(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readDate");
+
+  /* "/root/package/cpyamf/amf0.pyx":978
+ *         Reads a UTC date from the data stream.
+ *         """
+ *         return self._readDate()             # <<<<<<<<<<<<<<
+ * 
+ *     def readLongString(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readDate(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 978; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readDate");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":980
+ *         return self._readDate()
+ * 
+ *     def readLongString(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read UTF8 string.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readLongString(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readLongString[] = "\n        Read UTF8 string.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readLongString(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readLongString");
+
+  /* "/root/package/cpyamf/amf0.pyx":984
+ *         Read UTF8 string.
+ *         """
+ *         return self._readLongString()             # <<<<<<<<<<<<<<
+ * 
+ *     def readXML(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readLongString(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 984; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readLongString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf0.pyx":986
+ *         return self._readLongString()
+ * 
+ *     def readXML(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read XML.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readXML(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf0_7Decoder_readXML[] = "\n        Read XML.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf0_7Decoder_readXML(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readXML");
+
+  /* "/root/package/cpyamf/amf0.pyx":990
+ *         Read XML.
+ *         """
+ *         return self._readXML()             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder *)((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readXML(((struct __pyx_obj_6cpyamf_4amf0_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 990; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf0.Decoder.readXML");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/codec.pxd":8
+ * 
+ * cdef class Codec:
+ *     cdef public cBufferedByteStream stream             # <<<<<<<<<<<<<<
+ *     cdef public object context
+ *     cdef public object strict
+ */
+
+static PyObject *__pyx_pf_6cpyamf_5codec_5Codec_6stream___get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_5codec_5Codec_6stream___get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannySetupContext("__get__");
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream));
+  __pyx_r = ((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6cpyamf_5codec_5Codec_6stream___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pf_6cpyamf_5codec_5Codec_6stream___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannySetupContext("__set__");
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_6cpyamf_4util_cBufferedByteStream))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream);
+  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream));
+  ((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream = ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_value);
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.codec.Codec.stream.__set__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_6cpyamf_4amf0_Encoder __pyx_vtable_6cpyamf_4amf0_Encoder;
+
+static PyObject *__pyx_tp_new_6cpyamf_4amf0_Encoder(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_6cpyamf_4amf0_Encoder *p;
+  PyObject *o = __pyx_ptype_6cpyamf_5codec_Encoder->tp_new(t, a, k);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_6cpyamf_4amf0_Encoder *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_6cpyamf_5codec_Encoder*)__pyx_vtabptr_6cpyamf_4amf0_Encoder;
+  p->use_amf3 = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_6cpyamf_4amf0_Encoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf0_Encoder *p = (struct __pyx_obj_6cpyamf_4amf0_Encoder *)o;
+  Py_XDECREF(p->use_amf3);
+  __pyx_ptype_6cpyamf_5codec_Encoder->tp_dealloc(o);
+}
+
+static int __pyx_tp_traverse_6cpyamf_4amf0_Encoder(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6cpyamf_4amf0_Encoder *p = (struct __pyx_obj_6cpyamf_4amf0_Encoder *)o;
+  if (__pyx_ptype_6cpyamf_5codec_Encoder->tp_traverse) {
+    e = __pyx_ptype_6cpyamf_5codec_Encoder->tp_traverse(o, v, a); if (e) return e;
+  }
+  if (p->use_amf3) {
+    e = (*v)(p->use_amf3, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6cpyamf_4amf0_Encoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf0_Encoder *p = (struct __pyx_obj_6cpyamf_4amf0_Encoder *)o;
+  PyObject* tmp;
+  if (__pyx_ptype_6cpyamf_5codec_Encoder->tp_clear) {
+    __pyx_ptype_6cpyamf_5codec_Encoder->tp_clear(o);
+  }
+  tmp = ((PyObject*)p->use_amf3);
+  p->use_amf3 = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static struct PyMethodDef __pyx_methods_6cpyamf_4amf0_Encoder[] = {
+  {__Pyx_NAMESTR("buildContext"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_buildContext, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("writeElement"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeElement, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeElement)},
+  {__Pyx_NAMESTR("writeType"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeType, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeType)},
+  {__Pyx_NAMESTR("writeUndefined"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeUndefined, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeUndefined)},
+  {__Pyx_NAMESTR("writeFunc"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeFunc, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeFunc)},
+  {__Pyx_NAMESTR("writeRawAMF"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeRawAMF, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeRawAMF)},
+  {__Pyx_NAMESTR("writeUnsupported"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeUnsupported, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeUnsupported)},
+  {__Pyx_NAMESTR("writeNull"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeNull, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeNull)},
+  {__Pyx_NAMESTR("writeArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeArray, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeArray)},
+  {__Pyx_NAMESTR("writeNumber"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeNumber, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeNumber)},
+  {__Pyx_NAMESTR("writeBoolean"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeBoolean, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeBoolean)},
+  {__Pyx_NAMESTR("writeString"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeString, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeString)},
+  {__Pyx_NAMESTR("writeReference"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeReference, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeReference)},
+  {__Pyx_NAMESTR("writeMixedArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeMixedArray, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeMixedArray)},
+  {__Pyx_NAMESTR("writeObject"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeObject, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeObject)},
+  {__Pyx_NAMESTR("writeDictionary"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeDictionary, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeDictionary)},
+  {__Pyx_NAMESTR("writeDate"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeDate, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeDate)},
+  {__Pyx_NAMESTR("writeXML"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeXML, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeXML)},
+  {__Pyx_NAMESTR("writeAMF3"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Encoder_writeAMF3, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Encoder_writeAMF3)},
+  {0, 0, 0, 0}
+};
+
+static struct PyMemberDef __pyx_members_6cpyamf_4amf0_Encoder[] = {
+  {(char *)"use_amf3", T_OBJECT, offsetof(struct __pyx_obj_6cpyamf_4amf0_Encoder, use_amf3), 0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_Encoder = {
+  0, /*nb_add*/
+  0, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION >= 3
+  0, /*reserved*/
+  #else
+  0, /*nb_long*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_Encoder = {
+  0, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_Encoder = {
+  0, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_Encoder = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_getbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_releasebuffer*/
+  #endif
+};
+
+PyTypeObject __pyx_type_6cpyamf_4amf0_Encoder = {
+  PyVarObject_HEAD_INIT(0, 0)
+  __Pyx_NAMESTR("cpyamf.amf0.Encoder"), /*tp_name*/
+  sizeof(struct __pyx_obj_6cpyamf_4amf0_Encoder), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6cpyamf_4amf0_Encoder, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_compare*/
+  0, /*tp_repr*/
+  &__pyx_tp_as_number_Encoder, /*tp_as_number*/
+  &__pyx_tp_as_sequence_Encoder, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_Encoder, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_Encoder, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Encodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Encoder}\n    that writes directly to the underlying\n    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.\n\n    The encoding methods of this class are not looked up by name, so\n    overriding them in a Python subclass will not affect nested elements.\n\n    @ivar use_amf3: A flag to determine whether this encoder knows about AMF3.\n    @type use_amf3: C{bool}\n    "), /*tp_doc*/
+  __pyx_tp_traverse_6cpyamf_4amf0_Encoder, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4amf0_Encoder, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6cpyamf_4amf0_Encoder, /*tp_methods*/
+  __pyx_members_6cpyamf_4amf0_Encoder, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pf_6cpyamf_4amf0_7Encoder___init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6cpyamf_4amf0_Encoder, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*tp_version_tag*/
+  #endif
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf0_Decoder __pyx_vtable_6cpyamf_4amf0_Decoder;
+
+static PyObject *__pyx_tp_new_6cpyamf_4amf0_Decoder(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_6cpyamf_4amf0_Decoder *p;
+  PyObject *o = __pyx_ptype_6cpyamf_5codec_Decoder->tp_new(t, a, k);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_6cpyamf_4amf0_Decoder *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_6cpyamf_5codec_Decoder*)__pyx_vtabptr_6cpyamf_4amf0_Decoder;
+  return o;
+}
+
+static void __pyx_tp_dealloc_6cpyamf_4amf0_Decoder(PyObject *o) {
+  __pyx_ptype_6cpyamf_5codec_Decoder->tp_dealloc(o);
+}
+
+static int __pyx_tp_traverse_6cpyamf_4amf0_Decoder(PyObject *o, visitproc v, void *a) {
+  int e;
+  if (__pyx_ptype_6cpyamf_5codec_Decoder->tp_traverse) {
+    e = __pyx_ptype_6cpyamf_5codec_Decoder->tp_traverse(o, v, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6cpyamf_4amf0_Decoder(PyObject *o) {
+  if (__pyx_ptype_6cpyamf_5codec_Decoder->tp_clear) {
+    __pyx_ptype_6cpyamf_5codec_Decoder->tp_clear(o);
+  }
+  return 0;
+}
+
+static struct PyMethodDef __pyx_methods_6cpyamf_4amf0_Decoder[] = {
+  {__Pyx_NAMESTR("buildContext"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_buildContext, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("readNumber"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readNumber, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readNumber)},
+  {__Pyx_NAMESTR("readBoolean"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readBoolean, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readBoolean)},
+  {__Pyx_NAMESTR("readNull"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readNull, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readNull)},
+  {__Pyx_NAMESTR("readUndefined"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readUndefined, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readUndefined)},
+  {__Pyx_NAMESTR("readMixedArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readMixedArray, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readMixedArray)},
+  {__Pyx_NAMESTR("readList"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readList, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readList)},
+  {__Pyx_NAMESTR("readTypedObject"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readTypedObject, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readTypedObject)},
+  {__Pyx_NAMESTR("readAMF3"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readAMF3, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readAMF3)},
+  {__Pyx_NAMESTR("readString"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readString, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readString)},
+  {__Pyx_NAMESTR("readObject"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readObject, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readObject)},
+  {__Pyx_NAMESTR("readReference"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readReference, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readReference)},
+  {__Pyx_NAMESTR("readDate"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readDate, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readDate)},
+  {__Pyx_NAMESTR("readLongString"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readLongString, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readLongString)},
+  {__Pyx_NAMESTR("readXML"), (PyCFunction)__pyx_pf_6cpyamf_4amf0_7Decoder_readXML, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf0_7Decoder_readXML)},
+  {0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_Decoder = {
+  0, /*nb_add*/
+  0, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION >= 3
+  0, /*reserved*/
+  #else
+  0, /*nb_long*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_Decoder = {
+  0, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_Decoder = {
+  0, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_Decoder = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_getbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_releasebuffer*/
+  #endif
+};
+
+PyTypeObject __pyx_type_6cpyamf_4amf0_Decoder = {
+  PyVarObject_HEAD_INIT(0, 0)
+  __Pyx_NAMESTR("cpyamf.amf0.Decoder"), /*tp_name*/
+  sizeof(struct __pyx_obj_6cpyamf_4amf0_Decoder), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6cpyamf_4amf0_Decoder, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_compare*/
+  0, /*tp_repr*/
+  &__pyx_tp_as_number_Decoder, /*tp_as_number*/
+  &__pyx_tp_as_sequence_Decoder, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_Decoder, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_Decoder, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Decodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Decoder}\n    that reads directly from the underlying\n    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.\n\n    Nested elements are decoded without going through the public C{read*}\n    methods, so overriding them in a Python subclass only affects direct\n    calls.\n    "), /*tp_doc*/
+  __pyx_tp_traverse_6cpyamf_4amf0_Decoder, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4amf0_Decoder, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6cpyamf_4amf0_Decoder, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pf_6cpyamf_4amf0_7Decoder___init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6cpyamf_4amf0_Decoder, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*tp_version_tag*/
+  #endif
+};
+
+static struct PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+static void __pyx_init_filenames(void); /*proto*/
+
+#if PY_MAJOR_VERSION >= 3
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    __Pyx_NAMESTR("amf0"),
+    __Pyx_DOCSTR(__pyx_k_12), /* m_doc */
+    -1, /* m_size */
+    __pyx_methods /* m_methods */,
+    NULL, /* m_reload */
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 1},
+  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
+  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
+  {&__pyx_kp_u_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 1, 0, 0},
+  {&__pyx_kp_u_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 1, 0, 0},
+  {&__pyx_kp_u_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 1, 0, 0},
+  {&__pyx_kp_u_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 1, 0, 0},
+  {&__pyx_kp_u_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 1, 0, 0},
+  {&__pyx_kp_u_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 1, 0, 0},
+  {&__pyx_kp_u_19, __pyx_k_19, sizeof(__pyx_k_19), 0, 1, 0, 0},
+  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
+  {&__pyx_kp_u_20, __pyx_k_20, sizeof(__pyx_k_20), 0, 1, 0, 0},
+  {&__pyx_kp_u_21, __pyx_k_21, sizeof(__pyx_k_21), 0, 1, 0, 0},
+  {&__pyx_kp_u_22, __pyx_k_22, sizeof(__pyx_k_22), 0, 1, 0, 0},
+  {&__pyx_kp_u_23, __pyx_k_23, sizeof(__pyx_k_23), 0, 1, 0, 0},
+  {&__pyx_kp_u_24, __pyx_k_24, sizeof(__pyx_k_24), 0, 1, 0, 0},
+  {&__pyx_kp_u_25, __pyx_k_25, sizeof(__pyx_k_25), 0, 1, 0, 0},
+  {&__pyx_kp_u_26, __pyx_k_26, sizeof(__pyx_k_26), 0, 1, 0, 0},
+  {&__pyx_kp_u_27, __pyx_k_27, sizeof(__pyx_k_27), 0, 1, 0, 0},
+  {&__pyx_kp_u_28, __pyx_k_28, sizeof(__pyx_k_28), 0, 1, 0, 0},
+  {&__pyx_kp_u_29, __pyx_k_29, sizeof(__pyx_k_29), 0, 1, 0, 0},
+  {&__pyx_n_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 1},
+  {&__pyx_kp_u_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 1, 0, 0},
+  {&__pyx_kp_u_31, __pyx_k_31, sizeof(__pyx_k_31), 0, 1, 0, 0},
+  {&__pyx_kp_u_32, __pyx_k_32, sizeof(__pyx_k_32), 0, 1, 0, 0},
+  {&__pyx_kp_u_33, __pyx_k_33, sizeof(__pyx_k_33), 0, 1, 0, 0},
+  {&__pyx_kp_u_34, __pyx_k_34, sizeof(__pyx_k_34), 0, 1, 0, 0},
+  {&__pyx_kp_u_35, __pyx_k_35, sizeof(__pyx_k_35), 0, 1, 0, 0},
+  {&__pyx_kp_u_36, __pyx_k_36, sizeof(__pyx_k_36), 0, 1, 0, 0},
+  {&__pyx_kp_u_37, __pyx_k_37, sizeof(__pyx_k_37), 0, 1, 0, 0},
+  {&__pyx_kp_u_38, __pyx_k_38, sizeof(__pyx_k_38), 0, 1, 0, 0},
+  {&__pyx_kp_u_39, __pyx_k_39, sizeof(__pyx_k_39), 0, 1, 0, 0},
+  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
+  {&__pyx_kp_u_40, __pyx_k_40, sizeof(__pyx_k_40), 0, 1, 0, 0},
+  {&__pyx_kp_u_41, __pyx_k_41, sizeof(__pyx_k_41), 0, 1, 0, 0},
+  {&__pyx_kp_u_42, __pyx_k_42, sizeof(__pyx_k_42), 0, 1, 0, 0},
+  {&__pyx_kp_u_43, __pyx_k_43, sizeof(__pyx_k_43), 0, 1, 0, 0},
+  {&__pyx_kp_u_44, __pyx_k_44, sizeof(__pyx_k_44), 0, 1, 0, 0},
+  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
+  {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
+  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
+  {&__pyx_kp_u_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 1, 0, 0},
+  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
+  {&__pyx_n_s__AMF3, __pyx_k__AMF3, sizeof(__pyx_k__AMF3), 0, 0, 1, 1},
+  {&__pyx_n_s__ASObject, __pyx_k__ASObject, sizeof(__pyx_k__ASObject), 0, 0, 1, 1},
+  {&__pyx_n_s__ArrayType, __pyx_k__ArrayType, sizeof(__pyx_k__ArrayType), 0, 0, 1, 1},
+  {&__pyx_n_s__BuiltinFunctionType, __pyx_k__BuiltinFunctionType, sizeof(__pyx_k__BuiltinFunctionType), 0, 0, 1, 1},
+  {&__pyx_n_s__BuiltinMethodType, __pyx_k__BuiltinMethodType, sizeof(__pyx_k__BuiltinMethodType), 0, 0, 1, 1},
+  {&__pyx_n_s__ClassType, __pyx_k__ClassType, sizeof(__pyx_k__ClassType), 0, 0, 1, 1},
+  {&__pyx_n_s__Context, __pyx_k__Context, sizeof(__pyx_k__Context), 0, 0, 1, 1},
+  {&__pyx_n_s__DecodeError, __pyx_k__DecodeError, sizeof(__pyx_k__DecodeError), 0, 0, 1, 1},
+  {&__pyx_n_s__Decoder, __pyx_k__Decoder, sizeof(__pyx_k__Decoder), 0, 0, 1, 1},
+  {&__pyx_n_s__Dictionary, __pyx_k__Dictionary, sizeof(__pyx_k__Dictionary), 0, 0, 1, 1},
+  {&__pyx_n_s__ET, __pyx_k__ET, sizeof(__pyx_k__ET), 0, 0, 1, 1},
+  {&__pyx_n_s__EncodeError, __pyx_k__EncodeError, sizeof(__pyx_k__EncodeError), 0, 0, 1, 1},
+  {&__pyx_n_s__Encoder, __pyx_k__Encoder, sizeof(__pyx_k__Encoder), 0, 0, 1, 1},
+  {&__pyx_n_s__FunctionType, __pyx_k__FunctionType, sizeof(__pyx_k__FunctionType), 0, 0, 1, 1},
+  {&__pyx_n_s__GeneratorType, __pyx_k__GeneratorType, sizeof(__pyx_k__GeneratorType), 0, 0, 1, 1},
+  {&__pyx_n_s__IOError, __pyx_k__IOError, sizeof(__pyx_k__IOError), 0, 0, 1, 1},
+  {&__pyx_n_s__InstanceType, __pyx_k__InstanceType, sizeof(__pyx_k__InstanceType), 0, 0, 1, 1},
+  {&__pyx_n_s__LambdaType, __pyx_k__LambdaType, sizeof(__pyx_k__LambdaType), 0, 0, 1, 1},
+  {&__pyx_n_s__MethodType, __pyx_k__MethodType, sizeof(__pyx_k__MethodType), 0, 0, 1, 1},
+  {&__pyx_n_s__MixedArray, __pyx_k__MixedArray, sizeof(__pyx_k__MixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s__ModuleType, __pyx_k__ModuleType, sizeof(__pyx_k__ModuleType), 0, 0, 1, 1},
+  {&__pyx_n_s__ObjectType, __pyx_k__ObjectType, sizeof(__pyx_k__ObjectType), 0, 0, 1, 1},
+  {&__pyx_n_s__RawAMF, __pyx_k__RawAMF, sizeof(__pyx_k__RawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__ReferenceError, __pyx_k__ReferenceError, sizeof(__pyx_k__ReferenceError), 0, 0, 1, 1},
+  {&__pyx_n_s__StringTypes, __pyx_k__StringTypes, sizeof(__pyx_k__StringTypes), 0, 0, 1, 1},
+  {&__pyx_n_s__TypeType, __pyx_k__TypeType, sizeof(__pyx_k__TypeType), 0, 0, 1, 1},
+  {&__pyx_n_s__TypedObject, __pyx_k__TypedObject, sizeof(__pyx_k__TypedObject), 0, 0, 1, 1},
+  {&__pyx_n_s__Undefined, __pyx_k__Undefined, sizeof(__pyx_k__Undefined), 0, 0, 1, 1},
+  {&__pyx_n_s__UnknownClassAlias, __pyx_k__UnknownClassAlias, sizeof(__pyx_k__UnknownClassAlias), 0, 0, 1, 1},
+  {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s____class__, __pyx_k____class__, sizeof(__pyx_k____class__), 0, 0, 1, 1},
+  {&__pyx_n_s____init__, __pyx_k____init__, sizeof(__pyx_k____init__), 0, 0, 1, 1},
+  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
+  {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
+  {&__pyx_n_s___check_for_int, __pyx_k___check_for_int, sizeof(__pyx_k___check_for_int), 0, 0, 1, 1},
+  {&__pyx_n_s___readAMF3, __pyx_k___readAMF3, sizeof(__pyx_k___readAMF3), 0, 0, 1, 1},
+  {&__pyx_n_s___readASObject, __pyx_k___readASObject, sizeof(__pyx_k___readASObject), 0, 0, 1, 1},
+  {&__pyx_n_s___readBoolean, __pyx_k___readBoolean, sizeof(__pyx_k___readBoolean), 0, 0, 1, 1},
+  {&__pyx_n_s___readDate, __pyx_k___readDate, sizeof(__pyx_k___readDate), 0, 0, 1, 1},
+  {&__pyx_n_s___readElement, __pyx_k___readElement, sizeof(__pyx_k___readElement), 0, 0, 1, 1},
+  {&__pyx_n_s___readList, __pyx_k___readList, sizeof(__pyx_k___readList), 0, 0, 1, 1},
+  {&__pyx_n_s___readLongString, __pyx_k___readLongString, sizeof(__pyx_k___readLongString), 0, 0, 1, 1},
+  {&__pyx_n_s___readMixedArray, __pyx_k___readMixedArray, sizeof(__pyx_k___readMixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s___readNumber, __pyx_k___readNumber, sizeof(__pyx_k___readNumber), 0, 0, 1, 1},
+  {&__pyx_n_s___readObject, __pyx_k___readObject, sizeof(__pyx_k___readObject), 0, 0, 1, 1},
+  {&__pyx_n_s___readReference, __pyx_k___readReference, sizeof(__pyx_k___readReference), 0, 0, 1, 1},
+  {&__pyx_n_s___readString, __pyx_k___readString, sizeof(__pyx_k___readString), 0, 0, 1, 1},
+  {&__pyx_n_s___readTypedObject, __pyx_k___readTypedObject, sizeof(__pyx_k___readTypedObject), 0, 0, 1, 1},
+  {&__pyx_n_s___readXML, __pyx_k___readXML, sizeof(__pyx_k___readXML), 0, 0, 1, 1},
+  {&__pyx_n_s___writeAMF3, __pyx_k___writeAMF3, sizeof(__pyx_k___writeAMF3), 0, 0, 1, 1},
+  {&__pyx_n_s___writeArray, __pyx_k___writeArray, sizeof(__pyx_k___writeArray), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDate, __pyx_k___writeDate, sizeof(__pyx_k___writeDate), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDict, __pyx_k___writeDict, sizeof(__pyx_k___writeDict), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDictionary, __pyx_k___writeDictionary, sizeof(__pyx_k___writeDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s___writeElement, __pyx_k___writeElement, sizeof(__pyx_k___writeElement), 0, 0, 1, 1},
+  {&__pyx_n_s___writeEndObject, __pyx_k___writeEndObject, sizeof(__pyx_k___writeEndObject), 0, 0, 1, 1},
+  {&__pyx_n_s___writeMixedArray, __pyx_k___writeMixedArray, sizeof(__pyx_k___writeMixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s___writeObject, __pyx_k___writeObject, sizeof(__pyx_k___writeObject), 0, 0, 1, 1},
+  {&__pyx_n_s___writeReference, __pyx_k___writeReference, sizeof(__pyx_k___writeReference), 0, 0, 1, 1},
+  {&__pyx_n_s___writeString, __pyx_k___writeString, sizeof(__pyx_k___writeString), 0, 0, 1, 1},
+  {&__pyx_n_s___writeXML, __pyx_k___writeXML, sizeof(__pyx_k___writeXML), 0, 0, 1, 1},
+  {&__pyx_n_s__addAMF3Object, __pyx_k__addAMF3Object, sizeof(__pyx_k__addAMF3Object), 0, 0, 1, 1},
+  {&__pyx_n_s__addObject, __pyx_k__addObject, sizeof(__pyx_k__addObject), 0, 0, 1, 1},
+  {&__pyx_n_s__addRawAMF, __pyx_k__addRawAMF, sizeof(__pyx_k__addRawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__alias, __pyx_k__alias, sizeof(__pyx_k__alias), 0, 0, 1, 1},
+  {&__pyx_n_s__amf0, __pyx_k__amf0, sizeof(__pyx_k__amf0), 0, 0, 1, 1},
+  {&__pyx_n_s__amf3, __pyx_k__amf3, sizeof(__pyx_k__amf3), 0, 0, 1, 1},
+  {&__pyx_n_s__amf3_context, __pyx_k__amf3_context, sizeof(__pyx_k__amf3_context), 0, 0, 1, 1},
+  {&__pyx_n_s__amf3_decoder, __pyx_k__amf3_decoder, sizeof(__pyx_k__amf3_decoder), 0, 0, 1, 1},
+  {&__pyx_n_s__amf3_encoder, __pyx_k__amf3_encoder, sizeof(__pyx_k__amf3_encoder), 0, 0, 1, 1},
+  {&__pyx_n_s__anonymous, __pyx_k__anonymous, sizeof(__pyx_k__anonymous), 0, 0, 1, 1},
+  {&__pyx_n_s__append, __pyx_k__append, sizeof(__pyx_k__append), 0, 0, 1, 1},
+  {&__pyx_n_s__applyAttributes, __pyx_k__applyAttributes, sizeof(__pyx_k__applyAttributes), 0, 0, 1, 1},
+  {&__pyx_n_s__array, __pyx_k__array, sizeof(__pyx_k__array), 0, 0, 1, 1},
+  {&__pyx_n_s__basestring, __pyx_k__basestring, sizeof(__pyx_k__basestring), 0, 0, 1, 1},
+  {&__pyx_n_s__buffer, __pyx_k__buffer, sizeof(__pyx_k__buffer), 0, 0, 1, 1},
+  {&__pyx_n_s__chr, __pyx_k__chr, sizeof(__pyx_k__chr), 0, 0, 1, 1},
+  {&__pyx_n_s__codec, __pyx_k__codec, sizeof(__pyx_k__codec), 0, 0, 1, 1},
+  {&__pyx_n_s__compile, __pyx_k__compile, sizeof(__pyx_k__compile), 0, 0, 1, 1},
+  {&__pyx_n_s__context, __pyx_k__context, sizeof(__pyx_k__context), 0, 0, 1, 1},
+  {&__pyx_n_s__createInstance, __pyx_k__createInstance, sizeof(__pyx_k__createInstance), 0, 0, 1, 1},
+  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
+  {&__pyx_n_s__date, __pyx_k__date, sizeof(__pyx_k__date), 0, 0, 1, 1},
+  {&__pyx_n_s__datetime, __pyx_k__datetime, sizeof(__pyx_k__datetime), 0, 0, 1, 1},
+  {&__pyx_n_s__encode, __pyx_k__encode, sizeof(__pyx_k__encode), 0, 0, 1, 1},
+  {&__pyx_n_s__encode_attrs, __pyx_k__encode_attrs, sizeof(__pyx_k__encode_attrs), 0, 0, 1, 1},
+  {&__pyx_n_s__encoding, __pyx_k__encoding, sizeof(__pyx_k__encoding), 0, 0, 1, 1},
+  {&__pyx_n_s__external, __pyx_k__external, sizeof(__pyx_k__external), 0, 0, 1, 1},
+  {&__pyx_n_s__fromstring, __pyx_k__fromstring, sizeof(__pyx_k__fromstring), 0, 0, 1, 1},
+  {&__pyx_n_s__getByReference, __pyx_k__getByReference, sizeof(__pyx_k__getByReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getClassAlias, __pyx_k__getClassAlias, sizeof(__pyx_k__getClassAlias), 0, 0, 1, 1},
+  {&__pyx_n_s__getEncodableValues, __pyx_k__getEncodableValues, sizeof(__pyx_k__getEncodableValues), 0, 0, 1, 1},
+  {&__pyx_n_s__getObject, __pyx_k__getObject, sizeof(__pyx_k__getObject), 0, 0, 1, 1},
+  {&__pyx_n_s__getObjectReference, __pyx_k__getObjectReference, sizeof(__pyx_k__getObjectReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getReferenceTo, __pyx_k__getReferenceTo, sizeof(__pyx_k__getReferenceTo), 0, 0, 1, 1},
+  {&__pyx_n_s__getTypeFunc, __pyx_k__getTypeFunc, sizeof(__pyx_k__getTypeFunc), 0, 0, 1, 1},
+  {&__pyx_n_s__get_class_alias, __pyx_k__get_class_alias, sizeof(__pyx_k__get_class_alias), 0, 0, 1, 1},
+  {&__pyx_n_s__get_context, __pyx_k__get_context, sizeof(__pyx_k__get_context), 0, 0, 1, 1},
+  {&__pyx_n_s__get_datetime, __pyx_k__get_datetime, sizeof(__pyx_k__get_datetime), 0, 0, 1, 1},
+  {&__pyx_n_s__get_decoder, __pyx_k__get_decoder, sizeof(__pyx_k__get_decoder), 0, 0, 1, 1},
+  {&__pyx_n_s__get_encoder, __pyx_k__get_encoder, sizeof(__pyx_k__get_encoder), 0, 0, 1, 1},
+  {&__pyx_n_s__get_timestamp, __pyx_k__get_timestamp, sizeof(__pyx_k__get_timestamp), 0, 0, 1, 1},
+  {&__pyx_n_s__is_ET_element, __pyx_k__is_ET_element, sizeof(__pyx_k__is_ET_element), 0, 0, 1, 1},
+  {&__pyx_n_s__is_float_broken, __pyx_k__is_float_broken, sizeof(__pyx_k__is_float_broken), 0, 0, 1, 1},
+  {&__pyx_n_s__iteritems, __pyx_k__iteritems, sizeof(__pyx_k__iteritems), 0, 0, 1, 1},
+  {&__pyx_n_s__keys, __pyx_k__keys, sizeof(__pyx_k__keys), 0, 0, 1, 1},
+  {&__pyx_n_s__length, __pyx_k__length, sizeof(__pyx_k__length), 0, 0, 1, 1},
+  {&__pyx_n_s__objects, __pyx_k__objects, sizeof(__pyx_k__objects), 0, 0, 1, 1},
+  {&__pyx_n_s__ord, __pyx_k__ord, sizeof(__pyx_k__ord), 0, 0, 1, 1},
+  {&__pyx_n_s__pop, __pyx_k__pop, sizeof(__pyx_k__pop), 0, 0, 1, 1},
+  {&__pyx_n_s__pos, __pyx_k__pos, sizeof(__pyx_k__pos), 0, 0, 1, 1},
+  {&__pyx_n_s__pyamf, __pyx_k__pyamf, sizeof(__pyx_k__pyamf), 0, 0, 1, 1},
+  {&__pyx_n_s__readAMF3, __pyx_k__readAMF3, sizeof(__pyx_k__readAMF3), 0, 0, 1, 1},
+  {&__pyx_n_s__readBoolean, __pyx_k__readBoolean, sizeof(__pyx_k__readBoolean), 0, 0, 1, 1},
+  {&__pyx_n_s__readDate, __pyx_k__readDate, sizeof(__pyx_k__readDate), 0, 0, 1, 1},
+  {&__pyx_n_s__readElement, __pyx_k__readElement, sizeof(__pyx_k__readElement), 0, 0, 1, 1},
+  {&__pyx_n_s__readList, __pyx_k__readList, sizeof(__pyx_k__readList), 0, 0, 1, 1},
+  {&__pyx_n_s__readLongString, __pyx_k__readLongString, sizeof(__pyx_k__readLongString), 0, 0, 1, 1},
+  {&__pyx_n_s__readMixedArray, __pyx_k__readMixedArray, sizeof(__pyx_k__readMixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s__readNull, __pyx_k__readNull, sizeof(__pyx_k__readNull), 0, 0, 1, 1},
+  {&__pyx_n_s__readNumber, __pyx_k__readNumber, sizeof(__pyx_k__readNumber), 0, 0, 1, 1},
+  {&__pyx_n_s__readObject, __pyx_k__readObject, sizeof(__pyx_k__readObject), 0, 0, 1, 1},
+  {&__pyx_n_s__readReference, __pyx_k__readReference, sizeof(__pyx_k__readReference), 0, 0, 1, 1},
+  {&__pyx_n_s__readString, __pyx_k__readString, sizeof(__pyx_k__readString), 0, 0, 1, 1},
+  {&__pyx_n_s__readTypedObject, __pyx_k__readTypedObject, sizeof(__pyx_k__readTypedObject), 0, 0, 1, 1},
+  {&__pyx_n_s__readUndefined, __pyx_k__readUndefined, sizeof(__pyx_k__readUndefined), 0, 0, 1, 1},
+  {&__pyx_n_s__readXML, __pyx_k__readXML, sizeof(__pyx_k__readXML), 0, 0, 1, 1},
+  {&__pyx_n_s__read_double, __pyx_k__read_double, sizeof(__pyx_k__read_double), 0, 0, 1, 1},
+  {&__pyx_n_s__read_short, __pyx_k__read_short, sizeof(__pyx_k__read_short), 0, 0, 1, 1},
+  {&__pyx_n_s__read_uchar, __pyx_k__read_uchar, sizeof(__pyx_k__read_uchar), 0, 0, 1, 1},
+  {&__pyx_n_s__read_ulong, __pyx_k__read_ulong, sizeof(__pyx_k__read_ulong), 0, 0, 1, 1},
+  {&__pyx_n_s__read_ushort, __pyx_k__read_ushort, sizeof(__pyx_k__read_ushort), 0, 0, 1, 1},
+  {&__pyx_n_s__s, __pyx_k__s, sizeof(__pyx_k__s), 0, 0, 1, 1},
+  {&__pyx_n_s__set_attrs, __pyx_k__set_attrs, sizeof(__pyx_k__set_attrs), 0, 0, 1, 1},
+  {&__pyx_n_s__static_attrs, __pyx_k__static_attrs, sizeof(__pyx_k__static_attrs), 0, 0, 1, 1},
+  {&__pyx_n_s__stream, __pyx_k__stream, sizeof(__pyx_k__stream), 0, 0, 1, 1},
+  {&__pyx_n_s__strict, __pyx_k__strict, sizeof(__pyx_k__strict), 0, 0, 1, 1},
+  {&__pyx_n_s__time, __pyx_k__time, sizeof(__pyx_k__time), 0, 0, 1, 1},
+  {&__pyx_n_s__timezone_offset, __pyx_k__timezone_offset, sizeof(__pyx_k__timezone_offset), 0, 0, 1, 1},
+  {&__pyx_n_s__tostring, __pyx_k__tostring, sizeof(__pyx_k__tostring), 0, 0, 1, 1},
+  {&__pyx_n_s__types, __pyx_k__types, sizeof(__pyx_k__types), 0, 0, 1, 1},
+  {&__pyx_n_s__use_amf3, __pyx_k__use_amf3, sizeof(__pyx_k__use_amf3), 0, 0, 1, 1},
+  {&__pyx_n_s__utf8, __pyx_k__utf8, sizeof(__pyx_k__utf8), 0, 0, 1, 1},
+  {&__pyx_n_s__util, __pyx_k__util, sizeof(__pyx_k__util), 0, 0, 1, 1},
+  {&__pyx_n_s__write, __pyx_k__write, sizeof(__pyx_k__write), 0, 0, 1, 1},
+  {&__pyx_n_s__writeAMF3, __pyx_k__writeAMF3, sizeof(__pyx_k__writeAMF3), 0, 0, 1, 1},
+  {&__pyx_n_s__writeArray, __pyx_k__writeArray, sizeof(__pyx_k__writeArray), 0, 0, 1, 1},
+  {&__pyx_n_s__writeBoolean, __pyx_k__writeBoolean, sizeof(__pyx_k__writeBoolean), 0, 0, 1, 1},
+  {&__pyx_n_s__writeClass, __pyx_k__writeClass, sizeof(__pyx_k__writeClass), 0, 0, 1, 1},
+  {&__pyx_n_s__writeDate, __pyx_k__writeDate, sizeof(__pyx_k__writeDate), 0, 0, 1, 1},
+  {&__pyx_n_s__writeDictionary, __pyx_k__writeDictionary, sizeof(__pyx_k__writeDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s__writeElement, __pyx_k__writeElement, sizeof(__pyx_k__writeElement), 0, 0, 1, 1},
+  {&__pyx_n_s__writeFunc, __pyx_k__writeFunc, sizeof(__pyx_k__writeFunc), 0, 0, 1, 1},
+  {&__pyx_n_s__writeMixedArray, __pyx_k__writeMixedArray, sizeof(__pyx_k__writeMixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s__writeNull, __pyx_k__writeNull, sizeof(__pyx_k__writeNull), 0, 0, 1, 1},
+  {&__pyx_n_s__writeNumber, __pyx_k__writeNumber, sizeof(__pyx_k__writeNumber), 0, 0, 1, 1},
+  {&__pyx_n_s__writeObject, __pyx_k__writeObject, sizeof(__pyx_k__writeObject), 0, 0, 1, 1},
+  {&__pyx_n_s__writeRawAMF, __pyx_k__writeRawAMF, sizeof(__pyx_k__writeRawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__writeReference, __pyx_k__writeReference, sizeof(__pyx_k__writeReference), 0, 0, 1, 1},
+  {&__pyx_n_s__writeString, __pyx_k__writeString, sizeof(__pyx_k__writeString), 0, 0, 1, 1},
+  {&__pyx_n_s__writeType, __pyx_k__writeType, sizeof(__pyx_k__writeType), 0, 0, 1, 1},
+  {&__pyx_n_s__writeUndefined, __pyx_k__writeUndefined, sizeof(__pyx_k__writeUndefined), 0, 0, 1, 1},
+  {&__pyx_n_s__writeUnsupported, __pyx_k__writeUnsupported, sizeof(__pyx_k__writeUnsupported), 0, 0, 1, 1},
+  {&__pyx_n_s__writeXML, __pyx_k__writeXML, sizeof(__pyx_k__writeXML), 0, 0, 1, 1},
+  {&__pyx_n_s__write_double, __pyx_k__write_double, sizeof(__pyx_k__write_double), 0, 0, 1, 1},
+  {&__pyx_n_s__write_short, __pyx_k__write_short, sizeof(__pyx_k__write_short), 0, 0, 1, 1},
+  {&__pyx_n_s__write_uchar, __pyx_k__write_uchar, sizeof(__pyx_k__write_uchar), 0, 0, 1, 1},
+  {&__pyx_n_s__write_ulong, __pyx_k__write_ulong, sizeof(__pyx_k__write_ulong), 0, 0, 1, 1},
+  {&__pyx_n_s__write_ushort, __pyx_k__write_ushort, sizeof(__pyx_k__write_ushort), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_basestring = __Pyx_GetName(__pyx_b, __pyx_n_s__basestring); if (!__pyx_builtin_basestring) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 389; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ord = __Pyx_GetName(__pyx_b, __pyx_n_s__ord); if (!__pyx_builtin_ord) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_IOError = __Pyx_GetName(__pyx_b, __pyx_n_s__IOError); if (!__pyx_builtin_IOError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_chr = __Pyx_GetName(__pyx_b, __pyx_n_s__chr); if (!__pyx_builtin_chr) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 725; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_11 = PyInt_FromLong(11); if (unlikely(!__pyx_int_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_12 = PyInt_FromLong(12); if (unlikely(!__pyx_int_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_13 = PyInt_FromLong(13); if (unlikely(!__pyx_int_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+#if PY_MAJOR_VERSION < 3
+PyMODINIT_FUNC initamf0(void); /*proto*/
+PyMODINIT_FUNC initamf0(void)
+#else
+PyMODINIT_FUNC PyInit_amf0(void); /*proto*/
+PyMODINIT_FUNC PyInit_amf0(void)
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  #if CYTHON_REFNANNY
+  void* __pyx_refnanny = NULL;
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+      if (!__Pyx_RefNanny)
+          Py_FatalError("failed to import 'refnanny' module");
+  }
+  __pyx_refnanny = __Pyx_RefNanny->SetupContext("PyMODINIT_FUNC PyInit_amf0(void)", __LINE__, __FILE__);
+  #endif
+  __pyx_init_filenames();
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #if PY_MAJOR_VERSION < 3
+  __pyx_empty_bytes = PyString_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #else
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  #ifdef WITH_THREAD /* Python build with threading support? */
+  PyEval_InitThreads();
+  #endif
+  #endif
+  /*--- Module creation code ---*/
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("amf0"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_12), 0, PYTHON_API_VERSION);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  #if PY_MAJOR_VERSION < 3
+  Py_INCREF(__pyx_m);
+  #endif
+  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
+  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  /*--- Initialize various global constants etc. ---*/
+  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_module_is_main_cpyamf__amf0) {
+    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  }
+  /*--- Builtin init code ---*/
+  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*--- Global init code ---*/
+  __pyx_v_6cpyamf_4amf0_amf0 = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_Context = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_Dictionary = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_FUNC_TYPES = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_DATE_TYPES = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_CLASS_TYPES = Py_None; Py_INCREF(Py_None);
+  /*--- Function export code ---*/
+  /*--- Type init code ---*/
+  __pyx_ptype_6cpyamf_5codec_Encoder = __Pyx_ImportType("cpyamf.codec", "Encoder", sizeof(struct __pyx_obj_6cpyamf_5codec_Encoder), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Encoder)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_5codec_Encoder->tp_dict, &__pyx_vtabptr_6cpyamf_5codec_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtabptr_6cpyamf_4amf0_Encoder = &__pyx_vtable_6cpyamf_4amf0_Encoder;
+  __pyx_vtable_6cpyamf_4amf0_Encoder.__pyx_base = *__pyx_vtabptr_6cpyamf_5codec_Encoder;
+  #if PY_MAJOR_VERSION >= 3
+  __pyx_vtable_6cpyamf_4amf0_Encoder.__pyx_base.resolveType = (PyObject *(*)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder_resolveType;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeElement = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeElement;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeString = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *, int))__pyx_f_6cpyamf_4amf0_7Encoder__writeString;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeReference = (Py_ssize_t (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeReference;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeArray = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeArray;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeDict = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeDict;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeEndObject = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *))__pyx_f_6cpyamf_4amf0_7Encoder__writeEndObject;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeMixedArray = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeMixedArray;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeDictionary = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeDictionary;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeObject = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeObject;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeDate = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeDate;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeXML = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeXML;
+  __pyx_vtable_6cpyamf_4amf0_Encoder._writeAMF3 = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf0_7Encoder__writeAMF3;
+  #else
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder.__pyx_base.resolveType = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder_resolveType;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeElement = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeElement;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeString = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeString;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeReference = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeReference;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeArray = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeDict = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeDict;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeEndObject = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeEndObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeMixedArray = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeMixedArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeDictionary = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeDictionary;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeObject = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeDate = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeDate;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeXML = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeXML;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Encoder._writeAMF3 = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Encoder__writeAMF3;
+  #endif
+  __pyx_type_6cpyamf_4amf0_Encoder.tp_base = __pyx_ptype_6cpyamf_5codec_Encoder;
+  if (PyType_Ready(&__pyx_type_6cpyamf_4amf0_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4amf0_Encoder.tp_dict, __pyx_vtabptr_6cpyamf_4amf0_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "Encoder", (PyObject *)&__pyx_type_6cpyamf_4amf0_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4amf0_Encoder = &__pyx_type_6cpyamf_4amf0_Encoder;
+  __pyx_ptype_6cpyamf_5codec_Decoder = __Pyx_ImportType("cpyamf.codec", "Decoder", sizeof(struct __pyx_obj_6cpyamf_5codec_Decoder), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Decoder)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_5codec_Decoder->tp_dict, &__pyx_vtabptr_6cpyamf_5codec_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtabptr_6cpyamf_4amf0_Decoder = &__pyx_vtable_6cpyamf_4amf0_Decoder;
+  __pyx_vtable_6cpyamf_4amf0_Decoder.__pyx_base = *__pyx_vtabptr_6cpyamf_5codec_Decoder;
+  #if PY_MAJOR_VERSION >= 3
+  __pyx_vtable_6cpyamf_4amf0_Decoder.__pyx_base.readType = (PyObject *(*)(struct __pyx_obj_6cpyamf_5codec_Decoder *, unsigned char))__pyx_f_6cpyamf_4amf0_7Decoder_readType;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readNumber = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readNumber;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readBoolean = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readBoolean;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readString = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readString;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readLongString = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readLongString;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readObject = (int (*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf0_7Decoder__readObject;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readASObject = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readASObject;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readReference = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readReference;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readList = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readList;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readMixedArray = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readMixedArray;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readDate = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readDate;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readXML = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readXML;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readTypedObject = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readTypedObject;
+  __pyx_vtable_6cpyamf_4amf0_Decoder._readAMF3 = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf0_Decoder *))__pyx_f_6cpyamf_4amf0_7Decoder__readAMF3;
+  #else
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder.__pyx_base.readType = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder_readType;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readNumber = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readNumber;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readBoolean = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readBoolean;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readString = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readString;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readLongString = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readLongString;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readObject = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readASObject = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readASObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readReference = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readReference;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readList = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readList;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readMixedArray = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readMixedArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readDate = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readDate;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readXML = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readXML;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readTypedObject = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readTypedObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf0_Decoder._readAMF3 = (void(*)(void))__pyx_f_6cpyamf_4amf0_7Decoder__readAMF3;
+  #endif
+  __pyx_type_6cpyamf_4amf0_Decoder.tp_base = __pyx_ptype_6cpyamf_5codec_Decoder;
+  if (PyType_Ready(&__pyx_type_6cpyamf_4amf0_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4amf0_Decoder.tp_dict, __pyx_vtabptr_6cpyamf_4amf0_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "Decoder", (PyObject *)&__pyx_type_6cpyamf_4amf0_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4amf0_Decoder = &__pyx_type_6cpyamf_4amf0_Decoder;
+  /*--- Type import code ---*/
+  __pyx_ptype_6cpyamf_4util_cBufferedByteStream = __Pyx_ImportType("cpyamf.util", "cBufferedByteStream", sizeof(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream), 1); if (unlikely(!__pyx_ptype_6cpyamf_4util_cBufferedByteStream)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cBufferedByteStream->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4util_cIndexedCollection = __Pyx_ImportType("cpyamf.util", "cIndexedCollection", sizeof(struct __pyx_obj_6cpyamf_4util_cIndexedCollection), 1); if (unlikely(!__pyx_ptype_6cpyamf_4util_cIndexedCollection)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cIndexedCollection->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_5codec_Codec = __Pyx_ImportType("cpyamf.codec", "Codec", sizeof(struct __pyx_obj_6cpyamf_5codec_Codec), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Codec)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*--- Function import code ---*/
+  /*--- Execution code ---*/
+
+  /* "/root/package/cpyamf/amf0.pyx":38
+ * from cpyamf cimport codec
+ * 
+ * import types             # <<<<<<<<<<<<<<
+ * import datetime
+ * import array
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__types), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__types, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":39
+ * 
+ * import types
+ * import datetime             # <<<<<<<<<<<<<<
+ * import array
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__datetime), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__datetime, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":40
+ * import types
+ * import datetime
+ * import array             # <<<<<<<<<<<<<<
+ * 
+ * import pyamf
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__array), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__array, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":42
+ * import array
+ * 
+ * import pyamf             # <<<<<<<<<<<<<<
+ * from pyamf import util
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__pyamf, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":43
+ * 
+ * import pyamf
+ * from pyamf import util             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__util));
+  PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__util));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__util));
+  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__util, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":87
+ * 
+ * #: The L{pyamf.amf0} module, resolved lazily to match L{cpyamf.amf3}.
+ * cdef object amf0 = None             # <<<<<<<<<<<<<<
+ * cdef object Context = None
+ * cdef object Dictionary = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_amf0);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_amf0);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_amf0 = Py_None;
+
+  /* "/root/package/cpyamf/amf0.pyx":88
+ * #: The L{pyamf.amf0} module, resolved lazily to match L{cpyamf.amf3}.
+ * cdef object amf0 = None
+ * cdef object Context = None             # <<<<<<<<<<<<<<
+ * cdef object Dictionary = None
+ * cdef bint float_broken = 0
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_Context);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_Context);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_Context = Py_None;
+
+  /* "/root/package/cpyamf/amf0.pyx":89
+ * cdef object amf0 = None
+ * cdef object Context = None
+ * cdef object Dictionary = None             # <<<<<<<<<<<<<<
+ * cdef bint float_broken = 0
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_Dictionary);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_Dictionary);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf0_Dictionary = Py_None;
+
+  /* "/root/package/cpyamf/amf0.pyx":90
+ * cdef object Context = None
+ * cdef object Dictionary = None
+ * cdef bint float_broken = 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ */
+  __pyx_v_6cpyamf_4amf0_float_broken = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":92
+ * cdef bint float_broken = 0
+ * 
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,             # <<<<<<<<<<<<<<
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__BuiltinFunctionType); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__BuiltinMethodType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":93
+ * 
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,             # <<<<<<<<<<<<<<
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__FunctionType); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__GeneratorType); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__ModuleType); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":94
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)             # <<<<<<<<<<<<<<
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__LambdaType); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__MethodType); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_2, 4, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_2, 5, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_2, 6, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_FUNC_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_FUNC_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf0_FUNC_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":95
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)             # <<<<<<<<<<<<<<
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__date); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__datetime); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__time); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  __pyx_t_8 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_6 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_DATE_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_DATE_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf0_DATE_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":96
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__ClassType); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__TypeType); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf0_CLASS_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf0_CLASS_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf0_CLASS_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":586
+ *             self.stream.write_uchar(0)
+ * 
+ *     def writeString(self, s, writeType=True):             # <<<<<<<<<<<<<<
+ *         """
+ *         Write string to the data stream.
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_k_7 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf0.pyx":1
+ * # Copyright (c) 2007-2009 The PyAMF Project.             # <<<<<<<<<<<<<<
+ * # See LICENSE for details.
+ * 
+ */
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeElement); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_13), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeType); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_14), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeUndefined); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_15), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeFunc); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_16), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeRawAMF); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_17), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeUnsupported); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_18), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeNull); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_19), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_20), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeNumber); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_21), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeBoolean); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_22), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_23), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeReference); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_24), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeMixedArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_25), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeObject); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_26), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeDictionary); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_27), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeDate); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_28), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeXML); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_29), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeAMF3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_30), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readNumber); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_31), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readBoolean); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_32), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readNull); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_33), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readUndefined); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_34), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readMixedArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_35), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readList); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_36), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readTypedObject); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_37), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readAMF3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_38), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_39), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readObject); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_40), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readReference); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_41), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readDate); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_42), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readLongString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_43), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readXML); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_44), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/codec.pxd":8
+ * 
+ * cdef class Codec:
+ *     cdef public cBufferedByteStream stream             # <<<<<<<<<<<<<<
+ *     cdef public object context
+ *     cdef public object strict
+ */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  if (__pyx_m) {
+    __Pyx_AddTraceback("init cpyamf.amf0");
+    Py_DECREF(__pyx_m); __pyx_m = 0;
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init cpyamf.amf0");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if PY_MAJOR_VERSION < 3
+  return;
+  #else
+  return __pyx_m;
+  #endif
+}
+
+static const char *__pyx_filenames[] = {
+  "amf0.pyx",
+  "codec.pxd",
+  "util.pxd",
+};
+
+/* Runtime support code */
+
+static void __pyx_init_filenames(void) {
+  __pyx_f = __pyx_filenames;
+}
+
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
+        #else
+        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
+        #endif
+            goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%s() keywords must be strings", function_name);
+    return 0;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%s() got an unexpected keyword argument '%s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+static PyObject* __Pyx_PyEval_CallObjectWithKeywords(PyObject *callable, PyObject *args, PyObject *kwargs) {
+    PyObject* result;
+    if (likely(PyDict_Check(kwargs))) {
+        return PyEval_CallObjectWithKeywords(callable, args, kwargs);
+    } else {
+        PyObject* real_dict;
+        real_dict = PyObject_CallFunctionObjArgs((PyObject*)&PyDict_Type, kwargs, NULL);
+        if (unlikely(!real_dict))
+            return NULL;
+        result = PyEval_CallObjectWithKeywords(callable, args, real_dict);
+        Py_DECREF(real_dict);
+        return result; /* may be NULL */
+    }
+}
+
+static double __Pyx__PyObject_AsDouble(PyObject* obj) {
+    PyObject* float_value;
+    if (Py_TYPE(obj)->tp_as_number && Py_TYPE(obj)->tp_as_number->nb_float) {
+        return PyFloat_AsDouble(obj);
+    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        float_value = PyFloat_FromString(obj);
+#else
+        float_value = PyFloat_FromString(obj, 0);
+#endif
+    } else {
+        PyObject* args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        PyTuple_SET_ITEM(args, 0, obj);
+        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
+        PyTuple_SET_ITEM(args, 0, 0);
+        Py_DECREF(args);
+    }
+    if (likely(float_value)) {
+        double value = PyFloat_AS_DOUBLE(float_value);
+        Py_DECREF(float_value);
+        return value;
+    }
+bad:
+    return (double)-1;
+}
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+        #if PY_VERSION_HEX < 0x02050000
+                 "need more than %d value%s to unpack", (int)index,
+        #else
+                 "need more than %zd value%s to unpack", index,
+        #endif
+                 (index == 1) ? "" : "s");
+}
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void) {
+    PyErr_SetString(PyExc_ValueError, "too many values to unpack");
+}
+
+static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
+    PyObject *item;
+    if (!(item = PyIter_Next(iter))) {
+        if (!PyErr_Occurred()) {
+            __Pyx_RaiseNeedMoreValuesError(index);
+        }
+    }
+    return item;
+}
+
+static int __Pyx_EndUnpack(PyObject *iter) {
+    PyObject *item;
+    if ((item = PyIter_Next(iter))) {
+        Py_DECREF(item);
+        __Pyx_RaiseTooManyValuesError();
+        return -1;
+    }
+    else if (!PyErr_Occurred())
+        return 0;
+    else
+        return -1;
+}
+
+
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AS_STRING(kw_name));
+        #endif
+}
+
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *number, *more_or_less;
+
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    number = (num_expected == 1) ? "" : "s";
+    PyErr_Format(PyExc_TypeError,
+        #if PY_VERSION_HEX < 0x02050000
+            "%s() takes %s %d positional argument%s (%d given)",
+        #else
+            "%s() takes %s %zd positional argument%s (%zd given)",
+        #endif
+        func_name, more_or_less, num_expected, number, num_found);
+}
+
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+        } else {
+            #if PY_MAJOR_VERSION < 3
+            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
+            #else
+            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
+            #endif
+                goto invalid_keyword_type;
+            } else {
+                for (name = first_kw_arg; *name; name++) {
+                    #if PY_MAJOR_VERSION >= 3
+                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
+                        PyUnicode_Compare(**name, key) == 0) break;
+                    #else
+                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
+                        _PyString_Eq(**name, key)) break;
+                    #endif
+                }
+                if (*name) {
+                    values[name-argnames] = value;
+                } else {
+                    /* unexpected keyword found */
+                    for (name=argnames; name != first_kw_arg; name++) {
+                        if (**name == key) goto arg_passed_twice;
+                        #if PY_MAJOR_VERSION >= 3
+                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
+                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
+                        #else
+                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
+                            _PyString_Eq(**name, key)) goto arg_passed_twice;
+                        #endif
+                    }
+                    if (kwds2) {
+                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+                    } else {
+                        goto invalid_keyword;
+                    }
+                }
+            }
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%s() got an unexpected keyword argument '%s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *local_type, *local_value, *local_tb;
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+    if (unlikely(tstate->curexc_type))
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+        goto bad;
+    #endif
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+    Py_INCREF(local_type);
+    Py_INCREF(local_value);
+    Py_INCREF(local_tb);
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    /* Make sure tstate is in a consistent state when we XDECREF
+       these objects (XDECREF may run arbitrary code). */
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
+    PyObject *__import__ = 0;
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
+    if (!__import__)
+        goto bad;
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    module = PyObject_CallFunctionObjArgs(__import__,
+        name, global_dict, empty_dict, list, NULL);
+bad:
+    Py_XDECREF(empty_list);
+    Py_XDECREF(__import__);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
+    PyObject *result;
+    result = PyObject_GetAttr(dict, name);
+    if (!result)
+        PyErr_SetObject(PyExc_NameError, name);
+    return result;
+}
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+
+
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    Py_XINCREF(type);
+    Py_XINCREF(value);
+    Py_XINCREF(tb);
+    /* First, check the traceback argument, replacing None with NULL. */
+    if (tb == Py_None) {
+        Py_DECREF(tb);
+        tb = 0;
+    }
+    else if (tb != NULL && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto raise_error;
+    }
+    /* Next, replace a missing value with None */
+    if (value == NULL) {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+    #if PY_VERSION_HEX < 0x02050000
+    if (!PyClass_Check(type))
+    #else
+    if (!PyType_Check(type))
+    #endif
+    {
+        /* Raising an instance.  The value should be a dummy. */
+        if (value != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        /* Normalize to raise <class>, <instance> */
+        Py_DECREF(value);
+        value = type;
+        #if PY_VERSION_HEX < 0x02050000
+            if (PyInstance_Check(type)) {
+                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
+                Py_INCREF(type);
+            }
+            else {
+                type = 0;
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception must be an old-style class or instance");
+                goto raise_error;
+            }
+        #else
+            type = (PyObject*) Py_TYPE(type);
+            Py_INCREF(type);
+            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception class must be a subclass of BaseException");
+                goto raise_error;
+            }
+        #endif
+    }
+
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+
+#else /* Python 3+ */
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (!PyExceptionClass_Check(type)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+
+    PyErr_SetObject(type, value);
+
+    if (tb) {
+        PyThreadState *tstate = PyThreadState_GET();
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+    }
+
+bad:
+    return;
+}
+#endif
+
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
+    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned char" :
+                    "value too large to convert to unsigned char");
+            }
+            return (unsigned char)-1;
+        }
+        return (unsigned char)val;
+    }
+    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
+    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned short" :
+                    "value too large to convert to unsigned short");
+            }
+            return (unsigned short)-1;
+        }
+        return (unsigned short)val;
+    }
+    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
+    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned int" :
+                    "value too large to convert to unsigned int");
+            }
+            return (unsigned int)-1;
+        }
+        return (unsigned int)val;
+    }
+    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
+    const char neg_one = (char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to char" :
+                    "value too large to convert to char");
+            }
+            return (char)-1;
+        }
+        return (char)val;
+    }
+    return (char)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
+    const short neg_one = (short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to short" :
+                    "value too large to convert to short");
+            }
+            return (short)-1;
+        }
+        return (short)val;
+    }
+    return (short)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
+    const int neg_one = (int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to int" :
+                    "value too large to convert to int");
+            }
+            return (int)-1;
+        }
+        return (int)val;
+    }
+    return (int)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
+    const signed char neg_one = (signed char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed char" :
+                    "value too large to convert to signed char");
+            }
+            return (signed char)-1;
+        }
+        return (signed char)val;
+    }
+    return (signed char)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
+    const signed short neg_one = (signed short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed short" :
+                    "value too large to convert to signed short");
+            }
+            return (signed short)-1;
+        }
+        return (signed short)val;
+    }
+    return (signed short)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
+    const signed int neg_one = (signed int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed int" :
+                    "value too large to convert to signed int");
+            }
+            return (signed int)-1;
+        }
+        return (signed int)val;
+    }
+    return (signed int)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
+    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to unsigned long");
+            return (unsigned long)-1;
+        }
+        return (unsigned long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to unsigned long");
+                return (unsigned long)-1;
+            }
+            return PyLong_AsUnsignedLong(x);
+        } else {
+            return PyLong_AsLong(x);
+        }
+    } else {
+        unsigned long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (unsigned long)-1;
+        val = __Pyx_PyInt_AsUnsignedLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
+    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to unsigned PY_LONG_LONG");
+            return (unsigned PY_LONG_LONG)-1;
+        }
+        return (unsigned PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to unsigned PY_LONG_LONG");
+                return (unsigned PY_LONG_LONG)-1;
+            }
+            return PyLong_AsUnsignedLongLong(x);
+        } else {
+            return PyLong_AsLongLong(x);
+        }
+    } else {
+        unsigned PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (unsigned PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
+    const long neg_one = (long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to long");
+            return (long)-1;
+        }
+        return (long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to long");
+                return (long)-1;
+            }
+            return PyLong_AsUnsignedLong(x);
+        } else {
+            return PyLong_AsLong(x);
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (long)-1;
+        val = __Pyx_PyInt_AsLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to PY_LONG_LONG");
+            return (PY_LONG_LONG)-1;
+        }
+        return (PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to PY_LONG_LONG");
+                return (PY_LONG_LONG)-1;
+            }
+            return PyLong_AsUnsignedLongLong(x);
+        } else {
+            return PyLong_AsLongLong(x);
+        }
+    } else {
+        PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
+    const signed long neg_one = (signed long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to signed long");
+            return (signed long)-1;
+        }
+        return (signed long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to signed long");
+                return (signed long)-1;
+            }
+            return PyLong_AsUnsignedLong(x);
+        } else {
+            return PyLong_AsLong(x);
+        }
+    } else {
+        signed long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (signed long)-1;
+        val = __Pyx_PyInt_AsSignedLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
+    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to signed PY_LONG_LONG");
+            return (signed PY_LONG_LONG)-1;
+        }
+        return (signed PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to signed PY_LONG_LONG");
+                return (signed PY_LONG_LONG)-1;
+            }
+            return PyLong_AsUnsignedLongLong(x);
+        } else {
+            return PyLong_AsLongLong(x);
+        }
+    } else {
+        signed PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (signed PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsSignedLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+#ifndef __PYX_HAVE_RT_ImportType
+#define __PYX_HAVE_RT_ImportType
+static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
+    long size, int strict)
+{
+    PyObject *py_module = 0;
+    PyObject *result = 0;
+    PyObject *py_name = 0;
+    char warning[200];
+
+    py_module = __Pyx_ImportModule(module_name);
+    if (!py_module)
+        goto bad;
+    #if PY_MAJOR_VERSION < 3
+    py_name = PyString_FromString(class_name);
+    #else
+    py_name = PyUnicode_FromString(class_name);
+    #endif
+    if (!py_name)
+        goto bad;
+    result = PyObject_GetAttr(py_module, py_name);
+    Py_DECREF(py_name);
+    py_name = 0;
+    Py_DECREF(py_module);
+    py_module = 0;
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError, 
+            "%s.%s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+    if (!strict && ((PyTypeObject *)result)->tp_basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning), 
+            "%s.%s size changed, may indicate binary incompatibility",
+            module_name, class_name);
+        PyErr_WarnEx(NULL, warning, 0);
+    }
+    else if (((PyTypeObject *)result)->tp_basicsize != size) {
+        PyErr_Format(PyExc_ValueError, 
+            "%s.%s has the wrong size, try recompiling",
+            module_name, class_name);
+        goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(py_module);
+    Py_XDECREF(result);
+    return 0;
+}
+#endif
+
+#ifndef __PYX_HAVE_RT_ImportModule
+#define __PYX_HAVE_RT_ImportModule
+static PyObject *__Pyx_ImportModule(const char *name) {
+    PyObject *py_name = 0;
+    PyObject *py_module = 0;
+
+    #if PY_MAJOR_VERSION < 3
+    py_name = PyString_FromString(name);
+    #else
+    py_name = PyUnicode_FromString(name);
+    #endif
+    if (!py_name)
+        goto bad;
+    py_module = PyImport_Import(py_name);
+    Py_DECREF(py_name);
+    return py_module;
+bad:
+    Py_XDECREF(py_name);
+    return 0;
+}
+#endif
+
+static int __Pyx_GetVtable(PyObject *dict, void *vtabptr) {
+    PyObject *ob = PyMapping_GetItemString(dict, (char *)"__pyx_vtable__");
+    if (!ob)
+        goto bad;
+#if PY_VERSION_HEX < 0x03010000
+    *(void **)vtabptr = PyCObject_AsVoidPtr(ob);
+#else
+    *(void **)vtabptr = PyCapsule_GetPointer(ob, 0);
+#endif
+    if (!*(void **)vtabptr)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX < 0x03010000
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#else
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+
+static void __Pyx_AddTraceback(const char *funcname) {
+    PyObject *py_srcfile = 0;
+    PyObject *py_funcname = 0;
+    PyObject *py_globals = 0;
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+
+    #if PY_MAJOR_VERSION < 3
+    py_srcfile = PyString_FromString(__pyx_filename);
+    #else
+    py_srcfile = PyUnicode_FromString(__pyx_filename);
+    #endif
+    if (!py_srcfile) goto bad;
+    if (__pyx_clineno) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        #else
+        py_funcname = PyUnicode_FromString(funcname);
+        #endif
+    }
+    if (!py_funcname) goto bad;
+    py_globals = PyModule_GetDict(__pyx_m);
+    if (!py_globals) goto bad;
+    py_code = PyCode_New(
+        0,            /*int argcount,*/
+        #if PY_MAJOR_VERSION >= 3
+        0,            /*int kwonlyargcount,*/
+        #endif
+        0,            /*int nlocals,*/
+        0,            /*int stacksize,*/
+        0,            /*int flags,*/
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple,  /*PyObject *consts,*/
+        __pyx_empty_tuple,  /*PyObject *names,*/
+        __pyx_empty_tuple,  /*PyObject *varnames,*/
+        __pyx_empty_tuple,  /*PyObject *freevars,*/
+        __pyx_empty_tuple,  /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        __pyx_lineno,   /*int firstlineno,*/
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    if (!py_code) goto bad;
+    py_frame = PyFrame_New(
+        PyThreadState_GET(), /*PyThreadState *tstate,*/
+        py_code,             /*PyCodeObject *code,*/
+        py_globals,          /*PyObject *globals,*/
+        0                    /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    py_frame->f_lineno = __pyx_lineno;
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_srcfile);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else  /* Python 3+ has unicode identifiers */
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+/* Type Conversion Functions */
+
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   if (x == Py_True) return 1;
+   else if ((x == Py_False) | (x == Py_None)) return 0;
+   else return PyObject_IsTrue(x);
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+  PyNumberMethods *m;
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_VERSION_HEX < 0x03000000
+  if (PyInt_Check(x) || PyLong_Check(x))
+#else
+  if (PyLong_Check(x))
+#endif
+    return Py_INCREF(x), x;
+  m = Py_TYPE(x)->tp_as_number;
+#if PY_VERSION_HEX < 0x03000000
+  if (m && m->nb_int) {
+    name = "int";
+    res = PyNumber_Int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = PyNumber_Long(x);
+  }
+#else
+  if (m && m->nb_int) {
+    name = "int";
+    res = PyNumber_Long(x);
+  }
+#endif
+  if (res) {
+#if PY_VERSION_HEX < 0x03000000
+    if (!PyInt_Check(res) && !PyLong_Check(res)) {
+#else
+    if (!PyLong_Check(res)) {
+#endif
+      PyErr_Format(PyExc_TypeError,
+                   "__%s__ returned non-%s (type %.200s)",
+                   name, name, Py_TYPE(res)->tp_name);
+      Py_DECREF(res);
+      return NULL;
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject* x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+#if PY_VERSION_HEX < 0x02050000
+   if (ival <= LONG_MAX)
+       return PyInt_FromLong((long)ival);
+   else {
+       unsigned char *bytes = (unsigned char *) &ival;
+       int one = 1; int little = (int)*(unsigned char*)&one;
+       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
+   }
+#else
+   return PyInt_FromSize_t(ival);
+#endif
+}
+
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
+   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
+   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
+       return (size_t)-1;
+   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
+       PyErr_SetString(PyExc_OverflowError,
+                       "value too large to convert to size_t");
+       return (size_t)-1;
+   }
+   return (size_t)val;
+}
+
+
+#endif /* Py_PYTHON_H */
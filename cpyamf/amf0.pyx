@@ -0,0 +1,990 @@
+# Copyright (c) 2007-2009 The PyAMF Project.
+# See LICENSE for details.
+
+"""
+C-extension for L{pyamf.amf0} Python module in L{PyAMF<pyamf>}.
+
+@since: 0.6
+"""
+
+cdef extern from "Python.h":
+    ctypedef struct PyObject:
+        pass
+
+    object PyString_FromStringAndSize(char *buffer, Py_ssize_t length)
+    int PyString_AsStringAndSize(object, char **buf, Py_ssize_t *size) except -1
+    object PyInt_FromLong(long v)
+    long PyInt_AS_LONG(object)
+    double PyFloat_AsDouble(object) except? -1
+    object PyFloat_FromDouble(double)
+
+    int PyString_Check(object)
+    int PyUnicode_Check(object)
+    int PyInt_CheckExact(object)
+    int PyList_CheckExact(object)
+    int PyTuple_CheckExact(object)
+    object PyUnicode_AsUTF8String(object)
+    object PyUnicode_DecodeUTF8(char *, Py_ssize_t, char *)
+
+    Py_ssize_t PyList_GET_SIZE(object)
+    PyObject *PyList_GET_ITEM(object, Py_ssize_t)
+    Py_ssize_t PyTuple_GET_SIZE(object)
+    PyObject *PyTuple_GET_ITEM(object, Py_ssize_t)
+
+
+from cpyamf.util cimport cBufferedByteStream, cIndexedCollection
+from cpyamf cimport codec
+
+import types
+import datetime
+import array
+
+import pyamf
+from pyamf import util
+
+
+DEF TYPE_NUMBER = 0x00
+DEF TYPE_BOOL = 0x01
+DEF TYPE_STRING = 0x02
+DEF TYPE_OBJECT = 0x03
+DEF TYPE_MOVIECLIP = 0x04
+DEF TYPE_NULL = 0x05
+DEF TYPE_UNDEFINED = 0x06
+DEF TYPE_REFERENCE = 0x07
+DEF TYPE_MIXEDARRAY = 0x08
+DEF TYPE_OBJECTTERM = 0x09
+DEF TYPE_ARRAY = 0x0A
+DEF TYPE_DATE = 0x0B
+DEF TYPE_LONGSTRING = 0x0C
+DEF TYPE_UNSUPPORTED = 0x0D
+DEF TYPE_RECORDSET = 0x0E
+DEF TYPE_XML = 0x0F
+DEF TYPE_TYPEDOBJECT = 0x10
+DEF TYPE_AMF3 = 0x11
+
+# the largest magnitude at which every integral double is exactly
+# representable as a C long
+DEF MAX_EXACT_INT = 9007199254740992.0
+
+# the native handlers that Encoder.resolveType maps a class to
+DEF ENC_UNDEFINED = 0
+DEF ENC_NULL = 1
+DEF ENC_BOOL = 2
+DEF ENC_NUMBER = 3
+DEF ENC_STRING = 4
+DEF ENC_DATE = 5
+DEF ENC_ARRAY = 6
+DEF ENC_MIXEDARRAY = 7
+DEF ENC_OBJECT = 8
+DEF ENC_XML = 9
+DEF ENC_FUNC = 10
+DEF ENC_CLASS = 11
+DEF ENC_RAW = 12
+DEF ENC_DICTIONARY = 13
+
+
+#: The L{pyamf.amf0} module, resolved lazily to match L{cpyamf.amf3}.
+cdef object amf0 = None
+cdef object Context = None
+cdef object Dictionary = None
+cdef bint float_broken = 0
+
+cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+    types.FunctionType, types.GeneratorType, types.ModuleType,
+    types.LambdaType, types.MethodType)
+cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+
+
+cdef int _init_module() except -1:
+    global amf0, Context, Dictionary, float_broken
+
+    if amf0 is not None:
+        return 0
+
+    from pyamf import amf0 as mod
+    from pyamf import amf3
+
+    amf0 = mod
+    Context = mod.Context
+    Dictionary = amf3.Dictionary
+    float_broken = util.is_float_broken()
+
+    return 0
+
+
+# Reference table. The C{IndexedCollection} of an L{amf0.Context} is used
+# directly, any other context class goes through its public methods.
+
+cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+    if type(context) is Context:
+        return (<cIndexedCollection>context.objects).getReferenceTo(obj)
+
+    ref = context.getObjectReference(obj)
+
+    if ref is None:
+        return -1
+
+    return ref
+
+
+cdef object _get_object(object context, Py_ssize_t ref):
+    if type(context) is Context:
+        return (<cIndexedCollection>context.objects).getByReference(ref)
+
+    return context.getObject(ref)
+
+
+cdef int _add_object(object context, object obj) except -1:
+    if type(context) is Context:
+        (<cIndexedCollection>context.objects).append(obj)
+    else:
+        context.addObject(obj)
+
+    return 0
+
+
+cdef class Encoder(codec.Encoder):
+    """
+    Encodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Encoder}
+    that writes directly to the underlying
+    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.
+
+    The encoding methods of this class are not looked up by name, so
+    overriding them in a Python subclass will not affect nested elements.
+
+    @ivar use_amf3: A flag to determine whether this encoder knows about AMF3.
+    @type use_amf3: C{bool}
+    """
+
+    cdef public object use_amf3
+
+    def __init__(self, *args, **kwargs):
+        _init_module()
+
+        self.use_amf3 = kwargs.pop('use_amf3', False)
+
+        codec.Encoder.__init__(self, *args, **kwargs)
+
+    def buildContext(self):
+        return amf0.Context()
+
+    cdef object resolveType(self, object data):
+        if isinstance(data, FUNC_TYPES):
+            return ENC_FUNC
+
+        if data is None:
+            return ENC_NULL
+
+        if isinstance(data, bool):
+            return ENC_BOOL
+
+        if isinstance(data, (int, long, float)):
+            return ENC_NUMBER
+
+        if isinstance(data, types.StringTypes):
+            return ENC_STRING
+
+        if isinstance(data, pyamf.ASObject):
+            return ENC_OBJECT
+
+        if isinstance(data, pyamf.MixedArray):
+            return ENC_MIXEDARRAY
+
+        if isinstance(data, (list, tuple, array.ArrayType)):
+            return ENC_ARRAY
+
+        if isinstance(data, DATE_TYPES):
+            return ENC_DATE
+
+        if util.is_ET_element(data):
+            return ENC_XML
+
+        if data is pyamf.Undefined:
+            return ENC_UNDEFINED
+
+        if isinstance(data, pyamf.RawAMF):
+            return ENC_RAW
+
+        if isinstance(data, CLASS_TYPES):
+            return ENC_CLASS
+
+        if isinstance(data, Dictionary):
+            return ENC_DICTIONARY
+
+        if isinstance(data, (types.InstanceType, types.ObjectType)):
+            return ENC_OBJECT
+
+        return None
+
+    cdef int _writeElement(self, object data) except -1:
+        cdef object func
+        cdef long t
+
+        # There is a very specific use case that we must check for. In the
+        # context there is an array of amf3_objs that contain references to
+        # objects that are to be encoded in amf3.
+        if self.use_amf3 and self.context.hasAMF3ObjectReference(data):
+            return self._writeAMF3(data)
+
+        func = self.getTypeFunc(data)
+
+        if func is None:
+            raise pyamf.EncodeError("Cannot find encoder func for %r" % (data,))
+
+        if PyInt_CheckExact(func) == 0:
+            func(data)
+
+            return 0
+
+        t = PyInt_AS_LONG(func)
+
+        if t == ENC_STRING:
+            return self._writeString(data, 1)
+        elif t == ENC_NUMBER:
+            self.stream.write_uchar(TYPE_NUMBER)
+
+            return self.stream.write_double(float(data))
+        elif t == ENC_OBJECT:
+            return self._writeObject(data)
+        elif t == ENC_ARRAY:
+            return self._writeArray(data)
+        elif t == ENC_BOOL:
+            self.stream.write_uchar(TYPE_BOOL)
+
+            if data:
+                return self.stream.write_uchar(1)
+
+            return self.stream.write_uchar(0)
+        elif t == ENC_NULL:
+            return self.stream.write_uchar(TYPE_NULL)
+        elif t == ENC_MIXEDARRAY:
+            return self._writeMixedArray(data)
+        elif t == ENC_DATE:
+            return self._writeDate(data)
+        elif t == ENC_UNDEFINED:
+            return self.stream.write_uchar(TYPE_UNDEFINED)
+        elif t == ENC_XML:
+            return self._writeXML(data)
+        elif t == ENC_RAW:
+            self.writeRawAMF(data)
+        elif t == ENC_FUNC:
+            self.writeFunc(data)
+        elif t == ENC_CLASS:
+            self.writeClass(data)
+        elif t == ENC_DICTIONARY:
+            return self._writeDictionary(data)
+
+        return 0
+
+    cdef int _writeString(self, object s, bint writeType) except -1:
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+
+        if PyUnicode_Check(s):
+            s = PyUnicode_AsUTF8String(s)
+        elif not PyString_Check(s):
+            s = unicode(s).encode('utf8')
+
+        PyString_AsStringAndSize(s, &buf, &l)
+
+        if l > 0xffff:
+            if writeType:
+                self.stream.write_uchar(TYPE_LONGSTRING)
+
+            self.stream.write_ulong(l)
+        else:
+            if writeType:
+                self.stream.write_uchar(TYPE_STRING)
+
+            self.stream.write_ushort(l)
+
+        return self.stream.write(buf, l)
+
+    cdef Py_ssize_t _writeReference(self, object o) except -2:
+        """
+        Writes a reference to C{o} if it has already been encoded.
+
+        @return: The reference index or C{-1} if C{o} is not referenced.
+        """
+        cdef Py_ssize_t idx = _get_object_reference(self.context, o)
+
+        if idx == -1:
+            return -1
+
+        self.stream.write_uchar(TYPE_REFERENCE)
+        self.stream.write_ushort(idx)
+
+        return idx
+
+    cdef int _writeArray(self, object a) except -1:
+        cdef Py_ssize_t i, l
+
+        alias = self.context.getClassAlias(a.__class__)
+
+        if alias.external:
+            # a is a subclassed list with a registered alias - push to the
+            # correct method
+            return self._writeObject(a)
+
+        if self._writeReference(a) != -1:
+            return 0
+
+        _add_object(self.context, a)
+
+        self.stream.write_uchar(TYPE_ARRAY)
+        self.stream.write_ulong(len(a))
+
+        if PyList_CheckExact(a):
+            l = PyList_GET_SIZE(a)
+
+            for i from 0 <= i < l:
+                self._writeElement(<object>PyList_GET_ITEM(a, i))
+        elif PyTuple_CheckExact(a):
+            l = PyTuple_GET_SIZE(a)
+
+            for i from 0 <= i < l:
+                self._writeElement(<object>PyTuple_GET_ITEM(a, i))
+        else:
+            for x in a:
+                self._writeElement(x)
+
+        return 0
+
+    cdef int _writeDict(self, object o) except -1:
+        for key, val in o.iteritems():
+            self._writeString(key, 0)
+            self._writeElement(val)
+
+        return 0
+
+    cdef int _writeEndObject(self) except -1:
+        self.stream.write_ushort(0)
+
+        return self.stream.write_uchar(TYPE_OBJECTTERM)
+
+    cdef int _writeMixedArray(self, object o) except -1:
+        cdef object max_index = 0
+
+        if self._writeReference(o) != -1:
+            return 0
+
+        _add_object(self.context, o)
+        self.stream.write_uchar(TYPE_MIXEDARRAY)
+
+        # work out the highest integer index
+        for key in o:
+            if isinstance(key, (int, long)) and key > max_index:
+                max_index = key
+
+        self.stream.write_ulong(max_index)
+
+        self._writeDict(o)
+
+        return self._writeEndObject()
+
+    cdef int _writeDictionary(self, object d) except -1:
+        if not self.use_amf3:
+            for key in d:
+                if not isinstance(key, basestring):
+                    break
+            else:
+                return self._writeMixedArray(d)
+
+        return self._writeAMF3(d)
+
+    cdef int _writeObject(self, object o) except -1:
+        cdef Py_ssize_t i, l
+
+        if self.use_amf3:
+            return self._writeAMF3(o)
+
+        if self._writeReference(o) != -1:
+            return 0
+
+        _add_object(self.context, o)
+        alias = self.context.getClassAlias(o.__class__)
+
+        alias.compile()
+
+        if alias.amf3:
+            return self._writeAMF3(o)
+
+        if alias.anonymous:
+            self.stream.write_uchar(TYPE_OBJECT)
+        else:
+            self.stream.write_uchar(TYPE_TYPEDOBJECT)
+            self._writeString(alias.alias, 0)
+
+        keys = alias.encode_attrs
+
+        if keys is not None:
+            # a sealed class, the static attributes come first
+            values = alias.getEncodableValues(o)
+            l = len(keys)
+
+            for i from 0 <= i < l:
+                self._writeString(keys[i], 0)
+                self._writeElement(values[i])
+
+            return self._writeEndObject()
+
+        attrs = alias.getEncodableAttributes(o, codec=self)
+
+        if alias.static_attrs and attrs:
+            for key in alias.static_attrs:
+                value = attrs.pop(key)
+
+                self._writeString(key, 0)
+                self._writeElement(value)
+
+        if attrs:
+            for key, value in attrs.iteritems():
+                self._writeString(key, 0)
+                self._writeElement(value)
+
+        return self._writeEndObject()
+
+    cdef int _writeDate(self, object d) except -1:
+        if isinstance(d, datetime.time):
+            raise pyamf.EncodeError('A datetime.time instance was found but '
+                'AMF0 has no way to encode time objects. Please use '
+                'datetime.datetime instead (got:%r)' % (d,))
+
+        # According to the Red5 implementation of AMF0, dates references are
+        # created, but not used.
+        if self.timezone_offset is not None:
+            d -= self.timezone_offset
+
+        secs = util.get_timestamp(d)
+
+        self.stream.write_uchar(TYPE_DATE)
+        self.stream.write_double(secs * 1000.0)
+
+        return self.stream.write_short(0)
+
+    cdef int _writeXML(self, object e) except -1:
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+
+        if self.use_amf3 is True:
+            return self._writeAMF3(e)
+
+        self.stream.write_uchar(TYPE_XML)
+
+        data = util.ET.tostring(e, 'utf-8')
+        PyString_AsStringAndSize(data, &buf, &l)
+
+        self.stream.write_ulong(l)
+
+        return self.stream.write(buf, l)
+
+    cdef int _writeAMF3(self, object data) except -1:
+        context = self.context
+
+        if not hasattr(context, 'amf3_context'):
+            context.amf3_context = pyamf.get_context(pyamf.AMF3)
+
+        if not hasattr(context, 'amf3_encoder'):
+            context.amf3_encoder = pyamf.get_encoder(
+                pyamf.AMF3, self.stream, context.amf3_context)
+
+        context.addAMF3Object(data)
+        encoder = context.amf3_encoder
+
+        self.stream.write_uchar(TYPE_AMF3)
+        encoder.writeElement(data)
+
+        return 0
+
+    def writeElement(self, data):
+        """
+        Writes the data.
+
+        @type data: C{mixed}
+        @param data: The data to be encoded to the AMF0 data stream.
+        @raise EncodeError: Cannot find encoder func.
+        """
+        self._writeElement(data)
+
+    def writeType(self, t):
+        """
+        Writes the type to the stream.
+
+        @type   t: C{str}
+        @param  t: ActionScript type.
+        """
+        self.stream.write_uchar(ord(t))
+
+    def writeUndefined(self, data):
+        """
+        Writes the L{undefined<pyamf.amf0.TYPE_UNDEFINED>} data type to the
+        stream.
+        """
+        self.stream.write_uchar(TYPE_UNDEFINED)
+
+    def writeFunc(self, *args, **kwargs):
+        """
+        Functions cannot be serialised.
+        """
+        raise pyamf.EncodeError("Callables cannot be serialised")
+
+    def writeRawAMF(self, raw):
+        """
+        Writes a pre-encoded element to the stream, AMF3 fragments are
+        preceded by L{TYPE_AMF3<pyamf.amf0.TYPE_AMF3>}.
+
+        @since: 0.6
+        """
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+
+        if raw.encoding == pyamf.AMF3:
+            self.stream.write_uchar(TYPE_AMF3)
+
+        PyString_AsStringAndSize(raw.data, &buf, &l)
+        self.stream.write(buf, l)
+        self.context.addRawAMF(raw)
+
+    def writeUnsupported(self, data):
+        """
+        Writes L{unsupported<pyamf.amf0.TYPE_UNSUPPORTED>} data type to the
+        stream.
+        """
+        self.stream.write_uchar(TYPE_UNSUPPORTED)
+
+    def writeNull(self, n):
+        """
+        Write null type to data stream.
+        """
+        self.stream.write_uchar(TYPE_NULL)
+
+    def writeArray(self, a):
+        """
+        Write array to the stream.
+        """
+        self._writeArray(a)
+
+    def writeNumber(self, n):
+        """
+        Write number to the data stream.
+        """
+        self.stream.write_uchar(TYPE_NUMBER)
+        self.stream.write_double(float(n))
+
+    def writeBoolean(self, b):
+        """
+        Write boolean to the data stream.
+        """
+        self.stream.write_uchar(TYPE_BOOL)
+
+        if b:
+            self.stream.write_uchar(1)
+        else:
+            self.stream.write_uchar(0)
+
+    def writeString(self, s, writeType=True):
+        """
+        Write string to the data stream.
+
+        @param s: The string data to be encoded to the AMF0 data stream.
+        @type writeType: C{bool}
+        @param writeType: Write data type.
+        """
+        if writeType:
+            self._writeString(s, 1)
+        else:
+            self._writeString(s, 0)
+
+    def writeReference(self, o):
+        """
+        Write reference to the data stream.
+
+        @return: The reference index or C{None} if C{o} is not referenced.
+        """
+        cdef Py_ssize_t idx = self._writeReference(o)
+
+        if idx == -1:
+            return None
+
+        return idx
+
+    def writeMixedArray(self, o):
+        """
+        Write mixed array to the data stream.
+        """
+        self._writeMixedArray(o)
+
+    def writeObject(self, o):
+        """
+        Write object to the stream.
+        """
+        self._writeObject(o)
+
+    def writeDictionary(self, d):
+        """
+        Writes an L{amf3.Dictionary<pyamf.amf3.Dictionary>}, see
+        L{pyamf.amf0.Encoder.writeDictionary}.
+        """
+        self._writeDictionary(d)
+
+    def writeDate(self, d):
+        """
+        Writes a date to the data stream.
+        """
+        self._writeDate(d)
+
+    def writeXML(self, e):
+        """
+        Write XML to the data stream.
+        """
+        self._writeXML(e)
+
+    def writeAMF3(self, data):
+        """
+        Writes an element to the datastream in L{AMF3<pyamf.amf3>} format.
+        """
+        self._writeAMF3(data)
+
+
+cdef object _read_bytes(cBufferedByteStream stream, Py_ssize_t l, bint unicode_):
+    """
+    Reads C{l} bytes from C{stream}, decoding them from UTF-8 if C{unicode_}
+    is set. The result is built straight from the stream's memory.
+    """
+    cdef char *buf
+
+    if l == 0:
+        if unicode_:
+            return u''
+
+        return ''
+
+    if l < 0 or l > stream.length - stream.pos:
+        raise IOError('Attempted to read %d bytes from the buffer but only '
+            '%d remain' % (l, stream.length - stream.pos))
+
+    buf = stream.buffer + stream.pos
+    stream.pos += l
+
+    if unicode_:
+        return PyUnicode_DecodeUTF8(buf, l, 'strict')
+
+    return PyString_FromStringAndSize(buf, l)
+
+
+cdef class Decoder(codec.Decoder):
+    """
+    Decodes an AMF0 stream. A drop-in replacement for L{pyamf.amf0.Decoder}
+    that reads directly from the underlying
+    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.
+
+    Nested elements are decoded without going through the public C{read*}
+    methods, so overriding them in a Python subclass only affects direct
+    calls.
+    """
+
+    def __init__(self, *args, **kwargs):
+        _init_module()
+
+        codec.Decoder.__init__(self, *args, **kwargs)
+
+    def buildContext(self):
+        return amf0.Context()
+
+    cdef object readType(self, unsigned char t):
+        if t == TYPE_STRING:
+            return self._readString()
+        elif t == TYPE_NUMBER:
+            return self._readNumber()
+        elif t == TYPE_OBJECT:
+            return self._readASObject()
+        elif t == TYPE_BOOL:
+            return self._readBoolean()
+        elif t == TYPE_NULL or t == TYPE_UNSUPPORTED:
+            return None
+        elif t == TYPE_UNDEFINED:
+            return pyamf.Undefined
+        elif t == TYPE_REFERENCE:
+            return self._readReference()
+        elif t == TYPE_ARRAY:
+            return self._readList()
+        elif t == TYPE_MIXEDARRAY:
+            return self._readMixedArray()
+        elif t == TYPE_DATE:
+            return self._readDate()
+        elif t == TYPE_LONGSTRING:
+            return self._readLongString()
+        elif t == TYPE_XML:
+            return self._readXML()
+        elif t == TYPE_TYPEDOBJECT:
+            return self._readTypedObject()
+        elif t == TYPE_AMF3:
+            return self._readAMF3()
+
+        raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+
+    cdef object _readNumber(self):
+        cdef double x
+
+        if float_broken:
+            return amf0._check_for_int((<object>self.stream).read_double())
+
+        self.stream.read_double(&x)
+
+        # There is no way in AMF0 to distinguish between integers and floats
+        if -MAX_EXACT_INT <= x <= MAX_EXACT_INT and <double>(<long>x) == x:
+            return PyInt_FromLong(<long>x)
+
+        return amf0._check_for_int(PyFloat_FromDouble(x))
+
+    cdef object _readBoolean(self):
+        cdef unsigned char b
+
+        self.stream.read_uchar(&b)
+
+        if b:
+            return True
+
+        return False
+
+    cdef object _readString(self):
+        cdef unsigned short l
+
+        self.stream.read_ushort(&l)
+
+        return _read_bytes(self.stream, l, 1)
+
+    cdef object _readLongString(self):
+        cdef unsigned long l
+
+        self.stream.read_ulong(&l)
+
+        return _read_bytes(self.stream, l, 1)
+
+    cdef int _readObject(self, object obj, object alias) except -1:
+        cdef cBufferedByteStream stream = self.stream
+
+        obj_attrs = {}
+
+        key = self._readString().encode('utf8')
+
+        while stream.pos >= stream.length or stream.buffer[stream.pos] != TYPE_OBJECTTERM:
+            obj_attrs[key] = self._readElement()
+            key = self._readString().encode('utf8')
+
+        # discard the end marker (TYPE_OBJECTTERM)
+        stream.pos += 1
+
+        if alias:
+            alias.applyAttributes(obj, obj_attrs, codec=self)
+        else:
+            util.set_attrs(obj, obj_attrs)
+
+        return 0
+
+    cdef object _readASObject(self):
+        obj = pyamf.ASObject()
+        _add_object(self.context, obj)
+
+        self._readObject(obj, None)
+
+        return obj
+
+    cdef object _readReference(self):
+        cdef unsigned short idx
+
+        self.stream.read_ushort(&idx)
+
+        o = _get_object(self.context, idx)
+
+        if o is None:
+            raise pyamf.ReferenceError('Unknown reference %d' % (idx,))
+
+        return o
+
+    cdef object _readList(self):
+        cdef unsigned long l, i
+
+        obj = []
+        _add_object(self.context, obj)
+
+        self.stream.read_ulong(&l)
+
+        for i from 0 <= i < l:
+            obj.append(self._readElement())
+
+        return obj
+
+    cdef object _readMixedArray(self):
+        cdef unsigned long l
+
+        self.stream.read_ulong(&l)
+
+        obj = pyamf.MixedArray()
+        _add_object(self.context, obj)
+
+        self._readObject(obj, None)
+
+        for key in obj.keys():
+            try:
+                ikey = int(key)
+            except ValueError:
+                continue
+
+            obj[ikey] = obj[key]
+            del obj[key]
+
+        return obj
+
+    cdef object _readDate(self):
+        cdef double ms
+        cdef short tz
+
+        self.stream.read_double(&ms)
+        # Timezones are ignored
+        self.stream.read_short(&tz)
+
+        d = util.get_datetime(ms / 1000.0)
+
+        if self.timezone_offset:
+            d = d + self.timezone_offset
+
+        _add_object(self.context, d)
+
+        return d
+
+    cdef object _readXML(self):
+        data = self._readLongString()
+        xml = util.ET.fromstring(data)
+
+        _add_object(self.context, xml)
+
+        return xml
+
+    cdef object _readTypedObject(self):
+        classname = self._readString()
+        alias = None
+
+        try:
+            alias = pyamf.get_class_alias(classname)
+
+            ret = alias.createInstance(codec=self)
+        except pyamf.UnknownClassAlias:
+            if self.strict:
+                raise
+
+            ret = pyamf.TypedObject(classname)
+
+        _add_object(self.context, ret)
+        self._readObject(ret, alias)
+
+        return ret
+
+    cdef object _readAMF3(self):
+        context = self.context
+
+        if not hasattr(context, 'amf3_context'):
+            context.amf3_context = pyamf.get_context(pyamf.AMF3)
+
+        if not hasattr(context, 'amf3_decoder'):
+            context.amf3_decoder = pyamf.get_decoder(
+                pyamf.AMF3, self.stream, context.amf3_context)
+
+        element = context.amf3_decoder.readElement()
+        context.addAMF3Object(element)
+
+        return element
+
+    def readNumber(self):
+        """
+        Reads a ActionScript C{Number} value.
+
+        @rtype: C{int} or C{float}
+        """
+        return self._readNumber()
+
+    def readBoolean(self):
+        """
+        Reads a ActionScript C{Boolean} value.
+        """
+        return self._readBoolean()
+
+    def readNull(self):
+        """
+        Reads a ActionScript C{null} value.
+        """
+        return None
+
+    def readUndefined(self):
+        """
+        Reads an ActionScript C{undefined} value.
+        """
+        return pyamf.Undefined
+
+    def readMixedArray(self):
+        """
+        Read mixed array.
+
+        @rtype: L{pyamf.MixedArray}
+        """
+        return self._readMixedArray()
+
+    def readList(self):
+        """
+        Read a C{list} from the data stream.
+        """
+        return self._readList()
+
+    def readTypedObject(self):
+        """
+        Reads an ActionScript object from the stream and attempts to
+        'cast' it.
+        """
+        return self._readTypedObject()
+
+    def readAMF3(self):
+        """
+        Read AMF3 elements from the data stream.
+        """
+        return self._readAMF3()
+
+    def readString(self):
+        """
+        Reads a string from the data stream.
+        """
+        return self._readString()
+
+    def readObject(self):
+        """
+        Reads an object from the data stream.
+
+        @rtype: L{ASObject<pyamf.ASObject>}
+        """
+        return self._readASObject()
+
+    def readReference(self):
+        """
+        Reads a reference from the data stream.
+
+        @raise pyamf.ReferenceError: Unknown reference.
+        """
+        return self._readReference()
+
+    def readDate(self):
+        """
+        Reads a UTC date from the data stream.
+        """
+        return self._readDate()
+
+    def readLongString(self):
+        """
+        Read UTF8 string.
+        """
+        return self._readLongString()
+
+    def readXML(self):
+        """
+        Read XML.
+        """
+        return self._readXML()
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12 on Tue Jan 12 04:33:57 2010 */
+/* Generated by Cython 0.12.1 on Sat Oct 17 08:26:46 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -6,6 +6,7 @@
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #else
+
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
@@ -17,6 +18,7 @@
   #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
   #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   typedef int Py_ssize_t;
   #define PY_SSIZE_T_MAX INT_MAX
@@ -26,7 +28,9 @@
   #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
   #define PyNumber_Index(o)    PyNumber_Int(o)
   #define PyIndex_Check(o)     PyNumber_Check(o)
+  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
 #endif
+
 #if PY_VERSION_HEX < 0x02060000
   #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
   #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
@@ -36,17 +40,17 @@
   #define PyType_Modified(t)
 
   typedef struct {
-       void *buf;
-       PyObject *obj;
-       Py_ssize_t len;
-       Py_ssize_t itemsize;
-       int readonly;
-       int ndim;
-       char *format;
-       Py_ssize_t *shape;
-       Py_ssize_t *strides;
-       Py_ssize_t *suboffsets;
-       void *internal;
+     void *buf;
+     PyObject *obj;
+     Py_ssize_t len;
+     Py_ssize_t itemsize;
+     int readonly;
+     int ndim;
+     char *format;
+     Py_ssize_t *shape;
+     Py_ssize_t *strides;
+     Py_ssize_t *suboffsets;
+     void *internal;
   } Py_buffer;
 
   #define PyBUF_SIMPLE 0
@@ -60,18 +64,22 @@
   #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
 
 #endif
+
 #if PY_MAJOR_VERSION < 3
   #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define Py_TPFLAGS_CHECKTYPES 0
   #define Py_TPFLAGS_HAVE_INDEX 0
 #endif
+
 #if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
   #define Py_TPFLAGS_HAVE_NEWBUFFER 0
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyBaseString_Type            PyUnicode_Type
   #define PyString_Type                PyUnicode_Type
@@ -80,6 +88,7 @@
   #define PyBytes_Type                 PyString_Type
   #define PyBytes_CheckExact           PyString_CheckExact
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyInt_Type                   PyLong_Type
   #define PyInt_Check(op)              PyLong_Check(op)
@@ -99,10 +108,13 @@
 #else
   #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
   #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
 #endif
+
 #if !defined(WIN32) && !defined(MS_WINDOWS)
   #ifndef __stdcall
     #define __stdcall
@@ -116,6 +128,7 @@
 #else
   #define _USE_MATH_DEFINES
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
   #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
@@ -125,6 +138,7 @@
   #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
   #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   #define __Pyx_NAMESTR(n) ((char *)(n))
   #define __Pyx_DOCSTR(n)  ((char *)(n))
@@ -140,12 +154,14 @@
 #include <math.h>
 #define __PYX_HAVE_API__cpyamf__amf3
 
-#ifdef __GNUC__
-#define INLINE __inline__
-#elif _WIN32
-#define INLINE __inline
-#else
-#define INLINE 
+#ifndef CYTHON_INLINE
+  #if defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #else
+    #define CYTHON_INLINE 
+  #endif
 #endif
 
 typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
@@ -167,8 +183,8 @@ typedef struct {PyObject **p; char *s; const long n; const char* encoding; const
 #define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
 
 #define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
 
 #if !defined(T_PYSSIZET)
 #if PY_VERSION_HEX < 0x02050000
@@ -232,9 +248,9 @@ static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
 #endif
 #endif
 
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
 
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 
@@ -266,7 +282,7 @@ static const char **__pyx_f;
 
 /* Type declarations */
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":26
+/* "/root/package/cpyamf/util.pxd":32
  *     cdef int at_eof(self) except? -1
  *     cdef inline Py_ssize_t remaining(self) except? -1
  *     cdef int seek(self, Py_ssize_t pos, int mode=*) except? -1             # <<<<<<<<<<<<<<
@@ -279,8 +295,8 @@ struct __pyx_opt_args_6cpyamf_4util_19cBufferedByteStream_seek {
   int mode;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":72
- *     return size
+/* "/root/package/cpyamf/amf3.pyx":263
+ * 
  * 
  * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:             # <<<<<<<<<<<<<<
  *     cdef int n = 0
@@ -292,7 +308,78 @@ struct __pyx_opt_args_6cpyamf_4amf3__decode_int {
   int sign;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":9
+/* "/root/package/cpyamf/codec.pxd":7
+ * 
+ * 
+ * cdef class Codec:             # <<<<<<<<<<<<<<
+ *     cdef public cBufferedByteStream stream
+ *     cdef public object context
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Codec {
+  PyObject_HEAD
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *stream;
+  PyObject *context;
+  PyObject *strict;
+  PyObject *timezone_offset;
+};
+
+/* "/root/package/cpyamf/codec.pxd":22
+ * 
+ * 
+ * cdef class Decoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef object _readElement(self)
+ *     cdef object readType(self, unsigned char t)
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Decoder {
+  struct __pyx_obj_6cpyamf_5codec_Codec __pyx_base;
+  struct __pyx_vtabstruct_6cpyamf_5codec_Decoder *__pyx_vtab;
+};
+
+/* "/root/package/cpyamf/amf3.pyx":1064
+ * 
+ * 
+ * cdef class Decoder(codec.Decoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Decodes an AMF3 data stream. A drop-in replacement for
+ */
+
+struct __pyx_obj_6cpyamf_4amf3_Decoder {
+  struct __pyx_obj_6cpyamf_5codec_Decoder __pyx_base;
+  PyObject *use_proxies;
+  PyObject *typed_arrays;
+};
+
+/* "/root/package/cpyamf/codec.pxd":14
+ * 
+ * 
+ * cdef class Encoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef dict _func_cache
+ * 
+ */
+
+struct __pyx_obj_6cpyamf_5codec_Encoder {
+  struct __pyx_obj_6cpyamf_5codec_Codec __pyx_base;
+  struct __pyx_vtabstruct_6cpyamf_5codec_Encoder *__pyx_vtab;
+  PyObject *_func_cache;
+};
+
+/* "/root/package/cpyamf/amf3.pyx":299
+ * 
+ * 
+ * cdef class Encoder(codec.Encoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Encodes an AMF3 data stream. A drop-in replacement for
+ */
+
+struct __pyx_obj_6cpyamf_4amf3_Encoder {
+  struct __pyx_obj_6cpyamf_5codec_Encoder __pyx_base;
+  PyObject *use_proxies;
+  int string_references;
+};
+
+/* "/root/package/cpyamf/util.pxd":9
  * 
  * 
  * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
@@ -309,9 +396,12 @@ struct __pyx_obj_6cpyamf_4util_cBufferedByteStream {
   Py_ssize_t pos;
   Py_ssize_t size;
   Py_ssize_t length;
+  int wrapped;
+  PyObject *_source;
+  PyObject *_export;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":60
+/* "/root/package/cpyamf/util.pxd":66
  * 
  * 
  * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
@@ -330,6 +420,73 @@ struct __pyx_obj_6cpyamf_4util_cIndexedCollection {
 };
 
 
+/* "/root/package/cpyamf/codec.pxd":14
+ * 
+ * 
+ * cdef class Encoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef dict _func_cache
+ * 
+ */
+
+struct __pyx_vtabstruct_6cpyamf_5codec_Encoder {
+  PyObject *(*getCustomTypeFunc)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+  PyObject *(*getTypeFunc)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+  PyObject *(*resolveType)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *);
+};
+static struct __pyx_vtabstruct_6cpyamf_5codec_Encoder *__pyx_vtabptr_6cpyamf_5codec_Encoder;
+
+
+/* "/root/package/cpyamf/amf3.pyx":299
+ * 
+ * 
+ * cdef class Encoder(codec.Encoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Encodes an AMF3 data stream. A drop-in replacement for
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder {
+  struct __pyx_vtabstruct_6cpyamf_5codec_Encoder __pyx_base;
+  int (*_writeElement)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *);
+  int (*_writeInteger)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeNumber)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeString)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeDate)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeList)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *);
+  int (*_writeDict)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *);
+  int (*_writeObject)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *);
+  int (*_writeSealedObject)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *, PyObject *, int);
+  int (*_writeByteArray)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeVector)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *);
+  int (*_writeObjectVector)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeDictionary)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+  int (*_writeXML)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *);
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *__pyx_vtabptr_6cpyamf_4amf3_Encoder;
+
+
+/* "/root/package/cpyamf/codec.pxd":22
+ * 
+ * 
+ * cdef class Decoder(Codec):             # <<<<<<<<<<<<<<
+ *     cdef object _readElement(self)
+ *     cdef object readType(self, unsigned char t)
+ */
+
+struct __pyx_vtabstruct_6cpyamf_5codec_Decoder {
+  PyObject *(*_readElement)(struct __pyx_obj_6cpyamf_5codec_Decoder *);
+  PyObject *(*readType)(struct __pyx_obj_6cpyamf_5codec_Decoder *, unsigned char);
+};
+static struct __pyx_vtabstruct_6cpyamf_5codec_Decoder *__pyx_vtabptr_6cpyamf_5codec_Decoder;
+
+
+/* "/root/package/cpyamf/util.pxd":66
+ * 
+ * 
+ * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
+ *     cdef int use_hash
+ *     cdef PyObject **data
+ */
+
 struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection {
   int (*_increase_size)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *);
   void (*_clear)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *);
@@ -338,11 +495,12 @@ struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection {
   PyObject *(*getByReference)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
   Py_ssize_t (*getReferenceTo)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
   Py_ssize_t (*append)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
+  int (*truncate)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
 };
 static struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *__pyx_vtabptr_6cpyamf_4util_cIndexedCollection;
 
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":9
+/* "/root/package/cpyamf/util.pxd":9
  * 
  * 
  * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
@@ -351,6 +509,9 @@ static struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *__pyx_vtabptr_6
  */
 
 struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream {
+  int (*wrap)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *);
+  int (*_own)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  PyObject *(*read_view)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
   Py_ssize_t (*tell)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
   int (*close)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
   int (*write)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char *, Py_ssize_t);
@@ -395,6 +556,33 @@ struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream {
 };
 static struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream;
 
+
+/* "/root/package/cpyamf/amf3.pyx":1064
+ * 
+ * 
+ * cdef class Decoder(codec.Decoder):             # <<<<<<<<<<<<<<
+ *     """
+ *     Decodes an AMF3 data stream. A drop-in replacement for
+ */
+
+struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder {
+  struct __pyx_vtabstruct_6cpyamf_5codec_Decoder __pyx_base;
+  long (*_readInteger)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int);
+  PyObject *(*_readNumber)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+  PyObject *(*_readString)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int);
+  PyObject *(*_readDate)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+  PyObject *(*_readArray)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+  PyObject *(*_readTypedArray)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, long);
+  PyObject *(*_readClassDefinition)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, long);
+  PyObject *(*_readObject)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, PyObject *);
+  PyObject *(*_readXML)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int);
+  PyObject *(*_readByteArray)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+  PyObject *(*_readVector)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, PyObject *);
+  PyObject *(*_readObjectVector)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+  PyObject *(*_readDictionary)(struct __pyx_obj_6cpyamf_4amf3_Decoder *);
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *__pyx_vtabptr_6cpyamf_4amf3_Decoder;
+
 #ifndef CYTHON_REFNANNY
   #define CYTHON_REFNANNY 0
 #endif
@@ -441,6 +629,123 @@ static struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *__pyx_vtabptr_
 #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
 #define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
 
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
+    const char* function_name, int kw_allowed); /*proto*/
+
+static PyObject* __Pyx_PyEval_CallObjectWithKeywords(PyObject*, PyObject*, PyObject*); /*proto*/
+
+static CYTHON_INLINE long __Pyx_NegateNonNeg(long b) { return unlikely(b < 0) ? b : !b; }
+static CYTHON_INLINE PyObject* __Pyx_PyBoolOrNull_FromLong(long b) {
+    return unlikely(b < 0) ? NULL : __Pyx_PyBool_FromLong(b);
+}
+
+static double __Pyx__PyObject_AsDouble(PyObject* obj); /* proto */
+
+#define __Pyx_PyObject_AsDouble(obj) \
+    ((likely(PyFloat_CheckExact(obj))) ? \
+     PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
+
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; /* this is just to have an accurate signature */
+    }
+    else {
+        PyObject *r, *m;
+        m = __Pyx_GetAttrString(L, "append");
+        if (!m) return NULL;
+        r = PyObject_CallFunctionObjArgs(m, x, NULL);
+        Py_DECREF(m);
+        return r;
+    }
+}
+
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+
+
+#define __Pyx_GetItemInt_List(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_List_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+            PyObject *r = PyList_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Tuple_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+
+#define __Pyx_GetItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    PyObject *r;
+    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
+        r = PySequence_GetItem(o, i);
+    }
+    else {
+        r = __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+    }
+    return r;
+}
+
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
+
+static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
+static int __Pyx_EndUnpack(PyObject *); /*proto*/
+
+static PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *); /*proto*/
+
 static void __Pyx_RaiseDoubleKeywordsError(
     const char* func_name, PyObject* kw_name); /*proto*/
 
@@ -449,49 +754,85 @@ static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
 
 static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+#define __Pyx_SetItemInt(o, i, v, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_SetItemInt_Fast(o, i, v, size <= sizeof(long)) : \
+                                                    __Pyx_SetItemInt_Generic(o, to_py_func(i), v))
+
+static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int fits_long) {
+    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        Py_INCREF(v);
+        Py_DECREF(PyList_GET_ITEM(o, i));
+        PyList_SET_ITEM(o, i, v);
+        return 1;
+    }
+    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_ass_item && (likely(i >= 0)))
+        return PySequence_SetItem(o, i, v);
+    else {
+        PyObject *j = fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i);
+        return __Pyx_SetItemInt_Generic(o, j, v);
+    }
+}
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
 
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
 
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
 
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
 
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
 
-static INLINE char __Pyx_PyInt_AsChar(PyObject *);
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
 
-static INLINE short __Pyx_PyInt_AsShort(PyObject *);
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
 
-static INLINE int __Pyx_PyInt_AsInt(PyObject *);
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
 
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
 
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
 
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
 
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
 
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
 
-static INLINE long __Pyx_PyInt_AsLong(PyObject *);
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
 
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
 
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
 
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
 
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, long size);  /*proto*/
+static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, long size, int strict);  /*proto*/
 
 static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
 
 static int __Pyx_GetVtable(PyObject *dict, void *vtabptr); /*proto*/
 
+static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
+
 static void __Pyx_AddTraceback(const char *funcname); /*proto*/
 
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
@@ -499,697 +840,14573 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
 
 static PyTypeObject *__pyx_ptype_6cpyamf_4util_cBufferedByteStream = 0;
 static PyTypeObject *__pyx_ptype_6cpyamf_4util_cIndexedCollection = 0;
+/* Module declarations from cpyamf */
+
+/* Module declarations from cpyamf.codec */
+
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Codec = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Encoder = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_5codec_Decoder = 0;
 /* Module declarations from cpyamf.amf3 */
 
-static Py_ssize_t __pyx_f_6cpyamf_4amf3__encode_int(long, char **); /*proto*/
+static PyTypeObject *__pyx_ptype_6cpyamf_4amf3_Encoder = 0;
+static PyTypeObject *__pyx_ptype_6cpyamf_4amf3_Decoder = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_amf3 = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_Context = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_get_decode_plan = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_NumericVector = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_ObjectVector = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_Dictionary = 0;
+static int __pyx_v_6cpyamf_4amf3_float_broken;
+static PyObject *__pyx_v_6cpyamf_4amf3_FUNC_TYPES = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_DATE_TYPES = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_CLASS_TYPES = 0;
+static PyObject *__pyx_v_6cpyamf_4amf3_LIST_TYPES = 0;
+static int __pyx_f_6cpyamf_4amf3__init_module(void); /*proto*/
+static Py_ssize_t __pyx_f_6cpyamf_4amf3__get_object_reference(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf3__get_object(PyObject *, Py_ssize_t); /*proto*/
+static int __pyx_f_6cpyamf_4amf3__add_object(PyObject *, PyObject *); /*proto*/
+static Py_ssize_t __pyx_f_6cpyamf_4amf3__get_string_reference(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf3__get_string(PyObject *, Py_ssize_t); /*proto*/
+static int __pyx_f_6cpyamf_4amf3__add_string(PyObject *, PyObject *); /*proto*/
+static Py_ssize_t __pyx_f_6cpyamf_4amf3__encode_int(long, char *); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf3__encoded_int(long); /*proto*/
+static int __pyx_f_6cpyamf_4amf3__write_int(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long); /*proto*/
 static int __pyx_f_6cpyamf_4amf3__decode_int(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, long *, struct __pyx_opt_args_6cpyamf_4amf3__decode_int *__pyx_optional_args); /*proto*/
+static PyObject *__pyx_f_6cpyamf_4amf3__read_bytes(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t, int); /*proto*/
 #define __Pyx_MODULE_NAME "cpyamf.amf3"
 int __pyx_module_is_main_cpyamf__amf3 = 0;
 
 /* Implementation of cpyamf.amf3 */
 static PyObject *__pyx_builtin_OverflowError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_KeyError;
+static PyObject *__pyx_builtin_ord;
+static PyObject *__pyx_builtin_getattr;
+static PyObject *__pyx_builtin_IOError;
+static PyObject *__pyx_builtin_chr;
 static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_RuntimeError;
 static char __pyx_k_1[] = "Out of range";
-static char __pyx_k_3[] = "Unable to decode int";
-static char __pyx_k_4[] = "\nC-extension for L{pyamf.amf3} Python module in L{PyAMF<pyamf>}.\n\n@since: 0.4\n";
-static char __pyx_k_5[] = "encode_int (line 108)";
-static char __pyx_k_6[] = "decode_int (line 125)";
+static char __pyx_k_2[] = "Unknown type %r";
+static char __pyx_k_3[] = "A datetime.time instance was found but AMF3 has no way to encode time objects. Please use datetime.datetime instead (got:%r)";
+static char __pyx_k_4[] = "";
+static char __pyx_k_5[] = "dicts cannot contain empty string keys";
+static char __pyx_k_6[] = "Non int/str key value found in dict";
+static char __pyx_k_7[] = "getEncodableAttributes";
+static char __pyx_k_8[] = "getLegacyXMLReference";
+static char __pyx_k_9[] = "utf-8";
+static char __pyx_k_11[] = "Cannot write an AMF%d fragment to an AMF3 stream";
+static char __pyx_k_12[] = "Attempted to read %d bytes from the buffer but only %d remain";
+static char __pyx_k_13[] = "typed_arrays_default";
+static char __pyx_k_14[] = "Unsupported ActionScript type %r";
+static char __pyx_k_15[] = "Unknown reference %d";
+static char __pyx_k_16[] = "_readClassDefinition";
+static char __pyx_k_17[] = "Unknown object encoding";
+static char __pyx_k_21[] = "Unable to decode int";
+static char __pyx_k_22[] = "\nC-extension for L{pyamf.amf3} Python module in L{PyAMF<pyamf>}.\n\n@since: 0.4\n";
+static char __pyx_k_23[] = "Encoder.writeElement (line 892)";
+static char __pyx_k_24[] = "Encoder.writeProxy (line 902)";
+static char __pyx_k_25[] = "Encoder.writeUndefined (line 910)";
+static char __pyx_k_26[] = "Encoder.writeNull (line 916)";
+static char __pyx_k_27[] = "Encoder.writeBoolean (line 922)";
+static char __pyx_k_28[] = "Encoder.writeInteger (line 931)";
+static char __pyx_k_29[] = "Encoder.writeNumber (line 937)";
+static char __pyx_k_30[] = "Encoder.writeString (line 943)";
+static char __pyx_k_31[] = "Encoder.writeDate (line 953)";
+static char __pyx_k_32[] = "Encoder.writeList (line 959)";
+static char __pyx_k_33[] = "Encoder.writeDict (line 965)";
+static char __pyx_k_34[] = "Encoder.writeInstance (line 974)";
+static char __pyx_k_35[] = "Encoder.writeObject (line 987)";
+static char __pyx_k_36[] = "Encoder.writeByteArray (line 993)";
+static char __pyx_k_37[] = "Encoder.writeVector (line 999)";
+static char __pyx_k_38[] = "Encoder.writeObjectVector (line 1007)";
+static char __pyx_k_39[] = "Encoder.writeDictionary (line 1013)";
+static char __pyx_k_40[] = "Encoder.writeXML (line 1019)";
+static char __pyx_k_41[] = "Encoder.writeRawAMF (line 1025)";
+static char __pyx_k_42[] = "Decoder.readUndefined (line 1460)";
+static char __pyx_k_43[] = "Decoder.readNull (line 1466)";
+static char __pyx_k_44[] = "Decoder.readBoolFalse (line 1472)";
+static char __pyx_k_45[] = "Decoder.readBoolTrue (line 1478)";
+static char __pyx_k_46[] = "Decoder.readNumber (line 1484)";
+static char __pyx_k_47[] = "Decoder.readUnsignedInteger (line 1490)";
+static char __pyx_k_48[] = "Decoder.readSignedInteger (line 1496)";
+static char __pyx_k_49[] = "Decoder.readInteger (line 1502)";
+static char __pyx_k_50[] = "Decoder.readString (line 1514)";
+static char __pyx_k_51[] = "Decoder.readDate (line 1523)";
+static char __pyx_k_52[] = "Decoder.readArray (line 1529)";
+static char __pyx_k_53[] = "Decoder._getClassDefinition (line 1535)";
+static char __pyx_k_54[] = "Decoder.readObject (line 1545)";
+static char __pyx_k_55[] = "Decoder.readXMLString (line 1553)";
+static char __pyx_k_56[] = "Decoder.readXML (line 1560)";
+static char __pyx_k_57[] = "Decoder.readByteArray (line 1566)";
+static char __pyx_k_58[] = "Decoder.readIntVector (line 1572)";
+static char __pyx_k_59[] = "Decoder.readUintVector (line 1578)";
+static char __pyx_k_60[] = "Decoder.readNumberVector (line 1584)";
+static char __pyx_k_61[] = "Decoder.readObjectVector (line 1590)";
+static char __pyx_k_62[] = "Decoder.readDictionary (line 1596)";
+static char __pyx_k_63[] = "encode_int (line 1603)";
+static char __pyx_k_64[] = "decode_int (line 1612)";
+static char __pyx_k__d[] = "d";
+static char __pyx_k__l[] = "l";
+static char __pyx_k__n[] = "n";
+static char __pyx_k__ET[] = "ET";
+static char __pyx_k__fd[] = "fd";
+static char __pyx_k__chr[] = "chr";
+static char __pyx_k__obj[] = "obj";
+static char __pyx_k__ord[] = "ord";
+static char __pyx_k__pop[] = "pop";
+static char __pyx_k__pos[] = "pos";
+static char __pyx_k__raw[] = "raw";
+static char __pyx_k__AMF3[] = "AMF3";
+static char __pyx_k__amf3[] = "amf3";
+static char __pyx_k__data[] = "data";
+static char __pyx_k__date[] = "date";
+static char __pyx_k__keys[] = "keys";
+static char __pyx_k__plan[] = "plan";
+static char __pyx_k__seek[] = "seek";
 static char __pyx_k__sign[] = "sign";
+static char __pyx_k__sort[] = "sort";
+static char __pyx_k__tell[] = "tell";
+static char __pyx_k__time[] = "time";
+static char __pyx_k__util[] = "util";
+static char __pyx_k__alias[] = "alias";
+static char __pyx_k__array[] = "array";
+static char __pyx_k__codec[] = "codec";
+static char __pyx_k__defer[] = "defer";
+static char __pyx_k__fixed[] = "fixed";
+static char __pyx_k__index[] = "index";
+static char __pyx_k__klass[] = "klass";
+static char __pyx_k__pyamf[] = "pyamf";
+static char __pyx_k__types[] = "types";
+static char __pyx_k__write[] = "write";
+static char __pyx_k__RawAMF[] = "RawAMF";
+static char __pyx_k__append[] = "append";
+static char __pyx_k__buffer[] = "buffer";
+static char __pyx_k__length[] = "length";
 static char __pyx_k__stream[] = "stream";
+static char __pyx_k__strict[] = "strict";
+static char __pyx_k__tolist[] = "tolist";
+static char __pyx_k__Context[] = "Context";
+static char __pyx_k__Decoder[] = "Decoder";
+static char __pyx_k__Encoder[] = "Encoder";
+static char __pyx_k__IOError[] = "IOError";
+static char __pyx_k__context[] = "context";
+static char __pyx_k__getattr[] = "getattr";
+static char __pyx_k__objects[] = "objects";
+static char __pyx_k__readXML[] = "readXML";
+static char __pyx_k__strings[] = "strings";
+static char __pyx_k__KeyError[] = "KeyError";
+static char __pyx_k__TypeType[] = "TypeType";
+static char __pyx_k____init__[] = "__init__";
 static char __pyx_k____main__[] = "__main__";
 static char __pyx_k____test__[] = "__test__";
+static char __pyx_k___readXML[] = "_readXML";
+static char __pyx_k__addClass[] = "addClass";
+static char __pyx_k__attr_len[] = "attr_len";
+static char __pyx_k__datetime[] = "datetime";
+static char __pyx_k__encoding[] = "encoding";
+static char __pyx_k__external[] = "external";
+static char __pyx_k__getClass[] = "getClass";
+static char __pyx_k__readDate[] = "readDate";
+static char __pyx_k__readNull[] = "readNull";
+static char __pyx_k__tostring[] = "tostring";
+static char __pyx_k__typecode[] = "typecode";
+static char __pyx_k__unicode_[] = "unicode_";
+static char __pyx_k__writeXML[] = "writeXML";
+static char __pyx_k__ArrayType[] = "ArrayType";
+static char __pyx_k__ByteArray[] = "ByteArray";
+static char __pyx_k__ClassType[] = "ClassType";
+static char __pyx_k__DataInput[] = "DataInput";
+static char __pyx_k__IntVector[] = "IntVector";
+static char __pyx_k__Undefined[] = "Undefined";
+static char __pyx_k____class__[] = "__class__";
+static char __pyx_k___readDate[] = "_readDate";
+static char __pyx_k___writeXML[] = "_writeXML";
+static char __pyx_k__addObject[] = "addObject";
+static char __pyx_k__addRawAMF[] = "addRawAMF";
+static char __pyx_k__addString[] = "addString";
+static char __pyx_k__anonymous[] = "anonymous";
+static char __pyx_k__classname[] = "classname";
+static char __pyx_k__getObject[] = "getObject";
+static char __pyx_k__getString[] = "getString";
+static char __pyx_k__iteritems[] = "iteritems";
+static char __pyx_k__readArray[] = "readArray";
+static char __pyx_k__readProxy[] = "readProxy";
+static char __pyx_k__read_view[] = "read_view";
+static char __pyx_k__reference[] = "reference";
+static char __pyx_k__remaining[] = "remaining";
+static char __pyx_k__weak_keys[] = "weak_keys";
+static char __pyx_k__writeDate[] = "writeDate";
+static char __pyx_k__writeDict[] = "writeDict";
+static char __pyx_k__writeFunc[] = "writeFunc";
+static char __pyx_k__writeList[] = "writeList";
+static char __pyx_k__writeNull[] = "writeNull";
+static char __pyx_k__writeType[] = "writeType";
+static char __pyx_k__DataOutput[] = "DataOutput";
+static char __pyx_k__Dictionary[] = "Dictionary";
+static char __pyx_k__LambdaType[] = "LambdaType";
+static char __pyx_k__MethodType[] = "MethodType";
+static char __pyx_k__MixedArray[] = "MixedArray";
+static char __pyx_k__ModuleType[] = "ModuleType";
+static char __pyx_k__ObjectType[] = "ObjectType";
+static char __pyx_k__UintVector[] = "UintVector";
+static char __pyx_k__ValueError[] = "ValueError";
+static char __pyx_k___readArray[] = "_readArray";
+static char __pyx_k___writeDate[] = "_writeDate";
+static char __pyx_k___writeDict[] = "_writeDict";
+static char __pyx_k___writeList[] = "_writeList";
+static char __pyx_k__compressed[] = "compressed";
 static char __pyx_k__decode_int[] = "decode_int";
 static char __pyx_k__encode_int[] = "encode_int";
+static char __pyx_k__fromstring[] = "fromstring";
+static char __pyx_k__readNumber[] = "readNumber";
+static char __pyx_k__readObject[] = "readObject";
+static char __pyx_k__readString[] = "readString";
 static char __pyx_k__read_uchar[] = "read_uchar";
+static char __pyx_k__writeClass[] = "writeClass";
+static char __pyx_k__writeProxy[] = "writeProxy";
+static char __pyx_k__DecodeError[] = "DecodeError";
+static char __pyx_k__EncodeError[] = "EncodeError";
 static char __pyx_k__MemoryError[] = "MemoryError";
+static char __pyx_k__StringTypes[] = "StringTypes";
+static char __pyx_k____readamf__[] = "__readamf__";
+static char __pyx_k___decompress[] = "_decompress";
+static char __pyx_k___readNumber[] = "_readNumber";
+static char __pyx_k___readObject[] = "_readObject";
+static char __pyx_k___readString[] = "_readString";
+static char __pyx_k___readVector[] = "_readVector";
+static char __pyx_k__getTypeFunc[] = "getTypeFunc";
+static char __pyx_k__readInteger[] = "readInteger";
+static char __pyx_k__read_double[] = "read_double";
+static char __pyx_k__use_proxies[] = "use_proxies";
+static char __pyx_k__writeNumber[] = "writeNumber";
+static char __pyx_k__writeObject[] = "writeObject";
+static char __pyx_k__writeRawAMF[] = "writeRawAMF";
+static char __pyx_k__writeString[] = "writeString";
+static char __pyx_k__writeVector[] = "writeVector";
+static char __pyx_k__write_uchar[] = "write_uchar";
+static char __pyx_k__FunctionType[] = "FunctionType";
+static char __pyx_k__InstanceType[] = "InstanceType";
+static char __pyx_k__NumberVector[] = "NumberVector";
+static char __pyx_k__ObjectVector[] = "ObjectVector";
 static char __pyx_k__RuntimeError[] = "RuntimeError";
+static char __pyx_k____writeamf__[] = "__writeamf__";
+static char __pyx_k___pack_vector[] = "_pack_vector";
+static char __pyx_k___readElement[] = "_readElement";
+static char __pyx_k___readInteger[] = "_readInteger";
+static char __pyx_k___writeNumber[] = "_writeNumber";
+static char __pyx_k___writeObject[] = "_writeObject";
+static char __pyx_k___writeString[] = "_writeString";
+static char __pyx_k___writeVector[] = "_writeVector";
+static char __pyx_k__addLegacyXML[] = "addLegacyXML";
+static char __pyx_k__encode_attrs[] = "encode_attrs";
+static char __pyx_k__get_datetime[] = "get_datetime";
+static char __pyx_k__readBoolTrue[] = "readBoolTrue";
+static char __pyx_k__static_attrs[] = "static_attrs";
+static char __pyx_k__typed_arrays[] = "typed_arrays";
+static char __pyx_k__writeBoolean[] = "writeBoolean";
+static char __pyx_k__writeElement[] = "writeElement";
+static char __pyx_k__writeInteger[] = "writeInteger";
+static char __pyx_k__write_double[] = "write_double";
+static char __pyx_k__GeneratorType[] = "GeneratorType";
 static char __pyx_k__OverflowError[] = "OverflowError";
+static char __pyx_k__UndefinedType[] = "UndefinedType";
+static char __pyx_k___writeElement[] = "_writeElement";
+static char __pyx_k___writeInteger[] = "_writeInteger";
+static char __pyx_k__get_timestamp[] = "get_timestamp";
+static char __pyx_k__is_ET_element[] = "is_ET_element";
+static char __pyx_k__readBoolFalse[] = "readBoolFalse";
+static char __pyx_k__readByteArray[] = "readByteArray";
+static char __pyx_k__readIntVector[] = "readIntVector";
+static char __pyx_k__readUndefined[] = "readUndefined";
+static char __pyx_k__readXMLString[] = "readXMLString";
+static char __pyx_k__writeInstance[] = "writeInstance";
+static char __pyx_k__ReferenceError[] = "ReferenceError";
+static char __pyx_k___NumericVector[] = "_NumericVector";
+static char __pyx_k___readByteArray[] = "_readByteArray";
+static char __pyx_k___unpack_vector[] = "_unpack_vector";
+static char __pyx_k__createInstance[] = "createInstance";
+static char __pyx_k__getByReference[] = "getByReference";
+static char __pyx_k__getReferenceTo[] = "getReferenceTo";
+static char __pyx_k__get_class_meta[] = "get_class_meta";
+static char __pyx_k__readDictionary[] = "readDictionary";
+static char __pyx_k__readUintVector[] = "readUintVector";
+static char __pyx_k__writeByteArray[] = "writeByteArray";
+static char __pyx_k__writeUndefined[] = "writeUndefined";
+static char __pyx_k__ClassDefinition[] = "ClassDefinition";
+static char __pyx_k___get_alias_type[] = "_get_alias_type";
+static char __pyx_k___readDictionary[] = "_readDictionary";
+static char __pyx_k___readTypedArray[] = "_readTypedArray";
+static char __pyx_k___writeByteArray[] = "_writeByteArray";
+static char __pyx_k__applyAttributes[] = "applyAttributes";
+static char __pyx_k__get_class_alias[] = "get_class_alias";
+static char __pyx_k__get_decode_plan[] = "get_decode_plan";
+static char __pyx_k__is_float_broken[] = "is_float_broken";
+static char __pyx_k__timezone_offset[] = "timezone_offset";
+static char __pyx_k__writeDictionary[] = "writeDictionary";
+static char __pyx_k__VECTOR_TYPECODES[] = "VECTOR_TYPECODES";
+static char __pyx_k___writeDictionary[] = "_writeDictionary";
+static char __pyx_k__readNumberVector[] = "readNumberVector";
+static char __pyx_k__readObjectVector[] = "readObjectVector";
+static char __pyx_k__BuiltinMethodType[] = "BuiltinMethodType";
+static char __pyx_k__UnknownClassAlias[] = "UnknownClassAlias";
+static char __pyx_k___readObjectVector[] = "_readObjectVector";
+static char __pyx_k__getProxyForObject[] = "getProxyForObject";
+static char __pyx_k__readSignedInteger[] = "readSignedInteger";
+static char __pyx_k__static_properties[] = "static_properties";
+static char __pyx_k__string_references[] = "string_references";
+static char __pyx_k__writeObjectVector[] = "writeObjectVector";
+static char __pyx_k___writeObjectVector[] = "_writeObjectVector";
+static char __pyx_k___writeSealedObject[] = "_writeSealedObject";
+static char __pyx_k__getClassDefinition[] = "getClassDefinition";
+static char __pyx_k__getEncodableValues[] = "getEncodableValues";
+static char __pyx_k__getObjectReference[] = "getObjectReference";
+static char __pyx_k__getStringReference[] = "getStringReference";
+static char __pyx_k__BuiltinFunctionType[] = "BuiltinFunctionType";
+static char __pyx_k___getClassDefinition[] = "_getClassDefinition";
+static char __pyx_k__getClassByReference[] = "getClassByReference";
+static char __pyx_k__readUnsignedInteger[] = "readUnsignedInteger";
+static char __pyx_k__use_proxies_default[] = "use_proxies_default";
 static PyObject *__pyx_kp_s_1;
+static PyObject *__pyx_kp_s_11;
+static PyObject *__pyx_kp_s_12;
+static PyObject *__pyx_n_s_13;
+static PyObject *__pyx_kp_s_14;
+static PyObject *__pyx_kp_s_15;
+static PyObject *__pyx_n_s_16;
+static PyObject *__pyx_kp_s_17;
+static PyObject *__pyx_kp_s_2;
+static PyObject *__pyx_kp_s_21;
+static PyObject *__pyx_kp_u_23;
+static PyObject *__pyx_kp_u_24;
+static PyObject *__pyx_kp_u_25;
+static PyObject *__pyx_kp_u_26;
+static PyObject *__pyx_kp_u_27;
+static PyObject *__pyx_kp_u_28;
+static PyObject *__pyx_kp_u_29;
 static PyObject *__pyx_kp_s_3;
-static PyObject *__pyx_kp_u_5;
-static PyObject *__pyx_kp_u_6;
+static PyObject *__pyx_kp_u_30;
+static PyObject *__pyx_kp_u_31;
+static PyObject *__pyx_kp_u_32;
+static PyObject *__pyx_kp_u_33;
+static PyObject *__pyx_kp_u_34;
+static PyObject *__pyx_kp_u_35;
+static PyObject *__pyx_kp_u_36;
+static PyObject *__pyx_kp_u_37;
+static PyObject *__pyx_kp_u_38;
+static PyObject *__pyx_kp_u_39;
+static PyObject *__pyx_kp_s_4;
+static PyObject *__pyx_kp_u_4;
+static PyObject *__pyx_kp_u_40;
+static PyObject *__pyx_kp_u_41;
+static PyObject *__pyx_kp_u_42;
+static PyObject *__pyx_kp_u_43;
+static PyObject *__pyx_kp_u_44;
+static PyObject *__pyx_kp_u_45;
+static PyObject *__pyx_kp_u_46;
+static PyObject *__pyx_kp_u_47;
+static PyObject *__pyx_kp_u_48;
+static PyObject *__pyx_kp_u_49;
+static PyObject *__pyx_kp_s_5;
+static PyObject *__pyx_kp_u_50;
+static PyObject *__pyx_kp_u_51;
+static PyObject *__pyx_kp_u_52;
+static PyObject *__pyx_kp_u_53;
+static PyObject *__pyx_kp_u_54;
+static PyObject *__pyx_kp_u_55;
+static PyObject *__pyx_kp_u_56;
+static PyObject *__pyx_kp_u_57;
+static PyObject *__pyx_kp_u_58;
+static PyObject *__pyx_kp_u_59;
+static PyObject *__pyx_kp_s_6;
+static PyObject *__pyx_kp_u_60;
+static PyObject *__pyx_kp_u_61;
+static PyObject *__pyx_kp_u_62;
+static PyObject *__pyx_kp_u_63;
+static PyObject *__pyx_kp_u_64;
+static PyObject *__pyx_n_s_7;
+static PyObject *__pyx_n_s_8;
+static PyObject *__pyx_kp_s_9;
+static PyObject *__pyx_n_s__AMF3;
+static PyObject *__pyx_n_s__ArrayType;
+static PyObject *__pyx_n_s__BuiltinFunctionType;
+static PyObject *__pyx_n_s__BuiltinMethodType;
+static PyObject *__pyx_n_s__ByteArray;
+static PyObject *__pyx_n_s__ClassDefinition;
+static PyObject *__pyx_n_s__ClassType;
+static PyObject *__pyx_n_s__Context;
+static PyObject *__pyx_n_s__DataInput;
+static PyObject *__pyx_n_s__DataOutput;
+static PyObject *__pyx_n_s__DecodeError;
+static PyObject *__pyx_n_s__Decoder;
+static PyObject *__pyx_n_s__Dictionary;
+static PyObject *__pyx_n_s__ET;
+static PyObject *__pyx_n_s__EncodeError;
+static PyObject *__pyx_n_s__Encoder;
+static PyObject *__pyx_n_s__FunctionType;
+static PyObject *__pyx_n_s__GeneratorType;
+static PyObject *__pyx_n_s__IOError;
+static PyObject *__pyx_n_s__InstanceType;
+static PyObject *__pyx_n_s__IntVector;
+static PyObject *__pyx_n_s__KeyError;
+static PyObject *__pyx_n_s__LambdaType;
 static PyObject *__pyx_n_s__MemoryError;
+static PyObject *__pyx_n_s__MethodType;
+static PyObject *__pyx_n_s__MixedArray;
+static PyObject *__pyx_n_s__ModuleType;
+static PyObject *__pyx_n_s__NumberVector;
+static PyObject *__pyx_n_s__ObjectType;
+static PyObject *__pyx_n_s__ObjectVector;
 static PyObject *__pyx_n_s__OverflowError;
+static PyObject *__pyx_n_s__RawAMF;
+static PyObject *__pyx_n_s__ReferenceError;
 static PyObject *__pyx_n_s__RuntimeError;
+static PyObject *__pyx_n_s__StringTypes;
+static PyObject *__pyx_n_s__TypeType;
+static PyObject *__pyx_n_s__UintVector;
+static PyObject *__pyx_n_s__Undefined;
+static PyObject *__pyx_n_s__UndefinedType;
+static PyObject *__pyx_n_s__UnknownClassAlias;
+static PyObject *__pyx_n_s__VECTOR_TYPECODES;
+static PyObject *__pyx_n_s__ValueError;
+static PyObject *__pyx_n_s___NumericVector;
+static PyObject *__pyx_n_s____class__;
+static PyObject *__pyx_n_s____init__;
 static PyObject *__pyx_n_s____main__;
+static PyObject *__pyx_n_s____readamf__;
 static PyObject *__pyx_n_s____test__;
+static PyObject *__pyx_n_s____writeamf__;
+static PyObject *__pyx_n_s___decompress;
+static PyObject *__pyx_n_s___getClassDefinition;
+static PyObject *__pyx_n_s___get_alias_type;
+static PyObject *__pyx_n_s___pack_vector;
+static PyObject *__pyx_n_s___readArray;
+static PyObject *__pyx_n_s___readByteArray;
+static PyObject *__pyx_n_s___readDate;
+static PyObject *__pyx_n_s___readDictionary;
+static PyObject *__pyx_n_s___readElement;
+static PyObject *__pyx_n_s___readInteger;
+static PyObject *__pyx_n_s___readNumber;
+static PyObject *__pyx_n_s___readObject;
+static PyObject *__pyx_n_s___readObjectVector;
+static PyObject *__pyx_n_s___readString;
+static PyObject *__pyx_n_s___readTypedArray;
+static PyObject *__pyx_n_s___readVector;
+static PyObject *__pyx_n_s___readXML;
+static PyObject *__pyx_n_s___unpack_vector;
+static PyObject *__pyx_n_s___writeByteArray;
+static PyObject *__pyx_n_s___writeDate;
+static PyObject *__pyx_n_s___writeDict;
+static PyObject *__pyx_n_s___writeDictionary;
+static PyObject *__pyx_n_s___writeElement;
+static PyObject *__pyx_n_s___writeInteger;
+static PyObject *__pyx_n_s___writeList;
+static PyObject *__pyx_n_s___writeNumber;
+static PyObject *__pyx_n_s___writeObject;
+static PyObject *__pyx_n_s___writeObjectVector;
+static PyObject *__pyx_n_s___writeSealedObject;
+static PyObject *__pyx_n_s___writeString;
+static PyObject *__pyx_n_s___writeVector;
+static PyObject *__pyx_n_s___writeXML;
+static PyObject *__pyx_n_s__addClass;
+static PyObject *__pyx_n_s__addLegacyXML;
+static PyObject *__pyx_n_s__addObject;
+static PyObject *__pyx_n_s__addRawAMF;
+static PyObject *__pyx_n_s__addString;
+static PyObject *__pyx_n_s__alias;
+static PyObject *__pyx_n_s__amf3;
+static PyObject *__pyx_n_s__anonymous;
+static PyObject *__pyx_n_s__append;
+static PyObject *__pyx_n_s__applyAttributes;
+static PyObject *__pyx_n_s__array;
+static PyObject *__pyx_n_s__attr_len;
+static PyObject *__pyx_n_s__buffer;
+static PyObject *__pyx_n_s__chr;
+static PyObject *__pyx_n_s__classname;
+static PyObject *__pyx_n_s__codec;
+static PyObject *__pyx_n_s__compressed;
+static PyObject *__pyx_n_s__context;
+static PyObject *__pyx_n_s__createInstance;
+static PyObject *__pyx_n_s__d;
+static PyObject *__pyx_n_s__data;
+static PyObject *__pyx_n_s__date;
+static PyObject *__pyx_n_s__datetime;
 static PyObject *__pyx_n_s__decode_int;
+static PyObject *__pyx_n_s__defer;
+static PyObject *__pyx_n_s__encode_attrs;
 static PyObject *__pyx_n_s__encode_int;
+static PyObject *__pyx_n_s__encoding;
+static PyObject *__pyx_n_s__external;
+static PyObject *__pyx_n_s__fd;
+static PyObject *__pyx_n_s__fixed;
+static PyObject *__pyx_n_s__fromstring;
+static PyObject *__pyx_n_s__getByReference;
+static PyObject *__pyx_n_s__getClass;
+static PyObject *__pyx_n_s__getClassByReference;
+static PyObject *__pyx_n_s__getClassDefinition;
+static PyObject *__pyx_n_s__getEncodableValues;
+static PyObject *__pyx_n_s__getObject;
+static PyObject *__pyx_n_s__getObjectReference;
+static PyObject *__pyx_n_s__getProxyForObject;
+static PyObject *__pyx_n_s__getReferenceTo;
+static PyObject *__pyx_n_s__getString;
+static PyObject *__pyx_n_s__getStringReference;
+static PyObject *__pyx_n_s__getTypeFunc;
+static PyObject *__pyx_n_s__get_class_alias;
+static PyObject *__pyx_n_s__get_class_meta;
+static PyObject *__pyx_n_s__get_datetime;
+static PyObject *__pyx_n_s__get_decode_plan;
+static PyObject *__pyx_n_s__get_timestamp;
+static PyObject *__pyx_n_s__getattr;
+static PyObject *__pyx_n_s__index;
+static PyObject *__pyx_n_s__is_ET_element;
+static PyObject *__pyx_n_s__is_float_broken;
+static PyObject *__pyx_n_s__iteritems;
+static PyObject *__pyx_n_s__keys;
+static PyObject *__pyx_n_s__klass;
+static PyObject *__pyx_n_s__l;
+static PyObject *__pyx_n_s__length;
+static PyObject *__pyx_n_s__n;
+static PyObject *__pyx_n_s__obj;
+static PyObject *__pyx_n_s__objects;
+static PyObject *__pyx_n_s__ord;
+static PyObject *__pyx_n_s__plan;
+static PyObject *__pyx_n_s__pop;
+static PyObject *__pyx_n_s__pos;
+static PyObject *__pyx_n_s__pyamf;
+static PyObject *__pyx_n_s__raw;
+static PyObject *__pyx_n_s__readArray;
+static PyObject *__pyx_n_s__readBoolFalse;
+static PyObject *__pyx_n_s__readBoolTrue;
+static PyObject *__pyx_n_s__readByteArray;
+static PyObject *__pyx_n_s__readDate;
+static PyObject *__pyx_n_s__readDictionary;
+static PyObject *__pyx_n_s__readIntVector;
+static PyObject *__pyx_n_s__readInteger;
+static PyObject *__pyx_n_s__readNull;
+static PyObject *__pyx_n_s__readNumber;
+static PyObject *__pyx_n_s__readNumberVector;
+static PyObject *__pyx_n_s__readObject;
+static PyObject *__pyx_n_s__readObjectVector;
+static PyObject *__pyx_n_s__readProxy;
+static PyObject *__pyx_n_s__readSignedInteger;
+static PyObject *__pyx_n_s__readString;
+static PyObject *__pyx_n_s__readUintVector;
+static PyObject *__pyx_n_s__readUndefined;
+static PyObject *__pyx_n_s__readUnsignedInteger;
+static PyObject *__pyx_n_s__readXML;
+static PyObject *__pyx_n_s__readXMLString;
+static PyObject *__pyx_n_s__read_double;
 static PyObject *__pyx_n_s__read_uchar;
+static PyObject *__pyx_n_s__read_view;
+static PyObject *__pyx_n_s__reference;
+static PyObject *__pyx_n_s__remaining;
+static PyObject *__pyx_n_s__seek;
 static PyObject *__pyx_n_s__sign;
+static PyObject *__pyx_n_s__sort;
+static PyObject *__pyx_n_s__static_attrs;
+static PyObject *__pyx_n_s__static_properties;
 static PyObject *__pyx_n_s__stream;
-static PyObject *__pyx_k_2;
+static PyObject *__pyx_n_s__strict;
+static PyObject *__pyx_n_s__string_references;
+static PyObject *__pyx_n_s__strings;
+static PyObject *__pyx_n_s__tell;
+static PyObject *__pyx_n_s__time;
+static PyObject *__pyx_n_s__timezone_offset;
+static PyObject *__pyx_n_s__tolist;
+static PyObject *__pyx_n_s__tostring;
+static PyObject *__pyx_n_s__typecode;
+static PyObject *__pyx_n_s__typed_arrays;
+static PyObject *__pyx_n_s__types;
+static PyObject *__pyx_n_s__unicode_;
+static PyObject *__pyx_n_s__use_proxies;
+static PyObject *__pyx_n_s__use_proxies_default;
+static PyObject *__pyx_n_s__util;
+static PyObject *__pyx_n_s__weak_keys;
+static PyObject *__pyx_n_s__write;
+static PyObject *__pyx_n_s__writeBoolean;
+static PyObject *__pyx_n_s__writeByteArray;
+static PyObject *__pyx_n_s__writeClass;
+static PyObject *__pyx_n_s__writeDate;
+static PyObject *__pyx_n_s__writeDict;
+static PyObject *__pyx_n_s__writeDictionary;
+static PyObject *__pyx_n_s__writeElement;
+static PyObject *__pyx_n_s__writeFunc;
+static PyObject *__pyx_n_s__writeInstance;
+static PyObject *__pyx_n_s__writeInteger;
+static PyObject *__pyx_n_s__writeList;
+static PyObject *__pyx_n_s__writeNull;
+static PyObject *__pyx_n_s__writeNumber;
+static PyObject *__pyx_n_s__writeObject;
+static PyObject *__pyx_n_s__writeObjectVector;
+static PyObject *__pyx_n_s__writeProxy;
+static PyObject *__pyx_n_s__writeRawAMF;
+static PyObject *__pyx_n_s__writeString;
+static PyObject *__pyx_n_s__writeType;
+static PyObject *__pyx_n_s__writeUndefined;
+static PyObject *__pyx_n_s__writeVector;
+static PyObject *__pyx_n_s__writeXML;
+static PyObject *__pyx_n_s__write_double;
+static PyObject *__pyx_n_s__write_uchar;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_int_5;
+static PyObject *__pyx_int_6;
+static PyObject *__pyx_int_7;
+static PyObject *__pyx_int_8;
+static PyObject *__pyx_int_9;
+static PyObject *__pyx_int_10;
+static PyObject *__pyx_int_11;
+static PyObject *__pyx_int_12;
+static PyObject *__pyx_int_13;
+static PyObject *__pyx_int_14;
+static PyObject *__pyx_int_15;
+static PyObject *__pyx_int_16;
+static PyObject *__pyx_int_17;
+static PyObject *__pyx_int_268435455;
+static PyObject *__pyx_int_neg_268435456;
+static PyObject *__pyx_k_10;
+static PyObject *__pyx_k_18;
+static PyObject *__pyx_k_19;
+static PyObject *__pyx_k_20;
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":21
+/* "/root/package/cpyamf/amf3.pyx":115
  * 
  * 
- * cdef Py_ssize_t _encode_int(long i, char **buf) except? -1:             # <<<<<<<<<<<<<<
- *     # Use typecasting to get the twos complement representation of i
- *     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]
+ * cdef int _init_module() except -1:             # <<<<<<<<<<<<<<
+ *     global amf3, Context, get_decode_plan, float_broken
+ *     global NumericVector, ObjectVector, Dictionary
  */
 
-static  Py_ssize_t __pyx_f_6cpyamf_4amf3__encode_int(long __pyx_v_i, char **__pyx_v_buf) {
-  unsigned long __pyx_v_n;
-  Py_ssize_t __pyx_v_size;
-  unsigned long __pyx_v_real_value;
-  char __pyx_v_changed;
-  unsigned char __pyx_v_count;
-  char *__pyx_v_bytes;
-  Py_ssize_t __pyx_r;
+static  int __pyx_f_6cpyamf_4amf3__init_module(void) {
+  PyObject *__pyx_v_mod;
+  int __pyx_r;
   int __pyx_t_1;
-  __Pyx_RefNannySetupContext("_encode_int");
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("_init_module");
+  __pyx_v_mod = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":23
- * cdef Py_ssize_t _encode_int(long i, char **buf) except? -1:
- *     # Use typecasting to get the twos complement representation of i
- *     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":119
+ *     global NumericVector, ObjectVector, Dictionary
  * 
- *     cdef Py_ssize_t size = 0
- */
-  __pyx_v_n = (((unsigned long *)((void *)(&__pyx_v_i)))[0]);
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":25
- *     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]
+ *     if amf3 is not None:             # <<<<<<<<<<<<<<
+ *         return 0
  * 
- *     cdef Py_ssize_t size = 0             # <<<<<<<<<<<<<<
- *     cdef unsigned long real_value = n
- *     cdef char changed = 0
  */
-  __pyx_v_size = 0;
+  __pyx_t_1 = (__pyx_v_6cpyamf_4amf3_amf3 != Py_None);
+  if (__pyx_t_1) {
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":26
+    /* "/root/package/cpyamf/amf3.pyx":120
  * 
- *     cdef Py_ssize_t size = 0
- *     cdef unsigned long real_value = n             # <<<<<<<<<<<<<<
- *     cdef char changed = 0
- *     cdef unsigned char count = 0
- */
-  __pyx_v_real_value = __pyx_v_n;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":27
- *     cdef Py_ssize_t size = 0
- *     cdef unsigned long real_value = n
- *     cdef char changed = 0             # <<<<<<<<<<<<<<
- *     cdef unsigned char count = 0
- *     cdef char *bytes = NULL
- */
-  __pyx_v_changed = 0;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":28
- *     cdef unsigned long real_value = n
- *     cdef char changed = 0
- *     cdef unsigned char count = 0             # <<<<<<<<<<<<<<
- *     cdef char *bytes = NULL
+ *     if amf3 is not None:
+ *         return 0             # <<<<<<<<<<<<<<
  * 
+ *     from pyamf import amf3 as mod
  */
-  __pyx_v_count = 0;
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":29
- *     cdef char changed = 0
- *     cdef unsigned char count = 0
- *     cdef char *bytes = NULL             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":122
+ *         return 0
  * 
- *     if n > 0x1fffff:
+ *     from pyamf import amf3 as mod             # <<<<<<<<<<<<<<
+ * 
+ *     amf3 = mod
  */
-  __pyx_v_bytes = NULL;
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__amf3));
+  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__amf3));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__amf3));
+  __pyx_t_3 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__amf3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_v_mod);
+  __pyx_v_mod = __pyx_t_2;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":31
- *     cdef char *bytes = NULL
+  /* "/root/package/cpyamf/amf3.pyx":124
+ *     from pyamf import amf3 as mod
  * 
- *     if n > 0x1fffff:             # <<<<<<<<<<<<<<
- *         size = 4
- *         bytes = <char *>PyMem_Malloc(size)
+ *     amf3 = mod             # <<<<<<<<<<<<<<
+ *     Context = mod.Context
+ *     get_decode_plan = mod.get_decode_plan
  */
-  __pyx_t_1 = (__pyx_v_n > 0x1fffff);
-  if (__pyx_t_1) {
+  __Pyx_INCREF(__pyx_v_mod);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_amf3);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_amf3);
+  __Pyx_GIVEREF(__pyx_v_mod);
+  __pyx_v_6cpyamf_4amf3_amf3 = __pyx_v_mod;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":32
+  /* "/root/package/cpyamf/amf3.pyx":125
  * 
- *     if n > 0x1fffff:
- *         size = 4             # <<<<<<<<<<<<<<
- *         bytes = <char *>PyMem_Malloc(size)
- *         changed = 1
+ *     amf3 = mod
+ *     Context = mod.Context             # <<<<<<<<<<<<<<
+ *     get_decode_plan = mod.get_decode_plan
+ *     NumericVector = mod._NumericVector
  */
-    __pyx_v_size = 4;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s__Context); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_Context);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_Context);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_v_6cpyamf_4amf3_Context = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":33
- *     if n > 0x1fffff:
- *         size = 4
- *         bytes = <char *>PyMem_Malloc(size)             # <<<<<<<<<<<<<<
- *         changed = 1
- *         n = n >> 1
+  /* "/root/package/cpyamf/amf3.pyx":126
+ *     amf3 = mod
+ *     Context = mod.Context
+ *     get_decode_plan = mod.get_decode_plan             # <<<<<<<<<<<<<<
+ *     NumericVector = mod._NumericVector
+ *     ObjectVector = mod.ObjectVector
  */
-    __pyx_v_bytes = ((char *)PyMem_Malloc(__pyx_v_size));
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s__get_decode_plan); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_get_decode_plan);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_get_decode_plan);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_v_6cpyamf_4amf3_get_decode_plan = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":34
- *         size = 4
- *         bytes = <char *>PyMem_Malloc(size)
- *         changed = 1             # <<<<<<<<<<<<<<
- *         n = n >> 1
- *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
+  /* "/root/package/cpyamf/amf3.pyx":127
+ *     Context = mod.Context
+ *     get_decode_plan = mod.get_decode_plan
+ *     NumericVector = mod._NumericVector             # <<<<<<<<<<<<<<
+ *     ObjectVector = mod.ObjectVector
+ *     Dictionary = mod.Dictionary
  */
-    __pyx_v_changed = 1;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s___NumericVector); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_NumericVector);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_NumericVector);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_v_6cpyamf_4amf3_NumericVector = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":35
- *         bytes = <char *>PyMem_Malloc(size)
- *         changed = 1
- *         n = n >> 1             # <<<<<<<<<<<<<<
- *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
- *         count += 1
+  /* "/root/package/cpyamf/amf3.pyx":128
+ *     get_decode_plan = mod.get_decode_plan
+ *     NumericVector = mod._NumericVector
+ *     ObjectVector = mod.ObjectVector             # <<<<<<<<<<<<<<
+ *     Dictionary = mod.Dictionary
+ *     float_broken = util.is_float_broken()
  */
-    __pyx_v_n = (__pyx_v_n >> 1);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s__ObjectVector); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_ObjectVector);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_ObjectVector);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_v_6cpyamf_4amf3_ObjectVector = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":36
- *         changed = 1
- *         n = n >> 1
- *         bytes[count] = 0x80 | ((n >> 21) & 0xff)             # <<<<<<<<<<<<<<
- *         count += 1
+  /* "/root/package/cpyamf/amf3.pyx":129
+ *     NumericVector = mod._NumericVector
+ *     ObjectVector = mod.ObjectVector
+ *     Dictionary = mod.Dictionary             # <<<<<<<<<<<<<<
+ *     float_broken = util.is_float_broken()
  * 
  */
-    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 21) & 0xff));
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_mod, __pyx_n_s__Dictionary); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_Dictionary);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_Dictionary);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_v_6cpyamf_4amf3_Dictionary = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":37
- *         n = n >> 1
- *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
- *         count += 1             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":130
+ *     ObjectVector = mod.ObjectVector
+ *     Dictionary = mod.Dictionary
+ *     float_broken = util.is_float_broken()             # <<<<<<<<<<<<<<
  * 
- *     if n > 0x3fff:
+ *     return 0
  */
-    __pyx_v_count += 1;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__is_float_broken); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_6cpyamf_4amf3_float_broken = __pyx_t_1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":39
- *         count += 1
+  /* "/root/package/cpyamf/amf3.pyx":132
+ *     float_broken = util.is_float_broken()
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
  * 
- *     if n > 0x3fff:             # <<<<<<<<<<<<<<
- *         if size == 0:
- *             size = 3
  */
-  __pyx_t_1 = (__pyx_v_n > 0x3fff);
-  if (__pyx_t_1) {
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3._init_module");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_mod);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":40
+/* "/root/package/cpyamf/amf3.pyx":138
+ * # directly, any other context class goes through its public methods.
  * 
- *     if n > 0x3fff:
- *         if size == 0:             # <<<<<<<<<<<<<<
- *             size = 3
- *             bytes = <char *>PyMem_Malloc(size)
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
  */
-    __pyx_t_1 = (__pyx_v_size == 0);
-    if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":41
- *     if n > 0x3fff:
- *         if size == 0:
- *             size = 3             # <<<<<<<<<<<<<<
- *             bytes = <char *>PyMem_Malloc(size)
- * 
- */
-      __pyx_v_size = 3;
+static  Py_ssize_t __pyx_f_6cpyamf_4amf3__get_object_reference(PyObject *__pyx_v_context, PyObject *__pyx_v_obj) {
+  PyObject *__pyx_v_ref;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_get_object_reference");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_v_ref = Py_None; __Pyx_INCREF(Py_None);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":42
- *         if size == 0:
- *             size = 3
- *             bytes = <char *>PyMem_Malloc(size)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":139
+ * 
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
  * 
- *         bytes[count] = 0x80 | ((n >> 14) & 0xff)
  */
-      __pyx_v_bytes = ((char *)PyMem_Malloc(__pyx_v_size));
-      goto __pyx_L5;
-    }
-    __pyx_L5:;
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
+  if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":44
- *             bytes = <char *>PyMem_Malloc(size)
- * 
- *         bytes[count] = 0x80 | ((n >> 14) & 0xff)             # <<<<<<<<<<<<<<
- *         count += 1
+    /* "/root/package/cpyamf/amf3.pyx":140
+ * cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)             # <<<<<<<<<<<<<<
  * 
+ *     ref = context.getObjectReference(obj)
  */
-    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 14) & 0xff));
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getReferenceTo(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":45
+  /* "/root/package/cpyamf/amf3.pyx":142
+ *         return (<cIndexedCollection>context.objects).getReferenceTo(obj)
  * 
- *         bytes[count] = 0x80 | ((n >> 14) & 0xff)
- *         count += 1             # <<<<<<<<<<<<<<
+ *     ref = context.getObjectReference(obj)             # <<<<<<<<<<<<<<
  * 
- *     if n > 0x7f:
+ *     if ref is None:
  */
-    __pyx_v_count += 1;
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getObjectReference); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_obj);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+  __Pyx_GIVEREF(__pyx_v_obj);
+  __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_ref);
+  __pyx_v_ref = __pyx_t_5;
+  __pyx_t_5 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":47
- *         count += 1
+  /* "/root/package/cpyamf/amf3.pyx":144
+ *     ref = context.getObjectReference(obj)
+ * 
+ *     if ref is None:             # <<<<<<<<<<<<<<
+ *         return -1
  * 
- *     if n > 0x7f:             # <<<<<<<<<<<<<<
- *         if size == 0:
- *             size = 2
  */
-  __pyx_t_1 = (__pyx_v_n > 0x7f);
+  __pyx_t_1 = (__pyx_v_ref == Py_None);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":48
+    /* "/root/package/cpyamf/amf3.pyx":145
  * 
- *     if n > 0x7f:
- *         if size == 0:             # <<<<<<<<<<<<<<
- *             size = 2
- *             bytes = <char *>PyMem_Malloc(size)
- */
-    __pyx_t_1 = (__pyx_v_size == 0);
-    if (__pyx_t_1) {
-
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":49
- *     if n > 0x7f:
- *         if size == 0:
- *             size = 2             # <<<<<<<<<<<<<<
- *             bytes = <char *>PyMem_Malloc(size)
+ *     if ref is None:
+ *         return -1             # <<<<<<<<<<<<<<
  * 
+ *     return ref
  */
-      __pyx_v_size = 2;
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":50
- *         if size == 0:
- *             size = 2
- *             bytes = <char *>PyMem_Malloc(size)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":147
+ *         return -1
  * 
- *         bytes[count] = 0x80 | ((n >> 7) & 0xff)
- */
-      __pyx_v_bytes = ((char *)PyMem_Malloc(__pyx_v_size));
-      goto __pyx_L7;
-    }
-    __pyx_L7:;
-
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":52
- *             bytes = <char *>PyMem_Malloc(size)
+ *     return ref             # <<<<<<<<<<<<<<
  * 
- *         bytes[count] = 0x80 | ((n >> 7) & 0xff)             # <<<<<<<<<<<<<<
- *         count += 1
  * 
  */
-    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 7) & 0xff));
+  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_ref); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._get_object_reference");
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ref);
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":53
+/* "/root/package/cpyamf/amf3.pyx":150
  * 
- *         bytes[count] = 0x80 | ((n >> 7) & 0xff)
- *         count += 1             # <<<<<<<<<<<<<<
  * 
- *     if changed == 1:
+ * cdef object _get_object(object context, Py_ssize_t ref):             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
  */
-    __pyx_v_count += 1;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":55
- *         count += 1
+static  PyObject *__pyx_f_6cpyamf_4amf3__get_object(PyObject *__pyx_v_context, Py_ssize_t __pyx_v_ref) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("_get_object");
+  __Pyx_INCREF(__pyx_v_context);
+
+  /* "/root/package/cpyamf/amf3.pyx":151
  * 
- *     if changed == 1:             # <<<<<<<<<<<<<<
- *         n = real_value
+ * cdef object _get_object(object context, Py_ssize_t ref):
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
  * 
  */
-  __pyx_t_1 = (__pyx_v_changed == 1);
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":56
- * 
- *     if changed == 1:
- *         n = real_value             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/amf3.pyx":152
+ * cdef object _get_object(object context, Py_ssize_t ref):
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)             # <<<<<<<<<<<<<<
  * 
- *     if size == 0:
+ *     return context.getObject(ref)
  */
-    __pyx_v_n = __pyx_v_real_value;
-    goto __pyx_L8;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_ref); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
   }
-  __pyx_L8:;
+  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":58
- *         n = real_value
- * 
- *     if size == 0:             # <<<<<<<<<<<<<<
- *         size = 1
+  /* "/root/package/cpyamf/amf3.pyx":154
+ *         return (<cIndexedCollection>context.objects).getByReference(ref)
  * 
- */
-  __pyx_t_1 = (__pyx_v_size == 0);
-  if (__pyx_t_1) {
-
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":59
+ *     return context.getObject(ref)             # <<<<<<<<<<<<<<
  * 
- *     if size == 0:
- *         size = 1             # <<<<<<<<<<<<<<
  * 
- *         bytes = <char *>PyMem_Malloc(size)
  */
-    __pyx_v_size = 1;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getObject); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ref); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3._get_object");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":61
- *         size = 1
+/* "/root/package/cpyamf/amf3.pyx":157
  * 
- *         bytes = <char *>PyMem_Malloc(size)             # <<<<<<<<<<<<<<
  * 
- *     if n > 0x1fffff:
+ * cdef int _add_object(object context, object obj) except -1:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.objects).append(obj)
  */
-    __pyx_v_bytes = ((char *)PyMem_Malloc(__pyx_v_size));
-    goto __pyx_L9;
-  }
-  __pyx_L9:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":63
- *         bytes = <char *>PyMem_Malloc(size)
+static  int __pyx_f_6cpyamf_4amf3__add_object(PyObject *__pyx_v_context, PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_add_object");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_obj);
+
+  /* "/root/package/cpyamf/amf3.pyx":158
  * 
- *     if n > 0x1fffff:             # <<<<<<<<<<<<<<
- *         bytes[count] = n & 0xff
+ * cdef int _add_object(object context, object obj) except -1:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         (<cIndexedCollection>context.objects).append(obj)
  *     else:
  */
-  __pyx_t_1 = (__pyx_v_n > 0x1fffff);
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":64
- * 
- *     if n > 0x1fffff:
- *         bytes[count] = n & 0xff             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/amf3.pyx":159
+ * cdef int _add_object(object context, object obj) except -1:
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.objects).append(obj)             # <<<<<<<<<<<<<<
  *     else:
- *         bytes[count] = n & 0x7f
+ *         context.addObject(obj)
  */
-    (__pyx_v_bytes[__pyx_v_count]) = (__pyx_v_n & 0xff);
-    goto __pyx_L10;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__objects); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->append(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L3;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":66
- *         bytes[count] = n & 0xff
+    /* "/root/package/cpyamf/amf3.pyx":161
+ *         (<cIndexedCollection>context.objects).append(obj)
  *     else:
- *         bytes[count] = n & 0x7f             # <<<<<<<<<<<<<<
+ *         context.addObject(obj)             # <<<<<<<<<<<<<<
  * 
- *     buf[0] = bytes
+ *     return 0
  */
-    (__pyx_v_bytes[__pyx_v_count]) = (__pyx_v_n & 0x7f);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__addObject); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
-  __pyx_L10:;
+  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":68
- *         bytes[count] = n & 0x7f
- * 
- *     buf[0] = bytes             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":163
+ *         context.addObject(obj)
  * 
- *     return size
- */
-  (__pyx_v_buf[0]) = __pyx_v_bytes;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":70
- *     buf[0] = bytes
+ *     return 0             # <<<<<<<<<<<<<<
  * 
- *     return size             # <<<<<<<<<<<<<<
  * 
- * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
  */
-  __pyx_r = __pyx_v_size;
+  __pyx_r = 0;
   goto __pyx_L0;
 
   __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._add_object");
+  __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_obj);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":72
- *     return size
+/* "/root/package/cpyamf/amf3.pyx":166
  * 
- * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:             # <<<<<<<<<<<<<<
- *     cdef int n = 0
- *     cdef long result = 0
+ * 
+ * cdef Py_ssize_t _get_string_reference(object context, object s) except -2:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.strings).getReferenceTo(s)
  */
 
-static  int __pyx_f_6cpyamf_4amf3__decode_int(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream, long *__pyx_v_ret, struct __pyx_opt_args_6cpyamf_4amf3__decode_int *__pyx_optional_args) {
-  int __pyx_v_sign = ((int)0);
-  int __pyx_v_n;
-  long __pyx_v_result;
-  unsigned char __pyx_v_b;
-  int __pyx_r;
+static  Py_ssize_t __pyx_f_6cpyamf_4amf3__get_string_reference(PyObject *__pyx_v_context, PyObject *__pyx_v_s) {
+  PyObject *__pyx_v_ref;
+  Py_ssize_t __pyx_r;
   int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  __Pyx_RefNannySetupContext("_decode_int");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_sign = __pyx_optional_args->sign;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_stream);
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_get_string_reference");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_s);
+  __pyx_v_ref = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":73
+  /* "/root/package/cpyamf/amf3.pyx":167
+ * 
+ * cdef Py_ssize_t _get_string_reference(object context, object s) except -2:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.strings).getReferenceTo(s)
  * 
- * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
- *     cdef int n = 0             # <<<<<<<<<<<<<<
- *     cdef long result = 0
- *     cdef unsigned char b
  */
-  __pyx_v_n = 0;
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
+  if (__pyx_t_1) {
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":74
- * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
- *     cdef int n = 0
- *     cdef long result = 0             # <<<<<<<<<<<<<<
- *     cdef unsigned char b
+    /* "/root/package/cpyamf/amf3.pyx":168
+ * cdef Py_ssize_t _get_string_reference(object context, object s) except -2:
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.strings).getReferenceTo(s)             # <<<<<<<<<<<<<<
  * 
+ *     ref = context.getStringReference(s)
  */
-  __pyx_v_result = 0;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__strings); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getReferenceTo(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_s); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":77
- *     cdef unsigned char b
+  /* "/root/package/cpyamf/amf3.pyx":170
+ *         return (<cIndexedCollection>context.strings).getReferenceTo(s)
  * 
- *     if stream.read_uchar(&b) == -1:             # <<<<<<<<<<<<<<
+ *     ref = context.getStringReference(s)             # <<<<<<<<<<<<<<
+ * 
+ *     if ref is None:
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getStringReference); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_s);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_s);
+  __Pyx_GIVEREF(__pyx_v_s);
+  __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_ref);
+  __pyx_v_ref = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":172
+ *     ref = context.getStringReference(s)
+ * 
+ *     if ref is None:             # <<<<<<<<<<<<<<
  *         return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream->__pyx_vtab)->read_uchar(__pyx_v_stream, (&__pyx_v_b)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = (__pyx_t_1 == -1);
-  if (__pyx_t_2) {
+  __pyx_t_1 = (__pyx_v_ref == Py_None);
+  if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":78
+    /* "/root/package/cpyamf/amf3.pyx":173
  * 
- *     if stream.read_uchar(&b) == -1:
+ *     if ref is None:
  *         return -1             # <<<<<<<<<<<<<<
  * 
- *     while b & 0x80 != 0 and n < 3:
+ *     return ref
  */
     __pyx_r = -1;
     goto __pyx_L0;
-    goto __pyx_L3;
+    goto __pyx_L4;
   }
-  __pyx_L3:;
+  __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":80
+  /* "/root/package/cpyamf/amf3.pyx":175
  *         return -1
  * 
- *     while b & 0x80 != 0 and n < 3:             # <<<<<<<<<<<<<<
- *         result <<= 7
- *         result |= b & 0x7f
+ *     return ref             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-  while (1) {
-    __pyx_t_2 = ((__pyx_v_b & 0x80) != 0);
-    if (__pyx_t_2) {
-      __pyx_t_3 = (__pyx_v_n < 3);
-      __pyx_t_4 = __pyx_t_3;
-    } else {
-      __pyx_t_4 = __pyx_t_2;
-    }
-    if (!__pyx_t_4) break;
+  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_ref); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._get_string_reference");
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ref);
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_s);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":81
+/* "/root/package/cpyamf/amf3.pyx":178
  * 
- *     while b & 0x80 != 0 and n < 3:
- *         result <<= 7             # <<<<<<<<<<<<<<
- *         result |= b & 0x7f
  * 
+ * cdef object _get_string(object context, Py_ssize_t ref):             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.strings).getByReference(ref)
  */
-    __pyx_v_result <<= 7;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":82
- *     while b & 0x80 != 0 and n < 3:
- *         result <<= 7
- *         result |= b & 0x7f             # <<<<<<<<<<<<<<
- * 
- *         if stream.read_uchar(&b) == -1:
- */
-    __pyx_v_result |= (__pyx_v_b & 0x7f);
+static  PyObject *__pyx_f_6cpyamf_4amf3__get_string(PyObject *__pyx_v_context, Py_ssize_t __pyx_v_ref) {
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("_get_string");
+  __Pyx_INCREF(__pyx_v_context);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":84
- *         result |= b & 0x7f
+  /* "/root/package/cpyamf/amf3.pyx":179
  * 
- *         if stream.read_uchar(&b) == -1:             # <<<<<<<<<<<<<<
- *             return -1
+ * cdef object _get_string(object context, Py_ssize_t ref):
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         return (<cIndexedCollection>context.strings).getByReference(ref)
  * 
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream->__pyx_vtab)->read_uchar(__pyx_v_stream, (&__pyx_v_b)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_4 = (__pyx_t_1 == -1);
-    if (__pyx_t_4) {
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
+  if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":85
- * 
- *         if stream.read_uchar(&b) == -1:
- *             return -1             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/amf3.pyx":180
+ * cdef object _get_string(object context, Py_ssize_t ref):
+ *     if type(context) is Context:
+ *         return (<cIndexedCollection>context.strings).getByReference(ref)             # <<<<<<<<<<<<<<
  * 
- *         n += 1
+ *     return context.getString(ref)
  */
-      __pyx_r = -1;
-      goto __pyx_L0;
-      goto __pyx_L6;
-    }
-    __pyx_L6:;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__strings); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_ref); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":87
- *             return -1
+  /* "/root/package/cpyamf/amf3.pyx":182
+ *         return (<cIndexedCollection>context.strings).getByReference(ref)
+ * 
+ *     return context.getString(ref)             # <<<<<<<<<<<<<<
  * 
- *         n += 1             # <<<<<<<<<<<<<<
  * 
- *     if n < 3:
  */
-    __pyx_v_n += 1;
-  }
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__getString); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ref); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":89
- *         n += 1
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3._get_string");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":185
  * 
- *     if n < 3:             # <<<<<<<<<<<<<<
- *         result <<= 7
- *         result |= b
+ * 
+ * cdef int _add_string(object context, object s) except -1:             # <<<<<<<<<<<<<<
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.strings).append(s)
  */
-  __pyx_t_4 = (__pyx_v_n < 3);
-  if (__pyx_t_4) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":90
+static  int __pyx_f_6cpyamf_4amf3__add_string(PyObject *__pyx_v_context, PyObject *__pyx_v_s) {
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_add_string");
+  __Pyx_INCREF(__pyx_v_context);
+  __Pyx_INCREF(__pyx_v_s);
+
+  /* "/root/package/cpyamf/amf3.pyx":186
  * 
- *     if n < 3:
- *         result <<= 7             # <<<<<<<<<<<<<<
- *         result |= b
+ * cdef int _add_string(object context, object s) except -1:
+ *     if type(context) is Context:             # <<<<<<<<<<<<<<
+ *         (<cIndexedCollection>context.strings).append(s)
  *     else:
  */
-    __pyx_v_result <<= 7;
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_context)) == __pyx_v_6cpyamf_4amf3_Context);
+  if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":91
- *     if n < 3:
- *         result <<= 7
- *         result |= b             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/amf3.pyx":187
+ * cdef int _add_string(object context, object s) except -1:
+ *     if type(context) is Context:
+ *         (<cIndexedCollection>context.strings).append(s)             # <<<<<<<<<<<<<<
  *     else:
- *         result <<= 8
+ *         context.addString(s)
  */
-    __pyx_v_result |= __pyx_v_b;
-    goto __pyx_L7;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__strings); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2)->__pyx_vtab)->append(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_2), __pyx_v_s); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L3;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":93
- *         result |= b
+    /* "/root/package/cpyamf/amf3.pyx":189
+ *         (<cIndexedCollection>context.strings).append(s)
  *     else:
- *         result <<= 8             # <<<<<<<<<<<<<<
- *         result |= b
+ *         context.addString(s)             # <<<<<<<<<<<<<<
  * 
+ *     return 0
  */
-    __pyx_v_result <<= 8;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_context, __pyx_n_s__addString); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_s);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_s);
+    __Pyx_GIVEREF(__pyx_v_s);
+    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_L3:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":94
- *     else:
- *         result <<= 8
- *         result |= b             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":191
+ *         context.addString(s)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
  * 
- *         if result & 0x10000000 != 0:
  */
-    __pyx_v_result |= __pyx_v_b;
+  __pyx_r = 0;
+  goto __pyx_L0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":96
- *         result |= b
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._add_string");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_context);
+  __Pyx_DECREF(__pyx_v_s);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":194
  * 
- *         if result & 0x10000000 != 0:             # <<<<<<<<<<<<<<
- *             if sign == 1:
- *                 result -= 0x20000000
+ * 
+ * cdef Py_ssize_t _encode_int(long i, char *bytes) except -1:             # <<<<<<<<<<<<<<
+ *     """
+ *     Encodes C{i} as a variable length 29-bit integer into C{bytes}, which
  */
-    __pyx_t_4 = ((__pyx_v_result & 0x10000000) != 0);
-    if (__pyx_t_4) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":97
+static  Py_ssize_t __pyx_f_6cpyamf_4amf3__encode_int(long __pyx_v_i, char *__pyx_v_bytes) {
+  unsigned long __pyx_v_n;
+  unsigned long __pyx_v_real_value;
+  char __pyx_v_changed;
+  Py_ssize_t __pyx_v_count;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_encode_int");
+
+  /* "/root/package/cpyamf/amf3.pyx":200
+ *     """
+ *     # Use typecasting to get the twos complement representation of i
+ *     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long real_value = n
+ */
+  __pyx_v_n = (((unsigned long *)((void *)(&__pyx_v_i)))[0]);
+
+  /* "/root/package/cpyamf/amf3.pyx":202
+ *     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]
  * 
- *         if result & 0x10000000 != 0:
- *             if sign == 1:             # <<<<<<<<<<<<<<
- *                 result -= 0x20000000
- *             else:
+ *     cdef unsigned long real_value = n             # <<<<<<<<<<<<<<
+ *     cdef char changed = 0
+ *     cdef Py_ssize_t count = 0
  */
-      __pyx_t_4 = (__pyx_v_sign == 1);
-      if (__pyx_t_4) {
+  __pyx_v_real_value = __pyx_v_n;
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":98
- *         if result & 0x10000000 != 0:
- *             if sign == 1:
- *                 result -= 0x20000000             # <<<<<<<<<<<<<<
- *             else:
- *                 result <<= 1
+  /* "/root/package/cpyamf/amf3.pyx":203
+ * 
+ *     cdef unsigned long real_value = n
+ *     cdef char changed = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t count = 0
+ * 
  */
-        __pyx_v_result -= 0x20000000;
-        goto __pyx_L9;
-      }
-      /*else*/ {
+  __pyx_v_changed = 0;
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":100
- *                 result -= 0x20000000
- *             else:
- *                 result <<= 1             # <<<<<<<<<<<<<<
- *                 result += 1
+  /* "/root/package/cpyamf/amf3.pyx":204
+ *     cdef unsigned long real_value = n
+ *     cdef char changed = 0
+ *     cdef Py_ssize_t count = 0             # <<<<<<<<<<<<<<
  * 
+ *     if n > 0x1fffff:
  */
-        __pyx_v_result <<= 1;
+  __pyx_v_count = 0;
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":101
- *             else:
- *                 result <<= 1
- *                 result += 1             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/amf3.pyx":206
+ *     cdef Py_ssize_t count = 0
  * 
- *     ret[0] = result
+ *     if n > 0x1fffff:             # <<<<<<<<<<<<<<
+ *         changed = 1
+ *         n = n >> 1
  */
-        __pyx_v_result += 1;
-      }
-      __pyx_L9:;
-      goto __pyx_L8;
-    }
-    __pyx_L8:;
+  __pyx_t_1 = (__pyx_v_n > 0x1fffff);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":207
+ * 
+ *     if n > 0x1fffff:
+ *         changed = 1             # <<<<<<<<<<<<<<
+ *         n = n >> 1
+ *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
+ */
+    __pyx_v_changed = 1;
+
+    /* "/root/package/cpyamf/amf3.pyx":208
+ *     if n > 0x1fffff:
+ *         changed = 1
+ *         n = n >> 1             # <<<<<<<<<<<<<<
+ *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
+ *         count += 1
+ */
+    __pyx_v_n = (__pyx_v_n >> 1);
+
+    /* "/root/package/cpyamf/amf3.pyx":209
+ *         changed = 1
+ *         n = n >> 1
+ *         bytes[count] = 0x80 | ((n >> 21) & 0xff)             # <<<<<<<<<<<<<<
+ *         count += 1
+ * 
+ */
+    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 21) & 0xff));
+
+    /* "/root/package/cpyamf/amf3.pyx":210
+ *         n = n >> 1
+ *         bytes[count] = 0x80 | ((n >> 21) & 0xff)
+ *         count += 1             # <<<<<<<<<<<<<<
+ * 
+ *     if n > 0x3fff:
+ */
+    __pyx_v_count += 1;
+    goto __pyx_L3;
   }
-  __pyx_L7:;
+  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":103
- *                 result += 1
+  /* "/root/package/cpyamf/amf3.pyx":212
+ *         count += 1
  * 
- *     ret[0] = result             # <<<<<<<<<<<<<<
+ *     if n > 0x3fff:             # <<<<<<<<<<<<<<
+ *         bytes[count] = 0x80 | ((n >> 14) & 0xff)
+ *         count += 1
+ */
+  __pyx_t_1 = (__pyx_v_n > 0x3fff);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":213
+ * 
+ *     if n > 0x3fff:
+ *         bytes[count] = 0x80 | ((n >> 14) & 0xff)             # <<<<<<<<<<<<<<
+ *         count += 1
  * 
- *     return 0
  */
-  (__pyx_v_ret[0]) = __pyx_v_result;
+    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 14) & 0xff));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":105
- *     ret[0] = result
+    /* "/root/package/cpyamf/amf3.pyx":214
+ *     if n > 0x3fff:
+ *         bytes[count] = 0x80 | ((n >> 14) & 0xff)
+ *         count += 1             # <<<<<<<<<<<<<<
  * 
- *     return 0             # <<<<<<<<<<<<<<
+ *     if n > 0x7f:
+ */
+    __pyx_v_count += 1;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":216
+ *         count += 1
+ * 
+ *     if n > 0x7f:             # <<<<<<<<<<<<<<
+ *         bytes[count] = 0x80 | ((n >> 7) & 0xff)
+ *         count += 1
+ */
+  __pyx_t_1 = (__pyx_v_n > 0x7f);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":217
+ * 
+ *     if n > 0x7f:
+ *         bytes[count] = 0x80 | ((n >> 7) & 0xff)             # <<<<<<<<<<<<<<
+ *         count += 1
+ * 
+ */
+    (__pyx_v_bytes[__pyx_v_count]) = (0x80 | ((__pyx_v_n >> 7) & 0xff));
+
+    /* "/root/package/cpyamf/amf3.pyx":218
+ *     if n > 0x7f:
+ *         bytes[count] = 0x80 | ((n >> 7) & 0xff)
+ *         count += 1             # <<<<<<<<<<<<<<
+ * 
+ *     if changed == 1:
+ */
+    __pyx_v_count += 1;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":220
+ *         count += 1
+ * 
+ *     if changed == 1:             # <<<<<<<<<<<<<<
+ *         n = real_value
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_changed == 1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":221
+ * 
+ *     if changed == 1:
+ *         n = real_value             # <<<<<<<<<<<<<<
+ * 
+ *     if n > 0x1fffff:
+ */
+    __pyx_v_n = __pyx_v_real_value;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":223
+ *         n = real_value
+ * 
+ *     if n > 0x1fffff:             # <<<<<<<<<<<<<<
+ *         bytes[count] = n & 0xff
+ *     else:
+ */
+  __pyx_t_1 = (__pyx_v_n > 0x1fffff);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":224
+ * 
+ *     if n > 0x1fffff:
+ *         bytes[count] = n & 0xff             # <<<<<<<<<<<<<<
+ *     else:
+ *         bytes[count] = n & 0x7f
+ */
+    (__pyx_v_bytes[__pyx_v_count]) = (__pyx_v_n & 0xff);
+    goto __pyx_L7;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":226
+ *         bytes[count] = n & 0xff
+ *     else:
+ *         bytes[count] = n & 0x7f             # <<<<<<<<<<<<<<
+ * 
+ *     return count + 1
+ */
+    (__pyx_v_bytes[__pyx_v_count]) = (__pyx_v_n & 0x7f);
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/amf3.pyx":228
+ *         bytes[count] = n & 0x7f
+ * 
+ *     return count + 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_count + 1);
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":231
+ * 
+ * 
+ * cdef object _encoded_int(long n):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns C{n} encoded as a variable length 29-bit integer C{str}.
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3__encoded_int(long __pyx_v_n) {
+  char __pyx_v_buf[4];
+  Py_ssize_t __pyx_v_size;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  __Pyx_RefNannySetupContext("_encoded_int");
+
+  /* "/root/package/cpyamf/amf3.pyx":238
+ *     cdef Py_ssize_t size
+ * 
+ *     if n > MAX_29B_INT or n < MIN_29B_INT:             # <<<<<<<<<<<<<<
+ *         raise OverflowError("Out of range")
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_n > 268435455);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_n < -268435456);
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":239
+ * 
+ *     if n > MAX_29B_INT or n < MIN_29B_INT:
+ *         raise OverflowError("Out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     size = _encode_int(n, buf)
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_1));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":241
+ *         raise OverflowError("Out of range")
+ * 
+ *     size = _encode_int(n, buf)             # <<<<<<<<<<<<<<
+ * 
+ *     return PyString_FromStringAndSize(buf, size)
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__encode_int(__pyx_v_n, __pyx_v_buf); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_size = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":243
+ *     size = _encode_int(n, buf)
+ * 
+ *     return PyString_FromStringAndSize(buf, size)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_size); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._encoded_int");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":246
+ * 
+ * 
+ * cdef int _write_int(cBufferedByteStream stream, long n) except -1:             # <<<<<<<<<<<<<<
+ *     """
+ *     Writes C{n} as a variable length 29-bit integer to C{stream}.
+ */
+
+static  int __pyx_f_6cpyamf_4amf3__write_int(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream, long __pyx_v_n) {
+  char __pyx_v_buf[4];
+  Py_ssize_t __pyx_v_size;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_write_int");
+  __Pyx_INCREF((PyObject *)__pyx_v_stream);
+
+  /* "/root/package/cpyamf/amf3.pyx":253
+ *     cdef Py_ssize_t size
+ * 
+ *     if n > MAX_29B_INT or n < MIN_29B_INT:             # <<<<<<<<<<<<<<
+ *         raise OverflowError("Out of range")
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_n > 268435455);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_n < -268435456);
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":254
+ * 
+ *     if n > MAX_29B_INT or n < MIN_29B_INT:
+ *         raise OverflowError("Out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     size = _encode_int(n, buf)
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_1));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":256
+ *         raise OverflowError("Out of range")
+ * 
+ *     size = _encode_int(n, buf)             # <<<<<<<<<<<<<<
+ * 
+ *     stream.write(buf, size)
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__encode_int(__pyx_v_n, __pyx_v_buf); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_size = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":258
+ *     size = _encode_int(n, buf)
+ * 
+ *     stream.write(buf, size)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream->__pyx_vtab)->write(__pyx_v_stream, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":260
+ *     stream.write(buf, size)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3._write_int");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_stream);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":263
+ * 
+ * 
+ * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:             # <<<<<<<<<<<<<<
+ *     cdef int n = 0
+ *     cdef long result = 0
+ */
+
+static  int __pyx_f_6cpyamf_4amf3__decode_int(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream, long *__pyx_v_ret, struct __pyx_opt_args_6cpyamf_4amf3__decode_int *__pyx_optional_args) {
+  int __pyx_v_sign = ((int)0);
+  int __pyx_v_n;
+  long __pyx_v_result;
+  unsigned char __pyx_v_b;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_decode_int");
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_sign = __pyx_optional_args->sign;
+    }
+  }
+  __Pyx_INCREF((PyObject *)__pyx_v_stream);
+
+  /* "/root/package/cpyamf/amf3.pyx":264
+ * 
+ * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
+ *     cdef int n = 0             # <<<<<<<<<<<<<<
+ *     cdef long result = 0
+ *     cdef unsigned char b
+ */
+  __pyx_v_n = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":265
+ * cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
+ *     cdef int n = 0
+ *     cdef long result = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned char b
+ * 
+ */
+  __pyx_v_result = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":268
+ *     cdef unsigned char b
+ * 
+ *     if stream.read_uchar(&b) == -1:             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream->__pyx_vtab)->read_uchar(__pyx_v_stream, (&__pyx_v_b)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":269
+ * 
+ *     if stream.read_uchar(&b) == -1:
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ *     while b & 0x80 != 0 and n < 3:
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":271
+ *         return -1
+ * 
+ *     while b & 0x80 != 0 and n < 3:             # <<<<<<<<<<<<<<
+ *         result <<= 7
+ *         result |= b & 0x7f
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_b & 0x80) != 0);
+    if (__pyx_t_2) {
+      __pyx_t_3 = (__pyx_v_n < 3);
+      __pyx_t_4 = __pyx_t_3;
+    } else {
+      __pyx_t_4 = __pyx_t_2;
+    }
+    if (!__pyx_t_4) break;
+
+    /* "/root/package/cpyamf/amf3.pyx":272
+ * 
+ *     while b & 0x80 != 0 and n < 3:
+ *         result <<= 7             # <<<<<<<<<<<<<<
+ *         result |= b & 0x7f
+ * 
+ */
+    __pyx_v_result <<= 7;
+
+    /* "/root/package/cpyamf/amf3.pyx":273
+ *     while b & 0x80 != 0 and n < 3:
+ *         result <<= 7
+ *         result |= b & 0x7f             # <<<<<<<<<<<<<<
+ * 
+ *         if stream.read_uchar(&b) == -1:
+ */
+    __pyx_v_result |= (__pyx_v_b & 0x7f);
+
+    /* "/root/package/cpyamf/amf3.pyx":275
+ *         result |= b & 0x7f
+ * 
+ *         if stream.read_uchar(&b) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream->__pyx_vtab)->read_uchar(__pyx_v_stream, (&__pyx_v_b)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = (__pyx_t_1 == -1);
+    if (__pyx_t_4) {
+
+      /* "/root/package/cpyamf/amf3.pyx":276
+ * 
+ *         if stream.read_uchar(&b) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         n += 1
+ */
+      __pyx_r = -1;
+      goto __pyx_L0;
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf3.pyx":278
+ *             return -1
+ * 
+ *         n += 1             # <<<<<<<<<<<<<<
+ * 
+ *     if n < 3:
+ */
+    __pyx_v_n += 1;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":280
+ *         n += 1
+ * 
+ *     if n < 3:             # <<<<<<<<<<<<<<
+ *         result <<= 7
+ *         result |= b
+ */
+  __pyx_t_4 = (__pyx_v_n < 3);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":281
+ * 
+ *     if n < 3:
+ *         result <<= 7             # <<<<<<<<<<<<<<
+ *         result |= b
+ *     else:
+ */
+    __pyx_v_result <<= 7;
+
+    /* "/root/package/cpyamf/amf3.pyx":282
+ *     if n < 3:
+ *         result <<= 7
+ *         result |= b             # <<<<<<<<<<<<<<
+ *     else:
+ *         result <<= 8
+ */
+    __pyx_v_result |= __pyx_v_b;
+    goto __pyx_L7;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":284
+ *         result |= b
+ *     else:
+ *         result <<= 8             # <<<<<<<<<<<<<<
+ *         result |= b
+ * 
+ */
+    __pyx_v_result <<= 8;
+
+    /* "/root/package/cpyamf/amf3.pyx":285
+ *     else:
+ *         result <<= 8
+ *         result |= b             # <<<<<<<<<<<<<<
+ * 
+ *         if result & 0x10000000 != 0:
+ */
+    __pyx_v_result |= __pyx_v_b;
+
+    /* "/root/package/cpyamf/amf3.pyx":287
+ *         result |= b
+ * 
+ *         if result & 0x10000000 != 0:             # <<<<<<<<<<<<<<
+ *             if sign == 1:
+ *                 result -= 0x20000000
+ */
+    __pyx_t_4 = ((__pyx_v_result & 0x10000000) != 0);
+    if (__pyx_t_4) {
+
+      /* "/root/package/cpyamf/amf3.pyx":288
+ * 
+ *         if result & 0x10000000 != 0:
+ *             if sign == 1:             # <<<<<<<<<<<<<<
+ *                 result -= 0x20000000
+ *             else:
+ */
+      __pyx_t_4 = (__pyx_v_sign == 1);
+      if (__pyx_t_4) {
+
+        /* "/root/package/cpyamf/amf3.pyx":289
+ *         if result & 0x10000000 != 0:
+ *             if sign == 1:
+ *                 result -= 0x20000000             # <<<<<<<<<<<<<<
+ *             else:
+ *                 result <<= 1
+ */
+        __pyx_v_result -= 0x20000000;
+        goto __pyx_L9;
+      }
+      /*else*/ {
+
+        /* "/root/package/cpyamf/amf3.pyx":291
+ *                 result -= 0x20000000
+ *             else:
+ *                 result <<= 1             # <<<<<<<<<<<<<<
+ *                 result += 1
+ * 
+ */
+        __pyx_v_result <<= 1;
+
+        /* "/root/package/cpyamf/amf3.pyx":292
+ *             else:
+ *                 result <<= 1
+ *                 result += 1             # <<<<<<<<<<<<<<
+ * 
+ *     ret[0] = result
+ */
+        __pyx_v_result += 1;
+      }
+      __pyx_L9:;
+      goto __pyx_L8;
+    }
+    __pyx_L8:;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/amf3.pyx":294
+ *                 result += 1
+ * 
+ *     ret[0] = result             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (__pyx_v_ret[0]) = __pyx_v_result;
+
+  /* "/root/package/cpyamf/amf3.pyx":296
+ *     ret[0] = result
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3._decode_int");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_stream);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":319
+ *     cdef public bint string_references
+ * 
+ *     def __init__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         _init_module()
+ * 
+ */
+
+static int __pyx_pf_6cpyamf_4amf3_7Encoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_6cpyamf_4amf3_7Encoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("__init__");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 1))) return -1;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return -1;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf3.pyx":320
+ * 
+ *     def __init__(self, *args, **kwargs):
+ *         _init_module()             # <<<<<<<<<<<<<<
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__init_module(); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":322
+ *         _init_module()
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)             # <<<<<<<<<<<<<<
+ *         self.string_references = kwargs.pop('string_references', True)
+ * 
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_kwargs, __pyx_n_s__pop); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__use_proxies_default); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__use_proxies));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_n_s__use_proxies));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__use_proxies));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->use_proxies);
+  __Pyx_DECREF(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->use_proxies);
+  ((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->use_proxies = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":323
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ *         self.string_references = kwargs.pop('string_references', True)             # <<<<<<<<<<<<<<
+ * 
+ *         codec.Encoder.__init__(self, *args, **kwargs)
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_kwargs, __pyx_n_s__pop); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__string_references));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__string_references));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__string_references));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_5 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  ((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->string_references = __pyx_t_5;
+
+  /* "/root/package/cpyamf/amf3.pyx":325
+ *         self.string_references = kwargs.pop('string_references', True)
+ * 
+ *         codec.Encoder.__init__(self, *args, **kwargs)             # <<<<<<<<<<<<<<
+ * 
+ *     def buildContext(self):
+ */
+  __pyx_t_4 = PyObject_GetAttr(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_5codec_Encoder)), __pyx_n_s____init__); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  __pyx_t_3 = PySequence_Tuple(__pyx_v_args); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_6 = PyNumber_Add(__pyx_t_2, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_6, __pyx_v_kwargs); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.__init__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":327
+ *         codec.Encoder.__init__(self, *args, **kwargs)
+ * 
+ *     def buildContext(self):             # <<<<<<<<<<<<<<
+ *         return amf3.Context()
+ * 
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_buildContext(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_buildContext(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("buildContext");
+
+  /* "/root/package/cpyamf/amf3.pyx":328
+ * 
+ *     def buildContext(self):
+ *         return amf3.Context()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object resolveType(self, object data):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__Context); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.buildContext");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":330
+ *         return amf3.Context()
+ * 
+ *     cdef object resolveType(self, object data):             # <<<<<<<<<<<<<<
+ *         if isinstance(data, FUNC_TYPES):
+ *             return ENC_FUNC
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Encoder_resolveType(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_v_kls;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("resolveType");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_data);
+  __pyx_v_kls = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":331
+ * 
+ *     cdef object resolveType(self, object data):
+ *         if isinstance(data, FUNC_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_FUNC
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_FUNC_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":332
+ *     cdef object resolveType(self, object data):
+ *         if isinstance(data, FUNC_TYPES):
+ *             return ENC_FUNC             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, bool):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_12);
+    __pyx_r = __pyx_int_12;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":334
+ *             return ENC_FUNC
+ * 
+ *         if isinstance(data, bool):             # <<<<<<<<<<<<<<
+ *             return ENC_BOOL
+ * 
+ */
+  __pyx_t_1 = PyObject_TypeCheck(__pyx_v_data, ((PyTypeObject *)((PyObject*)&PyBool_Type))); 
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":335
+ * 
+ *         if isinstance(data, bool):
+ *             return ENC_BOOL             # <<<<<<<<<<<<<<
+ * 
+ *         if data is None:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_2);
+    __pyx_r = __pyx_int_2;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":337
+ *             return ENC_BOOL
+ * 
+ *         if data is None:             # <<<<<<<<<<<<<<
+ *             return ENC_NULL
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_data == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":338
+ * 
+ *         if data is None:
+ *             return ENC_NULL             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, (int, long)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_1);
+    __pyx_r = __pyx_int_1;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":340
+ *             return ENC_NULL
+ * 
+ *         if isinstance(data, (int, long)):             # <<<<<<<<<<<<<<
+ *             return ENC_INT
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyInt_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)((PyObject*)&PyInt_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyInt_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyLong_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)((PyObject*)&PyLong_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyLong_Type)));
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":341
+ * 
+ *         if isinstance(data, (int, long)):
+ *             return ENC_INT             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, float):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_3);
+    __pyx_r = __pyx_int_3;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":343
+ *             return ENC_INT
+ * 
+ *         if isinstance(data, float):             # <<<<<<<<<<<<<<
+ *             return ENC_NUMBER
+ * 
+ */
+  __pyx_t_1 = PyObject_TypeCheck(__pyx_v_data, ((PyTypeObject *)((PyObject*)&PyFloat_Type))); 
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":344
+ * 
+ *         if isinstance(data, float):
+ *             return ENC_NUMBER             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, types.StringTypes):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_4);
+    __pyx_r = __pyx_int_4;
+    goto __pyx_L0;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/amf3.pyx":346
+ *             return ENC_NUMBER
+ * 
+ *         if isinstance(data, types.StringTypes):             # <<<<<<<<<<<<<<
+ *             return ENC_STRING
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__StringTypes); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":347
+ * 
+ *         if isinstance(data, types.StringTypes):
+ *             return ENC_STRING             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, amf3.ByteArray):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_5);
+    __pyx_r = __pyx_int_5;
+    goto __pyx_L0;
+    goto __pyx_L8;
+  }
+  __pyx_L8:;
+
+  /* "/root/package/cpyamf/amf3.pyx":349
+ *             return ENC_STRING
+ * 
+ *         if isinstance(data, amf3.ByteArray):             # <<<<<<<<<<<<<<
+ *             return ENC_BYTEARRAY
+ * 
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__ByteArray); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":350
+ * 
+ *         if isinstance(data, amf3.ByteArray):
+ *             return ENC_BYTEARRAY             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, NumericVector):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_10);
+    __pyx_r = __pyx_int_10;
+    goto __pyx_L0;
+    goto __pyx_L9;
+  }
+  __pyx_L9:;
+
+  /* "/root/package/cpyamf/amf3.pyx":352
+ *             return ENC_BYTEARRAY
+ * 
+ *         if isinstance(data, NumericVector):             # <<<<<<<<<<<<<<
+ *             return ENC_VECTOR
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_NumericVector); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":353
+ * 
+ *         if isinstance(data, NumericVector):
+ *             return ENC_VECTOR             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, array.ArrayType):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_14);
+    __pyx_r = __pyx_int_14;
+    goto __pyx_L0;
+    goto __pyx_L10;
+  }
+  __pyx_L10:;
+
+  /* "/root/package/cpyamf/amf3.pyx":355
+ *             return ENC_VECTOR
+ * 
+ *         if isinstance(data, array.ArrayType):             # <<<<<<<<<<<<<<
+ *             return ENC_LIST
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ArrayType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":356
+ * 
+ *         if isinstance(data, array.ArrayType):
+ *             return ENC_LIST             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, ObjectVector):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_7);
+    __pyx_r = __pyx_int_7;
+    goto __pyx_L0;
+    goto __pyx_L11;
+  }
+  __pyx_L11:;
+
+  /* "/root/package/cpyamf/amf3.pyx":358
+ *             return ENC_LIST
+ * 
+ *         if isinstance(data, ObjectVector):             # <<<<<<<<<<<<<<
+ *             return ENC_OBJECT_VECTOR
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_ObjectVector); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":359
+ * 
+ *         if isinstance(data, ObjectVector):
+ *             return ENC_OBJECT_VECTOR             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, Dictionary):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_15);
+    __pyx_r = __pyx_int_15;
+    goto __pyx_L0;
+    goto __pyx_L12;
+  }
+  __pyx_L12:;
+
+  /* "/root/package/cpyamf/amf3.pyx":361
+ *             return ENC_OBJECT_VECTOR
+ * 
+ *         if isinstance(data, Dictionary):             # <<<<<<<<<<<<<<
+ *             return ENC_DICTIONARY
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_Dictionary); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":362
+ * 
+ *         if isinstance(data, Dictionary):
+ *             return ENC_DICTIONARY             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, DATE_TYPES):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_16);
+    __pyx_r = __pyx_int_16;
+    goto __pyx_L0;
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf3.pyx":364
+ *             return ENC_DICTIONARY
+ * 
+ *         if isinstance(data, DATE_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_DATE
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_DATE_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":365
+ * 
+ *         if isinstance(data, DATE_TYPES):
+ *             return ENC_DATE             # <<<<<<<<<<<<<<
+ * 
+ *         if util.is_ET_element(data):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_6);
+    __pyx_r = __pyx_int_6;
+    goto __pyx_L0;
+    goto __pyx_L14;
+  }
+  __pyx_L14:;
+
+  /* "/root/package/cpyamf/amf3.pyx":367
+ *             return ENC_DATE
+ * 
+ *         if util.is_ET_element(data):             # <<<<<<<<<<<<<<
+ *             return ENC_XML
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__is_ET_element); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":368
+ * 
+ *         if util.is_ET_element(data):
+ *             return ENC_XML             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, pyamf.UndefinedType):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_11);
+    __pyx_r = __pyx_int_11;
+    goto __pyx_L0;
+    goto __pyx_L15;
+  }
+  __pyx_L15:;
+
+  /* "/root/package/cpyamf/amf3.pyx":370
+ *             return ENC_XML
+ * 
+ *         if isinstance(data, pyamf.UndefinedType):             # <<<<<<<<<<<<<<
+ *             return ENC_UNDEFINED
+ * 
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__UndefinedType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":371
+ * 
+ *         if isinstance(data, pyamf.UndefinedType):
+ *             return ENC_UNDEFINED             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, pyamf.RawAMF):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
+    goto __pyx_L16;
+  }
+  __pyx_L16:;
+
+  /* "/root/package/cpyamf/amf3.pyx":373
+ *             return ENC_UNDEFINED
+ * 
+ *         if isinstance(data, pyamf.RawAMF):             # <<<<<<<<<<<<<<
+ *             return ENC_RAW
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__RawAMF); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":374
+ * 
+ *         if isinstance(data, pyamf.RawAMF):
+ *             return ENC_RAW             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, CLASS_TYPES):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_17);
+    __pyx_r = __pyx_int_17;
+    goto __pyx_L0;
+    goto __pyx_L17;
+  }
+  __pyx_L17:;
+
+  /* "/root/package/cpyamf/amf3.pyx":376
+ *             return ENC_RAW
+ * 
+ *         if isinstance(data, CLASS_TYPES):             # <<<<<<<<<<<<<<
+ *             return ENC_CLASS
+ * 
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_v_6cpyamf_4amf3_CLASS_TYPES); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":377
+ * 
+ *         if isinstance(data, CLASS_TYPES):
+ *             return ENC_CLASS             # <<<<<<<<<<<<<<
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_13);
+    __pyx_r = __pyx_int_13;
+    goto __pyx_L0;
+    goto __pyx_L18;
+  }
+  __pyx_L18:;
+
+  /* "/root/package/cpyamf/amf3.pyx":379
+ *             return ENC_CLASS
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):             # <<<<<<<<<<<<<<
+ *             kls = data.__class__
+ * 
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__InstanceType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__ObjectType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_data, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":380
+ * 
+ *         if isinstance(data, (types.InstanceType, types.ObjectType)):
+ *             kls = data.__class__             # <<<<<<<<<<<<<<
+ * 
+ *             if kls is pyamf.MixedArray:
+ */
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_data, __pyx_n_s____class__); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_kls);
+    __pyx_v_kls = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":382
+ *             kls = data.__class__
+ * 
+ *             if kls is pyamf.MixedArray:             # <<<<<<<<<<<<<<
+ *                 return ENC_DICT
+ * 
+ */
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 382; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__MixedArray); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 382; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_1 = (__pyx_v_kls == __pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":383
+ * 
+ *             if kls is pyamf.MixedArray:
+ *                 return ENC_DICT             # <<<<<<<<<<<<<<
+ * 
+ *             if kls in LIST_TYPES:
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_int_8);
+      __pyx_r = __pyx_int_8;
+      goto __pyx_L0;
+      goto __pyx_L20;
+    }
+    __pyx_L20:;
+
+    /* "/root/package/cpyamf/amf3.pyx":385
+ *                 return ENC_DICT
+ * 
+ *             if kls in LIST_TYPES:             # <<<<<<<<<<<<<<
+ *                 return ENC_LIST
+ * 
+ */
+    __pyx_t_1 = ((PySequence_Contains(__pyx_v_6cpyamf_4amf3_LIST_TYPES, __pyx_v_kls))); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":386
+ * 
+ *             if kls in LIST_TYPES:
+ *                 return ENC_LIST             # <<<<<<<<<<<<<<
+ * 
+ *             return ENC_OBJECT
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_int_7);
+      __pyx_r = __pyx_int_7;
+      goto __pyx_L0;
+      goto __pyx_L21;
+    }
+    __pyx_L21:;
+
+    /* "/root/package/cpyamf/amf3.pyx":388
+ *                 return ENC_LIST
+ * 
+ *             return ENC_OBJECT             # <<<<<<<<<<<<<<
+ * 
+ *         return None
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_9);
+    __pyx_r = __pyx_int_9;
+    goto __pyx_L0;
+    goto __pyx_L19;
+  }
+  __pyx_L19:;
+
+  /* "/root/package/cpyamf/amf3.pyx":390
+ *             return ENC_OBJECT
+ * 
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeElement(self, object data, object use_proxies) except -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_None);
+  __pyx_r = Py_None;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.resolveType");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kls);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":392
+ *         return None
+ * 
+ *     cdef int _writeElement(self, object data, object use_proxies) except -1:             # <<<<<<<<<<<<<<
+ *         cdef object func = self.getTypeFunc(data)
+ *         cdef long t
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeElement(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_data, PyObject *__pyx_v_use_proxies) {
+  PyObject *__pyx_v_func = 0;
+  long __pyx_v_t;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("_writeElement");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_data);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+
+  /* "/root/package/cpyamf/amf3.pyx":393
+ * 
+ *     cdef int _writeElement(self, object data, object use_proxies) except -1:
+ *         cdef object func = self.getTypeFunc(data)             # <<<<<<<<<<<<<<
+ *         cdef long t
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.getTypeFunc(((struct __pyx_obj_6cpyamf_5codec_Encoder *)__pyx_v_self), __pyx_v_data); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_func = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":396
+ *         cdef long t
+ * 
+ *         if func is None:             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError("Unknown type %r" % (data,))
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_func == Py_None);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":397
+ * 
+ *         if func is None:
+ *             raise pyamf.EncodeError("Unknown type %r" % (data,))             # <<<<<<<<<<<<<<
+ * 
+ *         if PyInt_CheckExact(func) == 0:
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":399
+ *             raise pyamf.EncodeError("Unknown type %r" % (data,))
+ * 
+ *         if PyInt_CheckExact(func) == 0:             # <<<<<<<<<<<<<<
+ *             func(data, use_proxies=use_proxies)
+ * 
+ */
+  __pyx_t_2 = (PyInt_CheckExact(__pyx_v_func) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":400
+ * 
+ *         if PyInt_CheckExact(func) == 0:
+ *             func(data, use_proxies=use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__use_proxies), __pyx_v_use_proxies) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_v_func, __pyx_t_4, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":402
+ *             func(data, use_proxies=use_proxies)
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         t = PyInt_AS_LONG(func)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":404
+ *             return 0
+ * 
+ *         t = PyInt_AS_LONG(func)             # <<<<<<<<<<<<<<
+ * 
+ *         if t == ENC_STRING:
+ */
+  __pyx_v_t = PyInt_AS_LONG(__pyx_v_func);
+
+  /* "/root/package/cpyamf/amf3.pyx":406
+ *         t = PyInt_AS_LONG(func)
+ * 
+ *         if t == ENC_STRING:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_STRING)
+ * 
+ */
+  switch (__pyx_v_t) {
+    case 5:
+
+    /* "/root/package/cpyamf/amf3.pyx":407
+ * 
+ *         if t == ENC_STRING:
+ *             self.stream.write_uchar(TYPE_STRING)             # <<<<<<<<<<<<<<
+ * 
+ *             return self._writeString(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 6); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf3.pyx":409
+ *             self.stream.write_uchar(TYPE_STRING)
+ * 
+ *             return self._writeString(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_INT:
+ *             return self._writeInteger(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":410
+ * 
+ *             return self._writeString(data)
+ *         elif t == ENC_INT:             # <<<<<<<<<<<<<<
+ *             return self._writeInteger(data)
+ *         elif t == ENC_NUMBER:
+ */
+    case 3:
+
+    /* "/root/package/cpyamf/amf3.pyx":411
+ *             return self._writeString(data)
+ *         elif t == ENC_INT:
+ *             return self._writeInteger(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_NUMBER:
+ *             return self._writeNumber(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeInteger(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":412
+ *         elif t == ENC_INT:
+ *             return self._writeInteger(data)
+ *         elif t == ENC_NUMBER:             # <<<<<<<<<<<<<<
+ *             return self._writeNumber(data)
+ *         elif t == ENC_BOOL:
+ */
+    case 4:
+
+    /* "/root/package/cpyamf/amf3.pyx":413
+ *             return self._writeInteger(data)
+ *         elif t == ENC_NUMBER:
+ *             return self._writeNumber(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_BOOL:
+ *             if data:
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeNumber(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":414
+ *         elif t == ENC_NUMBER:
+ *             return self._writeNumber(data)
+ *         elif t == ENC_BOOL:             # <<<<<<<<<<<<<<
+ *             if data:
+ *                 return self.stream.write_uchar(TYPE_BOOL_TRUE)
+ */
+    case 2:
+
+    /* "/root/package/cpyamf/amf3.pyx":415
+ *             return self._writeNumber(data)
+ *         elif t == ENC_BOOL:
+ *             if data:             # <<<<<<<<<<<<<<
+ *                 return self.stream.write_uchar(TYPE_BOOL_TRUE)
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_data); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/amf3.pyx":416
+ *         elif t == ENC_BOOL:
+ *             if data:
+ *                 return self.stream.write_uchar(TYPE_BOOL_TRUE)             # <<<<<<<<<<<<<<
+ * 
+ *             return self.stream.write_uchar(TYPE_BOOL_FALSE)
+ */
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 3); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_r = __pyx_t_5;
+      goto __pyx_L0;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/cpyamf/amf3.pyx":418
+ *                 return self.stream.write_uchar(TYPE_BOOL_TRUE)
+ * 
+ *             return self.stream.write_uchar(TYPE_BOOL_FALSE)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 2); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":419
+ * 
+ *             return self.stream.write_uchar(TYPE_BOOL_FALSE)
+ *         elif t == ENC_NULL:             # <<<<<<<<<<<<<<
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_OBJECT:
+ */
+    case 1:
+
+    /* "/root/package/cpyamf/amf3.pyx":420
+ *             return self.stream.write_uchar(TYPE_BOOL_FALSE)
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data, use_proxies)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":421
+ *         elif t == ENC_NULL:
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_OBJECT:             # <<<<<<<<<<<<<<
+ *             return self._writeObject(data, use_proxies)
+ *         elif t == ENC_LIST:
+ */
+    case 9:
+
+    /* "/root/package/cpyamf/amf3.pyx":422
+ *             return self.stream.write_uchar(TYPE_NULL)
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data, use_proxies)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_LIST:
+ *             return self._writeList(data, use_proxies)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeObject(__pyx_v_self, __pyx_v_data, __pyx_v_use_proxies); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 422; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":423
+ *         elif t == ENC_OBJECT:
+ *             return self._writeObject(data, use_proxies)
+ *         elif t == ENC_LIST:             # <<<<<<<<<<<<<<
+ *             return self._writeList(data, use_proxies)
+ *         elif t == ENC_DICT:
+ */
+    case 7:
+
+    /* "/root/package/cpyamf/amf3.pyx":424
+ *             return self._writeObject(data, use_proxies)
+ *         elif t == ENC_LIST:
+ *             return self._writeList(data, use_proxies)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_DICT:
+ *             return self._writeDict(data, use_proxies)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeList(__pyx_v_self, __pyx_v_data, __pyx_v_use_proxies); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":425
+ *         elif t == ENC_LIST:
+ *             return self._writeList(data, use_proxies)
+ *         elif t == ENC_DICT:             # <<<<<<<<<<<<<<
+ *             return self._writeDict(data, use_proxies)
+ *         elif t == ENC_DATE:
+ */
+    case 8:
+
+    /* "/root/package/cpyamf/amf3.pyx":426
+ *             return self._writeList(data, use_proxies)
+ *         elif t == ENC_DICT:
+ *             return self._writeDict(data, use_proxies)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDict(__pyx_v_self, __pyx_v_data, __pyx_v_use_proxies); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":427
+ *         elif t == ENC_DICT:
+ *             return self._writeDict(data, use_proxies)
+ *         elif t == ENC_DATE:             # <<<<<<<<<<<<<<
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:
+ */
+    case 6:
+
+    /* "/root/package/cpyamf/amf3.pyx":428
+ *             return self._writeDict(data, use_proxies)
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDate(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":429
+ *         elif t == ENC_DATE:
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:             # <<<<<<<<<<<<<<
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_BYTEARRAY:
+ */
+    case 0:
+
+    /* "/root/package/cpyamf/amf3.pyx":430
+ *             return self._writeDate(data)
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_BYTEARRAY:
+ *             return self._writeByteArray(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":431
+ *         elif t == ENC_UNDEFINED:
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_BYTEARRAY:             # <<<<<<<<<<<<<<
+ *             return self._writeByteArray(data)
+ *         elif t == ENC_VECTOR:
+ */
+    case 10:
+
+    /* "/root/package/cpyamf/amf3.pyx":432
+ *             return self.stream.write_uchar(TYPE_UNDEFINED)
+ *         elif t == ENC_BYTEARRAY:
+ *             return self._writeByteArray(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_VECTOR:
+ *             return self._writeVector(data, use_proxies)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeByteArray(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":433
+ *         elif t == ENC_BYTEARRAY:
+ *             return self._writeByteArray(data)
+ *         elif t == ENC_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._writeVector(data, use_proxies)
+ *         elif t == ENC_OBJECT_VECTOR:
+ */
+    case 14:
+
+    /* "/root/package/cpyamf/amf3.pyx":434
+ *             return self._writeByteArray(data)
+ *         elif t == ENC_VECTOR:
+ *             return self._writeVector(data, use_proxies)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_OBJECT_VECTOR:
+ *             return self._writeObjectVector(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeVector(__pyx_v_self, __pyx_v_data, __pyx_v_use_proxies); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":435
+ *         elif t == ENC_VECTOR:
+ *             return self._writeVector(data, use_proxies)
+ *         elif t == ENC_OBJECT_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._writeObjectVector(data)
+ *         elif t == ENC_DICTIONARY:
+ */
+    case 15:
+
+    /* "/root/package/cpyamf/amf3.pyx":436
+ *             return self._writeVector(data, use_proxies)
+ *         elif t == ENC_OBJECT_VECTOR:
+ *             return self._writeObjectVector(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_DICTIONARY:
+ *             return self._writeDictionary(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeObjectVector(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":437
+ *         elif t == ENC_OBJECT_VECTOR:
+ *             return self._writeObjectVector(data)
+ *         elif t == ENC_DICTIONARY:             # <<<<<<<<<<<<<<
+ *             return self._writeDictionary(data)
+ *         elif t == ENC_XML:
+ */
+    case 16:
+
+    /* "/root/package/cpyamf/amf3.pyx":438
+ *             return self._writeObjectVector(data)
+ *         elif t == ENC_DICTIONARY:
+ *             return self._writeDictionary(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeDictionary(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":439
+ *         elif t == ENC_DICTIONARY:
+ *             return self._writeDictionary(data)
+ *         elif t == ENC_XML:             # <<<<<<<<<<<<<<
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:
+ */
+    case 11:
+
+    /* "/root/package/cpyamf/amf3.pyx":440
+ *             return self._writeDictionary(data)
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeXML(__pyx_v_self, __pyx_v_data); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":441
+ *         elif t == ENC_XML:
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:             # <<<<<<<<<<<<<<
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:
+ */
+    case 17:
+
+    /* "/root/package/cpyamf/amf3.pyx":442
+ *             return self._writeXML(data)
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)
+ */
+    __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeRawAMF); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":443
+ *         elif t == ENC_RAW:
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:             # <<<<<<<<<<<<<<
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:
+ */
+    case 12:
+
+    /* "/root/package/cpyamf/amf3.pyx":444
+ *             self.writeRawAMF(data)
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)             # <<<<<<<<<<<<<<
+ *         elif t == ENC_CLASS:
+ *             self.writeClass(data)
+ */
+    __pyx_t_4 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeFunc); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":445
+ *         elif t == ENC_FUNC:
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:             # <<<<<<<<<<<<<<
+ *             self.writeClass(data)
+ * 
+ */
+    case 13:
+
+    /* "/root/package/cpyamf/amf3.pyx":446
+ *             self.writeFunc(data)
+ *         elif t == ENC_CLASS:
+ *             self.writeClass(data)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeClass); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    break;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":448
+ *             self.writeClass(data)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeInteger(self, object n) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeElement");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_func);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":450
+ *         return 0
+ * 
+ *     cdef int _writeInteger(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef long x
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeInteger(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  long __pyx_v_x;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  double __pyx_t_5;
+  int __pyx_t_6;
+  long __pyx_t_7;
+  __Pyx_RefNannySetupContext("_writeInteger");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+
+  /* "/root/package/cpyamf/amf3.pyx":453
+ *         cdef long x
+ * 
+ *         if PyInt_CheckExact(n) == 0:             # <<<<<<<<<<<<<<
+ *             if n < MIN_29B_INT or n > MAX_29B_INT:
+ *                 return self._writeNumber(float(n))
+ */
+  __pyx_t_1 = (PyInt_CheckExact(__pyx_v_n) == 0);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":454
+ * 
+ *         if PyInt_CheckExact(n) == 0:
+ *             if n < MIN_29B_INT or n > MAX_29B_INT:             # <<<<<<<<<<<<<<
+ *                 return self._writeNumber(float(n))
+ * 
+ */
+    __pyx_t_2 = PyObject_RichCompare(__pyx_v_n, __pyx_int_neg_268435456, Py_LT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (!__pyx_t_1) {
+      __pyx_t_2 = PyObject_RichCompare(__pyx_v_n, __pyx_int_268435455, Py_GT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_4 = __pyx_t_3;
+    } else {
+      __pyx_t_4 = __pyx_t_1;
+    }
+    if (__pyx_t_4) {
+
+      /* "/root/package/cpyamf/amf3.pyx":455
+ *         if PyInt_CheckExact(n) == 0:
+ *             if n < MIN_29B_INT or n > MAX_29B_INT:
+ *                 return self._writeNumber(float(n))             # <<<<<<<<<<<<<<
+ * 
+ *         x = n
+ */
+      __pyx_t_5 = __Pyx_PyObject_AsDouble(__pyx_v_n); if (unlikely(__pyx_t_5 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyFloat_FromDouble(__pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeNumber(__pyx_v_self, __pyx_t_2); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_r = __pyx_t_6;
+      goto __pyx_L0;
+      goto __pyx_L4;
+    }
+    __pyx_L4:;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":457
+ *                 return self._writeNumber(float(n))
+ * 
+ *         x = n             # <<<<<<<<<<<<<<
+ * 
+ *         if x < MIN_29B_INT or x > MAX_29B_INT:
+ */
+  __pyx_t_7 = __Pyx_PyInt_AsLong(__pyx_v_n); if (unlikely((__pyx_t_7 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_x = __pyx_t_7;
+
+  /* "/root/package/cpyamf/amf3.pyx":459
+ *         x = n
+ * 
+ *         if x < MIN_29B_INT or x > MAX_29B_INT:             # <<<<<<<<<<<<<<
+ *             return self._writeNumber(float(n))
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_x < -268435456);
+  if (!__pyx_t_4) {
+    __pyx_t_1 = (__pyx_v_x > 268435455);
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":460
+ * 
+ *         if x < MIN_29B_INT or x > MAX_29B_INT:
+ *             return self._writeNumber(float(n))             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_INTEGER)
+ */
+    __pyx_t_5 = __Pyx_PyObject_AsDouble(__pyx_v_n); if (unlikely(__pyx_t_5 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeNumber(__pyx_v_self, __pyx_t_2); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_6;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":462
+ *             return self._writeNumber(float(n))
+ * 
+ *         self.stream.write_uchar(TYPE_INTEGER)             # <<<<<<<<<<<<<<
+ * 
+ *         return _write_int(self.stream, x)
+ */
+  __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 4); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":464
+ *         self.stream.write_uchar(TYPE_INTEGER)
+ * 
+ *         return _write_int(self.stream, x)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeNumber(self, object n) except -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_x); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_6;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeInteger");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":466
+ *         return _write_int(self.stream, x)
+ * 
+ *     cdef int _writeNumber(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(TYPE_NUMBER)
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeNumber(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  int __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+  __Pyx_RefNannySetupContext("_writeNumber");
+
+  /* "/root/package/cpyamf/amf3.pyx":467
+ * 
+ *     cdef int _writeNumber(self, object n) except -1:
+ *         self.stream.write_uchar(TYPE_NUMBER)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write_double(PyFloat_AsDouble(n))
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 5); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":469
+ *         self.stream.write_uchar(TYPE_NUMBER)
+ * 
+ *         return self.stream.write_double(PyFloat_AsDouble(n))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeString(self, object n) except -1:
+ */
+  __pyx_t_2 = PyFloat_AsDouble(__pyx_v_n); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 469; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_double(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_2); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 469; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeNumber");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":471
+ *         return self.stream.write_double(PyFloat_AsDouble(n))
+ * 
+ *     cdef int _writeString(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef object bytes
+ *         cdef char *buf = NULL
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeString(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  PyObject *__pyx_v_bytes;
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  Py_ssize_t __pyx_v_ref;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  __Pyx_RefNannySetupContext("_writeString");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_bytes = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":473
+ *     cdef int _writeString(self, object n) except -1:
+ *         cdef object bytes
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ *         cdef Py_ssize_t ref
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf3.pyx":474
+ *         cdef object bytes
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":477
+ *         cdef Py_ssize_t ref
+ * 
+ *         if PyString_CheckExact(n):             # <<<<<<<<<<<<<<
+ *             bytes = n
+ *         elif PyUnicode_CheckExact(n):
+ */
+  __pyx_t_1 = PyString_CheckExact(__pyx_v_n);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":478
+ * 
+ *         if PyString_CheckExact(n):
+ *             bytes = n             # <<<<<<<<<<<<<<
+ *         elif PyUnicode_CheckExact(n):
+ *             bytes = PyUnicode_AsUTF8String(n)
+ */
+    __Pyx_INCREF(__pyx_v_n);
+    __Pyx_DECREF(__pyx_v_bytes);
+    __pyx_v_bytes = __pyx_v_n;
+    goto __pyx_L3;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":479
+ *         if PyString_CheckExact(n):
+ *             bytes = n
+ *         elif PyUnicode_CheckExact(n):             # <<<<<<<<<<<<<<
+ *             bytes = PyUnicode_AsUTF8String(n)
+ *         else:
+ */
+  __pyx_t_1 = PyUnicode_CheckExact(__pyx_v_n);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":480
+ *             bytes = n
+ *         elif PyUnicode_CheckExact(n):
+ *             bytes = PyUnicode_AsUTF8String(n)             # <<<<<<<<<<<<<<
+ *         else:
+ *             bytes = unicode(n).encode('utf8')
+ */
+    __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_n); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_v_bytes);
+    __pyx_v_bytes = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":482
+ *             bytes = PyUnicode_AsUTF8String(n)
+ *         else:
+ *             bytes = unicode(n).encode('utf8')             # <<<<<<<<<<<<<<
+ *             n = bytes
+ * 
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_n);
+    __Pyx_GIVEREF(__pyx_v_n);
+    __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)&PyUnicode_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(__pyx_t_3 == Py_None)) {
+      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'encode'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
+    }
+    __pyx_t_2 = ((PyObject *)PyUnicode_AsUTF8String(((PyObject *)__pyx_t_3))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_bytes);
+    __pyx_v_bytes = ((PyObject *)__pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":483
+ *         else:
+ *             bytes = unicode(n).encode('utf8')
+ *             n = bytes             # <<<<<<<<<<<<<<
+ * 
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ */
+    __Pyx_INCREF(__pyx_v_bytes);
+    __Pyx_DECREF(__pyx_v_n);
+    __pyx_v_n = __pyx_v_bytes;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":485
+ *             n = bytes
+ * 
+ *         PyString_AsStringAndSize(bytes, &buf, &l)             # <<<<<<<<<<<<<<
+ * 
+ *         if l == 0:
+ */
+  __pyx_t_1 = PyString_AsStringAndSize(__pyx_v_bytes, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":487
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ * 
+ *         if l == 0:             # <<<<<<<<<<<<<<
+ *             return self.stream.write_uchar(REFERENCE_BIT)
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_l == 0);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":488
+ * 
+ *         if l == 0:
+ *             return self.stream.write_uchar(REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *         if self.string_references:
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_1;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":490
+ *             return self.stream.write_uchar(REFERENCE_BIT)
+ * 
+ *         if self.string_references:             # <<<<<<<<<<<<<<
+ *             ref = _get_string_reference(self.context, n)
+ * 
+ */
+  __pyx_t_4 = __pyx_v_self->string_references;
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":491
+ * 
+ *         if self.string_references:
+ *             ref = _get_string_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *             if ref != -1:
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__get_string_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_ref = __pyx_t_5;
+
+    /* "/root/package/cpyamf/amf3.pyx":493
+ *             ref = _get_string_reference(self.context, n)
+ * 
+ *             if ref != -1:             # <<<<<<<<<<<<<<
+ *                 return _write_int(self.stream, ref << 1)
+ * 
+ */
+    __pyx_t_4 = (__pyx_v_ref != -1);
+    if (__pyx_t_4) {
+
+      /* "/root/package/cpyamf/amf3.pyx":494
+ * 
+ *             if ref != -1:
+ *                 return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *             _add_string(self.context, n)
+ */
+      __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_r = __pyx_t_1;
+      goto __pyx_L0;
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf3.pyx":496
+ *                 return _write_int(self.stream, ref << 1)
+ * 
+ *             _add_string(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, (l << 1) | REFERENCE_BIT)
+ */
+    __pyx_t_1 = __pyx_f_6cpyamf_4amf3__add_string(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":498
+ *             _add_string(self.context, n)
+ * 
+ *         _write_int(self.stream, (l << 1) | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write(buf, l)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_v_l << 1) | 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":500
+ *         _write_int(self.stream, (l << 1) | REFERENCE_BIT)
+ * 
+ *         return self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDate(self, object n) except -1:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeString");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_bytes);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":502
+ *         return self.stream.write(buf, l)
+ * 
+ *     cdef int _writeDate(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeDate(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_ms;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  double __pyx_t_7;
+  __Pyx_RefNannySetupContext("_writeDate");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_ms = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":505
+ *         cdef Py_ssize_t ref
+ * 
+ *         if isinstance(n, datetime.time):             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '
+ *                 'AMF3 has no way to encode time objects. Please use '
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 505; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__time); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 505; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = PyObject_IsInstance(__pyx_v_n, __pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 505; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":506
+ * 
+ *         if isinstance(n, datetime.time):
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '             # <<<<<<<<<<<<<<
+ *                 'AMF3 has no way to encode time objects. Please use '
+ *                 'datetime.datetime instead (got:%r)' % (n,))
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":508
+ *             raise pyamf.EncodeError('A datetime.time instance was found but '
+ *                 'AMF3 has no way to encode time objects. Please use '
+ *                 'datetime.datetime instead (got:%r)' % (n,))             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_DATE)
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_n);
+    __Pyx_GIVEREF(__pyx_v_n);
+    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_3), __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":510
+ *                 'datetime.datetime instead (got:%r)' % (n,))
+ * 
+ *         self.stream.write_uchar(TYPE_DATE)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 8); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 510; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":512
+ *         self.stream.write_uchar(TYPE_DATE)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":514
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_ref != -1);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":515
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 515; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":517
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(REFERENCE_BIT)
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":519
+ *         _add_object(self.context, n)
+ * 
+ *         self.stream.write_uchar(REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *         if self.timezone_offset is not None:
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":521
+ *         self.stream.write_uchar(REFERENCE_BIT)
+ * 
+ *         if self.timezone_offset is not None:             # <<<<<<<<<<<<<<
+ *             n -= self.timezone_offset
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_self->__pyx_base.__pyx_base.timezone_offset != Py_None);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":522
+ * 
+ *         if self.timezone_offset is not None:
+ *             n -= self.timezone_offset             # <<<<<<<<<<<<<<
+ * 
+ *         ms = util.get_timestamp(n)
+ */
+    __pyx_t_4 = PyNumber_InPlaceSubtract(__pyx_v_n, __pyx_v_self->__pyx_base.__pyx_base.timezone_offset); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 522; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_n);
+    __pyx_v_n = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":524
+ *             n -= self.timezone_offset
+ * 
+ *         ms = util.get_timestamp(n)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write_double(ms * 1000.0)
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__get_timestamp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_n);
+  __Pyx_GIVEREF(__pyx_v_n);
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_ms);
+  __pyx_v_ms = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":526
+ *         ms = util.get_timestamp(n)
+ * 
+ *         return self.stream.write_double(ms * 1000.0)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeList(self, object n, object use_proxies) except -1:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(1000.0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyNumber_Multiply(__pyx_v_ms, __pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_double(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_7); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeDate");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ms);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":528
+ *         return self.stream.write_double(ms * 1000.0)
+ * 
+ *     cdef int _writeList(self, object n, object use_proxies) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t i, l, ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeList(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n, PyObject *__pyx_v_use_proxies) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_l;
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_x;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7;
+  PyObject *__pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  __Pyx_RefNannySetupContext("_writeList");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":531
+ *         cdef Py_ssize_t i, l, ref
+ * 
+ *         if use_proxies is None:             # <<<<<<<<<<<<<<
+ *             use_proxies = self.use_proxies
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_use_proxies == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":532
+ * 
+ *         if use_proxies is None:
+ *             use_proxies = self.use_proxies             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is True:
+ */
+    __Pyx_INCREF(__pyx_v_self->use_proxies);
+    __Pyx_DECREF(__pyx_v_use_proxies);
+    __pyx_v_use_proxies = __pyx_v_self->use_proxies;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":534
+ *             use_proxies = self.use_proxies
+ * 
+ *         if use_proxies is True:             # <<<<<<<<<<<<<<
+ *             self.writeProxy(n)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = (__pyx_v_use_proxies == __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":535
+ * 
+ *         if use_proxies is True:
+ *             self.writeProxy(n)             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeProxy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_n);
+    __Pyx_GIVEREF(__pyx_v_n);
+    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":537
+ *             self.writeProxy(n)
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":539
+ *             return 0
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 9); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":541
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":543
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_ref != -1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":544
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":546
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, (len(n) << 1) | REFERENCE_BIT)
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":548
+ *         _add_object(self.context, n)
+ * 
+ *         _write_int(self.stream, (len(n) << 1) | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(0x01)
+ * 
+ */
+  __pyx_t_6 = PyObject_Length(__pyx_v_n); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_t_6 << 1) | 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":549
+ * 
+ *         _write_int(self.stream, (len(n) << 1) | REFERENCE_BIT)
+ *         self.stream.write_uchar(0x01)             # <<<<<<<<<<<<<<
+ * 
+ *         if PyList_CheckExact(n):
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0x01); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":551
+ *         self.stream.write_uchar(0x01)
+ * 
+ *         if PyList_CheckExact(n):             # <<<<<<<<<<<<<<
+ *             l = PyList_GET_SIZE(n)
+ * 
+ */
+  __pyx_t_5 = PyList_CheckExact(__pyx_v_n);
+  if (__pyx_t_5) {
+
+    /* "/root/package/cpyamf/amf3.pyx":552
+ * 
+ *         if PyList_CheckExact(n):
+ *             l = PyList_GET_SIZE(n)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < l:
+ */
+    __pyx_v_l = PyList_GET_SIZE(__pyx_v_n);
+
+    /* "/root/package/cpyamf/amf3.pyx":554
+ *             l = PyList_GET_SIZE(n)
+ * 
+ *             for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(<object>PyList_GET_ITEM(n, i), None)
+ *         elif PyTuple_CheckExact(n):
+ */
+    __pyx_t_6 = __pyx_v_l;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_6; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":555
+ * 
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyList_GET_ITEM(n, i), None)             # <<<<<<<<<<<<<<
+ *         elif PyTuple_CheckExact(n):
+ *             l = PyTuple_GET_SIZE(n)
+ */
+      __pyx_t_7 = PyList_GET_ITEM(__pyx_v_n, __pyx_v_i);
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, ((PyObject *)__pyx_t_7), Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    goto __pyx_L6;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":556
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyList_GET_ITEM(n, i), None)
+ *         elif PyTuple_CheckExact(n):             # <<<<<<<<<<<<<<
+ *             l = PyTuple_GET_SIZE(n)
+ * 
+ */
+  __pyx_t_5 = PyTuple_CheckExact(__pyx_v_n);
+  if (__pyx_t_5) {
+
+    /* "/root/package/cpyamf/amf3.pyx":557
+ *                 self._writeElement(<object>PyList_GET_ITEM(n, i), None)
+ *         elif PyTuple_CheckExact(n):
+ *             l = PyTuple_GET_SIZE(n)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < l:
+ */
+    __pyx_v_l = PyTuple_GET_SIZE(__pyx_v_n);
+
+    /* "/root/package/cpyamf/amf3.pyx":559
+ *             l = PyTuple_GET_SIZE(n)
+ * 
+ *             for i from 0 <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(n, i), None)
+ *         elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:
+ */
+    __pyx_t_6 = __pyx_v_l;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_6; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":560
+ * 
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(n, i), None)             # <<<<<<<<<<<<<<
+ *         elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:
+ *             if n.typecode in 'fd':
+ */
+      __pyx_t_8 = PyTuple_GET_ITEM(__pyx_v_n, __pyx_v_i);
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, ((PyObject *)__pyx_t_8), Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    goto __pyx_L6;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":561
+ *             for i from 0 <= i < l:
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(n, i), None)
+ *         elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:             # <<<<<<<<<<<<<<
+ *             if n.typecode in 'fd':
+ *                 for x in n:
+ */
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__ArrayType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_n, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__typecode); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__VECTOR_TYPECODES); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = ((PySequence_Contains(__pyx_t_4, __pyx_t_3))); if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_10 = __pyx_t_9;
+  } else {
+    __pyx_t_10 = __pyx_t_1;
+  }
+  if (__pyx_t_10) {
+
+    /* "/root/package/cpyamf/amf3.pyx":562
+ *                 self._writeElement(<object>PyTuple_GET_ITEM(n, i), None)
+ *         elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:
+ *             if n.typecode in 'fd':             # <<<<<<<<<<<<<<
+ *                 for x in n:
+ *                     self._writeNumber(x)
+ */
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__typecode); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_10 = ((PySequence_Contains(((PyObject *)__pyx_n_s__fd), __pyx_t_4))); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__pyx_t_10) {
+
+      /* "/root/package/cpyamf/amf3.pyx":563
+ *         elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:
+ *             if n.typecode in 'fd':
+ *                 for x in n:             # <<<<<<<<<<<<<<
+ *                     self._writeNumber(x)
+ *             else:
+ */
+      if (PyList_CheckExact(__pyx_v_n) || PyTuple_CheckExact(__pyx_v_n)) {
+        __pyx_t_6 = 0; __pyx_t_4 = __pyx_v_n; __Pyx_INCREF(__pyx_t_4);
+      } else {
+        __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_n); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+        } else {
+          __pyx_t_3 = PyIter_Next(__pyx_t_4);
+          if (!__pyx_t_3) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_3);
+        }
+        __Pyx_DECREF(__pyx_v_x);
+        __pyx_v_x = __pyx_t_3;
+        __pyx_t_3 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":564
+ *             if n.typecode in 'fd':
+ *                 for x in n:
+ *                     self._writeNumber(x)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 for x in n:
+ */
+        __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeNumber(__pyx_v_self, __pyx_v_x); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      goto __pyx_L11;
+    }
+    /*else*/ {
+
+      /* "/root/package/cpyamf/amf3.pyx":566
+ *                     self._writeNumber(x)
+ *             else:
+ *                 for x in n:             # <<<<<<<<<<<<<<
+ *                     self._writeInteger(x)
+ *         else:
+ */
+      if (PyList_CheckExact(__pyx_v_n) || PyTuple_CheckExact(__pyx_v_n)) {
+        __pyx_t_6 = 0; __pyx_t_4 = __pyx_v_n; __Pyx_INCREF(__pyx_t_4);
+      } else {
+        __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_n); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 566; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+        } else {
+          __pyx_t_3 = PyIter_Next(__pyx_t_4);
+          if (!__pyx_t_3) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 566; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_3);
+        }
+        __Pyx_DECREF(__pyx_v_x);
+        __pyx_v_x = __pyx_t_3;
+        __pyx_t_3 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":567
+ *             else:
+ *                 for x in n:
+ *                     self._writeInteger(x)             # <<<<<<<<<<<<<<
+ *         else:
+ *             for x in n:
+ */
+        __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeInteger(__pyx_v_self, __pyx_v_x); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __pyx_L11:;
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":569
+ *                     self._writeInteger(x)
+ *         else:
+ *             for x in n:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(x, None)
+ * 
+ */
+    if (PyList_CheckExact(__pyx_v_n) || PyTuple_CheckExact(__pyx_v_n)) {
+      __pyx_t_6 = 0; __pyx_t_4 = __pyx_v_n; __Pyx_INCREF(__pyx_t_4);
+    } else {
+      __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_n); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else {
+        __pyx_t_3 = PyIter_Next(__pyx_t_4);
+        if (!__pyx_t_3) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_DECREF(__pyx_v_x);
+      __pyx_v_x = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":570
+ *         else:
+ *             for x in n:
+ *                 self._writeElement(x, None)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_x, Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":572
+ *                 self._writeElement(x, None)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDict(self, object n, object use_proxies) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeList");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_x);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":574
+ *         return 0
+ * 
+ *     cdef int _writeDict(self, object n, object use_proxies) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeDict(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n, PyObject *__pyx_v_use_proxies) {
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_keys;
+  PyObject *__pyx_v_int_keys;
+  PyObject *__pyx_v_str_keys;
+  PyObject *__pyx_v_x;
+  PyObject *__pyx_v_l;
+  PyObject *__pyx_v_k;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  __Pyx_RefNannySetupContext("_writeDict");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_keys = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_int_keys = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_str_keys = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_l = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_k = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":580
+ *         # http://www.docuverse.com/blog/donpark/2007/05/14/flash-9-amf3-bug
+ *         # for more info
+ *         if '' in n:             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError("dicts cannot contain empty string keys")
+ * 
+ */
+  __pyx_t_1 = ((PySequence_Contains(__pyx_v_n, ((PyObject *)__pyx_kp_s_4)))); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":581
+ *         # for more info
+ *         if '' in n:
+ *             raise pyamf.EncodeError("dicts cannot contain empty string keys")             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is None:
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_5));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":583
+ *             raise pyamf.EncodeError("dicts cannot contain empty string keys")
+ * 
+ *         if use_proxies is None:             # <<<<<<<<<<<<<<
+ *             use_proxies = self.use_proxies
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_use_proxies == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":584
+ * 
+ *         if use_proxies is None:
+ *             use_proxies = self.use_proxies             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is True:
+ */
+    __Pyx_INCREF(__pyx_v_self->use_proxies);
+    __Pyx_DECREF(__pyx_v_use_proxies);
+    __pyx_v_use_proxies = __pyx_v_self->use_proxies;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":586
+ *             use_proxies = self.use_proxies
+ * 
+ *         if use_proxies is True:             # <<<<<<<<<<<<<<
+ *             self.writeProxy(n)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = (__pyx_v_use_proxies == __pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":587
+ * 
+ *         if use_proxies is True:
+ *             self.writeProxy(n)             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_4 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeProxy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_n);
+    __Pyx_GIVEREF(__pyx_v_n);
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":589
+ *             self.writeProxy(n)
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":591
+ *             return 0
+ * 
+ *         self.stream.write_uchar(TYPE_ARRAY)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 9); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":593
+ *         self.stream.write_uchar(TYPE_ARRAY)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 593; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":595
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_ref != -1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":596
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":598
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         # The AMF3 spec demands that all str based indicies be listed first
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":601
+ * 
+ *         # The AMF3 spec demands that all str based indicies be listed first
+ *         keys = n.keys()             # <<<<<<<<<<<<<<
+ *         int_keys = []
+ *         str_keys = []
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__keys); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 601; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 601; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_keys);
+  __pyx_v_keys = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":602
+ *         # The AMF3 spec demands that all str based indicies be listed first
+ *         keys = n.keys()
+ *         int_keys = []             # <<<<<<<<<<<<<<
+ *         str_keys = []
+ * 
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __Pyx_DECREF(__pyx_v_int_keys);
+  __pyx_v_int_keys = ((PyObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":603
+ *         keys = n.keys()
+ *         int_keys = []
+ *         str_keys = []             # <<<<<<<<<<<<<<
+ * 
+ *         for x in keys:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __Pyx_DECREF(__pyx_v_str_keys);
+  __pyx_v_str_keys = ((PyObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":605
+ *         str_keys = []
+ * 
+ *         for x in keys:             # <<<<<<<<<<<<<<
+ *             if isinstance(x, (int, long)):
+ *                 int_keys.append(x)
+ */
+  if (PyList_CheckExact(__pyx_v_keys) || PyTuple_CheckExact(__pyx_v_keys)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_keys; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_DECREF(__pyx_v_x);
+    __pyx_v_x = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":606
+ * 
+ *         for x in keys:
+ *             if isinstance(x, (int, long)):             # <<<<<<<<<<<<<<
+ *                 int_keys.append(x)
+ *             elif isinstance(x, (str, unicode)):
+ */
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 606; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyInt_Type)));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)((PyObject*)&PyInt_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyInt_Type)));
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyLong_Type)));
+    PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)((PyObject*)&PyLong_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyLong_Type)));
+    __pyx_t_1 = PyObject_IsInstance(__pyx_v_x, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 606; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":607
+ *         for x in keys:
+ *             if isinstance(x, (int, long)):
+ *                 int_keys.append(x)             # <<<<<<<<<<<<<<
+ *             elif isinstance(x, (str, unicode)):
+ *                 str_keys.append(x)
+ */
+      __pyx_t_3 = __Pyx_PyObject_Append(__pyx_v_int_keys, __pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L9;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":608
+ *             if isinstance(x, (int, long)):
+ *                 int_keys.append(x)
+ *             elif isinstance(x, (str, unicode)):             # <<<<<<<<<<<<<<
+ *                 str_keys.append(x)
+ *             else:
+ */
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyString_Type)));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)((PyObject*)&PyString_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyString_Type)));
+    __Pyx_INCREF(((PyObject *)((PyObject*)&PyUnicode_Type)));
+    PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)((PyObject*)&PyUnicode_Type)));
+    __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyUnicode_Type)));
+    __pyx_t_1 = PyObject_IsInstance(__pyx_v_x, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":609
+ *                 int_keys.append(x)
+ *             elif isinstance(x, (str, unicode)):
+ *                 str_keys.append(x)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 raise ValueError("Non int/str key value found in dict")
+ */
+      __pyx_t_3 = __Pyx_PyObject_Append(__pyx_v_str_keys, __pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 609; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L9;
+    }
+    /*else*/ {
+
+      /* "/root/package/cpyamf/amf3.pyx":611
+ *                 str_keys.append(x)
+ *             else:
+ *                 raise ValueError("Non int/str key value found in dict")             # <<<<<<<<<<<<<<
+ * 
+ *         # Make sure the integer keys are within range
+ */
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_6));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
+      __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_4, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_L9:;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":614
+ * 
+ *         # Make sure the integer keys are within range
+ *         l = len(int_keys)             # <<<<<<<<<<<<<<
+ * 
+ *         for x in int_keys:
+ */
+  __pyx_t_6 = PyObject_Length(__pyx_v_int_keys); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_6); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_v_l);
+  __pyx_v_l = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":616
+ *         l = len(int_keys)
+ * 
+ *         for x in int_keys:             # <<<<<<<<<<<<<<
+ *             if l < x <= 0:
+ *                 # treat as a string key
+ */
+  if (PyList_CheckExact(__pyx_v_int_keys) || PyTuple_CheckExact(__pyx_v_int_keys)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_int_keys; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_int_keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else {
+      __pyx_t_4 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_4) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_DECREF(__pyx_v_x);
+    __pyx_v_x = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":617
+ * 
+ *         for x in int_keys:
+ *             if l < x <= 0:             # <<<<<<<<<<<<<<
+ *                 # treat as a string key
+ *                 str_keys.append(x)
+ */
+    __pyx_t_4 = PyObject_RichCompare(__pyx_v_l, __pyx_v_x, Py_LT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_IsTrue(__pyx_t_4)) {
+      __Pyx_DECREF(__pyx_t_4);
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_x, __pyx_int_0, Py_LE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":619
+ *             if l < x <= 0:
+ *                 # treat as a string key
+ *                 str_keys.append(x)             # <<<<<<<<<<<<<<
+ *                 del int_keys[int_keys.index(x)]
+ * 
+ */
+      __pyx_t_4 = __Pyx_PyObject_Append(__pyx_v_str_keys, __pyx_v_x); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 619; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":620
+ *                 # treat as a string key
+ *                 str_keys.append(x)
+ *                 del int_keys[int_keys.index(x)]             # <<<<<<<<<<<<<<
+ * 
+ *         int_keys.sort()
+ */
+      __pyx_t_4 = PyObject_GetAttr(__pyx_v_int_keys, __pyx_n_s__index); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_v_x);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_x);
+      __Pyx_GIVEREF(__pyx_v_x);
+      __pyx_t_7 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (PyObject_DelItem(__pyx_v_int_keys, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L12;
+    }
+    __pyx_L12:;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":622
+ *                 del int_keys[int_keys.index(x)]
+ * 
+ *         int_keys.sort()             # <<<<<<<<<<<<<<
+ * 
+ *         # If integer keys don't start at 0, they will be treated as strings
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_int_keys, __pyx_n_s__sort); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":625
+ * 
+ *         # If integer keys don't start at 0, they will be treated as strings
+ *         if len(int_keys) > 0 and int_keys[0] != 0:             # <<<<<<<<<<<<<<
+ *             for x in int_keys:
+ *                 str_keys.append(str(x))
+ */
+  __pyx_t_6 = PyObject_Length(__pyx_v_int_keys); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 625; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = (__pyx_t_6 > 0);
+  if (__pyx_t_1) {
+    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_int_keys, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 625; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_2 = PyObject_RichCompare(__pyx_t_7, __pyx_int_0, Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 625; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 625; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_9 = __pyx_t_8;
+  } else {
+    __pyx_t_9 = __pyx_t_1;
+  }
+  if (__pyx_t_9) {
+
+    /* "/root/package/cpyamf/amf3.pyx":626
+ *         # If integer keys don't start at 0, they will be treated as strings
+ *         if len(int_keys) > 0 and int_keys[0] != 0:
+ *             for x in int_keys:             # <<<<<<<<<<<<<<
+ *                 str_keys.append(str(x))
+ *                 del int_keys[int_keys.index(x)]
+ */
+    if (PyList_CheckExact(__pyx_v_int_keys) || PyTuple_CheckExact(__pyx_v_int_keys)) {
+      __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_int_keys; __Pyx_INCREF(__pyx_t_2);
+    } else {
+      __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_int_keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++;
+      } else {
+        __pyx_t_7 = PyIter_Next(__pyx_t_2);
+        if (!__pyx_t_7) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_7);
+      }
+      __Pyx_DECREF(__pyx_v_x);
+      __pyx_v_x = __pyx_t_7;
+      __pyx_t_7 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":627
+ *         if len(int_keys) > 0 and int_keys[0] != 0:
+ *             for x in int_keys:
+ *                 str_keys.append(str(x))             # <<<<<<<<<<<<<<
+ *                 del int_keys[int_keys.index(x)]
+ * 
+ */
+      __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_INCREF(__pyx_v_x);
+      PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_x);
+      __Pyx_GIVEREF(__pyx_v_x);
+      __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)&PyString_Type)), __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = __Pyx_PyObject_Append(__pyx_v_str_keys, __pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":628
+ *             for x in int_keys:
+ *                 str_keys.append(str(x))
+ *                 del int_keys[int_keys.index(x)]             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, len(int_keys) << 1 | REFERENCE_BIT)
+ */
+      __pyx_t_7 = PyObject_GetAttr(__pyx_v_int_keys, __pyx_n_s__index); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_v_x);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_x);
+      __Pyx_GIVEREF(__pyx_v_x);
+      __pyx_t_4 = PyObject_Call(__pyx_t_7, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (PyObject_DelItem(__pyx_v_int_keys, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf3.pyx":630
+ *                 del int_keys[int_keys.index(x)]
+ * 
+ *         _write_int(self.stream, len(int_keys) << 1 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *         for x in str_keys:
+ */
+  __pyx_t_6 = PyObject_Length(__pyx_v_int_keys); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 630; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_t_6 << 1) | 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 630; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":632
+ *         _write_int(self.stream, len(int_keys) << 1 | REFERENCE_BIT)
+ * 
+ *         for x in str_keys:             # <<<<<<<<<<<<<<
+ *             self._writeString(x)
+ *             self._writeElement(n[x], None)
+ */
+  if (PyList_CheckExact(__pyx_v_str_keys) || PyTuple_CheckExact(__pyx_v_str_keys)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_str_keys; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_str_keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else {
+      __pyx_t_4 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_4) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_DECREF(__pyx_v_x);
+    __pyx_v_x = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":633
+ * 
+ *         for x in str_keys:
+ *             self._writeString(x)             # <<<<<<<<<<<<<<
+ *             self._writeElement(n[x], None)
+ * 
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_x); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 633; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf3.pyx":634
+ *         for x in str_keys:
+ *             self._writeString(x)
+ *             self._writeElement(n[x], None)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(0x01)
+ */
+    __pyx_t_4 = PyObject_GetItem(__pyx_v_n, __pyx_v_x); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_4, Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":636
+ *             self._writeElement(n[x], None)
+ * 
+ *         self.stream.write_uchar(0x01)             # <<<<<<<<<<<<<<
+ * 
+ *         for k in int_keys:
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0x01); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 636; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":638
+ *         self.stream.write_uchar(0x01)
+ * 
+ *         for k in int_keys:             # <<<<<<<<<<<<<<
+ *             self._writeElement(n[k], None)
+ * 
+ */
+  if (PyList_CheckExact(__pyx_v_int_keys) || PyTuple_CheckExact(__pyx_v_int_keys)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_int_keys; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_int_keys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 638; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
+    } else {
+      __pyx_t_4 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_4) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 638; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_DECREF(__pyx_v_k);
+    __pyx_v_k = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":639
+ * 
+ *         for k in int_keys:
+ *             self._writeElement(n[k], None)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_4 = PyObject_GetItem(__pyx_v_n, __pyx_v_k); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_4, Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":641
+ *             self._writeElement(n[k], None)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeObject(self, object obj, object use_proxies) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeDict");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_keys);
+  __Pyx_DECREF(__pyx_v_int_keys);
+  __Pyx_DECREF(__pyx_v_str_keys);
+  __Pyx_DECREF(__pyx_v_x);
+  __Pyx_DECREF(__pyx_v_l);
+  __Pyx_DECREF(__pyx_v_k);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":643
+ *         return 0
+ * 
+ *     cdef int _writeObject(self, object obj, object use_proxies) except -1:             # <<<<<<<<<<<<<<
+ *         cdef bint class_ref = 0
+ *         cdef long ref
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeObject(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_use_proxies) {
+  int __pyx_v_class_ref;
+  long __pyx_v_ref;
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_v_kls;
+  PyObject *__pyx_v_definition;
+  PyObject *__pyx_v_alias;
+  PyObject *__pyx_v_alias_klass;
+  PyObject *__pyx_v_meta;
+  PyObject *__pyx_v_attrs;
+  PyObject *__pyx_v_attr;
+  PyObject *__pyx_v_value;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  long __pyx_t_10;
+  __Pyx_RefNannySetupContext("_writeObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_obj);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_kls = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_definition = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_alias = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_alias_klass = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_meta = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attrs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attr = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_value = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":644
+ * 
+ *     cdef int _writeObject(self, object obj, object use_proxies) except -1:
+ *         cdef bint class_ref = 0             # <<<<<<<<<<<<<<
+ *         cdef long ref
+ *         cdef char *buf = NULL
+ */
+  __pyx_v_class_ref = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":646
+ *         cdef bint class_ref = 0
+ *         cdef long ref
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ * 
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf3.pyx":647
+ *         cdef long ref
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is None:
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":649
+ *         cdef Py_ssize_t l = 0
+ * 
+ *         if use_proxies is None:             # <<<<<<<<<<<<<<
+ *             use_proxies = self.use_proxies
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_use_proxies == Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":650
+ * 
+ *         if use_proxies is None:
+ *             use_proxies = self.use_proxies             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is True:
+ */
+    __Pyx_INCREF(__pyx_v_self->use_proxies);
+    __Pyx_DECREF(__pyx_v_use_proxies);
+    __pyx_v_use_proxies = __pyx_v_self->use_proxies;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":652
+ *             use_proxies = self.use_proxies
+ * 
+ *         if use_proxies is True:             # <<<<<<<<<<<<<<
+ *             self.writeProxy(obj)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = (__pyx_v_use_proxies == __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":653
+ * 
+ *         if use_proxies is True:
+ *             self.writeProxy(obj)             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__writeProxy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 653; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 653; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 653; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":655
+ *             self.writeProxy(obj)
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(TYPE_OBJECT)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":657
+ *             return 0
+ * 
+ *         self.stream.write_uchar(TYPE_OBJECT)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, obj)
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 10); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 657; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":659
+ *         self.stream.write_uchar(TYPE_OBJECT)
+ * 
+ *         ref = _get_object_reference(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":661
+ *         ref = _get_object_reference(self.context, obj)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_ref != -1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":662
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, obj)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 662; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/amf3.pyx":664
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         # object is not referenced, serialise it
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":667
+ * 
+ *         # object is not referenced, serialise it
+ *         kls = obj.__class__             # <<<<<<<<<<<<<<
+ *         definition = self.context.getClass(kls)
+ *         alias = None
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s____class__); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_v_kls);
+  __pyx_v_kls = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":668
+ *         # object is not referenced, serialise it
+ *         kls = obj.__class__
+ *         definition = self.context.getClass(kls)             # <<<<<<<<<<<<<<
+ *         alias = None
+ * 
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__getClass); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 668; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 668; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_kls);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_kls);
+  __Pyx_GIVEREF(__pyx_v_kls);
+  __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 668; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_definition);
+  __pyx_v_definition = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":669
+ *         kls = obj.__class__
+ *         definition = self.context.getClass(kls)
+ *         alias = None             # <<<<<<<<<<<<<<
+ * 
+ *         if definition is not None:
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_alias);
+  __pyx_v_alias = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":671
+ *         alias = None
+ * 
+ *         if definition is not None:             # <<<<<<<<<<<<<<
+ *             class_ref = 1
+ *             alias = definition.alias
+ */
+  __pyx_t_1 = (__pyx_v_definition != Py_None);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":672
+ * 
+ *         if definition is not None:
+ *             class_ref = 1             # <<<<<<<<<<<<<<
+ *             alias = definition.alias
+ *         else:
+ */
+    __pyx_v_class_ref = 1;
+
+    /* "/root/package/cpyamf/amf3.pyx":673
+ *         if definition is not None:
+ *             class_ref = 1
+ *             alias = definition.alias             # <<<<<<<<<<<<<<
+ *         else:
+ *             try:
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__alias); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_v_alias);
+    __pyx_v_alias = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":675
+ *             alias = definition.alias
+ *         else:
+ *             try:             # <<<<<<<<<<<<<<
+ *                 alias = pyamf.get_class_alias(kls)
+ *             except pyamf.UnknownClassAlias:
+ */
+    {
+      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+      __Pyx_XGOTREF(__pyx_save_exc_type);
+      __Pyx_XGOTREF(__pyx_save_exc_value);
+      __Pyx_XGOTREF(__pyx_save_exc_tb);
+      /*try:*/ {
+
+        /* "/root/package/cpyamf/amf3.pyx":676
+ *         else:
+ *             try:
+ *                 alias = pyamf.get_class_alias(kls)             # <<<<<<<<<<<<<<
+ *             except pyamf.UnknownClassAlias:
+ *                 alias_klass = pyamf._get_alias_type(kls)
+ */
+        __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__get_class_alias); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_INCREF(__pyx_v_kls);
+        PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_kls);
+        __Pyx_GIVEREF(__pyx_v_kls);
+        __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_v_alias);
+        __pyx_v_alias = __pyx_t_4;
+        __pyx_t_4 = 0;
+      }
+      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+      goto __pyx_L14_try_end;
+      __pyx_L7_error:;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":677
+ *             try:
+ *                 alias = pyamf.get_class_alias(kls)
+ *             except pyamf.UnknownClassAlias:             # <<<<<<<<<<<<<<
+ *                 alias_klass = pyamf._get_alias_type(kls)
+ *                 meta = util.get_class_meta(kls)
+ */
+      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__UnknownClassAlias); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_5 = PyErr_ExceptionMatches(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (__pyx_t_5) {
+        __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeObject");
+        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_4, &__pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_GOTREF(__pyx_t_3);
+
+        /* "/root/package/cpyamf/amf3.pyx":678
+ *                 alias = pyamf.get_class_alias(kls)
+ *             except pyamf.UnknownClassAlias:
+ *                 alias_klass = pyamf._get_alias_type(kls)             # <<<<<<<<<<<<<<
+ *                 meta = util.get_class_meta(kls)
+ * 
+ */
+        __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s___get_alias_type); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_INCREF(__pyx_v_kls);
+        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_kls);
+        __Pyx_GIVEREF(__pyx_v_kls);
+        __pyx_t_9 = PyObject_Call(__pyx_t_8, __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_v_alias_klass);
+        __pyx_v_alias_klass = __pyx_t_9;
+        __pyx_t_9 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":679
+ *             except pyamf.UnknownClassAlias:
+ *                 alias_klass = pyamf._get_alias_type(kls)
+ *                 meta = util.get_class_meta(kls)             # <<<<<<<<<<<<<<
+ * 
+ *                 alias = alias_klass(kls, defer=True, **meta)
+ */
+        __pyx_t_9 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_7 = PyObject_GetAttr(__pyx_t_9, __pyx_n_s__get_class_meta); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_INCREF(__pyx_v_kls);
+        PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_kls);
+        __Pyx_GIVEREF(__pyx_v_kls);
+        __pyx_t_8 = PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_v_meta);
+        __pyx_v_meta = __pyx_t_8;
+        __pyx_t_8 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":681
+ *                 meta = util.get_class_meta(kls)
+ * 
+ *                 alias = alias_klass(kls, defer=True, **meta)             # <<<<<<<<<<<<<<
+ * 
+ *             definition = amf3.ClassDefinition(alias)
+ */
+        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_INCREF(__pyx_v_kls);
+        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_kls);
+        __Pyx_GIVEREF(__pyx_v_kls);
+        __pyx_t_9 = PyDict_New(); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_9));
+        __pyx_t_7 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        if (PyDict_SetItem(__pyx_t_9, ((PyObject *)__pyx_n_s__defer), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (PyDict_Update(((PyObject *)__pyx_t_9), __pyx_v_meta) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_v_alias_klass, __pyx_t_8, ((PyObject *)__pyx_t_9)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(((PyObject *)__pyx_t_9)); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_v_alias);
+        __pyx_v_alias = __pyx_t_7;
+        __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        goto __pyx_L8_exception_handled;
+      }
+      __pyx_L9_except_error:;
+      __Pyx_XGIVEREF(__pyx_save_exc_type);
+      __Pyx_XGIVEREF(__pyx_save_exc_value);
+      __Pyx_XGIVEREF(__pyx_save_exc_tb);
+      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+      goto __pyx_L1_error;
+      __pyx_L8_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_save_exc_type);
+      __Pyx_XGIVEREF(__pyx_save_exc_value);
+      __Pyx_XGIVEREF(__pyx_save_exc_tb);
+      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+      __pyx_L14_try_end:;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":683
+ *                 alias = alias_klass(kls, defer=True, **meta)
+ * 
+ *             definition = amf3.ClassDefinition(alias)             # <<<<<<<<<<<<<<
+ * 
+ *             self.context.addClass(definition, alias.klass)
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__ClassDefinition); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 683; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 683; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_alias);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_alias);
+    __Pyx_GIVEREF(__pyx_v_alias);
+    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 683; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_v_definition);
+    __pyx_v_definition = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":685
+ *             definition = amf3.ClassDefinition(alias)
+ * 
+ *             self.context.addClass(definition, alias.klass)             # <<<<<<<<<<<<<<
+ * 
+ *         if class_ref:
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__addClass); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 685; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__klass); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 685; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 685; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_definition);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_definition);
+    __Pyx_GIVEREF(__pyx_v_definition);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 685; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":687
+ *             self.context.addClass(definition, alias.klass)
+ * 
+ *         if class_ref:             # <<<<<<<<<<<<<<
+ *             PyString_AsStringAndSize(definition.reference, &buf, &l)
+ *             self.stream.write(buf, l)
+ */
+  __pyx_t_1 = __pyx_v_class_ref;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":688
+ * 
+ *         if class_ref:
+ *             PyString_AsStringAndSize(definition.reference, &buf, &l)             # <<<<<<<<<<<<<<
+ *             self.stream.write(buf, l)
+ *         else:
+ */
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__reference); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyString_AsStringAndSize(__pyx_t_4, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":689
+ *         if class_ref:
+ *             PyString_AsStringAndSize(definition.reference, &buf, &l)
+ *             self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ *         else:
+ *             ref = 0
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 689; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L17;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":691
+ *             self.stream.write(buf, l)
+ *         else:
+ *             ref = 0             # <<<<<<<<<<<<<<
+ * 
+ *             if definition.encoding != OBJECT_ENCODING_EXTERNAL:
+ */
+    __pyx_v_ref = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":693
+ *             ref = 0
+ * 
+ *             if definition.encoding != OBJECT_ENCODING_EXTERNAL:             # <<<<<<<<<<<<<<
+ *                 ref += definition.attr_len << 4
+ * 
+ */
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__encoding); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_4, __pyx_int_1, Py_NE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":694
+ * 
+ *             if definition.encoding != OBJECT_ENCODING_EXTERNAL:
+ *                 ref += definition.attr_len << 4             # <<<<<<<<<<<<<<
+ * 
+ *             _write_int(self.stream, ref | definition.encoding << 2 |
+ */
+      __pyx_t_3 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__attr_len); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 694; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PyNumber_Lshift(__pyx_t_3, __pyx_int_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 694; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_PyInt_AsLong(__pyx_t_4); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 694; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_v_ref += __pyx_t_10;
+      goto __pyx_L18;
+    }
+    __pyx_L18:;
+
+    /* "/root/package/cpyamf/amf3.pyx":696
+ *                 ref += definition.attr_len << 4
+ * 
+ *             _write_int(self.stream, ref | definition.encoding << 2 |             # <<<<<<<<<<<<<<
+ *                 REFERENCE_BIT << 1 | REFERENCE_BIT)
+ * 
+ */
+    __pyx_t_4 = PyInt_FromLong(__pyx_v_ref); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__encoding); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PyNumber_Lshift(__pyx_t_3, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Or(__pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Or(__pyx_t_3, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Or(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 697; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_10 = __Pyx_PyInt_AsLong(__pyx_t_3); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 697; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_10); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf3.pyx":704
+ *             # again.
+ *             definition.reference = _encoded_int(
+ *                 definition.reference << 2 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *             if alias.anonymous:
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__reference); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PyNumber_Lshift(__pyx_t_3, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Or(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_10 = __Pyx_PyInt_AsLong(__pyx_t_3); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__encoded_int(__pyx_t_10); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+
+    /* "/root/package/cpyamf/amf3.pyx":703
+ *             # class is encoded, class_ref will be True and never get here
+ *             # again.
+ *             definition.reference = _encoded_int(             # <<<<<<<<<<<<<<
+ *                 definition.reference << 2 | REFERENCE_BIT)
+ * 
+ */
+    if (PyObject_SetAttr(__pyx_v_definition, __pyx_n_s__reference, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":706
+ *                 definition.reference << 2 | REFERENCE_BIT)
+ * 
+ *             if alias.anonymous:             # <<<<<<<<<<<<<<
+ *                 self.stream.write_uchar(0x01)
+ *             else:
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__anonymous); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":707
+ * 
+ *             if alias.anonymous:
+ *                 self.stream.write_uchar(0x01)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._writeString(alias.alias)
+ */
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0x01); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 707; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L19;
+    }
+    /*else*/ {
+
+      /* "/root/package/cpyamf/amf3.pyx":709
+ *                 self.stream.write_uchar(0x01)
+ *             else:
+ *                 self._writeString(alias.alias)             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.external:
+ */
+      __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__alias); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_3); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __pyx_L19:;
+  }
+  __pyx_L17:;
+
+  /* "/root/package/cpyamf/amf3.pyx":711
+ *                 self._writeString(alias.alias)
+ * 
+ *         if alias.external:             # <<<<<<<<<<<<<<
+ *             obj.__writeamf__(amf3.DataOutput(self))
+ * 
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__external); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":712
+ * 
+ *         if alias.external:
+ *             obj.__writeamf__(amf3.DataOutput(self))             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s____writeamf__); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__DataOutput); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    __pyx_t_7 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":714
+ *             obj.__writeamf__(amf3.DataOutput(self))
+ * 
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.encode_attrs is not None:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L20;
+  }
+  __pyx_L20:;
+
+  /* "/root/package/cpyamf/amf3.pyx":716
+ *             return 0
+ * 
+ *         if alias.encode_attrs is not None:             # <<<<<<<<<<<<<<
+ *             return self._writeSealedObject(obj, alias, definition, class_ref)
+ * 
+ */
+  __pyx_t_7 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__encode_attrs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 716; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = (__pyx_t_7 != Py_None);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":717
+ * 
+ *         if alias.encode_attrs is not None:
+ *             return self._writeSealedObject(obj, alias, definition, class_ref)             # <<<<<<<<<<<<<<
+ * 
+ *         attrs = alias.getEncodableAttributes(obj, codec=self)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeSealedObject(__pyx_v_self, __pyx_v_obj, __pyx_v_alias, __pyx_v_definition, __pyx_v_class_ref); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 717; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L21;
+  }
+  __pyx_L21:;
+
+  /* "/root/package/cpyamf/amf3.pyx":719
+ *             return self._writeSealedObject(obj, alias, definition, class_ref)
+ * 
+ *         attrs = alias.getEncodableAttributes(obj, codec=self)             # <<<<<<<<<<<<<<
+ * 
+ *         if alias.static_attrs:
+ */
+  __pyx_t_7 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s_7); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_obj);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+  __Pyx_GIVEREF(__pyx_v_obj);
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyEval_CallObjectWithKeywords(__pyx_t_7, __pyx_t_4, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_attrs);
+  __pyx_v_attrs = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":721
+ *         attrs = alias.getEncodableAttributes(obj, codec=self)
+ * 
+ *         if alias.static_attrs:             # <<<<<<<<<<<<<<
+ *             if not class_ref:
+ *                 for attr in alias.static_attrs:
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":722
+ * 
+ *         if alias.static_attrs:
+ *             if not class_ref:             # <<<<<<<<<<<<<<
+ *                 for attr in alias.static_attrs:
+ *                     self._writeString(attr)
+ */
+    __pyx_t_1 = (!__pyx_v_class_ref);
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":723
+ *         if alias.static_attrs:
+ *             if not class_ref:
+ *                 for attr in alias.static_attrs:             # <<<<<<<<<<<<<<
+ *                     self._writeString(attr)
+ * 
+ */
+      __pyx_t_2 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
+        __pyx_t_6 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
+      } else {
+        __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_3))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_3)) break;
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++;
+        } else {
+          __pyx_t_2 = PyIter_Next(__pyx_t_3);
+          if (!__pyx_t_2) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_2);
+        }
+        __Pyx_DECREF(__pyx_v_attr);
+        __pyx_v_attr = __pyx_t_2;
+        __pyx_t_2 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":724
+ *             if not class_ref:
+ *                 for attr in alias.static_attrs:
+ *                     self._writeString(attr)             # <<<<<<<<<<<<<<
+ * 
+ *             for attr in alias.static_attrs:
+ */
+        __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_attr); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L23;
+    }
+    __pyx_L23:;
+
+    /* "/root/package/cpyamf/amf3.pyx":726
+ *                     self._writeString(attr)
+ * 
+ *             for attr in alias.static_attrs:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(attrs.pop(attr), None)
+ * 
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 726; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
+      __pyx_t_6 = 0; __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2);
+    } else {
+      __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 726; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
+      } else {
+        __pyx_t_3 = PyIter_Next(__pyx_t_2);
+        if (!__pyx_t_3) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 726; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_DECREF(__pyx_v_attr);
+      __pyx_v_attr = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":727
+ * 
+ *             for attr in alias.static_attrs:
+ *                 self._writeElement(attrs.pop(attr), None)             # <<<<<<<<<<<<<<
+ * 
+ *             if definition.encoding == OBJECT_ENCODING_STATIC:
+ */
+      __pyx_t_3 = PyObject_GetAttr(__pyx_v_attrs, __pyx_n_s__pop); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 727; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 727; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_v_attr);
+      PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_attr);
+      __Pyx_GIVEREF(__pyx_v_attr);
+      __pyx_t_7 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 727; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_7, Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 727; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":729
+ *                 self._writeElement(attrs.pop(attr), None)
+ * 
+ *             if definition.encoding == OBJECT_ENCODING_STATIC:             # <<<<<<<<<<<<<<
+ *                 return 0
+ * 
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__encoding); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_7 = PyObject_RichCompare(__pyx_t_2, __pyx_int_0, Py_EQ); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":730
+ * 
+ *             if definition.encoding == OBJECT_ENCODING_STATIC:
+ *                 return 0             # <<<<<<<<<<<<<<
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+      goto __pyx_L28;
+    }
+    __pyx_L28:;
+    goto __pyx_L22;
+  }
+  __pyx_L22:;
+
+  /* "/root/package/cpyamf/amf3.pyx":732
+ *                 return 0
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:             # <<<<<<<<<<<<<<
+ *             if attrs:
+ *                 for attr, value in attrs.iteritems():
+ */
+  __pyx_t_7 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__encoding); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_7, __pyx_int_2, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":733
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ *             if attrs:             # <<<<<<<<<<<<<<
+ *                 for attr, value in attrs.iteritems():
+ *                     self._writeString(attr)
+ */
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_attrs); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":734
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ *             if attrs:
+ *                 for attr, value in attrs.iteritems():             # <<<<<<<<<<<<<<
+ *                     self._writeString(attr)
+ *                     self._writeElement(value, None)
+ */
+      __pyx_t_2 = PyObject_GetAttr(__pyx_v_attrs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_7 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PyList_CheckExact(__pyx_t_7) || PyTuple_CheckExact(__pyx_t_7)) {
+        __pyx_t_6 = 0; __pyx_t_2 = __pyx_t_7; __Pyx_INCREF(__pyx_t_2);
+      } else {
+        __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_2);
+      }
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_2))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+          __pyx_t_7 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+          __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++;
+        } else {
+          __pyx_t_7 = PyIter_Next(__pyx_t_2);
+          if (!__pyx_t_7) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_7);
+        }
+        if (PyTuple_CheckExact(__pyx_t_7) && likely(PyTuple_GET_SIZE(__pyx_t_7) == 2)) {
+          PyObject* tuple = __pyx_t_7;
+          __pyx_t_4 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_4);
+          __pyx_t_3 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_DECREF(__pyx_v_attr);
+          __pyx_v_attr = __pyx_t_4;
+          __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_v_value);
+          __pyx_v_value = __pyx_t_3;
+          __pyx_t_3 = 0;
+        } else {
+          __pyx_t_9 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_3);
+          if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_DECREF(__pyx_v_attr);
+          __pyx_v_attr = __pyx_t_4;
+          __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_v_value);
+          __pyx_v_value = __pyx_t_3;
+          __pyx_t_3 = 0;
+        }
+
+        /* "/root/package/cpyamf/amf3.pyx":735
+ *             if attrs:
+ *                 for attr, value in attrs.iteritems():
+ *                     self._writeString(attr)             # <<<<<<<<<<<<<<
+ *                     self._writeElement(value, None)
+ * 
+ */
+        __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_attr); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 735; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+        /* "/root/package/cpyamf/amf3.pyx":736
+ *                 for attr, value in attrs.iteritems():
+ *                     self._writeString(attr)
+ *                     self._writeElement(value, None)             # <<<<<<<<<<<<<<
+ * 
+ *             self.stream.write_uchar(0x01)
+ */
+        __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_value, Py_None); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      goto __pyx_L30;
+    }
+    __pyx_L30:;
+
+    /* "/root/package/cpyamf/amf3.pyx":738
+ *                     self._writeElement(value, None)
+ * 
+ *             self.stream.write_uchar(0x01)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0x01); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 738; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L29;
+  }
+  __pyx_L29:;
+
+  /* "/root/package/cpyamf/amf3.pyx":740
+ *             self.stream.write_uchar(0x01)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeSealedObject(self, object obj, object alias,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeObject");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kls);
+  __Pyx_DECREF(__pyx_v_definition);
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_alias_klass);
+  __Pyx_DECREF(__pyx_v_meta);
+  __Pyx_DECREF(__pyx_v_attrs);
+  __Pyx_DECREF(__pyx_v_attr);
+  __Pyx_DECREF(__pyx_v_value);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":742
+ *         return 0
+ * 
+ *     cdef int _writeSealedObject(self, object obj, object alias,             # <<<<<<<<<<<<<<
+ *                                 object definition, bint class_ref) except -1:
+ *         """
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeSealedObject(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_alias, PyObject *__pyx_v_definition, int __pyx_v_class_ref) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_l;
+  Py_ssize_t __pyx_v_static_len;
+  PyObject *__pyx_v_values;
+  PyObject *__pyx_v_static_attrs;
+  PyObject *__pyx_v_attr;
+  PyObject *__pyx_v_attrs;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("_writeSealedObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_obj);
+  __Pyx_INCREF(__pyx_v_alias);
+  __Pyx_INCREF(__pyx_v_definition);
+  __pyx_v_values = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_static_attrs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attr = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attrs = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":748
+ *         """
+ *         cdef Py_ssize_t i, l
+ *         cdef Py_ssize_t static_len = 0             # <<<<<<<<<<<<<<
+ * 
+ *         values = alias.getEncodableValues(obj)
+ */
+  __pyx_v_static_len = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":750
+ *         cdef Py_ssize_t static_len = 0
+ * 
+ *         values = alias.getEncodableValues(obj)             # <<<<<<<<<<<<<<
+ *         static_attrs = alias.static_attrs
+ * 
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__getEncodableValues); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_obj);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_obj);
+  __Pyx_GIVEREF(__pyx_v_obj);
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_values);
+  __pyx_v_values = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":751
+ * 
+ *         values = alias.getEncodableValues(obj)
+ *         static_attrs = alias.static_attrs             # <<<<<<<<<<<<<<
+ * 
+ *         if static_attrs:
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__static_attrs); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_static_attrs);
+  __pyx_v_static_attrs = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":753
+ *         static_attrs = alias.static_attrs
+ * 
+ *         if static_attrs:             # <<<<<<<<<<<<<<
+ *             static_len = len(static_attrs)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_static_attrs); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 753; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":754
+ * 
+ *         if static_attrs:
+ *             static_len = len(static_attrs)             # <<<<<<<<<<<<<<
+ * 
+ *             if not class_ref:
+ */
+    __pyx_t_5 = PyObject_Length(__pyx_v_static_attrs); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_static_len = __pyx_t_5;
+
+    /* "/root/package/cpyamf/amf3.pyx":756
+ *             static_len = len(static_attrs)
+ * 
+ *             if not class_ref:             # <<<<<<<<<<<<<<
+ *                 for attr in static_attrs:
+ *                     self._writeString(attr)
+ */
+    __pyx_t_4 = (!__pyx_v_class_ref);
+    if (__pyx_t_4) {
+
+      /* "/root/package/cpyamf/amf3.pyx":757
+ * 
+ *             if not class_ref:
+ *                 for attr in static_attrs:             # <<<<<<<<<<<<<<
+ *                     self._writeString(attr)
+ * 
+ */
+      if (PyList_CheckExact(__pyx_v_static_attrs) || PyTuple_CheckExact(__pyx_v_static_attrs)) {
+        __pyx_t_5 = 0; __pyx_t_3 = __pyx_v_static_attrs; __Pyx_INCREF(__pyx_t_3);
+      } else {
+        __pyx_t_5 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_static_attrs); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_3))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_3)) break;
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_2); __pyx_t_5++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_2); __pyx_t_5++;
+        } else {
+          __pyx_t_2 = PyIter_Next(__pyx_t_3);
+          if (!__pyx_t_2) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_2);
+        }
+        __Pyx_DECREF(__pyx_v_attr);
+        __pyx_v_attr = __pyx_t_2;
+        __pyx_t_2 = 0;
+
+        /* "/root/package/cpyamf/amf3.pyx":758
+ *             if not class_ref:
+ *                 for attr in static_attrs:
+ *                     self._writeString(attr)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < static_len:
+ */
+        __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_attr); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 758; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L4;
+    }
+    __pyx_L4:;
+
+    /* "/root/package/cpyamf/amf3.pyx":760
+ *                     self._writeString(attr)
+ * 
+ *             for i from 0 <= i < static_len:             # <<<<<<<<<<<<<<
+ *                 self._writeElement(values[i], None)
+ * 
+ */
+    __pyx_t_5 = __pyx_v_static_len;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":761
+ * 
+ *             for i from 0 <= i < static_len:
+ *                 self._writeElement(values[i], None)             # <<<<<<<<<<<<<<
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ */
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_values, __pyx_v_i, sizeof(Py_ssize_t), PyInt_FromSsize_t); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 761; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_3, Py_None); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 761; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":763
+ *                 self._writeElement(values[i], None)
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:             # <<<<<<<<<<<<<<
+ *             attrs = alias.encode_attrs
+ *             l = len(attrs)
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_definition, __pyx_n_s__encoding); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_int_2, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":764
+ * 
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ *             attrs = alias.encode_attrs             # <<<<<<<<<<<<<<
+ *             l = len(attrs)
+ * 
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__encode_attrs); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 764; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_v_attrs);
+    __pyx_v_attrs = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":765
+ *         if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+ *             attrs = alias.encode_attrs
+ *             l = len(attrs)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from static_len <= i < l:
+ */
+    __pyx_t_5 = PyObject_Length(__pyx_v_attrs); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 765; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_l = __pyx_t_5;
+
+    /* "/root/package/cpyamf/amf3.pyx":767
+ *             l = len(attrs)
+ * 
+ *             for i from static_len <= i < l:             # <<<<<<<<<<<<<<
+ *                 self._writeString(attrs[i])
+ *                 self._writeElement(values[i], None)
+ */
+    __pyx_t_5 = __pyx_v_l;
+    for (__pyx_v_i = __pyx_v_static_len; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":768
+ * 
+ *             for i from static_len <= i < l:
+ *                 self._writeString(attrs[i])             # <<<<<<<<<<<<<<
+ *                 self._writeElement(values[i], None)
+ * 
+ */
+      __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_attrs, __pyx_v_i, sizeof(Py_ssize_t), PyInt_FromSsize_t); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_2); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":769
+ *             for i from static_len <= i < l:
+ *                 self._writeString(attrs[i])
+ *                 self._writeElement(values[i], None)             # <<<<<<<<<<<<<<
+ * 
+ *             self.stream.write_uchar(0x01)
+ */
+      __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_values, __pyx_v_i, sizeof(Py_ssize_t), PyInt_FromSsize_t); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_t_2, Py_None); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":771
+ *                 self._writeElement(values[i], None)
+ * 
+ *             self.stream.write_uchar(0x01)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 0x01); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 771; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L9;
+  }
+  __pyx_L9:;
+
+  /* "/root/package/cpyamf/amf3.pyx":773
+ *             self.stream.write_uchar(0x01)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeByteArray(self, object n) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeSealedObject");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_values);
+  __Pyx_DECREF(__pyx_v_static_attrs);
+  __Pyx_DECREF(__pyx_v_attr);
+  __Pyx_DECREF(__pyx_v_attrs);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_definition);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":775
+ *         return 0
+ * 
+ *     cdef int _writeByteArray(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeByteArray(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_bytes;
+  int __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_writeByteArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_bytes = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":776
+ * 
+ *     cdef int _writeByteArray(self, object n) except -1:
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ *         cdef Py_ssize_t ref
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf3.pyx":777
+ *     cdef int _writeByteArray(self, object n) except -1:
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":780
+ *         cdef Py_ssize_t ref
+ * 
+ *         self.stream.write_uchar(TYPE_BYTEARRAY)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 12); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":782
+ *         self.stream.write_uchar(TYPE_BYTEARRAY)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_2 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_2;
+
+  /* "/root/package/cpyamf/amf3.pyx":784
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_ref != -1);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":785
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":787
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         bytes = str(n)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":789
+ *         _add_object(self.context, n)
+ * 
+ *         bytes = str(n)             # <<<<<<<<<<<<<<
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ * 
+ */
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_n);
+  __Pyx_GIVEREF(__pyx_v_n);
+  __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)&PyString_Type)), __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_bytes);
+  __pyx_v_bytes = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":790
+ * 
+ *         bytes = str(n)
+ *         PyString_AsStringAndSize(bytes, &buf, &l)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, l << 1 | REFERENCE_BIT)
+ */
+  __pyx_t_1 = PyString_AsStringAndSize(__pyx_v_bytes, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":792
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ * 
+ *         _write_int(self.stream, l << 1 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write(buf, l)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_v_l << 1) | 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":794
+ *         _write_int(self.stream, l << 1 | REFERENCE_BIT)
+ * 
+ *         return self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeVector(self, object n, object use_proxies) except -1:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeByteArray");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_bytes);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":796
+ *         return self.stream.write(buf, l)
+ * 
+ *     cdef int _writeVector(self, object n, object use_proxies) except -1:             # <<<<<<<<<<<<<<
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeVector(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n, PyObject *__pyx_v_use_proxies) {
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_marker;
+  PyObject *__pyx_v_typecode;
+  PyObject *__pyx_v_bytes;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  unsigned char __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  __Pyx_RefNannySetupContext("_writeVector");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_marker = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_typecode = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_bytes = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":797
+ * 
+ *     cdef int _writeVector(self, object n, object use_proxies) except -1:
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ *         cdef Py_ssize_t ref
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf3.pyx":798
+ *     cdef int _writeVector(self, object n, object use_proxies) except -1:
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":801
+ *         cdef Py_ssize_t ref
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             marker, typecode = amf3.VECTOR_TYPECODES[n.typecode]
+ *         except KeyError:
+ */
+  {
+    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+    __Pyx_XGOTREF(__pyx_save_exc_type);
+    __Pyx_XGOTREF(__pyx_save_exc_value);
+    __Pyx_XGOTREF(__pyx_save_exc_tb);
+    /*try:*/ {
+
+      /* "/root/package/cpyamf/amf3.pyx":802
+ * 
+ *         try:
+ *             marker, typecode = amf3.VECTOR_TYPECODES[n.typecode]             # <<<<<<<<<<<<<<
+ *         except KeyError:
+ *             return self._writeList(n.tolist(), use_proxies)
+ */
+      __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__VECTOR_TYPECODES); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__typecode); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyObject_GetItem(__pyx_t_1, __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
+        PyObject* tuple = __pyx_t_3;
+        __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
+        __pyx_t_1 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_v_marker);
+        __pyx_v_marker = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_v_typecode);
+        __pyx_v_typecode = __pyx_t_1;
+        __pyx_t_1 = 0;
+      } else {
+        __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_4, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_4, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_GOTREF(__pyx_t_1);
+        if (__Pyx_EndUnpack(__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_v_marker);
+        __pyx_v_marker = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_v_typecode);
+        __pyx_v_typecode = __pyx_t_1;
+        __pyx_t_1 = 0;
+      }
+    }
+    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+    goto __pyx_L10_try_end;
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":803
+ *         try:
+ *             marker, typecode = amf3.VECTOR_TYPECODES[n.typecode]
+ *         except KeyError:             # <<<<<<<<<<<<<<
+ *             return self._writeList(n.tolist(), use_proxies)
+ * 
+ */
+    __pyx_t_5 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
+    if (__pyx_t_5) {
+      __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeVector");
+      if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_t_2);
+
+      /* "/root/package/cpyamf/amf3.pyx":804
+ *             marker, typecode = amf3.VECTOR_TYPECODES[n.typecode]
+ *         except KeyError:
+ *             return self._writeList(n.tolist(), use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.write_uchar(ord(marker))
+ */
+      __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__tolist); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeList(__pyx_v_self, __pyx_t_6, __pyx_v_use_proxies); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_r = __pyx_t_5;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L6_except_return;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      goto __pyx_L4_exception_handled;
+    }
+    __pyx_L5_except_error:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L1_error;
+    __pyx_L6_except_return:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L0;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    __pyx_L10_try_end:;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":806
+ *             return self._writeList(n.tolist(), use_proxies)
+ * 
+ *         self.stream.write_uchar(ord(marker))             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_marker);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_marker);
+  __Pyx_GIVEREF(__pyx_v_marker);
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_ord, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = __Pyx_PyInt_AsUnsignedChar(__pyx_t_1); if (unlikely((__pyx_t_7 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_7); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":808
+ *         self.stream.write_uchar(ord(marker))
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_8 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_8 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 808; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_8;
+
+  /* "/root/package/cpyamf/amf3.pyx":810
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_9 = (__pyx_v_ref != -1);
+  if (__pyx_t_9) {
+
+    /* "/root/package/cpyamf/amf3.pyx":811
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 811; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf3.pyx":813
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":815
+ *         _add_object(self.context, n)
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(bool(getattr(n, 'fixed', False)))
+ * 
+ */
+  __pyx_t_8 = PyObject_Length(__pyx_v_n); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 815; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_t_8 << 1) | 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 815; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":816
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ *         self.stream.write_uchar(bool(getattr(n, 'fixed', False)))             # <<<<<<<<<<<<<<
+ * 
+ *         bytes = amf3._pack_vector(n, typecode)
+ */
+  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetAttr3(__pyx_v_n, ((PyObject *)__pyx_n_s__fixed), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyInt_AsUnsignedChar(__pyx_t_2); if (unlikely((__pyx_t_7 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_7); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":818
+ *         self.stream.write_uchar(bool(getattr(n, 'fixed', False)))
+ * 
+ *         bytes = amf3._pack_vector(n, typecode)             # <<<<<<<<<<<<<<
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ * 
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s___pack_vector); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_n);
+  __Pyx_GIVEREF(__pyx_v_n);
+  __Pyx_INCREF(__pyx_v_typecode);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_typecode);
+  __Pyx_GIVEREF(__pyx_v_typecode);
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_bytes);
+  __pyx_v_bytes = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":819
+ * 
+ *         bytes = amf3._pack_vector(n, typecode)
+ *         PyString_AsStringAndSize(bytes, &buf, &l)             # <<<<<<<<<<<<<<
+ * 
+ *         return self.stream.write(buf, l)
+ */
+  __pyx_t_5 = PyString_AsStringAndSize(__pyx_v_bytes, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 819; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":821
+ *         PyString_AsStringAndSize(bytes, &buf, &l)
+ * 
+ *         return self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeObjectVector(self, object n) except -1:
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeVector");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_marker);
+  __Pyx_DECREF(__pyx_v_typecode);
+  __Pyx_DECREF(__pyx_v_bytes);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":823
+ *         return self.stream.write(buf, l)
+ * 
+ *     cdef int _writeObjectVector(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeObjectVector(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_x;
+  int __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned char __pyx_t_6;
+  __Pyx_RefNannySetupContext("_writeObjectVector");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":826
+ *         cdef Py_ssize_t ref
+ * 
+ *         self.stream.write_uchar(TYPE_OBJECT_VECTOR)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 16); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":828
+ *         self.stream.write_uchar(TYPE_OBJECT_VECTOR)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_2 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_2;
+
+  /* "/root/package/cpyamf/amf3.pyx":830
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_ref != -1);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":831
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":833
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":835
+ *         _add_object(self.context, n)
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(bool(n.fixed))
+ *         self._writeString(n.classname)
+ */
+  __pyx_t_2 = PyObject_Length(__pyx_v_n); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_t_2 << 1) | 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":836
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ *         self.stream.write_uchar(bool(n.fixed))             # <<<<<<<<<<<<<<
+ *         self._writeString(n.classname)
+ * 
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__fixed); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = __Pyx_PyInt_AsUnsignedChar(__pyx_t_4); if (unlikely((__pyx_t_6 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_6); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":837
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ *         self.stream.write_uchar(bool(n.fixed))
+ *         self._writeString(n.classname)             # <<<<<<<<<<<<<<
+ * 
+ *         for x in n:
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__classname); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":839
+ *         self._writeString(n.classname)
+ * 
+ *         for x in n:             # <<<<<<<<<<<<<<
+ *             self._writeElement(x, None)
+ * 
+ */
+  if (PyList_CheckExact(__pyx_v_n) || PyTuple_CheckExact(__pyx_v_n)) {
+    __pyx_t_2 = 0; __pyx_t_4 = __pyx_v_n; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_n); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
+    } else {
+      __pyx_t_5 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_5) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_DECREF(__pyx_v_x);
+    __pyx_v_x = __pyx_t_5;
+    __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":840
+ * 
+ *         for x in n:
+ *             self._writeElement(x, None)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_x, Py_None); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":842
+ *             self._writeElement(x, None)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeDictionary(self, object n) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeObjectVector");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_x);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":844
+ *         return 0
+ * 
+ *     cdef int _writeDictionary(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeDictionary(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_v_value;
+  int __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned char __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  __Pyx_RefNannySetupContext("_writeDictionary");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_value = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":847
+ *         cdef Py_ssize_t ref
+ * 
+ *         self.stream.write_uchar(TYPE_DICTIONARY)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 17); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 847; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":849
+ *         self.stream.write_uchar(TYPE_DICTIONARY)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_2 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_2 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 849; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_2;
+
+  /* "/root/package/cpyamf/amf3.pyx":851
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_ref != -1);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":852
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":854
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":856
+ *         _add_object(self.context, n)
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)             # <<<<<<<<<<<<<<
+ *         self.stream.write_uchar(bool(n.weak_keys))
+ * 
+ */
+  __pyx_t_2 = PyObject_Length(__pyx_v_n); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, ((__pyx_t_2 << 1) | 1)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":857
+ * 
+ *         _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+ *         self.stream.write_uchar(bool(n.weak_keys))             # <<<<<<<<<<<<<<
+ * 
+ *         for key, value in n.iteritems():
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__weak_keys); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = __Pyx_PyInt_AsUnsignedChar(__pyx_t_4); if (unlikely((__pyx_t_6 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_t_6); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":859
+ *         self.stream.write_uchar(bool(n.weak_keys))
+ * 
+ *         for key, value in n.iteritems():             # <<<<<<<<<<<<<<
+ *             # primitive keys skip the type lookup
+ *             if PyInt_CheckExact(key):
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_n, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_5; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
+    } else {
+      __pyx_t_5 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_5) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    if (PyTuple_CheckExact(__pyx_t_5) && likely(PyTuple_GET_SIZE(__pyx_t_5) == 2)) {
+      PyObject* tuple = __pyx_t_5;
+      __pyx_t_7 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_7);
+      __pyx_t_8 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_7;
+      __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_v_value);
+      __pyx_v_value = __pyx_t_8;
+      __pyx_t_8 = 0;
+    } else {
+      __pyx_t_9 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_v_key);
+      __pyx_v_key = __pyx_t_7;
+      __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_v_value);
+      __pyx_v_value = __pyx_t_8;
+      __pyx_t_8 = 0;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":861
+ *         for key, value in n.iteritems():
+ *             # primitive keys skip the type lookup
+ *             if PyInt_CheckExact(key):             # <<<<<<<<<<<<<<
+ *                 self._writeInteger(key)
+ *             elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):
+ */
+    __pyx_t_1 = PyInt_CheckExact(__pyx_v_key);
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/amf3.pyx":862
+ *             # primitive keys skip the type lookup
+ *             if PyInt_CheckExact(key):
+ *                 self._writeInteger(key)             # <<<<<<<<<<<<<<
+ *             elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):
+ *                 self.stream.write_uchar(TYPE_STRING)
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeInteger(__pyx_v_self, __pyx_v_key); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":863
+ *             if PyInt_CheckExact(key):
+ *                 self._writeInteger(key)
+ *             elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):             # <<<<<<<<<<<<<<
+ *                 self.stream.write_uchar(TYPE_STRING)
+ *                 self._writeString(key)
+ */
+    __pyx_t_1 = PyString_CheckExact(__pyx_v_key);
+    if (!__pyx_t_1) {
+      __pyx_t_10 = PyUnicode_CheckExact(__pyx_v_key);
+      __pyx_t_3 = __pyx_t_10;
+    } else {
+      __pyx_t_3 = __pyx_t_1;
+    }
+    if (__pyx_t_3) {
+
+      /* "/root/package/cpyamf/amf3.pyx":864
+ *                 self._writeInteger(key)
+ *             elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):
+ *                 self.stream.write_uchar(TYPE_STRING)             # <<<<<<<<<<<<<<
+ *                 self._writeString(key)
+ *             else:
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 6); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/cpyamf/amf3.pyx":865
+ *             elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):
+ *                 self.stream.write_uchar(TYPE_STRING)
+ *                 self._writeString(key)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._writeElement(key, None)
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_v_key); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+    /*else*/ {
+
+      /* "/root/package/cpyamf/amf3.pyx":867
+ *                 self._writeString(key)
+ *             else:
+ *                 self._writeElement(key, None)             # <<<<<<<<<<<<<<
+ * 
+ *             self._writeElement(value, None)
+ */
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_key, Py_None); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf3.pyx":869
+ *                 self._writeElement(key, None)
+ * 
+ *             self._writeElement(value, None)             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeElement(__pyx_v_self, __pyx_v_value, Py_None); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":871
+ *             self._writeElement(value, None)
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _writeXML(self, object n) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeDictionary");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF(__pyx_v_value);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":873
+ *         return 0
+ * 
+ *     cdef int _writeXML(self, object n) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t ref
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4amf3_7Encoder__writeXML(struct __pyx_obj_6cpyamf_4amf3_Encoder *__pyx_v_self, PyObject *__pyx_v_n) {
+  Py_ssize_t __pyx_v_ref;
+  PyObject *__pyx_v_i;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  __Pyx_RefNannySetupContext("_writeXML");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":876
+ *         cdef Py_ssize_t ref
+ * 
+ *         i = self.context.getLegacyXMLReference(n)             # <<<<<<<<<<<<<<
+ * 
+ *         if i is None:
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s_8); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_n);
+  __Pyx_GIVEREF(__pyx_v_n);
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_i);
+  __pyx_v_i = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":878
+ *         i = self.context.getLegacyXMLReference(n)
+ * 
+ *         if i is None:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_XMLSTRING)
+ *         else:
+ */
+  __pyx_t_4 = (__pyx_v_i == Py_None);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":879
+ * 
+ *         if i is None:
+ *             self.stream.write_uchar(TYPE_XMLSTRING)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.stream.write_uchar(TYPE_XML)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 11); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 879; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":881
+ *             self.stream.write_uchar(TYPE_XMLSTRING)
+ *         else:
+ *             self.stream.write_uchar(TYPE_XML)             # <<<<<<<<<<<<<<
+ * 
+ *         ref = _get_object_reference(self.context, n)
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, 7); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":883
+ *             self.stream.write_uchar(TYPE_XML)
+ * 
+ *         ref = _get_object_reference(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref != -1:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__get_object_reference(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_6 == -2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_6;
+
+  /* "/root/package/cpyamf/amf3.pyx":885
+ *         ref = _get_object_reference(self.context, n)
+ * 
+ *         if ref != -1:             # <<<<<<<<<<<<<<
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_ref != -1);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":886
+ * 
+ *         if ref != -1:
+ *             return _write_int(self.stream, ref << 1)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, n)
+ */
+    __pyx_t_5 = __pyx_f_6cpyamf_4amf3__write_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref << 1)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":888
+ *             return _write_int(self.stream, ref << 1)
+ * 
+ *         _add_object(self.context, n)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._writeString(util.ET.tostring(n, 'utf-8'))
+ */
+  __pyx_t_5 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_n); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":890
+ *         _add_object(self.context, n)
+ * 
+ *         return self._writeString(util.ET.tostring(n, 'utf-8'))             # <<<<<<<<<<<<<<
+ * 
+ *     def writeElement(self, data, use_proxies=None):
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ET); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__tostring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_n);
+  __Pyx_GIVEREF(__pyx_v_n);
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_9));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_kp_s_9));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_9));
+  __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_writeString(__pyx_v_self, __pyx_t_1); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder._writeXML");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":892
+ *         return self._writeString(util.ET.tostring(n, 'utf-8'))
+ * 
+ *     def writeElement(self, data, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes the data.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeElement(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeElement[] = "\n        Writes the data.\n\n        @param data: The data to be encoded to the AMF3 data stream.\n        @type data: C{mixed}\n        @raise EncodeError: Cannot find encoder func for C{data}.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeElement(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__data,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeElement");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__data);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeElement") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 892; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_data = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_data = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeElement", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 892; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeElement");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":900
+ *         @raise EncodeError: Cannot find encoder func for C{data}.
+ *         """
+ *         self._writeElement(data, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeProxy(self, obj, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeElement(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_data, __pyx_v_use_proxies); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 900; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeElement");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":902
+ *         self._writeElement(data, use_proxies)
+ * 
+ *     def writeProxy(self, obj, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Encodes a proxied object to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeProxy(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeProxy[] = "\n        Encodes a proxied object to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeProxy(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_v_proxy;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__obj,0};
+  __Pyx_RefNannySetupContext("writeProxy");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__obj);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeProxy") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 902; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_obj = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_obj = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeProxy", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 902; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeProxy");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_proxy = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":906
+ *         Encodes a proxied object to the stream.
+ *         """
+ *         proxy = self.context.getProxyForObject(obj)             # <<<<<<<<<<<<<<
+ * 
+ *         self._writeElement(proxy, False)
+ */
+  __pyx_t_1 = PyObject_GetAttr(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.context, __pyx_n_s__getProxyForObject); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 906; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 906; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_obj);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_obj);
+  __Pyx_GIVEREF(__pyx_v_obj);
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 906; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_proxy);
+  __pyx_v_proxy = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":908
+ *         proxy = self.context.getProxyForObject(obj)
+ * 
+ *         self._writeElement(proxy, False)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeUndefined(self, *args, **kwargs):
+ */
+  __pyx_t_3 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 908; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeElement(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_proxy, __pyx_t_3); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 908; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeProxy");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_DECREF(__pyx_v_proxy);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":910
+ *         self._writeElement(proxy, False)
+ * 
+ *     def writeUndefined(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an C{pyamf.Undefined} value to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeUndefined(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeUndefined[] = "\n        Writes an C{pyamf.Undefined} value to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeUndefined(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeUndefined");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "writeUndefined", 1))) return NULL;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf3.pyx":914
+ *         Writes an C{pyamf.Undefined} value to the stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_UNDEFINED)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeNull(self, *args, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 914; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeUndefined");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":916
+ *         self.stream.write_uchar(TYPE_UNDEFINED)
+ * 
+ *     def writeNull(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a C{null} value to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeNull(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeNull[] = "\n        Writes a C{null} value to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeNull(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("writeNull");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "writeNull", 1))) return NULL;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf3.pyx":920
+ *         Writes a C{null} value to the stream.
+ *         """
+ *         self.stream.write_uchar(TYPE_NULL)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeBoolean(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 1); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 920; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeNull");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":922
+ *         self.stream.write_uchar(TYPE_NULL)
+ * 
+ *     def writeBoolean(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a Boolean to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeBoolean(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeBoolean[] = "\n        Writes a Boolean to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeBoolean(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeBoolean");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeBoolean") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 922; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeBoolean", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 922; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeBoolean");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+
+  /* "/root/package/cpyamf/amf3.pyx":926
+ *         Writes a Boolean to the stream.
+ *         """
+ *         if n:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_BOOL_TRUE)
+ *         else:
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_n); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 926; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":927
+ *         """
+ *         if n:
+ *             self.stream.write_uchar(TYPE_BOOL_TRUE)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.stream.write_uchar(TYPE_BOOL_FALSE)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 3); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 927; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":929
+ *             self.stream.write_uchar(TYPE_BOOL_TRUE)
+ *         else:
+ *             self.stream.write_uchar(TYPE_BOOL_FALSE)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeInteger(self, n, **kwargs):
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 2); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 929; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L6:;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeBoolean");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":931
+ *             self.stream.write_uchar(TYPE_BOOL_FALSE)
+ * 
+ *     def writeInteger(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an integer to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeInteger(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeInteger[] = "\n        Writes an integer to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeInteger(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeInteger");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeInteger") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeInteger", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeInteger");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":935
+ *         Writes an integer to the stream.
+ *         """
+ *         self._writeInteger(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeNumber(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeInteger(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 935; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeInteger");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":937
+ *         self._writeInteger(n)
+ * 
+ *     def writeNumber(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a float to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeNumber(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeNumber[] = "\n        Writes a float to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeNumber(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeNumber");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeNumber") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 937; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeNumber", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 937; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeNumber");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":941
+ *         Writes a float to the stream.
+ *         """
+ *         self._writeNumber(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeString(self, n, writeType=True, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeNumber(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 941; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeNumber");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":943
+ *         self._writeNumber(n)
+ * 
+ *     def writeString(self, n, writeType=True, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a string to the stream. If C{n} is not a unicode string, an
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeString[] = "\n        Writes a string to the stream. If C{n} is not a unicode string, an\n        attempt will be made to convert it.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_writeType = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,&__pyx_n_s__writeType,0};
+  __Pyx_RefNannySetupContext("writeString");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = __pyx_k_10;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__writeType);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeString") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+    __pyx_v_writeType = values[1];
+  } else {
+    __pyx_v_writeType = __pyx_k_10;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_writeType = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeString", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeString");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_n);
+  __Pyx_INCREF(__pyx_v_writeType);
+
+  /* "/root/package/cpyamf/amf3.pyx":948
+ *         attempt will be made to convert it.
+ *         """
+ *         if writeType:             # <<<<<<<<<<<<<<
+ *             self.stream.write_uchar(TYPE_STRING)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_writeType); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 948; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":949
+ *         """
+ *         if writeType:
+ *             self.stream.write_uchar(TYPE_STRING)             # <<<<<<<<<<<<<<
+ * 
+ *         self._writeString(n)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write_uchar(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, 6); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 949; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":951
+ *             self.stream.write_uchar(TYPE_STRING)
+ * 
+ *         self._writeString(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeDate(self, n, **kwargs):
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeString(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 951; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_DECREF(__pyx_v_writeType);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":953
+ *         self._writeString(n)
+ * 
+ *     def writeDate(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a C{datetime} instance to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDate(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeDate[] = "\n        Writes a C{datetime} instance to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDate(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeDate");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeDate") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 953; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeDate", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 953; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDate");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":957
+ *         Writes a C{datetime} instance to the stream.
+ *         """
+ *         self._writeDate(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeList(self, n, use_proxies=None):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDate(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDate");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":959
+ *         self._writeDate(n)
+ * 
+ *     def writeList(self, n, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a C{tuple}, C{set} or C{list} to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeList(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeList[] = "\n        Writes a C{tuple}, C{set} or C{list} to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeList(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeList");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeList") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 959; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeList", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 959; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeList");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":963
+ *         Writes a C{tuple}, C{set} or C{list} to the stream.
+ *         """
+ *         self._writeList(n, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeDict(self, n, use_proxies=None):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeList(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n, __pyx_v_use_proxies); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 963; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeList");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":965
+ *         self._writeList(n, use_proxies)
+ * 
+ *     def writeDict(self, n, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a C{dict} to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDict(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeDict[] = "\n        Writes a C{dict} to the stream.\n\n        @raise ValueError: Non C{int}/C{str} key value found in the C{dict}\n        @raise EncodeError: C{dict} contains empty string keys.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDict(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeDict");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeDict") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeDict", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDict");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":972
+ *         @raise EncodeError: C{dict} contains empty string keys.
+ *         """
+ *         self._writeDict(n, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeInstance(self, obj, use_proxies=None, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDict(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n, __pyx_v_use_proxies); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDict");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":974
+ *         self._writeDict(n, use_proxies)
+ * 
+ *     def writeInstance(self, obj, use_proxies=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a class instance to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeInstance(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeInstance[] = "\n        Writes a class instance to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeInstance(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_v_kls;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__obj,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeInstance");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__obj);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeInstance") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_obj = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeInstance", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeInstance");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_obj);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_kls = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":978
+ *         Writes a class instance to the stream.
+ *         """
+ *         kls = obj.__class__             # <<<<<<<<<<<<<<
+ * 
+ *         if kls is pyamf.MixedArray:
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s____class__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 978; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_kls);
+  __pyx_v_kls = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":980
+ *         kls = obj.__class__
+ * 
+ *         if kls is pyamf.MixedArray:             # <<<<<<<<<<<<<<
+ *             self._writeDict(obj, use_proxies)
+ *         elif kls in LIST_TYPES:
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 980; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__MixedArray); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 980; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_v_kls == __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":981
+ * 
+ *         if kls is pyamf.MixedArray:
+ *             self._writeDict(obj, use_proxies)             # <<<<<<<<<<<<<<
+ *         elif kls in LIST_TYPES:
+ *             self._writeList(obj, use_proxies)
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDict(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_obj, __pyx_v_use_proxies); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 981; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":982
+ *         if kls is pyamf.MixedArray:
+ *             self._writeDict(obj, use_proxies)
+ *         elif kls in LIST_TYPES:             # <<<<<<<<<<<<<<
+ *             self._writeList(obj, use_proxies)
+ *         else:
+ */
+  __pyx_t_3 = ((PySequence_Contains(__pyx_v_6cpyamf_4amf3_LIST_TYPES, __pyx_v_kls))); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 982; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":983
+ *             self._writeDict(obj, use_proxies)
+ *         elif kls in LIST_TYPES:
+ *             self._writeList(obj, use_proxies)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._writeObject(obj, use_proxies)
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeList(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_obj, __pyx_v_use_proxies); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":985
+ *             self._writeList(obj, use_proxies)
+ *         else:
+ *             self._writeObject(obj, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeObject(self, obj, use_proxies=None):
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeObject(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_obj, __pyx_v_use_proxies); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 985; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L6:;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeInstance");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_DECREF(__pyx_v_kls);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":987
+ *             self._writeObject(obj, use_proxies)
+ * 
+ *     def writeObject(self, obj, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an object to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeObject(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeObject[] = "\n        Writes an object to the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeObject(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__obj,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeObject");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__obj);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeObject") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 987; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_obj = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeObject", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 987; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeObject");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":991
+ *         Writes an object to the stream.
+ *         """
+ *         self._writeObject(obj, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeByteArray(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeObject(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_obj, __pyx_v_use_proxies); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 991; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeObject");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":993
+ *         self._writeObject(obj, use_proxies)
+ * 
+ *     def writeByteArray(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a L{ByteArray<pyamf.amf3.ByteArray>} to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeByteArray(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeByteArray[] = "\n        Writes a L{ByteArray<pyamf.amf3.ByteArray>} to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeByteArray(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeByteArray");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeByteArray") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 993; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeByteArray", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 993; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeByteArray");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":997
+ *         Writes a L{ByteArray<pyamf.amf3.ByteArray>} to the data stream.
+ *         """
+ *         self._writeByteArray(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeVector(self, n, use_proxies=None):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeByteArray(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 997; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeByteArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":999
+ *         self._writeByteArray(n)
+ * 
+ *     def writeVector(self, n, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an C{array.array} to the data stream as an AMF3 vector.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeVector(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeVector[] = "\n        Writes an C{array.array} to the data stream as an AMF3 vector.\n\n        @see: L{pyamf.amf3.Encoder.writeVector}\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeVector(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("writeVector");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "writeVector") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 999; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+    __pyx_v_use_proxies = values[1];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeVector", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 999; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeVector");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1005
+ *         @see: L{pyamf.amf3.Encoder.writeVector}
+ *         """
+ *         self._writeVector(n, use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeObjectVector(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeVector(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n, __pyx_v_use_proxies); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1005; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1007
+ *         self._writeVector(n, use_proxies)
+ * 
+ *     def writeObjectVector(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes an L{ObjectVector<pyamf.amf3.ObjectVector>} to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeObjectVector(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeObjectVector[] = "\n        Writes an L{ObjectVector<pyamf.amf3.ObjectVector>} to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeObjectVector(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeObjectVector");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeObjectVector") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeObjectVector", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeObjectVector");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1011
+ *         Writes an L{ObjectVector<pyamf.amf3.ObjectVector>} to the data stream.
+ *         """
+ *         self._writeObjectVector(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeDictionary(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeObjectVector(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1011; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeObjectVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1013
+ *         self._writeObjectVector(n)
+ * 
+ *     def writeDictionary(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a L{Dictionary<pyamf.amf3.Dictionary>} to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDictionary(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeDictionary[] = "\n        Writes a L{Dictionary<pyamf.amf3.Dictionary>} to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeDictionary(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeDictionary");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeDictionary") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1013; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeDictionary", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1013; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDictionary");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1017
+ *         Writes a L{Dictionary<pyamf.amf3.Dictionary>} to the data stream.
+ *         """
+ *         self._writeDictionary(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeXML(self, n, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeDictionary(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1017; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeDictionary");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1019
+ *         self._writeDictionary(n)
+ * 
+ *     def writeXML(self, n, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a XML string to the data stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeXML(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeXML[] = "\n        Writes a XML string to the data stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeXML(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_n = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__n,0};
+  __Pyx_RefNannySetupContext("writeXML");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeXML") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1019; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_n = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_n = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeXML", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1019; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeXML");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1023
+ *         Writes a XML string to the data stream.
+ *         """
+ *         self._writeXML(n)             # <<<<<<<<<<<<<<
+ * 
+ *     def writeRawAMF(self, raw, **kwargs):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_writeXML(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self), __pyx_v_n); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1023; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeXML");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1025
+ *         self._writeXML(n)
+ * 
+ *     def writeRawAMF(self, raw, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a pre-encoded element to the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeRawAMF(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Encoder_writeRawAMF[] = "\n        Writes a pre-encoded element to the stream.\n\n        @raise EncodeError: C{raw} is not AMF3 encoded.\n        @since: 0.6\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Encoder_writeRawAMF(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_raw = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  char *__pyx_v_buf;
+  Py_ssize_t __pyx_v_l;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__raw,0};
+  __Pyx_RefNannySetupContext("writeRawAMF");
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__raw);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, PyTuple_GET_SIZE(__pyx_args), "writeRawAMF") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1025; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_raw = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_raw = PyTuple_GET_ITEM(__pyx_args, 0);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeRawAMF", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1025; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeRawAMF");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_raw);
+
+  /* "/root/package/cpyamf/amf3.pyx":1032
+ *         @since: 0.6
+ *         """
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t l = 0
+ * 
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/amf3.pyx":1033
+ *         """
+ *         cdef char *buf = NULL
+ *         cdef Py_ssize_t l = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if raw.encoding != pyamf.AMF3:
+ */
+  __pyx_v_l = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1035
+ *         cdef Py_ssize_t l = 0
+ * 
+ *         if raw.encoding != pyamf.AMF3:             # <<<<<<<<<<<<<<
+ *             raise pyamf.EncodeError('Cannot write an AMF%d fragment to an '
+ *                 'AMF3 stream' % (raw.encoding,))
+ */
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_raw, __pyx_n_s__encoding); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__AMF3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_t_3, Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1036
+ * 
+ *         if raw.encoding != pyamf.AMF3:
+ *             raise pyamf.EncodeError('Cannot write an AMF%d fragment to an '             # <<<<<<<<<<<<<<
+ *                 'AMF3 stream' % (raw.encoding,))
+ * 
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__EncodeError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1037
+ *         if raw.encoding != pyamf.AMF3:
+ *             raise pyamf.EncodeError('Cannot write an AMF%d fragment to an '
+ *                 'AMF3 stream' % (raw.encoding,))             # <<<<<<<<<<<<<<
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ */
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_raw, __pyx_n_s__encoding); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_11), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1039
+ *                 'AMF3 stream' % (raw.encoding,))
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)             # <<<<<<<<<<<<<<
+ *         self.stream.write(buf, l)
+ *         self.context.addRawAMF(raw)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_raw, __pyx_n_s__data); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyString_AsStringAndSize(__pyx_t_2, (&__pyx_v_buf), (&__pyx_v_l)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1040
+ * 
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ *         self.stream.write(buf, l)             # <<<<<<<<<<<<<<
+ *         self.context.addRawAMF(raw)
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream->__pyx_vtab)->write(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.stream, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1041
+ *         PyString_AsStringAndSize(raw.data, &buf, &l)
+ *         self.stream.write(buf, l)
+ *         self.context.addRawAMF(raw)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6cpyamf_4amf3_Encoder *)__pyx_v_self)->__pyx_base.__pyx_base.context, __pyx_n_s__addRawAMF); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_raw);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_raw);
+  __Pyx_GIVEREF(__pyx_v_raw);
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Encoder.writeRawAMF");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_raw);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1044
+ * 
+ * 
+ * cdef object _read_bytes(cBufferedByteStream stream, Py_ssize_t l, bint unicode_):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads C{l} bytes from C{stream}, decoding them from UTF-8 if C{unicode_}
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3__read_bytes(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_stream, Py_ssize_t __pyx_v_l, int __pyx_v_unicode_) {
+  char *__pyx_v_buf;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_read_bytes");
+  __Pyx_INCREF((PyObject *)__pyx_v_stream);
+
+  /* "/root/package/cpyamf/amf3.pyx":1051
+ *     cdef char *buf
+ * 
+ *     if l < 0 or l > stream.length - stream.pos:             # <<<<<<<<<<<<<<
+ *         raise IOError('Attempted to read %d bytes from the buffer but only '
+ *             '%d remain' % (l, stream.length - stream.pos))
+ */
+  __pyx_t_1 = (__pyx_v_l < 0);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_l > (__pyx_v_stream->length - __pyx_v_stream->pos));
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1053
+ *     if l < 0 or l > stream.length - stream.pos:
+ *         raise IOError('Attempted to read %d bytes from the buffer but only '
+ *             '%d remain' % (l, stream.length - stream.pos))             # <<<<<<<<<<<<<<
+ * 
+ *     buf = stream.buffer + stream.pos
+ */
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_l); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_stream->length - __pyx_v_stream->pos)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_12), __pyx_t_6); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1055
+ *             '%d remain' % (l, stream.length - stream.pos))
+ * 
+ *     buf = stream.buffer + stream.pos             # <<<<<<<<<<<<<<
+ *     stream.pos += l
+ * 
+ */
+  __pyx_v_buf = (__pyx_v_stream->buffer + __pyx_v_stream->pos);
+
+  /* "/root/package/cpyamf/amf3.pyx":1056
+ * 
+ *     buf = stream.buffer + stream.pos
+ *     stream.pos += l             # <<<<<<<<<<<<<<
+ * 
+ *     if unicode_:
+ */
+  __pyx_v_stream->pos += __pyx_v_l;
+
+  /* "/root/package/cpyamf/amf3.pyx":1058
+ *     stream.pos += l
+ * 
+ *     if unicode_:             # <<<<<<<<<<<<<<
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')
+ * 
+ */
+  __pyx_t_3 = __pyx_v_unicode_;
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1059
+ * 
+ *     if unicode_:
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')             # <<<<<<<<<<<<<<
+ * 
+ *     return PyString_FromStringAndSize(buf, l)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_5 = PyUnicode_DecodeUTF8(__pyx_v_buf, __pyx_v_l, __pyx_k__strict); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1059; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1061
+ *         return PyUnicode_DecodeUTF8(buf, l, 'strict')
+ * 
+ *     return PyString_FromStringAndSize(buf, l)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_l); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1061; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3._read_bytes");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_stream);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1085
+ *     cdef public object typed_arrays
+ * 
+ *     def __init__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
+ *         _init_module()
+ * 
+ */
+
+static int __pyx_pf_6cpyamf_4amf3_7Decoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_6cpyamf_4amf3_7Decoder___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("__init__");
+  if (unlikely(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 1))) return -1;
+  __pyx_v_kwargs = (__pyx_kwds) ? PyDict_Copy(__pyx_kwds) : PyDict_New();
+  if (unlikely(!__pyx_v_kwargs)) return -1;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+
+  /* "/root/package/cpyamf/amf3.pyx":1086
+ * 
+ *     def __init__(self, *args, **kwargs):
+ *         _init_module()             # <<<<<<<<<<<<<<
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ */
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__init_module(); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1088
+ *         _init_module()
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)             # <<<<<<<<<<<<<<
+ *         self.typed_arrays = kwargs.pop('typed_arrays',
+ *             amf3.typed_arrays_default)
+ */
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_kwargs, __pyx_n_s__pop); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1088; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__use_proxies_default); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1088; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1088; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__use_proxies));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_n_s__use_proxies));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__use_proxies));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1088; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->use_proxies);
+  __Pyx_DECREF(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->use_proxies);
+  ((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->use_proxies = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1089
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ *         self.typed_arrays = kwargs.pop('typed_arrays',             # <<<<<<<<<<<<<<
+ *             amf3.typed_arrays_default)
+ * 
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_kwargs, __pyx_n_s__pop); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1089; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+
+  /* "/root/package/cpyamf/amf3.pyx":1090
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ *         self.typed_arrays = kwargs.pop('typed_arrays',
+ *             amf3.typed_arrays_default)             # <<<<<<<<<<<<<<
+ * 
+ *         codec.Decoder.__init__(self, *args, **kwargs)
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s_13); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1090; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1089; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__typed_arrays));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__typed_arrays));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__typed_arrays));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1089; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1089
+ * 
+ *         self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+ *         self.typed_arrays = kwargs.pop('typed_arrays',             # <<<<<<<<<<<<<<
+ *             amf3.typed_arrays_default)
+ * 
+ */
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->typed_arrays);
+  __Pyx_DECREF(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->typed_arrays);
+  ((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->typed_arrays = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1092
+ *             amf3.typed_arrays_default)
+ * 
+ *         codec.Decoder.__init__(self, *args, **kwargs)             # <<<<<<<<<<<<<<
+ * 
+ *     def buildContext(self):
+ */
+  __pyx_t_4 = PyObject_GetAttr(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_5codec_Decoder)), __pyx_n_s____init__); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1092; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1092; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  __pyx_t_3 = PySequence_Tuple(__pyx_v_args); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1092; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_5 = PyNumber_Add(__pyx_t_2, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1092; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_5, __pyx_v_kwargs); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1092; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.__init__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_DECREF(__pyx_v_kwargs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1094
+ *         codec.Decoder.__init__(self, *args, **kwargs)
+ * 
+ *     def buildContext(self):             # <<<<<<<<<<<<<<
+ *         return amf3.Context()
+ * 
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_buildContext(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_buildContext(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("buildContext");
+
+  /* "/root/package/cpyamf/amf3.pyx":1095
+ * 
+ *     def buildContext(self):
+ *         return amf3.Context()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object readType(self, unsigned char t):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__Context); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1095; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1095; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.buildContext");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1097
+ *         return amf3.Context()
+ * 
+ *     cdef object readType(self, unsigned char t):             # <<<<<<<<<<<<<<
+ *         if t == TYPE_STRING:
+ *             return self._readString(1)
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder_readType(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, unsigned char __pyx_v_t) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  long __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("readType");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/amf3.pyx":1098
+ * 
+ *     cdef object readType(self, unsigned char t):
+ *         if t == TYPE_STRING:             # <<<<<<<<<<<<<<
+ *             return self._readString(1)
+ *         elif t == TYPE_INTEGER:
+ */
+  switch (__pyx_v_t) {
+    case 6:
+
+    /* "/root/package/cpyamf/amf3.pyx":1099
+ *     cdef object readType(self, unsigned char t):
+ *         if t == TYPE_STRING:
+ *             return self._readString(1)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_INTEGER:
+ *             return PyInt_FromLong(self._readInteger(1))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1099; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1100
+ *         if t == TYPE_STRING:
+ *             return self._readString(1)
+ *         elif t == TYPE_INTEGER:             # <<<<<<<<<<<<<<
+ *             return PyInt_FromLong(self._readInteger(1))
+ *         elif t == TYPE_NUMBER:
+ */
+    case 4:
+
+    /* "/root/package/cpyamf/amf3.pyx":1101
+ *             return self._readString(1)
+ *         elif t == TYPE_INTEGER:
+ *             return PyInt_FromLong(self._readInteger(1))             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 1); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyInt_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1102
+ *         elif t == TYPE_INTEGER:
+ *             return PyInt_FromLong(self._readInteger(1))
+ *         elif t == TYPE_NUMBER:             # <<<<<<<<<<<<<<
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:
+ */
+    case 5:
+
+    /* "/root/package/cpyamf/amf3.pyx":1103
+ *             return PyInt_FromLong(self._readInteger(1))
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_OBJECT:
+ *             return self._readObject(None)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readNumber(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1104
+ *         elif t == TYPE_NUMBER:
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:             # <<<<<<<<<<<<<<
+ *             return self._readObject(None)
+ *         elif t == TYPE_ARRAY:
+ */
+    case 10:
+
+    /* "/root/package/cpyamf/amf3.pyx":1105
+ *             return self._readNumber()
+ *         elif t == TYPE_OBJECT:
+ *             return self._readObject(None)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_ARRAY:
+ *             return self._readArray()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readObject(__pyx_v_self, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1106
+ *         elif t == TYPE_OBJECT:
+ *             return self._readObject(None)
+ *         elif t == TYPE_ARRAY:             # <<<<<<<<<<<<<<
+ *             return self._readArray()
+ *         elif t == TYPE_NULL:
+ */
+    case 9:
+
+    /* "/root/package/cpyamf/amf3.pyx":1107
+ *             return self._readObject(None)
+ *         elif t == TYPE_ARRAY:
+ *             return self._readArray()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_NULL:
+ *             return None
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readArray(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1108
+ *         elif t == TYPE_ARRAY:
+ *             return self._readArray()
+ *         elif t == TYPE_NULL:             # <<<<<<<<<<<<<<
+ *             return None
+ *         elif t == TYPE_BOOL_TRUE:
+ */
+    case 1:
+
+    /* "/root/package/cpyamf/amf3.pyx":1109
+ *             return self._readArray()
+ *         elif t == TYPE_NULL:
+ *             return None             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_BOOL_TRUE:
+ *             return True
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1110
+ *         elif t == TYPE_NULL:
+ *             return None
+ *         elif t == TYPE_BOOL_TRUE:             # <<<<<<<<<<<<<<
+ *             return True
+ *         elif t == TYPE_BOOL_FALSE:
+ */
+    case 3:
+
+    /* "/root/package/cpyamf/amf3.pyx":1111
+ *             return None
+ *         elif t == TYPE_BOOL_TRUE:
+ *             return True             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_BOOL_FALSE:
+ *             return False
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1112
+ *         elif t == TYPE_BOOL_TRUE:
+ *             return True
+ *         elif t == TYPE_BOOL_FALSE:             # <<<<<<<<<<<<<<
+ *             return False
+ *         elif t == TYPE_UNDEFINED:
+ */
+    case 2:
+
+    /* "/root/package/cpyamf/amf3.pyx":1113
+ *             return True
+ *         elif t == TYPE_BOOL_FALSE:
+ *             return False             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1114
+ *         elif t == TYPE_BOOL_FALSE:
+ *             return False
+ *         elif t == TYPE_UNDEFINED:             # <<<<<<<<<<<<<<
+ *             return pyamf.Undefined
+ *         elif t == TYPE_DATE:
+ */
+    case 0:
+
+    /* "/root/package/cpyamf/amf3.pyx":1115
+ *             return False
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__Undefined); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1116
+ *         elif t == TYPE_UNDEFINED:
+ *             return pyamf.Undefined
+ *         elif t == TYPE_DATE:             # <<<<<<<<<<<<<<
+ *             return self._readDate()
+ *         elif t == TYPE_BYTEARRAY:
+ */
+    case 8:
+
+    /* "/root/package/cpyamf/amf3.pyx":1117
+ *             return pyamf.Undefined
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_BYTEARRAY:
+ *             return self._readByteArray()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readDate(__pyx_v_self); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1118
+ *         elif t == TYPE_DATE:
+ *             return self._readDate()
+ *         elif t == TYPE_BYTEARRAY:             # <<<<<<<<<<<<<<
+ *             return self._readByteArray()
+ *         elif t == TYPE_XMLSTRING:
+ */
+    case 12:
+
+    /* "/root/package/cpyamf/amf3.pyx":1119
+ *             return self._readDate()
+ *         elif t == TYPE_BYTEARRAY:
+ *             return self._readByteArray()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_XMLSTRING:
+ *             return self._readXML(0)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readByteArray(__pyx_v_self); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1120
+ *         elif t == TYPE_BYTEARRAY:
+ *             return self._readByteArray()
+ *         elif t == TYPE_XMLSTRING:             # <<<<<<<<<<<<<<
+ *             return self._readXML(0)
+ *         elif t == TYPE_XML:
+ */
+    case 11:
+
+    /* "/root/package/cpyamf/amf3.pyx":1121
+ *             return self._readByteArray()
+ *         elif t == TYPE_XMLSTRING:
+ *             return self._readXML(0)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_XML:
+ *             return self._readXML(1)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readXML(__pyx_v_self, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1122
+ *         elif t == TYPE_XMLSTRING:
+ *             return self._readXML(0)
+ *         elif t == TYPE_XML:             # <<<<<<<<<<<<<<
+ *             return self._readXML(1)
+ *         elif t == TYPE_INT_VECTOR:
+ */
+    case 7:
+
+    /* "/root/package/cpyamf/amf3.pyx":1123
+ *             return self._readXML(0)
+ *         elif t == TYPE_XML:
+ *             return self._readXML(1)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_INT_VECTOR:
+ *             return self._readVector(amf3.IntVector)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readXML(__pyx_v_self, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1124
+ *         elif t == TYPE_XML:
+ *             return self._readXML(1)
+ *         elif t == TYPE_INT_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._readVector(amf3.IntVector)
+ *         elif t == TYPE_UINT_VECTOR:
+ */
+    case 13:
+
+    /* "/root/package/cpyamf/amf3.pyx":1125
+ *             return self._readXML(1)
+ *         elif t == TYPE_INT_VECTOR:
+ *             return self._readVector(amf3.IntVector)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_UINT_VECTOR:
+ *             return self._readVector(amf3.UintVector)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__IntVector); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readVector(__pyx_v_self, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1126
+ *         elif t == TYPE_INT_VECTOR:
+ *             return self._readVector(amf3.IntVector)
+ *         elif t == TYPE_UINT_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._readVector(amf3.UintVector)
+ *         elif t == TYPE_NUMBER_VECTOR:
+ */
+    case 14:
+
+    /* "/root/package/cpyamf/amf3.pyx":1127
+ *             return self._readVector(amf3.IntVector)
+ *         elif t == TYPE_UINT_VECTOR:
+ *             return self._readVector(amf3.UintVector)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_NUMBER_VECTOR:
+ *             return self._readVector(amf3.NumberVector)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__UintVector); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readVector(__pyx_v_self, __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1128
+ *         elif t == TYPE_UINT_VECTOR:
+ *             return self._readVector(amf3.UintVector)
+ *         elif t == TYPE_NUMBER_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._readVector(amf3.NumberVector)
+ *         elif t == TYPE_OBJECT_VECTOR:
+ */
+    case 15:
+
+    /* "/root/package/cpyamf/amf3.pyx":1129
+ *             return self._readVector(amf3.UintVector)
+ *         elif t == TYPE_NUMBER_VECTOR:
+ *             return self._readVector(amf3.NumberVector)             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_OBJECT_VECTOR:
+ *             return self._readObjectVector()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__NumberVector); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readVector(__pyx_v_self, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1130
+ *         elif t == TYPE_NUMBER_VECTOR:
+ *             return self._readVector(amf3.NumberVector)
+ *         elif t == TYPE_OBJECT_VECTOR:             # <<<<<<<<<<<<<<
+ *             return self._readObjectVector()
+ *         elif t == TYPE_DICTIONARY:
+ */
+    case 16:
+
+    /* "/root/package/cpyamf/amf3.pyx":1131
+ *             return self._readVector(amf3.NumberVector)
+ *         elif t == TYPE_OBJECT_VECTOR:
+ *             return self._readObjectVector()             # <<<<<<<<<<<<<<
+ *         elif t == TYPE_DICTIONARY:
+ *             return self._readDictionary()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readObjectVector(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1132
+ *         elif t == TYPE_OBJECT_VECTOR:
+ *             return self._readObjectVector()
+ *         elif t == TYPE_DICTIONARY:             # <<<<<<<<<<<<<<
+ *             return self._readDictionary()
+ * 
+ */
+    case 17:
+
+    /* "/root/package/cpyamf/amf3.pyx":1133
+ *             return self._readObjectVector()
+ *         elif t == TYPE_DICTIONARY:
+ *             return self._readDictionary()             # <<<<<<<<<<<<<<
+ * 
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readDictionary(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1135
+ *             return self._readDictionary()
+ * 
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef long _readInteger(self, int signed) except? -1:
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__DecodeError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_chr, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_14), __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_Raise(__pyx_t_1, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readType");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1137
+ *         raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+ * 
+ *     cdef long _readInteger(self, int signed) except? -1:             # <<<<<<<<<<<<<<
+ *         cdef long x
+ * 
+ */
+
+static  long __pyx_f_6cpyamf_4amf3_7Decoder__readInteger(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, int __pyx_v_signed) {
+  long __pyx_v_x;
+  long __pyx_r;
+  int __pyx_t_1;
+  struct __pyx_opt_args_6cpyamf_4amf3__decode_int __pyx_t_2;
+  __Pyx_RefNannySetupContext("_readInteger");
+
+  /* "/root/package/cpyamf/amf3.pyx":1140
+ *         cdef long x
+ * 
+ *         _decode_int(self.stream, &x, signed)             # <<<<<<<<<<<<<<
+ * 
+ *         return x
+ */
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.sign = __pyx_v_signed;
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__decode_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_x), &__pyx_t_2); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1142
+ *         _decode_int(self.stream, &x, signed)
+ * 
+ *         return x             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readNumber(self):
+ */
+  __pyx_r = __pyx_v_x;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readInteger");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1144
+ *         return x
+ * 
+ *     cdef object _readNumber(self):             # <<<<<<<<<<<<<<
+ *         cdef double x
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readNumber(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  double __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_readNumber");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/amf3.pyx":1147
+ *         cdef double x
+ * 
+ *         if float_broken:             # <<<<<<<<<<<<<<
+ *             return (<object>self.stream).read_double()
+ * 
+ */
+  __pyx_t_1 = __pyx_v_6cpyamf_4amf3_float_broken;
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1148
+ * 
+ *         if float_broken:
+ *             return (<object>self.stream).read_double()             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_double(&x)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream), __pyx_n_s__read_double); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1150
+ *             return (<object>self.stream).read_double()
+ * 
+ *         self.stream.read_double(&x)             # <<<<<<<<<<<<<<
+ * 
+ *         return PyFloat_FromDouble(x)
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_double(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_x)); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1152
+ *         self.stream.read_double(&x)
+ * 
+ *         return PyFloat_FromDouble(x)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readString(self, bint unicode_):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readNumber");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1154
+ *         return PyFloat_FromDouble(x)
+ * 
+ *     cdef object _readString(self, bint unicode_):             # <<<<<<<<<<<<<<
+ *         cdef long x = self._readInteger(0)
+ *         cdef Py_ssize_t length = x >> 1
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readString(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, int __pyx_v_unicode_) {
+  long __pyx_v_x;
+  Py_ssize_t __pyx_v_length;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_readString");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1155
+ * 
+ *     cdef object _readString(self, bint unicode_):
+ *         cdef long x = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t length = x >> 1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_x = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1156
+ *     cdef object _readString(self, bint unicode_):
+ *         cdef long x = self._readInteger(0)
+ *         cdef Py_ssize_t length = x >> 1             # <<<<<<<<<<<<<<
+ * 
+ *         if x & REFERENCE_BIT == 0:
+ */
+  __pyx_v_length = (__pyx_v_x >> 1);
+
+  /* "/root/package/cpyamf/amf3.pyx":1158
+ *         cdef Py_ssize_t length = x >> 1
+ * 
+ *         if x & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_string(self.context, length)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_x & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1159
+ * 
+ *         if x & REFERENCE_BIT == 0:
+ *             return _get_string(self.context, length)             # <<<<<<<<<<<<<<
+ * 
+ *         if length == 0:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_string(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_length); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1161
+ *             return _get_string(self.context, length)
+ * 
+ *         if length == 0:             # <<<<<<<<<<<<<<
+ *             return u''
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_length == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1162
+ * 
+ *         if length == 0:
+ *             return u''             # <<<<<<<<<<<<<<
+ * 
+ *         result = _read_bytes(self.stream, length, unicode_)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_4));
+    __pyx_r = ((PyObject *)__pyx_kp_u_4);
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1164
+ *             return u''
+ * 
+ *         result = _read_bytes(self.stream, length, unicode_)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_string(self.context, result)
+ */
+  __pyx_t_3 = __pyx_f_6cpyamf_4amf3__read_bytes(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_length, __pyx_v_unicode_); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1166
+ *         result = _read_bytes(self.stream, length, unicode_)
+ * 
+ *         _add_string(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_string(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1166; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1168
+ *         _add_string(self.context, result)
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readDate(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readString");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1170
+ *         return result
+ * 
+ *     cdef object _readDate(self):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ *         cdef double ms
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readDate(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  long __pyx_v_ref;
+  double __pyx_v_ms;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_readDate");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1171
+ * 
+ *     cdef object _readDate(self):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef double ms
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1174
+ *         cdef double ms
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1175
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_double(&ms)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1177
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         self.stream.read_double(&ms)             # <<<<<<<<<<<<<<
+ * 
+ *         result = util.get_datetime(ms / 1000.0)
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_double(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_ms)); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1179
+ *         self.stream.read_double(&ms)
+ * 
+ *         result = util.get_datetime(ms / 1000.0)             # <<<<<<<<<<<<<<
+ * 
+ *         if self.timezone_offset is not None:
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__get_datetime); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyFloat_FromDouble((__pyx_v_ms / 1000.0)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1181
+ *         result = util.get_datetime(ms / 1000.0)
+ * 
+ *         if self.timezone_offset is not None:             # <<<<<<<<<<<<<<
+ *             result += self.timezone_offset
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_self->__pyx_base.__pyx_base.timezone_offset != Py_None);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1182
+ * 
+ *         if self.timezone_offset is not None:
+ *             result += self.timezone_offset             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, result)
+ */
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_result, __pyx_v_self->__pyx_base.__pyx_base.timezone_offset); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_v_result);
+    __pyx_v_result = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1184
+ *             result += self.timezone_offset
+ * 
+ *         _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1186
+ *         _add_object(self.context, result)
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readDate");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1188
+ *         return result
+ * 
+ *     cdef object _readArray(self):             # <<<<<<<<<<<<<<
+ *         cdef long size = self._readInteger(0)
+ *         cdef long i
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readArray(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  long __pyx_v_size;
+  long __pyx_v_i;
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("_readArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1189
+ * 
+ *     cdef object _readArray(self):
+ *         cdef long size = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef long i
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_size = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1192
+ *         cdef long i
+ * 
+ *         if size & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, size >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_size & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1193
+ * 
+ *         if size & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, size >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         size >>= 1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_size >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1195
+ *             return _get_object(self.context, size >> 1)
+ * 
+ *         size >>= 1             # <<<<<<<<<<<<<<
+ * 
+ *         key = self._readString(0)
+ */
+  __pyx_v_size >>= 1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1197
+ *         size >>= 1
+ * 
+ *         key = self._readString(0)             # <<<<<<<<<<<<<<
+ * 
+ *         if key == '':
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_key);
+  __pyx_v_key = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1199
+ *         key = self._readString(0)
+ * 
+ *         if key == '':             # <<<<<<<<<<<<<<
+ *             if self.typed_arrays:
+ *                 result = self._readTypedArray(size)
+ */
+  __pyx_t_3 = PyObject_RichCompare(__pyx_v_key, ((PyObject *)__pyx_kp_s_4), Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1200
+ * 
+ *         if key == '':
+ *             if self.typed_arrays:             # <<<<<<<<<<<<<<
+ *                 result = self._readTypedArray(size)
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_self->typed_arrays); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1201
+ *         if key == '':
+ *             if self.typed_arrays:
+ *                 result = self._readTypedArray(size)             # <<<<<<<<<<<<<<
+ * 
+ *                 if result is not None:
+ */
+      __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readTypedArray(__pyx_v_self, __pyx_v_size); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_v_result);
+      __pyx_v_result = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1203
+ *                 result = self._readTypedArray(size)
+ * 
+ *                 if result is not None:             # <<<<<<<<<<<<<<
+ *                     _add_object(self.context, result)
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_result != Py_None);
+      if (__pyx_t_2) {
+
+        /* "/root/package/cpyamf/amf3.pyx":1204
+ * 
+ *                 if result is not None:
+ *                     _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *                     return result
+ */
+        __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+        /* "/root/package/cpyamf/amf3.pyx":1206
+ *                     _add_object(self.context, result)
+ * 
+ *                     return result             # <<<<<<<<<<<<<<
+ * 
+ *             # integer indexes only -> python list
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_v_result);
+        __pyx_r = __pyx_v_result;
+        goto __pyx_L0;
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/cpyamf/amf3.pyx":1209
+ * 
+ *             # integer indexes only -> python list
+ *             result = []             # <<<<<<<<<<<<<<
+ *             _add_object(self.context, result)
+ * 
+ */
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+    __Pyx_DECREF(__pyx_v_result);
+    __pyx_v_result = ((PyObject *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1210
+ *             # integer indexes only -> python list
+ *             result = []
+ *             _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < size:
+ */
+    __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/cpyamf/amf3.pyx":1212
+ *             _add_object(self.context, result)
+ * 
+ *             for i from 0 <= i < size:             # <<<<<<<<<<<<<<
+ *                 result.append(self._readElement())
+ * 
+ */
+    __pyx_t_1 = __pyx_v_size;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1213
+ * 
+ *             for i from 0 <= i < size:
+ *                 result.append(self._readElement())             # <<<<<<<<<<<<<<
+ * 
+ *             return result
+ */
+      __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = __Pyx_PyObject_Append(__pyx_v_result, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":1215
+ *                 result.append(self._readElement())
+ * 
+ *             return result             # <<<<<<<<<<<<<<
+ * 
+ *         result = pyamf.MixedArray()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1217
+ *             return result
+ * 
+ *         result = pyamf.MixedArray()             # <<<<<<<<<<<<<<
+ *         _add_object(self.context, result)
+ * 
+ */
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__MixedArray); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1218
+ * 
+ *         result = pyamf.MixedArray()
+ *         _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         while key:
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1220
+ *         _add_object(self.context, result)
+ * 
+ *         while key:             # <<<<<<<<<<<<<<
+ *             result[key] = self._readElement()
+ *             key = self._readString(0)
+ */
+  while (1) {
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_key); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!__pyx_t_2) break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1221
+ * 
+ *         while key:
+ *             result[key] = self._readElement()             # <<<<<<<<<<<<<<
+ *             key = self._readString(0)
+ * 
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyObject_SetItem(__pyx_v_result, __pyx_v_key, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1222
+ *         while key:
+ *             result[key] = self._readElement()
+ *             key = self._readString(0)             # <<<<<<<<<<<<<<
+ * 
+ *         for i from 0 <= i < size:
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_v_key);
+    __pyx_v_key = __pyx_t_5;
+    __pyx_t_5 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1224
+ *             key = self._readString(0)
+ * 
+ *         for i from 0 <= i < size:             # <<<<<<<<<<<<<<
+ *             result[i] = self._readElement()
+ * 
+ */
+  __pyx_t_1 = __pyx_v_size;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1225
+ * 
+ *         for i from 0 <= i < size:
+ *             result[i] = self._readElement()             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_SetItemInt(__pyx_v_result, __pyx_v_i, __pyx_t_5, sizeof(long), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1227
+ *             result[i] = self._readElement()
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readTypedArray(self, long size):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readArray");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1229
+ *         return result
+ * 
+ *     cdef object _readTypedArray(self, long size):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads the C{size} elements of a dense array into an C{array.array} in
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readTypedArray(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, long __pyx_v_size) {
+  Py_ssize_t __pyx_v_pos;
+  double *__pyx_v_values;
+  long *__pyx_v_ints;
+  long __pyx_v_i;
+  long __pyx_v_x;
+  unsigned char __pyx_v_t;
+  int __pyx_v_is_float;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  struct __pyx_opt_args_6cpyamf_4amf3__decode_int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  __Pyx_RefNannySetupContext("_readTypedArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1235
+ *         and the stream position restored.
+ *         """
+ *         cdef Py_ssize_t pos = self.stream.tell()             # <<<<<<<<<<<<<<
+ *         cdef double *values
+ *         cdef long *ints
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->tell(__pyx_v_self->__pyx_base.__pyx_base.stream); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_pos = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1240
+ *         cdef long i, x
+ *         cdef unsigned char t
+ *         cdef bint is_float = 0             # <<<<<<<<<<<<<<
+ * 
+ *         # every element is at least 2 bytes, anything bigger is corrupt and
+ */
+  __pyx_v_is_float = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1244
+ *         # every element is at least 2 bytes, anything bigger is corrupt and
+ *         # left to the generic path to report
+ *         if size == 0 or float_broken or size * 2 > self.stream.remaining():             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_size == 0);
+  if (!__pyx_t_2) {
+    if (!__pyx_v_6cpyamf_4amf3_float_broken) {
+      __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->remaining(__pyx_v_self->__pyx_base.__pyx_base.stream); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = ((__pyx_v_size * 2) > __pyx_t_1);
+      __pyx_t_4 = __pyx_t_3;
+    } else {
+      __pyx_t_4 = __pyx_v_6cpyamf_4amf3_float_broken;
+    }
+    __pyx_t_3 = __pyx_t_4;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1245
+ *         # left to the generic path to report
+ *         if size == 0 or float_broken or size * 2 > self.stream.remaining():
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         values = <double *>PyMem_Malloc(size * sizeof(double))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1247
+ *             return None
+ * 
+ *         values = <double *>PyMem_Malloc(size * sizeof(double))             # <<<<<<<<<<<<<<
+ * 
+ *         if values == NULL:
+ */
+  __pyx_v_values = ((double *)PyMem_Malloc((__pyx_v_size * (sizeof(double)))));
+
+  /* "/root/package/cpyamf/amf3.pyx":1249
+ *         values = <double *>PyMem_Malloc(size * sizeof(double))
+ * 
+ *         if values == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_values == NULL);
+  if (__pyx_t_3) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1250
+ * 
+ *         if values == NULL:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ * 
+ *         try:
+ */
+    __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1252
+ *             raise MemoryError
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             for i from 0 <= i < size:
+ *                 self.stream.read_uchar(&t)
+ */
+  /*try:*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":1253
+ * 
+ *         try:
+ *             for i from 0 <= i < size:             # <<<<<<<<<<<<<<
+ *                 self.stream.read_uchar(&t)
+ * 
+ */
+    __pyx_t_5 = __pyx_v_size;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1254
+ *         try:
+ *             for i from 0 <= i < size:
+ *                 self.stream.read_uchar(&t)             # <<<<<<<<<<<<<<
+ * 
+ *                 if t == TYPE_INTEGER:
+ */
+      __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_t)); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1254; __pyx_clineno = __LINE__; goto __pyx_L6;}
+
+      /* "/root/package/cpyamf/amf3.pyx":1256
+ *                 self.stream.read_uchar(&t)
+ * 
+ *                 if t == TYPE_INTEGER:             # <<<<<<<<<<<<<<
+ *                     _decode_int(self.stream, &x, 1)
+ *                     values[i] = x
+ */
+      switch (__pyx_v_t) {
+        case 4:
+
+        /* "/root/package/cpyamf/amf3.pyx":1257
+ * 
+ *                 if t == TYPE_INTEGER:
+ *                     _decode_int(self.stream, &x, 1)             # <<<<<<<<<<<<<<
+ *                     values[i] = x
+ *                 elif t == TYPE_NUMBER:
+ */
+        __pyx_t_7.__pyx_n = 1;
+        __pyx_t_7.sign = 1;
+        __pyx_t_6 = __pyx_f_6cpyamf_4amf3__decode_int(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_x), &__pyx_t_7); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1257; __pyx_clineno = __LINE__; goto __pyx_L6;}
+
+        /* "/root/package/cpyamf/amf3.pyx":1258
+ *                 if t == TYPE_INTEGER:
+ *                     _decode_int(self.stream, &x, 1)
+ *                     values[i] = x             # <<<<<<<<<<<<<<
+ *                 elif t == TYPE_NUMBER:
+ *                     self.stream.read_double(&values[i])
+ */
+        (__pyx_v_values[__pyx_v_i]) = __pyx_v_x;
+        break;
+
+        /* "/root/package/cpyamf/amf3.pyx":1259
+ *                     _decode_int(self.stream, &x, 1)
+ *                     values[i] = x
+ *                 elif t == TYPE_NUMBER:             # <<<<<<<<<<<<<<
+ *                     self.stream.read_double(&values[i])
+ *                     is_float = 1
+ */
+        case 5:
+
+        /* "/root/package/cpyamf/amf3.pyx":1260
+ *                     values[i] = x
+ *                 elif t == TYPE_NUMBER:
+ *                     self.stream.read_double(&values[i])             # <<<<<<<<<<<<<<
+ *                     is_float = 1
+ *                 else:
+ */
+        __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_double(__pyx_v_self->__pyx_base.__pyx_base.stream, (&(__pyx_v_values[__pyx_v_i]))); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1260; __pyx_clineno = __LINE__; goto __pyx_L6;}
+
+        /* "/root/package/cpyamf/amf3.pyx":1261
+ *                 elif t == TYPE_NUMBER:
+ *                     self.stream.read_double(&values[i])
+ *                     is_float = 1             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     self.stream.seek(pos)
+ */
+        __pyx_v_is_float = 1;
+        break;
+        default:
+
+        /* "/root/package/cpyamf/amf3.pyx":1263
+ *                     is_float = 1
+ *                 else:
+ *                     self.stream.seek(pos)             # <<<<<<<<<<<<<<
+ * 
+ *                     return None
+ */
+        __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->seek(__pyx_v_self->__pyx_base.__pyx_base.stream, __pyx_v_pos, NULL); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L6;}
+
+        /* "/root/package/cpyamf/amf3.pyx":1265
+ *                     self.stream.seek(pos)
+ * 
+ *                     return None             # <<<<<<<<<<<<<<
+ * 
+ *             if is_float:
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(Py_None);
+        __pyx_r = Py_None;
+        goto __pyx_L5;
+        break;
+      }
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":1267
+ *                     return None
+ * 
+ *             if is_float:             # <<<<<<<<<<<<<<
+ *                 result = array.array('d')
+ *                 result.fromstring(PyString_FromStringAndSize(
+ */
+    __pyx_t_3 = __pyx_v_is_float;
+    if (__pyx_t_3) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1268
+ * 
+ *             if is_float:
+ *                 result = array.array('d')             # <<<<<<<<<<<<<<
+ *                 result.fromstring(PyString_FromStringAndSize(
+ *                     <char *>values, size * sizeof(double)))
+ */
+      __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1268; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__array); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1268; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1268; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_INCREF(((PyObject *)__pyx_n_s__d));
+      PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_n_s__d));
+      __Pyx_GIVEREF(((PyObject *)__pyx_n_s__d));
+      __pyx_t_10 = PyObject_Call(__pyx_t_9, __pyx_t_8, NULL); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1268; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_v_result);
+      __pyx_v_result = __pyx_t_10;
+      __pyx_t_10 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1269
+ *             if is_float:
+ *                 result = array.array('d')
+ *                 result.fromstring(PyString_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                     <char *>values, size * sizeof(double)))
+ * 
+ */
+      __pyx_t_10 = PyObject_GetAttr(__pyx_v_result, __pyx_n_s__fromstring); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1269; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_10);
+
+      /* "/root/package/cpyamf/amf3.pyx":1270
+ *                 result = array.array('d')
+ *                 result.fromstring(PyString_FromStringAndSize(
+ *                     <char *>values, size * sizeof(double)))             # <<<<<<<<<<<<<<
+ * 
+ *                 return result
+ */
+      __pyx_t_8 = PyString_FromStringAndSize(((char *)__pyx_v_values), (__pyx_v_size * (sizeof(double)))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1269; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1269; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_8);
+      __pyx_t_8 = 0;
+      __pyx_t_8 = PyObject_Call(__pyx_t_10, __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1269; __pyx_clineno = __LINE__; goto __pyx_L6;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1272
+ *                     <char *>values, size * sizeof(double)))
+ * 
+ *                 return result             # <<<<<<<<<<<<<<
+ * 
+ *             # sizeof(long) <= sizeof(double) so convert in place
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_v_result);
+      __pyx_r = __pyx_v_result;
+      goto __pyx_L5;
+      goto __pyx_L10;
+    }
+    __pyx_L10:;
+
+    /* "/root/package/cpyamf/amf3.pyx":1275
+ * 
+ *             # sizeof(long) <= sizeof(double) so convert in place
+ *             ints = <long *>values             # <<<<<<<<<<<<<<
+ * 
+ *             for i from 0 <= i < size:
+ */
+    __pyx_v_ints = ((long *)__pyx_v_values);
+
+    /* "/root/package/cpyamf/amf3.pyx":1277
+ *             ints = <long *>values
+ * 
+ *             for i from 0 <= i < size:             # <<<<<<<<<<<<<<
+ *                 ints[i] = <long>values[i]
+ * 
+ */
+    __pyx_t_5 = __pyx_v_size;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1278
+ * 
+ *             for i from 0 <= i < size:
+ *                 ints[i] = <long>values[i]             # <<<<<<<<<<<<<<
+ * 
+ *             result = array.array('l')
+ */
+      (__pyx_v_ints[__pyx_v_i]) = ((long)(__pyx_v_values[__pyx_v_i]));
+    }
+
+    /* "/root/package/cpyamf/amf3.pyx":1280
+ *                 ints[i] = <long>values[i]
+ * 
+ *             result = array.array('l')             # <<<<<<<<<<<<<<
+ *             result.fromstring(PyString_FromStringAndSize(
+ *                 <char *>ints, size * sizeof(long)))
+ */
+    __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1280; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__array); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1280; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1280; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_INCREF(((PyObject *)__pyx_n_s__l));
+    PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_n_s__l));
+    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__l));
+    __pyx_t_10 = PyObject_Call(__pyx_t_9, __pyx_t_8, NULL); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1280; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_v_result);
+    __pyx_v_result = __pyx_t_10;
+    __pyx_t_10 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1281
+ * 
+ *             result = array.array('l')
+ *             result.fromstring(PyString_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                 <char *>ints, size * sizeof(long)))
+ * 
+ */
+    __pyx_t_10 = PyObject_GetAttr(__pyx_v_result, __pyx_n_s__fromstring); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1281; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_10);
+
+    /* "/root/package/cpyamf/amf3.pyx":1282
+ *             result = array.array('l')
+ *             result.fromstring(PyString_FromStringAndSize(
+ *                 <char *>ints, size * sizeof(long)))             # <<<<<<<<<<<<<<
+ * 
+ *             return result
+ */
+    __pyx_t_8 = PyString_FromStringAndSize(((char *)__pyx_v_ints), (__pyx_v_size * (sizeof(long)))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1281; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1281; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_8);
+    __pyx_t_8 = 0;
+    __pyx_t_8 = PyObject_Call(__pyx_t_10, __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1281; __pyx_clineno = __LINE__; goto __pyx_L6;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1284
+ *                 <char *>ints, size * sizeof(long)))
+ * 
+ *             return result             # <<<<<<<<<<<<<<
+ *         finally:
+ *             PyMem_Free(values)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L5;
+  }
+  /*finally:*/ {
+    int __pyx_why;
+    PyObject *__pyx_exc_type, *__pyx_exc_value, *__pyx_exc_tb;
+    int __pyx_exc_lineno;
+    __pyx_exc_type = 0; __pyx_exc_value = 0; __pyx_exc_tb = 0; __pyx_exc_lineno = 0;
+    __pyx_why = 0; goto __pyx_L7;
+    __pyx_L5: __pyx_exc_type = 0; __pyx_exc_value = 0; __pyx_exc_tb = 0; __pyx_exc_lineno = 0;
+    __pyx_why = 3; goto __pyx_L7;
+    __pyx_L6: {
+      __pyx_why = 4;
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_ErrFetch(&__pyx_exc_type, &__pyx_exc_value, &__pyx_exc_tb);
+      __pyx_exc_lineno = __pyx_lineno;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "/root/package/cpyamf/amf3.pyx":1286
+ *             return result
+ *         finally:
+ *             PyMem_Free(values)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readClassDefinition(self, long ref):
+ */
+    PyMem_Free(__pyx_v_values);
+    switch (__pyx_why) {
+      case 3: goto __pyx_L0;
+      case 4: {
+        __Pyx_ErrRestore(__pyx_exc_type, __pyx_exc_value, __pyx_exc_tb);
+        __pyx_lineno = __pyx_exc_lineno;
+        __pyx_exc_type = 0;
+        __pyx_exc_value = 0;
+        __pyx_exc_tb = 0;
+        goto __pyx_L1_error;
+      }
+    }
+  }
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readTypedArray");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1288
+ *             PyMem_Free(values)
+ * 
+ *     cdef object _readClassDefinition(self, long ref):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a class definition from the stream.
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readClassDefinition(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, long __pyx_v_ref) {
+  long __pyx_v_i;
+  PyObject *__pyx_v_name;
+  PyObject *__pyx_v_static_properties;
+  PyObject *__pyx_v_plan;
+  PyObject *__pyx_v_class_def;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  __Pyx_RefNannySetupContext("_readClassDefinition");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_name = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_static_properties = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_plan = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_class_def = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1294
+ *         cdef long i
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return self.context.getClassByReference(ref >> 1)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1295
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return self.context.getClassByReference(ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         ref >>= 1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__getClassByReference); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyInt_FromLong((__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1297
+ *             return self.context.getClassByReference(ref >> 1)
+ * 
+ *         ref >>= 1             # <<<<<<<<<<<<<<
+ * 
+ *         name = self._readString(1)
+ */
+  __pyx_v_ref >>= 1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1299
+ *         ref >>= 1
+ * 
+ *         name = self._readString(1)             # <<<<<<<<<<<<<<
+ *         static_properties = []
+ * 
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_name);
+  __pyx_v_name = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1300
+ * 
+ *         name = self._readString(1)
+ *         static_properties = []             # <<<<<<<<<<<<<<
+ * 
+ *         for i from 0 <= i < ref >> 2:
+ */
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_DECREF(__pyx_v_static_properties);
+  __pyx_v_static_properties = ((PyObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1302
+ *         static_properties = []
+ * 
+ *         for i from 0 <= i < ref >> 2:             # <<<<<<<<<<<<<<
+ *             static_properties.append(self._readString(0))
+ * 
+ */
+  __pyx_t_5 = (__pyx_v_ref >> 2);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1303
+ * 
+ *         for i from 0 <= i < ref >> 2:
+ *             static_properties.append(self._readString(0))             # <<<<<<<<<<<<<<
+ * 
+ *         plan = get_decode_plan(name, ref & 0x03, static_properties,
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_Append(__pyx_v_static_properties, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1305
+ *             static_properties.append(self._readString(0))
+ * 
+ *         plan = get_decode_plan(name, ref & 0x03, static_properties,             # <<<<<<<<<<<<<<
+ *             self.strict)
+ *         class_def = plan.getClassDefinition()
+ */
+  __pyx_t_4 = PyInt_FromLong((__pyx_v_ref & 0x03)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "/root/package/cpyamf/amf3.pyx":1306
+ * 
+ *         plan = get_decode_plan(name, ref & 0x03, static_properties,
+ *             self.strict)             # <<<<<<<<<<<<<<
+ *         class_def = plan.getClassDefinition()
+ * 
+ */
+  __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_name);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_name);
+  __Pyx_GIVEREF(__pyx_v_name);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_static_properties);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_static_properties);
+  __Pyx_GIVEREF(__pyx_v_static_properties);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.strict);
+  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_v_self->__pyx_base.__pyx_base.strict);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.__pyx_base.strict);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_Call(__pyx_v_6cpyamf_4amf3_get_decode_plan, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_plan);
+  __pyx_v_plan = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1307
+ *         plan = get_decode_plan(name, ref & 0x03, static_properties,
+ *             self.strict)
+ *         class_def = plan.getClassDefinition()             # <<<<<<<<<<<<<<
+ * 
+ *         self.context.addClass(class_def, plan.alias.klass)
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_plan, __pyx_n_s__getClassDefinition); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_class_def);
+  __pyx_v_class_def = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1309
+ *         class_def = plan.getClassDefinition()
+ * 
+ *         self.context.addClass(class_def, plan.alias.klass)             # <<<<<<<<<<<<<<
+ * 
+ *         return class_def
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__addClass); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_plan, __pyx_n_s__alias); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__klass); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_class_def);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_class_def);
+  __Pyx_GIVEREF(__pyx_v_class_def);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1311
+ *         self.context.addClass(class_def, plan.alias.klass)
+ * 
+ *         return class_def             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readObject(self, object use_proxies):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_class_def);
+  __pyx_r = __pyx_v_class_def;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readClassDefinition");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_name);
+  __Pyx_DECREF(__pyx_v_static_properties);
+  __Pyx_DECREF(__pyx_v_plan);
+  __Pyx_DECREF(__pyx_v_class_def);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1313
+ *         return class_def
+ * 
+ *     cdef object _readObject(self, object use_proxies):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ *         cdef long encoding
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readObject(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, PyObject *__pyx_v_use_proxies) {
+  long __pyx_v_ref;
+  long __pyx_v_encoding;
+  PyObject *__pyx_v_obj;
+  PyObject *__pyx_v_class_def;
+  PyObject *__pyx_v_alias;
+  PyObject *__pyx_v_obj_attrs;
+  PyObject *__pyx_v_attr;
+  PyObject *__pyx_v_plan;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  __Pyx_RefNannySetupContext("_readObject");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_use_proxies);
+  __pyx_v_obj = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_class_def = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_alias = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_obj_attrs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_attr = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_plan = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1314
+ * 
+ *     cdef object _readObject(self, object use_proxies):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef long encoding
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1317
+ *         cdef long encoding
+ * 
+ *         if use_proxies is None:             # <<<<<<<<<<<<<<
+ *             use_proxies = self.use_proxies
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_use_proxies == Py_None);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1318
+ * 
+ *         if use_proxies is None:
+ *             use_proxies = self.use_proxies             # <<<<<<<<<<<<<<
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ */
+    __Pyx_INCREF(__pyx_v_self->use_proxies);
+    __Pyx_DECREF(__pyx_v_use_proxies);
+    __pyx_v_use_proxies = __pyx_v_self->use_proxies;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1320
+ *             use_proxies = self.use_proxies
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             obj = _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1321
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             obj = _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *             if obj is None:
+ */
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_v_obj);
+    __pyx_v_obj = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1323
+ *             obj = _get_object(self.context, ref >> 1)
+ * 
+ *             if obj is None:             # <<<<<<<<<<<<<<
+ *                 raise pyamf.ReferenceError('Unknown reference %d' % (ref >> 1,))
+ * 
+ */
+    __pyx_t_2 = (__pyx_v_obj == Py_None);
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1324
+ * 
+ *             if obj is None:
+ *                 raise pyamf.ReferenceError('Unknown reference %d' % (ref >> 1,))             # <<<<<<<<<<<<<<
+ * 
+ *             if use_proxies is True:
+ */
+      __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ReferenceError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = PyInt_FromLong((__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_3);
+      __pyx_t_3 = 0;
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_15), __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_3);
+      __pyx_t_3 = 0;
+      __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/cpyamf/amf3.pyx":1326
+ *                 raise pyamf.ReferenceError('Unknown reference %d' % (ref >> 1,))
+ * 
+ *             if use_proxies is True:             # <<<<<<<<<<<<<<
+ *                 obj = self.readProxy(obj)
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = (__pyx_v_use_proxies == __pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/amf3.pyx":1327
+ * 
+ *             if use_proxies is True:
+ *                 obj = self.readProxy(obj)             # <<<<<<<<<<<<<<
+ * 
+ *             return obj
+ */
+      __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__readProxy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_v_obj);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_obj);
+      __Pyx_GIVEREF(__pyx_v_obj);
+      __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_v_obj);
+      __pyx_v_obj = __pyx_t_4;
+      __pyx_t_4 = 0;
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/amf3.pyx":1329
+ *                 obj = self.readProxy(obj)
+ * 
+ *             return obj             # <<<<<<<<<<<<<<
+ * 
+ *         ref >>= 1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_obj);
+    __pyx_r = __pyx_v_obj;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1331
+ *             return obj
+ * 
+ *         ref >>= 1             # <<<<<<<<<<<<<<
+ * 
+ *         class_def = self._readClassDefinition(ref)
+ */
+  __pyx_v_ref >>= 1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1333
+ *         ref >>= 1
+ * 
+ *         class_def = self._readClassDefinition(ref)             # <<<<<<<<<<<<<<
+ *         alias = class_def.alias
+ * 
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readClassDefinition(__pyx_v_self, __pyx_v_ref); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_v_class_def);
+  __pyx_v_class_def = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1334
+ * 
+ *         class_def = self._readClassDefinition(ref)
+ *         alias = class_def.alias             # <<<<<<<<<<<<<<
+ * 
+ *         obj = alias.createInstance(codec=self)
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__alias); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_v_alias);
+  __pyx_v_alias = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1336
+ *         alias = class_def.alias
+ * 
+ *         obj = alias.createInstance(codec=self)             # <<<<<<<<<<<<<<
+ *         obj_attrs = {}
+ * 
+ */
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__createInstance); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_5));
+  if (PyDict_SetItem(__pyx_t_5, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_5)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_v_obj);
+  __pyx_v_obj = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1337
+ * 
+ *         obj = alias.createInstance(codec=self)
+ *         obj_attrs = {}             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, obj)
+ */
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_DECREF(__pyx_v_obj_attrs);
+  __pyx_v_obj_attrs = ((PyObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1339
+ *         obj_attrs = {}
+ * 
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         encoding = class_def.encoding
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1341
+ *         _add_object(self.context, obj)
+ * 
+ *         encoding = class_def.encoding             # <<<<<<<<<<<<<<
+ * 
+ *         if encoding == OBJECT_ENCODING_EXTERNAL or encoding == OBJECT_ENCODING_PROXY:
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__encoding); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyInt_AsLong(__pyx_t_3); if (unlikely((__pyx_t_1 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_encoding = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1343
+ *         encoding = class_def.encoding
+ * 
+ *         if encoding == OBJECT_ENCODING_EXTERNAL or encoding == OBJECT_ENCODING_PROXY:             # <<<<<<<<<<<<<<
+ *             obj.__readamf__(amf3.DataInput(self))
+ *         elif encoding == OBJECT_ENCODING_DYNAMIC:
+ */
+  switch (__pyx_v_encoding) {
+    case 1:
+    case 3:
+
+    /* "/root/package/cpyamf/amf3.pyx":1344
+ * 
+ *         if encoding == OBJECT_ENCODING_EXTERNAL or encoding == OBJECT_ENCODING_PROXY:
+ *             obj.__readamf__(amf3.DataInput(self))             # <<<<<<<<<<<<<<
+ *         elif encoding == OBJECT_ENCODING_DYNAMIC:
+ *             for attr in class_def.static_properties:
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s____readamf__); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__DataInput); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    __pyx_t_7 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1345
+ *         if encoding == OBJECT_ENCODING_EXTERNAL or encoding == OBJECT_ENCODING_PROXY:
+ *             obj.__readamf__(amf3.DataInput(self))
+ *         elif encoding == OBJECT_ENCODING_DYNAMIC:             # <<<<<<<<<<<<<<
+ *             for attr in class_def.static_properties:
+ *                 obj_attrs[attr] = self._readElement()
+ */
+    case 2:
+
+    /* "/root/package/cpyamf/amf3.pyx":1346
+ *             obj.__readamf__(amf3.DataInput(self))
+ *         elif encoding == OBJECT_ENCODING_DYNAMIC:
+ *             for attr in class_def.static_properties:             # <<<<<<<<<<<<<<
+ *                 obj_attrs[attr] = self._readElement()
+ * 
+ */
+    __pyx_t_7 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__static_properties); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    if (PyList_CheckExact(__pyx_t_7) || PyTuple_CheckExact(__pyx_t_7)) {
+      __pyx_t_8 = 0; __pyx_t_4 = __pyx_t_7; __Pyx_INCREF(__pyx_t_4);
+    } else {
+      __pyx_t_8 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
+      } else {
+        __pyx_t_7 = PyIter_Next(__pyx_t_4);
+        if (!__pyx_t_7) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_7);
+      }
+      __Pyx_DECREF(__pyx_v_attr);
+      __pyx_v_attr = __pyx_t_7;
+      __pyx_t_7 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1347
+ *         elif encoding == OBJECT_ENCODING_DYNAMIC:
+ *             for attr in class_def.static_properties:
+ *                 obj_attrs[attr] = self._readElement()             # <<<<<<<<<<<<<<
+ * 
+ *             attr = self._readString(0)
+ */
+      __pyx_t_7 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      if (PyObject_SetItem(__pyx_v_obj_attrs, __pyx_v_attr, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1349
+ *                 obj_attrs[attr] = self._readElement()
+ * 
+ *             attr = self._readString(0)             # <<<<<<<<<<<<<<
+ * 
+ *             while attr:
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_attr);
+    __pyx_v_attr = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1351
+ *             attr = self._readString(0)
+ * 
+ *             while attr:             # <<<<<<<<<<<<<<
+ *                 obj_attrs[attr] = self._readElement()
+ *                 attr = self._readString(0)
+ */
+    while (1) {
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_attr); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (!__pyx_t_2) break;
+
+      /* "/root/package/cpyamf/amf3.pyx":1352
+ * 
+ *             while attr:
+ *                 obj_attrs[attr] = self._readElement()             # <<<<<<<<<<<<<<
+ *                 attr = self._readString(0)
+ *         elif encoding == OBJECT_ENCODING_STATIC:
+ */
+      __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyObject_SetItem(__pyx_v_obj_attrs, __pyx_v_attr, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1353
+ *             while attr:
+ *                 obj_attrs[attr] = self._readElement()
+ *                 attr = self._readString(0)             # <<<<<<<<<<<<<<
+ *         elif encoding == OBJECT_ENCODING_STATIC:
+ *             for attr in class_def.static_properties:
+ */
+      __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_v_attr);
+      __pyx_v_attr = __pyx_t_4;
+      __pyx_t_4 = 0;
+    }
+    break;
+
+    /* "/root/package/cpyamf/amf3.pyx":1354
+ *                 obj_attrs[attr] = self._readElement()
+ *                 attr = self._readString(0)
+ *         elif encoding == OBJECT_ENCODING_STATIC:             # <<<<<<<<<<<<<<
+ *             for attr in class_def.static_properties:
+ *                 obj_attrs[attr] = self._readElement()
+ */
+    case 0:
+
+    /* "/root/package/cpyamf/amf3.pyx":1355
+ *                 attr = self._readString(0)
+ *         elif encoding == OBJECT_ENCODING_STATIC:
+ *             for attr in class_def.static_properties:             # <<<<<<<<<<<<<<
+ *                 obj_attrs[attr] = self._readElement()
+ *         else:
+ */
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__static_properties); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
+      __pyx_t_8 = 0; __pyx_t_7 = __pyx_t_4; __Pyx_INCREF(__pyx_t_7);
+    } else {
+      __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_7))) {
+        if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_4); __pyx_t_8++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
+        if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_4); __pyx_t_8++;
+      } else {
+        __pyx_t_4 = PyIter_Next(__pyx_t_7);
+        if (!__pyx_t_4) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      __Pyx_DECREF(__pyx_v_attr);
+      __pyx_v_attr = __pyx_t_4;
+      __pyx_t_4 = 0;
+
+      /* "/root/package/cpyamf/amf3.pyx":1356
+ *         elif encoding == OBJECT_ENCODING_STATIC:
+ *             for attr in class_def.static_properties:
+ *                 obj_attrs[attr] = self._readElement()             # <<<<<<<<<<<<<<
+ *         else:
+ *             raise pyamf.DecodeError("Unknown object encoding")
+ */
+      __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1356; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyObject_SetItem(__pyx_v_obj_attrs, __pyx_v_attr, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1356; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    break;
+    default:
+
+    /* "/root/package/cpyamf/amf3.pyx":1358
+ *                 obj_attrs[attr] = self._readElement()
+ *         else:
+ *             raise pyamf.DecodeError("Unknown object encoding")             # <<<<<<<<<<<<<<
+ * 
+ *         plan = class_def.plan
+ */
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__DecodeError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_17));
+    PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_kp_s_17));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_17));
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    break;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1360
+ *             raise pyamf.DecodeError("Unknown object encoding")
+ * 
+ *         plan = class_def.plan             # <<<<<<<<<<<<<<
+ * 
+ *         if plan is not None:
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__plan); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_plan);
+  __pyx_v_plan = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1362
+ *         plan = class_def.plan
+ * 
+ *         if plan is not None:             # <<<<<<<<<<<<<<
+ *             plan.applyAttributes(obj, obj_attrs, codec=self)
+ *         else:
+ */
+  __pyx_t_2 = (__pyx_v_plan != Py_None);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1363
+ * 
+ *         if plan is not None:
+ *             plan.applyAttributes(obj, obj_attrs, codec=self)             # <<<<<<<<<<<<<<
+ *         else:
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_plan, __pyx_n_s__applyAttributes); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __Pyx_INCREF(__pyx_v_obj_attrs);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_obj_attrs);
+    __Pyx_GIVEREF(__pyx_v_obj_attrs);
+    __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+    if (PyDict_SetItem(__pyx_t_4, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_7, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L13;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/amf3.pyx":1365
+ *             plan.applyAttributes(obj, obj_attrs, codec=self)
+ *         else:
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)             # <<<<<<<<<<<<<<
+ * 
+ *         if use_proxies is True:
+ */
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_alias, __pyx_n_s__applyAttributes); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __Pyx_INCREF(__pyx_v_obj_attrs);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_obj_attrs);
+    __Pyx_GIVEREF(__pyx_v_obj_attrs);
+    __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+    if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_n_s__codec), ((PyObject *)__pyx_v_self)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_5, __pyx_t_4, ((PyObject *)__pyx_t_7)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1367
+ *             alias.applyAttributes(obj, obj_attrs, codec=self)
+ * 
+ *         if use_proxies is True:             # <<<<<<<<<<<<<<
+ *             obj = self.readProxy(obj)
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = (__pyx_v_use_proxies == __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1368
+ * 
+ *         if use_proxies is True:
+ *             obj = self.readProxy(obj)             # <<<<<<<<<<<<<<
+ * 
+ *         return obj
+ */
+    __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__readProxy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_obj);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_obj);
+    __Pyx_GIVEREF(__pyx_v_obj);
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_v_obj);
+    __pyx_v_obj = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L14;
+  }
+  __pyx_L14:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1370
+ *             obj = self.readProxy(obj)
+ * 
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readXML(self, bint legacy):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readObject");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF(__pyx_v_class_def);
+  __Pyx_DECREF(__pyx_v_alias);
+  __Pyx_DECREF(__pyx_v_obj_attrs);
+  __Pyx_DECREF(__pyx_v_attr);
+  __Pyx_DECREF(__pyx_v_plan);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_use_proxies);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1372
+ *         return obj
+ * 
+ *     cdef object _readXML(self, bint legacy):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readXML(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, int __pyx_v_legacy) {
+  long __pyx_v_ref;
+  PyObject *__pyx_v_xmlstring;
+  PyObject *__pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("_readXML");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_xmlstring = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1373
+ * 
+ *     cdef object _readXML(self, bint legacy):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1375
+ *         cdef long ref = self._readInteger(0)
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1376
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         xmlstring = _read_bytes(self.stream, ref >> 1, 0)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1378
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         xmlstring = _read_bytes(self.stream, ref >> 1, 0)             # <<<<<<<<<<<<<<
+ * 
+ *         x = util.ET.fromstring(xmlstring)
+ */
+  __pyx_t_3 = __pyx_f_6cpyamf_4amf3__read_bytes(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref >> 1), 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_xmlstring);
+  __pyx_v_xmlstring = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1380
+ *         xmlstring = _read_bytes(self.stream, ref >> 1, 0)
+ * 
+ *         x = util.ET.fromstring(xmlstring)             # <<<<<<<<<<<<<<
+ *         _add_object(self.context, x)
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ET); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_xmlstring);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_xmlstring);
+  __Pyx_GIVEREF(__pyx_v_xmlstring);
+  __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_x);
+  __pyx_v_x = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1381
+ * 
+ *         x = util.ET.fromstring(xmlstring)
+ *         _add_object(self.context, x)             # <<<<<<<<<<<<<<
+ * 
+ *         if legacy:
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_x); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1383
+ *         _add_object(self.context, x)
+ * 
+ *         if legacy:             # <<<<<<<<<<<<<<
+ *             self.context.addLegacyXML(x)
+ * 
+ */
+  __pyx_t_2 = __pyx_v_legacy;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1384
+ * 
+ *         if legacy:
+ *             self.context.addLegacyXML(x)             # <<<<<<<<<<<<<<
+ * 
+ *         return x
+ */
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_n_s__addLegacyXML); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_x);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_x);
+    __Pyx_GIVEREF(__pyx_v_x);
+    __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1386
+ *             self.context.addLegacyXML(x)
+ * 
+ *         return x             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readByteArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_x);
+  __pyx_r = __pyx_v_x;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readXML");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_xmlstring);
+  __Pyx_DECREF(__pyx_v_x);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1388
+ *         return x
+ * 
+ *     cdef object _readByteArray(self):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ * 
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readByteArray(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  long __pyx_v_ref;
+  PyObject *__pyx_v_buffer;
+  PyObject *__pyx_v_data;
+  PyObject *__pyx_v_compressed;
+  PyObject *__pyx_v_obj;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("_readByteArray");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_buffer = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_data = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_compressed = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_obj = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1389
+ * 
+ *     cdef object _readByteArray(self):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1389; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1391
+ *         cdef long ref = self._readInteger(0)
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1392
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         buffer = self.stream.read_view(ref >> 1)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1394
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         buffer = self.stream.read_view(ref >> 1)             # <<<<<<<<<<<<<<
+ *         data = amf3._decompress(buffer)
+ *         compressed = data is not None
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_view(__pyx_v_self->__pyx_base.__pyx_base.stream, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_v_buffer);
+  __pyx_v_buffer = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1395
+ * 
+ *         buffer = self.stream.read_view(ref >> 1)
+ *         data = amf3._decompress(buffer)             # <<<<<<<<<<<<<<
+ *         compressed = data is not None
+ * 
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s___decompress); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_buffer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_buffer);
+  __Pyx_GIVEREF(__pyx_v_buffer);
+  __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_data);
+  __pyx_v_data = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1396
+ *         buffer = self.stream.read_view(ref >> 1)
+ *         data = amf3._decompress(buffer)
+ *         compressed = data is not None             # <<<<<<<<<<<<<<
+ * 
+ *         if compressed:
+ */
+  __pyx_t_2 = (__pyx_v_data != Py_None);
+  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_v_compressed);
+  __pyx_v_compressed = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1398
+ *         compressed = data is not None
+ * 
+ *         if compressed:             # <<<<<<<<<<<<<<
+ *             buffer = data
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_compressed); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1399
+ * 
+ *         if compressed:
+ *             buffer = data             # <<<<<<<<<<<<<<
+ * 
+ *         obj = amf3.ByteArray(buffer)
+ */
+    __Pyx_INCREF(__pyx_v_data);
+    __Pyx_DECREF(__pyx_v_buffer);
+    __pyx_v_buffer = __pyx_v_data;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1401
+ *             buffer = data
+ * 
+ *         obj = amf3.ByteArray(buffer)             # <<<<<<<<<<<<<<
+ *         obj.compressed = compressed
+ * 
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__ByteArray); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_buffer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_buffer);
+  __Pyx_GIVEREF(__pyx_v_buffer);
+  __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_obj);
+  __pyx_v_obj = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1402
+ * 
+ *         obj = amf3.ByteArray(buffer)
+ *         obj.compressed = compressed             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, obj)
+ */
+  if (PyObject_SetAttr(__pyx_v_obj, __pyx_n_s__compressed, __pyx_v_compressed) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1404
+ *         obj.compressed = compressed
+ * 
+ *         _add_object(self.context, obj)             # <<<<<<<<<<<<<<
+ * 
+ *         return obj
+ */
+  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_obj); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1406
+ *         _add_object(self.context, obj)
+ * 
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readVector(self, object klass):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readByteArray");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_buffer);
+  __Pyx_DECREF(__pyx_v_data);
+  __Pyx_DECREF(__pyx_v_compressed);
+  __Pyx_DECREF(__pyx_v_obj);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1408
+ *         return obj
+ * 
+ *     cdef object _readVector(self, object klass):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ *         cdef unsigned char fixed
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readVector(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self, PyObject *__pyx_v_klass) {
+  long __pyx_v_ref;
+  unsigned char __pyx_v_fixed;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_readVector");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_klass);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1409
+ * 
+ *     cdef object _readVector(self, object klass):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef unsigned char fixed
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1412
+ *         cdef unsigned char fixed
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1413
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_uchar(&fixed)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1415
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         self.stream.read_uchar(&fixed)             # <<<<<<<<<<<<<<
+ *         result = amf3._unpack_vector(klass, self.stream, ref >> 1, fixed)
+ * 
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_fixed)); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1416
+ * 
+ *         self.stream.read_uchar(&fixed)
+ *         result = amf3._unpack_vector(klass, self.stream, ref >> 1, fixed)             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, result)
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s___unpack_vector); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyInt_FromLong((__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyInt_FromLong(__pyx_v_fixed); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_INCREF(__pyx_v_klass);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_klass);
+  __Pyx_GIVEREF(__pyx_v_klass);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+  PyTuple_SET_ITEM(__pyx_t_7, 1, ((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->__pyx_base.__pyx_base.stream));
+  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1418
+ *         result = amf3._unpack_vector(klass, self.stream, ref >> 1, fixed)
+ * 
+ *         _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1420
+ *         _add_object(self.context, result)
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readObjectVector(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readVector");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_klass);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1422
+ *         return result
+ * 
+ *     cdef object _readObjectVector(self):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ *         cdef long i
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readObjectVector(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  long __pyx_v_ref;
+  long __pyx_v_i;
+  unsigned char __pyx_v_fixed;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_readObjectVector");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1423
+ * 
+ *     cdef object _readObjectVector(self):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef long i
+ *         cdef unsigned char fixed
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1423; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1427
+ *         cdef unsigned char fixed
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1428
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_uchar(&fixed)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1430
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         self.stream.read_uchar(&fixed)             # <<<<<<<<<<<<<<
+ *         result = ObjectVector(fixed=bool(fixed),
+ *             classname=self._readString(1))
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_fixed)); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1431
+ * 
+ *         self.stream.read_uchar(&fixed)
+ *         result = ObjectVector(fixed=bool(fixed),             # <<<<<<<<<<<<<<
+ *             classname=self._readString(1))
+ * 
+ */
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_5 = PyInt_FromLong(__pyx_v_fixed); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__fixed), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1432
+ *         self.stream.read_uchar(&fixed)
+ *         result = ObjectVector(fixed=bool(fixed),
+ *             classname=self._readString(1))             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, result)
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readString(__pyx_v_self, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__classname), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_v_6cpyamf_4amf3_ObjectVector, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1434
+ *             classname=self._readString(1))
+ * 
+ *         _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         for i from 0 <= i < ref >> 1:
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1436
+ *         _add_object(self.context, result)
+ * 
+ *         for i from 0 <= i < ref >> 1:             # <<<<<<<<<<<<<<
+ *             result.append(self._readElement())
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_ref >> 1);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1437
+ * 
+ *         for i from 0 <= i < ref >> 1:
+ *             result.append(self._readElement())             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __Pyx_PyObject_Append(__pyx_v_result, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1439
+ *             result.append(self._readElement())
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _readDictionary(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readObjectVector");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1441
+ *         return result
+ * 
+ *     cdef object _readDictionary(self):             # <<<<<<<<<<<<<<
+ *         cdef long ref = self._readInteger(0)
+ *         cdef long i
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4amf3_7Decoder__readDictionary(struct __pyx_obj_6cpyamf_4amf3_Decoder *__pyx_v_self) {
+  long __pyx_v_ref;
+  long __pyx_v_i;
+  unsigned char __pyx_v_weak_keys;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_v_key;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_readDictionary");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_result = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1442
+ * 
+ *     cdef object _readDictionary(self):
+ *         cdef long ref = self._readInteger(0)             # <<<<<<<<<<<<<<
+ *         cdef long i
+ *         cdef unsigned char weak_keys
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->_readInteger(__pyx_v_self, 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_ref = __pyx_t_1;
+
+  /* "/root/package/cpyamf/amf3.pyx":1446
+ *         cdef unsigned char weak_keys
+ * 
+ *         if ref & REFERENCE_BIT == 0:             # <<<<<<<<<<<<<<
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_ref & 1) == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1447
+ * 
+ *         if ref & REFERENCE_BIT == 0:
+ *             return _get_object(self.context, ref >> 1)             # <<<<<<<<<<<<<<
+ * 
+ *         self.stream.read_uchar(&weak_keys)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_6cpyamf_4amf3__get_object(__pyx_v_self->__pyx_base.__pyx_base.context, (__pyx_v_ref >> 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1449
+ *             return _get_object(self.context, ref >> 1)
+ * 
+ *         self.stream.read_uchar(&weak_keys)             # <<<<<<<<<<<<<<
+ *         result = Dictionary(weak_keys=bool(weak_keys))
+ * 
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_base.__pyx_base.stream->__pyx_vtab)->read_uchar(__pyx_v_self->__pyx_base.__pyx_base.stream, (&__pyx_v_weak_keys)); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1450
+ * 
+ *         self.stream.read_uchar(&weak_keys)
+ *         result = Dictionary(weak_keys=bool(weak_keys))             # <<<<<<<<<<<<<<
+ * 
+ *         _add_object(self.context, result)
+ */
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_5 = PyInt_FromLong(__pyx_v_weak_keys); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__weak_keys), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_v_6cpyamf_4amf3_Dictionary, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1452
+ *         result = Dictionary(weak_keys=bool(weak_keys))
+ * 
+ *         _add_object(self.context, result)             # <<<<<<<<<<<<<<
+ * 
+ *         for i from 0 <= i < ref >> 1:
+ */
+  __pyx_t_4 = __pyx_f_6cpyamf_4amf3__add_object(__pyx_v_self->__pyx_base.__pyx_base.context, __pyx_v_result); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/amf3.pyx":1454
+ *         _add_object(self.context, result)
+ * 
+ *         for i from 0 <= i < ref >> 1:             # <<<<<<<<<<<<<<
+ *             key = self._readElement()
+ *             result[key] = self._readElement()
+ */
+  __pyx_t_1 = (__pyx_v_ref >> 1);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1455
+ * 
+ *         for i from 0 <= i < ref >> 1:
+ *             key = self._readElement()             # <<<<<<<<<<<<<<
+ *             result[key] = self._readElement()
+ * 
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_v_key);
+    __pyx_v_key = __pyx_t_5;
+    __pyx_t_5 = 0;
+
+    /* "/root/package/cpyamf/amf3.pyx":1456
+ *         for i from 0 <= i < ref >> 1:
+ *             key = self._readElement()
+ *             result[key] = self._readElement()             # <<<<<<<<<<<<<<
+ * 
+ *         return result
+ */
+    __pyx_t_5 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._readElement(((struct __pyx_obj_6cpyamf_5codec_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyObject_SetItem(__pyx_v_result, __pyx_v_key, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+
+  /* "/root/package/cpyamf/amf3.pyx":1458
+ *             result[key] = self._readElement()
+ * 
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     def readUndefined(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._readDictionary");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF(__pyx_v_key);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1460
+ *         return result
+ * 
+ *     def readUndefined(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read undefined.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUndefined(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readUndefined[] = "\n        Read undefined.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUndefined(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readUndefined");
+
+  /* "/root/package/cpyamf/amf3.pyx":1464
+ *         Read undefined.
+ *         """
+ *         return pyamf.Undefined             # <<<<<<<<<<<<<<
+ * 
+ *     def readNull(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pyamf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__Undefined); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readUndefined");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1466
+ *         return pyamf.Undefined
+ * 
+ *     def readNull(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read null.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNull(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readNull[] = "\n        Read null.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNull(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannySetupContext("readNull");
+
+  /* "/root/package/cpyamf/amf3.pyx":1470
+ *         Read null.
+ *         """
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     def readBoolFalse(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_None);
+  __pyx_r = Py_None;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1472
+ *         return None
+ * 
+ *     def readBoolFalse(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns C{False}.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolFalse(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readBoolFalse[] = "\n        Returns C{False}.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolFalse(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readBoolFalse");
+
+  /* "/root/package/cpyamf/amf3.pyx":1476
+ *         Returns C{False}.
+ *         """
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     def readBoolTrue(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readBoolFalse");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1478
+ *         return False
+ * 
+ *     def readBoolTrue(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns C{True}.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolTrue(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readBoolTrue[] = "\n        Returns C{True}.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolTrue(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readBoolTrue");
+
+  /* "/root/package/cpyamf/amf3.pyx":1482
+ *         Returns C{True}.
+ *         """
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     def readNumber(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readBoolTrue");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1484
+ *         return True
+ * 
+ *     def readNumber(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read number.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNumber(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readNumber[] = "\n        Read number.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNumber(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readNumber");
+
+  /* "/root/package/cpyamf/amf3.pyx":1488
+ *         Read number.
+ *         """
+ *         return self._readNumber()             # <<<<<<<<<<<<<<
+ * 
+ *     def readUnsignedInteger(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readNumber(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readNumber");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1490
+ *         return self._readNumber()
+ * 
+ *     def readUnsignedInteger(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns an unsigned integer from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUnsignedInteger(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readUnsignedInteger[] = "\n        Reads and returns an unsigned integer from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUnsignedInteger(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readUnsignedInteger");
+
+  /* "/root/package/cpyamf/amf3.pyx":1494
+ *         Reads and returns an unsigned integer from the stream.
+ *         """
+ *         return self._readInteger(0)             # <<<<<<<<<<<<<<
+ * 
+ *     def readSignedInteger(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readInteger(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 0); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readUnsignedInteger");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1496
+ *         return self._readInteger(0)
+ * 
+ *     def readSignedInteger(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns a signed integer from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readSignedInteger(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readSignedInteger[] = "\n        Reads and returns a signed integer from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readSignedInteger(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readSignedInteger");
+
+  /* "/root/package/cpyamf/amf3.pyx":1500
+ *         Reads and returns a signed integer from the stream.
+ *         """
+ *         return self._readInteger(1)             # <<<<<<<<<<<<<<
+ * 
+ *     def readInteger(self, sign=False):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readInteger(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 1); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readSignedInteger");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1502
+ *         return self._readInteger(1)
+ * 
+ *     def readInteger(self, sign=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns an integer from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readInteger(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readInteger[] = "\n        Reads and returns an integer from the stream.\n\n        @param sign: Whether the integer is signed (C{signed} is a reserved\n            word in Cython).\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readInteger(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sign = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  long __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__sign,0};
+  __Pyx_RefNannySetupContext("readInteger");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    values[0] = __pyx_k_18;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__sign);
+        if (unlikely(value)) { values[0] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "readInteger") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1502; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_sign = values[0];
+  } else {
+    __pyx_v_sign = __pyx_k_18;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: __pyx_v_sign = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readInteger", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1502; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readInteger");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_sign);
+
+  /* "/root/package/cpyamf/amf3.pyx":1509
+ *             word in Cython).
+ *         """
+ *         if sign:             # <<<<<<<<<<<<<<
+ *             return self._readInteger(1)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_sign); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1510
+ *         """
+ *         if sign:
+ *             return self._readInteger(1)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._readInteger(0)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readInteger(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 1); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1510; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1510; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1512
+ *             return self._readInteger(1)
+ * 
+ *         return self._readInteger(0)             # <<<<<<<<<<<<<<
+ * 
+ *     def readString(self, unicode_=True):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readInteger(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 0); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readInteger");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_sign);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1514
+ *         return self._readInteger(0)
+ * 
+ *     def readString(self, unicode_=True):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns a string from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readString[] = "\n        Reads and returns a string from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readString(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_unicode_ = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__unicode_,0};
+  __Pyx_RefNannySetupContext("readString");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    values[0] = __pyx_k_19;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__unicode_);
+        if (unlikely(value)) { values[0] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "readString") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1514; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_unicode_ = values[0];
+  } else {
+    __pyx_v_unicode_ = __pyx_k_19;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: __pyx_v_unicode_ = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readString", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1514; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readString");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_unicode_);
+
+  /* "/root/package/cpyamf/amf3.pyx":1518
+ *         Reads and returns a string from the stream.
+ *         """
+ *         if unicode_:             # <<<<<<<<<<<<<<
+ *             return self._readString(1)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_unicode_); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/amf3.pyx":1519
+ *         """
+ *         if unicode_:
+ *             return self._readString(1)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._readString(0)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readString(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1521
+ *             return self._readString(1)
+ * 
+ *         return self._readString(0)             # <<<<<<<<<<<<<<
+ * 
+ *     def readDate(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readString(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_unicode_);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1523
+ *         return self._readString(0)
+ * 
+ *     def readDate(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read date from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readDate(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readDate[] = "\n        Read date from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readDate(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readDate");
+
+  /* "/root/package/cpyamf/amf3.pyx":1527
+ *         Read date from the stream.
+ *         """
+ *         return self._readDate()             # <<<<<<<<<<<<<<
+ * 
+ *     def readArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readDate(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readDate");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1529
+ *         return self._readDate()
+ * 
+ *     def readArray(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads an array from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readArray(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readArray[] = "\n        Reads an array from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readArray(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readArray");
+
+  /* "/root/package/cpyamf/amf3.pyx":1533
+ *         Reads an array from the stream.
+ *         """
+ *         return self._readArray()             # <<<<<<<<<<<<<<
+ * 
+ *     def _getClassDefinition(self, ref):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readArray(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1533; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1535
+ *         return self._readArray()
+ * 
+ *     def _getClassDefinition(self, ref):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads class definition from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder__getClassDefinition(PyObject *__pyx_v_self, PyObject *__pyx_v_ref); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder__getClassDefinition[] = "\n        Reads class definition from the stream.\n\n        @return: A tuple of the class definition and its alias.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder__getClassDefinition(PyObject *__pyx_v_self, PyObject *__pyx_v_ref) {
+  PyObject *__pyx_v_class_def;
+  PyObject *__pyx_r = NULL;
+  long __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("_getClassDefinition");
+  __pyx_v_class_def = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/amf3.pyx":1541
+ *         @return: A tuple of the class definition and its alias.
+ *         """
+ *         class_def = self._readClassDefinition(ref)             # <<<<<<<<<<<<<<
+ * 
+ *         return class_def, class_def.alias
+ */
+  __pyx_t_1 = __Pyx_PyInt_AsLong(__pyx_v_ref); if (unlikely((__pyx_t_1 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readClassDefinition(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_v_class_def);
+  __pyx_v_class_def = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1543
+ *         class_def = self._readClassDefinition(ref)
+ * 
+ *         return class_def, class_def.alias             # <<<<<<<<<<<<<<
+ * 
+ *     def readObject(self, use_proxies=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_class_def, __pyx_n_s__alias); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_class_def);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_class_def);
+  __Pyx_GIVEREF(__pyx_v_class_def);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder._getClassDefinition");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_class_def);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1545
+ *         return class_def, class_def.alias
+ * 
+ *     def readObject(self, use_proxies=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads an object from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readObject(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readObject[] = "\n        Reads an object from the stream.\n\n        @raise pyamf.DecodeError: Unknown object encoding.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readObject(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_use_proxies = 0;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__use_proxies,0};
+  __Pyx_RefNannySetupContext("readObject");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    values[0] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_proxies);
+        if (unlikely(value)) { values[0] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "readObject") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1545; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_use_proxies = values[0];
+  } else {
+    __pyx_v_use_proxies = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: __pyx_v_use_proxies = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readObject", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1545; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readObject");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/amf3.pyx":1551
+ *         @raise pyamf.DecodeError: Unknown object encoding.
+ *         """
+ *         return self._readObject(use_proxies)             # <<<<<<<<<<<<<<
+ * 
+ *     def readXMLString(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readObject(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), __pyx_v_use_proxies); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1551; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readObject");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1553
+ *         return self._readObject(use_proxies)
+ * 
+ *     def readXMLString(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a string from the data stream and converts it into
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readXMLString(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readXMLString[] = "\n        Reads a string from the data stream and converts it into\n        an XML Tree.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readXMLString(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readXMLString");
+
+  /* "/root/package/cpyamf/amf3.pyx":1558
+ *         an XML Tree.
+ *         """
+ *         return self._readXML(0)             # <<<<<<<<<<<<<<
+ * 
+ *     def readXML(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readXML(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readXMLString");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1560
+ *         return self._readXML(0)
+ * 
+ *     def readXML(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Read a legacy XML Document from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readXML(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readXML[] = "\n        Read a legacy XML Document from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readXML(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readXML");
+
+  /* "/root/package/cpyamf/amf3.pyx":1564
+ *         Read a legacy XML Document from the stream.
+ *         """
+ *         return self._readXML(1)             # <<<<<<<<<<<<<<
+ * 
+ *     def readByteArray(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readXML(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readXML");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1566
+ *         return self._readXML(1)
+ * 
+ *     def readByteArray(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a string of data from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readByteArray(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readByteArray[] = "\n        Reads a string of data from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readByteArray(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readByteArray");
+
+  /* "/root/package/cpyamf/amf3.pyx":1570
+ *         Reads a string of data from the stream.
+ *         """
+ *         return self._readByteArray()             # <<<<<<<<<<<<<<
+ * 
+ *     def readIntVector(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readByteArray(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readByteArray");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1572
+ *         return self._readByteArray()
+ * 
+ *     def readIntVector(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a C{Vector.<int>} from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readIntVector(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readIntVector[] = "\n        Reads a C{Vector.<int>} from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readIntVector(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readIntVector");
+
+  /* "/root/package/cpyamf/amf3.pyx":1576
+ *         Reads a C{Vector.<int>} from the stream.
+ *         """
+ *         return self._readVector(amf3.IntVector)             # <<<<<<<<<<<<<<
+ * 
+ *     def readUintVector(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__IntVector); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readVector(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readIntVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1578
+ *         return self._readVector(amf3.IntVector)
+ * 
+ *     def readUintVector(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a C{Vector.<uint>} from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUintVector(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readUintVector[] = "\n        Reads a C{Vector.<uint>} from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readUintVector(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readUintVector");
+
+  /* "/root/package/cpyamf/amf3.pyx":1582
+ *         Reads a C{Vector.<uint>} from the stream.
+ *         """
+ *         return self._readVector(amf3.UintVector)             # <<<<<<<<<<<<<<
+ * 
+ *     def readNumberVector(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__UintVector); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readVector(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readUintVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1584
+ *         return self._readVector(amf3.UintVector)
+ * 
+ *     def readNumberVector(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a C{Vector.<Number>} from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNumberVector(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readNumberVector[] = "\n        Reads a C{Vector.<Number>} from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readNumberVector(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("readNumberVector");
+
+  /* "/root/package/cpyamf/amf3.pyx":1588
+ *         Reads a C{Vector.<Number>} from the stream.
+ *         """
+ *         return self._readVector(amf3.NumberVector)             # <<<<<<<<<<<<<<
+ * 
+ *     def readObjectVector(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_6cpyamf_4amf3_amf3, __pyx_n_s__NumberVector); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readVector(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readNumberVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1590
+ *         return self._readVector(amf3.NumberVector)
+ * 
+ *     def readObjectVector(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a C{Vector.<Object>} from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readObjectVector(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readObjectVector[] = "\n        Reads a C{Vector.<Object>} from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readObjectVector(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readObjectVector");
+
+  /* "/root/package/cpyamf/amf3.pyx":1594
+ *         Reads a C{Vector.<Object>} from the stream.
+ *         """
+ *         return self._readObjectVector()             # <<<<<<<<<<<<<<
+ * 
+ *     def readDictionary(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readObjectVector(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readObjectVector");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/amf3.pyx":1596
+ *         return self._readObjectVector()
+ * 
+ *     def readDictionary(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads a C{flash.utils.Dictionary} from the stream.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readDictionary(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static char __pyx_doc_6cpyamf_4amf3_7Decoder_readDictionary[] = "\n        Reads a C{flash.utils.Dictionary} from the stream.\n        ";
+static PyObject *__pyx_pf_6cpyamf_4amf3_7Decoder_readDictionary(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("readDictionary");
+
+  /* "/root/package/cpyamf/amf3.pyx":1600
+ *         Reads a C{flash.utils.Dictionary} from the stream.
+ *         """
+ *         return self._readDictionary()             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder *)((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)->__pyx_base.__pyx_vtab)->_readDictionary(((struct __pyx_obj_6cpyamf_4amf3_Decoder *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = 0;
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("cpyamf.amf3._decode_int");
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.amf3.Decoder.readDictionary");
+  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_stream);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":108
+/* "/root/package/cpyamf/amf3.pyx":1603
  * 
  * 
  * def encode_int(long n):             # <<<<<<<<<<<<<<
@@ -1201,20 +15418,12 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_encode_int(PyObject *__pyx_self, PyObjec
 static char __pyx_doc_6cpyamf_4amf3_encode_int[] = "\n    Encode C{int}.\n\n    @raise OverflowError: Out of range.\n    ";
 static PyObject *__pyx_pf_6cpyamf_4amf3_encode_int(PyObject *__pyx_self, PyObject *__pyx_arg_n) {
   long __pyx_v_n;
-  char *__pyx_v_buf;
-  Py_ssize_t __pyx_v_size;
-  PyObject *__pyx_v_o = 0;
   PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("encode_int");
   __pyx_self = __pyx_self;
   assert(__pyx_arg_n); {
-    __pyx_v_n = __Pyx_PyInt_AsLong(__pyx_arg_n); if (unlikely((__pyx_v_n == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n = __Pyx_PyInt_AsLong(__pyx_arg_n); if (unlikely((__pyx_v_n == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1603; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -1222,112 +15431,34 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_encode_int(PyObject *__pyx_self, PyObjec
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":114
+  /* "/root/package/cpyamf/amf3.pyx":1609
  *     @raise OverflowError: Out of range.
  *     """
- *     if n >= 0x10000000 or n < -0x10000000:             # <<<<<<<<<<<<<<
- *         raise OverflowError("Out of range")
- * 
- */
-  __pyx_t_1 = (__pyx_v_n >= 0x10000000);
-  if (!__pyx_t_1) {
-    __pyx_t_2 = (__pyx_v_n < -268435456);
-    __pyx_t_3 = __pyx_t_2;
-  } else {
-    __pyx_t_3 = __pyx_t_1;
-  }
-  if (__pyx_t_3) {
-
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":115
- *     """
- *     if n >= 0x10000000 or n < -0x10000000:
- *         raise OverflowError("Out of range")             # <<<<<<<<<<<<<<
- * 
- *     cdef char *buf = NULL
- */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_1));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_5, 0, 0);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":117
- *         raise OverflowError("Out of range")
- * 
- *     cdef char *buf = NULL             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t size = _encode_int(n, &buf)
- *     cdef object o = PyString_FromStringAndSize(buf, size)
- */
-  __pyx_v_buf = NULL;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":118
- * 
- *     cdef char *buf = NULL
- *     cdef Py_ssize_t size = _encode_int(n, &buf)             # <<<<<<<<<<<<<<
- *     cdef object o = PyString_FromStringAndSize(buf, size)
- * 
- */
-  __pyx_t_6 = __pyx_f_6cpyamf_4amf3__encode_int(__pyx_v_n, (&__pyx_v_buf)); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_size = __pyx_t_6;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":119
- *     cdef char *buf = NULL
- *     cdef Py_ssize_t size = _encode_int(n, &buf)
- *     cdef object o = PyString_FromStringAndSize(buf, size)             # <<<<<<<<<<<<<<
- * 
- *     PyMem_Free(buf)
- */
-  __pyx_t_5 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_size); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_v_o = __pyx_t_5;
-  __pyx_t_5 = 0;
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":121
- *     cdef object o = PyString_FromStringAndSize(buf, size)
- * 
- *     PyMem_Free(buf)             # <<<<<<<<<<<<<<
- * 
- *     return o
- */
-  PyMem_Free(__pyx_v_buf);
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":123
- *     PyMem_Free(buf)
+ *     return _encoded_int(n)             # <<<<<<<<<<<<<<
  * 
- *     return o             # <<<<<<<<<<<<<<
  * 
- * def decode_int(stream, sign=False):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_o);
-  __pyx_r = __pyx_v_o;
+  __pyx_t_1 = __pyx_f_6cpyamf_4amf3__encoded_int(__pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1609; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("cpyamf.amf3.encode_int");
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_o);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":125
- *     return o
+/* "/root/package/cpyamf/amf3.pyx":1612
+ * 
  * 
  * def decode_int(stream, sign=False):             # <<<<<<<<<<<<<<
  *     """
@@ -1354,7 +15485,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
     PyObject* values[2] = {0,0};
-    values[1] = __pyx_k_2;
+    values[1] = __pyx_k_20;
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -1373,12 +15504,12 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "decode_int") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "decode_int") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_stream = values[0];
     __pyx_v_sign = values[1];
   } else {
-    __pyx_v_sign = __pyx_k_2;
+    __pyx_v_sign = __pyx_k_20;
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  2: __pyx_v_sign = PyTuple_GET_ITEM(__pyx_args, 1);
       case  1: __pyx_v_stream = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -1388,7 +15519,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("decode_int", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("decode_int", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.amf3.decode_int");
   return NULL;
@@ -1397,7 +15528,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
   __Pyx_INCREF(__pyx_v_sign);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":129
+  /* "/root/package/cpyamf/amf3.pyx":1616
  *     Decode C{int}.
  *     """
  *     cdef long *result = NULL             # <<<<<<<<<<<<<<
@@ -1406,7 +15537,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
  */
   __pyx_v_result = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":132
+  /* "/root/package/cpyamf/amf3.pyx":1619
  *     cdef object ret
  * 
  *     result = <long *>PyMem_Malloc(sizeof(long *))             # <<<<<<<<<<<<<<
@@ -1415,7 +15546,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
  */
   __pyx_v_result = ((long *)PyMem_Malloc((sizeof(long *))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":134
+  /* "/root/package/cpyamf/amf3.pyx":1621
  *     result = <long *>PyMem_Malloc(sizeof(long *))
  * 
  *     if result == NULL:             # <<<<<<<<<<<<<<
@@ -1425,7 +15556,7 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
   __pyx_t_1 = (__pyx_v_result == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":135
+    /* "/root/package/cpyamf/amf3.pyx":1622
  * 
  *     if result == NULL:
  *         raise MemoryError             # <<<<<<<<<<<<<<
@@ -1433,26 +15564,26 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
  *     if _decode_int(<cBufferedByteStream>stream, result, <int>sign) == -1:
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":137
+  /* "/root/package/cpyamf/amf3.pyx":1624
  *         raise MemoryError
  * 
  *     if _decode_int(<cBufferedByteStream>stream, result, <int>sign) == -1:             # <<<<<<<<<<<<<<
  *         PyMem_Free(result)
  * 
  */
-  __pyx_t_2 = __Pyx_PyInt_AsInt(__pyx_v_sign); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_AsInt(__pyx_v_sign); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_4.__pyx_n = 1;
   __pyx_t_4.sign = ((int)__pyx_t_2);
-  __pyx_t_3 = __pyx_f_6cpyamf_4amf3__decode_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream), __pyx_v_result, &__pyx_t_4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_f_6cpyamf_4amf3__decode_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_stream), __pyx_v_result, &__pyx_t_4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_1 = (__pyx_t_3 == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":138
+    /* "/root/package/cpyamf/amf3.pyx":1625
  * 
  *     if _decode_int(<cBufferedByteStream>stream, result, <int>sign) == -1:
  *         PyMem_Free(result)             # <<<<<<<<<<<<<<
@@ -1461,42 +15592,42 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
  */
     PyMem_Free(__pyx_v_result);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":140
+    /* "/root/package/cpyamf/amf3.pyx":1627
  *         PyMem_Free(result)
  * 
  *         raise RuntimeError('Unable to decode int')             # <<<<<<<<<<<<<<
  * 
  *     ret = PyInt_FromLong(result[0])
  */
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
-    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_s_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
-    __pyx_t_6 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_21));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_s_21));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_21));
+    __pyx_t_6 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_Raise(__pyx_t_6, 0, 0);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L7;
   }
   __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":142
+  /* "/root/package/cpyamf/amf3.pyx":1629
  *         raise RuntimeError('Unable to decode int')
  * 
  *     ret = PyInt_FromLong(result[0])             # <<<<<<<<<<<<<<
  * 
  *     PyMem_Free(result)
  */
-  __pyx_t_6 = PyInt_FromLong((__pyx_v_result[0])); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyInt_FromLong((__pyx_v_result[0])); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1629; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_6;
   __pyx_t_6 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":144
+  /* "/root/package/cpyamf/amf3.pyx":1631
  *     ret = PyInt_FromLong(result[0])
  * 
  *     PyMem_Free(result)             # <<<<<<<<<<<<<<
@@ -1505,11 +15636,10 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
  */
   PyMem_Free(__pyx_v_result);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":146
+  /* "/root/package/cpyamf/amf3.pyx":1633
  *     PyMem_Free(result)
  * 
  *     return ret             # <<<<<<<<<<<<<<
- * 
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_ret);
@@ -1532,6 +15662,503 @@ static PyObject *__pyx_pf_6cpyamf_4amf3_decode_int(PyObject *__pyx_self, PyObjec
   return __pyx_r;
 }
 
+/* "/root/package/cpyamf/codec.pxd":8
+ * 
+ * cdef class Codec:
+ *     cdef public cBufferedByteStream stream             # <<<<<<<<<<<<<<
+ *     cdef public object context
+ *     cdef public object strict
+ */
+
+static PyObject *__pyx_pf_6cpyamf_5codec_5Codec_6stream___get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_6cpyamf_5codec_5Codec_6stream___get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannySetupContext("__get__");
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream));
+  __pyx_r = ((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6cpyamf_5codec_5Codec_6stream___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pf_6cpyamf_5codec_5Codec_6stream___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannySetupContext("__set__");
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_6cpyamf_4util_cBufferedByteStream))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream);
+  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream));
+  ((struct __pyx_obj_6cpyamf_5codec_Codec *)__pyx_v_self)->stream = ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_value);
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.codec.Codec.stream.__set__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_6cpyamf_4amf3_Encoder __pyx_vtable_6cpyamf_4amf3_Encoder;
+
+static PyObject *__pyx_tp_new_6cpyamf_4amf3_Encoder(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_6cpyamf_4amf3_Encoder *p;
+  PyObject *o = __pyx_ptype_6cpyamf_5codec_Encoder->tp_new(t, a, k);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_6cpyamf_4amf3_Encoder *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_6cpyamf_5codec_Encoder*)__pyx_vtabptr_6cpyamf_4amf3_Encoder;
+  p->use_proxies = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_6cpyamf_4amf3_Encoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf3_Encoder *p = (struct __pyx_obj_6cpyamf_4amf3_Encoder *)o;
+  Py_XDECREF(p->use_proxies);
+  __pyx_ptype_6cpyamf_5codec_Encoder->tp_dealloc(o);
+}
+
+static int __pyx_tp_traverse_6cpyamf_4amf3_Encoder(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6cpyamf_4amf3_Encoder *p = (struct __pyx_obj_6cpyamf_4amf3_Encoder *)o;
+  if (__pyx_ptype_6cpyamf_5codec_Encoder->tp_traverse) {
+    e = __pyx_ptype_6cpyamf_5codec_Encoder->tp_traverse(o, v, a); if (e) return e;
+  }
+  if (p->use_proxies) {
+    e = (*v)(p->use_proxies, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6cpyamf_4amf3_Encoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf3_Encoder *p = (struct __pyx_obj_6cpyamf_4amf3_Encoder *)o;
+  PyObject* tmp;
+  if (__pyx_ptype_6cpyamf_5codec_Encoder->tp_clear) {
+    __pyx_ptype_6cpyamf_5codec_Encoder->tp_clear(o);
+  }
+  tmp = ((PyObject*)p->use_proxies);
+  p->use_proxies = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static struct PyMethodDef __pyx_methods_6cpyamf_4amf3_Encoder[] = {
+  {__Pyx_NAMESTR("buildContext"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_buildContext, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("writeElement"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeElement, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeElement)},
+  {__Pyx_NAMESTR("writeProxy"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeProxy, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeProxy)},
+  {__Pyx_NAMESTR("writeUndefined"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeUndefined, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeUndefined)},
+  {__Pyx_NAMESTR("writeNull"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeNull, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeNull)},
+  {__Pyx_NAMESTR("writeBoolean"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeBoolean, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeBoolean)},
+  {__Pyx_NAMESTR("writeInteger"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeInteger, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeInteger)},
+  {__Pyx_NAMESTR("writeNumber"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeNumber, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeNumber)},
+  {__Pyx_NAMESTR("writeString"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeString, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeString)},
+  {__Pyx_NAMESTR("writeDate"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeDate, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeDate)},
+  {__Pyx_NAMESTR("writeList"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeList, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeList)},
+  {__Pyx_NAMESTR("writeDict"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeDict, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeDict)},
+  {__Pyx_NAMESTR("writeInstance"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeInstance, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeInstance)},
+  {__Pyx_NAMESTR("writeObject"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeObject, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeObject)},
+  {__Pyx_NAMESTR("writeByteArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeByteArray, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeByteArray)},
+  {__Pyx_NAMESTR("writeVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeVector, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeVector)},
+  {__Pyx_NAMESTR("writeObjectVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeObjectVector, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeObjectVector)},
+  {__Pyx_NAMESTR("writeDictionary"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeDictionary, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeDictionary)},
+  {__Pyx_NAMESTR("writeXML"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeXML, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeXML)},
+  {__Pyx_NAMESTR("writeRawAMF"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Encoder_writeRawAMF, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Encoder_writeRawAMF)},
+  {0, 0, 0, 0}
+};
+
+static struct PyMemberDef __pyx_members_6cpyamf_4amf3_Encoder[] = {
+  {(char *)"use_proxies", T_OBJECT, offsetof(struct __pyx_obj_6cpyamf_4amf3_Encoder, use_proxies), 0, 0},
+  {(char *)"string_references", T_INT, offsetof(struct __pyx_obj_6cpyamf_4amf3_Encoder, string_references), 0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_Encoder = {
+  0, /*nb_add*/
+  0, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION >= 3
+  0, /*reserved*/
+  #else
+  0, /*nb_long*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_Encoder = {
+  0, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_Encoder = {
+  0, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_Encoder = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_getbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_releasebuffer*/
+  #endif
+};
+
+PyTypeObject __pyx_type_6cpyamf_4amf3_Encoder = {
+  PyVarObject_HEAD_INIT(0, 0)
+  __Pyx_NAMESTR("cpyamf.amf3.Encoder"), /*tp_name*/
+  sizeof(struct __pyx_obj_6cpyamf_4amf3_Encoder), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6cpyamf_4amf3_Encoder, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_compare*/
+  0, /*tp_repr*/
+  &__pyx_tp_as_number_Encoder, /*tp_as_number*/
+  &__pyx_tp_as_sequence_Encoder, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_Encoder, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_Encoder, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Encodes an AMF3 data stream. A drop-in replacement for\n    L{pyamf.amf3.Encoder} that writes directly to the underlying\n    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.\n\n    The encoding methods of this class are not looked up by name, so\n    overriding them in a Python subclass will not affect nested elements.\n\n    @ivar use_proxies: Whether lists/dicts/objects are encoded as proxies\n        (C{ArrayCollection}/C{ObjectProxy}).\n    @type use_proxies: C{bool}\n    @ivar string_references: Whether repeated strings are encoded as\n        references.\n    @type string_references: C{bool}\n    "), /*tp_doc*/
+  __pyx_tp_traverse_6cpyamf_4amf3_Encoder, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4amf3_Encoder, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6cpyamf_4amf3_Encoder, /*tp_methods*/
+  __pyx_members_6cpyamf_4amf3_Encoder, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pf_6cpyamf_4amf3_7Encoder___init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6cpyamf_4amf3_Encoder, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*tp_version_tag*/
+  #endif
+};
+static struct __pyx_vtabstruct_6cpyamf_4amf3_Decoder __pyx_vtable_6cpyamf_4amf3_Decoder;
+
+static PyObject *__pyx_tp_new_6cpyamf_4amf3_Decoder(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_6cpyamf_4amf3_Decoder *p;
+  PyObject *o = __pyx_ptype_6cpyamf_5codec_Decoder->tp_new(t, a, k);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_6cpyamf_4amf3_Decoder *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_6cpyamf_5codec_Decoder*)__pyx_vtabptr_6cpyamf_4amf3_Decoder;
+  p->use_proxies = Py_None; Py_INCREF(Py_None);
+  p->typed_arrays = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_6cpyamf_4amf3_Decoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf3_Decoder *p = (struct __pyx_obj_6cpyamf_4amf3_Decoder *)o;
+  Py_XDECREF(p->use_proxies);
+  Py_XDECREF(p->typed_arrays);
+  __pyx_ptype_6cpyamf_5codec_Decoder->tp_dealloc(o);
+}
+
+static int __pyx_tp_traverse_6cpyamf_4amf3_Decoder(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6cpyamf_4amf3_Decoder *p = (struct __pyx_obj_6cpyamf_4amf3_Decoder *)o;
+  if (__pyx_ptype_6cpyamf_5codec_Decoder->tp_traverse) {
+    e = __pyx_ptype_6cpyamf_5codec_Decoder->tp_traverse(o, v, a); if (e) return e;
+  }
+  if (p->use_proxies) {
+    e = (*v)(p->use_proxies, a); if (e) return e;
+  }
+  if (p->typed_arrays) {
+    e = (*v)(p->typed_arrays, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6cpyamf_4amf3_Decoder(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4amf3_Decoder *p = (struct __pyx_obj_6cpyamf_4amf3_Decoder *)o;
+  PyObject* tmp;
+  if (__pyx_ptype_6cpyamf_5codec_Decoder->tp_clear) {
+    __pyx_ptype_6cpyamf_5codec_Decoder->tp_clear(o);
+  }
+  tmp = ((PyObject*)p->use_proxies);
+  p->use_proxies = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->typed_arrays);
+  p->typed_arrays = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static struct PyMethodDef __pyx_methods_6cpyamf_4amf3_Decoder[] = {
+  {__Pyx_NAMESTR("buildContext"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_buildContext, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("readUndefined"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readUndefined, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readUndefined)},
+  {__Pyx_NAMESTR("readNull"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readNull, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readNull)},
+  {__Pyx_NAMESTR("readBoolFalse"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolFalse, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readBoolFalse)},
+  {__Pyx_NAMESTR("readBoolTrue"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readBoolTrue, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readBoolTrue)},
+  {__Pyx_NAMESTR("readNumber"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readNumber, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readNumber)},
+  {__Pyx_NAMESTR("readUnsignedInteger"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readUnsignedInteger, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readUnsignedInteger)},
+  {__Pyx_NAMESTR("readSignedInteger"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readSignedInteger, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readSignedInteger)},
+  {__Pyx_NAMESTR("readInteger"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readInteger, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readInteger)},
+  {__Pyx_NAMESTR("readString"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readString, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readString)},
+  {__Pyx_NAMESTR("readDate"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readDate, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readDate)},
+  {__Pyx_NAMESTR("readArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readArray, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readArray)},
+  {__Pyx_NAMESTR("_getClassDefinition"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder__getClassDefinition, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder__getClassDefinition)},
+  {__Pyx_NAMESTR("readObject"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readObject, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readObject)},
+  {__Pyx_NAMESTR("readXMLString"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readXMLString, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readXMLString)},
+  {__Pyx_NAMESTR("readXML"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readXML, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readXML)},
+  {__Pyx_NAMESTR("readByteArray"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readByteArray, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readByteArray)},
+  {__Pyx_NAMESTR("readIntVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readIntVector, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readIntVector)},
+  {__Pyx_NAMESTR("readUintVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readUintVector, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readUintVector)},
+  {__Pyx_NAMESTR("readNumberVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readNumberVector, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readNumberVector)},
+  {__Pyx_NAMESTR("readObjectVector"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readObjectVector, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readObjectVector)},
+  {__Pyx_NAMESTR("readDictionary"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_7Decoder_readDictionary, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_7Decoder_readDictionary)},
+  {0, 0, 0, 0}
+};
+
+static struct PyMemberDef __pyx_members_6cpyamf_4amf3_Decoder[] = {
+  {(char *)"use_proxies", T_OBJECT, offsetof(struct __pyx_obj_6cpyamf_4amf3_Decoder, use_proxies), 0, 0},
+  {(char *)"typed_arrays", T_OBJECT, offsetof(struct __pyx_obj_6cpyamf_4amf3_Decoder, typed_arrays), 0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_Decoder = {
+  0, /*nb_add*/
+  0, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION >= 3
+  0, /*reserved*/
+  #else
+  0, /*nb_long*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_Decoder = {
+  0, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_Decoder = {
+  0, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_Decoder = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_getbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_releasebuffer*/
+  #endif
+};
+
+PyTypeObject __pyx_type_6cpyamf_4amf3_Decoder = {
+  PyVarObject_HEAD_INIT(0, 0)
+  __Pyx_NAMESTR("cpyamf.amf3.Decoder"), /*tp_name*/
+  sizeof(struct __pyx_obj_6cpyamf_4amf3_Decoder), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6cpyamf_4amf3_Decoder, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_compare*/
+  0, /*tp_repr*/
+  &__pyx_tp_as_number_Decoder, /*tp_as_number*/
+  &__pyx_tp_as_sequence_Decoder, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_Decoder, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_Decoder, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Decodes an AMF3 data stream. A drop-in replacement for\n    L{pyamf.amf3.Decoder} that reads directly from the underlying\n    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.\n\n    Nested elements are decoded without going through the public C{read*}\n    methods, so overriding them in a Python subclass only affects direct\n    calls.\n\n    @ivar use_proxies: Whether C{ArrayCollection}/C{ObjectProxy} instances\n        are unwrapped to their source objects.\n    @type use_proxies: C{bool}\n    @ivar typed_arrays: Whether dense arrays that only contain numbers are\n        decoded to an C{array.array}, see L{pyamf.amf3.Decoder.typed_arrays}.\n    @type typed_arrays: C{bool}\n    "), /*tp_doc*/
+  __pyx_tp_traverse_6cpyamf_4amf3_Decoder, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4amf3_Decoder, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6cpyamf_4amf3_Decoder, /*tp_methods*/
+  __pyx_members_6cpyamf_4amf3_Decoder, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pf_6cpyamf_4amf3_7Decoder___init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6cpyamf_4amf3_Decoder, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*tp_version_tag*/
+  #endif
+};
+
 static struct PyMethodDef __pyx_methods[] = {
   {__Pyx_NAMESTR("encode_int"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_encode_int, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_encode_int)},
   {__Pyx_NAMESTR("decode_int"), (PyCFunction)__pyx_pf_6cpyamf_4amf3_decode_int, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4amf3_decode_int)},
@@ -1544,7 +16171,7 @@ static void __pyx_init_filenames(void); /*proto*/
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     __Pyx_NAMESTR("amf3"),
-    __Pyx_DOCSTR(__pyx_k_4), /* m_doc */
+    __Pyx_DOCSTR(__pyx_k_22), /* m_doc */
     -1, /* m_size */
     __pyx_methods /* m_methods */,
     NULL, /* m_reload */
@@ -1556,25 +16183,298 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
+  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
+  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
+  {&__pyx_n_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 1},
+  {&__pyx_kp_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 0},
+  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
+  {&__pyx_n_s_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 0, 1, 1},
+  {&__pyx_kp_s_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 0, 1, 0},
+  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
+  {&__pyx_kp_s_21, __pyx_k_21, sizeof(__pyx_k_21), 0, 0, 1, 0},
+  {&__pyx_kp_u_23, __pyx_k_23, sizeof(__pyx_k_23), 0, 1, 0, 0},
+  {&__pyx_kp_u_24, __pyx_k_24, sizeof(__pyx_k_24), 0, 1, 0, 0},
+  {&__pyx_kp_u_25, __pyx_k_25, sizeof(__pyx_k_25), 0, 1, 0, 0},
+  {&__pyx_kp_u_26, __pyx_k_26, sizeof(__pyx_k_26), 0, 1, 0, 0},
+  {&__pyx_kp_u_27, __pyx_k_27, sizeof(__pyx_k_27), 0, 1, 0, 0},
+  {&__pyx_kp_u_28, __pyx_k_28, sizeof(__pyx_k_28), 0, 1, 0, 0},
+  {&__pyx_kp_u_29, __pyx_k_29, sizeof(__pyx_k_29), 0, 1, 0, 0},
   {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
-  {&__pyx_kp_u_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 1, 0, 0},
-  {&__pyx_kp_u_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 1, 0, 0},
+  {&__pyx_kp_u_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 1, 0, 0},
+  {&__pyx_kp_u_31, __pyx_k_31, sizeof(__pyx_k_31), 0, 1, 0, 0},
+  {&__pyx_kp_u_32, __pyx_k_32, sizeof(__pyx_k_32), 0, 1, 0, 0},
+  {&__pyx_kp_u_33, __pyx_k_33, sizeof(__pyx_k_33), 0, 1, 0, 0},
+  {&__pyx_kp_u_34, __pyx_k_34, sizeof(__pyx_k_34), 0, 1, 0, 0},
+  {&__pyx_kp_u_35, __pyx_k_35, sizeof(__pyx_k_35), 0, 1, 0, 0},
+  {&__pyx_kp_u_36, __pyx_k_36, sizeof(__pyx_k_36), 0, 1, 0, 0},
+  {&__pyx_kp_u_37, __pyx_k_37, sizeof(__pyx_k_37), 0, 1, 0, 0},
+  {&__pyx_kp_u_38, __pyx_k_38, sizeof(__pyx_k_38), 0, 1, 0, 0},
+  {&__pyx_kp_u_39, __pyx_k_39, sizeof(__pyx_k_39), 0, 1, 0, 0},
+  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
+  {&__pyx_kp_u_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 1, 0, 0},
+  {&__pyx_kp_u_40, __pyx_k_40, sizeof(__pyx_k_40), 0, 1, 0, 0},
+  {&__pyx_kp_u_41, __pyx_k_41, sizeof(__pyx_k_41), 0, 1, 0, 0},
+  {&__pyx_kp_u_42, __pyx_k_42, sizeof(__pyx_k_42), 0, 1, 0, 0},
+  {&__pyx_kp_u_43, __pyx_k_43, sizeof(__pyx_k_43), 0, 1, 0, 0},
+  {&__pyx_kp_u_44, __pyx_k_44, sizeof(__pyx_k_44), 0, 1, 0, 0},
+  {&__pyx_kp_u_45, __pyx_k_45, sizeof(__pyx_k_45), 0, 1, 0, 0},
+  {&__pyx_kp_u_46, __pyx_k_46, sizeof(__pyx_k_46), 0, 1, 0, 0},
+  {&__pyx_kp_u_47, __pyx_k_47, sizeof(__pyx_k_47), 0, 1, 0, 0},
+  {&__pyx_kp_u_48, __pyx_k_48, sizeof(__pyx_k_48), 0, 1, 0, 0},
+  {&__pyx_kp_u_49, __pyx_k_49, sizeof(__pyx_k_49), 0, 1, 0, 0},
+  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
+  {&__pyx_kp_u_50, __pyx_k_50, sizeof(__pyx_k_50), 0, 1, 0, 0},
+  {&__pyx_kp_u_51, __pyx_k_51, sizeof(__pyx_k_51), 0, 1, 0, 0},
+  {&__pyx_kp_u_52, __pyx_k_52, sizeof(__pyx_k_52), 0, 1, 0, 0},
+  {&__pyx_kp_u_53, __pyx_k_53, sizeof(__pyx_k_53), 0, 1, 0, 0},
+  {&__pyx_kp_u_54, __pyx_k_54, sizeof(__pyx_k_54), 0, 1, 0, 0},
+  {&__pyx_kp_u_55, __pyx_k_55, sizeof(__pyx_k_55), 0, 1, 0, 0},
+  {&__pyx_kp_u_56, __pyx_k_56, sizeof(__pyx_k_56), 0, 1, 0, 0},
+  {&__pyx_kp_u_57, __pyx_k_57, sizeof(__pyx_k_57), 0, 1, 0, 0},
+  {&__pyx_kp_u_58, __pyx_k_58, sizeof(__pyx_k_58), 0, 1, 0, 0},
+  {&__pyx_kp_u_59, __pyx_k_59, sizeof(__pyx_k_59), 0, 1, 0, 0},
+  {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
+  {&__pyx_kp_u_60, __pyx_k_60, sizeof(__pyx_k_60), 0, 1, 0, 0},
+  {&__pyx_kp_u_61, __pyx_k_61, sizeof(__pyx_k_61), 0, 1, 0, 0},
+  {&__pyx_kp_u_62, __pyx_k_62, sizeof(__pyx_k_62), 0, 1, 0, 0},
+  {&__pyx_kp_u_63, __pyx_k_63, sizeof(__pyx_k_63), 0, 1, 0, 0},
+  {&__pyx_kp_u_64, __pyx_k_64, sizeof(__pyx_k_64), 0, 1, 0, 0},
+  {&__pyx_n_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 1},
+  {&__pyx_n_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 1},
+  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
+  {&__pyx_n_s__AMF3, __pyx_k__AMF3, sizeof(__pyx_k__AMF3), 0, 0, 1, 1},
+  {&__pyx_n_s__ArrayType, __pyx_k__ArrayType, sizeof(__pyx_k__ArrayType), 0, 0, 1, 1},
+  {&__pyx_n_s__BuiltinFunctionType, __pyx_k__BuiltinFunctionType, sizeof(__pyx_k__BuiltinFunctionType), 0, 0, 1, 1},
+  {&__pyx_n_s__BuiltinMethodType, __pyx_k__BuiltinMethodType, sizeof(__pyx_k__BuiltinMethodType), 0, 0, 1, 1},
+  {&__pyx_n_s__ByteArray, __pyx_k__ByteArray, sizeof(__pyx_k__ByteArray), 0, 0, 1, 1},
+  {&__pyx_n_s__ClassDefinition, __pyx_k__ClassDefinition, sizeof(__pyx_k__ClassDefinition), 0, 0, 1, 1},
+  {&__pyx_n_s__ClassType, __pyx_k__ClassType, sizeof(__pyx_k__ClassType), 0, 0, 1, 1},
+  {&__pyx_n_s__Context, __pyx_k__Context, sizeof(__pyx_k__Context), 0, 0, 1, 1},
+  {&__pyx_n_s__DataInput, __pyx_k__DataInput, sizeof(__pyx_k__DataInput), 0, 0, 1, 1},
+  {&__pyx_n_s__DataOutput, __pyx_k__DataOutput, sizeof(__pyx_k__DataOutput), 0, 0, 1, 1},
+  {&__pyx_n_s__DecodeError, __pyx_k__DecodeError, sizeof(__pyx_k__DecodeError), 0, 0, 1, 1},
+  {&__pyx_n_s__Decoder, __pyx_k__Decoder, sizeof(__pyx_k__Decoder), 0, 0, 1, 1},
+  {&__pyx_n_s__Dictionary, __pyx_k__Dictionary, sizeof(__pyx_k__Dictionary), 0, 0, 1, 1},
+  {&__pyx_n_s__ET, __pyx_k__ET, sizeof(__pyx_k__ET), 0, 0, 1, 1},
+  {&__pyx_n_s__EncodeError, __pyx_k__EncodeError, sizeof(__pyx_k__EncodeError), 0, 0, 1, 1},
+  {&__pyx_n_s__Encoder, __pyx_k__Encoder, sizeof(__pyx_k__Encoder), 0, 0, 1, 1},
+  {&__pyx_n_s__FunctionType, __pyx_k__FunctionType, sizeof(__pyx_k__FunctionType), 0, 0, 1, 1},
+  {&__pyx_n_s__GeneratorType, __pyx_k__GeneratorType, sizeof(__pyx_k__GeneratorType), 0, 0, 1, 1},
+  {&__pyx_n_s__IOError, __pyx_k__IOError, sizeof(__pyx_k__IOError), 0, 0, 1, 1},
+  {&__pyx_n_s__InstanceType, __pyx_k__InstanceType, sizeof(__pyx_k__InstanceType), 0, 0, 1, 1},
+  {&__pyx_n_s__IntVector, __pyx_k__IntVector, sizeof(__pyx_k__IntVector), 0, 0, 1, 1},
+  {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
+  {&__pyx_n_s__LambdaType, __pyx_k__LambdaType, sizeof(__pyx_k__LambdaType), 0, 0, 1, 1},
   {&__pyx_n_s__MemoryError, __pyx_k__MemoryError, sizeof(__pyx_k__MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s__MethodType, __pyx_k__MethodType, sizeof(__pyx_k__MethodType), 0, 0, 1, 1},
+  {&__pyx_n_s__MixedArray, __pyx_k__MixedArray, sizeof(__pyx_k__MixedArray), 0, 0, 1, 1},
+  {&__pyx_n_s__ModuleType, __pyx_k__ModuleType, sizeof(__pyx_k__ModuleType), 0, 0, 1, 1},
+  {&__pyx_n_s__NumberVector, __pyx_k__NumberVector, sizeof(__pyx_k__NumberVector), 0, 0, 1, 1},
+  {&__pyx_n_s__ObjectType, __pyx_k__ObjectType, sizeof(__pyx_k__ObjectType), 0, 0, 1, 1},
+  {&__pyx_n_s__ObjectVector, __pyx_k__ObjectVector, sizeof(__pyx_k__ObjectVector), 0, 0, 1, 1},
   {&__pyx_n_s__OverflowError, __pyx_k__OverflowError, sizeof(__pyx_k__OverflowError), 0, 0, 1, 1},
+  {&__pyx_n_s__RawAMF, __pyx_k__RawAMF, sizeof(__pyx_k__RawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__ReferenceError, __pyx_k__ReferenceError, sizeof(__pyx_k__ReferenceError), 0, 0, 1, 1},
   {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s__StringTypes, __pyx_k__StringTypes, sizeof(__pyx_k__StringTypes), 0, 0, 1, 1},
+  {&__pyx_n_s__TypeType, __pyx_k__TypeType, sizeof(__pyx_k__TypeType), 0, 0, 1, 1},
+  {&__pyx_n_s__UintVector, __pyx_k__UintVector, sizeof(__pyx_k__UintVector), 0, 0, 1, 1},
+  {&__pyx_n_s__Undefined, __pyx_k__Undefined, sizeof(__pyx_k__Undefined), 0, 0, 1, 1},
+  {&__pyx_n_s__UndefinedType, __pyx_k__UndefinedType, sizeof(__pyx_k__UndefinedType), 0, 0, 1, 1},
+  {&__pyx_n_s__UnknownClassAlias, __pyx_k__UnknownClassAlias, sizeof(__pyx_k__UnknownClassAlias), 0, 0, 1, 1},
+  {&__pyx_n_s__VECTOR_TYPECODES, __pyx_k__VECTOR_TYPECODES, sizeof(__pyx_k__VECTOR_TYPECODES), 0, 0, 1, 1},
+  {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s___NumericVector, __pyx_k___NumericVector, sizeof(__pyx_k___NumericVector), 0, 0, 1, 1},
+  {&__pyx_n_s____class__, __pyx_k____class__, sizeof(__pyx_k____class__), 0, 0, 1, 1},
+  {&__pyx_n_s____init__, __pyx_k____init__, sizeof(__pyx_k____init__), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
+  {&__pyx_n_s____readamf__, __pyx_k____readamf__, sizeof(__pyx_k____readamf__), 0, 0, 1, 1},
   {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
+  {&__pyx_n_s____writeamf__, __pyx_k____writeamf__, sizeof(__pyx_k____writeamf__), 0, 0, 1, 1},
+  {&__pyx_n_s___decompress, __pyx_k___decompress, sizeof(__pyx_k___decompress), 0, 0, 1, 1},
+  {&__pyx_n_s___getClassDefinition, __pyx_k___getClassDefinition, sizeof(__pyx_k___getClassDefinition), 0, 0, 1, 1},
+  {&__pyx_n_s___get_alias_type, __pyx_k___get_alias_type, sizeof(__pyx_k___get_alias_type), 0, 0, 1, 1},
+  {&__pyx_n_s___pack_vector, __pyx_k___pack_vector, sizeof(__pyx_k___pack_vector), 0, 0, 1, 1},
+  {&__pyx_n_s___readArray, __pyx_k___readArray, sizeof(__pyx_k___readArray), 0, 0, 1, 1},
+  {&__pyx_n_s___readByteArray, __pyx_k___readByteArray, sizeof(__pyx_k___readByteArray), 0, 0, 1, 1},
+  {&__pyx_n_s___readDate, __pyx_k___readDate, sizeof(__pyx_k___readDate), 0, 0, 1, 1},
+  {&__pyx_n_s___readDictionary, __pyx_k___readDictionary, sizeof(__pyx_k___readDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s___readElement, __pyx_k___readElement, sizeof(__pyx_k___readElement), 0, 0, 1, 1},
+  {&__pyx_n_s___readInteger, __pyx_k___readInteger, sizeof(__pyx_k___readInteger), 0, 0, 1, 1},
+  {&__pyx_n_s___readNumber, __pyx_k___readNumber, sizeof(__pyx_k___readNumber), 0, 0, 1, 1},
+  {&__pyx_n_s___readObject, __pyx_k___readObject, sizeof(__pyx_k___readObject), 0, 0, 1, 1},
+  {&__pyx_n_s___readObjectVector, __pyx_k___readObjectVector, sizeof(__pyx_k___readObjectVector), 0, 0, 1, 1},
+  {&__pyx_n_s___readString, __pyx_k___readString, sizeof(__pyx_k___readString), 0, 0, 1, 1},
+  {&__pyx_n_s___readTypedArray, __pyx_k___readTypedArray, sizeof(__pyx_k___readTypedArray), 0, 0, 1, 1},
+  {&__pyx_n_s___readVector, __pyx_k___readVector, sizeof(__pyx_k___readVector), 0, 0, 1, 1},
+  {&__pyx_n_s___readXML, __pyx_k___readXML, sizeof(__pyx_k___readXML), 0, 0, 1, 1},
+  {&__pyx_n_s___unpack_vector, __pyx_k___unpack_vector, sizeof(__pyx_k___unpack_vector), 0, 0, 1, 1},
+  {&__pyx_n_s___writeByteArray, __pyx_k___writeByteArray, sizeof(__pyx_k___writeByteArray), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDate, __pyx_k___writeDate, sizeof(__pyx_k___writeDate), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDict, __pyx_k___writeDict, sizeof(__pyx_k___writeDict), 0, 0, 1, 1},
+  {&__pyx_n_s___writeDictionary, __pyx_k___writeDictionary, sizeof(__pyx_k___writeDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s___writeElement, __pyx_k___writeElement, sizeof(__pyx_k___writeElement), 0, 0, 1, 1},
+  {&__pyx_n_s___writeInteger, __pyx_k___writeInteger, sizeof(__pyx_k___writeInteger), 0, 0, 1, 1},
+  {&__pyx_n_s___writeList, __pyx_k___writeList, sizeof(__pyx_k___writeList), 0, 0, 1, 1},
+  {&__pyx_n_s___writeNumber, __pyx_k___writeNumber, sizeof(__pyx_k___writeNumber), 0, 0, 1, 1},
+  {&__pyx_n_s___writeObject, __pyx_k___writeObject, sizeof(__pyx_k___writeObject), 0, 0, 1, 1},
+  {&__pyx_n_s___writeObjectVector, __pyx_k___writeObjectVector, sizeof(__pyx_k___writeObjectVector), 0, 0, 1, 1},
+  {&__pyx_n_s___writeSealedObject, __pyx_k___writeSealedObject, sizeof(__pyx_k___writeSealedObject), 0, 0, 1, 1},
+  {&__pyx_n_s___writeString, __pyx_k___writeString, sizeof(__pyx_k___writeString), 0, 0, 1, 1},
+  {&__pyx_n_s___writeVector, __pyx_k___writeVector, sizeof(__pyx_k___writeVector), 0, 0, 1, 1},
+  {&__pyx_n_s___writeXML, __pyx_k___writeXML, sizeof(__pyx_k___writeXML), 0, 0, 1, 1},
+  {&__pyx_n_s__addClass, __pyx_k__addClass, sizeof(__pyx_k__addClass), 0, 0, 1, 1},
+  {&__pyx_n_s__addLegacyXML, __pyx_k__addLegacyXML, sizeof(__pyx_k__addLegacyXML), 0, 0, 1, 1},
+  {&__pyx_n_s__addObject, __pyx_k__addObject, sizeof(__pyx_k__addObject), 0, 0, 1, 1},
+  {&__pyx_n_s__addRawAMF, __pyx_k__addRawAMF, sizeof(__pyx_k__addRawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__addString, __pyx_k__addString, sizeof(__pyx_k__addString), 0, 0, 1, 1},
+  {&__pyx_n_s__alias, __pyx_k__alias, sizeof(__pyx_k__alias), 0, 0, 1, 1},
+  {&__pyx_n_s__amf3, __pyx_k__amf3, sizeof(__pyx_k__amf3), 0, 0, 1, 1},
+  {&__pyx_n_s__anonymous, __pyx_k__anonymous, sizeof(__pyx_k__anonymous), 0, 0, 1, 1},
+  {&__pyx_n_s__append, __pyx_k__append, sizeof(__pyx_k__append), 0, 0, 1, 1},
+  {&__pyx_n_s__applyAttributes, __pyx_k__applyAttributes, sizeof(__pyx_k__applyAttributes), 0, 0, 1, 1},
+  {&__pyx_n_s__array, __pyx_k__array, sizeof(__pyx_k__array), 0, 0, 1, 1},
+  {&__pyx_n_s__attr_len, __pyx_k__attr_len, sizeof(__pyx_k__attr_len), 0, 0, 1, 1},
+  {&__pyx_n_s__buffer, __pyx_k__buffer, sizeof(__pyx_k__buffer), 0, 0, 1, 1},
+  {&__pyx_n_s__chr, __pyx_k__chr, sizeof(__pyx_k__chr), 0, 0, 1, 1},
+  {&__pyx_n_s__classname, __pyx_k__classname, sizeof(__pyx_k__classname), 0, 0, 1, 1},
+  {&__pyx_n_s__codec, __pyx_k__codec, sizeof(__pyx_k__codec), 0, 0, 1, 1},
+  {&__pyx_n_s__compressed, __pyx_k__compressed, sizeof(__pyx_k__compressed), 0, 0, 1, 1},
+  {&__pyx_n_s__context, __pyx_k__context, sizeof(__pyx_k__context), 0, 0, 1, 1},
+  {&__pyx_n_s__createInstance, __pyx_k__createInstance, sizeof(__pyx_k__createInstance), 0, 0, 1, 1},
+  {&__pyx_n_s__d, __pyx_k__d, sizeof(__pyx_k__d), 0, 0, 1, 1},
+  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
+  {&__pyx_n_s__date, __pyx_k__date, sizeof(__pyx_k__date), 0, 0, 1, 1},
+  {&__pyx_n_s__datetime, __pyx_k__datetime, sizeof(__pyx_k__datetime), 0, 0, 1, 1},
   {&__pyx_n_s__decode_int, __pyx_k__decode_int, sizeof(__pyx_k__decode_int), 0, 0, 1, 1},
+  {&__pyx_n_s__defer, __pyx_k__defer, sizeof(__pyx_k__defer), 0, 0, 1, 1},
+  {&__pyx_n_s__encode_attrs, __pyx_k__encode_attrs, sizeof(__pyx_k__encode_attrs), 0, 0, 1, 1},
   {&__pyx_n_s__encode_int, __pyx_k__encode_int, sizeof(__pyx_k__encode_int), 0, 0, 1, 1},
+  {&__pyx_n_s__encoding, __pyx_k__encoding, sizeof(__pyx_k__encoding), 0, 0, 1, 1},
+  {&__pyx_n_s__external, __pyx_k__external, sizeof(__pyx_k__external), 0, 0, 1, 1},
+  {&__pyx_n_s__fd, __pyx_k__fd, sizeof(__pyx_k__fd), 0, 0, 1, 1},
+  {&__pyx_n_s__fixed, __pyx_k__fixed, sizeof(__pyx_k__fixed), 0, 0, 1, 1},
+  {&__pyx_n_s__fromstring, __pyx_k__fromstring, sizeof(__pyx_k__fromstring), 0, 0, 1, 1},
+  {&__pyx_n_s__getByReference, __pyx_k__getByReference, sizeof(__pyx_k__getByReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getClass, __pyx_k__getClass, sizeof(__pyx_k__getClass), 0, 0, 1, 1},
+  {&__pyx_n_s__getClassByReference, __pyx_k__getClassByReference, sizeof(__pyx_k__getClassByReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getClassDefinition, __pyx_k__getClassDefinition, sizeof(__pyx_k__getClassDefinition), 0, 0, 1, 1},
+  {&__pyx_n_s__getEncodableValues, __pyx_k__getEncodableValues, sizeof(__pyx_k__getEncodableValues), 0, 0, 1, 1},
+  {&__pyx_n_s__getObject, __pyx_k__getObject, sizeof(__pyx_k__getObject), 0, 0, 1, 1},
+  {&__pyx_n_s__getObjectReference, __pyx_k__getObjectReference, sizeof(__pyx_k__getObjectReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getProxyForObject, __pyx_k__getProxyForObject, sizeof(__pyx_k__getProxyForObject), 0, 0, 1, 1},
+  {&__pyx_n_s__getReferenceTo, __pyx_k__getReferenceTo, sizeof(__pyx_k__getReferenceTo), 0, 0, 1, 1},
+  {&__pyx_n_s__getString, __pyx_k__getString, sizeof(__pyx_k__getString), 0, 0, 1, 1},
+  {&__pyx_n_s__getStringReference, __pyx_k__getStringReference, sizeof(__pyx_k__getStringReference), 0, 0, 1, 1},
+  {&__pyx_n_s__getTypeFunc, __pyx_k__getTypeFunc, sizeof(__pyx_k__getTypeFunc), 0, 0, 1, 1},
+  {&__pyx_n_s__get_class_alias, __pyx_k__get_class_alias, sizeof(__pyx_k__get_class_alias), 0, 0, 1, 1},
+  {&__pyx_n_s__get_class_meta, __pyx_k__get_class_meta, sizeof(__pyx_k__get_class_meta), 0, 0, 1, 1},
+  {&__pyx_n_s__get_datetime, __pyx_k__get_datetime, sizeof(__pyx_k__get_datetime), 0, 0, 1, 1},
+  {&__pyx_n_s__get_decode_plan, __pyx_k__get_decode_plan, sizeof(__pyx_k__get_decode_plan), 0, 0, 1, 1},
+  {&__pyx_n_s__get_timestamp, __pyx_k__get_timestamp, sizeof(__pyx_k__get_timestamp), 0, 0, 1, 1},
+  {&__pyx_n_s__getattr, __pyx_k__getattr, sizeof(__pyx_k__getattr), 0, 0, 1, 1},
+  {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
+  {&__pyx_n_s__is_ET_element, __pyx_k__is_ET_element, sizeof(__pyx_k__is_ET_element), 0, 0, 1, 1},
+  {&__pyx_n_s__is_float_broken, __pyx_k__is_float_broken, sizeof(__pyx_k__is_float_broken), 0, 0, 1, 1},
+  {&__pyx_n_s__iteritems, __pyx_k__iteritems, sizeof(__pyx_k__iteritems), 0, 0, 1, 1},
+  {&__pyx_n_s__keys, __pyx_k__keys, sizeof(__pyx_k__keys), 0, 0, 1, 1},
+  {&__pyx_n_s__klass, __pyx_k__klass, sizeof(__pyx_k__klass), 0, 0, 1, 1},
+  {&__pyx_n_s__l, __pyx_k__l, sizeof(__pyx_k__l), 0, 0, 1, 1},
+  {&__pyx_n_s__length, __pyx_k__length, sizeof(__pyx_k__length), 0, 0, 1, 1},
+  {&__pyx_n_s__n, __pyx_k__n, sizeof(__pyx_k__n), 0, 0, 1, 1},
+  {&__pyx_n_s__obj, __pyx_k__obj, sizeof(__pyx_k__obj), 0, 0, 1, 1},
+  {&__pyx_n_s__objects, __pyx_k__objects, sizeof(__pyx_k__objects), 0, 0, 1, 1},
+  {&__pyx_n_s__ord, __pyx_k__ord, sizeof(__pyx_k__ord), 0, 0, 1, 1},
+  {&__pyx_n_s__plan, __pyx_k__plan, sizeof(__pyx_k__plan), 0, 0, 1, 1},
+  {&__pyx_n_s__pop, __pyx_k__pop, sizeof(__pyx_k__pop), 0, 0, 1, 1},
+  {&__pyx_n_s__pos, __pyx_k__pos, sizeof(__pyx_k__pos), 0, 0, 1, 1},
+  {&__pyx_n_s__pyamf, __pyx_k__pyamf, sizeof(__pyx_k__pyamf), 0, 0, 1, 1},
+  {&__pyx_n_s__raw, __pyx_k__raw, sizeof(__pyx_k__raw), 0, 0, 1, 1},
+  {&__pyx_n_s__readArray, __pyx_k__readArray, sizeof(__pyx_k__readArray), 0, 0, 1, 1},
+  {&__pyx_n_s__readBoolFalse, __pyx_k__readBoolFalse, sizeof(__pyx_k__readBoolFalse), 0, 0, 1, 1},
+  {&__pyx_n_s__readBoolTrue, __pyx_k__readBoolTrue, sizeof(__pyx_k__readBoolTrue), 0, 0, 1, 1},
+  {&__pyx_n_s__readByteArray, __pyx_k__readByteArray, sizeof(__pyx_k__readByteArray), 0, 0, 1, 1},
+  {&__pyx_n_s__readDate, __pyx_k__readDate, sizeof(__pyx_k__readDate), 0, 0, 1, 1},
+  {&__pyx_n_s__readDictionary, __pyx_k__readDictionary, sizeof(__pyx_k__readDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s__readIntVector, __pyx_k__readIntVector, sizeof(__pyx_k__readIntVector), 0, 0, 1, 1},
+  {&__pyx_n_s__readInteger, __pyx_k__readInteger, sizeof(__pyx_k__readInteger), 0, 0, 1, 1},
+  {&__pyx_n_s__readNull, __pyx_k__readNull, sizeof(__pyx_k__readNull), 0, 0, 1, 1},
+  {&__pyx_n_s__readNumber, __pyx_k__readNumber, sizeof(__pyx_k__readNumber), 0, 0, 1, 1},
+  {&__pyx_n_s__readNumberVector, __pyx_k__readNumberVector, sizeof(__pyx_k__readNumberVector), 0, 0, 1, 1},
+  {&__pyx_n_s__readObject, __pyx_k__readObject, sizeof(__pyx_k__readObject), 0, 0, 1, 1},
+  {&__pyx_n_s__readObjectVector, __pyx_k__readObjectVector, sizeof(__pyx_k__readObjectVector), 0, 0, 1, 1},
+  {&__pyx_n_s__readProxy, __pyx_k__readProxy, sizeof(__pyx_k__readProxy), 0, 0, 1, 1},
+  {&__pyx_n_s__readSignedInteger, __pyx_k__readSignedInteger, sizeof(__pyx_k__readSignedInteger), 0, 0, 1, 1},
+  {&__pyx_n_s__readString, __pyx_k__readString, sizeof(__pyx_k__readString), 0, 0, 1, 1},
+  {&__pyx_n_s__readUintVector, __pyx_k__readUintVector, sizeof(__pyx_k__readUintVector), 0, 0, 1, 1},
+  {&__pyx_n_s__readUndefined, __pyx_k__readUndefined, sizeof(__pyx_k__readUndefined), 0, 0, 1, 1},
+  {&__pyx_n_s__readUnsignedInteger, __pyx_k__readUnsignedInteger, sizeof(__pyx_k__readUnsignedInteger), 0, 0, 1, 1},
+  {&__pyx_n_s__readXML, __pyx_k__readXML, sizeof(__pyx_k__readXML), 0, 0, 1, 1},
+  {&__pyx_n_s__readXMLString, __pyx_k__readXMLString, sizeof(__pyx_k__readXMLString), 0, 0, 1, 1},
+  {&__pyx_n_s__read_double, __pyx_k__read_double, sizeof(__pyx_k__read_double), 0, 0, 1, 1},
   {&__pyx_n_s__read_uchar, __pyx_k__read_uchar, sizeof(__pyx_k__read_uchar), 0, 0, 1, 1},
+  {&__pyx_n_s__read_view, __pyx_k__read_view, sizeof(__pyx_k__read_view), 0, 0, 1, 1},
+  {&__pyx_n_s__reference, __pyx_k__reference, sizeof(__pyx_k__reference), 0, 0, 1, 1},
+  {&__pyx_n_s__remaining, __pyx_k__remaining, sizeof(__pyx_k__remaining), 0, 0, 1, 1},
+  {&__pyx_n_s__seek, __pyx_k__seek, sizeof(__pyx_k__seek), 0, 0, 1, 1},
   {&__pyx_n_s__sign, __pyx_k__sign, sizeof(__pyx_k__sign), 0, 0, 1, 1},
+  {&__pyx_n_s__sort, __pyx_k__sort, sizeof(__pyx_k__sort), 0, 0, 1, 1},
+  {&__pyx_n_s__static_attrs, __pyx_k__static_attrs, sizeof(__pyx_k__static_attrs), 0, 0, 1, 1},
+  {&__pyx_n_s__static_properties, __pyx_k__static_properties, sizeof(__pyx_k__static_properties), 0, 0, 1, 1},
   {&__pyx_n_s__stream, __pyx_k__stream, sizeof(__pyx_k__stream), 0, 0, 1, 1},
+  {&__pyx_n_s__strict, __pyx_k__strict, sizeof(__pyx_k__strict), 0, 0, 1, 1},
+  {&__pyx_n_s__string_references, __pyx_k__string_references, sizeof(__pyx_k__string_references), 0, 0, 1, 1},
+  {&__pyx_n_s__strings, __pyx_k__strings, sizeof(__pyx_k__strings), 0, 0, 1, 1},
+  {&__pyx_n_s__tell, __pyx_k__tell, sizeof(__pyx_k__tell), 0, 0, 1, 1},
+  {&__pyx_n_s__time, __pyx_k__time, sizeof(__pyx_k__time), 0, 0, 1, 1},
+  {&__pyx_n_s__timezone_offset, __pyx_k__timezone_offset, sizeof(__pyx_k__timezone_offset), 0, 0, 1, 1},
+  {&__pyx_n_s__tolist, __pyx_k__tolist, sizeof(__pyx_k__tolist), 0, 0, 1, 1},
+  {&__pyx_n_s__tostring, __pyx_k__tostring, sizeof(__pyx_k__tostring), 0, 0, 1, 1},
+  {&__pyx_n_s__typecode, __pyx_k__typecode, sizeof(__pyx_k__typecode), 0, 0, 1, 1},
+  {&__pyx_n_s__typed_arrays, __pyx_k__typed_arrays, sizeof(__pyx_k__typed_arrays), 0, 0, 1, 1},
+  {&__pyx_n_s__types, __pyx_k__types, sizeof(__pyx_k__types), 0, 0, 1, 1},
+  {&__pyx_n_s__unicode_, __pyx_k__unicode_, sizeof(__pyx_k__unicode_), 0, 0, 1, 1},
+  {&__pyx_n_s__use_proxies, __pyx_k__use_proxies, sizeof(__pyx_k__use_proxies), 0, 0, 1, 1},
+  {&__pyx_n_s__use_proxies_default, __pyx_k__use_proxies_default, sizeof(__pyx_k__use_proxies_default), 0, 0, 1, 1},
+  {&__pyx_n_s__util, __pyx_k__util, sizeof(__pyx_k__util), 0, 0, 1, 1},
+  {&__pyx_n_s__weak_keys, __pyx_k__weak_keys, sizeof(__pyx_k__weak_keys), 0, 0, 1, 1},
+  {&__pyx_n_s__write, __pyx_k__write, sizeof(__pyx_k__write), 0, 0, 1, 1},
+  {&__pyx_n_s__writeBoolean, __pyx_k__writeBoolean, sizeof(__pyx_k__writeBoolean), 0, 0, 1, 1},
+  {&__pyx_n_s__writeByteArray, __pyx_k__writeByteArray, sizeof(__pyx_k__writeByteArray), 0, 0, 1, 1},
+  {&__pyx_n_s__writeClass, __pyx_k__writeClass, sizeof(__pyx_k__writeClass), 0, 0, 1, 1},
+  {&__pyx_n_s__writeDate, __pyx_k__writeDate, sizeof(__pyx_k__writeDate), 0, 0, 1, 1},
+  {&__pyx_n_s__writeDict, __pyx_k__writeDict, sizeof(__pyx_k__writeDict), 0, 0, 1, 1},
+  {&__pyx_n_s__writeDictionary, __pyx_k__writeDictionary, sizeof(__pyx_k__writeDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s__writeElement, __pyx_k__writeElement, sizeof(__pyx_k__writeElement), 0, 0, 1, 1},
+  {&__pyx_n_s__writeFunc, __pyx_k__writeFunc, sizeof(__pyx_k__writeFunc), 0, 0, 1, 1},
+  {&__pyx_n_s__writeInstance, __pyx_k__writeInstance, sizeof(__pyx_k__writeInstance), 0, 0, 1, 1},
+  {&__pyx_n_s__writeInteger, __pyx_k__writeInteger, sizeof(__pyx_k__writeInteger), 0, 0, 1, 1},
+  {&__pyx_n_s__writeList, __pyx_k__writeList, sizeof(__pyx_k__writeList), 0, 0, 1, 1},
+  {&__pyx_n_s__writeNull, __pyx_k__writeNull, sizeof(__pyx_k__writeNull), 0, 0, 1, 1},
+  {&__pyx_n_s__writeNumber, __pyx_k__writeNumber, sizeof(__pyx_k__writeNumber), 0, 0, 1, 1},
+  {&__pyx_n_s__writeObject, __pyx_k__writeObject, sizeof(__pyx_k__writeObject), 0, 0, 1, 1},
+  {&__pyx_n_s__writeObjectVector, __pyx_k__writeObjectVector, sizeof(__pyx_k__writeObjectVector), 0, 0, 1, 1},
+  {&__pyx_n_s__writeProxy, __pyx_k__writeProxy, sizeof(__pyx_k__writeProxy), 0, 0, 1, 1},
+  {&__pyx_n_s__writeRawAMF, __pyx_k__writeRawAMF, sizeof(__pyx_k__writeRawAMF), 0, 0, 1, 1},
+  {&__pyx_n_s__writeString, __pyx_k__writeString, sizeof(__pyx_k__writeString), 0, 0, 1, 1},
+  {&__pyx_n_s__writeType, __pyx_k__writeType, sizeof(__pyx_k__writeType), 0, 0, 1, 1},
+  {&__pyx_n_s__writeUndefined, __pyx_k__writeUndefined, sizeof(__pyx_k__writeUndefined), 0, 0, 1, 1},
+  {&__pyx_n_s__writeVector, __pyx_k__writeVector, sizeof(__pyx_k__writeVector), 0, 0, 1, 1},
+  {&__pyx_n_s__writeXML, __pyx_k__writeXML, sizeof(__pyx_k__writeXML), 0, 0, 1, 1},
+  {&__pyx_n_s__write_double, __pyx_k__write_double, sizeof(__pyx_k__write_double), 0, 0, 1, 1},
+  {&__pyx_n_s__write_uchar, __pyx_k__write_uchar, sizeof(__pyx_k__write_uchar), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ord = __Pyx_GetName(__pyx_b, __pyx_n_s__ord); if (!__pyx_builtin_ord) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_getattr = __Pyx_GetName(__pyx_b, __pyx_n_s__getattr); if (!__pyx_builtin_getattr) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_IOError = __Pyx_GetName(__pyx_b, __pyx_n_s__IOError); if (!__pyx_builtin_IOError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_chr = __Pyx_GetName(__pyx_b, __pyx_n_s__chr); if (!__pyx_builtin_chr) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1627; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -1582,6 +16482,26 @@ static int __Pyx_InitCachedBuiltins(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_11 = PyInt_FromLong(11); if (unlikely(!__pyx_int_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_12 = PyInt_FromLong(12); if (unlikely(!__pyx_int_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_13 = PyInt_FromLong(13); if (unlikely(!__pyx_int_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_14 = PyInt_FromLong(14); if (unlikely(!__pyx_int_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_15 = PyInt_FromLong(15); if (unlikely(!__pyx_int_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_16 = PyInt_FromLong(16); if (unlikely(!__pyx_int_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_17 = PyInt_FromLong(17); if (unlikely(!__pyx_int_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_268435455 = PyInt_FromLong(268435455); if (unlikely(!__pyx_int_268435455)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_neg_268435456 = PyInt_FromLong(-268435456); if (unlikely(!__pyx_int_neg_268435456)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -1598,6 +16518,11 @@ PyMODINIT_FUNC PyInit_amf3(void)
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
   #if CYTHON_REFNANNY
   void* __pyx_refnanny = NULL;
   __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
@@ -1625,7 +16550,7 @@ PyMODINIT_FUNC PyInit_amf3(void)
   #endif
   /*--- Module creation code ---*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("amf3"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_4), 0, PYTHON_API_VERSION);
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("amf3"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_22), 0, PYTHON_API_VERSION);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -1644,57 +16569,939 @@ PyMODINIT_FUNC PyInit_amf3(void)
   /*--- Builtin init code ---*/
   if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   /*--- Global init code ---*/
+  __pyx_v_6cpyamf_4amf3_amf3 = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_Context = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_get_decode_plan = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_NumericVector = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_ObjectVector = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_Dictionary = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_FUNC_TYPES = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_DATE_TYPES = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_CLASS_TYPES = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_LIST_TYPES = Py_None; Py_INCREF(Py_None);
   /*--- Function export code ---*/
   /*--- Type init code ---*/
+  __pyx_ptype_6cpyamf_5codec_Encoder = __Pyx_ImportType("cpyamf.codec", "Encoder", sizeof(struct __pyx_obj_6cpyamf_5codec_Encoder), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Encoder)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_5codec_Encoder->tp_dict, &__pyx_vtabptr_6cpyamf_5codec_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtabptr_6cpyamf_4amf3_Encoder = &__pyx_vtable_6cpyamf_4amf3_Encoder;
+  __pyx_vtable_6cpyamf_4amf3_Encoder.__pyx_base = *__pyx_vtabptr_6cpyamf_5codec_Encoder;
+  #if PY_MAJOR_VERSION >= 3
+  __pyx_vtable_6cpyamf_4amf3_Encoder.__pyx_base.resolveType = (PyObject *(*)(struct __pyx_obj_6cpyamf_5codec_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder_resolveType;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeElement = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeElement;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeInteger = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeInteger;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeNumber = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeNumber;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeString = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeString;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeDate = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeDate;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeList = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeList;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeDict = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeDict;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeObject = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeObject;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeSealedObject = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *, PyObject *, int))__pyx_f_6cpyamf_4amf3_7Encoder__writeSealedObject;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeByteArray = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeByteArray;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeVector = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeVector;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeObjectVector = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeObjectVector;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeDictionary = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeDictionary;
+  __pyx_vtable_6cpyamf_4amf3_Encoder._writeXML = (int (*)(struct __pyx_obj_6cpyamf_4amf3_Encoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Encoder__writeXML;
+  #else
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder.__pyx_base.resolveType = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder_resolveType;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeElement = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeElement;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeInteger = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeInteger;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeNumber = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeNumber;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeString = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeString;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeDate = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeDate;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeList = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeList;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeDict = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeDict;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeObject = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeSealedObject = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeSealedObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeByteArray = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeByteArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeVector = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeVector;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeObjectVector = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeObjectVector;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeDictionary = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeDictionary;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Encoder._writeXML = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Encoder__writeXML;
+  #endif
+  __pyx_type_6cpyamf_4amf3_Encoder.tp_base = __pyx_ptype_6cpyamf_5codec_Encoder;
+  if (PyType_Ready(&__pyx_type_6cpyamf_4amf3_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4amf3_Encoder.tp_dict, __pyx_vtabptr_6cpyamf_4amf3_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "Encoder", (PyObject *)&__pyx_type_6cpyamf_4amf3_Encoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4amf3_Encoder = &__pyx_type_6cpyamf_4amf3_Encoder;
+  __pyx_ptype_6cpyamf_5codec_Decoder = __Pyx_ImportType("cpyamf.codec", "Decoder", sizeof(struct __pyx_obj_6cpyamf_5codec_Decoder), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Decoder)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_5codec_Decoder->tp_dict, &__pyx_vtabptr_6cpyamf_5codec_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtabptr_6cpyamf_4amf3_Decoder = &__pyx_vtable_6cpyamf_4amf3_Decoder;
+  __pyx_vtable_6cpyamf_4amf3_Decoder.__pyx_base = *__pyx_vtabptr_6cpyamf_5codec_Decoder;
+  #if PY_MAJOR_VERSION >= 3
+  __pyx_vtable_6cpyamf_4amf3_Decoder.__pyx_base.readType = (PyObject *(*)(struct __pyx_obj_6cpyamf_5codec_Decoder *, unsigned char))__pyx_f_6cpyamf_4amf3_7Decoder_readType;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readInteger = (long (*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int))__pyx_f_6cpyamf_4amf3_7Decoder__readInteger;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readNumber = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readNumber;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readString = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int))__pyx_f_6cpyamf_4amf3_7Decoder__readString;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readDate = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readDate;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readArray = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readArray;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readTypedArray = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, long))__pyx_f_6cpyamf_4amf3_7Decoder__readTypedArray;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readClassDefinition = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, long))__pyx_f_6cpyamf_4amf3_7Decoder__readClassDefinition;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readObject = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Decoder__readObject;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readXML = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, int))__pyx_f_6cpyamf_4amf3_7Decoder__readXML;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readByteArray = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readByteArray;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readVector = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *, PyObject *))__pyx_f_6cpyamf_4amf3_7Decoder__readVector;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readObjectVector = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readObjectVector;
+  __pyx_vtable_6cpyamf_4amf3_Decoder._readDictionary = (PyObject *(*)(struct __pyx_obj_6cpyamf_4amf3_Decoder *))__pyx_f_6cpyamf_4amf3_7Decoder__readDictionary;
+  #else
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder.__pyx_base.readType = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder_readType;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readInteger = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readInteger;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readNumber = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readNumber;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readString = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readString;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readDate = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readDate;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readArray = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readTypedArray = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readTypedArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readClassDefinition = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readClassDefinition;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readObject = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readObject;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readXML = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readXML;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readByteArray = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readByteArray;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readVector = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readVector;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readObjectVector = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readObjectVector;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4amf3_Decoder._readDictionary = (void(*)(void))__pyx_f_6cpyamf_4amf3_7Decoder__readDictionary;
+  #endif
+  __pyx_type_6cpyamf_4amf3_Decoder.tp_base = __pyx_ptype_6cpyamf_5codec_Decoder;
+  if (PyType_Ready(&__pyx_type_6cpyamf_4amf3_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1064; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4amf3_Decoder.tp_dict, __pyx_vtabptr_6cpyamf_4amf3_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1064; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "Decoder", (PyObject *)&__pyx_type_6cpyamf_4amf3_Decoder) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1064; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4amf3_Decoder = &__pyx_type_6cpyamf_4amf3_Decoder;
   /*--- Type import code ---*/
-  __pyx_ptype_6cpyamf_4util_cBufferedByteStream = __Pyx_ImportType("cpyamf.util", "cBufferedByteStream", sizeof(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream)); if (unlikely(!__pyx_ptype_6cpyamf_4util_cBufferedByteStream)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cBufferedByteStream->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_6cpyamf_4util_cIndexedCollection = __Pyx_ImportType("cpyamf.util", "cIndexedCollection", sizeof(struct __pyx_obj_6cpyamf_4util_cIndexedCollection)); if (unlikely(!__pyx_ptype_6cpyamf_4util_cIndexedCollection)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cIndexedCollection->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4util_cBufferedByteStream = __Pyx_ImportType("cpyamf.util", "cBufferedByteStream", sizeof(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream), 1); if (unlikely(!__pyx_ptype_6cpyamf_4util_cBufferedByteStream)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cBufferedByteStream->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_4util_cIndexedCollection = __Pyx_ImportType("cpyamf.util", "cIndexedCollection", sizeof(struct __pyx_obj_6cpyamf_4util_cIndexedCollection), 1); if (unlikely(!__pyx_ptype_6cpyamf_4util_cIndexedCollection)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_GetVtable(__pyx_ptype_6cpyamf_4util_cIndexedCollection->tp_dict, &__pyx_vtabptr_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_6cpyamf_5codec_Codec = __Pyx_ImportType("cpyamf.codec", "Codec", sizeof(struct __pyx_obj_6cpyamf_5codec_Codec), 1); if (unlikely(!__pyx_ptype_6cpyamf_5codec_Codec)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":125
- *     return o
+  /* "/root/package/cpyamf/amf3.pyx":41
+ * from cpyamf cimport codec
+ * 
+ * import types             # <<<<<<<<<<<<<<
+ * import datetime
+ * import array
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__types), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__types, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":42
+ * 
+ * import types
+ * import datetime             # <<<<<<<<<<<<<<
+ * import array
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__datetime), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__datetime, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":43
+ * import types
+ * import datetime
+ * import array             # <<<<<<<<<<<<<<
+ * 
+ * import pyamf
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__array), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__array, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":45
+ * import array
+ * 
+ * import pyamf             # <<<<<<<<<<<<<<
+ * from pyamf import util
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__pyamf, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":46
+ * 
+ * import pyamf
+ * from pyamf import util             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__util));
+  PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__util));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__util));
+  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__pyamf), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__util, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":99
+ * 
+ * #: The L{pyamf.amf3} module, resolved lazily to avoid a circular import.
+ * cdef object amf3 = None             # <<<<<<<<<<<<<<
+ * cdef object Context = None
+ * cdef object get_decode_plan = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_amf3);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_amf3);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_amf3 = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":100
+ * #: The L{pyamf.amf3} module, resolved lazily to avoid a circular import.
+ * cdef object amf3 = None
+ * cdef object Context = None             # <<<<<<<<<<<<<<
+ * cdef object get_decode_plan = None
+ * cdef object NumericVector = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_Context);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_Context);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_Context = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":101
+ * cdef object amf3 = None
+ * cdef object Context = None
+ * cdef object get_decode_plan = None             # <<<<<<<<<<<<<<
+ * cdef object NumericVector = None
+ * cdef object ObjectVector = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_get_decode_plan);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_get_decode_plan);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_get_decode_plan = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":102
+ * cdef object Context = None
+ * cdef object get_decode_plan = None
+ * cdef object NumericVector = None             # <<<<<<<<<<<<<<
+ * cdef object ObjectVector = None
+ * cdef object Dictionary = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_NumericVector);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_NumericVector);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_NumericVector = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":103
+ * cdef object get_decode_plan = None
+ * cdef object NumericVector = None
+ * cdef object ObjectVector = None             # <<<<<<<<<<<<<<
+ * cdef object Dictionary = None
+ * cdef bint float_broken = 0
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_ObjectVector);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_ObjectVector);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_ObjectVector = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":104
+ * cdef object NumericVector = None
+ * cdef object ObjectVector = None
+ * cdef object Dictionary = None             # <<<<<<<<<<<<<<
+ * cdef bint float_broken = 0
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_Dictionary);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_Dictionary);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_v_6cpyamf_4amf3_Dictionary = Py_None;
+
+  /* "/root/package/cpyamf/amf3.pyx":105
+ * cdef object ObjectVector = None
+ * cdef object Dictionary = None
+ * cdef bint float_broken = 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ */
+  __pyx_v_6cpyamf_4amf3_float_broken = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":107
+ * cdef bint float_broken = 0
  * 
- * def decode_int(stream, sign=False):             # <<<<<<<<<<<<<<
- *     """
- *     Decode C{int}.
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,             # <<<<<<<<<<<<<<
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)
  */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__BuiltinFunctionType); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_2 = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__BuiltinMethodType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":108
+ * 
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,             # <<<<<<<<<<<<<<
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__FunctionType); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__GeneratorType); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__ModuleType); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":109
+ * cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)             # <<<<<<<<<<<<<<
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__LambdaType); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__MethodType); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_2, 4, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_2, 5, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_2, 6, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
   __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_FUNC_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_FUNC_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf3_FUNC_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/amf3.pyx":1
- * # Copyright (c) 2007-2009 The PyAMF Project.             # <<<<<<<<<<<<<<
- * # See LICENSE for details.
+  /* "/root/package/cpyamf/amf3.pyx":110
+ *     types.FunctionType, types.GeneratorType, types.ModuleType,
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)             # <<<<<<<<<<<<<<
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+ * cdef object LIST_TYPES = (list, set, tuple)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__date); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__datetime); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__time); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  __pyx_t_8 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_6 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_DATE_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_DATE_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf3_DATE_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":111
+ *     types.LambdaType, types.MethodType)
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)             # <<<<<<<<<<<<<<
+ * cdef object LIST_TYPES = (list, set, tuple)
  * 
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = PyObject_GetAttr(__pyx_m, __pyx_n_s__encode_int); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_GetAttrString(__pyx_t_2, "__doc__");
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__ClassType); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_5), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_GetAttr(__pyx_m, __pyx_n_s__decode_int); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_GetAttrString(__pyx_t_3, "__doc__");
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_6), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__TypeType); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_CLASS_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_CLASS_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf3_CLASS_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":112
+ * cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+ * cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+ * cdef object LIST_TYPES = (list, set, tuple)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyList_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)((PyObject*)&PyList_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyList_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PySet_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)((PyObject*)&PySet_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PySet_Type)));
+  __Pyx_INCREF(((PyObject *)((PyObject*)&PyTuple_Type)));
+  PyTuple_SET_ITEM(__pyx_t_2, 2, ((PyObject *)((PyObject*)&PyTuple_Type)));
+  __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyTuple_Type)));
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4amf3_LIST_TYPES);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4amf3_LIST_TYPES);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_6cpyamf_4amf3_LIST_TYPES = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":943
+ *         self._writeNumber(n)
+ * 
+ *     def writeString(self, n, writeType=True, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes a string to the stream. If C{n} is not a unicode string, an
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_k_10 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1502
+ *         return self._readInteger(1)
+ * 
+ *     def readInteger(self, sign=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns an integer from the stream.
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1502; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_k_18 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1514
+ *         return self._readInteger(0)
+ * 
+ *     def readString(self, unicode_=True):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads and returns a string from the stream.
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_k_19 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1612
+ * 
+ * 
+ * def decode_int(stream, sign=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Decode C{int}.
+ */
+  __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_k_20 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/amf3.pyx":1
+ * # Copyright (c) 2007-2009 The PyAMF Project.             # <<<<<<<<<<<<<<
+ * # See LICENSE for details.
+ * 
+ */
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeElement); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_23), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeProxy); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_24), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeUndefined); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_25), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeNull); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_26), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeBoolean); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_27), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeInteger); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_28), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeNumber); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_29), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_30), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeDate); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_31), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeList); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_32), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeDict); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_33), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeInstance); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_34), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeObject); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_35), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeByteArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_36), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_37), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeObjectVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_38), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeDictionary); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_39), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeXML); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_40), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Encoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__writeRawAMF); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_41), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readUndefined); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_42), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readNull); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_43), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readBoolFalse); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_44), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readBoolTrue); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_45), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readNumber); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_46), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readUnsignedInteger); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_47), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readSignedInteger); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_48), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readInteger); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_49), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_50), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readDate); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_51), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_52), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s___getClassDefinition); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_53), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readObject); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_54), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readXMLString); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_55), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readXML); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_56), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readByteArray); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_57), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readIntVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_58), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readUintVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_59), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readNumberVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_60), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readObjectVector); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_61), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__Decoder); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__readDictionary); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_62), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyObject_GetAttr(__pyx_m, __pyx_n_s__encode_int); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = __Pyx_GetAttrString(__pyx_t_7, "__doc__");
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_63), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = PyObject_GetAttr(__pyx_m, __pyx_n_s__decode_int); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_kp_u_64), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+
+  /* "/root/package/cpyamf/codec.pxd":8
+ * 
+ * cdef class Codec:
+ *     cdef public cBufferedByteStream stream             # <<<<<<<<<<<<<<
+ *     cdef public object context
+ *     cdef public object strict
+ */
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
   if (__pyx_m) {
     __Pyx_AddTraceback("init cpyamf.amf3");
     Py_DECREF(__pyx_m); __pyx_m = 0;
@@ -1712,6 +17519,7 @@ PyMODINIT_FUNC PyInit_amf3(void)
 
 static const char *__pyx_filenames[] = {
   "amf3.pyx",
+  "codec.pxd",
   "util.pxd",
 };
 
@@ -1721,6 +17529,180 @@ static void __pyx_init_filenames(void) {
   __pyx_f = __pyx_filenames;
 }
 
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
+        #else
+        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
+        #endif
+            goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%s() keywords must be strings", function_name);
+    return 0;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%s() got an unexpected keyword argument '%s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+static PyObject* __Pyx_PyEval_CallObjectWithKeywords(PyObject *callable, PyObject *args, PyObject *kwargs) {
+    PyObject* result;
+    if (likely(PyDict_Check(kwargs))) {
+        return PyEval_CallObjectWithKeywords(callable, args, kwargs);
+    } else {
+        PyObject* real_dict;
+        real_dict = PyObject_CallFunctionObjArgs((PyObject*)&PyDict_Type, kwargs, NULL);
+        if (unlikely(!real_dict))
+            return NULL;
+        result = PyEval_CallObjectWithKeywords(callable, args, real_dict);
+        Py_DECREF(real_dict);
+        return result; /* may be NULL */
+    }
+}
+
+static double __Pyx__PyObject_AsDouble(PyObject* obj) {
+    PyObject* float_value;
+    if (Py_TYPE(obj)->tp_as_number && Py_TYPE(obj)->tp_as_number->nb_float) {
+        return PyFloat_AsDouble(obj);
+    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        float_value = PyFloat_FromString(obj);
+#else
+        float_value = PyFloat_FromString(obj, 0);
+#endif
+    } else {
+        PyObject* args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        PyTuple_SET_ITEM(args, 0, obj);
+        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
+        PyTuple_SET_ITEM(args, 0, 0);
+        Py_DECREF(args);
+    }
+    if (likely(float_value)) {
+        double value = PyFloat_AS_DOUBLE(float_value);
+        Py_DECREF(float_value);
+        return value;
+    }
+bad:
+    return (double)-1;
+}
+
+
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *local_type, *local_value, *local_tb;
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+    if (unlikely(tstate->curexc_type))
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+        goto bad;
+    #endif
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+    Py_INCREF(local_type);
+    Py_INCREF(local_value);
+    Py_INCREF(local_tb);
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    /* Make sure tstate is in a consistent state when we XDECREF
+       these objects (XDECREF may run arbitrary code). */
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+        #if PY_VERSION_HEX < 0x02050000
+                 "need more than %d value%s to unpack", (int)index,
+        #else
+                 "need more than %zd value%s to unpack", index,
+        #endif
+                 (index == 1) ? "" : "s");
+}
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void) {
+    PyErr_SetString(PyExc_ValueError, "too many values to unpack");
+}
+
+static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
+    PyObject *item;
+    if (!(item = PyIter_Next(iter))) {
+        if (!PyErr_Occurred()) {
+            __Pyx_RaiseNeedMoreValuesError(index);
+        }
+    }
+    return item;
+}
+
+static int __Pyx_EndUnpack(PyObject *iter) {
+    PyObject *item;
+    if ((item = PyIter_Next(iter))) {
+        Py_DECREF(item);
+        __Pyx_RaiseTooManyValuesError();
+        return -1;
+    }
+    else if (!PyErr_Occurred())
+        return 0;
+    else
+        return -1;
+}
+
+static PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = PyObject_GetAttr(o, n);
+    if (!r) {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+            goto bad;
+        PyErr_Clear();
+        r = d;
+        Py_INCREF(d);
+    }
+    return r;
+bad:
+    return 0;
+}
+
 static void __Pyx_RaiseDoubleKeywordsError(
     const char* func_name,
     PyObject* kw_name)
@@ -1843,15 +17825,8 @@ bad:
     return -1;
 }
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
 
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     PyThreadState *tstate = PyThreadState_GET();
 
@@ -1866,7 +17841,7 @@ static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *t
     Py_XDECREF(tmp_tb);
 }
 
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
     PyThreadState *tstate = PyThreadState_GET();
     *type = tstate->curexc_type;
     *value = tstate->curexc_value;
@@ -1878,6 +17853,83 @@ static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **
 }
 
 
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
+    PyObject *__import__ = 0;
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
+    if (!__import__)
+        goto bad;
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    module = PyObject_CallFunctionObjArgs(__import__,
+        name, global_dict, empty_dict, list, NULL);
+bad:
+    Py_XDECREF(empty_list);
+    Py_XDECREF(__import__);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
+    PyObject *result;
+    result = PyObject_GetAttr(dict, name);
+    if (!result)
+        PyErr_SetObject(PyExc_NameError, name);
+    return result;
+}
+
 #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
     Py_XINCREF(type);
@@ -1988,7 +18040,7 @@ bad:
 }
 #endif
 
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned char) < sizeof(long)) {
@@ -2007,7 +18059,7 @@ static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
     const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned short) < sizeof(long)) {
@@ -2026,7 +18078,7 @@ static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
     return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
     const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned int) < sizeof(long)) {
@@ -2045,7 +18097,7 @@ static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
     return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
     const char neg_one = (char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(char) < sizeof(long)) {
@@ -2064,7 +18116,7 @@ static INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
     return (char)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
     const short neg_one = (short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(short) < sizeof(long)) {
@@ -2083,7 +18135,7 @@ static INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
     return (short)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
     const int neg_one = (int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(int) < sizeof(long)) {
@@ -2102,7 +18154,7 @@ static INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
     return (int)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
     const signed char neg_one = (signed char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed char) < sizeof(long)) {
@@ -2121,7 +18173,7 @@ static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
     return (signed char)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
     const signed short neg_one = (signed short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed short) < sizeof(long)) {
@@ -2140,7 +18192,7 @@ static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
     return (signed short)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
     const signed int neg_one = (signed int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed int) < sizeof(long)) {
@@ -2159,7 +18211,7 @@ static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
     return (signed int)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
     const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2194,7 +18246,7 @@ static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
     }
 }
 
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
     const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2229,7 +18281,7 @@ static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x)
     }
 }
 
-static INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
     const long neg_one = (long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2264,7 +18316,7 @@ static INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
     }
 }
 
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
     const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2299,7 +18351,7 @@ static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
     }
 }
 
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
     const signed long neg_one = (signed long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2334,7 +18386,7 @@ static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
     }
 }
 
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
     const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -2372,11 +18424,12 @@ static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
 #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    long size)
+    long size, int strict)
 {
     PyObject *py_module = 0;
     PyObject *result = 0;
     PyObject *py_name = 0;
+    char warning[200];
 
     py_module = __Pyx_ImportModule(module_name);
     if (!py_module)
@@ -2401,9 +18454,15 @@ static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class
             module_name, class_name);
         goto bad;
     }
-    if (((PyTypeObject *)result)->tp_basicsize != size) {
+    if (!strict && ((PyTypeObject *)result)->tp_basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning), 
+            "%s.%s size changed, may indicate binary incompatibility",
+            module_name, class_name);
+        PyErr_WarnEx(NULL, warning, 0);
+    }
+    else if (((PyTypeObject *)result)->tp_basicsize != size) {
         PyErr_Format(PyExc_ValueError, 
-            "%s.%s does not appear to be the correct type object",
+            "%s.%s has the wrong size, try recompiling",
             module_name, class_name);
         goto bad;
     }
@@ -2455,6 +18514,23 @@ bad:
     return -1;
 }
 
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX < 0x03010000
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#else
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
@@ -2557,13 +18633,13 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
 
 /* Type Conversion Functions */
 
-static INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (x == Py_True) return 1;
    else if ((x == Py_False) | (x == Py_None)) return 0;
    else return PyObject_IsTrue(x);
 }
 
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
   PyNumberMethods *m;
   const char *name = NULL;
   PyObject *res = NULL;
@@ -2609,7 +18685,7 @@ static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
   return res;
 }
 
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_ssize_t ival;
   PyObject* x = PyNumber_Index(b);
   if (!x) return -1;
@@ -2618,7 +18694,7 @@ static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   return ival;
 }
 
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
 #if PY_VERSION_HEX < 0x02050000
    if (ival <= LONG_MAX)
        return PyInt_FromLong((long)ival);
@@ -2632,7 +18708,7 @@ static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
 #endif
 }
 
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
    unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
    if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
        return (size_t)-1;
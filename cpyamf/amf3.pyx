@@ -8,66 +8,257 @@ C-extension for L{pyamf.amf3} Python module in L{PyAMF<pyamf>}.
 """
 
 cdef extern from "Python.h":
+    ctypedef struct PyObject:
+        pass
+
     ctypedef unsigned long size_t
     void *PyMem_Malloc(size_t n)
     void PyMem_Free(void *p)
     object PyString_FromStringAndSize(char *buffer, Py_ssize_t length)
+    int PyString_AsStringAndSize(object, char **buf, Py_ssize_t *size) except -1
     object PyInt_FromLong(long v)
+    long PyInt_AS_LONG(object)
+    double PyFloat_AsDouble(object) except? -1
+
+    int PyString_CheckExact(object)
+    int PyUnicode_CheckExact(object)
+    int PyInt_CheckExact(object)
+    int PyList_CheckExact(object)
+    int PyTuple_CheckExact(object)
+    object PyUnicode_AsUTF8String(object)
+    object PyUnicode_DecodeUTF8(char *, Py_ssize_t, char *)
+    object PyFloat_FromDouble(double)
+
+    Py_ssize_t PyList_GET_SIZE(object)
+    PyObject *PyList_GET_ITEM(object, Py_ssize_t)
+    Py_ssize_t PyTuple_GET_SIZE(object)
+    PyObject *PyTuple_GET_ITEM(object, Py_ssize_t)
+
+
+from cpyamf.util cimport cBufferedByteStream, cIndexedCollection
+from cpyamf cimport codec
+
+import types
+import datetime
+import array
+
+import pyamf
+from pyamf import util
+
+
+DEF REFERENCE_BIT = 0x01
+DEF MAX_29B_INT = 0x0FFFFFFF
+DEF MIN_29B_INT = -0x10000000
+
+DEF TYPE_UNDEFINED = 0x00
+DEF TYPE_NULL = 0x01
+DEF TYPE_BOOL_FALSE = 0x02
+DEF TYPE_BOOL_TRUE = 0x03
+DEF TYPE_INTEGER = 0x04
+DEF TYPE_NUMBER = 0x05
+DEF TYPE_STRING = 0x06
+DEF TYPE_XML = 0x07
+DEF TYPE_DATE = 0x08
+DEF TYPE_ARRAY = 0x09
+DEF TYPE_OBJECT = 0x0A
+DEF TYPE_XMLSTRING = 0x0B
+DEF TYPE_BYTEARRAY = 0x0C
+DEF TYPE_INT_VECTOR = 0x0D
+DEF TYPE_UINT_VECTOR = 0x0E
+DEF TYPE_NUMBER_VECTOR = 0x0F
+DEF TYPE_OBJECT_VECTOR = 0x10
+DEF TYPE_DICTIONARY = 0x11
+
+DEF OBJECT_ENCODING_STATIC = 0x00
+DEF OBJECT_ENCODING_EXTERNAL = 0x01
+DEF OBJECT_ENCODING_DYNAMIC = 0x02
+DEF OBJECT_ENCODING_PROXY = 0x03
+
+# the native handlers that Encoder.resolveType maps a class to
+DEF ENC_UNDEFINED = 0
+DEF ENC_NULL = 1
+DEF ENC_BOOL = 2
+DEF ENC_INT = 3
+DEF ENC_NUMBER = 4
+DEF ENC_STRING = 5
+DEF ENC_DATE = 6
+DEF ENC_LIST = 7
+DEF ENC_DICT = 8
+DEF ENC_OBJECT = 9
+DEF ENC_BYTEARRAY = 10
+DEF ENC_XML = 11
+DEF ENC_FUNC = 12
+DEF ENC_CLASS = 13
+DEF ENC_VECTOR = 14
+DEF ENC_OBJECT_VECTOR = 15
+DEF ENC_DICTIONARY = 16
+DEF ENC_RAW = 17
+
+
+#: The L{pyamf.amf3} module, resolved lazily to avoid a circular import.
+cdef object amf3 = None
+cdef object Context = None
+cdef object get_decode_plan = None
+cdef object NumericVector = None
+cdef object ObjectVector = None
+cdef object Dictionary = None
+cdef bint float_broken = 0
+
+cdef object FUNC_TYPES = (types.BuiltinFunctionType, types.BuiltinMethodType,
+    types.FunctionType, types.GeneratorType, types.ModuleType,
+    types.LambdaType, types.MethodType)
+cdef object DATE_TYPES = (datetime.date, datetime.datetime, datetime.time)
+cdef object CLASS_TYPES = (types.ClassType, types.TypeType)
+cdef object LIST_TYPES = (list, set, tuple)
+
+
+cdef int _init_module() except -1:
+    global amf3, Context, get_decode_plan, float_broken
+    global NumericVector, ObjectVector, Dictionary
+
+    if amf3 is not None:
+        return 0
+
+    from pyamf import amf3 as mod
+
+    amf3 = mod
+    Context = mod.Context
+    get_decode_plan = mod.get_decode_plan
+    NumericVector = mod._NumericVector
+    ObjectVector = mod.ObjectVector
+    Dictionary = mod.Dictionary
+    float_broken = util.is_float_broken()
+
+    return 0
+
+
+# Reference tables. The C{IndexedCollection}s of an L{amf3.Context} are used
+# directly, any other context class goes through its public methods.
+
+cdef Py_ssize_t _get_object_reference(object context, object obj) except -2:
+    if type(context) is Context:
+        return (<cIndexedCollection>context.objects).getReferenceTo(obj)
+
+    ref = context.getObjectReference(obj)
+
+    if ref is None:
+        return -1
 
+    return ref
 
-from cpyamf.util cimport cBufferedByteStream
 
+cdef object _get_object(object context, Py_ssize_t ref):
+    if type(context) is Context:
+        return (<cIndexedCollection>context.objects).getByReference(ref)
 
-cdef Py_ssize_t _encode_int(long i, char **buf) except? -1:
+    return context.getObject(ref)
+
+
+cdef int _add_object(object context, object obj) except -1:
+    if type(context) is Context:
+        (<cIndexedCollection>context.objects).append(obj)
+    else:
+        context.addObject(obj)
+
+    return 0
+
+
+cdef Py_ssize_t _get_string_reference(object context, object s) except -2:
+    if type(context) is Context:
+        return (<cIndexedCollection>context.strings).getReferenceTo(s)
+
+    ref = context.getStringReference(s)
+
+    if ref is None:
+        return -1
+
+    return ref
+
+
+cdef object _get_string(object context, Py_ssize_t ref):
+    if type(context) is Context:
+        return (<cIndexedCollection>context.strings).getByReference(ref)
+
+    return context.getString(ref)
+
+
+cdef int _add_string(object context, object s) except -1:
+    if type(context) is Context:
+        (<cIndexedCollection>context.strings).append(s)
+    else:
+        context.addString(s)
+
+    return 0
+
+
+cdef Py_ssize_t _encode_int(long i, char *bytes) except -1:
+    """
+    Encodes C{i} as a variable length 29-bit integer into C{bytes}, which
+    must have room for at least 4 chars. Returns the number of chars used.
+    """
     # Use typecasting to get the twos complement representation of i
     cdef unsigned long n = (<unsigned long*>(<void *>(&i)))[0]
 
-    cdef Py_ssize_t size = 0
     cdef unsigned long real_value = n
     cdef char changed = 0
-    cdef unsigned char count = 0
-    cdef char *bytes = NULL
+    cdef Py_ssize_t count = 0
 
     if n > 0x1fffff:
-        size = 4
-        bytes = <char *>PyMem_Malloc(size)
         changed = 1
         n = n >> 1
         bytes[count] = 0x80 | ((n >> 21) & 0xff)
         count += 1
 
     if n > 0x3fff:
-        if size == 0:
-            size = 3
-            bytes = <char *>PyMem_Malloc(size)
-
         bytes[count] = 0x80 | ((n >> 14) & 0xff)
         count += 1
 
     if n > 0x7f:
-        if size == 0:
-            size = 2
-            bytes = <char *>PyMem_Malloc(size)
-
         bytes[count] = 0x80 | ((n >> 7) & 0xff)
         count += 1
 
     if changed == 1:
         n = real_value
 
-    if size == 0:
-        size = 1
-
-        bytes = <char *>PyMem_Malloc(size)
-
     if n > 0x1fffff:
         bytes[count] = n & 0xff
     else:
         bytes[count] = n & 0x7f
 
-    buf[0] = bytes
+    return count + 1
+
+
+cdef object _encoded_int(long n):
+    """
+    Returns C{n} encoded as a variable length 29-bit integer C{str}.
+    """
+    cdef char buf[4]
+    cdef Py_ssize_t size
+
+    if n > MAX_29B_INT or n < MIN_29B_INT:
+        raise OverflowError("Out of range")
+
+    size = _encode_int(n, buf)
+
+    return PyString_FromStringAndSize(buf, size)
+
+
+cdef int _write_int(cBufferedByteStream stream, long n) except -1:
+    """
+    Writes C{n} as a variable length 29-bit integer to C{stream}.
+    """
+    cdef char buf[4]
+    cdef Py_ssize_t size
+
+    if n > MAX_29B_INT or n < MIN_29B_INT:
+        raise OverflowError("Out of range")
+
+    size = _encode_int(n, buf)
+
+    stream.write(buf, size)
+
+    return 0
 
-    return size
 
 cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except? -1:
     cdef int n = 0
@@ -105,22 +296,1318 @@ cdef int _decode_int(cBufferedByteStream stream, long *ret, int sign=0) except?
     return 0
 
 
+cdef class Encoder(codec.Encoder):
+    """
+    Encodes an AMF3 data stream. A drop-in replacement for
+    L{pyamf.amf3.Encoder} that writes directly to the underlying
+    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.
+
+    The encoding methods of this class are not looked up by name, so
+    overriding them in a Python subclass will not affect nested elements.
+
+    @ivar use_proxies: Whether lists/dicts/objects are encoded as proxies
+        (C{ArrayCollection}/C{ObjectProxy}).
+    @type use_proxies: C{bool}
+    @ivar string_references: Whether repeated strings are encoded as
+        references.
+    @type string_references: C{bool}
+    """
+
+    cdef public object use_proxies
+    cdef public bint string_references
+
+    def __init__(self, *args, **kwargs):
+        _init_module()
+
+        self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+        self.string_references = kwargs.pop('string_references', True)
+
+        codec.Encoder.__init__(self, *args, **kwargs)
+
+    def buildContext(self):
+        return amf3.Context()
+
+    cdef object resolveType(self, object data):
+        if isinstance(data, FUNC_TYPES):
+            return ENC_FUNC
+
+        if isinstance(data, bool):
+            return ENC_BOOL
+
+        if data is None:
+            return ENC_NULL
+
+        if isinstance(data, (int, long)):
+            return ENC_INT
+
+        if isinstance(data, float):
+            return ENC_NUMBER
+
+        if isinstance(data, types.StringTypes):
+            return ENC_STRING
+
+        if isinstance(data, amf3.ByteArray):
+            return ENC_BYTEARRAY
+
+        if isinstance(data, NumericVector):
+            return ENC_VECTOR
+
+        if isinstance(data, array.ArrayType):
+            return ENC_LIST
+
+        if isinstance(data, ObjectVector):
+            return ENC_OBJECT_VECTOR
+
+        if isinstance(data, Dictionary):
+            return ENC_DICTIONARY
+
+        if isinstance(data, DATE_TYPES):
+            return ENC_DATE
+
+        if util.is_ET_element(data):
+            return ENC_XML
+
+        if isinstance(data, pyamf.UndefinedType):
+            return ENC_UNDEFINED
+
+        if isinstance(data, pyamf.RawAMF):
+            return ENC_RAW
+
+        if isinstance(data, CLASS_TYPES):
+            return ENC_CLASS
+
+        if isinstance(data, (types.InstanceType, types.ObjectType)):
+            kls = data.__class__
+
+            if kls is pyamf.MixedArray:
+                return ENC_DICT
+
+            if kls in LIST_TYPES:
+                return ENC_LIST
+
+            return ENC_OBJECT
+
+        return None
+
+    cdef int _writeElement(self, object data, object use_proxies) except -1:
+        cdef object func = self.getTypeFunc(data)
+        cdef long t
+
+        if func is None:
+            raise pyamf.EncodeError("Unknown type %r" % (data,))
+
+        if PyInt_CheckExact(func) == 0:
+            func(data, use_proxies=use_proxies)
+
+            return 0
+
+        t = PyInt_AS_LONG(func)
+
+        if t == ENC_STRING:
+            self.stream.write_uchar(TYPE_STRING)
+
+            return self._writeString(data)
+        elif t == ENC_INT:
+            return self._writeInteger(data)
+        elif t == ENC_NUMBER:
+            return self._writeNumber(data)
+        elif t == ENC_BOOL:
+            if data:
+                return self.stream.write_uchar(TYPE_BOOL_TRUE)
+
+            return self.stream.write_uchar(TYPE_BOOL_FALSE)
+        elif t == ENC_NULL:
+            return self.stream.write_uchar(TYPE_NULL)
+        elif t == ENC_OBJECT:
+            return self._writeObject(data, use_proxies)
+        elif t == ENC_LIST:
+            return self._writeList(data, use_proxies)
+        elif t == ENC_DICT:
+            return self._writeDict(data, use_proxies)
+        elif t == ENC_DATE:
+            return self._writeDate(data)
+        elif t == ENC_UNDEFINED:
+            return self.stream.write_uchar(TYPE_UNDEFINED)
+        elif t == ENC_BYTEARRAY:
+            return self._writeByteArray(data)
+        elif t == ENC_VECTOR:
+            return self._writeVector(data, use_proxies)
+        elif t == ENC_OBJECT_VECTOR:
+            return self._writeObjectVector(data)
+        elif t == ENC_DICTIONARY:
+            return self._writeDictionary(data)
+        elif t == ENC_XML:
+            return self._writeXML(data)
+        elif t == ENC_RAW:
+            self.writeRawAMF(data)
+        elif t == ENC_FUNC:
+            self.writeFunc(data)
+        elif t == ENC_CLASS:
+            self.writeClass(data)
+
+        return 0
+
+    cdef int _writeInteger(self, object n) except -1:
+        cdef long x
+
+        if PyInt_CheckExact(n) == 0:
+            if n < MIN_29B_INT or n > MAX_29B_INT:
+                return self._writeNumber(float(n))
+
+        x = n
+
+        if x < MIN_29B_INT or x > MAX_29B_INT:
+            return self._writeNumber(float(n))
+
+        self.stream.write_uchar(TYPE_INTEGER)
+
+        return _write_int(self.stream, x)
+
+    cdef int _writeNumber(self, object n) except -1:
+        self.stream.write_uchar(TYPE_NUMBER)
+
+        return self.stream.write_double(PyFloat_AsDouble(n))
+
+    cdef int _writeString(self, object n) except -1:
+        cdef object bytes
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+        cdef Py_ssize_t ref
+
+        if PyString_CheckExact(n):
+            bytes = n
+        elif PyUnicode_CheckExact(n):
+            bytes = PyUnicode_AsUTF8String(n)
+        else:
+            bytes = unicode(n).encode('utf8')
+            n = bytes
+
+        PyString_AsStringAndSize(bytes, &buf, &l)
+
+        if l == 0:
+            return self.stream.write_uchar(REFERENCE_BIT)
+
+        if self.string_references:
+            ref = _get_string_reference(self.context, n)
+
+            if ref != -1:
+                return _write_int(self.stream, ref << 1)
+
+            _add_string(self.context, n)
+
+        _write_int(self.stream, (l << 1) | REFERENCE_BIT)
+
+        return self.stream.write(buf, l)
+
+    cdef int _writeDate(self, object n) except -1:
+        cdef Py_ssize_t ref
+
+        if isinstance(n, datetime.time):
+            raise pyamf.EncodeError('A datetime.time instance was found but '
+                'AMF3 has no way to encode time objects. Please use '
+                'datetime.datetime instead (got:%r)' % (n,))
+
+        self.stream.write_uchar(TYPE_DATE)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        self.stream.write_uchar(REFERENCE_BIT)
+
+        if self.timezone_offset is not None:
+            n -= self.timezone_offset
+
+        ms = util.get_timestamp(n)
+
+        return self.stream.write_double(ms * 1000.0)
+
+    cdef int _writeList(self, object n, object use_proxies) except -1:
+        cdef Py_ssize_t i, l, ref
+
+        if use_proxies is None:
+            use_proxies = self.use_proxies
+
+        if use_proxies is True:
+            self.writeProxy(n)
+
+            return 0
+
+        self.stream.write_uchar(TYPE_ARRAY)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        _write_int(self.stream, (len(n) << 1) | REFERENCE_BIT)
+        self.stream.write_uchar(0x01)
+
+        if PyList_CheckExact(n):
+            l = PyList_GET_SIZE(n)
+
+            for i from 0 <= i < l:
+                self._writeElement(<object>PyList_GET_ITEM(n, i), None)
+        elif PyTuple_CheckExact(n):
+            l = PyTuple_GET_SIZE(n)
+
+            for i from 0 <= i < l:
+                self._writeElement(<object>PyTuple_GET_ITEM(n, i), None)
+        elif isinstance(n, array.ArrayType) and n.typecode in amf3.VECTOR_TYPECODES:
+            if n.typecode in 'fd':
+                for x in n:
+                    self._writeNumber(x)
+            else:
+                for x in n:
+                    self._writeInteger(x)
+        else:
+            for x in n:
+                self._writeElement(x, None)
+
+        return 0
+
+    cdef int _writeDict(self, object n, object use_proxies) except -1:
+        cdef Py_ssize_t ref
+
+        # Design bug in AMF3 that cannot read/write empty key strings
+        # http://www.docuverse.com/blog/donpark/2007/05/14/flash-9-amf3-bug
+        # for more info
+        if '' in n:
+            raise pyamf.EncodeError("dicts cannot contain empty string keys")
+
+        if use_proxies is None:
+            use_proxies = self.use_proxies
+
+        if use_proxies is True:
+            self.writeProxy(n)
+
+            return 0
+
+        self.stream.write_uchar(TYPE_ARRAY)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        # The AMF3 spec demands that all str based indicies be listed first
+        keys = n.keys()
+        int_keys = []
+        str_keys = []
+
+        for x in keys:
+            if isinstance(x, (int, long)):
+                int_keys.append(x)
+            elif isinstance(x, (str, unicode)):
+                str_keys.append(x)
+            else:
+                raise ValueError("Non int/str key value found in dict")
+
+        # Make sure the integer keys are within range
+        l = len(int_keys)
+
+        for x in int_keys:
+            if l < x <= 0:
+                # treat as a string key
+                str_keys.append(x)
+                del int_keys[int_keys.index(x)]
+
+        int_keys.sort()
+
+        # If integer keys don't start at 0, they will be treated as strings
+        if len(int_keys) > 0 and int_keys[0] != 0:
+            for x in int_keys:
+                str_keys.append(str(x))
+                del int_keys[int_keys.index(x)]
+
+        _write_int(self.stream, len(int_keys) << 1 | REFERENCE_BIT)
+
+        for x in str_keys:
+            self._writeString(x)
+            self._writeElement(n[x], None)
+
+        self.stream.write_uchar(0x01)
+
+        for k in int_keys:
+            self._writeElement(n[k], None)
+
+        return 0
+
+    cdef int _writeObject(self, object obj, object use_proxies) except -1:
+        cdef bint class_ref = 0
+        cdef long ref
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+
+        if use_proxies is None:
+            use_proxies = self.use_proxies
+
+        if use_proxies is True:
+            self.writeProxy(obj)
+
+            return 0
+
+        self.stream.write_uchar(TYPE_OBJECT)
+
+        ref = _get_object_reference(self.context, obj)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, obj)
+
+        # object is not referenced, serialise it
+        kls = obj.__class__
+        definition = self.context.getClass(kls)
+        alias = None
+
+        if definition is not None:
+            class_ref = 1
+            alias = definition.alias
+        else:
+            try:
+                alias = pyamf.get_class_alias(kls)
+            except pyamf.UnknownClassAlias:
+                alias_klass = pyamf._get_alias_type(kls)
+                meta = util.get_class_meta(kls)
+
+                alias = alias_klass(kls, defer=True, **meta)
+
+            definition = amf3.ClassDefinition(alias)
+
+            self.context.addClass(definition, alias.klass)
+
+        if class_ref:
+            PyString_AsStringAndSize(definition.reference, &buf, &l)
+            self.stream.write(buf, l)
+        else:
+            ref = 0
+
+            if definition.encoding != OBJECT_ENCODING_EXTERNAL:
+                ref += definition.attr_len << 4
+
+            _write_int(self.stream, ref | definition.encoding << 2 |
+                REFERENCE_BIT << 1 | REFERENCE_BIT)
+
+            # work out what the final reference for the class will be.
+            # this is okay because the next time an object of the same
+            # class is encoded, class_ref will be True and never get here
+            # again.
+            definition.reference = _encoded_int(
+                definition.reference << 2 | REFERENCE_BIT)
+
+            if alias.anonymous:
+                self.stream.write_uchar(0x01)
+            else:
+                self._writeString(alias.alias)
+
+        if alias.external:
+            obj.__writeamf__(amf3.DataOutput(self))
+
+            return 0
+
+        if alias.encode_attrs is not None:
+            return self._writeSealedObject(obj, alias, definition, class_ref)
+
+        attrs = alias.getEncodableAttributes(obj, codec=self)
+
+        if alias.static_attrs:
+            if not class_ref:
+                for attr in alias.static_attrs:
+                    self._writeString(attr)
+
+            for attr in alias.static_attrs:
+                self._writeElement(attrs.pop(attr), None)
+
+            if definition.encoding == OBJECT_ENCODING_STATIC:
+                return 0
+
+        if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+            if attrs:
+                for attr, value in attrs.iteritems():
+                    self._writeString(attr)
+                    self._writeElement(value, None)
+
+            self.stream.write_uchar(0x01)
+
+        return 0
+
+    cdef int _writeSealedObject(self, object obj, object alias,
+                                object definition, bint class_ref) except -1:
+        """
+        Writes the attributes of C{obj} using the encode plan of C{alias}.
+        """
+        cdef Py_ssize_t i, l
+        cdef Py_ssize_t static_len = 0
+
+        values = alias.getEncodableValues(obj)
+        static_attrs = alias.static_attrs
+
+        if static_attrs:
+            static_len = len(static_attrs)
+
+            if not class_ref:
+                for attr in static_attrs:
+                    self._writeString(attr)
+
+            for i from 0 <= i < static_len:
+                self._writeElement(values[i], None)
+
+        if definition.encoding == OBJECT_ENCODING_DYNAMIC:
+            attrs = alias.encode_attrs
+            l = len(attrs)
+
+            for i from static_len <= i < l:
+                self._writeString(attrs[i])
+                self._writeElement(values[i], None)
+
+            self.stream.write_uchar(0x01)
+
+        return 0
+
+    cdef int _writeByteArray(self, object n) except -1:
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+        cdef Py_ssize_t ref
+
+        self.stream.write_uchar(TYPE_BYTEARRAY)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        bytes = str(n)
+        PyString_AsStringAndSize(bytes, &buf, &l)
+
+        _write_int(self.stream, l << 1 | REFERENCE_BIT)
+
+        return self.stream.write(buf, l)
+
+    cdef int _writeVector(self, object n, object use_proxies) except -1:
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+        cdef Py_ssize_t ref
+
+        try:
+            marker, typecode = amf3.VECTOR_TYPECODES[n.typecode]
+        except KeyError:
+            return self._writeList(n.tolist(), use_proxies)
+
+        self.stream.write_uchar(ord(marker))
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(bool(getattr(n, 'fixed', False)))
+
+        bytes = amf3._pack_vector(n, typecode)
+        PyString_AsStringAndSize(bytes, &buf, &l)
+
+        return self.stream.write(buf, l)
+
+    cdef int _writeObjectVector(self, object n) except -1:
+        cdef Py_ssize_t ref
+
+        self.stream.write_uchar(TYPE_OBJECT_VECTOR)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(bool(n.fixed))
+        self._writeString(n.classname)
+
+        for x in n:
+            self._writeElement(x, None)
+
+        return 0
+
+    cdef int _writeDictionary(self, object n) except -1:
+        cdef Py_ssize_t ref
+
+        self.stream.write_uchar(TYPE_DICTIONARY)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        _write_int(self.stream, len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(bool(n.weak_keys))
+
+        for key, value in n.iteritems():
+            # primitive keys skip the type lookup
+            if PyInt_CheckExact(key):
+                self._writeInteger(key)
+            elif PyString_CheckExact(key) or PyUnicode_CheckExact(key):
+                self.stream.write_uchar(TYPE_STRING)
+                self._writeString(key)
+            else:
+                self._writeElement(key, None)
+
+            self._writeElement(value, None)
+
+        return 0
+
+    cdef int _writeXML(self, object n) except -1:
+        cdef Py_ssize_t ref
+
+        i = self.context.getLegacyXMLReference(n)
+
+        if i is None:
+            self.stream.write_uchar(TYPE_XMLSTRING)
+        else:
+            self.stream.write_uchar(TYPE_XML)
+
+        ref = _get_object_reference(self.context, n)
+
+        if ref != -1:
+            return _write_int(self.stream, ref << 1)
+
+        _add_object(self.context, n)
+
+        return self._writeString(util.ET.tostring(n, 'utf-8'))
+
+    def writeElement(self, data, use_proxies=None):
+        """
+        Writes the data.
+
+        @param data: The data to be encoded to the AMF3 data stream.
+        @type data: C{mixed}
+        @raise EncodeError: Cannot find encoder func for C{data}.
+        """
+        self._writeElement(data, use_proxies)
+
+    def writeProxy(self, obj, **kwargs):
+        """
+        Encodes a proxied object to the stream.
+        """
+        proxy = self.context.getProxyForObject(obj)
+
+        self._writeElement(proxy, False)
+
+    def writeUndefined(self, *args, **kwargs):
+        """
+        Writes an C{pyamf.Undefined} value to the stream.
+        """
+        self.stream.write_uchar(TYPE_UNDEFINED)
+
+    def writeNull(self, *args, **kwargs):
+        """
+        Writes a C{null} value to the stream.
+        """
+        self.stream.write_uchar(TYPE_NULL)
+
+    def writeBoolean(self, n, **kwargs):
+        """
+        Writes a Boolean to the stream.
+        """
+        if n:
+            self.stream.write_uchar(TYPE_BOOL_TRUE)
+        else:
+            self.stream.write_uchar(TYPE_BOOL_FALSE)
+
+    def writeInteger(self, n, **kwargs):
+        """
+        Writes an integer to the stream.
+        """
+        self._writeInteger(n)
+
+    def writeNumber(self, n, **kwargs):
+        """
+        Writes a float to the stream.
+        """
+        self._writeNumber(n)
+
+    def writeString(self, n, writeType=True, **kwargs):
+        """
+        Writes a string to the stream. If C{n} is not a unicode string, an
+        attempt will be made to convert it.
+        """
+        if writeType:
+            self.stream.write_uchar(TYPE_STRING)
+
+        self._writeString(n)
+
+    def writeDate(self, n, **kwargs):
+        """
+        Writes a C{datetime} instance to the stream.
+        """
+        self._writeDate(n)
+
+    def writeList(self, n, use_proxies=None):
+        """
+        Writes a C{tuple}, C{set} or C{list} to the stream.
+        """
+        self._writeList(n, use_proxies)
+
+    def writeDict(self, n, use_proxies=None):
+        """
+        Writes a C{dict} to the stream.
+
+        @raise ValueError: Non C{int}/C{str} key value found in the C{dict}
+        @raise EncodeError: C{dict} contains empty string keys.
+        """
+        self._writeDict(n, use_proxies)
+
+    def writeInstance(self, obj, use_proxies=None, **kwargs):
+        """
+        Writes a class instance to the stream.
+        """
+        kls = obj.__class__
+
+        if kls is pyamf.MixedArray:
+            self._writeDict(obj, use_proxies)
+        elif kls in LIST_TYPES:
+            self._writeList(obj, use_proxies)
+        else:
+            self._writeObject(obj, use_proxies)
+
+    def writeObject(self, obj, use_proxies=None):
+        """
+        Writes an object to the stream.
+        """
+        self._writeObject(obj, use_proxies)
+
+    def writeByteArray(self, n, **kwargs):
+        """
+        Writes a L{ByteArray<pyamf.amf3.ByteArray>} to the data stream.
+        """
+        self._writeByteArray(n)
+
+    def writeVector(self, n, use_proxies=None):
+        """
+        Writes an C{array.array} to the data stream as an AMF3 vector.
+
+        @see: L{pyamf.amf3.Encoder.writeVector}
+        """
+        self._writeVector(n, use_proxies)
+
+    def writeObjectVector(self, n, **kwargs):
+        """
+        Writes an L{ObjectVector<pyamf.amf3.ObjectVector>} to the data stream.
+        """
+        self._writeObjectVector(n)
+
+    def writeDictionary(self, n, **kwargs):
+        """
+        Writes a L{Dictionary<pyamf.amf3.Dictionary>} to the data stream.
+        """
+        self._writeDictionary(n)
+
+    def writeXML(self, n, **kwargs):
+        """
+        Writes a XML string to the data stream.
+        """
+        self._writeXML(n)
+
+    def writeRawAMF(self, raw, **kwargs):
+        """
+        Writes a pre-encoded element to the stream.
+
+        @raise EncodeError: C{raw} is not AMF3 encoded.
+        @since: 0.6
+        """
+        cdef char *buf = NULL
+        cdef Py_ssize_t l = 0
+
+        if raw.encoding != pyamf.AMF3:
+            raise pyamf.EncodeError('Cannot write an AMF%d fragment to an '
+                'AMF3 stream' % (raw.encoding,))
+
+        PyString_AsStringAndSize(raw.data, &buf, &l)
+        self.stream.write(buf, l)
+        self.context.addRawAMF(raw)
+
+
+cdef object _read_bytes(cBufferedByteStream stream, Py_ssize_t l, bint unicode_):
+    """
+    Reads C{l} bytes from C{stream}, decoding them from UTF-8 if C{unicode_}
+    is set. The result is built straight from the stream's memory.
+    """
+    cdef char *buf
+
+    if l < 0 or l > stream.length - stream.pos:
+        raise IOError('Attempted to read %d bytes from the buffer but only '
+            '%d remain' % (l, stream.length - stream.pos))
+
+    buf = stream.buffer + stream.pos
+    stream.pos += l
+
+    if unicode_:
+        return PyUnicode_DecodeUTF8(buf, l, 'strict')
+
+    return PyString_FromStringAndSize(buf, l)
+
+
+cdef class Decoder(codec.Decoder):
+    """
+    Decodes an AMF3 data stream. A drop-in replacement for
+    L{pyamf.amf3.Decoder} that reads directly from the underlying
+    L{cBufferedByteStream<cpyamf.util.cBufferedByteStream>}.
+
+    Nested elements are decoded without going through the public C{read*}
+    methods, so overriding them in a Python subclass only affects direct
+    calls.
+
+    @ivar use_proxies: Whether C{ArrayCollection}/C{ObjectProxy} instances
+        are unwrapped to their source objects.
+    @type use_proxies: C{bool}
+    @ivar typed_arrays: Whether dense arrays that only contain numbers are
+        decoded to an C{array.array}, see L{pyamf.amf3.Decoder.typed_arrays}.
+    @type typed_arrays: C{bool}
+    """
+
+    cdef public object use_proxies
+    cdef public object typed_arrays
+
+    def __init__(self, *args, **kwargs):
+        _init_module()
+
+        self.use_proxies = kwargs.pop('use_proxies', amf3.use_proxies_default)
+        self.typed_arrays = kwargs.pop('typed_arrays',
+            amf3.typed_arrays_default)
+
+        codec.Decoder.__init__(self, *args, **kwargs)
+
+    def buildContext(self):
+        return amf3.Context()
+
+    cdef object readType(self, unsigned char t):
+        if t == TYPE_STRING:
+            return self._readString(1)
+        elif t == TYPE_INTEGER:
+            return PyInt_FromLong(self._readInteger(1))
+        elif t == TYPE_NUMBER:
+            return self._readNumber()
+        elif t == TYPE_OBJECT:
+            return self._readObject(None)
+        elif t == TYPE_ARRAY:
+            return self._readArray()
+        elif t == TYPE_NULL:
+            return None
+        elif t == TYPE_BOOL_TRUE:
+            return True
+        elif t == TYPE_BOOL_FALSE:
+            return False
+        elif t == TYPE_UNDEFINED:
+            return pyamf.Undefined
+        elif t == TYPE_DATE:
+            return self._readDate()
+        elif t == TYPE_BYTEARRAY:
+            return self._readByteArray()
+        elif t == TYPE_XMLSTRING:
+            return self._readXML(0)
+        elif t == TYPE_XML:
+            return self._readXML(1)
+        elif t == TYPE_INT_VECTOR:
+            return self._readVector(amf3.IntVector)
+        elif t == TYPE_UINT_VECTOR:
+            return self._readVector(amf3.UintVector)
+        elif t == TYPE_NUMBER_VECTOR:
+            return self._readVector(amf3.NumberVector)
+        elif t == TYPE_OBJECT_VECTOR:
+            return self._readObjectVector()
+        elif t == TYPE_DICTIONARY:
+            return self._readDictionary()
+
+        raise pyamf.DecodeError("Unsupported ActionScript type %r" % (chr(t),))
+
+    cdef long _readInteger(self, int signed) except? -1:
+        cdef long x
+
+        _decode_int(self.stream, &x, signed)
+
+        return x
+
+    cdef object _readNumber(self):
+        cdef double x
+
+        if float_broken:
+            return (<object>self.stream).read_double()
+
+        self.stream.read_double(&x)
+
+        return PyFloat_FromDouble(x)
+
+    cdef object _readString(self, bint unicode_):
+        cdef long x = self._readInteger(0)
+        cdef Py_ssize_t length = x >> 1
+
+        if x & REFERENCE_BIT == 0:
+            return _get_string(self.context, length)
+
+        if length == 0:
+            return u''
+
+        result = _read_bytes(self.stream, length, unicode_)
+
+        _add_string(self.context, result)
+
+        return result
+
+    cdef object _readDate(self):
+        cdef long ref = self._readInteger(0)
+        cdef double ms
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        self.stream.read_double(&ms)
+
+        result = util.get_datetime(ms / 1000.0)
+
+        if self.timezone_offset is not None:
+            result += self.timezone_offset
+
+        _add_object(self.context, result)
+
+        return result
+
+    cdef object _readArray(self):
+        cdef long size = self._readInteger(0)
+        cdef long i
+
+        if size & REFERENCE_BIT == 0:
+            return _get_object(self.context, size >> 1)
+
+        size >>= 1
+
+        key = self._readString(0)
+
+        if key == '':
+            if self.typed_arrays:
+                result = self._readTypedArray(size)
+
+                if result is not None:
+                    _add_object(self.context, result)
+
+                    return result
+
+            # integer indexes only -> python list
+            result = []
+            _add_object(self.context, result)
+
+            for i from 0 <= i < size:
+                result.append(self._readElement())
+
+            return result
+
+        result = pyamf.MixedArray()
+        _add_object(self.context, result)
+
+        while key:
+            result[key] = self._readElement()
+            key = self._readString(0)
+
+        for i from 0 <= i < size:
+            result[i] = self._readElement()
+
+        return result
+
+    cdef object _readTypedArray(self, long size):
+        """
+        Reads the C{size} elements of a dense array into an C{array.array} in
+        a single pass, if they are all numbers. Otherwise C{None} is returned
+        and the stream position restored.
+        """
+        cdef Py_ssize_t pos = self.stream.tell()
+        cdef double *values
+        cdef long *ints
+        cdef long i, x
+        cdef unsigned char t
+        cdef bint is_float = 0
+
+        # every element is at least 2 bytes, anything bigger is corrupt and
+        # left to the generic path to report
+        if size == 0 or float_broken or size * 2 > self.stream.remaining():
+            return None
+
+        values = <double *>PyMem_Malloc(size * sizeof(double))
+
+        if values == NULL:
+            raise MemoryError
+
+        try:
+            for i from 0 <= i < size:
+                self.stream.read_uchar(&t)
+
+                if t == TYPE_INTEGER:
+                    _decode_int(self.stream, &x, 1)
+                    values[i] = x
+                elif t == TYPE_NUMBER:
+                    self.stream.read_double(&values[i])
+                    is_float = 1
+                else:
+                    self.stream.seek(pos)
+
+                    return None
+
+            if is_float:
+                result = array.array('d')
+                result.fromstring(PyString_FromStringAndSize(
+                    <char *>values, size * sizeof(double)))
+
+                return result
+
+            # sizeof(long) <= sizeof(double) so convert in place
+            ints = <long *>values
+
+            for i from 0 <= i < size:
+                ints[i] = <long>values[i]
+
+            result = array.array('l')
+            result.fromstring(PyString_FromStringAndSize(
+                <char *>ints, size * sizeof(long)))
+
+            return result
+        finally:
+            PyMem_Free(values)
+
+    cdef object _readClassDefinition(self, long ref):
+        """
+        Reads a class definition from the stream.
+        """
+        cdef long i
+
+        if ref & REFERENCE_BIT == 0:
+            return self.context.getClassByReference(ref >> 1)
+
+        ref >>= 1
+
+        name = self._readString(1)
+        static_properties = []
+
+        for i from 0 <= i < ref >> 2:
+            static_properties.append(self._readString(0))
+
+        plan = get_decode_plan(name, ref & 0x03, static_properties,
+            self.strict)
+        class_def = plan.getClassDefinition()
+
+        self.context.addClass(class_def, plan.alias.klass)
+
+        return class_def
+
+    cdef object _readObject(self, object use_proxies):
+        cdef long ref = self._readInteger(0)
+        cdef long encoding
+
+        if use_proxies is None:
+            use_proxies = self.use_proxies
+
+        if ref & REFERENCE_BIT == 0:
+            obj = _get_object(self.context, ref >> 1)
+
+            if obj is None:
+                raise pyamf.ReferenceError('Unknown reference %d' % (ref >> 1,))
+
+            if use_proxies is True:
+                obj = self.readProxy(obj)
+
+            return obj
+
+        ref >>= 1
+
+        class_def = self._readClassDefinition(ref)
+        alias = class_def.alias
+
+        obj = alias.createInstance(codec=self)
+        obj_attrs = {}
+
+        _add_object(self.context, obj)
+
+        encoding = class_def.encoding
+
+        if encoding == OBJECT_ENCODING_EXTERNAL or encoding == OBJECT_ENCODING_PROXY:
+            obj.__readamf__(amf3.DataInput(self))
+        elif encoding == OBJECT_ENCODING_DYNAMIC:
+            for attr in class_def.static_properties:
+                obj_attrs[attr] = self._readElement()
+
+            attr = self._readString(0)
+
+            while attr:
+                obj_attrs[attr] = self._readElement()
+                attr = self._readString(0)
+        elif encoding == OBJECT_ENCODING_STATIC:
+            for attr in class_def.static_properties:
+                obj_attrs[attr] = self._readElement()
+        else:
+            raise pyamf.DecodeError("Unknown object encoding")
+
+        plan = class_def.plan
+
+        if plan is not None:
+            plan.applyAttributes(obj, obj_attrs, codec=self)
+        else:
+            alias.applyAttributes(obj, obj_attrs, codec=self)
+
+        if use_proxies is True:
+            obj = self.readProxy(obj)
+
+        return obj
+
+    cdef object _readXML(self, bint legacy):
+        cdef long ref = self._readInteger(0)
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        xmlstring = _read_bytes(self.stream, ref >> 1, 0)
+
+        x = util.ET.fromstring(xmlstring)
+        _add_object(self.context, x)
+
+        if legacy:
+            self.context.addLegacyXML(x)
+
+        return x
+
+    cdef object _readByteArray(self):
+        cdef long ref = self._readInteger(0)
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        buffer = self.stream.read_view(ref >> 1)
+        data = amf3._decompress(buffer)
+        compressed = data is not None
+
+        if compressed:
+            buffer = data
+
+        obj = amf3.ByteArray(buffer)
+        obj.compressed = compressed
+
+        _add_object(self.context, obj)
+
+        return obj
+
+    cdef object _readVector(self, object klass):
+        cdef long ref = self._readInteger(0)
+        cdef unsigned char fixed
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        self.stream.read_uchar(&fixed)
+        result = amf3._unpack_vector(klass, self.stream, ref >> 1, fixed)
+
+        _add_object(self.context, result)
+
+        return result
+
+    cdef object _readObjectVector(self):
+        cdef long ref = self._readInteger(0)
+        cdef long i
+        cdef unsigned char fixed
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        self.stream.read_uchar(&fixed)
+        result = ObjectVector(fixed=bool(fixed),
+            classname=self._readString(1))
+
+        _add_object(self.context, result)
+
+        for i from 0 <= i < ref >> 1:
+            result.append(self._readElement())
+
+        return result
+
+    cdef object _readDictionary(self):
+        cdef long ref = self._readInteger(0)
+        cdef long i
+        cdef unsigned char weak_keys
+
+        if ref & REFERENCE_BIT == 0:
+            return _get_object(self.context, ref >> 1)
+
+        self.stream.read_uchar(&weak_keys)
+        result = Dictionary(weak_keys=bool(weak_keys))
+
+        _add_object(self.context, result)
+
+        for i from 0 <= i < ref >> 1:
+            key = self._readElement()
+            result[key] = self._readElement()
+
+        return result
+
+    def readUndefined(self):
+        """
+        Read undefined.
+        """
+        return pyamf.Undefined
+
+    def readNull(self):
+        """
+        Read null.
+        """
+        return None
+
+    def readBoolFalse(self):
+        """
+        Returns C{False}.
+        """
+        return False
+
+    def readBoolTrue(self):
+        """
+        Returns C{True}.
+        """
+        return True
+
+    def readNumber(self):
+        """
+        Read number.
+        """
+        return self._readNumber()
+
+    def readUnsignedInteger(self):
+        """
+        Reads and returns an unsigned integer from the stream.
+        """
+        return self._readInteger(0)
+
+    def readSignedInteger(self):
+        """
+        Reads and returns a signed integer from the stream.
+        """
+        return self._readInteger(1)
+
+    def readInteger(self, sign=False):
+        """
+        Reads and returns an integer from the stream.
+
+        @param sign: Whether the integer is signed (C{signed} is a reserved
+            word in Cython).
+        """
+        if sign:
+            return self._readInteger(1)
+
+        return self._readInteger(0)
+
+    def readString(self, unicode_=True):
+        """
+        Reads and returns a string from the stream.
+        """
+        if unicode_:
+            return self._readString(1)
+
+        return self._readString(0)
+
+    def readDate(self):
+        """
+        Read date from the stream.
+        """
+        return self._readDate()
+
+    def readArray(self):
+        """
+        Reads an array from the stream.
+        """
+        return self._readArray()
+
+    def _getClassDefinition(self, ref):
+        """
+        Reads class definition from the stream.
+
+        @return: A tuple of the class definition and its alias.
+        """
+        class_def = self._readClassDefinition(ref)
+
+        return class_def, class_def.alias
+
+    def readObject(self, use_proxies=None):
+        """
+        Reads an object from the stream.
+
+        @raise pyamf.DecodeError: Unknown object encoding.
+        """
+        return self._readObject(use_proxies)
+
+    def readXMLString(self):
+        """
+        Reads a string from the data stream and converts it into
+        an XML Tree.
+        """
+        return self._readXML(0)
+
+    def readXML(self):
+        """
+        Read a legacy XML Document from the stream.
+        """
+        return self._readXML(1)
+
+    def readByteArray(self):
+        """
+        Reads a string of data from the stream.
+        """
+        return self._readByteArray()
+
+    def readIntVector(self):
+        """
+        Reads a C{Vector.<int>} from the stream.
+        """
+        return self._readVector(amf3.IntVector)
+
+    def readUintVector(self):
+        """
+        Reads a C{Vector.<uint>} from the stream.
+        """
+        return self._readVector(amf3.UintVector)
+
+    def readNumberVector(self):
+        """
+        Reads a C{Vector.<Number>} from the stream.
+        """
+        return self._readVector(amf3.NumberVector)
+
+    def readObjectVector(self):
+        """
+        Reads a C{Vector.<Object>} from the stream.
+        """
+        return self._readObjectVector()
+
+    def readDictionary(self):
+        """
+        Reads a C{flash.utils.Dictionary} from the stream.
+        """
+        return self._readDictionary()
+
+
 def encode_int(long n):
     """
     Encode C{int}.
 
     @raise OverflowError: Out of range.
     """
-    if n >= 0x10000000 or n < -0x10000000:
-        raise OverflowError("Out of range")
+    return _encoded_int(n)
 
-    cdef char *buf = NULL
-    cdef Py_ssize_t size = _encode_int(n, &buf)
-    cdef object o = PyString_FromStringAndSize(buf, size)
-
-    PyMem_Free(buf)
-
-    return o
 
 def decode_int(stream, sign=False):
     """
@@ -144,4 +1631,3 @@ def decode_int(stream, sign=False):
     PyMem_Free(result)
 
     return ret
-
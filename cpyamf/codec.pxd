@@ -0,0 +1,24 @@
+# Copyright (c) 2007-2009 The PyAMF Project.
+# See LICENSE for details.
+
+from cpyamf.util cimport cBufferedByteStream
+
+
+cdef class Codec:
+    cdef public cBufferedByteStream stream
+    cdef public object context
+    cdef public object strict
+    cdef public object timezone_offset
+
+
+cdef class Encoder(Codec):
+    cdef dict _func_cache
+
+    cdef object getCustomTypeFunc(self, object data)
+    cdef object getTypeFunc(self, object data)
+    cdef object resolveType(self, object data)
+
+
+cdef class Decoder(Codec):
+    cdef object _readElement(self)
+    cdef object readType(self, unsigned char t)
@@ -0,0 +1,213 @@
+# Copyright (c) 2007-2009 The PyAMF Project.
+# See LICENSE for details.
+
+"""
+Base classes for the compiled codecs in L{cpyamf}.
+
+@since: 0.6
+"""
+
+cdef extern from "Python.h":
+    ctypedef struct PyObject:
+        pass
+
+    PyObject *PyDict_GetItem(object, object)
+    int PyInt_CheckExact(object)
+
+
+from cpyamf.util cimport cBufferedByteStream
+
+import types
+
+import pyamf
+from pyamf import util
+
+
+cdef class Codec:
+    """
+    Base class for the compiled encoders and decoders. Mirrors the
+    constructor of L{pyamf.BaseEncoder} and L{pyamf.BaseDecoder}.
+
+    @ivar stream: The underlying data stream.
+    @type stream: L{BufferedByteStream<cpyamf.util.BufferedByteStream>}
+    @ivar context: The context for the en/decoding.
+    @ivar strict: Whether the codec should operate in 'strict' mode.
+    @type strict: C{bool}
+    @ivar timezone_offset: The offset from UTC for any datetime objects being
+        en/decoded. Default to C{None} means no offset.
+    @type timezone_offset: L{datetime.timedelta}
+    """
+
+    def __init__(self, stream=None, context=None, strict=False, timezone_offset=None):
+        if not isinstance(stream, cBufferedByteStream):
+            stream = util.BufferedByteStream(stream)
+
+        self.stream = stream
+
+        if context is None:
+            context = self.buildContext()
+
+        self.context = context
+        self.strict = strict
+        self.timezone_offset = timezone_offset
+
+    def buildContext(self):
+        """
+        Returns a new context instance for this codec. Overridden in subclass.
+        """
+        raise NotImplementedError
+
+
+cdef class Encoder(Codec):
+    """
+    Base class for the compiled encoders.
+
+    The function used to encode a given type is resolved once per class and
+    cached process-wide. L{pyamf.TYPE_MAP} is consulted first so that custom types take
+    precedence over the native handlers, as in L{pyamf.BaseEncoder}.
+    """
+
+    def __init__(self, *args, **kwargs):
+        Codec.__init__(self, *args, **kwargs)
+
+        self._func_cache = {}
+
+    cdef object getCustomTypeFunc(self, object data):
+        """
+        Returns the function registered with L{pyamf.add_type} for C{data},
+        otherwise C{None}.
+        """
+        for type_, func in pyamf.TYPE_MAP.iteritems():
+            try:
+                if isinstance(data, type_):
+                    return func
+            except TypeError:
+                if callable(type_) and type_(data):
+                    return func
+
+        return None
+
+    cdef object getTypeFunc(self, object data):
+        """
+        Returns the cached encoding function for the class of C{data}.
+
+        Resolution is shared between encoders of the same class through
+        L{pyamf.get_dispatch_table}; only the binding of custom type functions
+        to this encoder is cached per instance.
+        """
+        cdef object klass = type(data)
+        cdef object key
+        cdef object generation
+        cdef PyObject *ret
+
+        if klass is types.InstanceType:
+            klass = data.__class__
+
+        ret = PyDict_GetItem(self._func_cache, klass)
+
+        if ret != NULL:
+            return <object>ret
+
+        if pyamf.TYPE_MAP is not pyamf._dispatch_type_map:
+            pyamf._invalidate_dispatch_cache()
+
+        key = (type(self), klass)
+        ret = PyDict_GetItem(pyamf._dispatch_cache, key)
+
+        if ret != NULL:
+            func = <object>ret
+        else:
+            generation = pyamf._dispatch_generation
+            func = self.getCustomTypeFunc(data)
+
+            if func is None:
+                func = self.resolveType(data)
+
+            pyamf._cache_dispatch(key, func, generation)
+
+        if func is not None and PyInt_CheckExact(func) == 0:
+            func = pyamf.CustomTypeFunc(self, func)
+
+        self._func_cache[klass] = func
+
+        return func
+
+    cdef object resolveType(self, object data):
+        """
+        Returns the native encoding function (or type code) for C{data}, or
+        C{None} if C{data} cannot be encoded. Overridden in subclass.
+        """
+        return None
+
+    def writeFunc(self, obj, **kwargs):
+        """
+        Not possible to encode functions.
+
+        @raise EncodeError: Unable to encode function/methods.
+        """
+        raise pyamf.EncodeError("Unable to encode function/methods")
+
+    def writeClass(self, *args, **kwargs):
+        """
+        Classes cannot be serialised.
+        """
+        raise pyamf.EncodeError("Class objects cannot be serialised")
+
+
+cdef class Decoder(Codec):
+    """
+    Base class for the compiled decoders.
+    """
+
+    cdef object _readElement(self):
+        """
+        Reads an element from the data stream, restoring the position of the
+        stream if an C{IOError} is raised.
+
+        @raise EOStream: No more data left to decode.
+        """
+        cdef Py_ssize_t pos = self.stream.tell()
+        cdef unsigned char t
+
+        if self.stream.at_eof():
+            raise pyamf.EOStream
+
+        self.stream.read_uchar(&t)
+
+        try:
+            return self.readType(t)
+        except IOError:
+            self.stream.seek(pos)
+
+            raise
+
+    cdef object readType(self, unsigned char t):
+        """
+        Reads an element of type C{t} from the data stream. Overridden in
+        subclass.
+        """
+        raise NotImplementedError
+
+    def readElement(self):
+        """
+        Reads an element from the data stream.
+
+        @raise DecodeError: The ActionScript type is unsupported.
+        @raise EOStream: No more data left to decode.
+        """
+        return self._readElement()
+
+    def readProxy(self, obj, **kwargs):
+        """
+        Decodes a proxied object from the stream.
+        """
+        return self.context.getObjectForProxy(obj)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self._readElement()
+        except pyamf.EOStream:
+            raise StopIteration
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12 on Tue Jan 12 04:33:58 2010 */
+/* Generated by Cython 0.12.1 on Sat Oct 17 08:27:59 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -6,6 +6,7 @@
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #else
+
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
@@ -17,6 +18,7 @@
   #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
   #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   typedef int Py_ssize_t;
   #define PY_SSIZE_T_MAX INT_MAX
@@ -26,7 +28,9 @@
   #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
   #define PyNumber_Index(o)    PyNumber_Int(o)
   #define PyIndex_Check(o)     PyNumber_Check(o)
+  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
 #endif
+
 #if PY_VERSION_HEX < 0x02060000
   #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
   #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
@@ -36,17 +40,17 @@
   #define PyType_Modified(t)
 
   typedef struct {
-       void *buf;
-       PyObject *obj;
-       Py_ssize_t len;
-       Py_ssize_t itemsize;
-       int readonly;
-       int ndim;
-       char *format;
-       Py_ssize_t *shape;
-       Py_ssize_t *strides;
-       Py_ssize_t *suboffsets;
-       void *internal;
+     void *buf;
+     PyObject *obj;
+     Py_ssize_t len;
+     Py_ssize_t itemsize;
+     int readonly;
+     int ndim;
+     char *format;
+     Py_ssize_t *shape;
+     Py_ssize_t *strides;
+     Py_ssize_t *suboffsets;
+     void *internal;
   } Py_buffer;
 
   #define PyBUF_SIMPLE 0
@@ -60,18 +64,22 @@
   #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
 
 #endif
+
 #if PY_MAJOR_VERSION < 3
   #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define Py_TPFLAGS_CHECKTYPES 0
   #define Py_TPFLAGS_HAVE_INDEX 0
 #endif
+
 #if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
   #define Py_TPFLAGS_HAVE_NEWBUFFER 0
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyBaseString_Type            PyUnicode_Type
   #define PyString_Type                PyUnicode_Type
@@ -80,6 +88,7 @@
   #define PyBytes_Type                 PyString_Type
   #define PyBytes_CheckExact           PyString_CheckExact
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyInt_Type                   PyLong_Type
   #define PyInt_Check(op)              PyLong_Check(op)
@@ -99,10 +108,13 @@
 #else
   #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
   #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+
 #endif
+
 #if PY_MAJOR_VERSION >= 3
   #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
 #endif
+
 #if !defined(WIN32) && !defined(MS_WINDOWS)
   #ifndef __stdcall
     #define __stdcall
@@ -116,6 +128,7 @@
 #else
   #define _USE_MATH_DEFINES
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
   #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
@@ -125,6 +138,7 @@
   #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
   #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
 #endif
+
 #if PY_VERSION_HEX < 0x02050000
   #define __Pyx_NAMESTR(n) ((char *)(n))
   #define __Pyx_DOCSTR(n)  ((char *)(n))
@@ -142,12 +156,14 @@
 #include "stdlib.h"
 #include "stdio.h"
 
-#ifdef __GNUC__
-#define INLINE __inline__
-#elif _WIN32
-#define INLINE __inline
-#else
-#define INLINE 
+#ifndef CYTHON_INLINE
+  #if defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #else
+    #define CYTHON_INLINE 
+  #endif
 #endif
 
 typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
@@ -169,8 +185,8 @@ typedef struct {PyObject **p; char *s; const long n; const char* encoding; const
 #define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
 
 #define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
 
 #if !defined(T_PYSSIZET)
 #if PY_VERSION_HEX < 0x02050000
@@ -234,9 +250,9 @@ static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
 #endif
 #endif
 
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
 
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 
@@ -268,7 +284,7 @@ static const char **__pyx_f;
 
 /* Type declarations */
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":26
+/* "/root/package/cpyamf/util.pxd":32
  *     cdef int at_eof(self) except? -1
  *     cdef inline Py_ssize_t remaining(self) except? -1
  *     cdef int seek(self, Py_ssize_t pos, int mode=*) except? -1             # <<<<<<<<<<<<<<
@@ -281,7 +297,7 @@ struct __pyx_opt_args_6cpyamf_4util_19cBufferedByteStream_seek {
   int mode;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":60
+/* "/root/package/cpyamf/util.pxd":66
  * 
  * 
  * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
@@ -299,7 +315,7 @@ struct __pyx_obj_6cpyamf_4util_cIndexedCollection {
   Py_ssize_t length;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1719
+/* "/root/package/cpyamf/util.pyx":1947
  * 
  * 
  * cdef class IndexedCollection(cIndexedCollection):             # <<<<<<<<<<<<<<
@@ -311,7 +327,7 @@ struct __pyx_obj_6cpyamf_4util_IndexedCollection {
   struct __pyx_obj_6cpyamf_4util_cIndexedCollection __pyx_base;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":9
+/* "/root/package/cpyamf/util.pxd":9
  * 
  * 
  * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
@@ -328,9 +344,12 @@ struct __pyx_obj_6cpyamf_4util_cBufferedByteStream {
   Py_ssize_t pos;
   Py_ssize_t size;
   Py_ssize_t length;
+  int wrapped;
+  PyObject *_source;
+  PyObject *_export;
 };
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1014
+/* "/root/package/cpyamf/util.pyx":1175
  * 
  * 
  * cdef class BufferedByteStream(cBufferedByteStream):             # <<<<<<<<<<<<<<
@@ -343,7 +362,7 @@ struct __pyx_obj_6cpyamf_4util_BufferedByteStream {
 };
 
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1562
+/* "/root/package/cpyamf/util.pyx":1768
  * 
  * 
  * cdef class cIndexedCollection:             # <<<<<<<<<<<<<<
@@ -359,11 +378,12 @@ struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection {
   PyObject *(*getByReference)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
   Py_ssize_t (*getReferenceTo)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
   Py_ssize_t (*append)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *);
+  int (*truncate)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t);
 };
 static struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *__pyx_vtabptr_6cpyamf_4util_cIndexedCollection;
 
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1719
+/* "/root/package/cpyamf/util.pyx":1947
  * 
  * 
  * cdef class IndexedCollection(cIndexedCollection):             # <<<<<<<<<<<<<<
@@ -377,7 +397,7 @@ struct __pyx_vtabstruct_6cpyamf_4util_IndexedCollection {
 static struct __pyx_vtabstruct_6cpyamf_4util_IndexedCollection *__pyx_vtabptr_6cpyamf_4util_IndexedCollection;
 
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":247
+/* "/root/package/cpyamf/util.pyx":265
  * 
  * 
  * cdef class cBufferedByteStream:             # <<<<<<<<<<<<<<
@@ -386,6 +406,9 @@ static struct __pyx_vtabstruct_6cpyamf_4util_IndexedCollection *__pyx_vtabptr_6c
  */
 
 struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream {
+  int (*wrap)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *);
+  int (*_own)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
+  PyObject *(*read_view)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t);
   Py_ssize_t (*tell)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
   int (*close)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *);
   int (*write)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char *, Py_ssize_t);
@@ -431,7 +454,7 @@ struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream {
 static struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream;
 
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1014
+/* "/root/package/cpyamf/util.pyx":1175
  * 
  * 
  * cdef class BufferedByteStream(cBufferedByteStream):             # <<<<<<<<<<<<<<
@@ -493,7 +516,7 @@ static struct __pyx_vtabstruct_6cpyamf_4util_BufferedByteStream *__pyx_vtabptr_6
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
 
-static INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
     const char* function_name, int kw_allowed); /*proto*/
 
 static void __Pyx_RaiseDoubleKeywordsError(
@@ -501,7 +524,7 @@ static void __Pyx_RaiseDoubleKeywordsError(
 
 static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
 
-static INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
     if (likely(PyList_CheckExact(L))) {
         if (PyList_Append(L, x) < 0) return NULL;
         Py_INCREF(Py_None);
@@ -517,46 +540,46 @@ static INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
     }
 }
 
-static INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
 
 static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
 
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
 
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
 
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
 
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
 
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
 
-static INLINE char __Pyx_PyInt_AsChar(PyObject *);
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
 
-static INLINE short __Pyx_PyInt_AsShort(PyObject *);
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
 
-static INLINE int __Pyx_PyInt_AsInt(PyObject *);
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
 
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
 
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
 
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
 
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
 
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
 
-static INLINE long __Pyx_PyInt_AsLong(PyObject *);
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
 
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
 
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
 
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
 
 static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
 
@@ -584,48 +607,53 @@ static double __pyx_v_6cpyamf_4util_platform_neginf;
 static PyObject *__pyx_v_6cpyamf_4util_pyamf_NaN = 0;
 static PyObject *__pyx_v_6cpyamf_4util_pyamf_NegInf = 0;
 static PyObject *__pyx_v_6cpyamf_4util_pyamf_PosInf = 0;
+static PyObject *__pyx_v_6cpyamf_4util_buffer_types = 0;
 static int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void); /*proto*/
 static int __pyx_f_6cpyamf_4util_complete_import(void); /*proto*/
 static char __pyx_f_6cpyamf_4util_get_native_endian(void); /*proto*/
-static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char); /*proto*/
-static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char); /*proto*/
-static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *, Py_ssize_t); /*proto*/
 static int __pyx_f_6cpyamf_4util_is_broken_float(void); /*proto*/
 #define __Pyx_MODULE_NAME "cpyamf.util"
 int __pyx_module_is_main_cpyamf__util = 0;
 
 /* Implementation of cpyamf.util */
 static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_IOError;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_OverflowError;
-static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_NotImplementedError;
 static char __pyx_k_1[] = "pyamf.util";
-static char __pyx_k_2[] = "Buffer closed";
-static char __pyx_k_3[] = "Bad value for mode";
-static char __pyx_k_4[] = "integer out of range";
-static char __pyx_k_5[] = "";
-static char __pyx_k_6[] = "value must be Unicode or str";
-static char __pyx_k_7[] = "Unable to coerce buf->StringIO";
-static char __pyx_k_8[] = "String value expected";
-static char __pyx_k_9[] = "!";
-static char __pyx_k_10[] = "@";
-static char __pyx_k_11[] = "<";
-static char __pyx_k_12[] = ">";
-static char __pyx_k_13[] = "Not a valid endian type";
-static char __pyx_k_14[] = "expected int for x";
-static char __pyx_k_15[] = "Expecting float for val";
-static char __pyx_k_17[] = "Bad reference type";
-static char __pyx_k_18[] = "\nC-extension for L{pyamf.util} Python module in L{PyAMF<pyamf>}.\n\n@since: 0.4\n";
-static char __pyx_k_19[] = "\377\370\000\000\000\000\000\000";
-static char __pyx_k_20[] = "\377\360\000\000\000\000\000\000";
-static char __pyx_k_21[] = "\360\000\000\000\000\000\000";
+static char __pyx_k_2[] = "Unable to wrap a non-contiguous memoryview";
+static char __pyx_k_3[] = "Buffer closed";
+static char __pyx_k_4[] = "Bad value for mode";
+static char __pyx_k_5[] = "integer out of range";
+static char __pyx_k_6[] = "";
+static char __pyx_k_7[] = "value must be Unicode or str";
+static char __pyx_k_8[] = "Unable to coerce buf->StringIO";
+static char __pyx_k_9[] = "String value expected";
+static char __pyx_k_10[] = "!";
+static char __pyx_k_11[] = "@";
+static char __pyx_k_12[] = "<";
+static char __pyx_k_13[] = ">";
+static char __pyx_k_14[] = "Not a valid endian type";
+static char __pyx_k_15[] = "Expected a writable, contiguous buffer";
+static char __pyx_k_16[] = "expected int for x";
+static char __pyx_k_17[] = "Expecting float for val";
+static char __pyx_k_19[] = "Bad reference type";
+static char __pyx_k_20[] = "\nC-extension for L{pyamf.util} Python module in L{PyAMF<pyamf>}.\n\n@since: 0.4\n";
+static char __pyx_k_21[] = "\377\370\000\000\000\000\000\000";
+static char __pyx_k_22[] = "\377\360\000\000\000\000\000\000";
+static char __pyx_k_23[] = "\360\000\000\000\000\000\000";
 static char __pyx_k__id[] = "id";
 static char __pyx_k__NaN[] = "NaN";
 static char __pyx_k__buf[] = "buf";
+static char __pyx_k__len[] = "len";
 static char __pyx_k__pos[] = "pos";
+static char __pyx_k___own[] = "_own";
 static char __pyx_k___ref[] = "_ref";
 static char __pyx_k__data[] = "data";
 static char __pyx_k__mode[] = "mode";
@@ -636,6 +664,7 @@ static char __pyx_k__seek[] = "seek";
 static char __pyx_k__size[] = "size";
 static char __pyx_k__tell[] = "tell";
 static char __pyx_k__util[] = "util";
+static char __pyx_k__wrap[] = "wrap";
 static char __pyx_k__clear[] = "clear";
 static char __pyx_k__write[] = "write";
 static char __pyx_k__NegInf[] = "NegInf";
@@ -648,9 +677,13 @@ static char __pyx_k__length[] = "length";
 static char __pyx_k__strict[] = "strict";
 static char __pyx_k__IOError[] = "IOError";
 static char __pyx_k___endian[] = "_endian";
+static char __pyx_k___export[] = "_export";
+static char __pyx_k___source[] = "_source";
+static char __pyx_k__wrapped[] = "wrapped";
 static char __pyx_k____main__[] = "__main__";
 static char __pyx_k__getvalue[] = "getvalue";
 static char __pyx_k__pack_int[] = "pack_int";
+static char __pyx_k__readonly[] = "readonly";
 static char __pyx_k__use_hash[] = "use_hash";
 static char __pyx_k__TypeError[] = "TypeError";
 static char __pyx_k__pack_uint[] = "pack_uint";
@@ -659,6 +692,7 @@ static char __pyx_k__ValueError[] = "ValueError";
 static char __pyx_k__unpack_int[] = "unpack_int";
 static char __pyx_k__MemoryError[] = "MemoryError";
 static char __pyx_k__unpack_uint[] = "unpack_uint";
+static char __pyx_k__buffer_types[] = "buffer_types";
 static char __pyx_k__OverflowError[] = "OverflowError";
 static char __pyx_k__has_available[] = "has_available";
 static char __pyx_k___increase_size[] = "_increase_size";
@@ -671,10 +705,12 @@ static PyObject *__pyx_n_s_1;
 static PyObject *__pyx_kp_b_10;
 static PyObject *__pyx_kp_b_11;
 static PyObject *__pyx_kp_b_12;
-static PyObject *__pyx_kp_s_13;
+static PyObject *__pyx_kp_b_13;
 static PyObject *__pyx_kp_s_14;
 static PyObject *__pyx_kp_s_15;
+static PyObject *__pyx_kp_s_16;
 static PyObject *__pyx_kp_s_17;
+static PyObject *__pyx_kp_s_19;
 static PyObject *__pyx_kp_s_2;
 static PyObject *__pyx_kp_s_3;
 static PyObject *__pyx_kp_s_4;
@@ -682,7 +718,7 @@ static PyObject *__pyx_kp_s_5;
 static PyObject *__pyx_kp_s_6;
 static PyObject *__pyx_kp_s_7;
 static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_b_9;
+static PyObject *__pyx_kp_s_9;
 static PyObject *__pyx_n_s__IOError;
 static PyObject *__pyx_n_s__MemoryError;
 static PyObject *__pyx_n_s__NaN;
@@ -695,12 +731,16 @@ static PyObject *__pyx_n_s__ValueError;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s___clear;
 static PyObject *__pyx_n_s___endian;
+static PyObject *__pyx_n_s___export;
 static PyObject *__pyx_n_s___increase_buffer;
 static PyObject *__pyx_n_s___increase_size;
+static PyObject *__pyx_n_s___own;
 static PyObject *__pyx_n_s___ref;
+static PyObject *__pyx_n_s___source;
 static PyObject *__pyx_n_s__append;
 static PyObject *__pyx_n_s__buf;
 static PyObject *__pyx_n_s__buffer;
+static PyObject *__pyx_n_s__buffer_types;
 static PyObject *__pyx_n_s__clear;
 static PyObject *__pyx_n_s__closed;
 static PyObject *__pyx_n_s__complain_if_closed;
@@ -709,6 +749,7 @@ static PyObject *__pyx_n_s__getByReference;
 static PyObject *__pyx_n_s__getvalue;
 static PyObject *__pyx_n_s__has_available;
 static PyObject *__pyx_n_s__id;
+static PyObject *__pyx_n_s__len;
 static PyObject *__pyx_n_s__length;
 static PyObject *__pyx_n_s__mode;
 static PyObject *__pyx_n_s__pack_int;
@@ -716,6 +757,7 @@ static PyObject *__pyx_n_s__pack_uint;
 static PyObject *__pyx_n_s__peek;
 static PyObject *__pyx_n_s__pos;
 static PyObject *__pyx_n_s__read;
+static PyObject *__pyx_n_s__readonly;
 static PyObject *__pyx_n_s__refs;
 static PyObject *__pyx_n_s__remaining;
 static PyObject *__pyx_n_s__seek;
@@ -725,6 +767,8 @@ static PyObject *__pyx_n_s__unpack_int;
 static PyObject *__pyx_n_s__unpack_uint;
 static PyObject *__pyx_n_s__use_hash;
 static PyObject *__pyx_n_s__util;
+static PyObject *__pyx_n_s__wrap;
+static PyObject *__pyx_n_s__wrapped;
 static PyObject *__pyx_n_s__write;
 static PyObject *__pyx_n_s__write_utf8_string;
 static PyObject *__pyx_int_0;
@@ -732,9 +776,9 @@ static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_int_4294967295L;
-static PyObject *__pyx_k_16;
+static PyObject *__pyx_k_18;
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":100
+/* "/root/package/cpyamf/util.pyx":116
  * 
  * 
  * cdef int build_platform_exceptional_floats() except? -1:             # <<<<<<<<<<<<<<
@@ -749,7 +793,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("build_platform_exceptional_floats");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":104
+  /* "/root/package/cpyamf/util.pyx":120
  *     global system_nan, system_posinf, system_neginf
  * 
  *     cdef unsigned char *buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * sizeof(double))             # <<<<<<<<<<<<<<
@@ -758,7 +802,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   __pyx_v_buf = ((unsigned char *)PyMem_Malloc(((sizeof(unsigned char *)) * (sizeof(double)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":106
+  /* "/root/package/cpyamf/util.pyx":122
  *     cdef unsigned char *buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * sizeof(double))
  * 
  *     if buf == NULL:             # <<<<<<<<<<<<<<
@@ -768,7 +812,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   __pyx_t_1 = (__pyx_v_buf == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":107
+    /* "/root/package/cpyamf/util.pyx":123
  * 
  *     if buf == NULL:
  *         raise MemoryError             # <<<<<<<<<<<<<<
@@ -776,12 +820,12 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  *     memcpy(buf, NaN, 8)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":109
+  /* "/root/package/cpyamf/util.pyx":125
  *         raise MemoryError
  * 
  *     memcpy(buf, NaN, 8)             # <<<<<<<<<<<<<<
@@ -790,7 +834,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy(__pyx_v_buf, __pyx_v_6cpyamf_4util_NaN, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":111
+  /* "/root/package/cpyamf/util.pyx":127
  *     memcpy(buf, NaN, 8)
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -800,19 +844,19 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   __pyx_t_1 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN));
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":112
+    /* "/root/package/cpyamf/util.pyx":128
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):
  *         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *     memcpy(&system_nan, buf, 8)
  */
-    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L4;
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":114
+  /* "/root/package/cpyamf/util.pyx":130
  *         swap_bytes(buf, 8)
  * 
  *     memcpy(&system_nan, buf, 8)             # <<<<<<<<<<<<<<
@@ -821,7 +865,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy((&__pyx_v_6cpyamf_4util_system_nan), __pyx_v_buf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":116
+  /* "/root/package/cpyamf/util.pyx":132
  *     memcpy(&system_nan, buf, 8)
  * 
  *     memcpy(buf, NegInf, 8)             # <<<<<<<<<<<<<<
@@ -830,7 +874,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy(__pyx_v_buf, __pyx_v_6cpyamf_4util_NegInf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":118
+  /* "/root/package/cpyamf/util.pyx":134
  *     memcpy(buf, NegInf, 8)
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -840,19 +884,19 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   __pyx_t_1 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN));
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":119
+    /* "/root/package/cpyamf/util.pyx":135
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):
  *         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *     memcpy(&system_neginf, buf, 8)
  */
-    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":121
+  /* "/root/package/cpyamf/util.pyx":137
  *         swap_bytes(buf, 8)
  * 
  *     memcpy(&system_neginf, buf, 8)             # <<<<<<<<<<<<<<
@@ -861,7 +905,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy((&__pyx_v_6cpyamf_4util_system_neginf), __pyx_v_buf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":123
+  /* "/root/package/cpyamf/util.pyx":139
  *     memcpy(&system_neginf, buf, 8)
  * 
  *     memcpy(buf, PosInf, 8)             # <<<<<<<<<<<<<<
@@ -870,7 +914,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy(__pyx_v_buf, __pyx_v_6cpyamf_4util_PosInf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":125
+  /* "/root/package/cpyamf/util.pyx":141
  *     memcpy(buf, PosInf, 8)
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -880,19 +924,19 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   __pyx_t_1 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN));
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":126
+    /* "/root/package/cpyamf/util.pyx":142
  * 
  *     if not is_big_endian(SYSTEM_ENDIAN):
  *         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *     memcpy(&system_posinf, buf, 8)
  */
-    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":128
+  /* "/root/package/cpyamf/util.pyx":144
  *         swap_bytes(buf, 8)
  * 
  *     memcpy(&system_posinf, buf, 8)             # <<<<<<<<<<<<<<
@@ -901,7 +945,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
   memcpy((&__pyx_v_6cpyamf_4util_system_posinf), __pyx_v_buf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":130
+  /* "/root/package/cpyamf/util.pyx":146
  *     memcpy(&system_posinf, buf, 8)
  * 
  *     if float_broken == 1:             # <<<<<<<<<<<<<<
@@ -911,7 +955,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   __pyx_t_1 = (__pyx_v_6cpyamf_4util_float_broken == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":131
+    /* "/root/package/cpyamf/util.pyx":147
  * 
  *     if float_broken == 1:
  *         if _PyFloat_Unpack8(<unsigned char *>&NaN, not is_big_endian(SYSTEM_ENDIAN)) == -1:             # <<<<<<<<<<<<<<
@@ -921,7 +965,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     __pyx_t_1 = (_PyFloat_Unpack8(((unsigned char *)(&__pyx_v_6cpyamf_4util_NaN)), (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN))) == -1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":132
+      /* "/root/package/cpyamf/util.pyx":148
  *     if float_broken == 1:
  *         if _PyFloat_Unpack8(<unsigned char *>&NaN, not is_big_endian(SYSTEM_ENDIAN)) == -1:
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -930,7 +974,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
       PyMem_Free(__pyx_v_buf);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":134
+      /* "/root/package/cpyamf/util.pyx":150
  *             PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -943,7 +987,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     }
     __pyx_L8:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":136
+    /* "/root/package/cpyamf/util.pyx":152
  *             return -1
  * 
  *         memcpy(&platform_nan, buf, 8)             # <<<<<<<<<<<<<<
@@ -952,7 +996,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
     memcpy((&__pyx_v_6cpyamf_4util_platform_nan), __pyx_v_buf, 8);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":138
+    /* "/root/package/cpyamf/util.pyx":154
  *         memcpy(&platform_nan, buf, 8)
  * 
  *         if _PyFloat_Unpack8(<unsigned char *>&PosInf, not is_big_endian(SYSTEM_ENDIAN)) == -1:             # <<<<<<<<<<<<<<
@@ -962,7 +1006,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     __pyx_t_1 = (_PyFloat_Unpack8(((unsigned char *)(&__pyx_v_6cpyamf_4util_PosInf)), (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN))) == -1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":139
+      /* "/root/package/cpyamf/util.pyx":155
  * 
  *         if _PyFloat_Unpack8(<unsigned char *>&PosInf, not is_big_endian(SYSTEM_ENDIAN)) == -1:
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -971,7 +1015,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
       PyMem_Free(__pyx_v_buf);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":141
+      /* "/root/package/cpyamf/util.pyx":157
  *             PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -984,7 +1028,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     }
     __pyx_L9:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":143
+    /* "/root/package/cpyamf/util.pyx":159
  *             return -1
  * 
  *         memcpy(&platform_posinf, buf, 8)             # <<<<<<<<<<<<<<
@@ -993,7 +1037,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
     memcpy((&__pyx_v_6cpyamf_4util_platform_posinf), __pyx_v_buf, 8);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":145
+    /* "/root/package/cpyamf/util.pyx":161
  *         memcpy(&platform_posinf, buf, 8)
  * 
  *         if _PyFloat_Unpack8(<unsigned char *>&NegInf, not is_big_endian(SYSTEM_ENDIAN)) == -1:             # <<<<<<<<<<<<<<
@@ -1003,7 +1047,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     __pyx_t_1 = (_PyFloat_Unpack8(((unsigned char *)(&__pyx_v_6cpyamf_4util_NegInf)), (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN))) == -1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":146
+      /* "/root/package/cpyamf/util.pyx":162
  * 
  *         if _PyFloat_Unpack8(<unsigned char *>&NegInf, not is_big_endian(SYSTEM_ENDIAN)) == -1:
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -1012,7 +1056,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
  */
       PyMem_Free(__pyx_v_buf);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":148
+      /* "/root/package/cpyamf/util.pyx":164
  *             PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -1025,7 +1069,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
     }
     __pyx_L10:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":150
+    /* "/root/package/cpyamf/util.pyx":166
  *             return -1
  * 
  *         memcpy(&platform_neginf, buf, 8)             # <<<<<<<<<<<<<<
@@ -1037,7 +1081,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   }
   __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":152
+  /* "/root/package/cpyamf/util.pyx":168
  *         memcpy(&platform_neginf, buf, 8)
  * 
  *     PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -1056,7 +1100,7 @@ static  int __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(void) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":155
+/* "/root/package/cpyamf/util.pyx":171
  * 
  * 
  * cdef int complete_import() except? -1:             # <<<<<<<<<<<<<<
@@ -1075,8 +1119,8 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   __pyx_v_SYSTEM_ENDIAN = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_pyamf = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":163
- *     global pyamf_NaN, pyamf_NegInf, pyamf_PosInf
+  /* "/root/package/cpyamf/util.pyx":179
+ *     global pyamf_NaN, pyamf_NegInf, pyamf_PosInf, buffer_types
  * 
  *     complete_init = 1             # <<<<<<<<<<<<<<
  * 
@@ -1084,30 +1128,30 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
  */
   __pyx_v_6cpyamf_4util_complete_init = 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":165
+  /* "/root/package/cpyamf/util.pyx":181
  *     complete_init = 1
  * 
  *     SYSTEM_ENDIAN = get_native_endian()             # <<<<<<<<<<<<<<
  * 
  *     if is_broken_float():
  */
-  __pyx_t_1 = PyInt_FromLong(__pyx_f_6cpyamf_4util_get_native_endian()); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(__pyx_f_6cpyamf_4util_get_native_endian()); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_SYSTEM_ENDIAN);
   __pyx_v_SYSTEM_ENDIAN = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":167
+  /* "/root/package/cpyamf/util.pyx":183
  *     SYSTEM_ENDIAN = get_native_endian()
  * 
  *     if is_broken_float():             # <<<<<<<<<<<<<<
  *         float_broken = 1
  * 
  */
-  __pyx_t_2 = __pyx_f_6cpyamf_4util_is_broken_float(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_6cpyamf_4util_is_broken_float(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":168
+    /* "/root/package/cpyamf/util.pyx":184
  * 
  *     if is_broken_float():
  *         float_broken = 1             # <<<<<<<<<<<<<<
@@ -1119,38 +1163,38 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":170
+  /* "/root/package/cpyamf/util.pyx":186
  *         float_broken = 1
  * 
  *     build_platform_exceptional_floats()             # <<<<<<<<<<<<<<
  * 
  *     import pyamf.util
  */
-  __pyx_t_2 = __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_6cpyamf_4util_build_platform_exceptional_floats(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":172
+  /* "/root/package/cpyamf/util.pyx":188
  *     build_platform_exceptional_floats()
  * 
  *     import pyamf.util             # <<<<<<<<<<<<<<
  * 
  *     pyamf_NaN = pyamf.util.NaN
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s_1), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s_1), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_pyamf);
   __pyx_v_pyamf = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":174
+  /* "/root/package/cpyamf/util.pyx":190
  *     import pyamf.util
  * 
  *     pyamf_NaN = pyamf.util.NaN             # <<<<<<<<<<<<<<
  *     pyamf_NegInf = pyamf.util.NegInf
  *     pyamf_PosInf = pyamf.util.PosInf
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__NaN); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__NaN); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_GOTREF(__pyx_v_6cpyamf_4util_pyamf_NaN);
@@ -1159,16 +1203,16 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   __pyx_v_6cpyamf_4util_pyamf_NaN = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":175
+  /* "/root/package/cpyamf/util.pyx":191
  * 
  *     pyamf_NaN = pyamf.util.NaN
  *     pyamf_NegInf = pyamf.util.NegInf             # <<<<<<<<<<<<<<
  *     pyamf_PosInf = pyamf.util.PosInf
  * 
  */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__NegInf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__NegInf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_GOTREF(__pyx_v_6cpyamf_4util_pyamf_NegInf);
@@ -1177,16 +1221,16 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   __pyx_v_6cpyamf_4util_pyamf_NegInf = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":176
+  /* "/root/package/cpyamf/util.pyx":192
  *     pyamf_NaN = pyamf.util.NaN
  *     pyamf_NegInf = pyamf.util.NegInf
  *     pyamf_PosInf = pyamf.util.PosInf             # <<<<<<<<<<<<<<
  * 
- *     return 0
+ *     buffer_types = pyamf.util.buffer_types
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__PosInf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__PosInf); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_GOTREF(__pyx_v_6cpyamf_4util_pyamf_PosInf);
@@ -1195,9 +1239,27 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   __pyx_v_6cpyamf_4util_pyamf_PosInf = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":178
+  /* "/root/package/cpyamf/util.pyx":194
  *     pyamf_PosInf = pyamf.util.PosInf
  * 
+ *     buffer_types = pyamf.util.buffer_types             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_pyamf, __pyx_n_s__util); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__buffer_types); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GOTREF(__pyx_v_6cpyamf_4util_buffer_types);
+  __Pyx_DECREF(__pyx_v_6cpyamf_4util_buffer_types);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_v_6cpyamf_4util_buffer_types = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/util.pyx":196
+ *     buffer_types = pyamf.util.buffer_types
+ * 
  *     return 0             # <<<<<<<<<<<<<<
  * 
  * 
@@ -1219,7 +1281,7 @@ static  int __pyx_f_6cpyamf_4util_complete_import(void) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":181
+/* "/root/package/cpyamf/util.pyx":199
  * 
  * 
  * cdef char get_native_endian():             # <<<<<<<<<<<<<<
@@ -1234,7 +1296,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_native_endian");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":187
+  /* "/root/package/cpyamf/util.pyx":205
  *     @return: Either L{ENDIAN_LITTLE} or L{ENDIAN_BIG}
  *     """
  *     cdef unsigned int one = 1             # <<<<<<<<<<<<<<
@@ -1243,7 +1305,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
  */
   __pyx_v_one = 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":188
+  /* "/root/package/cpyamf/util.pyx":206
  *     """
  *     cdef unsigned int one = 1
  *     cdef int big_endian = (<char*>&one)[0] != 1             # <<<<<<<<<<<<<<
@@ -1252,7 +1314,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
  */
   __pyx_v_big_endian = ((((char *)(&__pyx_v_one))[0]) != 1);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":190
+  /* "/root/package/cpyamf/util.pyx":208
  *     cdef int big_endian = (<char*>&one)[0] != 1
  * 
  *     if big_endian == 1:             # <<<<<<<<<<<<<<
@@ -1262,7 +1324,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
   __pyx_t_1 = (__pyx_v_big_endian == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":191
+    /* "/root/package/cpyamf/util.pyx":209
  * 
  *     if big_endian == 1:
  *         return ENDIAN_BIG             # <<<<<<<<<<<<<<
@@ -1275,7 +1337,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":193
+    /* "/root/package/cpyamf/util.pyx":211
  *         return ENDIAN_BIG
  *     else:
  *         return ENDIAN_LITTLE             # <<<<<<<<<<<<<<
@@ -1293,7 +1355,7 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":196
+/* "/root/package/cpyamf/util.pyx":214
  * 
  * 
  * cdef inline int is_big_endian(char endian):             # <<<<<<<<<<<<<<
@@ -1301,14 +1363,14 @@ static  char __pyx_f_6cpyamf_4util_get_native_endian(void) {
  *     Returns a boolean value whether the supplied C{endian} is big.
  */
 
-static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
   int __pyx_r;
   int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
   __Pyx_RefNannySetupContext("is_big_endian");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":200
+  /* "/root/package/cpyamf/util.pyx":218
  *     Returns a boolean value whether the supplied C{endian} is big.
  *     """
  *     if endian == ENDIAN_NATIVE:             # <<<<<<<<<<<<<<
@@ -1318,7 +1380,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
   __pyx_t_1 = (__pyx_v_endian == '@');
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":201
+    /* "/root/package/cpyamf/util.pyx":219
  *     """
  *     if endian == ENDIAN_NATIVE:
  *         return SYSTEM_ENDIAN == ENDIAN_BIG             # <<<<<<<<<<<<<<
@@ -1331,7 +1393,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":203
+  /* "/root/package/cpyamf/util.pyx":221
  *         return SYSTEM_ENDIAN == ENDIAN_BIG
  * 
  *     return endian == ENDIAN_NETWORK or endian == ENDIAN_BIG             # <<<<<<<<<<<<<<
@@ -1354,7 +1416,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":206
+/* "/root/package/cpyamf/util.pyx":224
  * 
  * 
  * cdef inline int is_native_endian(char endian):             # <<<<<<<<<<<<<<
@@ -1362,12 +1424,12 @@ static INLINE int __pyx_f_6cpyamf_4util_is_big_endian(char __pyx_v_endian) {
  *         return 1
  */
 
-static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   int __pyx_r;
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("is_native_endian");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":207
+  /* "/root/package/cpyamf/util.pyx":225
  * 
  * cdef inline int is_native_endian(char endian):
  *     if endian == ENDIAN_NATIVE:             # <<<<<<<<<<<<<<
@@ -1377,7 +1439,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   __pyx_t_1 = (__pyx_v_endian == '@');
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":208
+    /* "/root/package/cpyamf/util.pyx":226
  * cdef inline int is_native_endian(char endian):
  *     if endian == ENDIAN_NATIVE:
  *         return 1             # <<<<<<<<<<<<<<
@@ -1390,7 +1452,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":210
+  /* "/root/package/cpyamf/util.pyx":228
  *         return 1
  * 
  *     if endian == ENDIAN_NETWORK:             # <<<<<<<<<<<<<<
@@ -1400,7 +1462,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   __pyx_t_1 = (__pyx_v_endian == '!');
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":211
+    /* "/root/package/cpyamf/util.pyx":229
  * 
  *     if endian == ENDIAN_NETWORK:
  *         endian = ENDIAN_BIG             # <<<<<<<<<<<<<<
@@ -1412,7 +1474,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":213
+  /* "/root/package/cpyamf/util.pyx":231
  *         endian = ENDIAN_BIG
  * 
  *     return endian == SYSTEM_ENDIAN             # <<<<<<<<<<<<<<
@@ -1428,7 +1490,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":216
+/* "/root/package/cpyamf/util.pyx":234
  * 
  * 
  * cdef inline int swap_bytes(unsigned char *buffer, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -1436,7 +1498,7 @@ static INLINE int __pyx_f_6cpyamf_4util_is_native_endian(char __pyx_v_endian) {
  * 
  */
 
-static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer, Py_ssize_t __pyx_v_size) {
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer, Py_ssize_t __pyx_v_size) {
   unsigned char *__pyx_v_buf;
   Py_ssize_t __pyx_v_i;
   int __pyx_r;
@@ -1444,7 +1506,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
   Py_ssize_t __pyx_t_2;
   __Pyx_RefNannySetupContext("swap_bytes");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":217
+  /* "/root/package/cpyamf/util.pyx":235
  * 
  * cdef inline int swap_bytes(unsigned char *buffer, Py_ssize_t size) except? -1:
  *     cdef unsigned char *buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * size)             # <<<<<<<<<<<<<<
@@ -1453,7 +1515,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
  */
   __pyx_v_buf = ((unsigned char *)PyMem_Malloc(((sizeof(unsigned char *)) * __pyx_v_size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":219
+  /* "/root/package/cpyamf/util.pyx":237
  *     cdef unsigned char *buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * size)
  * 
  *     if buf == NULL:             # <<<<<<<<<<<<<<
@@ -1463,7 +1525,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
   __pyx_t_1 = (__pyx_v_buf == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":220
+    /* "/root/package/cpyamf/util.pyx":238
  * 
  *     if buf == NULL:
  *         raise MemoryError             # <<<<<<<<<<<<<<
@@ -1471,12 +1533,12 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
  *     cdef Py_ssize_t i
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":224
+  /* "/root/package/cpyamf/util.pyx":242
  *     cdef Py_ssize_t i
  * 
  *     for i from 0 <= i < size:             # <<<<<<<<<<<<<<
@@ -1486,7 +1548,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
   __pyx_t_2 = __pyx_v_size;
   for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":225
+    /* "/root/package/cpyamf/util.pyx":243
  * 
  *     for i from 0 <= i < size:
  *         buf[i] = buffer[size - i - 1]             # <<<<<<<<<<<<<<
@@ -1496,7 +1558,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
     (__pyx_v_buf[__pyx_v_i]) = (__pyx_v_buffer[((__pyx_v_size - __pyx_v_i) - 1)]);
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":227
+  /* "/root/package/cpyamf/util.pyx":245
  *         buf[i] = buffer[size - i - 1]
  * 
  *     memcpy(buffer, buf, size)             # <<<<<<<<<<<<<<
@@ -1505,7 +1567,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
  */
   memcpy(__pyx_v_buffer, __pyx_v_buf, __pyx_v_size);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":228
+  /* "/root/package/cpyamf/util.pyx":246
  * 
  *     memcpy(buffer, buf, size)
  *     PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -1514,7 +1576,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":230
+  /* "/root/package/cpyamf/util.pyx":248
  *     PyMem_Free(buf)
  * 
  *     return 0             # <<<<<<<<<<<<<<
@@ -1534,7 +1596,7 @@ static INLINE int __pyx_f_6cpyamf_4util_swap_bytes(unsigned char *__pyx_v_buffer
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":233
+/* "/root/package/cpyamf/util.pyx":251
  * 
  * 
  * cdef int is_broken_float() except? -1:             # <<<<<<<<<<<<<<
@@ -1550,7 +1612,7 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("is_broken_float");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":234
+  /* "/root/package/cpyamf/util.pyx":252
  * 
  * cdef int is_broken_float() except? -1:
  *     cdef double test = _PyFloat_Unpack8(NaN, 0)             # <<<<<<<<<<<<<<
@@ -1559,7 +1621,7 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
  */
   __pyx_v_test = _PyFloat_Unpack8(__pyx_v_6cpyamf_4util_NaN, 0);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":237
+  /* "/root/package/cpyamf/util.pyx":255
  * 
  *     cdef int result
  *     cdef unsigned char *buf = <unsigned char *>&test             # <<<<<<<<<<<<<<
@@ -1568,7 +1630,7 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
  */
   __pyx_v_buf = ((unsigned char *)(&__pyx_v_test));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":239
+  /* "/root/package/cpyamf/util.pyx":257
  *     cdef unsigned char *buf = <unsigned char *>&test
  * 
  *     if is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -1578,19 +1640,19 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
   __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":240
+    /* "/root/package/cpyamf/util.pyx":258
  * 
  *     if is_big_endian(SYSTEM_ENDIAN):
  *         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *     result = memcmp(NaN, buf, 8)
  */
-    __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":242
+  /* "/root/package/cpyamf/util.pyx":260
  *         swap_bytes(buf, 8)
  * 
  *     result = memcmp(NaN, buf, 8)             # <<<<<<<<<<<<<<
@@ -1599,7 +1661,7 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
  */
   __pyx_v_result = memcmp(__pyx_v_6cpyamf_4util_NaN, __pyx_v_buf, 8);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":244
+  /* "/root/package/cpyamf/util.pyx":262
  *     result = memcmp(NaN, buf, 8)
  * 
  *     return result != 0             # <<<<<<<<<<<<<<
@@ -1619,7 +1681,7 @@ static  int __pyx_f_6cpyamf_4util_is_broken_float(void) {
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":248
+/* "/root/package/cpyamf/util.pyx":266
  * 
  * cdef class cBufferedByteStream:
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1638,7 +1700,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
   if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":249
+  /* "/root/package/cpyamf/util.pyx":267
  * cdef class cBufferedByteStream:
  *     def __cinit__(self):
  *         if complete_init == 0:             # <<<<<<<<<<<<<<
@@ -1648,19 +1710,19 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
   __pyx_t_1 = (__pyx_v_6cpyamf_4util_complete_init == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":250
+    /* "/root/package/cpyamf/util.pyx":268
  *     def __cinit__(self):
  *         if complete_init == 0:
  *             complete_import()             # <<<<<<<<<<<<<<
  * 
  *         self._endian = ENDIAN_NETWORK
  */
-    __pyx_t_2 = __pyx_f_6cpyamf_4util_complete_import(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_6cpyamf_4util_complete_import(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":252
+  /* "/root/package/cpyamf/util.pyx":270
  *             complete_import()
  * 
  *         self._endian = ENDIAN_NETWORK             # <<<<<<<<<<<<<<
@@ -1669,7 +1731,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->_endian = '!';
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":253
+  /* "/root/package/cpyamf/util.pyx":271
  * 
  *         self._endian = ENDIAN_NETWORK
  *         self.pos = 0             # <<<<<<<<<<<<<<
@@ -1678,7 +1740,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->pos = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":254
+  /* "/root/package/cpyamf/util.pyx":272
  *         self._endian = ENDIAN_NETWORK
  *         self.pos = 0
  *         self.length = 0             # <<<<<<<<<<<<<<
@@ -1687,7 +1749,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->length = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":255
+  /* "/root/package/cpyamf/util.pyx":273
  *         self.pos = 0
  *         self.length = 0
  *         self.size = 1024             # <<<<<<<<<<<<<<
@@ -1696,7 +1758,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->size = 1024;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":256
+  /* "/root/package/cpyamf/util.pyx":274
  *         self.length = 0
  *         self.size = 1024
  *         self.closed = 0             # <<<<<<<<<<<<<<
@@ -1705,7 +1767,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->closed = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":258
+  /* "/root/package/cpyamf/util.pyx":276
  *         self.closed = 0
  * 
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
@@ -1714,7 +1776,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->buffer = ((char *)PyMem_Malloc(((sizeof(char *)) * ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":260
+  /* "/root/package/cpyamf/util.pyx":278
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)
  * 
  *         if self.buffer == NULL:             # <<<<<<<<<<<<<<
@@ -1724,7 +1786,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
   __pyx_t_1 = (((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->buffer == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":261
+    /* "/root/package/cpyamf/util.pyx":279
  * 
  *         if self.buffer == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -1732,7 +1794,7 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
  *     def __dealloc__(self):
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
@@ -1748,33 +1810,41 @@ static int __pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(PyObject *__py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":263
+/* "/root/package/cpyamf/util.pyx":281
  *             raise MemoryError
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.buffer != NULL:
+ *         if self.buffer != NULL and self.wrapped == 0:
  *             PyMem_Free(self.buffer)
  */
 
 static void __pyx_pf_6cpyamf_4util_19cBufferedByteStream___dealloc__(PyObject *__pyx_v_self); /*proto*/
 static void __pyx_pf_6cpyamf_4util_19cBufferedByteStream___dealloc__(PyObject *__pyx_v_self) {
   int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
   __Pyx_RefNannySetupContext("__dealloc__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":264
+  /* "/root/package/cpyamf/util.pyx":282
  * 
  *     def __dealloc__(self):
- *         if self.buffer != NULL:             # <<<<<<<<<<<<<<
+ *         if self.buffer != NULL and self.wrapped == 0:             # <<<<<<<<<<<<<<
  *             PyMem_Free(self.buffer)
  * 
  */
   __pyx_t_1 = (((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->buffer != NULL);
   if (__pyx_t_1) {
+    __pyx_t_2 = (((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->wrapped == 0);
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":265
+    /* "/root/package/cpyamf/util.pyx":283
  *     def __dealloc__(self):
- *         if self.buffer != NULL:
+ *         if self.buffer != NULL and self.wrapped == 0:
  *             PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
  * 
  *         self.buffer = NULL
@@ -1784,12 +1854,12 @@ static void __pyx_pf_6cpyamf_4util_19cBufferedByteStream___dealloc__(PyObject *_
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":267
+  /* "/root/package/cpyamf/util.pyx":285
  *             PyMem_Free(self.buffer)
  * 
  *         self.buffer = NULL             # <<<<<<<<<<<<<<
  * 
- *     cdef int close(self) except? -1:
+ *     cdef int wrap(self, object buf) except? -1:
  */
   ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)->buffer = NULL;
 
@@ -1797,244 +1867,778 @@ static void __pyx_pf_6cpyamf_4util_19cBufferedByteStream___dealloc__(PyObject *_
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":269
+/* "/root/package/cpyamf/util.pyx":287
  *         self.buffer = NULL
  * 
- *     cdef int close(self) except? -1:             # <<<<<<<<<<<<<<
- *         self.closed = 1
- * 
+ *     cdef int wrap(self, object buf) except? -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Points the stream at the memory of C{buf}, which must support the
  */
 
-static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_close(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_wrap(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, PyObject *__pyx_v_buf) {
+  void *__pyx_v_ptr;
+  Py_ssize_t __pyx_v_size;
+  Py_buffer *__pyx_v_view;
+  PyObject *__pyx_v_export;
   int __pyx_r;
-  __Pyx_RefNannySetupContext("close");
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":270
- * 
- *     cdef int close(self) except? -1:
- *         self.closed = 1             # <<<<<<<<<<<<<<
- * 
- *         return 0
- */
-  __pyx_v_self->closed = 1;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("wrap");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_buf);
+  __pyx_v_export = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":272
- *         self.closed = 1
- * 
- *         return 0             # <<<<<<<<<<<<<<
- * 
- *     cdef inline int complain_if_closed(self) except? -1:
+  /* "/root/package/cpyamf/util.pyx":298
+ *         object it is a view of, so both are copied instead.
+ *         """
+ *         cdef void *ptr = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = 0
+ *         cdef Py_buffer *view
  */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  __pyx_v_ptr = NULL;
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":274
- *         return 0
- * 
- *     cdef inline int complain_if_closed(self) except? -1:             # <<<<<<<<<<<<<<
- *         if self.closed == 1:
- *             raise IOError('Buffer closed')
+  /* "/root/package/cpyamf/util.pyx":299
+ *         """
+ *         cdef void *ptr = NULL
+ *         cdef Py_ssize_t size = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_buffer *view
+ *         cdef object export
  */
+  __pyx_v_size = 0;
 
-static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_complain_if_closed(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
-  int __pyx_r;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("complain_if_closed");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":275
- * 
- *     cdef inline int complain_if_closed(self) except? -1:
- *         if self.closed == 1:             # <<<<<<<<<<<<<<
- *             raise IOError('Buffer closed')
+  /* "/root/package/cpyamf/util.pyx":303
+ *         cdef object export
  * 
+ *         if PyMemoryView_Check(buf):             # <<<<<<<<<<<<<<
+ *             export = buf
+ *         elif PyObject_CheckBuffer(buf) and not PyBuffer_Check(buf):
  */
-  __pyx_t_1 = (__pyx_v_self->closed == 1);
+  __pyx_t_1 = PyMemoryView_Check(__pyx_v_buf);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":276
- *     cdef inline int complain_if_closed(self) except? -1:
- *         if self.closed == 1:
- *             raise IOError('Buffer closed')             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/util.pyx":304
  * 
- *         return 0
+ *         if PyMemoryView_Check(buf):
+ *             export = buf             # <<<<<<<<<<<<<<
+ *         elif PyObject_CheckBuffer(buf) and not PyBuffer_Check(buf):
+ *             export = PyMemoryView_FromObject(buf)
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_2));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_IOError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(__pyx_v_buf);
+    __Pyx_DECREF(__pyx_v_export);
+    __pyx_v_export = __pyx_v_buf;
     goto __pyx_L3;
   }
-  __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":278
- *             raise IOError('Buffer closed')
- * 
- *         return 0             # <<<<<<<<<<<<<<
- * 
- *     cdef inline Py_ssize_t tell(self) except? -1:
+  /* "/root/package/cpyamf/util.pyx":305
+ *         if PyMemoryView_Check(buf):
+ *             export = buf
+ *         elif PyObject_CheckBuffer(buf) and not PyBuffer_Check(buf):             # <<<<<<<<<<<<<<
+ *             export = PyMemoryView_FromObject(buf)
+ *         else:
  */
-  __pyx_r = 0;
-  goto __pyx_L0;
+  __pyx_t_1 = PyObject_CheckBuffer(__pyx_v_buf);
+  if (__pyx_t_1) {
+    __pyx_t_2 = (!PyBuffer_Check(__pyx_v_buf));
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
 
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.complain_if_closed");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "/root/package/cpyamf/util.pyx":306
+ *             export = buf
+ *         elif PyObject_CheckBuffer(buf) and not PyBuffer_Check(buf):
+ *             export = PyMemoryView_FromObject(buf)             # <<<<<<<<<<<<<<
+ *         else:
+ *             if PyObject_AsReadBuffer(buf, &ptr, &size) == -1:
+ */
+    __pyx_t_4 = PyMemoryView_FromObject(__pyx_v_buf); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_export);
+    __pyx_v_export = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":280
- *         return 0
+    /* "/root/package/cpyamf/util.pyx":308
+ *             export = PyMemoryView_FromObject(buf)
+ *         else:
+ *             if PyObject_AsReadBuffer(buf, &ptr, &size) == -1:             # <<<<<<<<<<<<<<
+ *                 return -1
  * 
- *     cdef inline Py_ssize_t tell(self) except? -1:             # <<<<<<<<<<<<<<
- *         """
- *         Returns the position of the stream pointer.
  */
+    __pyx_t_1 = PyObject_AsReadBuffer(__pyx_v_buf, (&__pyx_v_ptr), (&__pyx_v_size)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = (__pyx_t_1 == -1);
+    if (__pyx_t_3) {
 
-static INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_tell(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
-  Py_ssize_t __pyx_r;
-  __Pyx_RefNannySetupContext("tell");
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":284
- *         Returns the position of the stream pointer.
- *         """
- *         return self.pos             # <<<<<<<<<<<<<<
+      /* "/root/package/cpyamf/util.pyx":309
+ *         else:
+ *             if PyObject_AsReadBuffer(buf, &ptr, &size) == -1:
+ *                 return -1             # <<<<<<<<<<<<<<
  * 
- *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
+ *             if self.write(<char *>ptr, size) == -1:
  */
-  __pyx_r = __pyx_v_self->pos;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      __pyx_r = -1;
+      goto __pyx_L0;
+      goto __pyx_L4;
+    }
+    __pyx_L4:;
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":286
- *         return self.pos
+    /* "/root/package/cpyamf/util.pyx":311
+ *                 return -1
+ * 
+ *             if self.write(<char *>ptr, size) == -1:             # <<<<<<<<<<<<<<
+ *                 return -1
  * 
- *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
- *         cdef unsigned long new_len = self.length + size
- *         cdef unsigned long current_size = self.size
  */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((char *)__pyx_v_ptr), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 311; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = (__pyx_t_1 == -1);
+    if (__pyx_t_3) {
 
-static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream__increase_buffer(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, Py_ssize_t __pyx_v_size) {
-  unsigned long __pyx_v_new_len;
-  unsigned long __pyx_v_current_size;
-  int __pyx_r;
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("_increase_buffer");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":287
+      /* "/root/package/cpyamf/util.pyx":312
  * 
- *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
- *         cdef unsigned long new_len = self.length + size             # <<<<<<<<<<<<<<
- *         cdef unsigned long current_size = self.size
+ *             if self.write(<char *>ptr, size) == -1:
+ *                 return -1             # <<<<<<<<<<<<<<
  * 
+ *             self.pos = 0
  */
-  __pyx_v_new_len = (__pyx_v_self->length + __pyx_v_size);
+      __pyx_r = -1;
+      goto __pyx_L0;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":288
- *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
- *         cdef unsigned long new_len = self.length + size
- *         cdef unsigned long current_size = self.size             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/util.pyx":314
+ *                 return -1
  * 
- *         while new_len > current_size:
+ *             self.pos = 0             # <<<<<<<<<<<<<<
+ * 
+ *             return 0
  */
-  __pyx_v_current_size = __pyx_v_self->size;
+    __pyx_v_self->pos = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":290
- *         cdef unsigned long current_size = self.size
+    /* "/root/package/cpyamf/util.pyx":316
+ *             self.pos = 0
  * 
- *         while new_len > current_size:             # <<<<<<<<<<<<<<
- *             current_size *= 2
+ *             return 0             # <<<<<<<<<<<<<<
  * 
+ *         view = PyMemoryView_GET_BUFFER(export)
  */
-  while (1) {
-    __pyx_t_1 = (__pyx_v_new_len > __pyx_v_current_size);
-    if (!__pyx_t_1) break;
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":291
+  /* "/root/package/cpyamf/util.pyx":318
+ *             return 0
  * 
- *         while new_len > current_size:
- *             current_size *= 2             # <<<<<<<<<<<<<<
+ *         view = PyMemoryView_GET_BUFFER(export)             # <<<<<<<<<<<<<<
  * 
- *         if current_size != self.size:
+ *         if not PyBuffer_IsContiguous(view, c'C'):
  */
-    __pyx_v_current_size *= 2;
-  }
+  __pyx_v_view = PyMemoryView_GET_BUFFER(__pyx_v_export);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":293
- *             current_size *= 2
+  /* "/root/package/cpyamf/util.pyx":320
+ *         view = PyMemoryView_GET_BUFFER(export)
  * 
- *         if current_size != self.size:             # <<<<<<<<<<<<<<
- *             self.size = current_size
+ *         if not PyBuffer_IsContiguous(view, c'C'):             # <<<<<<<<<<<<<<
+ *             raise TypeError('Unable to wrap a non-contiguous memoryview')
  * 
  */
-  __pyx_t_1 = (__pyx_v_current_size != __pyx_v_self->size);
-  if (__pyx_t_1) {
+  __pyx_t_3 = (!PyBuffer_IsContiguous(__pyx_v_view, 'C'));
+  if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":294
+    /* "/root/package/cpyamf/util.pyx":321
  * 
- *         if current_size != self.size:
- *             self.size = current_size             # <<<<<<<<<<<<<<
+ *         if not PyBuffer_IsContiguous(view, c'C'):
+ *             raise TypeError('Unable to wrap a non-contiguous memoryview')             # <<<<<<<<<<<<<<
  * 
- *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)
+ *         ptr = view.buf
  */
-    __pyx_v_self->size = __pyx_v_current_size;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_2));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":296
- *             self.size = current_size
+  /* "/root/package/cpyamf/util.pyx":323
+ *             raise TypeError('Unable to wrap a non-contiguous memoryview')
  * 
- *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
+ *         ptr = view.buf             # <<<<<<<<<<<<<<
+ *         size = view.len
  * 
- *             if self.buffer == NULL:
  */
-    __pyx_v_self->buffer = ((char *)PyMem_Realloc(__pyx_v_self->buffer, ((sizeof(char *)) * __pyx_v_self->size)));
+  __pyx_v_ptr = __pyx_v_view->buf;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":298
- *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)
+  /* "/root/package/cpyamf/util.pyx":324
  * 
- *             if self.buffer == NULL:             # <<<<<<<<<<<<<<
- *                 raise MemoryError
+ *         ptr = view.buf
+ *         size = view.len             # <<<<<<<<<<<<<<
  * 
+ *         if self.wrapped == 0 and self.buffer != NULL:
  */
-    __pyx_t_1 = (__pyx_v_self->buffer == NULL);
-    if (__pyx_t_1) {
+  __pyx_v_size = __pyx_v_view->len;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":299
+  /* "/root/package/cpyamf/util.pyx":326
+ *         size = view.len
  * 
- *             if self.buffer == NULL:
- *                 raise MemoryError             # <<<<<<<<<<<<<<
+ *         if self.wrapped == 0 and self.buffer != NULL:             # <<<<<<<<<<<<<<
+ *             PyMem_Free(self.buffer)
  * 
- *         return 0
+ */
+  __pyx_t_3 = (__pyx_v_self->wrapped == 0);
+  if (__pyx_t_3) {
+    __pyx_t_2 = (__pyx_v_self->buffer != NULL);
+    __pyx_t_6 = __pyx_t_2;
+  } else {
+    __pyx_t_6 = __pyx_t_3;
+  }
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/util.pyx":327
+ * 
+ *         if self.wrapped == 0 and self.buffer != NULL:
+ *             PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
+ * 
+ *         self.buffer = <char *>ptr
+ */
+    PyMem_Free(__pyx_v_self->buffer);
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/util.pyx":329
+ *             PyMem_Free(self.buffer)
+ * 
+ *         self.buffer = <char *>ptr             # <<<<<<<<<<<<<<
+ *         self.size = size
+ *         self.length = size
+ */
+  __pyx_v_self->buffer = ((char *)__pyx_v_ptr);
+
+  /* "/root/package/cpyamf/util.pyx":330
+ * 
+ *         self.buffer = <char *>ptr
+ *         self.size = size             # <<<<<<<<<<<<<<
+ *         self.length = size
+ *         self.pos = 0
+ */
+  __pyx_v_self->size = __pyx_v_size;
+
+  /* "/root/package/cpyamf/util.pyx":331
+ *         self.buffer = <char *>ptr
+ *         self.size = size
+ *         self.length = size             # <<<<<<<<<<<<<<
+ *         self.pos = 0
+ *         self._source = buf
+ */
+  __pyx_v_self->length = __pyx_v_size;
+
+  /* "/root/package/cpyamf/util.pyx":332
+ *         self.size = size
+ *         self.length = size
+ *         self.pos = 0             # <<<<<<<<<<<<<<
+ *         self._source = buf
+ *         self._export = export
+ */
+  __pyx_v_self->pos = 0;
+
+  /* "/root/package/cpyamf/util.pyx":333
+ *         self.length = size
+ *         self.pos = 0
+ *         self._source = buf             # <<<<<<<<<<<<<<
+ *         self._export = export
+ *         self.wrapped = 1
+ */
+  __Pyx_INCREF(__pyx_v_buf);
+  __Pyx_GIVEREF(__pyx_v_buf);
+  __Pyx_GOTREF(__pyx_v_self->_source);
+  __Pyx_DECREF(__pyx_v_self->_source);
+  __pyx_v_self->_source = __pyx_v_buf;
+
+  /* "/root/package/cpyamf/util.pyx":334
+ *         self.pos = 0
+ *         self._source = buf
+ *         self._export = export             # <<<<<<<<<<<<<<
+ *         self.wrapped = 1
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_export);
+  __Pyx_GIVEREF(__pyx_v_export);
+  __Pyx_GOTREF(__pyx_v_self->_export);
+  __Pyx_DECREF(__pyx_v_self->_export);
+  __pyx_v_self->_export = __pyx_v_export;
+
+  /* "/root/package/cpyamf/util.pyx":335
+ *         self._source = buf
+ *         self._export = export
+ *         self.wrapped = 1             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  __pyx_v_self->wrapped = 1;
+
+  /* "/root/package/cpyamf/util.pyx":337
+ *         self.wrapped = 1
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _own(self) except? -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.wrap");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_export);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_buf);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":339
+ *         return 0
+ * 
+ *     cdef int _own(self) except? -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Replaces a wrapped buffer with a private, writable copy.
+ */
+
+static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream__own(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+  Py_ssize_t __pyx_v_size;
+  char *__pyx_v_buf;
+  int __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_own");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/util.pyx":343
+ *         Replaces a wrapped buffer with a private, writable copy.
+ *         """
+ *         cdef Py_ssize_t size = 1024             # <<<<<<<<<<<<<<
+ *         cdef char *buf
+ * 
+ */
+  __pyx_v_size = 1024;
+
+  /* "/root/package/cpyamf/util.pyx":346
+ *         cdef char *buf
+ * 
+ *         if self.wrapped == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_self->wrapped == 0);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":347
+ * 
+ *         if self.wrapped == 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         while size < self.length:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":349
+ *             return 0
+ * 
+ *         while size < self.length:             # <<<<<<<<<<<<<<
+ *             size *= 2
+ * 
+ */
+  while (1) {
+    __pyx_t_1 = (__pyx_v_size < __pyx_v_self->length);
+    if (!__pyx_t_1) break;
+
+    /* "/root/package/cpyamf/util.pyx":350
+ * 
+ *         while size < self.length:
+ *             size *= 2             # <<<<<<<<<<<<<<
+ * 
+ *         buf = <char *>PyMem_Malloc(sizeof(char *) * size)
+ */
+    __pyx_v_size *= 2;
+  }
+
+  /* "/root/package/cpyamf/util.pyx":352
+ *             size *= 2
+ * 
+ *         buf = <char *>PyMem_Malloc(sizeof(char *) * size)             # <<<<<<<<<<<<<<
+ * 
+ *         if buf == NULL:
+ */
+  __pyx_v_buf = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_size)));
+
+  /* "/root/package/cpyamf/util.pyx":354
+ *         buf = <char *>PyMem_Malloc(sizeof(char *) * size)
+ * 
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_buf == NULL);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":355
+ * 
+ *         if buf == NULL:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ * 
+ *         memcpy(buf, self.buffer, self.length)
+ */
+    __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/util.pyx":357
+ *             raise MemoryError
+ * 
+ *         memcpy(buf, self.buffer, self.length)             # <<<<<<<<<<<<<<
+ * 
+ *         self.buffer = buf
+ */
+  memcpy(__pyx_v_buf, __pyx_v_self->buffer, __pyx_v_self->length);
+
+  /* "/root/package/cpyamf/util.pyx":359
+ *         memcpy(buf, self.buffer, self.length)
+ * 
+ *         self.buffer = buf             # <<<<<<<<<<<<<<
+ *         self.size = size
+ *         self._source = None
+ */
+  __pyx_v_self->buffer = __pyx_v_buf;
+
+  /* "/root/package/cpyamf/util.pyx":360
+ * 
+ *         self.buffer = buf
+ *         self.size = size             # <<<<<<<<<<<<<<
+ *         self._source = None
+ *         self._export = None
+ */
+  __pyx_v_self->size = __pyx_v_size;
+
+  /* "/root/package/cpyamf/util.pyx":361
+ *         self.buffer = buf
+ *         self.size = size
+ *         self._source = None             # <<<<<<<<<<<<<<
+ *         self._export = None
+ *         self.wrapped = 0
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_source);
+  __Pyx_DECREF(__pyx_v_self->_source);
+  __pyx_v_self->_source = Py_None;
+
+  /* "/root/package/cpyamf/util.pyx":362
+ *         self.size = size
+ *         self._source = None
+ *         self._export = None             # <<<<<<<<<<<<<<
+ *         self.wrapped = 0
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_export);
+  __Pyx_DECREF(__pyx_v_self->_export);
+  __pyx_v_self->_export = Py_None;
+
+  /* "/root/package/cpyamf/util.pyx":363
+ *         self._source = None
+ *         self._export = None
+ *         self.wrapped = 0             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  __pyx_v_self->wrapped = 0;
+
+  /* "/root/package/cpyamf/util.pyx":365
+ *         self.wrapped = 0
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int close(self) except? -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream._own");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":367
+ *         return 0
+ * 
+ *     cdef int close(self) except? -1:             # <<<<<<<<<<<<<<
+ *         self.closed = 1
+ * 
+ */
+
+static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_close(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannySetupContext("close");
+
+  /* "/root/package/cpyamf/util.pyx":368
+ * 
+ *     cdef int close(self) except? -1:
+ *         self.closed = 1             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  __pyx_v_self->closed = 1;
+
+  /* "/root/package/cpyamf/util.pyx":370
+ *         self.closed = 1
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int complain_if_closed(self) except? -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":372
+ *         return 0
+ * 
+ *     cdef inline int complain_if_closed(self) except? -1:             # <<<<<<<<<<<<<<
+ *         if self.closed == 1:
+ *             raise IOError('Buffer closed')
+ */
+
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_complain_if_closed(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("complain_if_closed");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/util.pyx":373
+ * 
+ *     cdef inline int complain_if_closed(self) except? -1:
+ *         if self.closed == 1:             # <<<<<<<<<<<<<<
+ *             raise IOError('Buffer closed')
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_self->closed == 1);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":374
+ *     cdef inline int complain_if_closed(self) except? -1:
+ *         if self.closed == 1:
+ *             raise IOError('Buffer closed')             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_3));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_IOError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":376
+ *             raise IOError('Buffer closed')
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline Py_ssize_t tell(self) except? -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.complain_if_closed");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":378
+ *         return 0
+ * 
+ *     cdef inline Py_ssize_t tell(self) except? -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the position of the stream pointer.
+ */
+
+static CYTHON_INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_tell(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannySetupContext("tell");
+
+  /* "/root/package/cpyamf/util.pyx":382
+ *         Returns the position of the stream pointer.
+ *         """
+ *         return self.pos             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
+ */
+  __pyx_r = __pyx_v_self->pos;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":384
+ *         return self.pos
+ * 
+ *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
+ *         cdef unsigned long new_len = self.length + size
+ *         cdef unsigned long current_size = self.size
+ */
+
+static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream__increase_buffer(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, Py_ssize_t __pyx_v_size) {
+  unsigned long __pyx_v_new_len;
+  unsigned long __pyx_v_current_size;
+  int __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_increase_buffer");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/util.pyx":385
+ * 
+ *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
+ *         cdef unsigned long new_len = self.length + size             # <<<<<<<<<<<<<<
+ *         cdef unsigned long current_size = self.size
+ * 
+ */
+  __pyx_v_new_len = (__pyx_v_self->length + __pyx_v_size);
+
+  /* "/root/package/cpyamf/util.pyx":386
+ *     cdef int _increase_buffer(self, Py_ssize_t size) except? -1:
+ *         cdef unsigned long new_len = self.length + size
+ *         cdef unsigned long current_size = self.size             # <<<<<<<<<<<<<<
+ * 
+ *         while new_len > current_size:
+ */
+  __pyx_v_current_size = __pyx_v_self->size;
+
+  /* "/root/package/cpyamf/util.pyx":388
+ *         cdef unsigned long current_size = self.size
+ * 
+ *         while new_len > current_size:             # <<<<<<<<<<<<<<
+ *             current_size *= 2
+ * 
+ */
+  while (1) {
+    __pyx_t_1 = (__pyx_v_new_len > __pyx_v_current_size);
+    if (!__pyx_t_1) break;
+
+    /* "/root/package/cpyamf/util.pyx":389
+ * 
+ *         while new_len > current_size:
+ *             current_size *= 2             # <<<<<<<<<<<<<<
+ * 
+ *         if current_size != self.size:
+ */
+    __pyx_v_current_size *= 2;
+  }
+
+  /* "/root/package/cpyamf/util.pyx":391
+ *             current_size *= 2
+ * 
+ *         if current_size != self.size:             # <<<<<<<<<<<<<<
+ *             self.size = current_size
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_current_size != __pyx_v_self->size);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":392
+ * 
+ *         if current_size != self.size:
+ *             self.size = current_size             # <<<<<<<<<<<<<<
+ * 
+ *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)
+ */
+    __pyx_v_self->size = __pyx_v_current_size;
+
+    /* "/root/package/cpyamf/util.pyx":394
+ *             self.size = current_size
+ * 
+ *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
+ * 
+ *             if self.buffer == NULL:
+ */
+    __pyx_v_self->buffer = ((char *)PyMem_Realloc(__pyx_v_self->buffer, ((sizeof(char *)) * __pyx_v_self->size)));
+
+    /* "/root/package/cpyamf/util.pyx":396
+ *             self.buffer = <char *>PyMem_Realloc(self.buffer, sizeof(char *) * self.size)
+ * 
+ *             if self.buffer == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_self->buffer == NULL);
+    if (__pyx_t_1) {
+
+      /* "/root/package/cpyamf/util.pyx":397
+ * 
+ *             if self.buffer == NULL:
+ *                 raise MemoryError             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
  */
       __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -2042,7 +2646,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream__increase_buffer(struct
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":301
+  /* "/root/package/cpyamf/util.pyx":399
  *                 raise MemoryError
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -2063,7 +2667,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream__increase_buffer(struct
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":303
+/* "/root/package/cpyamf/util.pyx":401
  *         return 0
  * 
  *     cdef int write(self, char *buf, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -2075,21 +2679,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   int __pyx_r;
   int __pyx_t_1;
   int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
   __Pyx_RefNannySetupContext("write");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":307
+  /* "/root/package/cpyamf/util.pyx":405
  *         Writes the content of the specified C{buf} into this buffer.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":308
+    /* "/root/package/cpyamf/util.pyx":406
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2102,7 +2708,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":310
+  /* "/root/package/cpyamf/util.pyx":408
  *             return -1
  * 
  *         if size == 0:             # <<<<<<<<<<<<<<
@@ -2112,12 +2718,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   __pyx_t_2 = (__pyx_v_size == 0);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":311
+    /* "/root/package/cpyamf/util.pyx":409
  * 
  *         if size == 0:
  *             return 0             # <<<<<<<<<<<<<<
  * 
- *         if self._increase_buffer(size) == -1:
+ *         if self.wrapped == 1 and self._own() == -1:
  */
     __pyx_r = 0;
     goto __pyx_L0;
@@ -2125,23 +2731,29 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":313
+  /* "/root/package/cpyamf/util.pyx":411
  *             return 0
  * 
- *         if self._increase_buffer(size) == -1:             # <<<<<<<<<<<<<<
+ *         if self.wrapped == 1 and self._own() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->_increase_buffer(__pyx_v_self, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = (__pyx_t_1 == -1);
+  __pyx_t_2 = (__pyx_v_self->wrapped == 1);
   if (__pyx_t_2) {
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->_own(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = (__pyx_t_1 == -1);
+    __pyx_t_4 = __pyx_t_3;
+  } else {
+    __pyx_t_4 = __pyx_t_2;
+  }
+  if (__pyx_t_4) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":314
+    /* "/root/package/cpyamf/util.pyx":412
  * 
- *         if self._increase_buffer(size) == -1:
+ *         if self.wrapped == 1 and self._own() == -1:
  *             return -1             # <<<<<<<<<<<<<<
  * 
- *         memcpy(self.buffer + self.pos, buf, size)
+ *         if self._increase_buffer(size) == -1:
  */
     __pyx_r = -1;
     goto __pyx_L0;
@@ -2149,7 +2761,31 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":316
+  /* "/root/package/cpyamf/util.pyx":414
+ *             return -1
+ * 
+ *         if self._increase_buffer(size) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->_increase_buffer(__pyx_v_self, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = (__pyx_t_1 == -1);
+  if (__pyx_t_4) {
+
+    /* "/root/package/cpyamf/util.pyx":415
+ * 
+ *         if self._increase_buffer(size) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         memcpy(self.buffer + self.pos, buf, size)
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/util.pyx":417
  *             return -1
  * 
  *         memcpy(self.buffer + self.pos, buf, size)             # <<<<<<<<<<<<<<
@@ -2158,17 +2794,17 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
  */
   memcpy((__pyx_v_self->buffer + __pyx_v_self->pos), __pyx_v_buf, __pyx_v_size);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":318
+  /* "/root/package/cpyamf/util.pyx":419
  *         memcpy(self.buffer + self.pos, buf, size)
  * 
  *         if self.pos + size > self.length:             # <<<<<<<<<<<<<<
  *             self.length = self.pos + size
  * 
  */
-  __pyx_t_2 = ((__pyx_v_self->pos + __pyx_v_size) > __pyx_v_self->length);
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((__pyx_v_self->pos + __pyx_v_size) > __pyx_v_self->length);
+  if (__pyx_t_4) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":319
+    /* "/root/package/cpyamf/util.pyx":420
  * 
  *         if self.pos + size > self.length:
  *             self.length = self.pos + size             # <<<<<<<<<<<<<<
@@ -2176,11 +2812,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
  *         self.pos += size
  */
     __pyx_v_self->length = (__pyx_v_self->pos + __pyx_v_size);
-    goto __pyx_L6;
+    goto __pyx_L7;
   }
-  __pyx_L6:;
+  __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":321
+  /* "/root/package/cpyamf/util.pyx":422
  *             self.length = self.pos + size
  * 
  *         self.pos += size             # <<<<<<<<<<<<<<
@@ -2189,7 +2825,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
  */
   __pyx_v_self->pos += __pyx_v_size;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":323
+  /* "/root/package/cpyamf/util.pyx":424
  *         self.pos += size
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -2210,7 +2846,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":325
+/* "/root/package/cpyamf/util.pyx":426
  *         return 0
  * 
  *     cdef inline int has_available(self, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -2218,13 +2854,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write(struct __pyx_obj_6
  *             return 0
  */
 
-static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, Py_ssize_t __pyx_v_size) {
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, Py_ssize_t __pyx_v_size) {
   int __pyx_r;
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("has_available");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":326
+  /* "/root/package/cpyamf/util.pyx":427
  * 
  *     cdef inline int has_available(self, Py_ssize_t size) except? -1:
  *         if size == 0:             # <<<<<<<<<<<<<<
@@ -2234,7 +2870,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
   __pyx_t_1 = (__pyx_v_size == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":327
+    /* "/root/package/cpyamf/util.pyx":428
  *     cdef inline int has_available(self, Py_ssize_t size) except? -1:
  *         if size == 0:
  *             return 0             # <<<<<<<<<<<<<<
@@ -2247,7 +2883,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":329
+  /* "/root/package/cpyamf/util.pyx":430
  *             return 0
  * 
  *         if self.length == self.pos:             # <<<<<<<<<<<<<<
@@ -2257,7 +2893,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
   __pyx_t_1 = (__pyx_v_self->length == __pyx_v_self->pos);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":330
+    /* "/root/package/cpyamf/util.pyx":431
  * 
  *         if self.length == self.pos:
  *             raise IOError             # <<<<<<<<<<<<<<
@@ -2265,12 +2901,12 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
  *         if self.pos + size > self.length:
  */
     __Pyx_Raise(__pyx_builtin_IOError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L4;
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":332
+  /* "/root/package/cpyamf/util.pyx":433
  *             raise IOError
  * 
  *         if self.pos + size > self.length:             # <<<<<<<<<<<<<<
@@ -2280,7 +2916,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
   __pyx_t_1 = ((__pyx_v_self->pos + __pyx_v_size) > __pyx_v_self->length);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":333
+    /* "/root/package/cpyamf/util.pyx":434
  * 
  *         if self.pos + size > self.length:
  *             if size == 1:             # <<<<<<<<<<<<<<
@@ -2290,7 +2926,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
     __pyx_t_1 = (__pyx_v_size == 1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":334
+      /* "/root/package/cpyamf/util.pyx":435
  *         if self.pos + size > self.length:
  *             if size == 1:
  *                 raise IOError             # <<<<<<<<<<<<<<
@@ -2298,12 +2934,12 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
  *             raise IOError
  */
       __Pyx_Raise(__pyx_builtin_IOError, 0, 0);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":336
+    /* "/root/package/cpyamf/util.pyx":437
  *                 raise IOError
  * 
  *             raise IOError             # <<<<<<<<<<<<<<
@@ -2311,12 +2947,12 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
  *         return 0
  */
     __Pyx_Raise(__pyx_builtin_IOError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":338
+  /* "/root/package/cpyamf/util.pyx":439
  *             raise IOError
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -2337,7 +2973,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_has_available(stru
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":340
+/* "/root/package/cpyamf/util.pyx":441
  *         return 0
  * 
  *     cdef int read(self, char **buf, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -2353,18 +2989,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   __Pyx_RefNannySetupContext("read");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":345
+  /* "/root/package/cpyamf/util.pyx":446
  *         the specified byte array of specified length.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":346
+    /* "/root/package/cpyamf/util.pyx":447
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2377,7 +3013,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":348
+  /* "/root/package/cpyamf/util.pyx":449
  *             return -1
  * 
  *         if size == -1:             # <<<<<<<<<<<<<<
@@ -2387,17 +3023,17 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   __pyx_t_2 = (__pyx_v_size == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":349
+    /* "/root/package/cpyamf/util.pyx":450
  * 
  *         if size == -1:
  *             size = self.remaining()             # <<<<<<<<<<<<<<
  * 
  *             if size == 0:
  */
-    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->remaining(__pyx_v_self); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->remaining(__pyx_v_self); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_size = __pyx_t_3;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":351
+    /* "/root/package/cpyamf/util.pyx":452
  *             size = self.remaining()
  * 
  *             if size == 0:             # <<<<<<<<<<<<<<
@@ -2407,7 +3043,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
     __pyx_t_2 = (__pyx_v_size == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":352
+      /* "/root/package/cpyamf/util.pyx":453
  * 
  *             if size == 0:
  *                 size = 1             # <<<<<<<<<<<<<<
@@ -2422,18 +3058,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":354
+  /* "/root/package/cpyamf/util.pyx":455
  *                 size = 1
  * 
  *         if self.has_available(size) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":355
+    /* "/root/package/cpyamf/util.pyx":456
  * 
  *         if self.has_available(size) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2446,7 +3082,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":357
+  /* "/root/package/cpyamf/util.pyx":458
  *             return -1
  * 
  *         buf[0] = <char *>PyMem_Malloc(sizeof(char *) * size)             # <<<<<<<<<<<<<<
@@ -2455,7 +3091,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
  */
   (__pyx_v_buf[0]) = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":359
+  /* "/root/package/cpyamf/util.pyx":460
  *         buf[0] = <char *>PyMem_Malloc(sizeof(char *) * size)
  * 
  *         if buf[0] == NULL:             # <<<<<<<<<<<<<<
@@ -2465,7 +3101,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   __pyx_t_2 = ((__pyx_v_buf[0]) == NULL);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":360
+    /* "/root/package/cpyamf/util.pyx":461
  * 
  *         if buf[0] == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -2473,9 +3109,9 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
  *             return -1
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":362
+    /* "/root/package/cpyamf/util.pyx":463
  *             raise MemoryError
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -2488,7 +3124,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   }
   __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":364
+  /* "/root/package/cpyamf/util.pyx":465
  *             return -1
  * 
  *         memcpy(buf[0], self.buffer + self.pos, size)             # <<<<<<<<<<<<<<
@@ -2497,7 +3133,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
  */
   memcpy((__pyx_v_buf[0]), (__pyx_v_self->buffer + __pyx_v_self->pos), __pyx_v_size);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":365
+  /* "/root/package/cpyamf/util.pyx":466
  * 
  *         memcpy(buf[0], self.buffer + self.pos, size)
  *         self.pos += size             # <<<<<<<<<<<<<<
@@ -2506,12 +3142,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
  */
   __pyx_v_self->pos += __pyx_v_size;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":367
+  /* "/root/package/cpyamf/util.pyx":468
  *         self.pos += size
  * 
  *         return 0             # <<<<<<<<<<<<<<
  * 
- *     cdef inline int at_eof(self) except? -1:
+ *     cdef object read_view(self, Py_ssize_t size):
  */
   __pyx_r = 0;
   goto __pyx_L0;
@@ -2527,33 +3163,220 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read(struct __pyx_obj_6c
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":369
+/* "/root/package/cpyamf/util.pyx":470
  *         return 0
  * 
+ *     cdef object read_view(self, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads C{size} bytes from the stream, returning a C{memoryview} onto
+ */
+
+static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_view(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, Py_ssize_t __pyx_v_size) {
+  Py_ssize_t __pyx_v_pos;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("read_view");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+
+  /* "/root/package/cpyamf/util.pyx":475
+ *         the wrapped buffer if there is one (see L{wrap}), otherwise a copy.
+ *         """
+ *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":476
+ *         """
+ *         if self.complain_if_closed() == -1:
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         if size == -1:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":478
+ *             return None
+ * 
+ *         if size == -1:             # <<<<<<<<<<<<<<
+ *             size = self.remaining()
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_size == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":479
+ * 
+ *         if size == -1:
+ *             size = self.remaining()             # <<<<<<<<<<<<<<
+ * 
+ *             if size == 0:
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->remaining(__pyx_v_self); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_size = __pyx_t_3;
+
+    /* "/root/package/cpyamf/util.pyx":481
+ *             size = self.remaining()
+ * 
+ *             if size == 0:             # <<<<<<<<<<<<<<
+ *                 size = 1
+ * 
+ */
+    __pyx_t_2 = (__pyx_v_size == 0);
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/util.pyx":482
+ * 
+ *             if size == 0:
+ *                 size = 1             # <<<<<<<<<<<<<<
+ * 
+ *         if self.has_available(size) == -1:
+ */
+      __pyx_v_size = 1;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/util.pyx":484
+ *                 size = 1
+ * 
+ *         if self.has_available(size) == -1:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 484; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":485
+ * 
+ *         if self.has_available(size) == -1:
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         cdef Py_ssize_t pos = self.pos
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/util.pyx":487
+ *             return None
+ * 
+ *         cdef Py_ssize_t pos = self.pos             # <<<<<<<<<<<<<<
+ * 
+ *         self.pos += size
+ */
+  __pyx_v_pos = __pyx_v_self->pos;
+
+  /* "/root/package/cpyamf/util.pyx":489
+ *         cdef Py_ssize_t pos = self.pos
+ * 
+ *         self.pos += size             # <<<<<<<<<<<<<<
+ * 
+ *         if self.wrapped == 0:
+ */
+  __pyx_v_self->pos += __pyx_v_size;
+
+  /* "/root/package/cpyamf/util.pyx":491
+ *         self.pos += size
+ * 
+ *         if self.wrapped == 0:             # <<<<<<<<<<<<<<
+ *             return PyString_FromStringAndSize(self.buffer + pos, size)
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_self->wrapped == 0);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":492
+ * 
+ *         if self.wrapped == 0:
+ *             return PyString_FromStringAndSize(self.buffer + pos, size)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._export[pos:pos + size]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_4 = PyString_FromStringAndSize((__pyx_v_self->buffer + __pyx_v_pos), __pyx_v_size); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/util.pyx":494
+ *             return PyString_FromStringAndSize(self.buffer + pos, size)
+ * 
+ *         return self._export[pos:pos + size]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int at_eof(self) except? -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PySequence_GetSlice(__pyx_v_self->_export, __pyx_v_pos, (__pyx_v_pos + __pyx_v_size)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.read_view");
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":496
+ *         return self._export[pos:pos + size]
+ * 
  *     cdef inline int at_eof(self) except? -1:             # <<<<<<<<<<<<<<
  *         """
  *         Returns C{True} if the internal pointer is at the end of the stream.
  */
 
-static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_at_eof(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+static CYTHON_INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_at_eof(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
   int __pyx_r;
   int __pyx_t_1;
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("at_eof");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":375
+  /* "/root/package/cpyamf/util.pyx":502
  *         @rtype: C{bool}
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 502; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":376
+    /* "/root/package/cpyamf/util.pyx":503
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2566,7 +3389,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_at_eof(struct __py
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":378
+  /* "/root/package/cpyamf/util.pyx":505
  *             return -1
  * 
  *         return self.length == self.pos             # <<<<<<<<<<<<<<
@@ -2587,7 +3410,7 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_at_eof(struct __py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":380
+/* "/root/package/cpyamf/util.pyx":507
  *         return self.length == self.pos
  * 
  *     cdef inline Py_ssize_t remaining(self) except? -1:             # <<<<<<<<<<<<<<
@@ -2595,25 +3418,25 @@ static INLINE int __pyx_f_6cpyamf_4util_19cBufferedByteStream_at_eof(struct __py
  *         Returns number of remaining bytes.
  */
 
-static INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_remaining(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
+static CYTHON_INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_remaining(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self) {
   Py_ssize_t __pyx_r;
   int __pyx_t_1;
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("remaining");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":384
+  /* "/root/package/cpyamf/util.pyx":511
  *         Returns number of remaining bytes.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":385
+    /* "/root/package/cpyamf/util.pyx":512
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2626,7 +3449,7 @@ static INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_remaining(s
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":387
+  /* "/root/package/cpyamf/util.pyx":514
  *             return -1
  * 
  *         return self.length - self.pos             # <<<<<<<<<<<<<<
@@ -2647,7 +3470,7 @@ static INLINE Py_ssize_t __pyx_f_6cpyamf_4util_19cBufferedByteStream_remaining(s
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":389
+/* "/root/package/cpyamf/util.pyx":516
  *         return self.length - self.pos
  * 
  *     cdef int seek(self, Py_ssize_t pos, int mode=0) except? -1:             # <<<<<<<<<<<<<<
@@ -2672,18 +3495,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
   }
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":399
+  /* "/root/package/cpyamf/util.pyx":526
  *         @type mode: C{int}
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":400
+    /* "/root/package/cpyamf/util.pyx":527
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -2696,7 +3519,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":402
+  /* "/root/package/cpyamf/util.pyx":529
  *             return -1
  * 
  *         if mode == 0:             # <<<<<<<<<<<<<<
@@ -2706,7 +3529,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
   switch (__pyx_v_mode) {
     case 0:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":403
+    /* "/root/package/cpyamf/util.pyx":530
  * 
  *         if mode == 0:
  *             if pos < 0 or pos > self.length:             # <<<<<<<<<<<<<<
@@ -2722,23 +3545,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     }
     if (__pyx_t_4) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":404
+      /* "/root/package/cpyamf/util.pyx":531
  *         if mode == 0:
  *             if pos < 0 or pos > self.length:
  *                 raise IOError()             # <<<<<<<<<<<<<<
  * 
  *             self.pos = pos
  */
-      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L4;
     }
     __pyx_L4:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":406
+    /* "/root/package/cpyamf/util.pyx":533
  *                 raise IOError()
  * 
  *             self.pos = pos             # <<<<<<<<<<<<<<
@@ -2748,7 +3571,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     __pyx_v_self->pos = __pyx_v_pos;
     break;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":407
+    /* "/root/package/cpyamf/util.pyx":534
  * 
  *             self.pos = pos
  *         elif mode == 1:             # <<<<<<<<<<<<<<
@@ -2757,7 +3580,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
  */
     case 1:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":408
+    /* "/root/package/cpyamf/util.pyx":535
  *             self.pos = pos
  *         elif mode == 1:
  *             if pos + self.pos < 0 or pos + self.pos > self.length:             # <<<<<<<<<<<<<<
@@ -2773,23 +3596,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     }
     if (__pyx_t_3) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":409
+      /* "/root/package/cpyamf/util.pyx":536
  *         elif mode == 1:
  *             if pos + self.pos < 0 or pos + self.pos > self.length:
  *                 raise IOError()             # <<<<<<<<<<<<<<
  * 
  *             self.pos += pos
  */
-      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L5;
     }
     __pyx_L5:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":411
+    /* "/root/package/cpyamf/util.pyx":538
  *                 raise IOError()
  * 
  *             self.pos += pos             # <<<<<<<<<<<<<<
@@ -2799,7 +3622,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     __pyx_v_self->pos += __pyx_v_pos;
     break;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":412
+    /* "/root/package/cpyamf/util.pyx":539
  * 
  *             self.pos += pos
  *         elif mode == 2:             # <<<<<<<<<<<<<<
@@ -2808,7 +3631,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
  */
     case 2:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":413
+    /* "/root/package/cpyamf/util.pyx":540
  *             self.pos += pos
  *         elif mode == 2:
  *             if pos + self.length < 0 or pos + self.length > self.length:             # <<<<<<<<<<<<<<
@@ -2824,23 +3647,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     }
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":414
+      /* "/root/package/cpyamf/util.pyx":541
  *         elif mode == 2:
  *             if pos + self.length < 0 or pos + self.length > self.length:
  *                 raise IOError()             # <<<<<<<<<<<<<<
  * 
  *             self.pos = self.length + pos
  */
-      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":416
+    /* "/root/package/cpyamf/util.pyx":543
  *                 raise IOError()
  * 
  *             self.pos = self.length + pos             # <<<<<<<<<<<<<<
@@ -2851,28 +3674,28 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
     break;
     default:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":418
+    /* "/root/package/cpyamf/util.pyx":545
  *             self.pos = self.length + pos
  *         else:
  *             raise ValueError('Bad value for mode')             # <<<<<<<<<<<<<<
  * 
  *         return 0
  */
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
-    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_s_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
-    __pyx_t_6 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_s_4));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
+    __pyx_t_6 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_Raise(__pyx_t_6, 0, 0);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     break;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":420
+  /* "/root/package/cpyamf/util.pyx":547
  *             raise ValueError('Bad value for mode')
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -2895,7 +3718,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_seek(struct __pyx_obj_6c
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":422
+/* "/root/package/cpyamf/util.pyx":549
  *         return 0
  * 
  *     cdef object getvalue(self):             # <<<<<<<<<<<<<<
@@ -2911,18 +3734,18 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_getvalue(struct __
   __Pyx_RefNannySetupContext("getvalue");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":426
+  /* "/root/package/cpyamf/util.pyx":553
  *         Get raw data from buffer.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return None
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":427
+    /* "/root/package/cpyamf/util.pyx":554
  *         """
  *         if self.complain_if_closed() == -1:
  *             return None             # <<<<<<<<<<<<<<
@@ -2937,7 +3760,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_getvalue(struct __
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":429
+  /* "/root/package/cpyamf/util.pyx":556
  *             return None
  * 
  *         return PyString_FromStringAndSize(self.buffer, self.length)             # <<<<<<<<<<<<<<
@@ -2945,7 +3768,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_getvalue(struct __
  *     cdef int peek(self, char **buf, Py_ssize_t size) except? -1:
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyString_FromStringAndSize(__pyx_v_self->buffer, __pyx_v_self->length); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 429; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyString_FromStringAndSize(__pyx_v_self->buffer, __pyx_v_self->length); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -2964,7 +3787,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_getvalue(struct __
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":431
+/* "/root/package/cpyamf/util.pyx":558
  *         return PyString_FromStringAndSize(self.buffer, self.length)
  * 
  *     cdef int peek(self, char **buf, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -2980,18 +3803,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
   __Pyx_RefNannySetupContext("peek");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":436
+  /* "/root/package/cpyamf/util.pyx":563
  *         returning the stream pointer to its initial position.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":437
+    /* "/root/package/cpyamf/util.pyx":564
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3004,7 +3827,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":439
+  /* "/root/package/cpyamf/util.pyx":566
  *             return -1
  * 
  *         cdef Py_ssize_t cur_pos = self.pos             # <<<<<<<<<<<<<<
@@ -3013,18 +3836,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
  */
   __pyx_v_cur_pos = __pyx_v_self->pos;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":441
+  /* "/root/package/cpyamf/util.pyx":568
  *         cdef Py_ssize_t cur_pos = self.pos
  * 
  *         if self.read(buf, size) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":442
+    /* "/root/package/cpyamf/util.pyx":569
  * 
  *         if self.read(buf, size) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3037,7 +3860,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":444
+  /* "/root/package/cpyamf/util.pyx":571
  *             return -1
  * 
  *         self.pos = cur_pos             # <<<<<<<<<<<<<<
@@ -3046,7 +3869,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
  */
   __pyx_v_self->pos = __pyx_v_cur_pos;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":446
+  /* "/root/package/cpyamf/util.pyx":573
  *         self.pos = cur_pos
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -3067,7 +3890,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_peek(struct __pyx_obj_6c
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":448
+/* "/root/package/cpyamf/util.pyx":575
  *         return 0
  * 
  *     cdef int truncate(self, Py_ssize_t size) except? -1:             # <<<<<<<<<<<<<<
@@ -3086,18 +3909,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   __Pyx_RefNannySetupContext("truncate");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":455
+  /* "/root/package/cpyamf/util.pyx":582
  *         @type size: C{int}
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":456
+    /* "/root/package/cpyamf/util.pyx":583
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3110,7 +3933,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":458
+  /* "/root/package/cpyamf/util.pyx":585
  *             return -1
  * 
  *         if size > self.length:             # <<<<<<<<<<<<<<
@@ -3120,25 +3943,49 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   __pyx_t_2 = (__pyx_v_size > __pyx_v_self->length);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":459
+    /* "/root/package/cpyamf/util.pyx":586
  * 
  *         if size > self.length:
  *             raise IOError()             # <<<<<<<<<<<<<<
  * 
- *         if size == 0:
+ *         if self._own() == -1:
  */
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 459; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L4;
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":461
+  /* "/root/package/cpyamf/util.pyx":588
  *             raise IOError()
  * 
+ *         if self._own() == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->_own(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":589
+ * 
+ *         if self._own() == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         if size == 0:
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/util.pyx":591
+ *             return -1
+ * 
  *         if size == 0:             # <<<<<<<<<<<<<<
  *             PyMem_Free(self.buffer)
  * 
@@ -3146,7 +3993,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   __pyx_t_2 = (__pyx_v_size == 0);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":462
+    /* "/root/package/cpyamf/util.pyx":592
  * 
  *         if size == 0:
  *             PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
@@ -3155,7 +4002,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     PyMem_Free(__pyx_v_self->buffer);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":464
+    /* "/root/package/cpyamf/util.pyx":594
  *             PyMem_Free(self.buffer)
  * 
  *             self.pos = 0             # <<<<<<<<<<<<<<
@@ -3164,7 +4011,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_v_self->pos = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":465
+    /* "/root/package/cpyamf/util.pyx":595
  * 
  *             self.pos = 0
  *             self.length = 0             # <<<<<<<<<<<<<<
@@ -3173,7 +4020,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_v_self->length = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":466
+    /* "/root/package/cpyamf/util.pyx":596
  *             self.pos = 0
  *             self.length = 0
  *             self.size = 1024             # <<<<<<<<<<<<<<
@@ -3182,7 +4029,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_v_self->size = 1024;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":468
+    /* "/root/package/cpyamf/util.pyx":598
  *             self.size = 1024
  * 
  *             self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
@@ -3191,7 +4038,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_v_self->buffer = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_self->size)));
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":470
+    /* "/root/package/cpyamf/util.pyx":600
  *             self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)
  * 
  *             if self.buffer == NULL:             # <<<<<<<<<<<<<<
@@ -3201,23 +4048,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
     __pyx_t_2 = (__pyx_v_self->buffer == NULL);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":471
+      /* "/root/package/cpyamf/util.pyx":601
  * 
  *             if self.buffer == NULL:
  *                 raise MemoryError()             # <<<<<<<<<<<<<<
  * 
  *             return 0
  */
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_MemoryError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_MemoryError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 601; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L6;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 601; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L7;
     }
-    __pyx_L6:;
+    __pyx_L7:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":473
+    /* "/root/package/cpyamf/util.pyx":603
  *                 raise MemoryError()
  * 
  *             return 0             # <<<<<<<<<<<<<<
@@ -3226,11 +4073,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_r = 0;
     goto __pyx_L0;
-    goto __pyx_L5;
+    goto __pyx_L6;
   }
-  __pyx_L5:;
+  __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":475
+  /* "/root/package/cpyamf/util.pyx":605
  *             return 0
  * 
  *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
@@ -3239,7 +4086,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":476
+  /* "/root/package/cpyamf/util.pyx":606
  * 
  *         cdef char *buf = NULL
  *         cdef Py_ssize_t cur_pos = self.pos             # <<<<<<<<<<<<<<
@@ -3248,18 +4095,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   __pyx_v_cur_pos = __pyx_v_self->pos;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":478
+  /* "/root/package/cpyamf/util.pyx":608
  *         cdef Py_ssize_t cur_pos = self.pos
  * 
  *         if self.seek(0) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->seek(__pyx_v_self, 0, NULL); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->seek(__pyx_v_self, 0, NULL); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":479
+    /* "/root/package/cpyamf/util.pyx":609
  * 
  *         if self.seek(0) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3268,22 +4115,22 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_r = -1;
     goto __pyx_L0;
-    goto __pyx_L7;
+    goto __pyx_L8;
   }
-  __pyx_L7:;
+  __pyx_L8:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":481
+  /* "/root/package/cpyamf/util.pyx":611
  *             return -1
  * 
  *         if self.peek(&buf, size) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->peek(__pyx_v_self, (&__pyx_v_buf), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->peek(__pyx_v_self, (&__pyx_v_buf), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":482
+    /* "/root/package/cpyamf/util.pyx":612
  * 
  *         if self.peek(&buf, size) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3292,11 +4139,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_r = -1;
     goto __pyx_L0;
-    goto __pyx_L8;
+    goto __pyx_L9;
   }
-  __pyx_L8:;
+  __pyx_L9:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":484
+  /* "/root/package/cpyamf/util.pyx":614
  *             return -1
  * 
  *         PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
@@ -3305,7 +4152,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   PyMem_Free(__pyx_v_self->buffer);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":485
+  /* "/root/package/cpyamf/util.pyx":615
  * 
  *         PyMem_Free(self.buffer)
  *         self.size = 1024             # <<<<<<<<<<<<<<
@@ -3314,7 +4161,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   __pyx_v_self->size = 1024;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":486
+  /* "/root/package/cpyamf/util.pyx":616
  *         PyMem_Free(self.buffer)
  *         self.size = 1024
  *         self.length = 0             # <<<<<<<<<<<<<<
@@ -3323,7 +4170,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   __pyx_v_self->length = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":487
+  /* "/root/package/cpyamf/util.pyx":617
  *         self.size = 1024
  *         self.length = 0
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
@@ -3332,7 +4179,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   __pyx_v_self->buffer = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_self->size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":489
+  /* "/root/package/cpyamf/util.pyx":619
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)
  * 
  *         if self.buffer == NULL:             # <<<<<<<<<<<<<<
@@ -3342,7 +4189,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   __pyx_t_2 = (__pyx_v_self->buffer == NULL);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":490
+    /* "/root/package/cpyamf/util.pyx":620
  * 
  *         if self.buffer == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -3350,23 +4197,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  *         if self.write(buf, size) == -1:
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L9;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L10;
   }
-  __pyx_L9:;
+  __pyx_L10:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":492
+  /* "/root/package/cpyamf/util.pyx":622
  *             raise MemoryError
  * 
  *         if self.write(buf, size) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":493
+    /* "/root/package/cpyamf/util.pyx":623
  * 
  *         if self.write(buf, size) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3375,11 +4222,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_r = -1;
     goto __pyx_L0;
-    goto __pyx_L10;
+    goto __pyx_L11;
   }
-  __pyx_L10:;
+  __pyx_L11:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":495
+  /* "/root/package/cpyamf/util.pyx":625
  *             return -1
  * 
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -3388,7 +4235,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":497
+  /* "/root/package/cpyamf/util.pyx":627
  *         PyMem_Free(buf)
  * 
  *         if self.length > cur_pos:             # <<<<<<<<<<<<<<
@@ -3398,7 +4245,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   __pyx_t_2 = (__pyx_v_self->length > __pyx_v_cur_pos);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":498
+    /* "/root/package/cpyamf/util.pyx":628
  * 
  *         if self.length > cur_pos:
  *             self.pos = self.length             # <<<<<<<<<<<<<<
@@ -3406,11 +4253,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  *             if self.seek(cur_pos, 0) == -1:
  */
     __pyx_v_self->pos = __pyx_v_self->length;
-    goto __pyx_L11;
+    goto __pyx_L12;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":500
+    /* "/root/package/cpyamf/util.pyx":630
  *             self.pos = self.length
  *         else:
  *             if self.seek(cur_pos, 0) == -1:             # <<<<<<<<<<<<<<
@@ -3419,11 +4266,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
     __pyx_t_4.__pyx_n = 1;
     __pyx_t_4.mode = 0;
-    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->seek(__pyx_v_self, __pyx_v_cur_pos, &__pyx_t_4); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->seek(__pyx_v_self, __pyx_v_cur_pos, &__pyx_t_4); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 630; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_2 = (__pyx_t_1 == -1);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":501
+      /* "/root/package/cpyamf/util.pyx":631
  *         else:
  *             if self.seek(cur_pos, 0) == -1:
  *                 return -1             # <<<<<<<<<<<<<<
@@ -3432,13 +4279,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
  */
       __pyx_r = -1;
       goto __pyx_L0;
-      goto __pyx_L12;
+      goto __pyx_L13;
     }
-    __pyx_L12:;
+    __pyx_L13:;
   }
-  __pyx_L11:;
+  __pyx_L12:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":503
+  /* "/root/package/cpyamf/util.pyx":633
  *                 return -1
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -3460,7 +4307,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_truncate(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":505
+/* "/root/package/cpyamf/util.pyx":635
  *         return 0
  * 
  *     cdef int consume(self) except? -1:             # <<<<<<<<<<<<<<
@@ -3478,18 +4325,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   __Pyx_RefNannySetupContext("consume");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":510
+  /* "/root/package/cpyamf/util.pyx":640
  *         The stream pointer is set to 0 at the end of this function.
  *         """
  *         if self.complain_if_closed() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 510; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->complain_if_closed(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 640; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":511
+    /* "/root/package/cpyamf/util.pyx":641
  *         """
  *         if self.complain_if_closed() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3502,7 +4349,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":513
+  /* "/root/package/cpyamf/util.pyx":643
  *             return -1
  * 
  *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
@@ -3511,19 +4358,43 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":514
+  /* "/root/package/cpyamf/util.pyx":644
  * 
  *         cdef char *buf = NULL
  *         cdef Py_ssize_t size = self.remaining()             # <<<<<<<<<<<<<<
  * 
- *         if size > 0:
+ *         if self._own() == -1:
  */
-  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->remaining(__pyx_v_self); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->remaining(__pyx_v_self); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_size = __pyx_t_3;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":516
+  /* "/root/package/cpyamf/util.pyx":646
  *         cdef Py_ssize_t size = self.remaining()
  * 
+ *         if self._own() == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->_own(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":647
+ * 
+ *         if self._own() == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         if size > 0:
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "/root/package/cpyamf/util.pyx":649
+ *             return -1
+ * 
  *         if size > 0:             # <<<<<<<<<<<<<<
  *             if self.peek(&buf, size) == -1:
  *                 return -1
@@ -3531,18 +4402,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   __pyx_t_2 = (__pyx_v_size > 0);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":517
+    /* "/root/package/cpyamf/util.pyx":650
  * 
  *         if size > 0:
  *             if self.peek(&buf, size) == -1:             # <<<<<<<<<<<<<<
  *                 return -1
  * 
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->peek(__pyx_v_self, (&__pyx_v_buf), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->peek(__pyx_v_self, (&__pyx_v_buf), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_2 = (__pyx_t_1 == -1);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":518
+      /* "/root/package/cpyamf/util.pyx":651
  *         if size > 0:
  *             if self.peek(&buf, size) == -1:
  *                 return -1             # <<<<<<<<<<<<<<
@@ -3551,14 +4422,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
       __pyx_r = -1;
       goto __pyx_L0;
-      goto __pyx_L5;
+      goto __pyx_L6;
     }
-    __pyx_L5:;
-    goto __pyx_L4;
+    __pyx_L6:;
+    goto __pyx_L5;
   }
-  __pyx_L4:;
+  __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":520
+  /* "/root/package/cpyamf/util.pyx":653
  *                 return -1
  * 
  *         PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
@@ -3567,7 +4438,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   PyMem_Free(__pyx_v_self->buffer);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":521
+  /* "/root/package/cpyamf/util.pyx":654
  * 
  *         PyMem_Free(self.buffer)
  *         self.size = 1024             # <<<<<<<<<<<<<<
@@ -3576,7 +4447,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_self->size = 1024;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":522
+  /* "/root/package/cpyamf/util.pyx":655
  *         PyMem_Free(self.buffer)
  *         self.size = 1024
  *         self.length = 0             # <<<<<<<<<<<<<<
@@ -3585,7 +4456,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_self->length = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":523
+  /* "/root/package/cpyamf/util.pyx":656
  *         self.size = 1024
  *         self.length = 0
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)             # <<<<<<<<<<<<<<
@@ -3594,7 +4465,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_self->buffer = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_self->size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":524
+  /* "/root/package/cpyamf/util.pyx":657
  *         self.length = 0
  *         self.buffer = <char *>PyMem_Malloc(sizeof(char *) * self.size)
  *         self.pos = 0             # <<<<<<<<<<<<<<
@@ -3603,7 +4474,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_self->pos = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":526
+  /* "/root/package/cpyamf/util.pyx":659
  *         self.pos = 0
  * 
  *         if self.buffer == NULL:             # <<<<<<<<<<<<<<
@@ -3613,7 +4484,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   __pyx_t_2 = (__pyx_v_self->buffer == NULL);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":527
+    /* "/root/package/cpyamf/util.pyx":660
  * 
  *         if self.buffer == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -3621,12 +4492,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  *         if size > 0:
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 660; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
   }
-  __pyx_L6:;
+  __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":529
+  /* "/root/package/cpyamf/util.pyx":662
  *             raise MemoryError
  * 
  *         if size > 0:             # <<<<<<<<<<<<<<
@@ -3636,18 +4507,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   __pyx_t_2 = (__pyx_v_size > 0);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":530
+    /* "/root/package/cpyamf/util.pyx":663
  * 
  *         if size > 0:
  *             if self.write(buf, size) == -1:             # <<<<<<<<<<<<<<
  *                 return -1
  * 
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 663; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_2 = (__pyx_t_1 == -1);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":531
+      /* "/root/package/cpyamf/util.pyx":664
  *         if size > 0:
  *             if self.write(buf, size) == -1:
  *                 return -1             # <<<<<<<<<<<<<<
@@ -3656,11 +4527,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
       __pyx_r = -1;
       goto __pyx_L0;
-      goto __pyx_L8;
+      goto __pyx_L9;
     }
-    __pyx_L8:;
+    __pyx_L9:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":533
+    /* "/root/package/cpyamf/util.pyx":666
  *                 return -1
  * 
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -3668,11 +4539,11 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  *         self.pos = 0
  */
     PyMem_Free(__pyx_v_buf);
-    goto __pyx_L7;
+    goto __pyx_L8;
   }
-  __pyx_L7:;
+  __pyx_L8:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":535
+  /* "/root/package/cpyamf/util.pyx":668
  *             PyMem_Free(buf)
  * 
  *         self.pos = 0             # <<<<<<<<<<<<<<
@@ -3681,7 +4552,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
  */
   __pyx_v_self->pos = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":537
+  /* "/root/package/cpyamf/util.pyx":670
  *         self.pos = 0
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -3702,7 +4573,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_consume(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":539
+/* "/root/package/cpyamf/util.pyx":672
  *         return 0
  * 
  *     cdef int unpack_int(self, int num_bytes, long *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -3721,18 +4592,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   __Pyx_RefNannySetupContext("unpack_int");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":543
+  /* "/root/package/cpyamf/util.pyx":676
  *         Unpacks a long from C{buf}.
  *         """
  *         if self.has_available(num_bytes) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_num_bytes); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_num_bytes); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":544
+    /* "/root/package/cpyamf/util.pyx":677
  *         """
  *         if self.has_available(num_bytes) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3745,7 +4616,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":546
+  /* "/root/package/cpyamf/util.pyx":679
  *             return -1
  * 
  *         cdef int nb = num_bytes             # <<<<<<<<<<<<<<
@@ -3754,7 +4625,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   __pyx_v_nb = __pyx_v_num_bytes;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":547
+  /* "/root/package/cpyamf/util.pyx":680
  * 
  *         cdef int nb = num_bytes
  *         cdef long x = 0             # <<<<<<<<<<<<<<
@@ -3763,7 +4634,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   __pyx_v_x = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":548
+  /* "/root/package/cpyamf/util.pyx":681
  *         cdef int nb = num_bytes
  *         cdef long x = 0
  *         cdef int bytes_left = num_bytes             # <<<<<<<<<<<<<<
@@ -3772,7 +4643,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   __pyx_v_bytes_left = __pyx_v_num_bytes;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":549
+  /* "/root/package/cpyamf/util.pyx":682
  *         cdef long x = 0
  *         cdef int bytes_left = num_bytes
  *         cdef unsigned char *bytes = <unsigned char *>(self.buffer + self.pos)             # <<<<<<<<<<<<<<
@@ -3781,7 +4652,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   __pyx_v_bytes = ((unsigned char *)(__pyx_v_self->buffer + __pyx_v_self->pos));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":551
+  /* "/root/package/cpyamf/util.pyx":684
  *         cdef unsigned char *bytes = <unsigned char *>(self.buffer + self.pos)
  * 
  *         if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -3791,7 +4662,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":552
+    /* "/root/package/cpyamf/util.pyx":685
  * 
  *         if is_big_endian(self._endian):
  *             while bytes_left > 0:             # <<<<<<<<<<<<<<
@@ -3802,7 +4673,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
       __pyx_t_2 = (__pyx_v_bytes_left > 0);
       if (!__pyx_t_2) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":553
+      /* "/root/package/cpyamf/util.pyx":686
  *         if is_big_endian(self._endian):
  *             while bytes_left > 0:
  *                 x = (x << 8) | bytes[0]             # <<<<<<<<<<<<<<
@@ -3811,7 +4682,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
       __pyx_v_x = ((__pyx_v_x << 8) | (__pyx_v_bytes[0]));
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":554
+      /* "/root/package/cpyamf/util.pyx":687
  *             while bytes_left > 0:
  *                 x = (x << 8) | bytes[0]
  *                 bytes += 1             # <<<<<<<<<<<<<<
@@ -3820,7 +4691,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
       __pyx_v_bytes += 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":555
+      /* "/root/package/cpyamf/util.pyx":688
  *                 x = (x << 8) | bytes[0]
  *                 bytes += 1
  *                 bytes_left -= 1             # <<<<<<<<<<<<<<
@@ -3833,7 +4704,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":557
+    /* "/root/package/cpyamf/util.pyx":690
  *                 bytes_left -= 1
  *         else:
  *             while bytes_left > 0:             # <<<<<<<<<<<<<<
@@ -3844,7 +4715,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
       __pyx_t_2 = (__pyx_v_bytes_left > 0);
       if (!__pyx_t_2) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":558
+      /* "/root/package/cpyamf/util.pyx":691
  *         else:
  *             while bytes_left > 0:
  *                 x = (x << 8) | bytes[bytes_left - 1]             # <<<<<<<<<<<<<<
@@ -3853,7 +4724,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
       __pyx_v_x = ((__pyx_v_x << 8) | (__pyx_v_bytes[(__pyx_v_bytes_left - 1)]));
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":559
+      /* "/root/package/cpyamf/util.pyx":692
  *             while bytes_left > 0:
  *                 x = (x << 8) | bytes[bytes_left - 1]
  *                 bytes_left -= 1             # <<<<<<<<<<<<<<
@@ -3865,7 +4736,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":561
+  /* "/root/package/cpyamf/util.pyx":694
  *                 bytes_left -= 1
  * 
  *         if SIZEOF_LONG > num_bytes:             # <<<<<<<<<<<<<<
@@ -3875,7 +4746,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   __pyx_t_2 = (SIZEOF_LONG > __pyx_v_num_bytes);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":562
+    /* "/root/package/cpyamf/util.pyx":695
  * 
  *         if SIZEOF_LONG > num_bytes:
  *             x |= -(x & (1L << ((8 * num_bytes) - 1)))             # <<<<<<<<<<<<<<
@@ -3887,7 +4758,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   }
   __pyx_L9:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":564
+  /* "/root/package/cpyamf/util.pyx":697
  *             x |= -(x & (1L << ((8 * num_bytes) - 1)))
  * 
  *         self.pos += nb             # <<<<<<<<<<<<<<
@@ -3896,7 +4767,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   __pyx_v_self->pos += __pyx_v_nb;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":566
+  /* "/root/package/cpyamf/util.pyx":699
  *         self.pos += nb
  * 
  *         ret[0] = x             # <<<<<<<<<<<<<<
@@ -3905,7 +4776,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
  */
   (__pyx_v_ret[0]) = __pyx_v_x;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":568
+  /* "/root/package/cpyamf/util.pyx":701
  *         ret[0] = x
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -3926,7 +4797,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_int(struct __pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":570
+/* "/root/package/cpyamf/util.pyx":703
  *         return 0
  * 
  *     cdef int unpack_uint(self, int num_bytes, unsigned long *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -3944,7 +4815,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   __Pyx_RefNannySetupContext("unpack_uint");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":574
+  /* "/root/package/cpyamf/util.pyx":707
  *         Unpacks an unsigned long from C{buf}.
  *         """
  *         cdef int nb = num_bytes             # <<<<<<<<<<<<<<
@@ -3953,18 +4824,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
   __pyx_v_nb = __pyx_v_num_bytes;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":576
+  /* "/root/package/cpyamf/util.pyx":709
  *         cdef int nb = num_bytes
  * 
  *         if self.has_available(num_bytes) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_num_bytes); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->has_available(__pyx_v_self, __pyx_v_num_bytes); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":577
+    /* "/root/package/cpyamf/util.pyx":710
  * 
  *         if self.has_available(num_bytes) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -3977,7 +4848,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":579
+  /* "/root/package/cpyamf/util.pyx":712
  *             return -1
  * 
  *         cdef unsigned long x = 0             # <<<<<<<<<<<<<<
@@ -3986,7 +4857,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
   __pyx_v_x = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":580
+  /* "/root/package/cpyamf/util.pyx":713
  * 
  *         cdef unsigned long x = 0
  *         cdef unsigned char *bytes = <unsigned char *>(self.buffer + self.pos)             # <<<<<<<<<<<<<<
@@ -3995,7 +4866,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
   __pyx_v_bytes = ((unsigned char *)(__pyx_v_self->buffer + __pyx_v_self->pos));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":582
+  /* "/root/package/cpyamf/util.pyx":715
  *         cdef unsigned char *bytes = <unsigned char *>(self.buffer + self.pos)
  * 
  *         if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -4005,7 +4876,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":583
+    /* "/root/package/cpyamf/util.pyx":716
  * 
  *         if is_big_endian(self._endian):
  *             while num_bytes > 0:             # <<<<<<<<<<<<<<
@@ -4016,7 +4887,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
       __pyx_t_2 = (__pyx_v_num_bytes > 0);
       if (!__pyx_t_2) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":584
+      /* "/root/package/cpyamf/util.pyx":717
  *         if is_big_endian(self._endian):
  *             while num_bytes > 0:
  *                 x = (x << 8) | bytes[0]             # <<<<<<<<<<<<<<
@@ -4025,7 +4896,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
       __pyx_v_x = ((__pyx_v_x << 8) | (__pyx_v_bytes[0]));
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":585
+      /* "/root/package/cpyamf/util.pyx":718
  *             while num_bytes > 0:
  *                 x = (x << 8) | bytes[0]
  *                 bytes += 1             # <<<<<<<<<<<<<<
@@ -4034,7 +4905,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
       __pyx_v_bytes += 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":586
+      /* "/root/package/cpyamf/util.pyx":719
  *                 x = (x << 8) | bytes[0]
  *                 bytes += 1
  *                 num_bytes -= 1             # <<<<<<<<<<<<<<
@@ -4047,7 +4918,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":588
+    /* "/root/package/cpyamf/util.pyx":721
  *                 num_bytes -= 1
  *         else:
  *             while num_bytes > 0:             # <<<<<<<<<<<<<<
@@ -4058,7 +4929,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
       __pyx_t_2 = (__pyx_v_num_bytes > 0);
       if (!__pyx_t_2) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":589
+      /* "/root/package/cpyamf/util.pyx":722
  *         else:
  *             while num_bytes > 0:
  *                 x = (x << 8) | bytes[num_bytes - 1]             # <<<<<<<<<<<<<<
@@ -4067,7 +4938,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
       __pyx_v_x = ((__pyx_v_x << 8) | (__pyx_v_bytes[(__pyx_v_num_bytes - 1)]));
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":590
+      /* "/root/package/cpyamf/util.pyx":723
  *             while num_bytes > 0:
  *                 x = (x << 8) | bytes[num_bytes - 1]
  *                 num_bytes -= 1             # <<<<<<<<<<<<<<
@@ -4079,7 +4950,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":592
+  /* "/root/package/cpyamf/util.pyx":725
  *                 num_bytes -= 1
  * 
  *         self.pos += nb             # <<<<<<<<<<<<<<
@@ -4088,7 +4959,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
   __pyx_v_self->pos += __pyx_v_nb;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":594
+  /* "/root/package/cpyamf/util.pyx":727
  *         self.pos += nb
  * 
  *         ret[0] = x             # <<<<<<<<<<<<<<
@@ -4097,7 +4968,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
  */
   (__pyx_v_ret[0]) = __pyx_v_x;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":596
+  /* "/root/package/cpyamf/util.pyx":729
  *         ret[0] = x
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -4118,7 +4989,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_unpack_uint(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":598
+/* "/root/package/cpyamf/util.pyx":731
  *         return 0
  * 
  *     cdef int pack_int(self, int num_bytes, long x) except? -1:             # <<<<<<<<<<<<<<
@@ -4141,7 +5012,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   __Pyx_RefNannySetupContext("pack_int");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":604
+  /* "/root/package/cpyamf/util.pyx":737
  *         @raise OverflowError: integer out of range
  *         """
  *         cdef long maxint = 1             # <<<<<<<<<<<<<<
@@ -4150,7 +5021,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
   __pyx_v_maxint = 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":605
+  /* "/root/package/cpyamf/util.pyx":738
  *         """
  *         cdef long maxint = 1
  *         cdef long minint = -1             # <<<<<<<<<<<<<<
@@ -4159,7 +5030,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
   __pyx_v_minint = -1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":607
+  /* "/root/package/cpyamf/util.pyx":740
  *         cdef long minint = -1
  * 
  *         if num_bytes != SIZEOF_LONG:             # <<<<<<<<<<<<<<
@@ -4169,7 +5040,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   __pyx_t_1 = (__pyx_v_num_bytes != SIZEOF_LONG);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":608
+    /* "/root/package/cpyamf/util.pyx":741
  * 
  *         if num_bytes != SIZEOF_LONG:
  *             maxint = (maxint << (num_bytes * 8 - 1)) - 1             # <<<<<<<<<<<<<<
@@ -4178,7 +5049,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
     __pyx_v_maxint = ((__pyx_v_maxint << ((__pyx_v_num_bytes * 8) - 1)) - 1);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":609
+    /* "/root/package/cpyamf/util.pyx":742
  *         if num_bytes != SIZEOF_LONG:
  *             maxint = (maxint << (num_bytes * 8 - 1)) - 1
  *             minint = (-maxint) - 1             # <<<<<<<<<<<<<<
@@ -4187,7 +5058,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
     __pyx_v_minint = ((-__pyx_v_maxint) - 1);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":611
+    /* "/root/package/cpyamf/util.pyx":744
  *             minint = (-maxint) - 1
  * 
  *             if x > maxint or x < minint:             # <<<<<<<<<<<<<<
@@ -4203,24 +5074,24 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
     }
     if (__pyx_t_3) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":612
+      /* "/root/package/cpyamf/util.pyx":745
  * 
  *             if x > maxint or x < minint:
  *                 raise OverflowError('integer out of range')             # <<<<<<<<<<<<<<
  * 
  *         cdef char *buf = <char *>PyMem_Malloc(num_bytes)
  */
-      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 745; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-      __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 745; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_Raise(__pyx_t_5, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 745; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L4;
     }
     __pyx_L4:;
@@ -4228,7 +5099,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":614
+  /* "/root/package/cpyamf/util.pyx":747
  *                 raise OverflowError('integer out of range')
  * 
  *         cdef char *buf = <char *>PyMem_Malloc(num_bytes)             # <<<<<<<<<<<<<<
@@ -4237,7 +5108,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
   __pyx_v_buf = ((char *)PyMem_Malloc(__pyx_v_num_bytes));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":616
+  /* "/root/package/cpyamf/util.pyx":749
  *         cdef char *buf = <char *>PyMem_Malloc(num_bytes)
  * 
  *         if buf == NULL:             # <<<<<<<<<<<<<<
@@ -4247,7 +5118,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   __pyx_t_3 = (__pyx_v_buf == NULL);
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":617
+    /* "/root/package/cpyamf/util.pyx":750
  * 
  *         if buf == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -4255,12 +5126,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  *         cdef long i = num_bytes
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":619
+  /* "/root/package/cpyamf/util.pyx":752
  *             raise MemoryError
  * 
  *         cdef long i = num_bytes             # <<<<<<<<<<<<<<
@@ -4269,7 +5140,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
   __pyx_v_i = __pyx_v_num_bytes;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":621
+  /* "/root/package/cpyamf/util.pyx":754
  *         cdef long i = num_bytes
  * 
  *         if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -4279,7 +5150,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   __pyx_t_6 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
   if (__pyx_t_6) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":622
+    /* "/root/package/cpyamf/util.pyx":755
  * 
  *         if is_big_endian(self._endian):
  *             while i > 0:             # <<<<<<<<<<<<<<
@@ -4290,7 +5161,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
       __pyx_t_3 = (__pyx_v_i > 0);
       if (!__pyx_t_3) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":623
+      /* "/root/package/cpyamf/util.pyx":756
  *         if is_big_endian(self._endian):
  *             while i > 0:
  *                 i -= 1             # <<<<<<<<<<<<<<
@@ -4299,7 +5170,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
       __pyx_v_i -= 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":624
+      /* "/root/package/cpyamf/util.pyx":757
  *             while i > 0:
  *                 i -= 1
  *                 buf[i] = <char>x             # <<<<<<<<<<<<<<
@@ -4308,7 +5179,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
       (__pyx_v_buf[__pyx_v_i]) = ((char)__pyx_v_x);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":625
+      /* "/root/package/cpyamf/util.pyx":758
  *                 i -= 1
  *                 buf[i] = <char>x
  *                 x >>= 8             # <<<<<<<<<<<<<<
@@ -4321,7 +5192,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":627
+    /* "/root/package/cpyamf/util.pyx":760
  *                 x >>= 8
  *         else:
  *             while i > 0:             # <<<<<<<<<<<<<<
@@ -4332,7 +5203,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
       __pyx_t_3 = (__pyx_v_i > 0);
       if (!__pyx_t_3) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":628
+      /* "/root/package/cpyamf/util.pyx":761
  *         else:
  *             while i > 0:
  *                 buf[num_bytes - i] = <char>x             # <<<<<<<<<<<<<<
@@ -4341,7 +5212,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
       (__pyx_v_buf[(__pyx_v_num_bytes - __pyx_v_i)]) = ((char)__pyx_v_x);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":629
+      /* "/root/package/cpyamf/util.pyx":762
  *             while i > 0:
  *                 buf[num_bytes - i] = <char>x
  *                 i -= 1             # <<<<<<<<<<<<<<
@@ -4350,7 +5221,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
       __pyx_v_i -= 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":630
+      /* "/root/package/cpyamf/util.pyx":763
  *                 buf[num_bytes - i] = <char>x
  *                 i -= 1
  *                 x >>= 8             # <<<<<<<<<<<<<<
@@ -4362,16 +5233,16 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":632
+  /* "/root/package/cpyamf/util.pyx":765
  *                 x >>= 8
  * 
  *         self.write(buf, num_bytes)             # <<<<<<<<<<<<<<
  *         PyMem_Free(buf)
  * 
  */
-  __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_num_bytes); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_num_bytes); if (unlikely(__pyx_t_6 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 765; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":633
+  /* "/root/package/cpyamf/util.pyx":766
  * 
  *         self.write(buf, num_bytes)
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -4380,7 +5251,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":635
+  /* "/root/package/cpyamf/util.pyx":768
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -4403,7 +5274,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_int(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":637
+/* "/root/package/cpyamf/util.pyx":770
  *         return 0
  * 
  *     cdef int pack_uint(self, int num_bytes, unsigned long x) except? -1:             # <<<<<<<<<<<<<<
@@ -4423,7 +5294,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   __Pyx_RefNannySetupContext("pack_uint");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":643
+  /* "/root/package/cpyamf/util.pyx":776
  *         @raise OverflowError: integer out of range
  *         """
  *         cdef unsigned long maxint = 1             # <<<<<<<<<<<<<<
@@ -4432,7 +5303,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
   __pyx_v_maxint = 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":645
+  /* "/root/package/cpyamf/util.pyx":778
  *         cdef unsigned long maxint = 1
  * 
  *         if num_bytes != SIZEOF_LONG:             # <<<<<<<<<<<<<<
@@ -4442,7 +5313,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   __pyx_t_1 = (__pyx_v_num_bytes != SIZEOF_LONG);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":646
+    /* "/root/package/cpyamf/util.pyx":779
  * 
  *         if num_bytes != SIZEOF_LONG:
  *             maxint <<= <unsigned long>(num_bytes * 8)             # <<<<<<<<<<<<<<
@@ -4451,7 +5322,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
     __pyx_v_maxint <<= ((unsigned long)(__pyx_v_num_bytes * 8));
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":648
+    /* "/root/package/cpyamf/util.pyx":781
  *             maxint <<= <unsigned long>(num_bytes * 8)
  * 
  *             if x >= maxint:             # <<<<<<<<<<<<<<
@@ -4461,24 +5332,24 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
     __pyx_t_1 = (__pyx_v_x >= __pyx_v_maxint);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":649
+      /* "/root/package/cpyamf/util.pyx":782
  * 
  *             if x >= maxint:
  *                 raise OverflowError('integer out of range')             # <<<<<<<<<<<<<<
  * 
  *         cdef char *buf = <char *>PyMem_Malloc(sizeof(char *) * num_bytes)
  */
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
+      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 782; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L4;
     }
     __pyx_L4:;
@@ -4486,7 +5357,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":651
+  /* "/root/package/cpyamf/util.pyx":784
  *                 raise OverflowError('integer out of range')
  * 
  *         cdef char *buf = <char *>PyMem_Malloc(sizeof(char *) * num_bytes)             # <<<<<<<<<<<<<<
@@ -4495,7 +5366,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
   __pyx_v_buf = ((char *)PyMem_Malloc(((sizeof(char *)) * __pyx_v_num_bytes)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":653
+  /* "/root/package/cpyamf/util.pyx":786
  *         cdef char *buf = <char *>PyMem_Malloc(sizeof(char *) * num_bytes)
  * 
  *         if not buf:             # <<<<<<<<<<<<<<
@@ -4505,7 +5376,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   __pyx_t_1 = (!(__pyx_v_buf != 0));
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":654
+    /* "/root/package/cpyamf/util.pyx":787
  * 
  *         if not buf:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -4513,12 +5384,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  *         cdef long i = num_bytes
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 654; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":656
+  /* "/root/package/cpyamf/util.pyx":789
  *             raise MemoryError
  * 
  *         cdef long i = num_bytes             # <<<<<<<<<<<<<<
@@ -4527,7 +5398,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
   __pyx_v_i = __pyx_v_num_bytes;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":658
+  /* "/root/package/cpyamf/util.pyx":791
  *         cdef long i = num_bytes
  * 
  *         if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -4537,7 +5408,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   __pyx_t_4 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
   if (__pyx_t_4) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":659
+    /* "/root/package/cpyamf/util.pyx":792
  * 
  *         if is_big_endian(self._endian):
  *             while i > 0:             # <<<<<<<<<<<<<<
@@ -4548,7 +5419,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
       __pyx_t_1 = (__pyx_v_i > 0);
       if (!__pyx_t_1) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":660
+      /* "/root/package/cpyamf/util.pyx":793
  *         if is_big_endian(self._endian):
  *             while i > 0:
  *                 i -= 1             # <<<<<<<<<<<<<<
@@ -4557,7 +5428,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
       __pyx_v_i -= 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":661
+      /* "/root/package/cpyamf/util.pyx":794
  *             while i > 0:
  *                 i -= 1
  *                 buf[i] = <char>x             # <<<<<<<<<<<<<<
@@ -4566,7 +5437,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
       (__pyx_v_buf[__pyx_v_i]) = ((char)__pyx_v_x);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":662
+      /* "/root/package/cpyamf/util.pyx":795
  *                 i -= 1
  *                 buf[i] = <char>x
  *                 x >>= 8             # <<<<<<<<<<<<<<
@@ -4579,7 +5450,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":664
+    /* "/root/package/cpyamf/util.pyx":797
  *                 x >>= 8
  *         else:
  *             while i > 0:             # <<<<<<<<<<<<<<
@@ -4590,7 +5461,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
       __pyx_t_1 = (__pyx_v_i > 0);
       if (!__pyx_t_1) break;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":665
+      /* "/root/package/cpyamf/util.pyx":798
  *         else:
  *             while i > 0:
  *                 buf[num_bytes - i] = <char>x             # <<<<<<<<<<<<<<
@@ -4599,7 +5470,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
       (__pyx_v_buf[(__pyx_v_num_bytes - __pyx_v_i)]) = ((char)__pyx_v_x);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":666
+      /* "/root/package/cpyamf/util.pyx":799
  *             while i > 0:
  *                 buf[num_bytes - i] = <char>x
  *                 i -= 1             # <<<<<<<<<<<<<<
@@ -4608,7 +5479,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
       __pyx_v_i -= 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":667
+      /* "/root/package/cpyamf/util.pyx":800
  *                 buf[num_bytes - i] = <char>x
  *                 i -= 1
  *                 x >>= 8             # <<<<<<<<<<<<<<
@@ -4620,16 +5491,16 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":669
+  /* "/root/package/cpyamf/util.pyx":802
  *                 x >>= 8
  * 
  *         self.write(buf, num_bytes)             # <<<<<<<<<<<<<<
  *         PyMem_Free(buf)
  * 
  */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_num_bytes); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 669; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_num_bytes); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":670
+  /* "/root/package/cpyamf/util.pyx":803
  * 
  *         self.write(buf, num_bytes)
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -4638,7 +5509,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":672
+  /* "/root/package/cpyamf/util.pyx":805
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -4661,7 +5532,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":674
+/* "/root/package/cpyamf/util.pyx":807
  *         return 0
  * 
  *     cdef int read_uchar(self, unsigned char *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4670,19 +5541,54 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_pack_uint(struct __pyx_o
  */
 
 static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_uchar(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, unsigned char *__pyx_v_ret) {
+  unsigned long __pyx_v_x;
   int __pyx_r;
   int __pyx_t_1;
+  int __pyx_t_2;
   __Pyx_RefNannySetupContext("read_uchar");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":678
- *         Reads an C{unsigned char} from the stream.
- *         """
- *         return self.unpack_uint(1, <unsigned long *>ret)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/util.pyx":813
+ *         cdef unsigned long x
+ * 
+ *         if self.unpack_uint(1, &x) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 1, (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":814
+ * 
+ *         if self.unpack_uint(1, &x) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         ret[0] = <unsigned char>x
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":816
+ *             return -1
+ * 
+ *         ret[0] = <unsigned char>x             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  (__pyx_v_ret[0]) = ((unsigned char)__pyx_v_x);
+
+  /* "/root/package/cpyamf/util.pyx":818
+ *         ret[0] = <unsigned char>x
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_char(self, char *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 1, ((unsigned long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_1;
+  __pyx_r = 0;
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -4691,12 +5597,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_uchar(struct __pyx_
   __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.read_uchar");
   __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":680
- *         return self.unpack_uint(1, <unsigned long *>ret)
+/* "/root/package/cpyamf/util.pyx":820
+ *         return 0
  * 
  *     cdef int read_char(self, char *ret) except? -1:             # <<<<<<<<<<<<<<
  *         """
@@ -4704,19 +5611,54 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_uchar(struct __pyx_
  */
 
 static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_char(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, char *__pyx_v_ret) {
+  long __pyx_v_x;
   int __pyx_r;
   int __pyx_t_1;
+  int __pyx_t_2;
   __Pyx_RefNannySetupContext("read_char");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":684
- *         Reads a C{char} from the stream.
- *         """
- *         return self.unpack_int(1, <long *>ret)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/util.pyx":826
+ *         cdef long x
+ * 
+ *         if self.unpack_int(1, &x) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 1, (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":827
+ * 
+ *         if self.unpack_int(1, &x) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         ret[0] = <char>x
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":829
+ *             return -1
+ * 
+ *         ret[0] = <char>x             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  (__pyx_v_ret[0]) = ((char)__pyx_v_x);
+
+  /* "/root/package/cpyamf/util.pyx":831
+ *         ret[0] = <char>x
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_ushort(self, unsigned short *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 1, ((long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 684; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_1;
+  __pyx_r = 0;
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -4725,12 +5667,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_char(struct __pyx_o
   __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.read_char");
   __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":686
- *         return self.unpack_int(1, <long *>ret)
+/* "/root/package/cpyamf/util.pyx":833
+ *         return 0
  * 
  *     cdef int read_ushort(self, unsigned short *ret) except? -1:             # <<<<<<<<<<<<<<
  *         """
@@ -4738,19 +5681,54 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_char(struct __pyx_o
  */
 
 static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_ushort(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, unsigned short *__pyx_v_ret) {
+  unsigned long __pyx_v_x;
   int __pyx_r;
   int __pyx_t_1;
+  int __pyx_t_2;
   __Pyx_RefNannySetupContext("read_ushort");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":690
- *         Reads a 2 byte unsigned integer from the stream.
- *         """
- *         return self.unpack_uint(2, <unsigned long *>ret)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/util.pyx":839
+ *         cdef unsigned long x
+ * 
+ *         if self.unpack_uint(2, &x) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 2, (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":840
+ * 
+ *         if self.unpack_uint(2, &x) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         ret[0] = <unsigned short>x
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":842
+ *             return -1
+ * 
+ *         ret[0] = <unsigned short>x             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  (__pyx_v_ret[0]) = ((unsigned short)__pyx_v_x);
+
+  /* "/root/package/cpyamf/util.pyx":844
+ *         ret[0] = <unsigned short>x
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_short(self, short *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 2, ((unsigned long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_1;
+  __pyx_r = 0;
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -4759,12 +5737,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_ushort(struct __pyx
   __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.read_ushort");
   __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":692
- *         return self.unpack_uint(2, <unsigned long *>ret)
+/* "/root/package/cpyamf/util.pyx":846
+ *         return 0
  * 
  *     cdef int read_short(self, short *ret) except? -1:             # <<<<<<<<<<<<<<
  *         """
@@ -4772,19 +5751,54 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_ushort(struct __pyx
  */
 
 static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_short(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *__pyx_v_self, short *__pyx_v_ret) {
+  long __pyx_v_x;
   int __pyx_r;
   int __pyx_t_1;
+  int __pyx_t_2;
   __Pyx_RefNannySetupContext("read_short");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":696
- *         Reads a 2 byte integer from the stream.
- *         """
- *         return self.unpack_int(2, <long *>ret)             # <<<<<<<<<<<<<<
+  /* "/root/package/cpyamf/util.pyx":852
+ *         cdef long x
+ * 
+ *         if self.unpack_int(2, &x) == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 2, (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__pyx_t_1 == -1);
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":853
+ * 
+ *         if self.unpack_int(2, &x) == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         ret[0] = <short>x
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":855
+ *             return -1
+ * 
+ *         ret[0] = <short>x             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+  (__pyx_v_ret[0]) = ((short)__pyx_v_x);
+
+  /* "/root/package/cpyamf/util.pyx":857
+ *         ret[0] = <short>x
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_ulong(self, unsigned long *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 2, ((long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_1;
+  __pyx_r = 0;
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -4793,12 +5807,13 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_short(struct __pyx_
   __Pyx_AddTraceback("cpyamf.util.cBufferedByteStream.read_short");
   __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":698
- *         return self.unpack_int(2, <long *>ret)
+/* "/root/package/cpyamf/util.pyx":859
+ *         return 0
  * 
  *     cdef int read_ulong(self, unsigned long *ret) except? -1:             # <<<<<<<<<<<<<<
  *         """
@@ -4810,14 +5825,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_ulong(struct __pyx_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("read_ulong");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":702
+  /* "/root/package/cpyamf/util.pyx":863
  *         Reads a 4 byte unsigned integer from the stream.
  *         """
  *         return self.unpack_uint(4, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_long(self, long *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -4831,7 +5846,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_ulong(struct __pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":704
+/* "/root/package/cpyamf/util.pyx":865
  *         return self.unpack_uint(4, ret)
  * 
  *     cdef int read_long(self, long *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4844,14 +5859,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_long(struct __pyx_o
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("read_long");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":708
+  /* "/root/package/cpyamf/util.pyx":869
  *         Reads a 4 byte integer from the stream.
  *         """
  *         return self.unpack_int(4, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_24bit_uint(self, unsigned long *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 708; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -4865,7 +5880,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_long(struct __pyx_o
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":710
+/* "/root/package/cpyamf/util.pyx":871
  *         return self.unpack_int(4, ret)
  * 
  *     cdef int read_24bit_uint(self, unsigned long *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4878,14 +5893,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_24bit_uint(struct _
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("read_24bit_uint");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":714
+  /* "/root/package/cpyamf/util.pyx":875
  *         Reads a 24 bit unsigned integer from the stream.
  *         """
  *         return self.unpack_uint(3, <unsigned long *>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int read_24bit_int(self, long *ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 3, ((unsigned long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 714; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_uint(__pyx_v_self, 3, ((unsigned long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -4899,7 +5914,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_24bit_uint(struct _
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":716
+/* "/root/package/cpyamf/util.pyx":877
  *         return self.unpack_uint(3, <unsigned long *>ret)
  * 
  *     cdef int read_24bit_int(self, long *ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4912,14 +5927,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_24bit_int(struct __
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("read_24bit_int");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":720
+  /* "/root/package/cpyamf/util.pyx":881
  *         Reads a 24 bit integer from the stream.
  *         """
  *         return self.unpack_int(3, <long *>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_uchar(self, unsigned char ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 3, ((long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 720; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->unpack_int(__pyx_v_self, 3, ((long *)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -4933,7 +5948,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_24bit_int(struct __
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":722
+/* "/root/package/cpyamf/util.pyx":883
  *         return self.unpack_int(3, <long *>ret)
  * 
  *     cdef int write_uchar(self, unsigned char ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4946,14 +5961,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_uchar(struct __pyx
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_uchar");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":729
+  /* "/root/package/cpyamf/util.pyx":890
  *         @type ret: C{int}
  *         """
  *         return self.pack_uint(1, <unsigned long>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_char(self, char ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 1, ((unsigned long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 1, ((unsigned long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -4967,7 +5982,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_uchar(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":731
+/* "/root/package/cpyamf/util.pyx":892
  *         return self.pack_uint(1, <unsigned long>ret)
  * 
  *     cdef int write_char(self, char ret) except? -1:             # <<<<<<<<<<<<<<
@@ -4980,14 +5995,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_char(struct __pyx_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_char");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":738
+  /* "/root/package/cpyamf/util.pyx":899
  *         @type ret: C{int}
  *         """
  *         return self.pack_int(1, <long>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_ushort(self, unsigned short ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 1, ((long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 738; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 1, ((long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 899; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5001,7 +6016,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_char(struct __pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":740
+/* "/root/package/cpyamf/util.pyx":901
  *         return self.pack_int(1, <long>ret)
  * 
  *     cdef int write_ushort(self, unsigned short ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5014,14 +6029,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_ushort(struct __py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_ushort");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":747
+  /* "/root/package/cpyamf/util.pyx":908
  *         @type ret: C{int}
  *         """
  *         return self.pack_uint(2, <unsigned long>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_short(self, short ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 2, ((unsigned long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 747; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 2, ((unsigned long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 908; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5035,7 +6050,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_ushort(struct __py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":749
+/* "/root/package/cpyamf/util.pyx":910
  *         return self.pack_uint(2, <unsigned long>ret)
  * 
  *     cdef int write_short(self, short ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5048,14 +6063,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_short(struct __pyx
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_short");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":756
+  /* "/root/package/cpyamf/util.pyx":917
  *         @type ret: C{int}
  *         """
  *         return self.pack_int(2, <long>ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_ulong(self, unsigned long ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 2, ((long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 2, ((long)__pyx_v_ret)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 917; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5069,7 +6084,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_short(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":758
+/* "/root/package/cpyamf/util.pyx":919
  *         return self.pack_int(2, <long>ret)
  * 
  *     cdef int write_ulong(self, unsigned long ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5082,14 +6097,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_ulong(struct __pyx
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_ulong");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":765
+  /* "/root/package/cpyamf/util.pyx":926
  *         @type ret: C{int}
  *         """
  *         return self.pack_uint(4, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_long(self, long ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 765; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 926; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5103,7 +6118,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_ulong(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":767
+/* "/root/package/cpyamf/util.pyx":928
  *         return self.pack_uint(4, ret)
  * 
  *     cdef int write_long(self, long ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5116,14 +6131,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_long(struct __pyx_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_long");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":774
+  /* "/root/package/cpyamf/util.pyx":935
  *         @type ret: C{int}
  *         """
  *         return self.pack_int(4, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_24bit_uint(self, unsigned long ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 4, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 935; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5137,7 +6152,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_long(struct __pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":776
+/* "/root/package/cpyamf/util.pyx":937
  *         return self.pack_int(4, ret)
  * 
  *     cdef int write_24bit_uint(self, unsigned long ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5150,14 +6165,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_24bit_uint(struct
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_24bit_uint");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":783
+  /* "/root/package/cpyamf/util.pyx":944
  *         @type ret: C{int}
  *         """
  *         return self.pack_uint(3, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef int write_24bit_int(self, long ret) except? -1:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 3, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_uint(__pyx_v_self, 3, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 944; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5171,7 +6186,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_24bit_uint(struct
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":785
+/* "/root/package/cpyamf/util.pyx":946
  *         return self.pack_uint(3, ret)
  * 
  *     cdef int write_24bit_int(self, long ret) except? -1:             # <<<<<<<<<<<<<<
@@ -5184,14 +6199,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_24bit_int(struct _
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_24bit_int");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":792
+  /* "/root/package/cpyamf/util.pyx":953
  *         @type ret: C{int}
  *         """
  *         return self.pack_int(3, ret)             # <<<<<<<<<<<<<<
  * 
  *     cdef object read_utf8_string(self, unsigned int l):
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 3, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->pack_int(__pyx_v_self, 3, __pyx_v_ret); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 953; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
@@ -5205,7 +6220,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_24bit_int(struct _
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":794
+/* "/root/package/cpyamf/util.pyx":955
  *         return self.pack_int(3, ret)
  * 
  *     cdef object read_utf8_string(self, unsigned int l):             # <<<<<<<<<<<<<<
@@ -5225,7 +6240,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":800
+  /* "/root/package/cpyamf/util.pyx":961
  *         @rtype: C{unicode}
  *         """
  *         cdef char* buf = NULL             # <<<<<<<<<<<<<<
@@ -5234,7 +6249,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":803
+  /* "/root/package/cpyamf/util.pyx":964
  *         cdef object ret
  * 
  *         if l == 0:             # <<<<<<<<<<<<<<
@@ -5244,7 +6259,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
   __pyx_t_1 = (__pyx_v_l == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":804
+    /* "/root/package/cpyamf/util.pyx":965
  * 
  *         if l == 0:
  *             return unicode('')             # <<<<<<<<<<<<<<
@@ -5252,12 +6267,12 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
  *         if self.read(&buf, l) == -1:
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_5));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
-    __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)&PyUnicode_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_6));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
+    __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)&PyUnicode_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_3;
@@ -5267,18 +6282,18 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":806
+  /* "/root/package/cpyamf/util.pyx":967
  *             return unicode('')
  * 
  *         if self.read(&buf, l) == -1:             # <<<<<<<<<<<<<<
  *             if buf != NULL:
  *                 PyMem_Free(buf)
  */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (&__pyx_v_buf), __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (&__pyx_v_buf), __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 967; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_1 = (__pyx_t_4 == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":807
+    /* "/root/package/cpyamf/util.pyx":968
  * 
  *         if self.read(&buf, l) == -1:
  *             if buf != NULL:             # <<<<<<<<<<<<<<
@@ -5288,7 +6303,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
     __pyx_t_1 = (__pyx_v_buf != NULL);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":808
+      /* "/root/package/cpyamf/util.pyx":969
  *         if self.read(&buf, l) == -1:
  *             if buf != NULL:
  *                 PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -5300,7 +6315,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
     }
     __pyx_L5:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":810
+    /* "/root/package/cpyamf/util.pyx":971
  *                 PyMem_Free(buf)
  * 
  *             return             # <<<<<<<<<<<<<<
@@ -5314,20 +6329,20 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":812
+  /* "/root/package/cpyamf/util.pyx":973
  *             return
  * 
  *         ret = PyUnicode_DecodeUTF8(buf, l, 'strict')             # <<<<<<<<<<<<<<
  *         PyMem_Free(buf)
  * 
  */
-  __pyx_t_3 = PyUnicode_DecodeUTF8(__pyx_v_buf, __pyx_v_l, __pyx_k__strict); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 812; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyUnicode_DecodeUTF8(__pyx_v_buf, __pyx_v_l, __pyx_k__strict); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 973; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":813
+  /* "/root/package/cpyamf/util.pyx":974
  * 
  *         ret = PyUnicode_DecodeUTF8(buf, l, 'strict')
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -5336,7 +6351,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":815
+  /* "/root/package/cpyamf/util.pyx":976
  *         PyMem_Free(buf)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -5363,7 +6378,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_utf8_string(s
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":817
+/* "/root/package/cpyamf/util.pyx":978
  *         return ret
  * 
  *     cdef int write_utf8_string(self, object obj) except? -1:             # <<<<<<<<<<<<<<
@@ -5385,7 +6400,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   __Pyx_INCREF(__pyx_v_obj);
   __pyx_v_encoded_string = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":825
+  /* "/root/package/cpyamf/util.pyx":986
  *         """
  *         cdef object encoded_string
  *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
@@ -5394,7 +6409,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":826
+  /* "/root/package/cpyamf/util.pyx":987
  *         cdef object encoded_string
  *         cdef char *buf = NULL
  *         cdef Py_ssize_t l = -1             # <<<<<<<<<<<<<<
@@ -5403,7 +6418,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
  */
   __pyx_v_l = -1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":828
+  /* "/root/package/cpyamf/util.pyx":989
  *         cdef Py_ssize_t l = -1
  * 
  *         if PyUnicode_Check(obj) == 1:             # <<<<<<<<<<<<<<
@@ -5413,14 +6428,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   __pyx_t_1 = (PyUnicode_Check(__pyx_v_obj) == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":829
+    /* "/root/package/cpyamf/util.pyx":990
  * 
  *         if PyUnicode_Check(obj) == 1:
  *             encoded_string = PyUnicode_AsUTF8String(obj)             # <<<<<<<<<<<<<<
  *         elif PyString_Check(obj) == 1:
  *             encoded_string = obj
  */
-    __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_obj); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_obj); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 990; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_v_encoded_string);
     __pyx_v_encoded_string = __pyx_t_2;
@@ -5428,7 +6443,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
     goto __pyx_L3;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":830
+  /* "/root/package/cpyamf/util.pyx":991
  *         if PyUnicode_Check(obj) == 1:
  *             encoded_string = PyUnicode_AsUTF8String(obj)
  *         elif PyString_Check(obj) == 1:             # <<<<<<<<<<<<<<
@@ -5438,7 +6453,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   __pyx_t_1 = (PyString_Check(__pyx_v_obj) == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":831
+    /* "/root/package/cpyamf/util.pyx":992
  *             encoded_string = PyUnicode_AsUTF8String(obj)
  *         elif PyString_Check(obj) == 1:
  *             encoded_string = obj             # <<<<<<<<<<<<<<
@@ -5452,28 +6467,28 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":833
+    /* "/root/package/cpyamf/util.pyx":994
  *             encoded_string = obj
  *         else:
  *             raise TypeError('value must be Unicode or str')             # <<<<<<<<<<<<<<
  * 
  *         if <PyObject *>encoded_string == NULL:
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 994; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_6));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_7));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 994; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 994; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":835
+  /* "/root/package/cpyamf/util.pyx":996
  *             raise TypeError('value must be Unicode or str')
  * 
  *         if <PyObject *>encoded_string == NULL:             # <<<<<<<<<<<<<<
@@ -5483,7 +6498,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   __pyx_t_1 = (((PyObject *)__pyx_v_encoded_string) == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":836
+    /* "/root/package/cpyamf/util.pyx":997
  * 
  *         if <PyObject *>encoded_string == NULL:
  *             return -1             # <<<<<<<<<<<<<<
@@ -5496,7 +6511,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":838
+  /* "/root/package/cpyamf/util.pyx":999
  *             return -1
  * 
  *         if PyString_AsStringAndSize(encoded_string, &buf, &l) == -1:             # <<<<<<<<<<<<<<
@@ -5506,7 +6521,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   __pyx_t_1 = (PyString_AsStringAndSize(__pyx_v_encoded_string, (&__pyx_v_buf), (&__pyx_v_l)) == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":839
+    /* "/root/package/cpyamf/util.pyx":1000
  * 
  *         if PyString_AsStringAndSize(encoded_string, &buf, &l) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -5519,18 +6534,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":841
+  /* "/root/package/cpyamf/util.pyx":1002
  *             return -1
  * 
  *         if self.write(buf, l) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_buf, __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1002; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_1 = (__pyx_t_4 == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":842
+    /* "/root/package/cpyamf/util.pyx":1003
  * 
  *         if self.write(buf, l) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -5543,7 +6558,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":844
+  /* "/root/package/cpyamf/util.pyx":1005
  *             return -1
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -5568,7 +6583,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_utf8_string(struct
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":846
+/* "/root/package/cpyamf/util.pyx":1007
  *         return 0
  * 
  *     cdef int read_double(self, double *obj) except? -1:             # <<<<<<<<<<<<<<
@@ -5585,7 +6600,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
   __Pyx_RefNannySetupContext("read_double");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":850
+  /* "/root/package/cpyamf/util.pyx":1011
  *         Reads an 8 byte float from the stream.
  *         """
  *         cdef unsigned char *buf = NULL             # <<<<<<<<<<<<<<
@@ -5594,7 +6609,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":851
+  /* "/root/package/cpyamf/util.pyx":1012
  *         """
  *         cdef unsigned char *buf = NULL
  *         cdef int done = 0             # <<<<<<<<<<<<<<
@@ -5603,18 +6618,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
   __pyx_v_done = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":853
+  /* "/root/package/cpyamf/util.pyx":1014
  *         cdef int done = 0
  * 
  *         if self.read(<char **>&buf, 8) == -1:             # <<<<<<<<<<<<<<
  *             if buf != NULL:
  *                 PyMem_Free(buf)
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, ((char **)(&__pyx_v_buf)), 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, ((char **)(&__pyx_v_buf)), 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1014; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":854
+    /* "/root/package/cpyamf/util.pyx":1015
  * 
  *         if self.read(<char **>&buf, 8) == -1:
  *             if buf != NULL:             # <<<<<<<<<<<<<<
@@ -5624,7 +6639,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_2 = (__pyx_v_buf != NULL);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":855
+      /* "/root/package/cpyamf/util.pyx":1016
  *         if self.read(<char **>&buf, 8) == -1:
  *             if buf != NULL:
  *                 PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -5636,7 +6651,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     }
     __pyx_L4:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":857
+    /* "/root/package/cpyamf/util.pyx":1018
  *                 PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -5649,7 +6664,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":859
+  /* "/root/package/cpyamf/util.pyx":1020
  *             return -1
  * 
  *         if float_broken == 1:             # <<<<<<<<<<<<<<
@@ -5659,7 +6674,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
   __pyx_t_2 = (__pyx_v_6cpyamf_4util_float_broken == 1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":860
+    /* "/root/package/cpyamf/util.pyx":1021
  * 
  *         if float_broken == 1:
  *             if is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -5669,7 +6684,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":861
+      /* "/root/package/cpyamf/util.pyx":1022
  *         if float_broken == 1:
  *             if is_big_endian(SYSTEM_ENDIAN):
  *                 if not is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -5679,14 +6694,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       __pyx_t_2 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian));
       if (__pyx_t_2) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":862
+        /* "/root/package/cpyamf/util.pyx":1023
  *             if is_big_endian(SYSTEM_ENDIAN):
  *                 if not is_big_endian(self._endian):
  *                     swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  *             else:
  *                 if is_big_endian(self._endian):
  */
-        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1023; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L7;
       }
       __pyx_L7:;
@@ -5694,7 +6709,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     }
     /*else*/ {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":864
+      /* "/root/package/cpyamf/util.pyx":1025
  *                     swap_bytes(buf, 8)
  *             else:
  *                 if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -5704,21 +6719,21 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
       if (__pyx_t_1) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":865
+        /* "/root/package/cpyamf/util.pyx":1026
  *             else:
  *                 if is_big_endian(self._endian):
  *                     swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *             if memcmp(buf, &system_nan, 8) == 0:
  */
-        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1026; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L8;
       }
       __pyx_L8:;
     }
     __pyx_L6:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":867
+    /* "/root/package/cpyamf/util.pyx":1028
  *                     swap_bytes(buf, 8)
  * 
  *             if memcmp(buf, &system_nan, 8) == 0:             # <<<<<<<<<<<<<<
@@ -5728,7 +6743,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_2 = (memcmp(__pyx_v_buf, (&__pyx_v_6cpyamf_4util_system_nan), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":868
+      /* "/root/package/cpyamf/util.pyx":1029
  * 
  *             if memcmp(buf, &system_nan, 8) == 0:
  *                 memcpy(obj, &system_nan, 8)             # <<<<<<<<<<<<<<
@@ -5737,7 +6752,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
       memcpy(__pyx_v_obj, (&__pyx_v_6cpyamf_4util_system_nan), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":870
+      /* "/root/package/cpyamf/util.pyx":1031
  *                 memcpy(obj, &system_nan, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -5748,7 +6763,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       goto __pyx_L9;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":871
+    /* "/root/package/cpyamf/util.pyx":1032
  * 
  *                 done = 1
  *             elif memcmp(buf, &system_posinf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -5758,7 +6773,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_2 = (memcmp(__pyx_v_buf, (&__pyx_v_6cpyamf_4util_system_posinf), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":872
+      /* "/root/package/cpyamf/util.pyx":1033
  *                 done = 1
  *             elif memcmp(buf, &system_posinf, 8) == 0:
  *                 memcpy(obj, &system_posinf, 8)             # <<<<<<<<<<<<<<
@@ -5767,7 +6782,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
       memcpy(__pyx_v_obj, (&__pyx_v_6cpyamf_4util_system_posinf), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":874
+      /* "/root/package/cpyamf/util.pyx":1035
  *                 memcpy(obj, &system_posinf, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -5778,7 +6793,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       goto __pyx_L9;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":875
+    /* "/root/package/cpyamf/util.pyx":1036
  * 
  *                 done = 1
  *             elif memcmp(buf, &system_neginf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -5788,7 +6803,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_2 = (memcmp(__pyx_v_buf, (&__pyx_v_6cpyamf_4util_system_neginf), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":876
+      /* "/root/package/cpyamf/util.pyx":1037
  *                 done = 1
  *             elif memcmp(buf, &system_neginf, 8) == 0:
  *                 memcpy(obj, &system_neginf, 8)             # <<<<<<<<<<<<<<
@@ -5797,7 +6812,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
       memcpy(__pyx_v_obj, (&__pyx_v_6cpyamf_4util_system_neginf), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":878
+      /* "/root/package/cpyamf/util.pyx":1039
  *                 memcpy(obj, &system_neginf, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -5809,7 +6824,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     }
     __pyx_L9:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":880
+    /* "/root/package/cpyamf/util.pyx":1041
  *                 done = 1
  * 
  *             if done == 1:             # <<<<<<<<<<<<<<
@@ -5819,7 +6834,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_2 = (__pyx_v_done == 1);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":881
+      /* "/root/package/cpyamf/util.pyx":1042
  * 
  *             if done == 1:
  *                 PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -5828,7 +6843,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
       PyMem_Free(__pyx_v_buf);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":883
+      /* "/root/package/cpyamf/util.pyx":1044
  *                 PyMem_Free(buf)
  * 
  *                 return 0             # <<<<<<<<<<<<<<
@@ -5841,7 +6856,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     }
     __pyx_L10:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":885
+    /* "/root/package/cpyamf/util.pyx":1046
  *                 return 0
  * 
  *             if is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -5851,7 +6866,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":886
+      /* "/root/package/cpyamf/util.pyx":1047
  * 
  *             if is_big_endian(SYSTEM_ENDIAN):
  *                 if not is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -5861,14 +6876,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       __pyx_t_2 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian));
       if (__pyx_t_2) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":887
+        /* "/root/package/cpyamf/util.pyx":1048
  *             if is_big_endian(SYSTEM_ENDIAN):
  *                 if not is_big_endian(self._endian):
  *                     swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  *             else:
  *                 if is_big_endian(self._endian):
  */
-        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 887; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1048; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L12;
       }
       __pyx_L12:;
@@ -5876,7 +6891,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
     }
     /*else*/ {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":889
+      /* "/root/package/cpyamf/util.pyx":1050
  *                     swap_bytes(buf, 8)
  *             else:
  *                 if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -5886,14 +6901,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
       __pyx_t_1 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
       if (__pyx_t_1) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":890
+        /* "/root/package/cpyamf/util.pyx":1051
  *             else:
  *                 if is_big_endian(self._endian):
  *                     swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *         obj[0] = _PyFloat_Unpack8(buf, not is_big_endian(self._endian))
  */
-        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 890; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1051; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L13;
       }
       __pyx_L13:;
@@ -5903,7 +6918,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":892
+  /* "/root/package/cpyamf/util.pyx":1053
  *                     swap_bytes(buf, 8)
  * 
  *         obj[0] = _PyFloat_Unpack8(buf, not is_big_endian(self._endian))             # <<<<<<<<<<<<<<
@@ -5912,7 +6927,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
   (__pyx_v_obj[0]) = _PyFloat_Unpack8(__pyx_v_buf, (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":893
+  /* "/root/package/cpyamf/util.pyx":1054
  * 
  *         obj[0] = _PyFloat_Unpack8(buf, not is_big_endian(self._endian))
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -5921,7 +6936,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":895
+  /* "/root/package/cpyamf/util.pyx":1056
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -5942,7 +6957,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_double(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":897
+/* "/root/package/cpyamf/util.pyx":1058
  *         return 0
  * 
  *     cdef int write_double(self, double val) except? -1:             # <<<<<<<<<<<<<<
@@ -5959,7 +6974,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   __Pyx_RefNannySetupContext("write_double");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":906
+  /* "/root/package/cpyamf/util.pyx":1067
  *         cdef unsigned char *buf
  *         cdef unsigned char *foo
  *         cdef int done = 0             # <<<<<<<<<<<<<<
@@ -5968,7 +6983,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
   __pyx_v_done = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":908
+  /* "/root/package/cpyamf/util.pyx":1069
  *         cdef int done = 0
  * 
  *         buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * 8)             # <<<<<<<<<<<<<<
@@ -5977,7 +6992,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
   __pyx_v_buf = ((unsigned char *)PyMem_Malloc(((sizeof(unsigned char *)) * 8)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":910
+  /* "/root/package/cpyamf/util.pyx":1071
  *         buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * 8)
  * 
  *         if buf == NULL:             # <<<<<<<<<<<<<<
@@ -5987,7 +7002,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   __pyx_t_1 = (__pyx_v_buf == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":911
+    /* "/root/package/cpyamf/util.pyx":1072
  * 
  *         if buf == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -5995,12 +7010,12 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  *         if float_broken == 1:
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":913
+  /* "/root/package/cpyamf/util.pyx":1074
  *             raise MemoryError
  * 
  *         if float_broken == 1:             # <<<<<<<<<<<<<<
@@ -6010,7 +7025,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   __pyx_t_1 = (__pyx_v_6cpyamf_4util_float_broken == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":914
+    /* "/root/package/cpyamf/util.pyx":1075
  * 
  *         if float_broken == 1:
  *             if memcmp(&val, &system_nan, 8) == 0:             # <<<<<<<<<<<<<<
@@ -6020,7 +7035,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     __pyx_t_1 = (memcmp((&__pyx_v_val), (&__pyx_v_6cpyamf_4util_system_nan), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":915
+      /* "/root/package/cpyamf/util.pyx":1076
  *         if float_broken == 1:
  *             if memcmp(&val, &system_nan, 8) == 0:
  *                 memcpy(buf, &val, 8)             # <<<<<<<<<<<<<<
@@ -6029,7 +7044,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
       memcpy(__pyx_v_buf, (&__pyx_v_val), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":917
+      /* "/root/package/cpyamf/util.pyx":1078
  *                 memcpy(buf, &val, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -6040,7 +7055,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
       goto __pyx_L5;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":918
+    /* "/root/package/cpyamf/util.pyx":1079
  * 
  *                 done = 1
  *             elif memcmp(&val, &system_posinf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -6050,7 +7065,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     __pyx_t_1 = (memcmp((&__pyx_v_val), (&__pyx_v_6cpyamf_4util_system_posinf), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":919
+      /* "/root/package/cpyamf/util.pyx":1080
  *                 done = 1
  *             elif memcmp(&val, &system_posinf, 8) == 0:
  *                 memcpy(buf, &val, 8)             # <<<<<<<<<<<<<<
@@ -6059,7 +7074,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
       memcpy(__pyx_v_buf, (&__pyx_v_val), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":921
+      /* "/root/package/cpyamf/util.pyx":1082
  *                 memcpy(buf, &val, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -6070,7 +7085,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
       goto __pyx_L5;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":922
+    /* "/root/package/cpyamf/util.pyx":1083
  * 
  *                 done = 1
  *             elif memcmp(&val, &system_neginf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -6080,7 +7095,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     __pyx_t_1 = (memcmp((&__pyx_v_val), (&__pyx_v_6cpyamf_4util_system_neginf), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":923
+      /* "/root/package/cpyamf/util.pyx":1084
  *                 done = 1
  *             elif memcmp(&val, &system_neginf, 8) == 0:
  *                 memcpy(buf, &val, 8)             # <<<<<<<<<<<<<<
@@ -6089,7 +7104,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
       memcpy(__pyx_v_buf, (&__pyx_v_val), 8);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":925
+      /* "/root/package/cpyamf/util.pyx":1086
  *                 memcpy(buf, &val, 8)
  * 
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -6101,7 +7116,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     }
     __pyx_L5:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":927
+    /* "/root/package/cpyamf/util.pyx":1088
  *                 done = 1
  * 
  *             if done == 1:             # <<<<<<<<<<<<<<
@@ -6111,7 +7126,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     __pyx_t_1 = (__pyx_v_done == 1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":928
+      /* "/root/package/cpyamf/util.pyx":1089
  * 
  *             if done == 1:
  *                 if is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -6121,7 +7136,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
       __pyx_t_2 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN);
       if (__pyx_t_2) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":929
+        /* "/root/package/cpyamf/util.pyx":1090
  *             if done == 1:
  *                 if is_big_endian(SYSTEM_ENDIAN):
  *                     if not is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -6131,14 +7146,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
         __pyx_t_1 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian));
         if (__pyx_t_1) {
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":930
+          /* "/root/package/cpyamf/util.pyx":1091
  *                 if is_big_endian(SYSTEM_ENDIAN):
  *                     if not is_big_endian(self._endian):
  *                         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  *                 else:
  *                     if is_big_endian(self._endian):
  */
-          __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 930; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1091; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L8;
         }
         __pyx_L8:;
@@ -6146,7 +7161,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
       }
       /*else*/ {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":932
+        /* "/root/package/cpyamf/util.pyx":1093
  *                         swap_bytes(buf, 8)
  *                 else:
  *                     if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -6156,14 +7171,14 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
         __pyx_t_2 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
         if (__pyx_t_2) {
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":933
+          /* "/root/package/cpyamf/util.pyx":1094
  *                 else:
  *                     if is_big_endian(self._endian):
  *                         swap_bytes(buf, 8)             # <<<<<<<<<<<<<<
  * 
  *         if done == 0:
  */
-          __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_2 = __pyx_f_6cpyamf_4util_swap_bytes(__pyx_v_buf, 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1094; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L9;
         }
         __pyx_L9:;
@@ -6176,7 +7191,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":935
+  /* "/root/package/cpyamf/util.pyx":1096
  *                         swap_bytes(buf, 8)
  * 
  *         if done == 0:             # <<<<<<<<<<<<<<
@@ -6186,7 +7201,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   __pyx_t_1 = (__pyx_v_done == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":936
+    /* "/root/package/cpyamf/util.pyx":1097
  * 
  *         if done == 0:
  *             if _PyFloat_Pack8(val, <unsigned char *>buf, not is_big_endian(self._endian)) == -1:             # <<<<<<<<<<<<<<
@@ -6196,7 +7211,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
     __pyx_t_1 = (_PyFloat_Pack8(__pyx_v_val, ((unsigned char *)__pyx_v_buf), (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian))) == -1);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":937
+      /* "/root/package/cpyamf/util.pyx":1098
  *         if done == 0:
  *             if _PyFloat_Pack8(val, <unsigned char *>buf, not is_big_endian(self._endian)) == -1:
  *                 PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6205,7 +7220,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
       PyMem_Free(__pyx_v_buf);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":939
+      /* "/root/package/cpyamf/util.pyx":1100
  *                 PyMem_Free(buf)
  * 
  *                 return -1             # <<<<<<<<<<<<<<
@@ -6221,18 +7236,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   }
   __pyx_L10:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":941
+  /* "/root/package/cpyamf/util.pyx":1102
  *                 return -1
  * 
  *         if self.write(<char *>buf, 8) == -1:             # <<<<<<<<<<<<<<
  *             PyMem_Free(buf)
  * 
  */
-  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((char *)__pyx_v_buf), 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 941; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((char *)__pyx_v_buf), 8); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_1 = (__pyx_t_2 == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":942
+    /* "/root/package/cpyamf/util.pyx":1103
  * 
  *         if self.write(<char *>buf, 8) == -1:
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6241,7 +7256,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
     PyMem_Free(__pyx_v_buf);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":944
+    /* "/root/package/cpyamf/util.pyx":1105
  *             PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -6254,7 +7269,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   }
   __pyx_L12:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":946
+  /* "/root/package/cpyamf/util.pyx":1107
  *             return -1
  * 
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6263,7 +7278,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":948
+  /* "/root/package/cpyamf/util.pyx":1109
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -6284,7 +7299,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_double(struct __py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":950
+/* "/root/package/cpyamf/util.pyx":1111
  *         return 0
  * 
  *     cdef int read_float(self, float *x):             # <<<<<<<<<<<<<<
@@ -6301,7 +7316,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
   __Pyx_RefNannySetupContext("read_float");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":954
+  /* "/root/package/cpyamf/util.pyx":1115
  *         Reads a 4 byte float from the stream.
  *         """
  *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
@@ -6310,7 +7325,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":955
+  /* "/root/package/cpyamf/util.pyx":1116
  *         """
  *         cdef char *buf = NULL
  *         cdef unsigned char le = 0             # <<<<<<<<<<<<<<
@@ -6319,18 +7334,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
  */
   __pyx_v_le = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":957
+  /* "/root/package/cpyamf/util.pyx":1118
  *         cdef unsigned char le = 0
  * 
  *         if self.read(&buf, 4) == -1:             # <<<<<<<<<<<<<<
  *             if buf != NULL:
  *                 PyMem_Free(buf)
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (&__pyx_v_buf), 4); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (&__pyx_v_buf), 4); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":958
+    /* "/root/package/cpyamf/util.pyx":1119
  * 
  *         if self.read(&buf, 4) == -1:
  *             if buf != NULL:             # <<<<<<<<<<<<<<
@@ -6340,7 +7355,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
     __pyx_t_2 = (__pyx_v_buf != NULL);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":959
+      /* "/root/package/cpyamf/util.pyx":1120
  *         if self.read(&buf, 4) == -1:
  *             if buf != NULL:
  *                 PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6352,7 +7367,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
     }
     __pyx_L4:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":961
+    /* "/root/package/cpyamf/util.pyx":1122
  *                 PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -6365,7 +7380,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":963
+  /* "/root/package/cpyamf/util.pyx":1124
  *             return -1
  * 
  *         if not is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -6375,7 +7390,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
   __pyx_t_2 = (!__pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian));
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":964
+    /* "/root/package/cpyamf/util.pyx":1125
  * 
  *         if not is_big_endian(self._endian):
  *             le = 1             # <<<<<<<<<<<<<<
@@ -6387,7 +7402,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":966
+  /* "/root/package/cpyamf/util.pyx":1127
  *             le = 1
  * 
  *         x[0] = _PyFloat_Unpack4(<unsigned char *>buf, le)             # <<<<<<<<<<<<<<
@@ -6396,7 +7411,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
  */
   (__pyx_v_x[0]) = _PyFloat_Unpack4(((unsigned char *)__pyx_v_buf), __pyx_v_le);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":967
+  /* "/root/package/cpyamf/util.pyx":1128
  * 
  *         x[0] = _PyFloat_Unpack4(<unsigned char *>buf, le)
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6405,7 +7420,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":969
+  /* "/root/package/cpyamf/util.pyx":1130
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -6426,7 +7441,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_read_float(struct __pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":971
+/* "/root/package/cpyamf/util.pyx":1132
  *         return 0
  * 
  *     cdef int write_float(self, float c):             # <<<<<<<<<<<<<<
@@ -6444,7 +7459,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   __Pyx_RefNannySetupContext("write_float");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":979
+  /* "/root/package/cpyamf/util.pyx":1140
  *         """
  *         cdef unsigned char *buf
  *         cdef unsigned char le = 1             # <<<<<<<<<<<<<<
@@ -6453,7 +7468,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
  */
   __pyx_v_le = 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":981
+  /* "/root/package/cpyamf/util.pyx":1142
  *         cdef unsigned char le = 1
  * 
  *         buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * 4)             # <<<<<<<<<<<<<<
@@ -6462,7 +7477,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
  */
   __pyx_v_buf = ((unsigned char *)PyMem_Malloc(((sizeof(unsigned char *)) * 4)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":983
+  /* "/root/package/cpyamf/util.pyx":1144
  *         buf = <unsigned char *>PyMem_Malloc(sizeof(unsigned char *) * 4)
  * 
  *         if buf == NULL:             # <<<<<<<<<<<<<<
@@ -6472,23 +7487,23 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   __pyx_t_1 = (__pyx_v_buf == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":984
+    /* "/root/package/cpyamf/util.pyx":1145
  * 
  *         if buf == NULL:
  *             raise MemoryError()             # <<<<<<<<<<<<<<
  * 
  *         if is_big_endian(self._endian):
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_MemoryError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 984; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_MemoryError, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 984; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":986
+  /* "/root/package/cpyamf/util.pyx":1147
  *             raise MemoryError()
  * 
  *         if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -6498,7 +7513,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   __pyx_t_3 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_self->_endian);
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":987
+    /* "/root/package/cpyamf/util.pyx":1148
  * 
  *         if is_big_endian(self._endian):
  *             le = 0             # <<<<<<<<<<<<<<
@@ -6510,7 +7525,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":989
+  /* "/root/package/cpyamf/util.pyx":1150
  *             le = 0
  * 
  *         if _PyFloat_Pack4(c, <unsigned char *>buf, le) == -1:             # <<<<<<<<<<<<<<
@@ -6520,7 +7535,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   __pyx_t_1 = (_PyFloat_Pack4(__pyx_v_c, ((unsigned char *)__pyx_v_buf), __pyx_v_le) == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":990
+    /* "/root/package/cpyamf/util.pyx":1151
  * 
  *         if _PyFloat_Pack4(c, <unsigned char *>buf, le) == -1:
  *             PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6529,7 +7544,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
  */
     PyMem_Free(__pyx_v_buf);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":992
+    /* "/root/package/cpyamf/util.pyx":1153
  *             PyMem_Free(buf)
  * 
  *             return -1             # <<<<<<<<<<<<<<
@@ -6542,18 +7557,18 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":994
+  /* "/root/package/cpyamf/util.pyx":1155
  *             return -1
  * 
  *         if self.write(<char *>buf, 4) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((char *)__pyx_v_buf), 4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 994; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((char *)__pyx_v_buf), 4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_1 = (__pyx_t_3 == -1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":995
+    /* "/root/package/cpyamf/util.pyx":1156
  * 
  *         if self.write(<char *>buf, 4) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -6566,7 +7581,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":997
+  /* "/root/package/cpyamf/util.pyx":1158
  *             return -1
  * 
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -6575,7 +7590,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":999
+  /* "/root/package/cpyamf/util.pyx":1160
  *         PyMem_Free(buf)
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -6597,7 +7612,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float(struct __pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1001
+/* "/root/package/cpyamf/util.pyx":1162
  *         return 0
  * 
  *     cdef int append(self, object obj) except? -1:             # <<<<<<<<<<<<<<
@@ -6616,7 +7631,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_append(struct __pyx_obj_
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1002
+  /* "/root/package/cpyamf/util.pyx":1163
  * 
  *     cdef int append(self, object obj) except? -1:
  *         cdef int i = self.pos             # <<<<<<<<<<<<<<
@@ -6625,7 +7640,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_append(struct __pyx_obj_
  */
   __pyx_v_i = __pyx_v_self->pos;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1004
+  /* "/root/package/cpyamf/util.pyx":1165
  *         cdef int i = self.pos
  * 
  *         self.pos = self.length             # <<<<<<<<<<<<<<
@@ -6634,46 +7649,46 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_append(struct __pyx_obj_
  */
   __pyx_v_self->pos = __pyx_v_self->length;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1006
+  /* "/root/package/cpyamf/util.pyx":1167
  *         self.pos = self.length
  * 
  *         if hasattr(obj, 'getvalue'):             # <<<<<<<<<<<<<<
  *             self.write_utf8_string(obj.getvalue())
  *         else:
  */
-  __pyx_t_1 = PyObject_HasAttr(__pyx_v_obj, ((PyObject *)__pyx_n_s__getvalue)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1006; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_HasAttr(__pyx_v_obj, ((PyObject *)__pyx_n_s__getvalue)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1007
+    /* "/root/package/cpyamf/util.pyx":1168
  * 
  *         if hasattr(obj, 'getvalue'):
  *             self.write_utf8_string(obj.getvalue())             # <<<<<<<<<<<<<<
  *         else:
  *             self.write_utf8_string(obj)
  */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s__getvalue); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_obj, __pyx_n_s__getvalue); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write_utf8_string(__pyx_v_self, __pyx_t_3); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write_utf8_string(__pyx_v_self, __pyx_t_3); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L3;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1009
+    /* "/root/package/cpyamf/util.pyx":1170
  *             self.write_utf8_string(obj.getvalue())
  *         else:
  *             self.write_utf8_string(obj)             # <<<<<<<<<<<<<<
  * 
  *         self.pos = i
  */
-    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write_utf8_string(__pyx_v_self, __pyx_v_obj); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1009; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self->__pyx_vtab)->write_utf8_string(__pyx_v_self, __pyx_v_obj); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1011
+  /* "/root/package/cpyamf/util.pyx":1172
  *             self.write_utf8_string(obj)
  * 
  *         self.pos = i             # <<<<<<<<<<<<<<
@@ -6696,7 +7711,7 @@ static  int __pyx_f_6cpyamf_4util_19cBufferedByteStream_append(struct __pyx_obj_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1021
+/* "/root/package/cpyamf/util.pyx":1182
  *     """
  * 
  *     def __init__(self, buf=None):             # <<<<<<<<<<<<<<
@@ -6712,12 +7727,13 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
   PyObject *__pyx_v_old_pos;
   int __pyx_r;
   int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
+  PyObject *__pyx_t_5 = NULL;
   int __pyx_t_6;
   int __pyx_t_7;
+  int __pyx_t_8;
   static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__buf,0};
   __Pyx_RefNannySetupContext("__init__");
   if (unlikely(__pyx_kwds)) {
@@ -6737,7 +7753,7 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1021; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1182; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_buf = values[0];
   } else {
@@ -6750,7 +7766,7 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1021; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1182; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.__init__");
   return -1;
@@ -6760,21 +7776,42 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
   __pyx_v_x = ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)Py_None); __Pyx_INCREF(Py_None);
   __pyx_v_old_pos = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1028
+  /* "/root/package/cpyamf/util.pyx":1189
  *         cdef cBufferedByteStream x
  * 
  *         if buf is None:             # <<<<<<<<<<<<<<
  *             pass
- *         elif isinstance(buf, cBufferedByteStream):
+ *         elif isinstance(buf, buffer_types):
  */
   __pyx_t_1 = (__pyx_v_buf == Py_None);
   if (__pyx_t_1) {
     goto __pyx_L6;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1030
+  /* "/root/package/cpyamf/util.pyx":1191
  *         if buf is None:
  *             pass
+ *         elif isinstance(buf, buffer_types):             # <<<<<<<<<<<<<<
+ *             self.wrap(buf)
+ *         elif isinstance(buf, cBufferedByteStream):
+ */
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_buf, __pyx_v_6cpyamf_4util_buffer_types); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":1192
+ *             pass
+ *         elif isinstance(buf, buffer_types):
+ *             self.wrap(buf)             # <<<<<<<<<<<<<<
+ *         elif isinstance(buf, cBufferedByteStream):
+ *             x = <cBufferedByteStream>buf
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_BufferedByteStream *)((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.wrap(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_buf); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+
+  /* "/root/package/cpyamf/util.pyx":1193
+ *         elif isinstance(buf, buffer_types):
+ *             self.wrap(buf)
  *         elif isinstance(buf, cBufferedByteStream):             # <<<<<<<<<<<<<<
  *             x = <cBufferedByteStream>buf
  *             self.write(x.getvalue())
@@ -6782,8 +7819,8 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
   __pyx_t_1 = PyObject_TypeCheck(__pyx_v_buf, ((PyTypeObject *)((PyObject*)__pyx_ptype_6cpyamf_4util_cBufferedByteStream))); 
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1031
- *             pass
+    /* "/root/package/cpyamf/util.pyx":1194
+ *             self.wrap(buf)
  *         elif isinstance(buf, cBufferedByteStream):
  *             x = <cBufferedByteStream>buf             # <<<<<<<<<<<<<<
  *             self.write(x.getvalue())
@@ -6793,261 +7830,261 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
     __Pyx_DECREF(((PyObject *)__pyx_v_x));
     __pyx_v_x = ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_buf);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1032
+    /* "/root/package/cpyamf/util.pyx":1195
  *         elif isinstance(buf, cBufferedByteStream):
  *             x = <cBufferedByteStream>buf
  *             self.write(x.getvalue())             # <<<<<<<<<<<<<<
  *         elif isinstance(buf, (str, unicode)):
  *             self.write(buf)
  */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_x->__pyx_vtab)->getvalue(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream *)__pyx_v_x->__pyx_vtab)->getvalue(__pyx_v_x); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     goto __pyx_L6;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1033
+  /* "/root/package/cpyamf/util.pyx":1196
  *             x = <cBufferedByteStream>buf
  *             self.write(x.getvalue())
  *         elif isinstance(buf, (str, unicode)):             # <<<<<<<<<<<<<<
  *             self.write(buf)
  *         elif hasattr(buf, 'getvalue'):
  */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1033; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(((PyObject *)((PyObject*)&PyString_Type)));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)((PyObject*)&PyString_Type)));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)((PyObject*)&PyString_Type)));
   __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyString_Type)));
   __Pyx_INCREF(((PyObject *)((PyObject*)&PyUnicode_Type)));
-  PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)((PyObject*)&PyUnicode_Type)));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, ((PyObject *)((PyObject*)&PyUnicode_Type)));
   __Pyx_GIVEREF(((PyObject *)((PyObject*)&PyUnicode_Type)));
-  __pyx_t_1 = PyObject_IsInstance(__pyx_v_buf, __pyx_t_3); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1033; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_IsInstance(__pyx_v_buf, __pyx_t_4); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1034
+    /* "/root/package/cpyamf/util.pyx":1197
  *             self.write(x.getvalue())
  *         elif isinstance(buf, (str, unicode)):
  *             self.write(buf)             # <<<<<<<<<<<<<<
  *         elif hasattr(buf, 'getvalue'):
  *             self.write(buf.getvalue())
  */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
     __Pyx_INCREF(__pyx_v_buf);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_buf);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_buf);
     __Pyx_GIVEREF(__pyx_v_buf);
-    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L6;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1035
+  /* "/root/package/cpyamf/util.pyx":1198
  *         elif isinstance(buf, (str, unicode)):
  *             self.write(buf)
  *         elif hasattr(buf, 'getvalue'):             # <<<<<<<<<<<<<<
  *             self.write(buf.getvalue())
  *         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
  */
-  __pyx_t_1 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__getvalue)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__getvalue)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1036
+    /* "/root/package/cpyamf/util.pyx":1199
  *             self.write(buf)
  *         elif hasattr(buf, 'getvalue'):
  *             self.write(buf.getvalue())             # <<<<<<<<<<<<<<
  *         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
  *             old_pos = buf.tell()
  */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__getvalue); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__getvalue); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1036; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     goto __pyx_L6;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1037
+  /* "/root/package/cpyamf/util.pyx":1200
  *         elif hasattr(buf, 'getvalue'):
  *             self.write(buf.getvalue())
  *         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):             # <<<<<<<<<<<<<<
  *             old_pos = buf.tell()
  *             buf.seek(0)
  */
-  __pyx_t_1 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__read)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__read)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (__pyx_t_1) {
-    __pyx_t_5 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__seek)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (__pyx_t_5) {
-      __pyx_t_6 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__tell)); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_7 = __pyx_t_6;
+    __pyx_t_6 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__seek)); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__pyx_t_6) {
+      __pyx_t_7 = PyObject_HasAttr(__pyx_v_buf, ((PyObject *)__pyx_n_s__tell)); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = __pyx_t_7;
     } else {
-      __pyx_t_7 = __pyx_t_5;
+      __pyx_t_8 = __pyx_t_6;
     }
-    __pyx_t_5 = __pyx_t_7;
+    __pyx_t_6 = __pyx_t_8;
   } else {
-    __pyx_t_5 = __pyx_t_1;
+    __pyx_t_6 = __pyx_t_1;
   }
-  if (__pyx_t_5) {
+  if (__pyx_t_6) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1038
+    /* "/root/package/cpyamf/util.pyx":1201
  *             self.write(buf.getvalue())
  *         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
  *             old_pos = buf.tell()             # <<<<<<<<<<<<<<
  *             buf.seek(0)
  *             self.write(buf.read())
  */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__tell); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1038; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1038; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__tell); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_v_old_pos);
-    __pyx_v_old_pos = __pyx_t_4;
-    __pyx_t_4 = 0;
+    __pyx_v_old_pos = __pyx_t_5;
+    __pyx_t_5 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1039
+    /* "/root/package/cpyamf/util.pyx":1202
  *         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
  *             old_pos = buf.tell()
  *             buf.seek(0)             # <<<<<<<<<<<<<<
  *             self.write(buf.read())
  *             buf.seek(old_pos)
  */
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__seek); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_int_0);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_int_0);
     __Pyx_GIVEREF(__pyx_int_0);
-    __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1040
+    /* "/root/package/cpyamf/util.pyx":1203
  *             old_pos = buf.tell()
  *             buf.seek(0)
  *             self.write(buf.read())             # <<<<<<<<<<<<<<
  *             buf.seek(old_pos)
  *         else:
  */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__read); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__write); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__read); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1041
+    /* "/root/package/cpyamf/util.pyx":1204
  *             buf.seek(0)
  *             self.write(buf.read())
  *             buf.seek(old_pos)             # <<<<<<<<<<<<<<
  *         else:
  *             raise TypeError("Unable to coerce buf->StringIO")
  */
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_buf, __pyx_n_s__seek); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_v_old_pos);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_old_pos);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_old_pos);
     __Pyx_GIVEREF(__pyx_v_old_pos);
-    __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1043
+    /* "/root/package/cpyamf/util.pyx":1206
  *             buf.seek(old_pos)
  *         else:
  *             raise TypeError("Unable to coerce buf->StringIO")             # <<<<<<<<<<<<<<
  * 
  *         self.seek(0)
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1043; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_7));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1043; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_8));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
+    __pyx_t_4 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1043; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_Raise(__pyx_t_4, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1045
+  /* "/root/package/cpyamf/util.pyx":1208
  *             raise TypeError("Unable to coerce buf->StringIO")
  * 
  *         self.seek(0)             # <<<<<<<<<<<<<<
  * 
  *     property endian:
  */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__seek); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1045; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1045; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_int_0);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
-  __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1045; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
   __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.__init__");
   __pyx_r = -1;
   __pyx_L0:;
@@ -7059,7 +8096,7 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream___init__(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1048
+/* "/root/package/cpyamf/util.pyx":1211
  * 
  *     property endian:
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -7079,7 +8116,7 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_value);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1049
+  /* "/root/package/cpyamf/util.pyx":1212
  *     property endian:
  *         def __set__(self, value):
  *             if PyString_Check(value) == 0:             # <<<<<<<<<<<<<<
@@ -7089,29 +8126,29 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
   __pyx_t_1 = (PyString_Check(__pyx_v_value) == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1050
+    /* "/root/package/cpyamf/util.pyx":1213
  *         def __set__(self, value):
  *             if PyString_Check(value) == 0:
  *                 raise TypeError('String value expected')             # <<<<<<<<<<<<<<
  * 
  *             if value not in [ENDIAN_NETWORK, ENDIAN_NATIVE, ENDIAN_LITTLE, ENDIAN_BIG]:
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1050; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_8));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1050; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_9));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_9));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_9));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1050; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1052
+  /* "/root/package/cpyamf/util.pyx":1215
  *                 raise TypeError('String value expected')
  * 
  *             if value not in [ENDIAN_NETWORK, ENDIAN_NATIVE, ENDIAN_LITTLE, ENDIAN_BIG]:             # <<<<<<<<<<<<<<
@@ -7120,15 +8157,15 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
  */
   __Pyx_INCREF(__pyx_v_value);
   __pyx_t_3 = __pyx_v_value;
-  __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_9), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_10), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_4 = ((int)__pyx_t_1);
   if (__pyx_t_4) {
-    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_10), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_11), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_5 = ((int)__pyx_t_1);
     __pyx_t_1 = __pyx_t_5;
@@ -7136,9 +8173,9 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
     __pyx_t_1 = __pyx_t_4;
   }
   if (__pyx_t_1) {
-    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_11), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_12), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_4 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_4 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_5 = ((int)__pyx_t_4);
     __pyx_t_4 = __pyx_t_5;
@@ -7146,9 +8183,9 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
     __pyx_t_4 = __pyx_t_1;
   }
   if (__pyx_t_4) {
-    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_12), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_b_13), Py_NE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_5 = ((int)__pyx_t_1);
     __pyx_t_1 = __pyx_t_5;
@@ -7159,29 +8196,29 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
   __pyx_t_4 = __pyx_t_1;
   if (__pyx_t_4) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1053
+    /* "/root/package/cpyamf/util.pyx":1216
  * 
  *             if value not in [ENDIAN_NETWORK, ENDIAN_NATIVE, ENDIAN_LITTLE, ENDIAN_BIG]:
  *                 raise ValueError('Not a valid endian type')             # <<<<<<<<<<<<<<
  * 
  *             self._endian = PyString_AsString(value)[0]
  */
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_13));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_13));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_13));
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_14));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_2, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1053; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1055
+  /* "/root/package/cpyamf/util.pyx":1218
  *                 raise ValueError('Not a valid endian type')
  * 
  *             self._endian = PyString_AsString(value)[0]             # <<<<<<<<<<<<<<
@@ -7204,7 +8241,7 @@ static int __pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___set__(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1057
+/* "/root/package/cpyamf/util.pyx":1220
  *             self._endian = PyString_AsString(value)[0]
  * 
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -7218,7 +8255,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___get__(PyO
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1058
+  /* "/root/package/cpyamf/util.pyx":1221
  * 
  *         def __get__(self):
  *             return PyString_FromStringAndSize(&self._endian, 1)             # <<<<<<<<<<<<<<
@@ -7226,7 +8263,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___get__(PyO
  *     def read(self, size=-1):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyString_FromStringAndSize((&((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base._endian), 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1058; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyString_FromStringAndSize((&((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base._endian), 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7244,7 +8281,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_6endian___get__(PyO
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1060
+/* "/root/package/cpyamf/util.pyx":1223
  *             return PyString_FromStringAndSize(&self._endian, 1)
  * 
  *     def read(self, size=-1):             # <<<<<<<<<<<<<<
@@ -7283,7 +8320,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read(PyObject *__py
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "read") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "read") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1223; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_size = values[0];
   } else {
@@ -7296,7 +8333,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read(PyObject *__py
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("read", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1223; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.read");
   return NULL;
@@ -7305,135 +8342,423 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read(PyObject *__py
   __Pyx_INCREF(__pyx_v_size);
   __pyx_v_r = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1067
- *         cdef object cls
+  /* "/root/package/cpyamf/util.pyx":1230
+ *         cdef object cls
+ * 
+ *         if size != -1:             # <<<<<<<<<<<<<<
+ *             s = <Py_ssize_t>size
+ *         else:
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_size, __pyx_int_neg_1, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "/root/package/cpyamf/util.pyx":1231
+ * 
+ *         if size != -1:
+ *             s = <Py_ssize_t>size             # <<<<<<<<<<<<<<
+ *         else:
+ *             s = cBufferedByteStream.remaining(self)
+ */
+    __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_size); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1231; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_s = ((Py_ssize_t)__pyx_t_3);
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/cpyamf/util.pyx":1233
+ *             s = <Py_ssize_t>size
+ *         else:
+ *             s = cBufferedByteStream.remaining(self)             # <<<<<<<<<<<<<<
+ * 
+ *             if s == 0:
+ */
+    __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_s = __pyx_t_3;
+
+    /* "/root/package/cpyamf/util.pyx":1235
+ *             s = cBufferedByteStream.remaining(self)
+ * 
+ *             if s == 0:             # <<<<<<<<<<<<<<
+ *                 s = 1
+ * 
+ */
+    __pyx_t_2 = (__pyx_v_s == 0);
+    if (__pyx_t_2) {
+
+      /* "/root/package/cpyamf/util.pyx":1236
+ * 
+ *             if s == 0:
+ *                 s = 1             # <<<<<<<<<<<<<<
+ * 
+ *         cdef char *buf = NULL
+ */
+      __pyx_v_s = 1;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/cpyamf/util.pyx":1238
+ *                 s = 1
+ * 
+ *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ * 
+ *         cBufferedByteStream.read(self, &buf, s)
+ */
+  __pyx_v_buf = NULL;
+
+  /* "/root/package/cpyamf/util.pyx":1240
+ *         cdef char *buf = NULL
+ * 
+ *         cBufferedByteStream.read(self, &buf, s)             # <<<<<<<<<<<<<<
+ * 
+ *         r = PyString_FromStringAndSize(buf, s)
+ */
+  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_buf), __pyx_v_s); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/cpyamf/util.pyx":1242
+ *         cBufferedByteStream.read(self, &buf, s)
+ * 
+ *         r = PyString_FromStringAndSize(buf, s)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(buf)
+ * 
+ */
+  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_s); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_r);
+  __pyx_v_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/cpyamf/util.pyx":1243
+ * 
+ *         r = PyString_FromStringAndSize(buf, s)
+ *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
+ * 
+ *         return r
+ */
+  PyMem_Free(__pyx_v_buf);
+
+  /* "/root/package/cpyamf/util.pyx":1245
+ *         PyMem_Free(buf)
+ * 
+ *         return r             # <<<<<<<<<<<<<<
+ * 
+ *     def read_view(self, size=-1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_r);
+  __pyx_r = __pyx_v_r;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.read");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_r);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_DECREF(__pyx_v_size);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":1247
+ *         return r
+ * 
+ *     def read_view(self, size=-1):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads C{size} bytes from the stream. If the stream wraps a buffer a
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_view(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6cpyamf_4util_18BufferedByteStream_read_view[] = "\n        Reads C{size} bytes from the stream. If the stream wraps a buffer a\n        read-only view onto that buffer is returned instead of a copy.\n\n        @see: L{pyamf.util.BufferedByteStream.read_view}\n        @since: 0.6\n        ";
+static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_view(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_size = 0;
+  PyObject *__pyx_r = NULL;
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__size,0};
+  __Pyx_RefNannySetupContext("read_view");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    values[0] = ((PyObject *)__pyx_int_neg_1);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      if (kw_args > 1) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__size);
+        if (unlikely(value)) { values[0] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "read_view") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1247; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_size = values[0];
+  } else {
+    __pyx_v_size = ((PyObject *)__pyx_int_neg_1);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: __pyx_v_size = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_view", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1247; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.read_view");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "/root/package/cpyamf/util.pyx":1255
+ *         @since: 0.6
+ *         """
+ *         return cBufferedByteStream.read_view(self, <Py_ssize_t>size)             # <<<<<<<<<<<<<<
+ * 
+ *     def readinto(self, buf):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_size); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1255; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_view(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((Py_ssize_t)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1255; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.read_view");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":1257
+ *         return cBufferedByteStream.read_view(self, <Py_ssize_t>size)
+ * 
+ *     def readinto(self, buf):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads up to C{len(buf)} bytes from the stream into the writable
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_readinto(PyObject *__pyx_v_self, PyObject *__pyx_v_buf); /*proto*/
+static char __pyx_doc_6cpyamf_4util_18BufferedByteStream_readinto[] = "\n        Reads up to C{len(buf)} bytes from the stream into the writable\n        buffer C{buf}.\n\n        @see: L{pyamf.util.BufferedByteStream.readinto}\n        @since: 0.6\n        ";
+static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_readinto(PyObject *__pyx_v_self, PyObject *__pyx_v_buf) {
+  void *__pyx_v_ptr;
+  Py_ssize_t __pyx_v_size;
+  Py_buffer *__pyx_v_view;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("readinto");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_buf);
+
+  /* "/root/package/cpyamf/util.pyx":1265
+ *         @since: 0.6
+ *         """
+ *         cdef void *ptr = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = 0
+ *         cdef Py_buffer *view
+ */
+  __pyx_v_ptr = NULL;
+
+  /* "/root/package/cpyamf/util.pyx":1266
+ *         """
+ *         cdef void *ptr = NULL
+ *         cdef Py_ssize_t size = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_buffer *view
+ * 
+ */
+  __pyx_v_size = 0;
+
+  /* "/root/package/cpyamf/util.pyx":1269
+ *         cdef Py_buffer *view
  * 
- *         if size != -1:             # <<<<<<<<<<<<<<
- *             s = <Py_ssize_t>size
- *         else:
+ *         cBufferedByteStream.complain_if_closed(self)             # <<<<<<<<<<<<<<
+ * 
+ *         if PyMemoryView_Check(buf):
  */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_size, __pyx_int_neg_1, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1067; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1067; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->complain_if_closed(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1068
+  /* "/root/package/cpyamf/util.pyx":1271
+ *         cBufferedByteStream.complain_if_closed(self)
+ * 
+ *         if PyMemoryView_Check(buf):             # <<<<<<<<<<<<<<
+ *             view = PyMemoryView_GET_BUFFER(buf)
  * 
- *         if size != -1:
- *             s = <Py_ssize_t>size             # <<<<<<<<<<<<<<
- *         else:
- *             s = cBufferedByteStream.remaining(self)
  */
-    __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_size); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1068; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_v_s = ((Py_ssize_t)__pyx_t_3);
-    goto __pyx_L6;
-  }
-  /*else*/ {
+  __pyx_t_1 = PyMemoryView_Check(__pyx_v_buf);
+  if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1070
- *             s = <Py_ssize_t>size
- *         else:
- *             s = cBufferedByteStream.remaining(self)             # <<<<<<<<<<<<<<
+    /* "/root/package/cpyamf/util.pyx":1272
  * 
- *             if s == 0:
+ *         if PyMemoryView_Check(buf):
+ *             view = PyMemoryView_GET_BUFFER(buf)             # <<<<<<<<<<<<<<
+ * 
+ *             if view.readonly or not PyBuffer_IsContiguous(view, c'C'):
  */
-    __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1070; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_v_s = __pyx_t_3;
+    __pyx_v_view = PyMemoryView_GET_BUFFER(__pyx_v_buf);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1072
- *             s = cBufferedByteStream.remaining(self)
+    /* "/root/package/cpyamf/util.pyx":1274
+ *             view = PyMemoryView_GET_BUFFER(buf)
  * 
- *             if s == 0:             # <<<<<<<<<<<<<<
- *                 s = 1
+ *             if view.readonly or not PyBuffer_IsContiguous(view, c'C'):             # <<<<<<<<<<<<<<
+ *                 raise TypeError('Expected a writable, contiguous buffer')
  * 
  */
-    __pyx_t_2 = (__pyx_v_s == 0);
-    if (__pyx_t_2) {
+    if (!__pyx_v_view->readonly) {
+      __pyx_t_2 = (!PyBuffer_IsContiguous(__pyx_v_view, 'C'));
+      __pyx_t_3 = __pyx_t_2;
+    } else {
+      __pyx_t_3 = __pyx_v_view->readonly;
+    }
+    if (__pyx_t_3) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1073
+      /* "/root/package/cpyamf/util.pyx":1275
  * 
- *             if s == 0:
- *                 s = 1             # <<<<<<<<<<<<<<
+ *             if view.readonly or not PyBuffer_IsContiguous(view, c'C'):
+ *                 raise TypeError('Expected a writable, contiguous buffer')             # <<<<<<<<<<<<<<
  * 
- *         cdef char *buf = NULL
+ *             ptr = view.buf
  */
-      __pyx_v_s = 1;
-      goto __pyx_L7;
+      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(((PyObject *)__pyx_kp_s_15));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_15));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_15));
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_5, 0, 0);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
     }
-    __pyx_L7:;
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/util.pyx":1277
+ *                 raise TypeError('Expected a writable, contiguous buffer')
+ * 
+ *             ptr = view.buf             # <<<<<<<<<<<<<<
+ *             size = view.len
+ *         else:
+ */
+    __pyx_v_ptr = __pyx_v_view->buf;
+
+    /* "/root/package/cpyamf/util.pyx":1278
+ * 
+ *             ptr = view.buf
+ *             size = view.len             # <<<<<<<<<<<<<<
+ *         else:
+ *             PyObject_AsWriteBuffer(buf, &ptr, &size)
+ */
+    __pyx_v_size = __pyx_v_view->len;
+    goto __pyx_L5;
   }
-  __pyx_L6:;
+  /*else*/ {
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1075
- *                 s = 1
+    /* "/root/package/cpyamf/util.pyx":1280
+ *             size = view.len
+ *         else:
+ *             PyObject_AsWriteBuffer(buf, &ptr, &size)             # <<<<<<<<<<<<<<
  * 
- *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
+ *         if size > self.length - self.pos:
+ */
+    __pyx_t_1 = PyObject_AsWriteBuffer(__pyx_v_buf, (&__pyx_v_ptr), (&__pyx_v_size)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1280; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_L5:;
+
+  /* "/root/package/cpyamf/util.pyx":1282
+ *             PyObject_AsWriteBuffer(buf, &ptr, &size)
+ * 
+ *         if size > self.length - self.pos:             # <<<<<<<<<<<<<<
+ *             size = self.length - self.pos
  * 
- *         cBufferedByteStream.read(self, &buf, s)
  */
-  __pyx_v_buf = NULL;
+  __pyx_t_3 = (__pyx_v_size > (((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.length - ((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos));
+  if (__pyx_t_3) {
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1077
- *         cdef char *buf = NULL
+    /* "/root/package/cpyamf/util.pyx":1283
  * 
- *         cBufferedByteStream.read(self, &buf, s)             # <<<<<<<<<<<<<<
+ *         if size > self.length - self.pos:
+ *             size = self.length - self.pos             # <<<<<<<<<<<<<<
  * 
- *         r = PyString_FromStringAndSize(buf, s)
+ *         memcpy(ptr, self.buffer + self.pos, size)
  */
-  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_buf), __pyx_v_s); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1077; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_size = (((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.length - ((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos);
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1079
- *         cBufferedByteStream.read(self, &buf, s)
+  /* "/root/package/cpyamf/util.pyx":1285
+ *             size = self.length - self.pos
  * 
- *         r = PyString_FromStringAndSize(buf, s)             # <<<<<<<<<<<<<<
- *         PyMem_Free(buf)
+ *         memcpy(ptr, self.buffer + self.pos, size)             # <<<<<<<<<<<<<<
+ *         self.pos += size
  * 
  */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_s); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1079; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_r);
-  __pyx_v_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  memcpy(__pyx_v_ptr, (((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.buffer + ((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos), __pyx_v_size);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1080
+  /* "/root/package/cpyamf/util.pyx":1286
  * 
- *         r = PyString_FromStringAndSize(buf, s)
- *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
+ *         memcpy(ptr, self.buffer + self.pos, size)
+ *         self.pos += size             # <<<<<<<<<<<<<<
  * 
- *         return r
+ *         return size
  */
-  PyMem_Free(__pyx_v_buf);
+  ((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos += __pyx_v_size;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1082
- *         PyMem_Free(buf)
+  /* "/root/package/cpyamf/util.pyx":1288
+ *         self.pos += size
  * 
- *         return r             # <<<<<<<<<<<<<<
+ *         return size             # <<<<<<<<<<<<<<
  * 
  *     def write(self, x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_r);
-  __pyx_r = __pyx_v_r;
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_size); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.read");
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.readinto");
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_r);
   __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_size);
+  __Pyx_DECREF(__pyx_v_buf);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1084
- *         return r
+/* "/root/package/cpyamf/util.pyx":1290
+ *         return size
  * 
  *     def write(self, x):             # <<<<<<<<<<<<<<
  *         """
@@ -7447,14 +8772,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write(PyObject *__p
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1091
+  /* "/root/package/cpyamf/util.pyx":1297
  *         @type x:
  *         """
  *         cBufferedByteStream.write_utf8_string(self, x)             # <<<<<<<<<<<<<<
  * 
  *     def close(self):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1091; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -7467,7 +8792,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write(PyObject *__p
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1093
+/* "/root/package/cpyamf/util.pyx":1299
  *         cBufferedByteStream.write_utf8_string(self, x)
  * 
  *     def close(self):             # <<<<<<<<<<<<<<
@@ -7482,14 +8807,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_close(PyObject *__p
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("close");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1097
+  /* "/root/package/cpyamf/util.pyx":1303
  *         Close the stream.
  *         """
  *         cBufferedByteStream.close(self)             # <<<<<<<<<<<<<<
  * 
  *     def flush(self):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->close(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1097; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->close(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -7502,7 +8827,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_close(PyObject *__p
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1099
+/* "/root/package/cpyamf/util.pyx":1305
  *         cBufferedByteStream.close(self)
  * 
  *     def flush(self):             # <<<<<<<<<<<<<<
@@ -7521,7 +8846,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_flush(PyObject *__p
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1103
+/* "/root/package/cpyamf/util.pyx":1309
  *         pass
  * 
  *     def tell(self):             # <<<<<<<<<<<<<<
@@ -7536,7 +8861,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_tell(PyObject *__py
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("tell");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1107
+  /* "/root/package/cpyamf/util.pyx":1313
  *         Returns the position of the stream pointer.
  *         """
  *         return self.pos             # <<<<<<<<<<<<<<
@@ -7544,7 +8869,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_tell(PyObject *__py
  *     def remaining(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromSsize_t(((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromSsize_t(((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base.pos); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7562,7 +8887,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_tell(PyObject *__py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1109
+/* "/root/package/cpyamf/util.pyx":1315
  *         return self.pos
  * 
  *     def remaining(self):             # <<<<<<<<<<<<<<
@@ -7578,7 +8903,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_remaining(PyObject
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("remaining");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1116
+  /* "/root/package/cpyamf/util.pyx":1322
  *         @return: Number of remaining bytes.
  *         """
  *         return cBufferedByteStream.remaining(self)             # <<<<<<<<<<<<<<
@@ -7586,8 +8911,8 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_remaining(PyObject
  *     def __len__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -7605,7 +8930,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_remaining(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1118
+/* "/root/package/cpyamf/util.pyx":1324
  *         return cBufferedByteStream.remaining(self)
  * 
  *     def __len__(self):             # <<<<<<<<<<<<<<
@@ -7618,7 +8943,7 @@ static Py_ssize_t __pyx_pf_6cpyamf_4util_18BufferedByteStream___len__(PyObject *
   Py_ssize_t __pyx_r;
   __Pyx_RefNannySetupContext("__len__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1119
+  /* "/root/package/cpyamf/util.pyx":1325
  * 
  *     def __len__(self):
  *         return self.length             # <<<<<<<<<<<<<<
@@ -7634,7 +8959,7 @@ static Py_ssize_t __pyx_pf_6cpyamf_4util_18BufferedByteStream___len__(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1121
+/* "/root/package/cpyamf/util.pyx":1327
  *         return self.length
  * 
  *     def getvalue(self):             # <<<<<<<<<<<<<<
@@ -7649,7 +8974,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_getvalue(PyObject *
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("getvalue");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1125
+  /* "/root/package/cpyamf/util.pyx":1331
  *         Get raw data from buffer.
  *         """
  *         return cBufferedByteStream.getvalue(self)             # <<<<<<<<<<<<<<
@@ -7657,7 +8982,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_getvalue(PyObject *
  *     def at_eof(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->getvalue(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->getvalue(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7675,7 +9000,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_getvalue(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1127
+/* "/root/package/cpyamf/util.pyx":1333
  *         return cBufferedByteStream.getvalue(self)
  * 
  *     def at_eof(self):             # <<<<<<<<<<<<<<
@@ -7692,17 +9017,17 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_at_eof(PyObject *__
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("at_eof");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1133
+  /* "/root/package/cpyamf/util.pyx":1339
  *         @rtype: C{bool}
  *         """
  *         cdef int result = cBufferedByteStream.at_eof(self)             # <<<<<<<<<<<<<<
  * 
  *         return (result == 1)
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->at_eof(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->at_eof(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_result = __pyx_t_1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1135
+  /* "/root/package/cpyamf/util.pyx":1341
  *         cdef int result = cBufferedByteStream.at_eof(self)
  * 
  *         return (result == 1)             # <<<<<<<<<<<<<<
@@ -7710,7 +9035,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_at_eof(PyObject *__
  *     def seek(self, pos, mode=0):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_result == 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_result == 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -7728,7 +9053,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_at_eof(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1137
+/* "/root/package/cpyamf/util.pyx":1343
  *         return (result == 1)
  * 
  *     def seek(self, pos, mode=0):             # <<<<<<<<<<<<<<
@@ -7770,7 +9095,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_seek(PyObject *__py
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "seek") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1137; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "seek") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_pos = values[0];
     __pyx_v_mode = values[1];
@@ -7785,24 +9110,24 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_seek(PyObject *__py
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("seek", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1137; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("seek", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.seek");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1147
+  /* "/root/package/cpyamf/util.pyx":1353
  *         @type mode: C{int}
  *         """
  *         cBufferedByteStream.seek(self, pos, mode)             # <<<<<<<<<<<<<<
  * 
  *     def peek(self, size=1):
  */
-  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_pos); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_AsInt(__pyx_v_mode); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_pos); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_AsInt(__pyx_v_mode); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_4.__pyx_n = 1;
   __pyx_t_4.mode = __pyx_t_2;
-  __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->seek(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_t_1, &__pyx_t_4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->seek(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_t_1, &__pyx_t_4); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -7815,7 +9140,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_seek(PyObject *__py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1149
+/* "/root/package/cpyamf/util.pyx":1355
  *         cBufferedByteStream.seek(self, pos, mode)
  * 
  *     def peek(self, size=1):             # <<<<<<<<<<<<<<
@@ -7854,7 +9179,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "peek") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "peek") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1355; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_size = values[0];
   } else {
@@ -7867,7 +9192,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("peek", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("peek", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1355; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.peek");
   return NULL;
@@ -7876,7 +9201,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
   __Pyx_INCREF(__pyx_v_size);
   __pyx_v_r = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1160
+  /* "/root/package/cpyamf/util.pyx":1366
  *         @return: Bytes.
  *         """
  *         cdef char *buf = NULL             # <<<<<<<<<<<<<<
@@ -7885,67 +9210,67 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
  */
   __pyx_v_buf = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1163
+  /* "/root/package/cpyamf/util.pyx":1369
  *         cdef Py_ssize_t l
  * 
  *         if size == -1:             # <<<<<<<<<<<<<<
  *             l = cBufferedByteStream.remaining(self)
  *         else:
  */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_size, __pyx_int_neg_1, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_size, __pyx_int_neg_1, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1164
+    /* "/root/package/cpyamf/util.pyx":1370
  * 
  *         if size == -1:
  *             l = cBufferedByteStream.remaining(self)             # <<<<<<<<<<<<<<
  *         else:
  *             l = <int>size
  */
-    __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->remaining(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_3 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_l = __pyx_t_3;
     goto __pyx_L6;
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1166
+    /* "/root/package/cpyamf/util.pyx":1372
  *             l = cBufferedByteStream.remaining(self)
  *         else:
  *             l = <int>size             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.peek(self, &buf, l)
  */
-    __pyx_t_4 = __Pyx_PyInt_AsInt(__pyx_v_size); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1166; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyInt_AsInt(__pyx_v_size); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_l = ((int)__pyx_t_4);
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1168
+  /* "/root/package/cpyamf/util.pyx":1374
  *             l = <int>size
  * 
  *         cBufferedByteStream.peek(self, &buf, l)             # <<<<<<<<<<<<<<
  * 
  *         r = PyString_FromStringAndSize(buf, l)
  */
-  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->peek(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_buf), __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->peek(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_buf), __pyx_v_l); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1170
+  /* "/root/package/cpyamf/util.pyx":1376
  *         cBufferedByteStream.peek(self, &buf, l)
  * 
  *         r = PyString_FromStringAndSize(buf, l)             # <<<<<<<<<<<<<<
  *         PyMem_Free(buf)
  * 
  */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_l); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_buf, __pyx_v_l); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_r);
   __pyx_v_r = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1171
+  /* "/root/package/cpyamf/util.pyx":1377
  * 
  *         r = PyString_FromStringAndSize(buf, l)
  *         PyMem_Free(buf)             # <<<<<<<<<<<<<<
@@ -7954,7 +9279,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
  */
   PyMem_Free(__pyx_v_buf);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1173
+  /* "/root/package/cpyamf/util.pyx":1379
  *         PyMem_Free(buf)
  * 
  *         return r             # <<<<<<<<<<<<<<
@@ -7981,7 +9306,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_peek(PyObject *__py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1175
+/* "/root/package/cpyamf/util.pyx":1381
  *         return r
  * 
  *     def truncate(self, int size=0):             # <<<<<<<<<<<<<<
@@ -8013,37 +9338,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_truncate(PyObject *
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "truncate") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "truncate") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1381; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     if (values[0]) {
-      __pyx_v_size = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_size == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_size = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_size == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1381; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_size = ((int)0);
     }
   } else {
     __pyx_v_size = ((int)0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_size = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_size == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_size = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_size == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1381; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  0: break;
       default: goto __pyx_L5_argtuple_error;
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("truncate", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("truncate", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1381; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.BufferedByteStream.truncate");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1182
+  /* "/root/package/cpyamf/util.pyx":1388
  *         @type size: C{int}
  *         """
  *         cBufferedByteStream.truncate(self, size)             # <<<<<<<<<<<<<<
  * 
  *     def consume(self):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->truncate(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->truncate(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_size); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -8056,7 +9381,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_truncate(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1184
+/* "/root/package/cpyamf/util.pyx":1390
  *         cBufferedByteStream.truncate(self, size)
  * 
  *     def consume(self):             # <<<<<<<<<<<<<<
@@ -8071,14 +9396,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_consume(PyObject *_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("consume");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1189
+  /* "/root/package/cpyamf/util.pyx":1395
  *         The stream pointer is set to 0 at the end of this function.
  *         """
  *         cBufferedByteStream.consume(self)             # <<<<<<<<<<<<<<
  * 
  *     def read_uchar(self):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->consume(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->consume(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -8091,7 +9416,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_consume(PyObject *_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1191
+/* "/root/package/cpyamf/util.pyx":1397
  *         cBufferedByteStream.consume(self)
  * 
  *     def read_uchar(self):             # <<<<<<<<<<<<<<
@@ -8112,7 +9437,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1195
+  /* "/root/package/cpyamf/util.pyx":1401
  *         Reads an C{unsigned char} from the stream.
  *         """
  *         cdef unsigned char *i = NULL             # <<<<<<<<<<<<<<
@@ -8121,7 +9446,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1198
+  /* "/root/package/cpyamf/util.pyx":1404
  *         cdef object ret
  * 
  *         i = <unsigned char *>PyMem_Malloc(1 * sizeof(unsigned char))             # <<<<<<<<<<<<<<
@@ -8130,7 +9455,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
  */
   __pyx_v_i = ((unsigned char *)PyMem_Malloc((1 * (sizeof(unsigned char)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1200
+  /* "/root/package/cpyamf/util.pyx":1406
  *         i = <unsigned char *>PyMem_Malloc(1 * sizeof(unsigned char))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8140,7 +9465,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1201
+    /* "/root/package/cpyamf/util.pyx":1407
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8148,34 +9473,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
  *         cBufferedByteStream.read_uchar(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1203
+  /* "/root/package/cpyamf/util.pyx":1409
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_uchar(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <unsigned char>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_uchar(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_uchar(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1205
+  /* "/root/package/cpyamf/util.pyx":1411
  *         cBufferedByteStream.read_uchar(self, i)
  * 
  *         ret = <unsigned char>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((unsigned char)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((unsigned char)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1206
+  /* "/root/package/cpyamf/util.pyx":1412
  * 
  *         ret = <unsigned char>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8184,7 +9509,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1208
+  /* "/root/package/cpyamf/util.pyx":1414
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8210,7 +9535,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_uchar(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1210
+/* "/root/package/cpyamf/util.pyx":1416
  *         return ret
  * 
  *     def read_char(self):             # <<<<<<<<<<<<<<
@@ -8231,7 +9556,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1214
+  /* "/root/package/cpyamf/util.pyx":1420
  *         Reads a C{char} from the stream.
  *         """
  *         cdef char *i = NULL             # <<<<<<<<<<<<<<
@@ -8240,7 +9565,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1217
+  /* "/root/package/cpyamf/util.pyx":1423
  *         cdef object ret
  * 
  *         i = <char *>PyMem_Malloc(1 * sizeof(char))             # <<<<<<<<<<<<<<
@@ -8249,7 +9574,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
  */
   __pyx_v_i = ((char *)PyMem_Malloc((1 * (sizeof(char)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1219
+  /* "/root/package/cpyamf/util.pyx":1425
  *         i = <char *>PyMem_Malloc(1 * sizeof(char))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8259,7 +9584,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1220
+    /* "/root/package/cpyamf/util.pyx":1426
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8267,34 +9592,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
  *         cBufferedByteStream.read_char(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1222
+  /* "/root/package/cpyamf/util.pyx":1428
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_char(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <char>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_char(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_char(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1224
+  /* "/root/package/cpyamf/util.pyx":1430
  *         cBufferedByteStream.read_char(self, i)
  * 
  *         ret = <char>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((char)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((char)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1225
+  /* "/root/package/cpyamf/util.pyx":1431
  * 
  *         ret = <char>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8303,7 +9628,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1227
+  /* "/root/package/cpyamf/util.pyx":1433
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8329,7 +9654,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_char(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1229
+/* "/root/package/cpyamf/util.pyx":1435
  *         return ret
  * 
  *     def read_ushort(self):             # <<<<<<<<<<<<<<
@@ -8350,7 +9675,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1233
+  /* "/root/package/cpyamf/util.pyx":1439
  *         Reads a 2 byte unsigned integer from the stream.
  *         """
  *         cdef unsigned short *i = NULL             # <<<<<<<<<<<<<<
@@ -8359,7 +9684,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1236
+  /* "/root/package/cpyamf/util.pyx":1442
  *         cdef object ret
  * 
  *         i = <unsigned short *>PyMem_Malloc(1 * sizeof(unsigned short))             # <<<<<<<<<<<<<<
@@ -8368,7 +9693,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
  */
   __pyx_v_i = ((unsigned short *)PyMem_Malloc((1 * (sizeof(unsigned short)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1238
+  /* "/root/package/cpyamf/util.pyx":1444
  *         i = <unsigned short *>PyMem_Malloc(1 * sizeof(unsigned short))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8378,7 +9703,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1239
+    /* "/root/package/cpyamf/util.pyx":1445
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8386,34 +9711,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
  *         cBufferedByteStream.read_ushort(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1241
+  /* "/root/package/cpyamf/util.pyx":1447
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_ushort(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <unsigned short>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_ushort(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_ushort(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1243
+  /* "/root/package/cpyamf/util.pyx":1449
  *         cBufferedByteStream.read_ushort(self, i)
  * 
  *         ret = <unsigned short>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((unsigned short)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((unsigned short)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1244
+  /* "/root/package/cpyamf/util.pyx":1450
  * 
  *         ret = <unsigned short>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8422,7 +9747,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1246
+  /* "/root/package/cpyamf/util.pyx":1452
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8448,7 +9773,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ushort(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1248
+/* "/root/package/cpyamf/util.pyx":1454
  *         return ret
  * 
  *     def read_short(self):             # <<<<<<<<<<<<<<
@@ -8469,7 +9794,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1252
+  /* "/root/package/cpyamf/util.pyx":1458
  *         Reads a 2 byte integer from the stream.
  *         """
  *         cdef short *i = NULL             # <<<<<<<<<<<<<<
@@ -8478,7 +9803,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1255
+  /* "/root/package/cpyamf/util.pyx":1461
  *         cdef object ret
  * 
  *         i = <short *>PyMem_Malloc(1 * sizeof(short))             # <<<<<<<<<<<<<<
@@ -8487,7 +9812,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
  */
   __pyx_v_i = ((short *)PyMem_Malloc((1 * (sizeof(short)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1257
+  /* "/root/package/cpyamf/util.pyx":1463
  *         i = <short *>PyMem_Malloc(1 * sizeof(short))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8497,7 +9822,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1258
+    /* "/root/package/cpyamf/util.pyx":1464
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8505,34 +9830,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
  *         cBufferedByteStream.read_short(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1260
+  /* "/root/package/cpyamf/util.pyx":1466
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_short(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <short>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_short(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_short(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1262
+  /* "/root/package/cpyamf/util.pyx":1468
  *         cBufferedByteStream.read_short(self, i)
  * 
  *         ret = <short>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((short)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((short)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1263
+  /* "/root/package/cpyamf/util.pyx":1469
  * 
  *         ret = <short>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8541,7 +9866,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1265
+  /* "/root/package/cpyamf/util.pyx":1471
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8567,7 +9892,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_short(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1267
+/* "/root/package/cpyamf/util.pyx":1473
  *         return ret
  * 
  *     def read_ulong(self):             # <<<<<<<<<<<<<<
@@ -8588,7 +9913,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1271
+  /* "/root/package/cpyamf/util.pyx":1477
  *         Reads a 4 byte unsigned integer from the stream.
  *         """
  *         cdef unsigned long *i = NULL             # <<<<<<<<<<<<<<
@@ -8597,7 +9922,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1274
+  /* "/root/package/cpyamf/util.pyx":1480
  *         cdef object ret
  * 
  *         i = <unsigned long *>PyMem_Malloc(1 * sizeof(unsigned long))             # <<<<<<<<<<<<<<
@@ -8606,7 +9931,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
  */
   __pyx_v_i = ((unsigned long *)PyMem_Malloc((1 * (sizeof(unsigned long)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1276
+  /* "/root/package/cpyamf/util.pyx":1482
  *         i = <unsigned long *>PyMem_Malloc(1 * sizeof(unsigned long))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8616,7 +9941,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1277
+    /* "/root/package/cpyamf/util.pyx":1483
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8624,34 +9949,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
  *         cBufferedByteStream.read_ulong(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1279
+  /* "/root/package/cpyamf/util.pyx":1485
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_ulong(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <unsigned long>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_ulong(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_ulong(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1281
+  /* "/root/package/cpyamf/util.pyx":1487
  *         cBufferedByteStream.read_ulong(self, i)
  * 
  *         ret = <unsigned long>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyLong_FromUnsignedLong(((unsigned long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyLong_FromUnsignedLong(((unsigned long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1282
+  /* "/root/package/cpyamf/util.pyx":1488
  * 
  *         ret = <unsigned long>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8660,7 +9985,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1284
+  /* "/root/package/cpyamf/util.pyx":1490
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8686,7 +10011,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_ulong(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1286
+/* "/root/package/cpyamf/util.pyx":1492
  *         return ret
  * 
  *     def read_long(self):             # <<<<<<<<<<<<<<
@@ -8707,7 +10032,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1290
+  /* "/root/package/cpyamf/util.pyx":1496
  *         Reads a 4 byte integer from the stream.
  *         """
  *         cdef long *i = NULL             # <<<<<<<<<<<<<<
@@ -8716,7 +10041,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1293
+  /* "/root/package/cpyamf/util.pyx":1499
  *         cdef object ret
  * 
  *         i = <long *>PyMem_Malloc(1 * sizeof(long))             # <<<<<<<<<<<<<<
@@ -8725,7 +10050,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
  */
   __pyx_v_i = ((long *)PyMem_Malloc((1 * (sizeof(long)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1295
+  /* "/root/package/cpyamf/util.pyx":1501
  *         i = <long *>PyMem_Malloc(1 * sizeof(long))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8735,7 +10060,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1296
+    /* "/root/package/cpyamf/util.pyx":1502
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8743,34 +10068,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
  *         cBufferedByteStream.read_long(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1502; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1298
+  /* "/root/package/cpyamf/util.pyx":1504
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_long(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <long>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_long(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_long(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1504; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1300
+  /* "/root/package/cpyamf/util.pyx":1506
  *         cBufferedByteStream.read_long(self, i)
  * 
  *         ret = <long>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1301
+  /* "/root/package/cpyamf/util.pyx":1507
  * 
  *         ret = <long>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8779,7 +10104,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1303
+  /* "/root/package/cpyamf/util.pyx":1509
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8805,7 +10130,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_long(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1305
+/* "/root/package/cpyamf/util.pyx":1511
  *         return ret
  * 
  *     def read_24bit_uint(self):             # <<<<<<<<<<<<<<
@@ -8826,7 +10151,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1309
+  /* "/root/package/cpyamf/util.pyx":1515
  *         Reads a 24 bit unsigned integer from the stream.
  *         """
  *         cdef unsigned long *i = NULL             # <<<<<<<<<<<<<<
@@ -8835,7 +10160,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1312
+  /* "/root/package/cpyamf/util.pyx":1518
  *         cdef object ret
  * 
  *         i = <unsigned long *>PyMem_Malloc(1 * sizeof(unsigned long))             # <<<<<<<<<<<<<<
@@ -8844,7 +10169,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
  */
   __pyx_v_i = ((unsigned long *)PyMem_Malloc((1 * (sizeof(unsigned long)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1314
+  /* "/root/package/cpyamf/util.pyx":1520
  *         i = <unsigned long *>PyMem_Malloc(1 * sizeof(unsigned long))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8854,7 +10179,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1315
+    /* "/root/package/cpyamf/util.pyx":1521
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8862,34 +10187,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
  *         cBufferedByteStream.read_24bit_uint(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1317
+  /* "/root/package/cpyamf/util.pyx":1523
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_24bit_uint(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <long>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_24bit_uint(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_24bit_uint(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1523; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1319
+  /* "/root/package/cpyamf/util.pyx":1525
  *         cBufferedByteStream.read_24bit_uint(self, i)
  * 
  *         ret = <long>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1320
+  /* "/root/package/cpyamf/util.pyx":1526
  * 
  *         ret = <long>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -8898,7 +10223,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1322
+  /* "/root/package/cpyamf/util.pyx":1528
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -8924,7 +10249,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_uint(PyO
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1324
+/* "/root/package/cpyamf/util.pyx":1530
  *         return ret
  * 
  *     def read_24bit_int(self):             # <<<<<<<<<<<<<<
@@ -8945,7 +10270,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1328
+  /* "/root/package/cpyamf/util.pyx":1534
  *         Reads a 24 bit integer from the stream.
  *         """
  *         cdef long *i = NULL             # <<<<<<<<<<<<<<
@@ -8954,7 +10279,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
  */
   __pyx_v_i = NULL;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1331
+  /* "/root/package/cpyamf/util.pyx":1537
  *         cdef object ret
  * 
  *         i = <long *>PyMem_Malloc(1 * sizeof(long))             # <<<<<<<<<<<<<<
@@ -8963,7 +10288,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
  */
   __pyx_v_i = ((long *)PyMem_Malloc((1 * (sizeof(long)))));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1333
+  /* "/root/package/cpyamf/util.pyx":1539
  *         i = <long *>PyMem_Malloc(1 * sizeof(long))
  * 
  *         if i == NULL:             # <<<<<<<<<<<<<<
@@ -8973,7 +10298,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
   __pyx_t_1 = (__pyx_v_i == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1334
+    /* "/root/package/cpyamf/util.pyx":1540
  * 
  *         if i == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -8981,34 +10306,34 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
  *         cBufferedByteStream.read_24bit_int(self, i)
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1336
+  /* "/root/package/cpyamf/util.pyx":1542
  *             raise MemoryError
  * 
  *         cBufferedByteStream.read_24bit_int(self, i)             # <<<<<<<<<<<<<<
  * 
  *         ret = <long>(i[0])
  */
-  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_24bit_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_24bit_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_i); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1542; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1338
+  /* "/root/package/cpyamf/util.pyx":1544
  *         cBufferedByteStream.read_24bit_int(self, i)
  * 
  *         ret = <long>(i[0])             # <<<<<<<<<<<<<<
  *         PyMem_Free(i)
  * 
  */
-  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(((long)(__pyx_v_i[0]))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1339
+  /* "/root/package/cpyamf/util.pyx":1545
  * 
  *         ret = <long>(i[0])
  *         PyMem_Free(i)             # <<<<<<<<<<<<<<
@@ -9017,7 +10342,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
  */
   PyMem_Free(__pyx_v_i);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1341
+  /* "/root/package/cpyamf/util.pyx":1547
  *         PyMem_Free(i)
  * 
  *         return ret             # <<<<<<<<<<<<<<
@@ -9043,7 +10368,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_24bit_int(PyOb
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1343
+/* "/root/package/cpyamf/util.pyx":1549
  *         return ret
  * 
  *     def write_uchar(self, x):             # <<<<<<<<<<<<<<
@@ -9066,7 +10391,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_uchar(PyObjec
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1351
+  /* "/root/package/cpyamf/util.pyx":1557
  *         @raise TypeError: Unexpected type for int C{x}.
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -9082,37 +10407,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_uchar(PyObjec
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1352
+    /* "/root/package/cpyamf/util.pyx":1558
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:
  *             raise TypeError('expected int for x')             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.write_uchar(self, <unsigned char>x)
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_14));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_16));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_16));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_16));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1354
+  /* "/root/package/cpyamf/util.pyx":1560
  *             raise TypeError('expected int for x')
  * 
  *         cBufferedByteStream.write_uchar(self, <unsigned char>x)             # <<<<<<<<<<<<<<
  * 
  *     def write_char(self, x):
  */
-  __pyx_t_6 = __Pyx_PyInt_AsUnsignedChar(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_uchar(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned char)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsUnsignedChar(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_uchar(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned char)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9129,7 +10454,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_uchar(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1356
+/* "/root/package/cpyamf/util.pyx":1562
  *         cBufferedByteStream.write_uchar(self, <unsigned char>x)
  * 
  *     def write_char(self, x):             # <<<<<<<<<<<<<<
@@ -9152,7 +10477,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_char(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1364
+  /* "/root/package/cpyamf/util.pyx":1570
  *         @raise TypeError: Unexpected type for int C{x}.
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -9168,37 +10493,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_char(PyObject
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1365
+    /* "/root/package/cpyamf/util.pyx":1571
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:
  *             raise TypeError('expected int for x')             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.write_char(self, <char>x)
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_14));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_16));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_16));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_16));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1367
+  /* "/root/package/cpyamf/util.pyx":1573
  *             raise TypeError('expected int for x')
  * 
  *         cBufferedByteStream.write_char(self, <char>x)             # <<<<<<<<<<<<<<
  * 
  *     def write_ushort(self, x):
  */
-  __pyx_t_6 = __Pyx_PyInt_AsChar(__pyx_v_x); if (unlikely((__pyx_t_6 == (char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_char(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((char)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsChar(__pyx_v_x); if (unlikely((__pyx_t_6 == (char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_char(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((char)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9215,7 +10540,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_char(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1369
+/* "/root/package/cpyamf/util.pyx":1575
  *         cBufferedByteStream.write_char(self, <char>x)
  * 
  *     def write_ushort(self, x):             # <<<<<<<<<<<<<<
@@ -9238,7 +10563,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ushort(PyObje
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1377
+  /* "/root/package/cpyamf/util.pyx":1583
  *         @raise TypeError: Unexpected type for int C{x}.
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -9254,37 +10579,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ushort(PyObje
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1378
+    /* "/root/package/cpyamf/util.pyx":1584
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:
  *             raise TypeError('expected int for x')             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.write_ushort(self, <unsigned short>x)
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_14));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_16));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_16));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_16));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1380
+  /* "/root/package/cpyamf/util.pyx":1586
  *             raise TypeError('expected int for x')
  * 
  *         cBufferedByteStream.write_ushort(self, <unsigned short>x)             # <<<<<<<<<<<<<<
  * 
  *     def write_short(self, x):
  */
-  __pyx_t_6 = __Pyx_PyInt_AsUnsignedShort(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned short)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_ushort(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned short)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsUnsignedShort(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned short)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_ushort(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned short)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9301,7 +10626,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ushort(PyObje
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1382
+/* "/root/package/cpyamf/util.pyx":1588
  *         cBufferedByteStream.write_ushort(self, <unsigned short>x)
  * 
  *     def write_short(self, x):             # <<<<<<<<<<<<<<
@@ -9324,7 +10649,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_short(PyObjec
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1390
+  /* "/root/package/cpyamf/util.pyx":1596
  *         @raise TypeError: Unexpected type for int C{x}.
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -9340,37 +10665,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_short(PyObjec
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1391
+    /* "/root/package/cpyamf/util.pyx":1597
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:
  *             raise TypeError('expected int for x')             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.write_short(self, <short>x)
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_14));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_16));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_16));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_16));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1393
+  /* "/root/package/cpyamf/util.pyx":1599
  *             raise TypeError('expected int for x')
  * 
  *         cBufferedByteStream.write_short(self, <short>x)             # <<<<<<<<<<<<<<
  * 
  *     def write_ulong(self, x):
  */
-  __pyx_t_6 = __Pyx_PyInt_AsShort(__pyx_v_x); if (unlikely((__pyx_t_6 == (short)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_short(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((short)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsShort(__pyx_v_x); if (unlikely((__pyx_t_6 == (short)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_short(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((short)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9387,7 +10712,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_short(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1395
+/* "/root/package/cpyamf/util.pyx":1601
  *         cBufferedByteStream.write_short(self, <short>x)
  * 
  *     def write_ulong(self, x):             # <<<<<<<<<<<<<<
@@ -9410,7 +10735,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ulong(PyObjec
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1403
+  /* "/root/package/cpyamf/util.pyx":1609
  *         @raise TypeError: Unexpected type for int C{x}.
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -9426,43 +10751,43 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ulong(PyObjec
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1404
+    /* "/root/package/cpyamf/util.pyx":1610
  *         """
  *         if PyInt_Check(x) == 0 and PyLong_Check(x) == 0:
  *             raise TypeError('expected int for x')             # <<<<<<<<<<<<<<
  * 
  *         if x > 4294967295L or x < 0:
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_14));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_14));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_14));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_16));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_16));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_16));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1406
+  /* "/root/package/cpyamf/util.pyx":1612
  *             raise TypeError('expected int for x')
  * 
  *         if x > 4294967295L or x < 0:             # <<<<<<<<<<<<<<
  *             raise OverflowError
  * 
  */
-  __pyx_t_5 = PyObject_RichCompare(__pyx_v_x, __pyx_int_4294967295L, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyObject_RichCompare(__pyx_v_x, __pyx_int_4294967295L, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   if (!__pyx_t_3) {
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_x, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_RichCompare(__pyx_v_x, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_t_2 = __pyx_t_1;
   } else {
@@ -9470,7 +10795,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ulong(PyObjec
   }
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1407
+    /* "/root/package/cpyamf/util.pyx":1613
  * 
  *         if x > 4294967295L or x < 0:
  *             raise OverflowError             # <<<<<<<<<<<<<<
@@ -9478,20 +10803,20 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ulong(PyObjec
  *         cBufferedByteStream.write_ulong(self, <unsigned long>x)
  */
     __Pyx_Raise(__pyx_builtin_OverflowError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1409
+  /* "/root/package/cpyamf/util.pyx":1615
  *             raise OverflowError
  * 
  *         cBufferedByteStream.write_ulong(self, <unsigned long>x)             # <<<<<<<<<<<<<<
  * 
  *     def write_long(self, long x):
  */
-  __pyx_t_6 = __Pyx_PyInt_AsUnsignedLong(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_ulong(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned long)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsUnsignedLong(__pyx_v_x); if (unlikely((__pyx_t_6 == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1615; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_ulong(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((unsigned long)__pyx_t_6)); if (unlikely(__pyx_t_7 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1615; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9508,7 +10833,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_ulong(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1411
+/* "/root/package/cpyamf/util.pyx":1617
  *         cBufferedByteStream.write_ulong(self, <unsigned long>x)
  * 
  *     def write_long(self, long x):             # <<<<<<<<<<<<<<
@@ -9524,7 +10849,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_long(PyObject
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_long");
   assert(__pyx_arg_x); {
-    __pyx_v_x = __Pyx_PyInt_AsLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1411; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = __Pyx_PyInt_AsLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1617; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -9532,14 +10857,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_long(PyObject
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1418
+  /* "/root/package/cpyamf/util.pyx":1624
  *         @type x: C{int}
  *         """
  *         cBufferedByteStream.write_long(self, x)             # <<<<<<<<<<<<<<
  * 
  *     def write_24bit_uint(self, unsigned long x):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_long(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_long(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9552,7 +10877,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_long(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1420
+/* "/root/package/cpyamf/util.pyx":1626
  *         cBufferedByteStream.write_long(self, x)
  * 
  *     def write_24bit_uint(self, unsigned long x):             # <<<<<<<<<<<<<<
@@ -9568,7 +10893,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_uint(Py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_24bit_uint");
   assert(__pyx_arg_x); {
-    __pyx_v_x = __Pyx_PyInt_AsUnsignedLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1420; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = __Pyx_PyInt_AsUnsignedLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1626; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -9576,14 +10901,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_uint(Py
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1427
+  /* "/root/package/cpyamf/util.pyx":1633
  *         @type x: C{int}
  *         """
  *         cBufferedByteStream.write_24bit_uint(self, x)             # <<<<<<<<<<<<<<
  * 
  *     def write_24bit_int(self, long x):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_24bit_uint(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_24bit_uint(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1633; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9596,7 +10921,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_uint(Py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1429
+/* "/root/package/cpyamf/util.pyx":1635
  *         cBufferedByteStream.write_24bit_uint(self, x)
  * 
  *     def write_24bit_int(self, long x):             # <<<<<<<<<<<<<<
@@ -9612,7 +10937,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_int(PyO
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_24bit_int");
   assert(__pyx_arg_x); {
-    __pyx_v_x = __Pyx_PyInt_AsLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1429; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = __Pyx_PyInt_AsLong(__pyx_arg_x); if (unlikely((__pyx_v_x == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1635; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -9620,14 +10945,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_int(PyO
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1436
+  /* "/root/package/cpyamf/util.pyx":1642
  *         @type x: C{int}
  *         """
  *         cBufferedByteStream.write_24bit_int(self, x)             # <<<<<<<<<<<<<<
  * 
  *     def read_utf8_string(self, unsigned int size):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_24bit_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_24bit_int(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_x); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9640,7 +10965,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_24bit_int(PyO
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1438
+/* "/root/package/cpyamf/util.pyx":1644
  *         cBufferedByteStream.write_24bit_int(self, x)
  * 
  *     def read_utf8_string(self, unsigned int size):             # <<<<<<<<<<<<<<
@@ -9656,7 +10981,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_utf8_string(Py
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("read_utf8_string");
   assert(__pyx_arg_size); {
-    __pyx_v_size = __Pyx_PyInt_AsUnsignedInt(__pyx_arg_size); if (unlikely((__pyx_v_size == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1438; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_size = __Pyx_PyInt_AsUnsignedInt(__pyx_arg_size); if (unlikely((__pyx_v_size == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1644; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -9664,7 +10989,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_utf8_string(Py
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1444
+  /* "/root/package/cpyamf/util.pyx":1650
  *         @rtype: C{unicode}
  *         """
  *         return cBufferedByteStream.read_utf8_string(self, size)             # <<<<<<<<<<<<<<
@@ -9672,7 +10997,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_utf8_string(Py
  *     def write_utf8_string(self, obj):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9690,7 +11015,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_utf8_string(Py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1446
+/* "/root/package/cpyamf/util.pyx":1652
  *         return cBufferedByteStream.read_utf8_string(self, size)
  * 
  *     def write_utf8_string(self, obj):             # <<<<<<<<<<<<<<
@@ -9705,14 +11030,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_utf8_string(P
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("write_utf8_string");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1452
+  /* "/root/package/cpyamf/util.pyx":1658
  *         @param obj: unicode object
  *         """
  *         cBufferedByteStream.write_utf8_string(self, obj)             # <<<<<<<<<<<<<<
  * 
  *     def read_double(self):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_utf8_string(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -9725,7 +11050,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_utf8_string(P
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1454
+/* "/root/package/cpyamf/util.pyx":1660
  *         cBufferedByteStream.write_utf8_string(self, obj)
  * 
  *     def read_double(self):             # <<<<<<<<<<<<<<
@@ -9744,18 +11069,18 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
   __Pyx_RefNannySetupContext("read_double");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1460
+  /* "/root/package/cpyamf/util.pyx":1666
  *         cdef double x
  * 
  *         if cBufferedByteStream.read_double(self, &x) == -1:             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_double(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_double(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1461
+    /* "/root/package/cpyamf/util.pyx":1667
  * 
  *         if cBufferedByteStream.read_double(self, &x) == -1:
  *             return             # <<<<<<<<<<<<<<
@@ -9769,7 +11094,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1463
+  /* "/root/package/cpyamf/util.pyx":1669
  *             return
  * 
  *         if float_broken == 1:             # <<<<<<<<<<<<<<
@@ -9779,7 +11104,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
   __pyx_t_2 = (__pyx_v_6cpyamf_4util_float_broken == 1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1464
+    /* "/root/package/cpyamf/util.pyx":1670
  * 
  *         if float_broken == 1:
  *             if memcmp(&x, &system_nan, 8) == 0:             # <<<<<<<<<<<<<<
@@ -9789,7 +11114,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
     __pyx_t_2 = (memcmp((&__pyx_v_x), (&__pyx_v_6cpyamf_4util_system_nan), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1465
+      /* "/root/package/cpyamf/util.pyx":1671
  *         if float_broken == 1:
  *             if memcmp(&x, &system_nan, 8) == 0:
  *                 return pyamf_NaN             # <<<<<<<<<<<<<<
@@ -9803,7 +11128,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
       goto __pyx_L7;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1466
+    /* "/root/package/cpyamf/util.pyx":1672
  *             if memcmp(&x, &system_nan, 8) == 0:
  *                 return pyamf_NaN
  *             elif memcmp(&x, &system_neginf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -9813,7 +11138,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
     __pyx_t_2 = (memcmp((&__pyx_v_x), (&__pyx_v_6cpyamf_4util_system_neginf), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1467
+      /* "/root/package/cpyamf/util.pyx":1673
  *                 return pyamf_NaN
  *             elif memcmp(&x, &system_neginf, 8) == 0:
  *                 return pyamf_NegInf             # <<<<<<<<<<<<<<
@@ -9827,7 +11152,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
       goto __pyx_L7;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1468
+    /* "/root/package/cpyamf/util.pyx":1674
  *             elif memcmp(&x, &system_neginf, 8) == 0:
  *                 return pyamf_NegInf
  *             elif memcmp(&x, &system_posinf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -9837,7 +11162,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
     __pyx_t_2 = (memcmp((&__pyx_v_x), (&__pyx_v_6cpyamf_4util_system_posinf), 8) == 0);
     if (__pyx_t_2) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1469
+      /* "/root/package/cpyamf/util.pyx":1675
  *                 return pyamf_NegInf
  *             elif memcmp(&x, &system_posinf, 8) == 0:
  *                 return pyamf_PosInf             # <<<<<<<<<<<<<<
@@ -9855,7 +11180,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1471
+  /* "/root/package/cpyamf/util.pyx":1677
  *                 return pyamf_PosInf
  * 
  *         return PyFloat_FromDouble(x)             # <<<<<<<<<<<<<<
@@ -9863,7 +11188,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
  *     def write_double(self, val):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1677; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -9882,7 +11207,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_double(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1473
+/* "/root/package/cpyamf/util.pyx":1679
  *         return PyFloat_FromDouble(x)
  * 
  *     def write_double(self, val):             # <<<<<<<<<<<<<<
@@ -9905,7 +11230,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
   __Pyx_INCREF(__pyx_v_val);
   __pyx_v_done = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1481
+  /* "/root/package/cpyamf/util.pyx":1687
  *         @raise TypeError: Unexpected type for float C{val}.
  *         """
  *         if PyFloat_Check(val) == 0:             # <<<<<<<<<<<<<<
@@ -9915,29 +11240,29 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
   __pyx_t_1 = (PyFloat_Check(__pyx_v_val) == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1482
+    /* "/root/package/cpyamf/util.pyx":1688
  *         """
  *         if PyFloat_Check(val) == 0:
  *             raise TypeError('Expecting float for val')             # <<<<<<<<<<<<<<
  * 
  *         cdef double d = PyFloat_AsDouble(val)
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_15));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_15));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_15));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_17));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_17));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_17));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1688; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1484
+  /* "/root/package/cpyamf/util.pyx":1690
  *             raise TypeError('Expecting float for val')
  * 
  *         cdef double d = PyFloat_AsDouble(val)             # <<<<<<<<<<<<<<
@@ -9946,7 +11271,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
  */
   __pyx_v_d = PyFloat_AsDouble(__pyx_v_val);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1486
+  /* "/root/package/cpyamf/util.pyx":1692
  *         cdef double d = PyFloat_AsDouble(val)
  * 
  *         if float_broken == 1:             # <<<<<<<<<<<<<<
@@ -9956,7 +11281,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
   __pyx_t_1 = (__pyx_v_6cpyamf_4util_float_broken == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1487
+    /* "/root/package/cpyamf/util.pyx":1693
  * 
  *         if float_broken == 1:
  *             if memcmp(&d, &platform_nan, 8) == 0:             # <<<<<<<<<<<<<<
@@ -9966,7 +11291,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
     __pyx_t_1 = (memcmp((&__pyx_v_d), (&__pyx_v_6cpyamf_4util_platform_nan), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1488
+      /* "/root/package/cpyamf/util.pyx":1694
  *         if float_broken == 1:
  *             if memcmp(&d, &platform_nan, 8) == 0:
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -9979,7 +11304,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
       goto __pyx_L7;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1489
+    /* "/root/package/cpyamf/util.pyx":1695
  *             if memcmp(&d, &platform_nan, 8) == 0:
  *                 done = 1
  *             elif memcmp(&d, &platform_neginf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -9989,7 +11314,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
     __pyx_t_1 = (memcmp((&__pyx_v_d), (&__pyx_v_6cpyamf_4util_platform_neginf), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1490
+      /* "/root/package/cpyamf/util.pyx":1696
  *                 done = 1
  *             elif memcmp(&d, &platform_neginf, 8) == 0:
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -10002,7 +11327,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
       goto __pyx_L7;
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1491
+    /* "/root/package/cpyamf/util.pyx":1697
  *             elif memcmp(&d, &platform_neginf, 8) == 0:
  *                 done = 1
  *             elif memcmp(&d, &platform_posinf, 8) == 0:             # <<<<<<<<<<<<<<
@@ -10012,7 +11337,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
     __pyx_t_1 = (memcmp((&__pyx_v_d), (&__pyx_v_6cpyamf_4util_platform_posinf), 8) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1492
+      /* "/root/package/cpyamf/util.pyx":1698
  *                 done = 1
  *             elif memcmp(&d, &platform_posinf, 8) == 0:
  *                 done = 1             # <<<<<<<<<<<<<<
@@ -10026,20 +11351,20 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
     }
     __pyx_L7:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1494
+    /* "/root/package/cpyamf/util.pyx":1700
  *                 done = 1
  * 
  *             if done == 1:             # <<<<<<<<<<<<<<
  *                 if is_big_endian(SYSTEM_ENDIAN):
  *                     if not is_big_endian(self._endian):
  */
-    __pyx_t_3 = PyObject_RichCompare(__pyx_v_done, __pyx_int_1, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_RichCompare(__pyx_v_done, __pyx_int_1, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1700; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1700; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1495
+      /* "/root/package/cpyamf/util.pyx":1701
  * 
  *             if done == 1:
  *                 if is_big_endian(SYSTEM_ENDIAN):             # <<<<<<<<<<<<<<
@@ -10049,7 +11374,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
       __pyx_t_4 = __pyx_f_6cpyamf_4util_is_big_endian(__pyx_v_6cpyamf_4util_SYSTEM_ENDIAN);
       if (__pyx_t_4) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1496
+        /* "/root/package/cpyamf/util.pyx":1702
  *             if done == 1:
  *                 if is_big_endian(SYSTEM_ENDIAN):
  *                     if not is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -10059,14 +11384,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
         __pyx_t_1 = (!__pyx_f_6cpyamf_4util_is_big_endian(((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base._endian));
         if (__pyx_t_1) {
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1497
+          /* "/root/package/cpyamf/util.pyx":1703
  *                 if is_big_endian(SYSTEM_ENDIAN):
  *                     if not is_big_endian(self._endian):
  *                         swap_bytes(<unsigned char *>&d, 8)             # <<<<<<<<<<<<<<
  *                 else:
  *                     if is_big_endian(self._endian):
  */
-          __pyx_t_4 = __pyx_f_6cpyamf_4util_swap_bytes(((unsigned char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_4 = __pyx_f_6cpyamf_4util_swap_bytes(((unsigned char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L10;
         }
         __pyx_L10:;
@@ -10074,7 +11399,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
       }
       /*else*/ {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1499
+        /* "/root/package/cpyamf/util.pyx":1705
  *                         swap_bytes(<unsigned char *>&d, 8)
  *                 else:
  *                     if is_big_endian(self._endian):             # <<<<<<<<<<<<<<
@@ -10084,30 +11409,30 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
         __pyx_t_4 = __pyx_f_6cpyamf_4util_is_big_endian(((struct __pyx_obj_6cpyamf_4util_BufferedByteStream *)__pyx_v_self)->__pyx_base._endian);
         if (__pyx_t_4) {
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1500
+          /* "/root/package/cpyamf/util.pyx":1706
  *                 else:
  *                     if is_big_endian(self._endian):
  *                         swap_bytes(<unsigned char *>&d, 8)             # <<<<<<<<<<<<<<
  * 
  *                 cBufferedByteStream.write(self, <char *>&d, 8)
  */
-          __pyx_t_4 = __pyx_f_6cpyamf_4util_swap_bytes(((unsigned char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_4 = __pyx_f_6cpyamf_4util_swap_bytes(((unsigned char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L11;
         }
         __pyx_L11:;
       }
       __pyx_L9:;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1502
+      /* "/root/package/cpyamf/util.pyx":1708
  *                         swap_bytes(<unsigned char *>&d, 8)
  * 
  *                 cBufferedByteStream.write(self, <char *>&d, 8)             # <<<<<<<<<<<<<<
  * 
  *                 return
  */
-      __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1502; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((char *)(&__pyx_v_d)), 8); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1708; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1504
+      /* "/root/package/cpyamf/util.pyx":1710
  *                 cBufferedByteStream.write(self, <char *>&d, 8)
  * 
  *                 return             # <<<<<<<<<<<<<<
@@ -10124,14 +11449,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1506
+  /* "/root/package/cpyamf/util.pyx":1712
  *                 return
  * 
  *         cBufferedByteStream.write_double(self, d)             # <<<<<<<<<<<<<<
  * 
  *     def read_float(self):
  */
-  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_double(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_d); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_double(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_d); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -10149,7 +11474,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_double(PyObje
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1508
+/* "/root/package/cpyamf/util.pyx":1714
  *         cBufferedByteStream.write_double(self, d)
  * 
  *     def read_float(self):             # <<<<<<<<<<<<<<
@@ -10168,18 +11493,18 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_float(PyObject
   __Pyx_RefNannySetupContext("read_float");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1514
+  /* "/root/package/cpyamf/util.pyx":1720
  *         cdef float x
  * 
  *         if cBufferedByteStream.read_float(self, &x) == -1:             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_float(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->read_float(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), (&__pyx_v_x)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1720; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1515
+    /* "/root/package/cpyamf/util.pyx":1721
  * 
  *         if cBufferedByteStream.read_float(self, &x) == -1:
  *             return             # <<<<<<<<<<<<<<
@@ -10193,7 +11518,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_float(PyObject
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1517
+  /* "/root/package/cpyamf/util.pyx":1723
  *             return
  * 
  *         return PyFloat_FromDouble(x)             # <<<<<<<<<<<<<<
@@ -10201,7 +11526,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_float(PyObject
  *     def write_float(self, x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -10220,7 +11545,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_float(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1519
+/* "/root/package/cpyamf/util.pyx":1725
  *         return PyFloat_FromDouble(x)
  * 
  *     def write_float(self, x):             # <<<<<<<<<<<<<<
@@ -10241,7 +11566,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_float(PyObjec
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_x);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1526
+  /* "/root/package/cpyamf/util.pyx":1732
  *         @type x: C{float}
  *         """
  *         if PyFloat_Check(x) == 0:             # <<<<<<<<<<<<<<
@@ -10251,37 +11576,37 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_float(PyObjec
   __pyx_t_1 = (PyFloat_Check(__pyx_v_x) == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1527
+    /* "/root/package/cpyamf/util.pyx":1733
  *         """
  *         if PyFloat_Check(x) == 0:
  *             raise TypeError('Expecting float for val')             # <<<<<<<<<<<<<<
  * 
  *         cBufferedByteStream.write_float(self, <float>x)
  */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_15));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_15));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_15));
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_17));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_17));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_17));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1529
+  /* "/root/package/cpyamf/util.pyx":1735
  *             raise TypeError('Expecting float for val')
  * 
  *         cBufferedByteStream.write_float(self, <float>x)             # <<<<<<<<<<<<<<
  * 
  *     def append(self, data):
  */
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_x); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_float(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((float)__pyx_t_4)); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_x); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1735; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->write_float(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), ((float)__pyx_t_4)); if (unlikely(__pyx_t_5 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1735; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -10298,7 +11623,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_write_float(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1531
+/* "/root/package/cpyamf/util.pyx":1737
  *         cBufferedByteStream.write_float(self, <float>x)
  * 
  *     def append(self, data):             # <<<<<<<<<<<<<<
@@ -10313,14 +11638,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_append(PyObject *__
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("append");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1540
+  /* "/root/package/cpyamf/util.pyx":1746
  *         @raise TypeError: data is not C{str} or C{unicode}
  *         """
  *         cBufferedByteStream.append(self, data)             # <<<<<<<<<<<<<<
  * 
  *     def __add__(self, other):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->append(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_data); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->append(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self), __pyx_v_data); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1746; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -10333,7 +11658,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream_append(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1542
+/* "/root/package/cpyamf/util.pyx":1748
  *         cBufferedByteStream.append(self, data)
  * 
  *     def __add__(self, other):             # <<<<<<<<<<<<<<
@@ -10354,87 +11679,87 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___add__(PyObject *_
   __Pyx_RefNannySetupContext("__add__");
   __pyx_v_new = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1543
+  /* "/root/package/cpyamf/util.pyx":1749
  * 
  *     def __add__(self, other):
  *         cdef long old_pos = <long>self.tell()             # <<<<<<<<<<<<<<
  *         cdef long old_other_pos = <long>other.tell()
  * 
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__tell); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__tell); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_AsLong(__pyx_t_2); if (unlikely((__pyx_t_3 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_AsLong(__pyx_t_2); if (unlikely((__pyx_t_3 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_old_pos = ((long)__pyx_t_3);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1544
+  /* "/root/package/cpyamf/util.pyx":1750
  *     def __add__(self, other):
  *         cdef long old_pos = <long>self.tell()
  *         cdef long old_other_pos = <long>other.tell()             # <<<<<<<<<<<<<<
  * 
  *         new = BufferedByteStream(self)
  */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__tell); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__tell); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_3 = __Pyx_PyInt_AsLong(__pyx_t_1); if (unlikely((__pyx_t_3 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_AsLong(__pyx_t_1); if (unlikely((__pyx_t_3 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_old_other_pos = ((long)__pyx_t_3);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1546
+  /* "/root/package/cpyamf/util.pyx":1752
  *         cdef long old_other_pos = <long>other.tell()
  * 
  *         new = BufferedByteStream(self)             # <<<<<<<<<<<<<<
  * 
  *         other.seek(0)
  */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1752; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_self);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self);
   __Pyx_GIVEREF(__pyx_v_self);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_4util_BufferedByteStream)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_4util_BufferedByteStream)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1752; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_new);
   __pyx_v_new = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1548
+  /* "/root/package/cpyamf/util.pyx":1754
  *         new = BufferedByteStream(self)
  * 
  *         other.seek(0)             # <<<<<<<<<<<<<<
  *         new.seek(0, 2)
  *         new.write(other.read())
  */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__seek); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__seek); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_int_0);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
-  __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1549
+  /* "/root/package/cpyamf/util.pyx":1755
  * 
  *         other.seek(0)
  *         new.seek(0, 2)             # <<<<<<<<<<<<<<
  *         new.write(other.read())
  * 
  */
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1755; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1755; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_int_0);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
@@ -10442,102 +11767,102 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___add__(PyObject *_
   __Pyx_INCREF(__pyx_int_2);
   PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_2);
   __Pyx_GIVEREF(__pyx_int_2);
-  __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1755; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1550
+  /* "/root/package/cpyamf/util.pyx":1756
  *         other.seek(0)
  *         new.seek(0, 2)
  *         new.write(other.read())             # <<<<<<<<<<<<<<
  * 
  *         self.seek(old_pos)
  */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__read); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__read); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1552
+  /* "/root/package/cpyamf/util.pyx":1758
  *         new.write(other.read())
  * 
  *         self.seek(old_pos)             # <<<<<<<<<<<<<<
  *         other.seek(old_other_pos)
  *         new.seek(0)
  */
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__seek); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1758; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_old_pos); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_old_pos); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1758; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1758; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1758; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1553
+  /* "/root/package/cpyamf/util.pyx":1759
  * 
  *         self.seek(old_pos)
  *         other.seek(old_other_pos)             # <<<<<<<<<<<<<<
  *         new.seek(0)
  * 
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__seek); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_other, __pyx_n_s__seek); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyInt_FromLong(__pyx_v_old_other_pos); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_old_other_pos); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1554
+  /* "/root/package/cpyamf/util.pyx":1760
  *         self.seek(old_pos)
  *         other.seek(old_other_pos)
  *         new.seek(0)             # <<<<<<<<<<<<<<
  * 
  *         return new
  */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__seek); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_new, __pyx_n_s__seek); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_int_0);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1556
+  /* "/root/package/cpyamf/util.pyx":1762
  *         new.seek(0)
  * 
  *         return new             # <<<<<<<<<<<<<<
@@ -10564,7 +11889,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___add__(PyObject *_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1558
+/* "/root/package/cpyamf/util.pyx":1764
  *         return new
  * 
  *     def __str__(self):             # <<<<<<<<<<<<<<
@@ -10578,7 +11903,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___str__(PyObject *_
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__str__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1559
+  /* "/root/package/cpyamf/util.pyx":1765
  * 
  *     def __str__(self):
  *         return cBufferedByteStream.getvalue(self)             # <<<<<<<<<<<<<<
@@ -10586,7 +11911,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___str__(PyObject *_
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->getvalue(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream->getvalue(((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1765; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10604,7 +11929,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18BufferedByteStream___str__(PyObject *_
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1566
+/* "/root/package/cpyamf/util.pyx":1772
  *     """
  * 
  *     def __cinit__(self, int use_hash=0):             # <<<<<<<<<<<<<<
@@ -10636,31 +11961,31 @@ static int __pyx_pf_6cpyamf_4util_18cIndexedCollection___cinit__(PyObject *__pyx
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1566; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     if (values[0]) {
-      __pyx_v_use_hash = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_use_hash == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1566; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_use_hash = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_use_hash == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_use_hash = ((int)0);
     }
   } else {
     __pyx_v_use_hash = ((int)0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_use_hash = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_use_hash == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1566; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_use_hash = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_use_hash == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  0: break;
       default: goto __pyx_L5_argtuple_error;
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1566; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.cIndexedCollection.__cinit__");
   return -1;
   __pyx_L4_argument_unpacking_done:;
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1567
+  /* "/root/package/cpyamf/util.pyx":1773
  * 
  *     def __cinit__(self, int use_hash=0):
  *         if complete_init == 0:             # <<<<<<<<<<<<<<
@@ -10670,19 +11995,19 @@ static int __pyx_pf_6cpyamf_4util_18cIndexedCollection___cinit__(PyObject *__pyx
   __pyx_t_1 = (__pyx_v_6cpyamf_4util_complete_init == 0);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1568
+    /* "/root/package/cpyamf/util.pyx":1774
  *     def __cinit__(self, int use_hash=0):
  *         if complete_init == 0:
  *             complete_import()             # <<<<<<<<<<<<<<
  * 
  *         self.use_hash = use_hash
  */
-    __pyx_t_2 = __pyx_f_6cpyamf_4util_complete_import(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_6cpyamf_4util_complete_import(); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1570
+  /* "/root/package/cpyamf/util.pyx":1776
  *             complete_import()
  * 
  *         self.use_hash = use_hash             # <<<<<<<<<<<<<<
@@ -10691,14 +12016,14 @@ static int __pyx_pf_6cpyamf_4util_18cIndexedCollection___cinit__(PyObject *__pyx
  */
   ((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->use_hash = __pyx_v_use_hash;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1572
+  /* "/root/package/cpyamf/util.pyx":1778
  *         self.use_hash = use_hash
  * 
  *         self.clear()             # <<<<<<<<<<<<<<
  * 
  *     cdef void _clear(self):
  */
-  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->__pyx_vtab)->clear(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->__pyx_vtab)->clear(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1778; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = 0;
   goto __pyx_L0;
@@ -10711,7 +12036,7 @@ static int __pyx_pf_6cpyamf_4util_18cIndexedCollection___cinit__(PyObject *__pyx
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1574
+/* "/root/package/cpyamf/util.pyx":1780
  *         self.clear()
  * 
  *     cdef void _clear(self):             # <<<<<<<<<<<<<<
@@ -10726,7 +12051,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
   __Pyx_RefNannySetupContext("_clear");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1577
+  /* "/root/package/cpyamf/util.pyx":1783
  *         cdef Py_ssize_t i
  * 
  *         if self.data != NULL:             # <<<<<<<<<<<<<<
@@ -10736,7 +12061,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
   __pyx_t_1 = (__pyx_v_self->data != NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1578
+    /* "/root/package/cpyamf/util.pyx":1784
  * 
  *         if self.data != NULL:
  *             for i from 0 <= i < self.length:             # <<<<<<<<<<<<<<
@@ -10746,7 +12071,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
     __pyx_t_2 = __pyx_v_self->length;
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1579
+      /* "/root/package/cpyamf/util.pyx":1785
  *         if self.data != NULL:
  *             for i from 0 <= i < self.length:
  *                 Py_DECREF(self.data[i])             # <<<<<<<<<<<<<<
@@ -10756,7 +12081,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
       Py_DECREF((__pyx_v_self->data[__pyx_v_i]));
     }
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1581
+    /* "/root/package/cpyamf/util.pyx":1787
  *                 Py_DECREF(self.data[i])
  * 
  *             PyMem_Free(self.data)             # <<<<<<<<<<<<<<
@@ -10765,7 +12090,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
  */
     PyMem_Free(__pyx_v_self->data);
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1582
+    /* "/root/package/cpyamf/util.pyx":1788
  * 
  *             PyMem_Free(self.data)
  *             self.data = NULL             # <<<<<<<<<<<<<<
@@ -10781,7 +12106,7 @@ static  void __pyx_f_6cpyamf_4util_18cIndexedCollection__clear(struct __pyx_obj_
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1584
+/* "/root/package/cpyamf/util.pyx":1790
  *             self.data = NULL
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -10793,7 +12118,7 @@ static void __pyx_pf_6cpyamf_4util_18cIndexedCollection___dealloc__(PyObject *__
 static void __pyx_pf_6cpyamf_4util_18cIndexedCollection___dealloc__(PyObject *__pyx_v_self) {
   __Pyx_RefNannySetupContext("__dealloc__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1585
+  /* "/root/package/cpyamf/util.pyx":1791
  * 
  *     def __dealloc__(self):
  *         self._clear()             # <<<<<<<<<<<<<<
@@ -10805,7 +12130,7 @@ static void __pyx_pf_6cpyamf_4util_18cIndexedCollection___dealloc__(PyObject *__
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1587
+/* "/root/package/cpyamf/util.pyx":1793
  *         self._clear()
  * 
  *     cdef int _increase_size(self) except? -1:             # <<<<<<<<<<<<<<
@@ -10822,7 +12147,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
   __Pyx_RefNannySetupContext("_increase_size");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1588
+  /* "/root/package/cpyamf/util.pyx":1794
  * 
  *     cdef int _increase_size(self) except? -1:
  *         cdef Py_ssize_t new_len = self.length             # <<<<<<<<<<<<<<
@@ -10831,7 +12156,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
   __pyx_v_new_len = __pyx_v_self->length;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1589
+  /* "/root/package/cpyamf/util.pyx":1795
  *     cdef int _increase_size(self) except? -1:
  *         cdef Py_ssize_t new_len = self.length
  *         cdef Py_ssize_t current_size = self.size             # <<<<<<<<<<<<<<
@@ -10840,7 +12165,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
   __pyx_v_current_size = __pyx_v_self->size;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1592
+  /* "/root/package/cpyamf/util.pyx":1798
  *         cdef PyObject **cpy
  * 
  *         while new_len >= current_size:             # <<<<<<<<<<<<<<
@@ -10851,7 +12176,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
     __pyx_t_1 = (__pyx_v_new_len >= __pyx_v_current_size);
     if (!__pyx_t_1) break;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1593
+    /* "/root/package/cpyamf/util.pyx":1799
  * 
  *         while new_len >= current_size:
  *             current_size *= 2             # <<<<<<<<<<<<<<
@@ -10861,7 +12186,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
     __pyx_v_current_size *= 2;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1595
+  /* "/root/package/cpyamf/util.pyx":1801
  *             current_size *= 2
  * 
  *         if current_size != self.size:             # <<<<<<<<<<<<<<
@@ -10871,7 +12196,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
   __pyx_t_1 = (__pyx_v_current_size != __pyx_v_self->size);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1596
+    /* "/root/package/cpyamf/util.pyx":1802
  * 
  *         if current_size != self.size:
  *             self.size = current_size             # <<<<<<<<<<<<<<
@@ -10880,7 +12205,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
     __pyx_v_self->size = __pyx_v_current_size;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1598
+    /* "/root/package/cpyamf/util.pyx":1804
  *             self.size = current_size
  * 
  *             cpy = <PyObject **>PyMem_Realloc(self.data, sizeof(PyObject *) * self.size)             # <<<<<<<<<<<<<<
@@ -10889,7 +12214,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
     __pyx_v_cpy = ((PyObject **)PyMem_Realloc(__pyx_v_self->data, ((sizeof(PyObject *)) * __pyx_v_self->size)));
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1600
+    /* "/root/package/cpyamf/util.pyx":1806
  *             cpy = <PyObject **>PyMem_Realloc(self.data, sizeof(PyObject *) * self.size)
  * 
  *             if cpy == NULL:             # <<<<<<<<<<<<<<
@@ -10899,7 +12224,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
     __pyx_t_1 = (__pyx_v_cpy == NULL);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1601
+      /* "/root/package/cpyamf/util.pyx":1807
  * 
  *             if cpy == NULL:
  *                 PyMem_Free(self.data)             # <<<<<<<<<<<<<<
@@ -10908,7 +12233,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
       PyMem_Free(__pyx_v_self->data);
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1602
+      /* "/root/package/cpyamf/util.pyx":1808
  *             if cpy == NULL:
  *                 PyMem_Free(self.data)
  *                 self.data = NULL             # <<<<<<<<<<<<<<
@@ -10917,7 +12242,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  */
       __pyx_v_self->data = NULL;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1604
+      /* "/root/package/cpyamf/util.pyx":1810
  *                 self.data = NULL
  * 
  *                 raise MemoryError             # <<<<<<<<<<<<<<
@@ -10925,12 +12250,12 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
  *             self.data = cpy
  */
       __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1604; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1606
+    /* "/root/package/cpyamf/util.pyx":1812
  *                 raise MemoryError
  * 
  *             self.data = cpy             # <<<<<<<<<<<<<<
@@ -10942,7 +12267,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1608
+  /* "/root/package/cpyamf/util.pyx":1814
  *             self.data = cpy
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -10963,7 +12288,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size(struct __p
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1610
+/* "/root/package/cpyamf/util.pyx":1816
  *         return 0
  * 
  *     cdef int clear(self) except? -1:             # <<<<<<<<<<<<<<
@@ -10978,7 +12303,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
   __Pyx_RefNannySetupContext("clear");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1611
+  /* "/root/package/cpyamf/util.pyx":1817
  * 
  *     cdef int clear(self) except? -1:
  *         self._clear()             # <<<<<<<<<<<<<<
@@ -10987,7 +12312,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
  */
   ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_clear(__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1613
+  /* "/root/package/cpyamf/util.pyx":1819
  *         self._clear()
  * 
  *         self.length = 0             # <<<<<<<<<<<<<<
@@ -10996,7 +12321,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
  */
   __pyx_v_self->length = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1614
+  /* "/root/package/cpyamf/util.pyx":1820
  * 
  *         self.length = 0
  *         self.size = 64             # <<<<<<<<<<<<<<
@@ -11005,7 +12330,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
  */
   __pyx_v_self->size = 64;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1616
+  /* "/root/package/cpyamf/util.pyx":1822
  *         self.size = 64
  * 
  *         self.data = <PyObject **>PyMem_Malloc(sizeof(PyObject *) * self.size)             # <<<<<<<<<<<<<<
@@ -11014,7 +12339,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
  */
   __pyx_v_self->data = ((PyObject **)PyMem_Malloc(((sizeof(PyObject *)) * __pyx_v_self->size)));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1618
+  /* "/root/package/cpyamf/util.pyx":1824
  *         self.data = <PyObject **>PyMem_Malloc(sizeof(PyObject *) * self.size)
  * 
  *         if self.data == NULL:             # <<<<<<<<<<<<<<
@@ -11024,7 +12349,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
   __pyx_t_1 = (__pyx_v_self->data == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1619
+    /* "/root/package/cpyamf/util.pyx":1825
  * 
  *         if self.data == NULL:
  *             raise MemoryError             # <<<<<<<<<<<<<<
@@ -11032,19 +12357,19 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
  *         self.refs = {}
  */
     __Pyx_Raise(__pyx_builtin_MemoryError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1619; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1825; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1621
+  /* "/root/package/cpyamf/util.pyx":1827
  *             raise MemoryError
  * 
  *         self.refs = {}             # <<<<<<<<<<<<<<
  * 
  *         return 0
  */
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1621; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
   __Pyx_GOTREF(__pyx_v_self->refs);
@@ -11052,7 +12377,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
   __pyx_v_self->refs = ((PyObject *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1623
+  /* "/root/package/cpyamf/util.pyx":1829
  *         self.refs = {}
  * 
  *         return 0             # <<<<<<<<<<<<<<
@@ -11074,7 +12399,7 @@ static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_clear(struct __pyx_obj_6c
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1625
+/* "/root/package/cpyamf/util.pyx":1831
  *         return 0
  * 
  *     cdef object getByReference(self, Py_ssize_t ref):             # <<<<<<<<<<<<<<
@@ -11091,7 +12416,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
   __Pyx_RefNannySetupContext("getByReference");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1628
+  /* "/root/package/cpyamf/util.pyx":1834
  *         """
  *         """
  *         if ref < 0 or ref >= self.length:             # <<<<<<<<<<<<<<
@@ -11107,7 +12432,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1629
+    /* "/root/package/cpyamf/util.pyx":1835
  *         """
  *         if ref < 0 or ref >= self.length:
  *             return None             # <<<<<<<<<<<<<<
@@ -11122,7 +12447,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1631
+  /* "/root/package/cpyamf/util.pyx":1837
  *             return None
  * 
  *         Py_INCREF(self.data[ref])             # <<<<<<<<<<<<<<
@@ -11131,7 +12456,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
  */
   Py_INCREF((__pyx_v_self->data[__pyx_v_ref]));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1633
+  /* "/root/package/cpyamf/util.pyx":1839
  *         Py_INCREF(self.data[ref])
  * 
  *         return <object>self.data[ref]             # <<<<<<<<<<<<<<
@@ -11152,7 +12477,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1635
+/* "/root/package/cpyamf/util.pyx":1841
  *         return <object>self.data[ref]
  * 
  *     cdef inline object _ref(self, object obj):             # <<<<<<<<<<<<<<
@@ -11160,7 +12485,7 @@ static  PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference(stru
  *             return hash(obj)
  */
 
-static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *__pyx_v_self, PyObject *__pyx_v_obj) {
+static CYTHON_INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *__pyx_v_self, PyObject *__pyx_v_obj) {
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   long __pyx_t_2;
@@ -11170,7 +12495,7 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1636
+  /* "/root/package/cpyamf/util.pyx":1842
  * 
  *     cdef inline object _ref(self, object obj):
  *         if self.use_hash == 1:             # <<<<<<<<<<<<<<
@@ -11180,7 +12505,7 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
   __pyx_t_1 = (__pyx_v_self->use_hash == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1637
+    /* "/root/package/cpyamf/util.pyx":1843
  *     cdef inline object _ref(self, object obj):
  *         if self.use_hash == 1:
  *             return hash(obj)             # <<<<<<<<<<<<<<
@@ -11188,8 +12513,8 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
  *         return id(obj)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyObject_Hash(__pyx_v_obj); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1637; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = PyInt_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1637; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Hash(__pyx_v_obj); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
@@ -11198,7 +12523,7 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1639
+  /* "/root/package/cpyamf/util.pyx":1845
  *             return hash(obj)
  * 
  *         return id(obj)             # <<<<<<<<<<<<<<
@@ -11206,12 +12531,12 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
  *     cdef Py_ssize_t getReferenceTo(self, object obj) except? -1:
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_obj);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_obj);
   __Pyx_GIVEREF(__pyx_v_obj);
-  __pyx_t_4 = PyObject_Call(__pyx_builtin_id, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_builtin_id, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_r = __pyx_t_4;
@@ -11233,7 +12558,7 @@ static INLINE PyObject *__pyx_f_6cpyamf_4util_18cIndexedCollection__ref(struct _
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1641
+/* "/root/package/cpyamf/util.pyx":1847
  *         return id(obj)
  * 
  *     cdef Py_ssize_t getReferenceTo(self, object obj) except? -1:             # <<<<<<<<<<<<<<
@@ -11250,19 +12575,19 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo(str
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1642
+  /* "/root/package/cpyamf/util.pyx":1848
  * 
  *     cdef Py_ssize_t getReferenceTo(self, object obj) except? -1:
  *         cdef PyObject *p = <PyObject *>PyDict_GetItem(self.refs, self._ref(obj))             # <<<<<<<<<<<<<<
  * 
  *         if p == NULL:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_ref(__pyx_v_self, __pyx_v_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_ref(__pyx_v_self, __pyx_v_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1848; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_p = ((PyObject *)PyDict_GetItem(__pyx_v_self->refs, __pyx_t_1));
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1644
+  /* "/root/package/cpyamf/util.pyx":1850
  *         cdef PyObject *p = <PyObject *>PyDict_GetItem(self.refs, self._ref(obj))
  * 
  *         if p == NULL:             # <<<<<<<<<<<<<<
@@ -11272,7 +12597,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo(str
   __pyx_t_2 = (__pyx_v_p == NULL);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1645
+    /* "/root/package/cpyamf/util.pyx":1851
  * 
  *         if p == NULL:
  *             return -1             # <<<<<<<<<<<<<<
@@ -11285,7 +12610,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo(str
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1647
+  /* "/root/package/cpyamf/util.pyx":1853
  *             return -1
  * 
  *         return <Py_ssize_t>PyInt_AS_LONG(<object>p)             # <<<<<<<<<<<<<<
@@ -11308,7 +12633,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo(str
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1649
+/* "/root/package/cpyamf/util.pyx":1855
  *         return <Py_ssize_t>PyInt_AS_LONG(<object>p)
  * 
  *     cdef Py_ssize_t append(self, object obj) except? -1:             # <<<<<<<<<<<<<<
@@ -11326,18 +12651,18 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1650
+  /* "/root/package/cpyamf/util.pyx":1856
  * 
  *     cdef Py_ssize_t append(self, object obj) except? -1:
  *         if self._increase_size() == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_increase_size(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_increase_size(__pyx_v_self); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_2 = (__pyx_t_1 == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1651
+    /* "/root/package/cpyamf/util.pyx":1857
  *     cdef Py_ssize_t append(self, object obj) except? -1:
  *         if self._increase_size() == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -11350,32 +12675,32 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
   }
   __pyx_L3:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1653
+  /* "/root/package/cpyamf/util.pyx":1859
  *             return -1
  * 
  *         cdef object h = self._ref(obj)             # <<<<<<<<<<<<<<
  * 
  *         if PyDict_SetItem(self.refs, h, <object>self.length) == -1:
  */
-  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_ref(__pyx_v_self, __pyx_v_obj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1653; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_ref(__pyx_v_self, __pyx_v_obj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_h = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1655
+  /* "/root/package/cpyamf/util.pyx":1861
  *         cdef object h = self._ref(obj)
  * 
  *         if PyDict_SetItem(self.refs, h, <object>self.length) == -1:             # <<<<<<<<<<<<<<
  *             return -1
  * 
  */
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_self->length); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_self->length); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1861; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = (PyDict_SetItem(__pyx_v_self->refs, __pyx_v_h, __pyx_t_3) == -1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1656
+    /* "/root/package/cpyamf/util.pyx":1862
  * 
  *         if PyDict_SetItem(self.refs, h, <object>self.length) == -1:
  *             return -1             # <<<<<<<<<<<<<<
@@ -11388,7 +12713,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
   }
   __pyx_L4:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1658
+  /* "/root/package/cpyamf/util.pyx":1864
  *             return -1
  * 
  *         self.data[self.length] = <PyObject *>obj             # <<<<<<<<<<<<<<
@@ -11397,7 +12722,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
  */
   (__pyx_v_self->data[__pyx_v_self->length]) = ((PyObject *)__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1659
+  /* "/root/package/cpyamf/util.pyx":1865
  * 
  *         self.data[self.length] = <PyObject *>obj
  *         Py_INCREF(<PyObject *>obj)             # <<<<<<<<<<<<<<
@@ -11406,7 +12731,7 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
  */
   Py_INCREF(((PyObject *)__pyx_v_obj));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1661
+  /* "/root/package/cpyamf/util.pyx":1867
  *         Py_INCREF(<PyObject *>obj)
  * 
  *         self.length += 1             # <<<<<<<<<<<<<<
@@ -11415,12 +12740,12 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
  */
   __pyx_v_self->length += 1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1663
+  /* "/root/package/cpyamf/util.pyx":1869
  *         self.length += 1
  * 
  *         return self.length - 1             # <<<<<<<<<<<<<<
  * 
- *     def __iter__(self):
+ *     cdef int truncate(self, Py_ssize_t length) except? -1:
  */
   __pyx_r = (__pyx_v_self->length - 1);
   goto __pyx_L0;
@@ -11439,9 +12764,170 @@ static  Py_ssize_t __pyx_f_6cpyamf_4util_18cIndexedCollection_append(struct __py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1665
+/* "/root/package/cpyamf/util.pyx":1871
  *         return self.length - 1
  * 
+ *     cdef int truncate(self, Py_ssize_t length) except? -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t i
+ *         cdef object h
+ */
+
+static  int __pyx_f_6cpyamf_4util_18cIndexedCollection_truncate(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *__pyx_v_self, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_v_h;
+  PyObject *__pyx_v_p;
+  int __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  __Pyx_RefNannySetupContext("truncate");
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __pyx_v_h = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cpyamf/util.pyx":1876
+ *         cdef PyObject *p
+ * 
+ *         if length < 0:             # <<<<<<<<<<<<<<
+ *             length = 0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_length < 0);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cpyamf/util.pyx":1877
+ * 
+ *         if length < 0:
+ *             length = 0             # <<<<<<<<<<<<<<
+ * 
+ *         for i from length <= i < self.length:
+ */
+    __pyx_v_length = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/cpyamf/util.pyx":1879
+ *             length = 0
+ * 
+ *         for i from length <= i < self.length:             # <<<<<<<<<<<<<<
+ *             h = self._ref(<object>self.data[i])
+ *             p = <PyObject *>PyDict_GetItem(self.refs, h)
+ */
+  __pyx_t_2 = __pyx_v_self->length;
+  for (__pyx_v_i = __pyx_v_length; __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
+
+    /* "/root/package/cpyamf/util.pyx":1880
+ * 
+ *         for i from length <= i < self.length:
+ *             h = self._ref(<object>self.data[i])             # <<<<<<<<<<<<<<
+ *             p = <PyObject *>PyDict_GetItem(self.refs, h)
+ * 
+ */
+    __pyx_t_3 = (__pyx_v_self->data[__pyx_v_i]);
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_self->__pyx_vtab)->_ref(__pyx_v_self, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1880; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_v_h);
+    __pyx_v_h = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "/root/package/cpyamf/util.pyx":1881
+ *         for i from length <= i < self.length:
+ *             h = self._ref(<object>self.data[i])
+ *             p = <PyObject *>PyDict_GetItem(self.refs, h)             # <<<<<<<<<<<<<<
+ * 
+ *             if p != NULL and PyInt_AS_LONG(<object>p) >= length:
+ */
+    __pyx_v_p = ((PyObject *)PyDict_GetItem(__pyx_v_self->refs, __pyx_v_h));
+
+    /* "/root/package/cpyamf/util.pyx":1883
+ *             p = <PyObject *>PyDict_GetItem(self.refs, h)
+ * 
+ *             if p != NULL and PyInt_AS_LONG(<object>p) >= length:             # <<<<<<<<<<<<<<
+ *                 del self.refs[h]
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_p != NULL);
+    if (__pyx_t_1) {
+      __pyx_t_5 = (PyInt_AS_LONG(((PyObject *)__pyx_v_p)) >= __pyx_v_length);
+      __pyx_t_6 = __pyx_t_5;
+    } else {
+      __pyx_t_6 = __pyx_t_1;
+    }
+    if (__pyx_t_6) {
+
+      /* "/root/package/cpyamf/util.pyx":1884
+ * 
+ *             if p != NULL and PyInt_AS_LONG(<object>p) >= length:
+ *                 del self.refs[h]             # <<<<<<<<<<<<<<
+ * 
+ *             Py_DECREF(self.data[i])
+ */
+      if (PyObject_DelItem(__pyx_v_self->refs, __pyx_v_h) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1884; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "/root/package/cpyamf/util.pyx":1886
+ *                 del self.refs[h]
+ * 
+ *             Py_DECREF(self.data[i])             # <<<<<<<<<<<<<<
+ * 
+ *         if length < self.length:
+ */
+    Py_DECREF((__pyx_v_self->data[__pyx_v_i]));
+  }
+
+  /* "/root/package/cpyamf/util.pyx":1888
+ *             Py_DECREF(self.data[i])
+ * 
+ *         if length < self.length:             # <<<<<<<<<<<<<<
+ *             self.length = length
+ * 
+ */
+  __pyx_t_6 = (__pyx_v_length < __pyx_v_self->length);
+  if (__pyx_t_6) {
+
+    /* "/root/package/cpyamf/util.pyx":1889
+ * 
+ *         if length < self.length:
+ *             self.length = length             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_v_self->length = __pyx_v_length;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/cpyamf/util.pyx":1891
+ *             self.length = length
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __iter__(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpyamf.util.cIndexedCollection.truncate");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_h);
+  __Pyx_DECREF((PyObject *)__pyx_v_self);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cpyamf/util.pyx":1893
+ *         return 0
+ * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
  *         cdef object x = []
  *         cdef Py_ssize_t idx
@@ -11458,19 +12944,19 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___iter__(PyObject *
   __Pyx_RefNannySetupContext("__iter__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1666
+  /* "/root/package/cpyamf/util.pyx":1894
  * 
  *     def __iter__(self):
  *         cdef object x = []             # <<<<<<<<<<<<<<
  *         cdef Py_ssize_t idx
  * 
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1894; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __pyx_v_x = ((PyObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1669
+  /* "/root/package/cpyamf/util.pyx":1897
  *         cdef Py_ssize_t idx
  * 
  *         for idx from 0 <= idx < self.length:             # <<<<<<<<<<<<<<
@@ -11480,7 +12966,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___iter__(PyObject *
   __pyx_t_2 = ((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->length;
   for (__pyx_v_idx = 0; __pyx_v_idx < __pyx_t_2; __pyx_v_idx++) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1670
+    /* "/root/package/cpyamf/util.pyx":1898
  * 
  *         for idx from 0 <= idx < self.length:
  *             x.append(<object>self.data[idx])             # <<<<<<<<<<<<<<
@@ -11488,12 +12974,12 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___iter__(PyObject *
  *         return iter(x)
  */
     __pyx_t_3 = (((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->data[__pyx_v_idx]);
-    __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_x, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1670; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_x, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1898; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1672
+  /* "/root/package/cpyamf/util.pyx":1900
  *             x.append(<object>self.data[idx])
  * 
  *         return iter(x)             # <<<<<<<<<<<<<<
@@ -11501,7 +12987,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___iter__(PyObject *
  *     def __len__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetIter(__pyx_v_x); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1672; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetIter(__pyx_v_x); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1900; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -11521,7 +13007,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___iter__(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1674
+/* "/root/package/cpyamf/util.pyx":1902
  *         return iter(x)
  * 
  *     def __len__(self):             # <<<<<<<<<<<<<<
@@ -11534,7 +13020,7 @@ static Py_ssize_t __pyx_pf_6cpyamf_4util_18cIndexedCollection___len__(PyObject *
   Py_ssize_t __pyx_r;
   __Pyx_RefNannySetupContext("__len__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1675
+  /* "/root/package/cpyamf/util.pyx":1903
  * 
  *     def __len__(self):
  *         return self.length             # <<<<<<<<<<<<<<
@@ -11550,7 +13036,7 @@ static Py_ssize_t __pyx_pf_6cpyamf_4util_18cIndexedCollection___len__(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1677
+/* "/root/package/cpyamf/util.pyx":1905
  *         return self.length
  * 
  *     def __richcmp__(self, object other, int op):             # <<<<<<<<<<<<<<
@@ -11574,18 +13060,18 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   __Pyx_INCREF(__pyx_v_self);
   __Pyx_INCREF(__pyx_v_other);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1680
+  /* "/root/package/cpyamf/util.pyx":1908
  *         cdef int equal
  *         cdef Py_ssize_t i
  *         cdef cIndexedCollection s = self # this is necessary because cython does not see the c-space vars of the class for this func             # <<<<<<<<<<<<<<
  * 
  *         if PyDict_Check(other) == 1:
  */
-  if (!(likely(((__pyx_v_self) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_self, __pyx_ptype_6cpyamf_4util_cIndexedCollection))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1680; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_v_self) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_self, __pyx_ptype_6cpyamf_4util_cIndexedCollection))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1908; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_INCREF(__pyx_v_self);
   __pyx_v_s = ((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1682
+  /* "/root/package/cpyamf/util.pyx":1910
  *         cdef cIndexedCollection s = self # this is necessary because cython does not see the c-space vars of the class for this func
  * 
  *         if PyDict_Check(other) == 1:             # <<<<<<<<<<<<<<
@@ -11595,22 +13081,22 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   __pyx_t_1 = (PyDict_Check(__pyx_v_other) == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1683
+    /* "/root/package/cpyamf/util.pyx":1911
  * 
  *         if PyDict_Check(other) == 1:
  *             equal = s.refs == other             # <<<<<<<<<<<<<<
  *         elif PyList_Check(other) != 1:
  *             equal = 0
  */
-    __pyx_t_2 = PyObject_RichCompare(__pyx_v_s->refs, __pyx_v_other, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1683; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_RichCompare(__pyx_v_s->refs, __pyx_v_other, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1911; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1683; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1911; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_v_equal = __pyx_t_3;
     goto __pyx_L5;
   }
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1684
+  /* "/root/package/cpyamf/util.pyx":1912
  *         if PyDict_Check(other) == 1:
  *             equal = s.refs == other
  *         elif PyList_Check(other) != 1:             # <<<<<<<<<<<<<<
@@ -11620,7 +13106,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   __pyx_t_1 = (PyList_Check(__pyx_v_other) != 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1685
+    /* "/root/package/cpyamf/util.pyx":1913
  *             equal = s.refs == other
  *         elif PyList_Check(other) != 1:
  *             equal = 0             # <<<<<<<<<<<<<<
@@ -11632,7 +13118,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1687
+    /* "/root/package/cpyamf/util.pyx":1915
  *             equal = 0
  *         else:
  *             equal = 0             # <<<<<<<<<<<<<<
@@ -11641,7 +13127,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  */
     __pyx_v_equal = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1689
+    /* "/root/package/cpyamf/util.pyx":1917
  *             equal = 0
  * 
  *             if PyList_GET_SIZE(other) == s.length:             # <<<<<<<<<<<<<<
@@ -11651,7 +13137,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
     __pyx_t_1 = (PyList_GET_SIZE(__pyx_v_other) == __pyx_v_s->length);
     if (__pyx_t_1) {
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1690
+      /* "/root/package/cpyamf/util.pyx":1918
  * 
  *             if PyList_GET_SIZE(other) == s.length:
  *                 equal = 1             # <<<<<<<<<<<<<<
@@ -11660,7 +13146,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  */
       __pyx_v_equal = 1;
 
-      /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1692
+      /* "/root/package/cpyamf/util.pyx":1920
  *                 equal = 1
  * 
  *                 for i from 0 <= i < s.length:             # <<<<<<<<<<<<<<
@@ -11670,24 +13156,24 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
       __pyx_t_4 = __pyx_v_s->length;
       for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_4; __pyx_v_i++) {
 
-        /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1693
+        /* "/root/package/cpyamf/util.pyx":1921
  * 
  *                 for i from 0 <= i < s.length:
  *                     if PyList_GET_ITEM(other, i) != <object>s.data[i]:             # <<<<<<<<<<<<<<
  *                         equal = 0
  * 
  */
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_v_other, __pyx_v_i); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_v_other, __pyx_v_i); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1921; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_2);
         __pyx_t_5 = (__pyx_v_s->data[__pyx_v_i]);
-        __pyx_t_6 = PyObject_RichCompare(__pyx_t_2, ((PyObject *)__pyx_t_5), Py_NE); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_6 = PyObject_RichCompare(__pyx_t_2, ((PyObject *)__pyx_t_5), Py_NE); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1921; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1921; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         if (__pyx_t_1) {
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1694
+          /* "/root/package/cpyamf/util.pyx":1922
  *                 for i from 0 <= i < s.length:
  *                     if PyList_GET_ITEM(other, i) != <object>s.data[i]:
  *                         equal = 0             # <<<<<<<<<<<<<<
@@ -11696,7 +13182,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  */
           __pyx_v_equal = 0;
 
-          /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1696
+          /* "/root/package/cpyamf/util.pyx":1924
  *                         equal = 0
  * 
  *                         break             # <<<<<<<<<<<<<<
@@ -11715,7 +13201,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1698
+  /* "/root/package/cpyamf/util.pyx":1926
  *                         break
  * 
  *         if op == 2: # ==             # <<<<<<<<<<<<<<
@@ -11725,7 +13211,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   switch (__pyx_v_op) {
     case 2:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1699
+    /* "/root/package/cpyamf/util.pyx":1927
  * 
  *         if op == 2: # ==
  *             return equal             # <<<<<<<<<<<<<<
@@ -11733,14 +13219,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  *             return not equal
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = PyInt_FromLong(__pyx_v_equal); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1699; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyInt_FromLong(__pyx_v_equal); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1927; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_r = __pyx_t_6;
     __pyx_t_6 = 0;
     goto __pyx_L0;
     break;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1700
+    /* "/root/package/cpyamf/util.pyx":1928
  *         if op == 2: # ==
  *             return equal
  *         elif op == 3: # !=             # <<<<<<<<<<<<<<
@@ -11749,7 +13235,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  */
     case 3:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1701
+    /* "/root/package/cpyamf/util.pyx":1929
  *             return equal
  *         elif op == 3: # !=
  *             return not equal             # <<<<<<<<<<<<<<
@@ -11757,7 +13243,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  *             raise NotImplementedError
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = __Pyx_PyBool_FromLong((!__pyx_v_equal)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1701; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_PyBool_FromLong((!__pyx_v_equal)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1929; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_r = __pyx_t_6;
     __pyx_t_6 = 0;
@@ -11765,7 +13251,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
     break;
     default:
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1703
+    /* "/root/package/cpyamf/util.pyx":1931
  *             return not equal
  *         else:
  *             raise NotImplementedError             # <<<<<<<<<<<<<<
@@ -11773,7 +13259,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
  *     def __getitem__(self, idx):
  */
     __Pyx_Raise(__pyx_builtin_NotImplementedError, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1931; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     break;
   }
 
@@ -11793,7 +13279,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___richcmp__(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1705
+/* "/root/package/cpyamf/util.pyx":1933
  *             raise NotImplementedError
  * 
  *     def __getitem__(self, idx):             # <<<<<<<<<<<<<<
@@ -11808,7 +13294,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___getitem__(PyObjec
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__getitem__");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1706
+  /* "/root/package/cpyamf/util.pyx":1934
  * 
  *     def __getitem__(self, idx):
  *         return self.getByReference(idx)             # <<<<<<<<<<<<<<
@@ -11816,8 +13302,8 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___getitem__(PyObjec
  *     def __copy__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_idx); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->__pyx_vtab)->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_idx); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1934; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->__pyx_vtab)->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1934; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -11835,7 +13321,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___getitem__(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1708
+/* "/root/package/cpyamf/util.pyx":1936
  *         return self.getByReference(idx)
  * 
  *     def __copy__(self):             # <<<<<<<<<<<<<<
@@ -11856,27 +13342,27 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1709
+  /* "/root/package/cpyamf/util.pyx":1937
  * 
  *     def __copy__(self):
  *         cdef cIndexedCollection n = cIndexedCollection(self.use_hash)             # <<<<<<<<<<<<<<
  * 
  *         return n
  */
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->use_hash); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)->use_hash); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1937; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1937; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_4util_cIndexedCollection)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_6cpyamf_4util_cIndexedCollection)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1937; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_n = ((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1711
+  /* "/root/package/cpyamf/util.pyx":1939
  *         cdef cIndexedCollection n = cIndexedCollection(self.use_hash)
  * 
  *         return n             # <<<<<<<<<<<<<<
@@ -11888,7 +13374,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
   __pyx_r = ((PyObject *)__pyx_v_n);
   goto __pyx_L0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1713
+  /* "/root/package/cpyamf/util.pyx":1941
  *         return n
  * 
  *         for x in self:             # <<<<<<<<<<<<<<
@@ -11898,7 +13384,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
   if (PyList_CheckExact(__pyx_v_self) || PyTuple_CheckExact(__pyx_v_self)) {
     __pyx_t_3 = 0; __pyx_t_1 = __pyx_v_self; __Pyx_INCREF(__pyx_t_1);
   } else {
-    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1713; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1941; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
   }
   for (;;) {
@@ -11911,7 +13397,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
     } else {
       __pyx_t_2 = PyIter_Next(__pyx_t_1);
       if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1713; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1941; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_2);
@@ -11920,18 +13406,18 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
     __pyx_v_x = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1714
+    /* "/root/package/cpyamf/util.pyx":1942
  * 
  *         for x in self:
  *             n.append(x)             # <<<<<<<<<<<<<<
  * 
  *         return n
  */
-    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_n->__pyx_vtab)->append(__pyx_v_n, __pyx_v_x); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1714; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = ((struct __pyx_vtabstruct_6cpyamf_4util_cIndexedCollection *)__pyx_v_n->__pyx_vtab)->append(__pyx_v_n, __pyx_v_x); if (unlikely(__pyx_t_4 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1716
+  /* "/root/package/cpyamf/util.pyx":1944
  *             n.append(x)
  * 
  *         return n             # <<<<<<<<<<<<<<
@@ -11959,7 +13445,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_18cIndexedCollection___copy__(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1723
+/* "/root/package/cpyamf/util.pyx":1951
  *     """
  * 
  *     def __init__(self, use_hash=False):             # <<<<<<<<<<<<<<
@@ -11977,7 +13463,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
     PyObject* values[1] = {0};
-    values[0] = __pyx_k_16;
+    values[0] = __pyx_k_18;
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       case  0: break;
@@ -11991,11 +13477,11 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1723; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1951; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_use_hash = values[0];
   } else {
-    __pyx_v_use_hash = __pyx_k_16;
+    __pyx_v_use_hash = __pyx_k_18;
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  1: __pyx_v_use_hash = PyTuple_GET_ITEM(__pyx_args, 0);
       case  0: break;
@@ -12004,7 +13490,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1723; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1951; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cpyamf.util.IndexedCollection.__init__");
   return -1;
@@ -12012,17 +13498,17 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_use_hash);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1724
+  /* "/root/package/cpyamf/util.pyx":1952
  * 
  *     def __init__(self, use_hash=False):
  *         if use_hash:             # <<<<<<<<<<<<<<
  *             self.use_hash = 1
  *         else:
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_use_hash); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_use_hash); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1952; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1725
+    /* "/root/package/cpyamf/util.pyx":1953
  *     def __init__(self, use_hash=False):
  *         if use_hash:
  *             self.use_hash = 1             # <<<<<<<<<<<<<<
@@ -12034,7 +13520,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1727
+    /* "/root/package/cpyamf/util.pyx":1955
  *             self.use_hash = 1
  *         else:
  *             self.use_hash = 0             # <<<<<<<<<<<<<<
@@ -12057,7 +13543,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection___init__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1730
+/* "/root/package/cpyamf/util.pyx":1958
  * 
  *     property use_hash:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -12073,7 +13559,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
   __Pyx_RefNannySetupContext("__get__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1731
+  /* "/root/package/cpyamf/util.pyx":1959
  *     property use_hash:
  *         def __get__(self):
  *             if self.use_hash == 1:             # <<<<<<<<<<<<<<
@@ -12083,7 +13569,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
   __pyx_t_1 = (((struct __pyx_obj_6cpyamf_4util_IndexedCollection *)__pyx_v_self)->__pyx_base.use_hash == 1);
   if (__pyx_t_1) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1732
+    /* "/root/package/cpyamf/util.pyx":1960
  *         def __get__(self):
  *             if self.use_hash == 1:
  *                 return True             # <<<<<<<<<<<<<<
@@ -12091,7 +13577,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
  *             return False
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1732; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -12100,7 +13586,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1734
+  /* "/root/package/cpyamf/util.pyx":1962
  *                 return True
  * 
  *             return False             # <<<<<<<<<<<<<<
@@ -12108,7 +13594,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
  *         def __set__(self, value):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -12127,7 +13613,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___get__(Py
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1736
+/* "/root/package/cpyamf/util.pyx":1964
  *             return False
  * 
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -12144,20 +13630,20 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___set__(PyObject
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_value);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1737
+  /* "/root/package/cpyamf/util.pyx":1965
  * 
  *         def __set__(self, value):
  *             if value is True:             # <<<<<<<<<<<<<<
  *                 self.use_hash = 1
  *             else:
  */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1737; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_v_value == __pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1738
+    /* "/root/package/cpyamf/util.pyx":1966
  *         def __set__(self, value):
  *             if value is True:
  *                 self.use_hash = 1             # <<<<<<<<<<<<<<
@@ -12169,7 +13655,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___set__(PyObject
   }
   /*else*/ {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1740
+    /* "/root/package/cpyamf/util.pyx":1968
  *                 self.use_hash = 1
  *             else:
  *                 self.use_hash = 0             # <<<<<<<<<<<<<<
@@ -12193,7 +13679,7 @@ static int __pyx_pf_6cpyamf_4util_17IndexedCollection_8use_hash___set__(PyObject
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1742
+/* "/root/package/cpyamf/util.pyx":1970
  *                 self.use_hash = 0
  * 
  *     def getByReference(self, ref):             # <<<<<<<<<<<<<<
@@ -12214,7 +13700,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getByReference(PyObj
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_ref);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1743
+  /* "/root/package/cpyamf/util.pyx":1971
  * 
  *     def getByReference(self, ref):
  *         if PyInt_Check(ref) == 0 and PyLong_Check(ref) == 0:             # <<<<<<<<<<<<<<
@@ -12230,29 +13716,29 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getByReference(PyObj
   }
   if (__pyx_t_3) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1744
+    /* "/root/package/cpyamf/util.pyx":1972
  *     def getByReference(self, ref):
  *         if PyInt_Check(ref) == 0 and PyLong_Check(ref) == 0:
  *             raise TypeError("Bad reference type")             # <<<<<<<<<<<<<<
  * 
  *         return cIndexedCollection.getByReference(self, <Py_ssize_t>ref)
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1744; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_17));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_17));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_17));
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1744; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_19));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_19));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_19));
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1744; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1746
+  /* "/root/package/cpyamf/util.pyx":1974
  *             raise TypeError("Bad reference type")
  * 
  *         return cIndexedCollection.getByReference(self, <Py_ssize_t>ref)             # <<<<<<<<<<<<<<
@@ -12260,8 +13746,8 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getByReference(PyObj
  *     def getReferenceTo(self, object obj):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_ref); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1746; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), ((Py_ssize_t)__pyx_t_6)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1746; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_ref); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->getByReference(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), ((Py_ssize_t)__pyx_t_6)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_r = __pyx_t_5;
   __pyx_t_5 = 0;
@@ -12282,7 +13768,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getByReference(PyObj
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1748
+/* "/root/package/cpyamf/util.pyx":1976
  *         return cIndexedCollection.getByReference(self, <Py_ssize_t>ref)
  * 
  *     def getReferenceTo(self, object obj):             # <<<<<<<<<<<<<<
@@ -12301,17 +13787,17 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo(PyObj
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_INCREF(__pyx_v_obj);
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1749
+  /* "/root/package/cpyamf/util.pyx":1977
  * 
  *     def getReferenceTo(self, object obj):
  *         cdef int i = cIndexedCollection.getReferenceTo(self, obj)             # <<<<<<<<<<<<<<
  * 
  *         if i == -1:
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->getReferenceTo(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->getReferenceTo(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1977; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_i = __pyx_t_1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1751
+  /* "/root/package/cpyamf/util.pyx":1979
  *         cdef int i = cIndexedCollection.getReferenceTo(self, obj)
  * 
  *         if i == -1:             # <<<<<<<<<<<<<<
@@ -12321,7 +13807,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo(PyObj
   __pyx_t_2 = (__pyx_v_i == -1);
   if (__pyx_t_2) {
 
-    /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1752
+    /* "/root/package/cpyamf/util.pyx":1980
  * 
  *         if i == -1:
  *             return None             # <<<<<<<<<<<<<<
@@ -12336,7 +13822,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo(PyObj
   }
   __pyx_L5:;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1754
+  /* "/root/package/cpyamf/util.pyx":1982
  *             return None
  * 
  *         return i             # <<<<<<<<<<<<<<
@@ -12344,7 +13830,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo(PyObj
  *     def append(self, object obj):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1982; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -12364,7 +13850,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo(PyObj
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1756
+/* "/root/package/cpyamf/util.pyx":1984
  *         return i
  * 
  *     def append(self, object obj):             # <<<<<<<<<<<<<<
@@ -12379,7 +13865,7 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_append(PyObject *__p
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("append");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1757
+  /* "/root/package/cpyamf/util.pyx":1985
  * 
  *     def append(self, object obj):
  *         return cIndexedCollection.append(self, obj)             # <<<<<<<<<<<<<<
@@ -12387,8 +13873,8 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_append(PyObject *__p
  *     def clear(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->append(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->append(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), __pyx_v_obj); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1985; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1985; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -12406,11 +13892,12 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_append(PyObject *__p
   return __pyx_r;
 }
 
-/* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1759
+/* "/root/package/cpyamf/util.pyx":1987
  *         return cIndexedCollection.append(self, obj)
  * 
  *     def clear(self):             # <<<<<<<<<<<<<<
  *          cIndexedCollection.clear(self)
+ * 
  */
 
 static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_clear(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
@@ -12419,12 +13906,14 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_clear(PyObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("clear");
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1760
+  /* "/root/package/cpyamf/util.pyx":1988
  * 
  *     def clear(self):
  *          cIndexedCollection.clear(self)             # <<<<<<<<<<<<<<
+ * 
+ *     def truncate(self, length):
  */
-  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->clear(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->clear(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self)); if (unlikely(__pyx_t_1 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1988; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
@@ -12436,6 +13925,41 @@ static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_clear(PyObject *__py
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+
+/* "/root/package/cpyamf/util.pyx":1990
+ *          cIndexedCollection.clear(self)
+ * 
+ *     def truncate(self, length):             # <<<<<<<<<<<<<<
+ *         """
+ *         Discards every reference from index C{length} onwards.
+ */
+
+static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_truncate(PyObject *__pyx_v_self, PyObject *__pyx_v_length); /*proto*/
+static char __pyx_doc_6cpyamf_4util_17IndexedCollection_truncate[] = "\n        Discards every reference from index C{length} onwards.\n\n        @since: 0.6\n        ";
+static PyObject *__pyx_pf_6cpyamf_4util_17IndexedCollection_truncate(PyObject *__pyx_v_self, PyObject *__pyx_v_length) {
+  PyObject *__pyx_r = NULL;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("truncate");
+
+  /* "/root/package/cpyamf/util.pyx":1996
+ *         @since: 0.6
+ *         """
+ *         cIndexedCollection.truncate(self, <Py_ssize_t>length)             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_length); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1996; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_vtabptr_6cpyamf_4util_cIndexedCollection->truncate(((struct __pyx_obj_6cpyamf_4util_cIndexedCollection *)__pyx_v_self), ((Py_ssize_t)__pyx_t_1)); if (unlikely(__pyx_t_2 == -1 && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1996; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpyamf.util.IndexedCollection.truncate");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 static struct __pyx_vtabstruct_6cpyamf_4util_cBufferedByteStream __pyx_vtable_6cpyamf_4util_cBufferedByteStream;
 
 static PyObject *__pyx_tp_new_6cpyamf_4util_cBufferedByteStream(PyTypeObject *t, PyObject *a, PyObject *k) {
@@ -12444,6 +13968,8 @@ static PyObject *__pyx_tp_new_6cpyamf_4util_cBufferedByteStream(PyTypeObject *t,
   if (!o) return 0;
   p = ((struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)o);
   p->__pyx_vtab = __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream;
+  p->_source = Py_None; Py_INCREF(Py_None);
+  p->_export = Py_None; Py_INCREF(Py_None);
   if (__pyx_pf_6cpyamf_4util_19cBufferedByteStream___cinit__(o, __pyx_empty_tuple, NULL) < 0) {
     Py_DECREF(o); o = 0;
   }
@@ -12451,6 +13977,7 @@ static PyObject *__pyx_tp_new_6cpyamf_4util_cBufferedByteStream(PyTypeObject *t,
 }
 
 static void __pyx_tp_dealloc_6cpyamf_4util_cBufferedByteStream(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *p = (struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)o;
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
@@ -12460,9 +13987,35 @@ static void __pyx_tp_dealloc_6cpyamf_4util_cBufferedByteStream(PyObject *o) {
     --Py_REFCNT(o);
     PyErr_Restore(etype, eval, etb);
   }
+  Py_XDECREF(p->_source);
+  Py_XDECREF(p->_export);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
+static int __pyx_tp_traverse_6cpyamf_4util_cBufferedByteStream(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *p = (struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)o;
+  if (p->_source) {
+    e = (*v)(p->_source, a); if (e) return e;
+  }
+  if (p->_export) {
+    e = (*v)(p->_export, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6cpyamf_4util_cBufferedByteStream(PyObject *o) {
+  struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *p = (struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *)o;
+  PyObject* tmp;
+  tmp = ((PyObject*)p->_source);
+  p->_source = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_export);
+  p->_export = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
 static struct PyMethodDef __pyx_methods_6cpyamf_4util_cBufferedByteStream[] = {
   {0, 0, 0, 0}
 };
@@ -12585,10 +14138,10 @@ PyTypeObject __pyx_type_6cpyamf_4util_cBufferedByteStream = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   &__pyx_tp_as_buffer_cBufferedByteStream, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  __pyx_tp_traverse_6cpyamf_4util_cBufferedByteStream, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4util_cBufferedByteStream, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
@@ -12854,6 +14407,8 @@ static int __pyx_setprop_6cpyamf_4util_18BufferedByteStream_endian(PyObject *o,
 
 static struct PyMethodDef __pyx_methods_6cpyamf_4util_BufferedByteStream[] = {
   {__Pyx_NAMESTR("read"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_read, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_18BufferedByteStream_read)},
+  {__Pyx_NAMESTR("read_view"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_read_view, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_18BufferedByteStream_read_view)},
+  {__Pyx_NAMESTR("readinto"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_readinto, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_18BufferedByteStream_readinto)},
   {__Pyx_NAMESTR("write"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_write, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_18BufferedByteStream_write)},
   {__Pyx_NAMESTR("close"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_close, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_18BufferedByteStream_close)},
   {__Pyx_NAMESTR("flush"), (PyCFunction)__pyx_pf_6cpyamf_4util_18BufferedByteStream_flush, METH_NOARGS, __Pyx_DOCSTR(0)},
@@ -13016,10 +14571,10 @@ PyTypeObject __pyx_type_6cpyamf_4util_BufferedByteStream = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   &__pyx_tp_as_buffer_BufferedByteStream, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   __Pyx_DOCSTR("\n    An extension of C{StringIO}.\n\n    @see: L{BufferedByteStream<pyamf.util.BufferedByteStream>}\n    "), /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  __pyx_tp_traverse_6cpyamf_4util_cBufferedByteStream, /*tp_traverse*/
+  __pyx_tp_clear_6cpyamf_4util_cBufferedByteStream, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
@@ -13077,6 +14632,7 @@ static struct PyMethodDef __pyx_methods_6cpyamf_4util_IndexedCollection[] = {
   {__Pyx_NAMESTR("getReferenceTo"), (PyCFunction)__pyx_pf_6cpyamf_4util_17IndexedCollection_getReferenceTo, METH_O, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("append"), (PyCFunction)__pyx_pf_6cpyamf_4util_17IndexedCollection_append, METH_O, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("clear"), (PyCFunction)__pyx_pf_6cpyamf_4util_17IndexedCollection_clear, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("truncate"), (PyCFunction)__pyx_pf_6cpyamf_4util_17IndexedCollection_truncate, METH_O, __Pyx_DOCSTR(__pyx_doc_6cpyamf_4util_17IndexedCollection_truncate)},
   {0, 0, 0, 0}
 };
 
@@ -13245,7 +14801,7 @@ static void __pyx_init_filenames(void); /*proto*/
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     __Pyx_NAMESTR("util"),
-    __Pyx_DOCSTR(__pyx_k_18), /* m_doc */
+    __Pyx_DOCSTR(__pyx_k_20), /* m_doc */
     -1, /* m_size */
     __pyx_methods /* m_methods */,
     NULL, /* m_reload */
@@ -13260,10 +14816,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_b_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 0, 0},
   {&__pyx_kp_b_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 0, 0},
   {&__pyx_kp_b_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 0, 0},
-  {&__pyx_kp_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 0},
+  {&__pyx_kp_b_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 0, 0},
   {&__pyx_kp_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 0},
   {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
+  {&__pyx_kp_s_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 0, 1, 0},
   {&__pyx_kp_s_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 0, 1, 0},
+  {&__pyx_kp_s_19, __pyx_k_19, sizeof(__pyx_k_19), 0, 0, 1, 0},
   {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
   {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
   {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
@@ -13271,7 +14829,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
   {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
   {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_b_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 0, 0},
+  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
   {&__pyx_n_s__IOError, __pyx_k__IOError, sizeof(__pyx_k__IOError), 0, 0, 1, 1},
   {&__pyx_n_s__MemoryError, __pyx_k__MemoryError, sizeof(__pyx_k__MemoryError), 0, 0, 1, 1},
   {&__pyx_n_s__NaN, __pyx_k__NaN, sizeof(__pyx_k__NaN), 0, 0, 1, 1},
@@ -13284,12 +14842,16 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s___clear, __pyx_k___clear, sizeof(__pyx_k___clear), 0, 0, 1, 1},
   {&__pyx_n_s___endian, __pyx_k___endian, sizeof(__pyx_k___endian), 0, 0, 1, 1},
+  {&__pyx_n_s___export, __pyx_k___export, sizeof(__pyx_k___export), 0, 0, 1, 1},
   {&__pyx_n_s___increase_buffer, __pyx_k___increase_buffer, sizeof(__pyx_k___increase_buffer), 0, 0, 1, 1},
   {&__pyx_n_s___increase_size, __pyx_k___increase_size, sizeof(__pyx_k___increase_size), 0, 0, 1, 1},
+  {&__pyx_n_s___own, __pyx_k___own, sizeof(__pyx_k___own), 0, 0, 1, 1},
   {&__pyx_n_s___ref, __pyx_k___ref, sizeof(__pyx_k___ref), 0, 0, 1, 1},
+  {&__pyx_n_s___source, __pyx_k___source, sizeof(__pyx_k___source), 0, 0, 1, 1},
   {&__pyx_n_s__append, __pyx_k__append, sizeof(__pyx_k__append), 0, 0, 1, 1},
   {&__pyx_n_s__buf, __pyx_k__buf, sizeof(__pyx_k__buf), 0, 0, 1, 1},
   {&__pyx_n_s__buffer, __pyx_k__buffer, sizeof(__pyx_k__buffer), 0, 0, 1, 1},
+  {&__pyx_n_s__buffer_types, __pyx_k__buffer_types, sizeof(__pyx_k__buffer_types), 0, 0, 1, 1},
   {&__pyx_n_s__clear, __pyx_k__clear, sizeof(__pyx_k__clear), 0, 0, 1, 1},
   {&__pyx_n_s__closed, __pyx_k__closed, sizeof(__pyx_k__closed), 0, 0, 1, 1},
   {&__pyx_n_s__complain_if_closed, __pyx_k__complain_if_closed, sizeof(__pyx_k__complain_if_closed), 0, 0, 1, 1},
@@ -13298,6 +14860,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__getvalue, __pyx_k__getvalue, sizeof(__pyx_k__getvalue), 0, 0, 1, 1},
   {&__pyx_n_s__has_available, __pyx_k__has_available, sizeof(__pyx_k__has_available), 0, 0, 1, 1},
   {&__pyx_n_s__id, __pyx_k__id, sizeof(__pyx_k__id), 0, 0, 1, 1},
+  {&__pyx_n_s__len, __pyx_k__len, sizeof(__pyx_k__len), 0, 0, 1, 1},
   {&__pyx_n_s__length, __pyx_k__length, sizeof(__pyx_k__length), 0, 0, 1, 1},
   {&__pyx_n_s__mode, __pyx_k__mode, sizeof(__pyx_k__mode), 0, 0, 1, 1},
   {&__pyx_n_s__pack_int, __pyx_k__pack_int, sizeof(__pyx_k__pack_int), 0, 0, 1, 1},
@@ -13305,6 +14868,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__peek, __pyx_k__peek, sizeof(__pyx_k__peek), 0, 0, 1, 1},
   {&__pyx_n_s__pos, __pyx_k__pos, sizeof(__pyx_k__pos), 0, 0, 1, 1},
   {&__pyx_n_s__read, __pyx_k__read, sizeof(__pyx_k__read), 0, 0, 1, 1},
+  {&__pyx_n_s__readonly, __pyx_k__readonly, sizeof(__pyx_k__readonly), 0, 0, 1, 1},
   {&__pyx_n_s__refs, __pyx_k__refs, sizeof(__pyx_k__refs), 0, 0, 1, 1},
   {&__pyx_n_s__remaining, __pyx_k__remaining, sizeof(__pyx_k__remaining), 0, 0, 1, 1},
   {&__pyx_n_s__seek, __pyx_k__seek, sizeof(__pyx_k__seek), 0, 0, 1, 1},
@@ -13314,18 +14878,20 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__unpack_uint, __pyx_k__unpack_uint, sizeof(__pyx_k__unpack_uint), 0, 0, 1, 1},
   {&__pyx_n_s__use_hash, __pyx_k__use_hash, sizeof(__pyx_k__use_hash), 0, 0, 1, 1},
   {&__pyx_n_s__util, __pyx_k__util, sizeof(__pyx_k__util), 0, 0, 1, 1},
+  {&__pyx_n_s__wrap, __pyx_k__wrap, sizeof(__pyx_k__wrap), 0, 0, 1, 1},
+  {&__pyx_n_s__wrapped, __pyx_k__wrapped, sizeof(__pyx_k__wrapped), 0, 0, 1, 1},
   {&__pyx_n_s__write, __pyx_k__write, sizeof(__pyx_k__write), 0, 0, 1, 1},
   {&__pyx_n_s__write_utf8_string, __pyx_k__write_utf8_string, sizeof(__pyx_k__write_utf8_string), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_IOError = __Pyx_GetName(__pyx_b, __pyx_n_s__IOError); if (!__pyx_builtin_IOError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_id = __Pyx_GetName(__pyx_b, __pyx_n_s__id); if (!__pyx_builtin_id) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_NotImplementedError = __Pyx_GetName(__pyx_b, __pyx_n_s__NotImplementedError); if (!__pyx_builtin_NotImplementedError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_IOError = __Pyx_GetName(__pyx_b, __pyx_n_s__IOError); if (!__pyx_builtin_IOError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 745; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_id = __Pyx_GetName(__pyx_b, __pyx_n_s__id); if (!__pyx_builtin_id) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_NotImplementedError = __Pyx_GetName(__pyx_b, __pyx_n_s__NotImplementedError); if (!__pyx_builtin_NotImplementedError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1931; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -13379,7 +14945,7 @@ PyMODINIT_FUNC PyInit_util(void)
   #endif
   /*--- Module creation code ---*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("util"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_18), 0, PYTHON_API_VERSION);
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("util"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_20), 0, PYTHON_API_VERSION);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -13401,10 +14967,14 @@ PyMODINIT_FUNC PyInit_util(void)
   __pyx_v_6cpyamf_4util_pyamf_NaN = Py_None; Py_INCREF(Py_None);
   __pyx_v_6cpyamf_4util_pyamf_NegInf = Py_None; Py_INCREF(Py_None);
   __pyx_v_6cpyamf_4util_pyamf_PosInf = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6cpyamf_4util_buffer_types = Py_None; Py_INCREF(Py_None);
   /*--- Function export code ---*/
   /*--- Type init code ---*/
   __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream = &__pyx_vtable_6cpyamf_4util_cBufferedByteStream;
   #if PY_MAJOR_VERSION >= 3
+  __pyx_vtable_6cpyamf_4util_cBufferedByteStream.wrap = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *))__pyx_f_6cpyamf_4util_19cBufferedByteStream_wrap;
+  __pyx_vtable_6cpyamf_4util_cBufferedByteStream._own = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *))__pyx_f_6cpyamf_4util_19cBufferedByteStream__own;
+  __pyx_vtable_6cpyamf_4util_cBufferedByteStream.read_view = (PyObject *(*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, Py_ssize_t))__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_view;
   __pyx_vtable_6cpyamf_4util_cBufferedByteStream.tell = (Py_ssize_t (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *))__pyx_f_6cpyamf_4util_19cBufferedByteStream_tell;
   __pyx_vtable_6cpyamf_4util_cBufferedByteStream.close = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *))__pyx_f_6cpyamf_4util_19cBufferedByteStream_close;
   __pyx_vtable_6cpyamf_4util_cBufferedByteStream.write = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, char *, Py_ssize_t))__pyx_f_6cpyamf_4util_19cBufferedByteStream_write;
@@ -13447,6 +15017,9 @@ PyMODINIT_FUNC PyInit_util(void)
   __pyx_vtable_6cpyamf_4util_cBufferedByteStream.write_float = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, float))__pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float;
   __pyx_vtable_6cpyamf_4util_cBufferedByteStream.append = (int (*)(struct __pyx_obj_6cpyamf_4util_cBufferedByteStream *, PyObject *))__pyx_f_6cpyamf_4util_19cBufferedByteStream_append;
   #else
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.wrap = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_wrap;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream._own = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream__own;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.read_view = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_read_view;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.tell = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_tell;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.close = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_close;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.write = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_write;
@@ -13489,9 +15062,9 @@ PyMODINIT_FUNC PyInit_util(void)
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.write_float = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_write_float;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cBufferedByteStream.append = (void(*)(void))__pyx_f_6cpyamf_4util_19cBufferedByteStream_append;
   #endif
-  if (PyType_Ready(&__pyx_type_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_cBufferedByteStream.tp_dict, __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "cBufferedByteStream", (PyObject *)&__pyx_type_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_cBufferedByteStream.tp_dict, __pyx_vtabptr_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "cBufferedByteStream", (PyObject *)&__pyx_type_6cpyamf_4util_cBufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_6cpyamf_4util_cBufferedByteStream = &__pyx_type_6cpyamf_4util_cBufferedByteStream;
   __pyx_vtabptr_6cpyamf_4util_cIndexedCollection = &__pyx_vtable_6cpyamf_4util_cIndexedCollection;
   #if PY_MAJOR_VERSION >= 3
@@ -13502,6 +15075,7 @@ PyMODINIT_FUNC PyInit_util(void)
   __pyx_vtable_6cpyamf_4util_cIndexedCollection.getByReference = (PyObject *(*)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t))__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference;
   __pyx_vtable_6cpyamf_4util_cIndexedCollection.getReferenceTo = (Py_ssize_t (*)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *))__pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo;
   __pyx_vtable_6cpyamf_4util_cIndexedCollection.append = (Py_ssize_t (*)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, PyObject *))__pyx_f_6cpyamf_4util_18cIndexedCollection_append;
+  __pyx_vtable_6cpyamf_4util_cIndexedCollection.truncate = (int (*)(struct __pyx_obj_6cpyamf_4util_cIndexedCollection *, Py_ssize_t))__pyx_f_6cpyamf_4util_18cIndexedCollection_truncate;
   #else
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection._increase_size = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection__increase_size;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection._clear = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection__clear;
@@ -13510,30 +15084,31 @@ PyMODINIT_FUNC PyInit_util(void)
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection.getByReference = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection_getByReference;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection.getReferenceTo = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection_getReferenceTo;
   *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection.append = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection_append;
+  *(void(**)(void))&__pyx_vtable_6cpyamf_4util_cIndexedCollection.truncate = (void(*)(void))__pyx_f_6cpyamf_4util_18cIndexedCollection_truncate;
   #endif
-  if (PyType_Ready(&__pyx_type_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_cIndexedCollection.tp_dict, __pyx_vtabptr_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "cIndexedCollection", (PyObject *)&__pyx_type_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_cIndexedCollection.tp_dict, __pyx_vtabptr_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "cIndexedCollection", (PyObject *)&__pyx_type_6cpyamf_4util_cIndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_6cpyamf_4util_cIndexedCollection = &__pyx_type_6cpyamf_4util_cIndexedCollection;
   __pyx_vtabptr_6cpyamf_4util_BufferedByteStream = &__pyx_vtable_6cpyamf_4util_BufferedByteStream;
   __pyx_vtable_6cpyamf_4util_BufferedByteStream.__pyx_base = *__pyx_vtabptr_6cpyamf_4util_cBufferedByteStream;
   __pyx_type_6cpyamf_4util_BufferedByteStream.tp_base = __pyx_ptype_6cpyamf_4util_cBufferedByteStream;
-  if (PyType_Ready(&__pyx_type_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1014; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_BufferedByteStream.tp_dict, __pyx_vtabptr_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1014; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "BufferedByteStream", (PyObject *)&__pyx_type_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1014; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_BufferedByteStream.tp_dict, __pyx_vtabptr_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "BufferedByteStream", (PyObject *)&__pyx_type_6cpyamf_4util_BufferedByteStream) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_6cpyamf_4util_BufferedByteStream = &__pyx_type_6cpyamf_4util_BufferedByteStream;
   __pyx_vtabptr_6cpyamf_4util_IndexedCollection = &__pyx_vtable_6cpyamf_4util_IndexedCollection;
   __pyx_vtable_6cpyamf_4util_IndexedCollection.__pyx_base = *__pyx_vtabptr_6cpyamf_4util_cIndexedCollection;
   __pyx_type_6cpyamf_4util_IndexedCollection.tp_base = __pyx_ptype_6cpyamf_4util_cIndexedCollection;
-  if (PyType_Ready(&__pyx_type_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_IndexedCollection.tp_dict, __pyx_vtabptr_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "IndexedCollection", (PyObject *)&__pyx_type_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1947; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_6cpyamf_4util_IndexedCollection.tp_dict, __pyx_vtabptr_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1947; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "IndexedCollection", (PyObject *)&__pyx_type_6cpyamf_4util_IndexedCollection) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1947; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_6cpyamf_4util_IndexedCollection = &__pyx_type_6cpyamf_4util_IndexedCollection;
   /*--- Type import code ---*/
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":79
+  /* "/root/package/cpyamf/util.pyx":93
  * cdef char SYSTEM_ENDIAN
  * 
  * cdef int float_broken = -1             # <<<<<<<<<<<<<<
@@ -13542,7 +15117,7 @@ PyMODINIT_FUNC PyInit_util(void)
  */
   __pyx_v_6cpyamf_4util_float_broken = -1;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":81
+  /* "/root/package/cpyamf/util.pyx":95
  * cdef int float_broken = -1
  * 
  * cdef int complete_init = 0             # <<<<<<<<<<<<<<
@@ -13551,47 +15126,47 @@ PyMODINIT_FUNC PyInit_util(void)
  */
   __pyx_v_6cpyamf_4util_complete_init = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":83
+  /* "/root/package/cpyamf/util.pyx":97
  * cdef int complete_init = 0
  * 
  * cdef unsigned char *NaN = <unsigned char *>'\xff\xf8\x00\x00\x00\x00\x00\x00'             # <<<<<<<<<<<<<<
  * cdef unsigned char *NegInf = <unsigned char *>'\xff\xf0\x00\x00\x00\x00\x00\x00'
  * cdef unsigned char *PosInf = <unsigned char *>'\x7f\xf0\x00\x00\x00\x00\x00\x00'
  */
-  __pyx_v_6cpyamf_4util_NaN = ((unsigned char *)((unsigned char *)__pyx_k_19));
+  __pyx_v_6cpyamf_4util_NaN = ((unsigned char *)((unsigned char *)__pyx_k_21));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":84
+  /* "/root/package/cpyamf/util.pyx":98
  * 
  * cdef unsigned char *NaN = <unsigned char *>'\xff\xf8\x00\x00\x00\x00\x00\x00'
  * cdef unsigned char *NegInf = <unsigned char *>'\xff\xf0\x00\x00\x00\x00\x00\x00'             # <<<<<<<<<<<<<<
  * cdef unsigned char *PosInf = <unsigned char *>'\x7f\xf0\x00\x00\x00\x00\x00\x00'
  * 
  */
-  __pyx_v_6cpyamf_4util_NegInf = ((unsigned char *)((unsigned char *)__pyx_k_20));
+  __pyx_v_6cpyamf_4util_NegInf = ((unsigned char *)((unsigned char *)__pyx_k_22));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":85
+  /* "/root/package/cpyamf/util.pyx":99
  * cdef unsigned char *NaN = <unsigned char *>'\xff\xf8\x00\x00\x00\x00\x00\x00'
  * cdef unsigned char *NegInf = <unsigned char *>'\xff\xf0\x00\x00\x00\x00\x00\x00'
  * cdef unsigned char *PosInf = <unsigned char *>'\x7f\xf0\x00\x00\x00\x00\x00\x00'             # <<<<<<<<<<<<<<
  * 
  * cdef double system_nan
  */
-  __pyx_v_6cpyamf_4util_PosInf = ((unsigned char *)((unsigned char *)__pyx_k_21));
+  __pyx_v_6cpyamf_4util_PosInf = ((unsigned char *)((unsigned char *)__pyx_k_23));
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pyx":1723
+  /* "/root/package/cpyamf/util.pyx":1951
  *     """
  * 
  *     def __init__(self, use_hash=False):             # <<<<<<<<<<<<<<
  *         if use_hash:
  *             self.use_hash = 1
  */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1951; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_16 = __pyx_t_1;
+  __pyx_k_18 = __pyx_t_1;
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/Users/nick/projects/pyamf-git/cpyamf/util.pxd":1
+  /* "/root/package/cpyamf/util.pxd":1
  * # Copyright (c) 2007-2009 The PyAMF Project.             # <<<<<<<<<<<<<<
  * # See LICENSE for details.
  * 
@@ -13654,7 +15229,7 @@ static void __Pyx_RaiseArgtupleInvalid(
         func_name, more_or_less, num_expected, number, num_found);
 }
 
-static INLINE int __Pyx_CheckKeywordStrings(
+static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
     PyObject *kwdict,
     const char* function_name,
     int kw_allowed)
@@ -13780,7 +15355,7 @@ bad:
     return -1;
 }
 
-static INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
         PyErr_Format(PyExc_SystemError, "Missing type object");
         return 0;
@@ -13800,7 +15375,7 @@ static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
     return result;
 }
 
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     PyThreadState *tstate = PyThreadState_GET();
 
@@ -13815,7 +15390,7 @@ static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *t
     Py_XDECREF(tmp_tb);
 }
 
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
     PyThreadState *tstate = PyThreadState_GET();
     *type = tstate->curexc_type;
     *value = tstate->curexc_value;
@@ -13970,7 +15545,7 @@ bad:
     return module;
 }
 
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned char) < sizeof(long)) {
@@ -13989,7 +15564,7 @@ static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
     const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned short) < sizeof(long)) {
@@ -14008,7 +15583,7 @@ static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
     return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
     const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(unsigned int) < sizeof(long)) {
@@ -14027,7 +15602,7 @@ static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
     return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
 }
 
-static INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
     const char neg_one = (char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(char) < sizeof(long)) {
@@ -14046,7 +15621,7 @@ static INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
     return (char)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
     const short neg_one = (short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(short) < sizeof(long)) {
@@ -14065,7 +15640,7 @@ static INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
     return (short)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
     const int neg_one = (int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(int) < sizeof(long)) {
@@ -14084,7 +15659,7 @@ static INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
     return (int)__Pyx_PyInt_AsLong(x);
 }
 
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
     const signed char neg_one = (signed char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed char) < sizeof(long)) {
@@ -14103,7 +15678,7 @@ static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
     return (signed char)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
     const signed short neg_one = (signed short)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed short) < sizeof(long)) {
@@ -14122,7 +15697,7 @@ static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
     return (signed short)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
     const signed int neg_one = (signed int)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
     if (sizeof(signed int) < sizeof(long)) {
@@ -14141,7 +15716,7 @@ static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
     return (signed int)__Pyx_PyInt_AsSignedLong(x);
 }
 
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
     const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14176,7 +15751,7 @@ static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
     }
 }
 
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
     const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14211,7 +15786,7 @@ static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x)
     }
 }
 
-static INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
     const long neg_one = (long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14246,7 +15821,7 @@ static INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
     }
 }
 
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
     const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14281,7 +15856,7 @@ static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
     }
 }
 
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
     const signed long neg_one = (signed long)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14316,7 +15891,7 @@ static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
     }
 }
 
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
     const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_VERSION_HEX < 0x03000000
@@ -14470,13 +16045,13 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
 
 /* Type Conversion Functions */
 
-static INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (x == Py_True) return 1;
    else if ((x == Py_False) | (x == Py_None)) return 0;
    else return PyObject_IsTrue(x);
 }
 
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
   PyNumberMethods *m;
   const char *name = NULL;
   PyObject *res = NULL;
@@ -14522,7 +16097,7 @@ static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
   return res;
 }
 
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_ssize_t ival;
   PyObject* x = PyNumber_Index(b);
   if (!x) return -1;
@@ -14531,7 +16106,7 @@ static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   return ival;
 }
 
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
 #if PY_VERSION_HEX < 0x02050000
    if (ival <= LONG_MAX)
        return PyInt_FromLong((long)ival);
@@ -14545,7 +16120,7 @@ static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
 #endif
 }
 
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
    unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
    if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
        return (size_t)-1;
@@ -13,7 +13,13 @@ cdef class cBufferedByteStream:
     cdef Py_ssize_t pos
     cdef Py_ssize_t size # total size of the alloc'd buffer
     cdef Py_ssize_t length
+    cdef int wrapped
+    cdef object _source
+    cdef object _export
 
+    cdef int wrap(self, object buf) except? -1
+    cdef int _own(self) except? -1
+    cdef object read_view(self, Py_ssize_t size)
     cdef inline Py_ssize_t tell(self) except? -1
     cdef int close(self) except? -1
     cdef int write(self, char *buf, Py_ssize_t size) except? -1
@@ -71,3 +77,4 @@ cdef class cIndexedCollection:
     cdef object getByReference(self, Py_ssize_t ref)
     cdef Py_ssize_t getReferenceTo(self, object obj) except? -1
     cdef Py_ssize_t append(self, object obj) except? -1
+    cdef int truncate(self, Py_ssize_t length) except? -1
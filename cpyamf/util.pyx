@@ -67,6 +67,20 @@ cdef extern from "Python.h":
     object PyInt_FromSsize_t(Py_ssize_t)
     object PyList_GET_ITEM(object, Py_ssize_t)
 
+    ctypedef struct Py_buffer:
+        void *buf
+        Py_ssize_t len
+        int readonly
+
+    int PyObject_AsReadBuffer(object, void **, Py_ssize_t *) except -1
+    int PyObject_AsWriteBuffer(object, void **, Py_ssize_t *) except -1
+    int PyMemoryView_Check(object)
+    int PyObject_CheckBuffer(object)
+    int PyBuffer_Check(object)
+    object PyMemoryView_FromObject(object)
+    Py_buffer *PyMemoryView_GET_BUFFER(object)
+    int PyBuffer_IsContiguous(Py_buffer *, char)
+
 
 # module constant declarations
 DEF ENDIAN_NETWORK = "!"
@@ -96,6 +110,8 @@ cdef object pyamf_NaN
 cdef object pyamf_NegInf
 cdef object pyamf_PosInf
 
+cdef object buffer_types
+
 
 cdef int build_platform_exceptional_floats() except? -1:
     global platform_nan, platform_posinf, platform_neginf
@@ -158,7 +174,7 @@ cdef int complete_import() except? -1:
     finalise the cpyamf.util module to improve startup time.
     """
     global complete_init, float_broken
-    global pyamf_NaN, pyamf_NegInf, pyamf_PosInf
+    global pyamf_NaN, pyamf_NegInf, pyamf_PosInf, buffer_types
 
     complete_init = 1
 
@@ -175,6 +191,8 @@ cdef int complete_import() except? -1:
     pyamf_NegInf = pyamf.util.NegInf
     pyamf_PosInf = pyamf.util.PosInf
 
+    buffer_types = pyamf.util.buffer_types
+
     return 0
 
 
@@ -261,11 +279,91 @@ cdef class cBufferedByteStream:
             raise MemoryError
 
     def __dealloc__(self):
-        if self.buffer != NULL:
+        if self.buffer != NULL and self.wrapped == 0:
             PyMem_Free(self.buffer)
 
         self.buffer = NULL
 
+    cdef int wrap(self, object buf) except? -1:
+        """
+        Points the stream at the memory of C{buf}, which must support the
+        buffer interface, without copying it. The memory is treated as read
+        only, the first write to the stream takes a private copy.
+
+        An export of the memory is held while it is wrapped so that C{buf}
+        cannot be resized or freed under the stream. C{mmap} objects only
+        support the old buffer interface and a C{buffer} does not pin the
+        object it is a view of, so both are copied instead.
+        """
+        cdef void *ptr = NULL
+        cdef Py_ssize_t size = 0
+        cdef Py_buffer *view
+        cdef object export
+
+        if PyMemoryView_Check(buf):
+            export = buf
+        elif PyObject_CheckBuffer(buf) and not PyBuffer_Check(buf):
+            export = PyMemoryView_FromObject(buf)
+        else:
+            if PyObject_AsReadBuffer(buf, &ptr, &size) == -1:
+                return -1
+
+            if self.write(<char *>ptr, size) == -1:
+                return -1
+
+            self.pos = 0
+
+            return 0
+
+        view = PyMemoryView_GET_BUFFER(export)
+
+        if not PyBuffer_IsContiguous(view, c'C'):
+            raise TypeError('Unable to wrap a non-contiguous memoryview')
+
+        ptr = view.buf
+        size = view.len
+
+        if self.wrapped == 0 and self.buffer != NULL:
+            PyMem_Free(self.buffer)
+
+        self.buffer = <char *>ptr
+        self.size = size
+        self.length = size
+        self.pos = 0
+        self._source = buf
+        self._export = export
+        self.wrapped = 1
+
+        return 0
+
+    cdef int _own(self) except? -1:
+        """
+        Replaces a wrapped buffer with a private, writable copy.
+        """
+        cdef Py_ssize_t size = 1024
+        cdef char *buf
+
+        if self.wrapped == 0:
+            return 0
+
+        while size < self.length:
+            size *= 2
+
+        buf = <char *>PyMem_Malloc(sizeof(char *) * size)
+
+        if buf == NULL:
+            raise MemoryError
+
+        memcpy(buf, self.buffer, self.length)
+
+        self.buffer = buf
+        self.size = size
+        self._source = None
+        self._export = None
+        self.wrapped = 0
+
+        return 0
+
     cdef int close(self) except? -1:
         self.closed = 1
 
@@ -310,6 +408,9 @@ cdef class cBufferedByteStream:
         if size == 0:
             return 0
 
+        if self.wrapped == 1 and self._own() == -1:
+            return -1
+
         if self._increase_buffer(size) == -1:
             return -1
 
@@ -366,6 +467,32 @@ cdef class cBufferedByteStream:
 
         return 0
 
+    cdef object read_view(self, Py_ssize_t size):
+        """
+        Reads C{size} bytes from the stream, returning a C{memoryview} onto
+        the wrapped buffer if there is one (see L{wrap}), otherwise a copy.
+        """
+        if self.complain_if_closed() == -1:
+            return None
+
+        if size == -1:
+            size = self.remaining()
+
+            if size == 0:
+                size = 1
+
+        if self.has_available(size) == -1:
+            return None
+
+        cdef Py_ssize_t pos = self.pos
+
+        self.pos += size
+
+        if self.wrapped == 0:
+            return PyString_FromStringAndSize(self.buffer + pos, size)
+
+        return self._export[pos:pos + size]
+
     cdef inline int at_eof(self) except? -1:
         """
         Returns C{True} if the internal pointer is at the end of the stream.
@@ -458,6 +585,9 @@ cdef class cBufferedByteStream:
         if size > self.length:
             raise IOError()
 
+        if self._own() == -1:
+            return -1
+
         if size == 0:
             PyMem_Free(self.buffer)
 
@@ -513,6 +643,9 @@ cdef class cBufferedByteStream:
         cdef char *buf = NULL
         cdef Py_ssize_t size = self.remaining()
 
+        if self._own() == -1:
+            return -1
+
         if size > 0:
             if self.peek(&buf, size) == -1:
                 return -1
@@ -675,25 +808,53 @@ cdef class cBufferedByteStream:
         """
         Reads an C{unsigned char} from the stream.
         """
-        return self.unpack_uint(1, <unsigned long *>ret)
+        cdef unsigned long x
+
+        if self.unpack_uint(1, &x) == -1:
+            return -1
+
+        ret[0] = <unsigned char>x
+
+        return 0
 
     cdef int read_char(self, char *ret) except? -1:
         """
         Reads a C{char} from the stream.
         """
-        return self.unpack_int(1, <long *>ret)
+        cdef long x
+
+        if self.unpack_int(1, &x) == -1:
+            return -1
+
+        ret[0] = <char>x
+
+        return 0
 
     cdef int read_ushort(self, unsigned short *ret) except? -1:
         """
         Reads a 2 byte unsigned integer from the stream.
         """
-        return self.unpack_uint(2, <unsigned long *>ret)
+        cdef unsigned long x
+
+        if self.unpack_uint(2, &x) == -1:
+            return -1
+
+        ret[0] = <unsigned short>x
+
+        return 0
 
     cdef int read_short(self, short *ret) except? -1:
         """
         Reads a 2 byte integer from the stream.
         """
-        return self.unpack_int(2, <long *>ret)
+        cdef long x
+
+        if self.unpack_int(2, &x) == -1:
+            return -1
+
+        ret[0] = <short>x
+
+        return 0
 
     cdef int read_ulong(self, unsigned long *ret) except? -1:
         """
@@ -1027,6 +1188,8 @@ cdef class BufferedByteStream(cBufferedByteStream):
 
         if buf is None:
             pass
+        elif isinstance(buf, buffer_types):
+            self.wrap(buf)
         elif isinstance(buf, cBufferedByteStream):
             x = <cBufferedByteStream>buf
             self.write(x.getvalue())
@@ -1081,6 +1244,49 @@ cdef class BufferedByteStream(cBufferedByteStream):
 
         return r
 
+    def read_view(self, size=-1):
+        """
+        Reads C{size} bytes from the stream. If the stream wraps a buffer a
+        read-only view onto that buffer is returned instead of a copy.
+
+        @see: L{pyamf.util.BufferedByteStream.read_view}
+        @since: 0.6
+        """
+        return cBufferedByteStream.read_view(self, <Py_ssize_t>size)
+
+    def readinto(self, buf):
+        """
+        Reads up to C{len(buf)} bytes from the stream into the writable
+        buffer C{buf}.
+
+        @see: L{pyamf.util.BufferedByteStream.readinto}
+        @since: 0.6
+        """
+        cdef void *ptr = NULL
+        cdef Py_ssize_t size = 0
+        cdef Py_buffer *view
+
+        cBufferedByteStream.complain_if_closed(self)
+
+        if PyMemoryView_Check(buf):
+            view = PyMemoryView_GET_BUFFER(buf)
+
+            if view.readonly or not PyBuffer_IsContiguous(view, c'C'):
+                raise TypeError('Expected a writable, contiguous buffer')
+
+            ptr = view.buf
+            size = view.len
+        else:
+            PyObject_AsWriteBuffer(buf, &ptr, &size)
+
+        if size > self.length - self.pos:
+            size = self.length - self.pos
+
+        memcpy(ptr, self.buffer + self.pos, size)
+        self.pos += size
+
+        return size
+
     def write(self, x):
         """
         Writes the content of the specified C{x} into this buffer.
@@ -1662,6 +1868,28 @@ cdef class cIndexedCollection:
 
         return self.length - 1
 
+    cdef int truncate(self, Py_ssize_t length) except? -1:
+        cdef Py_ssize_t i
+        cdef object h
+        cdef PyObject *p
+
+        if length < 0:
+            length = 0
+
+        for i from length <= i < self.length:
+            h = self._ref(<object>self.data[i])
+            p = <PyObject *>PyDict_GetItem(self.refs, h)
+
+            if p != NULL and PyInt_AS_LONG(<object>p) >= length:
+                del self.refs[h]
+
+            Py_DECREF(self.data[i])
+
+        if length < self.length:
+            self.length = length
+
+        return 0
+
     def __iter__(self):
         cdef object x = []
         cdef Py_ssize_t idx
@@ -1758,3 +1986,11 @@ cdef class IndexedCollection(cIndexedCollection):
 
     def clear(self):
          cIndexedCollection.clear(self)
+
+    def truncate(self, length):
+        """
+        Discards every reference from index C{length} onwards.
+
+        @since: 0.6
+        """
+        cIndexedCollection.truncate(self, <Py_ssize_t>length)
@@ -16,8 +16,11 @@ U{Flash Player<http://en.wikipedia.org/wiki/Flash_Player>}.
 @status: Production/Stable
 """
 
+import re
 import types
 import inspect
+import operator
+import threading
 
 from pyamf import util, versions as v
 from pyamf.adapters import register_adapters
@@ -33,6 +36,10 @@ __all__ = [
     'register_class_loader',
     'encode',
     'decode',
+    'extract',
+    'pre_encode',
+    'RawAMF',
+    'CodecPool',
     '__version__'
 ]
 
@@ -57,6 +64,24 @@ ERROR_CLASS_MAP = {
 #: Alias mapping support
 ALIAS_TYPES = {}
 
+#: Process-wide cache of resolved encoder dispatch. Maps
+#: C{(encoder class, data class)} to the name of the encoder method, the
+#: L{TYPE_MAP} function or C{None} if the class cannot be encoded.
+#: @see: L{get_dispatch_table}
+_dispatch_cache = {}
+_dispatch_lock = threading.Lock()
+_dispatch_generation = 0
+_dispatch_type_map = TYPE_MAP
+
+#: Process-wide cache of the L{ClassAlias} subclass that L{ALIAS_TYPES}
+#: selects for a class.
+_alias_type_cache = {}
+#: Process-wide cache of the anonymous L{ClassAlias} for classes that have not
+#: been registered.
+_unaliased_cache = {}
+_alias_lock = threading.Lock()
+_alias_generation = 0
+
 #: Specifies that objects are serialized using AMF for ActionScript 1.0
 #: and 2.0 that were introduced in the Adobe Flash Player 6.
 AMF0 = 0
@@ -69,6 +94,13 @@ ENCODING_TYPES = (AMF0, AMF3)
 #: Default encoding
 DEFAULT_ENCODING = AMF3
 
+#: Whether to use the compiled L{cpyamf} codecs (if they are available).
+#: Setting this to C{False} forces the pure Python codecs to be used, which is
+#: useful for comparison/debugging. Can be overridden per call by supplying
+#: C{use_ext} to L{get_encoder}/L{get_decoder}/L{encode}/L{decode}.
+#: @since: 0.6
+USE_EXTENSIONS = True
+
 
 class UndefinedType(object):
 
@@ -162,7 +194,12 @@ class BaseContext(object):
         @type ref: C{int}
         @return: The referenced object or C{None} if not found.
         """
-        return self.objects.getByReference(ref)
+        obj = self.objects.getByReference(ref)
+
+        if type(obj) is _LazySlot:
+            return obj.resolve()
+
+        return obj
 
     def getObjectReference(self, obj):
         """
@@ -185,6 +222,17 @@ class BaseContext(object):
         """
         return self.objects.append(obj)
 
+    def addRawAMF(self, raw):
+        """
+        Reserves the object references that C{raw} creates when it is decoded
+        so that references written after it still line up.
+
+        @type raw: L{RawAMF}
+        @since: 0.6
+        """
+        for i in xrange(raw.objects):
+            self.objects.append(object())
+
     def getClassAlias(self, klass):
         """
         Gets a class alias based on the supplied C{klass}.
@@ -198,14 +246,14 @@ class BaseContext(object):
             pass
 
         try:
-            self.class_aliases[klass] = get_class_alias(klass)
+            alias = get_class_alias(klass)
         except UnknownClassAlias:
             # no alias has been found yet .. check subclasses
-            alias = util.get_class_alias(klass)
+            alias = _get_unaliased(klass)
 
-            self.class_aliases[klass] = alias(klass)
+        self.class_aliases[klass] = alias
 
-        return self.class_aliases[klass]
+        return alias
 
     def getProxyForObject(self, obj):
         """
@@ -255,6 +303,26 @@ class BaseContext(object):
         self.proxied_objects[id(obj)] = proxied
         self.proxied_objects[id(proxied)] = obj
 
+    def checkpoint(self):
+        """
+        Returns an opaque marker of the references held by this context.
+        Passing the marker to L{rollback} discards any references that were
+        created after it was taken.
+
+        @see: L{IncrementalDecoder}
+        @since: 0.6
+        """
+        return len(self.objects)
+
+    def rollback(self, checkpoint):
+        """
+        Discards all references created since C{checkpoint} was returned by
+        L{checkpoint}.
+
+        @since: 0.6
+        """
+        self.objects.truncate(checkpoint)
+
 
 class ASObject(dict):
     """
@@ -294,12 +362,68 @@ class MixedArray(dict):
     """
 
 
+class RawAMF(object):
+    """
+    A pre-encoded AMF element that the encoders write to the stream as is.
+    The bytes must not refer to any string, object or trait outside of the
+    fragment, use L{pre_encode} to create one.
+
+    @ivar data: The encoded element.
+    @type data: C{str}
+    @ivar encoding: The encoding of C{data}, L{AMF0} or L{AMF3}.
+    @ivar objects: The number of object references the fragment creates when
+        it is decoded.
+    @ivar strings: The number of string references the fragment creates when
+        it is decoded (AMF3 only).
+    @ivar classes: The number of trait references the fragment creates when
+        it is decoded (AMF3 only).
+    @since: 0.6
+    """
+
+    __slots__ = ('data', 'encoding', 'objects', 'strings', 'classes')
+
+    def __init__(self, data, encoding=AMF3, objects=0, strings=0, classes=0):
+        self.data = data
+        self.encoding = encoding
+        self.objects = objects
+        self.strings = strings
+        self.classes = classes
+
+    def __len__(self):
+        return len(self.data)
+
+    def __eq__(self, other):
+        if not isinstance(other, RawAMF):
+            return False
+
+        return self.data == other.data and self.encoding == other.encoding
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __reduce__(self):
+        return (RawAMF, (self.data, self.encoding, self.objects, self.strings,
+            self.classes))
+
+    def __repr__(self):
+        return '<%s.%s AMF%d %d bytes at 0x%x>' % (
+            self.__class__.__module__, self.__class__.__name__,
+            self.encoding, len(self.data), id(self))
+
+
 class ClassAlias(object):
     """
     Class alias. Provides class/instance meta data to the En/Decoder to allow
     fine grain control and some performance increases.
 
     @ivar bases: A list of (class, alias) for all bases of this alias.
+    @ivar encode_attrs: The attributes fetched by L{getEncodableValues}, static
+        attributes first, or C{None} if the class is not sealed. Set by
+        L{compile}.
+    @type encode_attrs: C{tuple}
+    @ivar lazy: Whether instances are decoded to a L{LazyObject}. C{None}
+        leaves it to the decoder (see L{BaseDecoder._isLazy}).
+    @type lazy: C{bool} or C{None}
     """
 
     def __init__(self, klass, alias=None, **kwargs):
@@ -318,8 +442,10 @@ class ClassAlias(object):
         self.amf3 = kwargs.get('amf3', None)
         self.external = kwargs.get('external', None)
         self.dynamic = kwargs.get('dynamic', None)
+        self.lazy = kwargs.get('lazy', None)
 
         self._compiled = False
+        self.encode_attrs = None
         self.anonymous = False
         self.sealed = None
         self.bases = None
@@ -537,8 +663,56 @@ class ClassAlias(object):
         if issubclass(self.klass, dict) or self.klass is dict:
             self.is_dict = True
 
+        self._compile_encode_plan()
+
         self._compiled = True
 
+    def _compile_encode_plan(self):
+        """
+        Builds the encode plan for sealed classes. The en/decoders use
+        L{encode_attrs} and L{getEncodableValues} in preference to
+        L{getEncodableAttributes} when a plan is available.
+
+        @since: 0.6
+        """
+        self.encode_attrs = None
+        self._encode_getter = None
+
+        if self.external or self.dynamic:
+            return
+
+        # a subclass that overrides getEncodableAttributes must be honoured
+        func = getattr(self.getEncodableAttributes, 'im_func', None)
+
+        if func is not ClassAlias.getEncodableAttributes.im_func:
+            return
+
+        attrs = list(self.static_attrs or [])
+        others = list(self.non_static_encodable_properties or [])
+        others.sort()
+
+        attrs.extend(others)
+
+        try:
+            attrs = [str(attr) for attr in attrs]
+        except UnicodeEncodeError:
+            return
+
+        for attr in attrs:
+            # attrgetter would treat these as a path to a nested attribute
+            if '.' in attr:
+                return
+
+        if len(attrs) == 0:
+            self._encode_getter = lambda obj: ()
+        elif len(attrs) == 1:
+            attr = attrs[0]
+            self._encode_getter = lambda obj: (getattr(obj, attr),)
+        else:
+            self._encode_getter = operator.attrgetter(*attrs)
+
+        self.encode_attrs = tuple(attrs)
+
     def is_compiled(self):
         return self._compiled
 
@@ -664,6 +838,23 @@ class ClassAlias(object):
 
         return attrs
 
+    def getEncodableValues(self, obj):
+        """
+        Returns a tuple of the values of L{encode_attrs} for C{obj}. The static
+        attributes come first, in the order of L{static_attrs}. Only available
+        if L{encode_attrs} is not C{None}, which is the case for sealed
+        classes that do not override L{getEncodableAttributes}.
+
+        @since: 0.6
+        """
+        try:
+            return self._encode_getter(obj)
+        except AttributeError:
+            # missing static attributes are encoded as undefined
+            attrs = self.getEncodableAttributes(obj)
+
+            return tuple([attrs[attr] for attr in self.encode_attrs])
+
     def getDecodableAttributes(self, obj, attrs, codec=None):
         """
         Returns a dictionary of attributes for C{obj} that has been filtered,
@@ -857,6 +1048,275 @@ class ErrorAlias(ClassAlias):
         return attrs
 
 
+class _SkipError(BaseError):
+    """
+    Raised by a decoder in lazy mode when an element cannot be skipped
+    without decoding it, e.g. an externalised object.
+    """
+
+
+class _LazyMember(object):
+    """
+    The position of a member of a L{LazyObject} in the stream.
+
+    @ivar offset: The stream offset of the encoded value.
+    @ivar ref: The first object reference created by the value.
+    """
+
+    __slots__ = ('offset', 'ref', 'value', 'decoded')
+
+    def __init__(self, offset, ref):
+        self.offset = offset
+        self.ref = ref
+        self.value = None
+        self.decoded = False
+
+
+class _LazySlot(object):
+    """
+    Holds the place of an object that is nested in an undecoded member of a
+    L{LazyObject} in the object references of a context, so that the
+    references of the objects that follow stay correct. L{resolve} decodes
+    the member, and the members that object is nested in if they were read
+    lazily too.
+    """
+
+    __slots__ = ('state', 'member', 'ref')
+
+    def __init__(self, state, member):
+        self.state = state
+        self.member = member
+        self.ref = None
+
+    def resolve(self):
+        slot = self
+
+        while type(slot) is _LazySlot:
+            slot.state.read(slot.member)
+            obj = slot.state.objects[slot.ref]
+
+            if obj is slot:
+                raise ReferenceError('Unknown reference %d' % (slot.ref,))
+
+            slot = obj
+
+        return slot
+
+
+class _LazyReferences(object):
+    """
+    Replays the references of a stream for the decoder of a L{LazyObject}
+    member. Lookups go to the original references and appended objects fill
+    in the placeholders from C{cursor} onwards. If C{cursor} is C{None} the
+    references are read only.
+    """
+
+    def __init__(self, refs, cursor=None):
+        self.list = refs
+        self.cursor = cursor
+
+    def getByReference(self, ref):
+        try:
+            return self.list[ref]
+        except IndexError:
+            return None
+
+    def append(self, obj):
+        if self.cursor is None:
+            return None
+
+        ref = self.cursor
+        self.list[ref] = obj
+        self.cursor += 1
+
+        return ref
+
+    def truncate(self, length):
+        if self.cursor is not None:
+            self.cursor = length
+
+    def __len__(self):
+        if self.cursor is None:
+            return len(self.list)
+
+        return self.cursor
+
+
+class _LazyState(object):
+    """
+    The stream and references that are shared by the L{LazyObject}s read by a
+    decoder. The reference lists are held directly so that clearing the
+    context does not affect them.
+
+    @ivar decoder: The decoder that read the objects.
+    @ivar objects: The object references of the context.
+    @type objects: C{list}
+    """
+
+    def __init__(self, decoder, objects):
+        self.decoder = decoder
+        self.stream = decoder.stream
+        self.objects = objects
+
+    def read(self, member):
+        """
+        Decodes C{member} from the stream, filling in the references of the
+        objects nested in it.
+        """
+        if member.decoded:
+            return member.value
+
+        stream = self.stream
+        pos = stream.tell()
+
+        context = self.decoder.lazy_context_class(self, member.ref)
+        decoder = self.decoder._getLazyDecoder(stream, context)
+
+        stream.seek(member.offset)
+
+        try:
+            value = decoder.readElement()
+        finally:
+            stream.seek(pos)
+
+        member.value = value
+        member.decoded = True
+
+        return value
+
+
+class _LazyElement(object):
+    """
+    An element that was skipped over in the stream, decoded by L{get}. If
+    C{state} is C{None} the element could not be skipped and C{member} is
+    the decoded value.
+    """
+
+    __slots__ = ('state', 'member')
+
+    def __init__(self, state, member):
+        self.state = state
+        self.member = member
+
+    def get(self):
+        if self.state is None:
+            return self.member
+
+        return self.state.read(self.member)
+
+
+class LazyObject(object):
+    """
+    Stands in for an object read by a decoder in lazy mode. Only the stream
+    offsets of the members are recorded when the object is read, each member
+    is decoded the first time it is accessed as an attribute or item. Use
+    L{materialize} to get the fully decoded object.
+
+    C{len}, iteration, C{in} and truth testing are forwarded to the decoded
+    object, so a L{LazyObject} for an L{ASObject} can be used as a C{dict}.
+
+    @see: L{ClassAlias.lazy}
+    @since: 0.6
+    """
+
+    __slots__ = ('_lazy_state', '_lazy_members', '_lazy_create',
+        '_lazy_apply', '_lazy_obj')
+
+    def __init__(self, state, create, apply):
+        object.__setattr__(self, '_lazy_state', state)
+        object.__setattr__(self, '_lazy_members', {})
+        object.__setattr__(self, '_lazy_create', create)
+        object.__setattr__(self, '_lazy_apply', apply)
+        object.__setattr__(self, '_lazy_obj', None)
+
+    def _lazy_get(self, name):
+        """
+        Returns the member C{name} or the materialized object if C{name} is
+        not a member (or it already exists).
+        """
+        if self._lazy_obj is None:
+            try:
+                member = self._lazy_members[name]
+            except KeyError:
+                pass
+            else:
+                return True, self._lazy_state.read(member)
+
+        return False, _materialize(self)
+
+    def _lazy_set(self, name, value):
+        if self._lazy_obj is None:
+            try:
+                member = self._lazy_members[name]
+            except KeyError:
+                pass
+            else:
+                member.value = value
+                member.decoded = True
+
+                return True
+
+        return False
+
+    def __getattr__(self, name):
+        if name.startswith('_lazy_'):
+            raise AttributeError(name)
+
+        found, value = self._lazy_get(name)
+
+        if found:
+            return value
+
+        return getattr(value, name)
+
+    def __setattr__(self, name, value):
+        if not self._lazy_set(name, value):
+            setattr(_materialize(self), name, value)
+
+    def __getitem__(self, key):
+        found, value = self._lazy_get(key)
+
+        if found:
+            return value
+
+        return value[key]
+
+    def __setitem__(self, key, value):
+        if not self._lazy_set(key, value):
+            _materialize(self)[key] = value
+
+    def __len__(self):
+        return len(_materialize(self))
+
+    def __iter__(self):
+        return iter(_materialize(self))
+
+    def __contains__(self, key):
+        if self._lazy_obj is None and key in self._lazy_members:
+            return True
+
+        return key in _materialize(self)
+
+    def __nonzero__(self):
+        return bool(_materialize(self))
+
+    def __eq__(self, other):
+        return materialize(self) == materialize(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        if self._lazy_obj is not None:
+            return repr(self._lazy_obj)
+
+        return '<%s members=%r>' % (self.__class__.__name__,
+            sorted(self._lazy_members.keys()))
+
+
 class BaseDecoder(object):
     """
     Base AMF decoder.
@@ -874,10 +1334,17 @@ class BaseDecoder(object):
     @ivar timezone_offset: The offset from UTC for any datetime objects being
         decoded. Default to C{None} means no offset.
     @type timezone_offset: L{datetime.timedelta}
+    @ivar lazy: Whether objects are decoded to L{LazyObject}s. Overridden by
+        L{ClassAlias.lazy}.
+    @type lazy: C{bool}
+    @ivar lazy_context_class: The context used to decode the members of a
+        L{LazyObject} against the references of the original stream.
     """
 
     context_class = BaseContext
+    lazy_context_class = None
     type_map = {}
+    lazy = False
 
     def __init__(self, stream=None, context=None, strict=False, timezone_offset=None):
         if isinstance(stream, util.BufferedByteStream):
@@ -894,6 +1361,8 @@ class BaseDecoder(object):
         self.timezone_offset = timezone_offset
 
         self._func_cache = {}
+        self._lazy_state = None
+        self._lazy_member = None
 
     def readProxy(self, obj, **kwargs):
         """
@@ -934,119 +1403,420 @@ class BaseDecoder(object):
 
             raise
 
-    def __iter__(self):
-        try:
-            while 1:
-                yield self.readElement()
-        except EOStream:
-            raise StopIteration
+    def _isLazy(self, alias):
+        """
+        Returns whether an object of C{alias} is decoded to a L{LazyObject}.
 
+        @since: 0.6
+        """
+        if alias is not None and alias.lazy is not None:
+            return alias.lazy
 
-class CustomTypeFunc(object):
-    """
-    Custom type mappings.
-    """
+        return self.lazy
 
-    def __init__(self, encoder, func):
-        self.encoder = encoder
-        self.func = func
+    def _getLazyState(self):
+        """
+        Returns the L{_LazyState} for the current stream and context.
+        """
+        state = self._lazy_state
 
-    def __call__(self, data, *args, **kwargs):
-        self.encoder.writeElement(self.func(data, encoder=self.encoder))
+        if state is None or state.stream is not self.stream or \
+                state.objects is not getattr(self.context.objects, 'list', None):
+            state = self._lazy_state = _LazyState(self,
+                self._getLazyReferences('objects'))
 
+        return state
 
-class BaseEncoder(object):
-    """
-    Base AMF encoder.
+    def _getLazyReferences(self, name, use_hash=False):
+        """
+        Returns the list of references held by the collection C{name} of the
+        context. The compiled collections are cleared in place so they are
+        swapped for a L{util.PyIndexedCollection} holding the same
+        references.
+        """
+        refs = getattr(self.context, name)
 
-    @ivar type_map: A list of types -> functions. The types is a list of
-        possible instances or functions to call (that return a C{bool}) to
-        determine the correct function to call to encode the data.
-    @type type_map: C{list}
-    @ivar context_class: Holds the class that will create context objects for
-        the implementing C{Encoder}.
-    @type context_class: C{type} or C{types.ClassType}
-    @ivar stream: The underlying data stream.
-    @type stream: L{BufferedByteStream<pyamf.util.BufferedByteStream>}
-    @ivar context: The context for the encoding.
-    @type context: An instance of C{BaseEncoder.context_class}
-    @ivar strict: Whether the encoder should operate in 'strict' mode. Nothing
-        is really affected by this for the time being - its just here for
-        flexibility.
-    @type strict: C{bool}, default is False.
-    @ivar timezone_offset: The offset from UTC for any datetime objects being
-        encoded. Default to C{None} means no offset.
-    @type timezone_offset: L{datetime.timedelta}
-    """
+        if not isinstance(refs, (util.PyIndexedCollection, _LazyReferences)):
+            cpy = util.PyIndexedCollection(use_hash=use_hash)
 
-    context_class = BaseContext
-    type_map = []
+            for obj in refs:
+                cpy.append(obj)
 
-    def __init__(self, stream=None, context=None, strict=False, timezone_offset=None):
-        if isinstance(stream, util.BufferedByteStream):
-            self.stream = stream
-        else:
-            self.stream = util.BufferedByteStream(stream)
+            setattr(self.context, name, cpy)
+            refs = cpy
 
-        if context is None:
-            self.context = self.context_class()
-        else:
-            self.context = context
+        return refs.list
 
-        self._write_elem_func_cache = {}
-        self.strict = strict
-        self.timezone_offset = timezone_offset
+    def _getLazyDecoder(self, stream, context):
+        """
+        Returns a decoder with the same options as this one, used to decode
+        the members of a L{LazyObject}.
+        """
+        return self.__class__(stream, context, strict=self.strict,
+            timezone_offset=self.timezone_offset)
 
-    def writeProxy(self, obj, **kwargs):
+    def _readLazyObject(self, create, apply, *args):
         """
-        Encodes a proxied object to the stream.
+        Reads the members of an object into a L{LazyObject}, see
+        C{_skipLazyMembers}.
 
-        @since: 0.6
+        @param create: Returns a new instance of the object.
+        @param apply: Called with the instance and a C{dict} of its members.
+        @return: The L{LazyObject} or C{None} if a member cannot be skipped, in
+            which case the stream and context are restored.
         """
-        proxy = self.context.getProxyForObject(obj)
+        pos = self.stream.tell()
+        checkpoint = self.context.checkpoint()
 
-        self.writeElement(proxy, use_proxies=False)
+        obj = LazyObject(self._getLazyState(), create, apply)
+        self.context.addObject(obj)
 
-    def writeFunc(self, obj, **kwargs):
+        try:
+            self._skipLazyMembers(obj, *args)
+        except _SkipError:
+            self.context.rollback(checkpoint)
+            self.stream.seek(pos)
+
+            return None
+
+        return obj
+
+    def _skipLazyMember(self, obj, name):
         """
-        Not possible to encode functions.
+        Records the position of the member C{name} of C{obj} and skips over
+        it.
+        """
+        obj._lazy_members[name] = self._skipMember()
 
-        @raise EncodeError: Unable to encode function/methods.
+    def _skipMember(self):
         """
-        raise EncodeError("Unable to encode function/methods")
+        Skips over the next element, returning the L{_LazyMember} that
+        decodes it.
+        """
+        member = _LazyMember(self.stream.tell(), len(self.context.objects))
 
-    def _getWriteElementFunc(self, data):
+        self._lazy_member = member
+        self._skipElement()
+        self._lazy_member = None
+
+        return member
+
+    def _skipLazyElement(self):
         """
-        Gets a function used to encode the data.
+        Skips over the next element in the stream, see L{extract}.
 
-        @type   data: C{mixed}
-        @param  data: Python data.
-        @rtype: callable or C{None}.
-        @return: The function used to encode data to the stream.
+        @rtype: L{_LazyElement}
+        @since: 0.6
         """
-        for type_, func in TYPE_MAP.iteritems():
+        state = self._getLazyState()
+        pos = self.stream.tell()
+        checkpoint = self.context.checkpoint()
+
+        try:
+            return _LazyElement(state, self._skipMember())
+        except _SkipError:
+            self.context.rollback(checkpoint)
+            self.stream.seek(pos)
+
+        return _LazyElement(None, self.readElement())
+
+    def _skipBytes(self, n):
+        """
+        Skips C{n} bytes of the stream.
+
+        @raise IOError: Fewer than C{n} bytes remain.
+        """
+        if self.stream.remaining() < n:
+            raise IOError('Attempted to skip %d bytes but only %d remain' % (
+                n, self.stream.remaining()))
+
+        self.stream.seek(n, 1)
+
+    def _addLazySlot(self):
+        """
+        Adds a placeholder to the object references for an object in the member
+        that is being skipped.
+        """
+        slot = _LazySlot(self._lazy_state, self._lazy_member)
+        slot.ref = self.context.addObject(slot)
+
+    def __iter__(self):
+        try:
+            while 1:
+                yield self.readElement()
+        except EOStream:
+            raise StopIteration
+
+
+class IncrementalDecoder(object):
+    """
+    A push style decoder for AMF data that arrives in chunks, e.g. from a
+    socket.
+
+    Bytes are passed to L{feed} as they arrive and each call returns the
+    elements that were completed by those bytes. The decoder and its
+    context persist between calls so references are resolved across chunks.
+    Consumed bytes are discarded as soon as their element is complete, only
+    a trailing partial element is held back until more data arrives.
+
+    An element is only decoded once all of it has arrived. Until then its
+    bytes are scanned (see C{_scan_element} in L{amf0<pyamf.amf0>} and
+    L{amf3<pyamf.amf3>}) and each call to L{feed} carries on scanning from
+    where the last one stopped, so a large element costs time in proportion
+    to its size however it is chunked. Elements whose length cannot be found
+    without decoding them, e.g. those holding externalised objects, are
+    decoded on every call to L{feed} until they succeed. If such an element
+    is incomplete, the references it created in the context are rolled back
+    (see L{BaseContext.checkpoint}) before it is read again.
+
+    @ivar encoding: The AMF encoding of the data.
+    @ivar decoder: The underlying decoder.
+    @ivar stream: The buffer holding the unconsumed bytes.
+    @type stream: L{BufferedByteStream<pyamf.util.BufferedByteStream>}
+    @since: 0.6
+    """
+
+    encoding = DEFAULT_ENCODING
+
+    def __init__(self, context=None, strict=False, timezone_offset=None,
+        use_ext=None, encoding=None):
+        if encoding is not None:
+            self.encoding = encoding
+
+        self.stream = util.BufferedByteStream()
+        self.decoder = get_decoder(self.encoding, self.stream,
+            context=context, strict=strict, timezone_offset=timezone_offset,
+            use_ext=use_ext)
+        self.context = self.decoder.context
+
+        self._scanner = None
+        self._scanned = 0
+
+    def feed(self, data):
+        """
+        Adds C{data} to the buffer and decodes as many complete elements as
+        possible.
+
+        @param data: The next chunk of AMF data.
+        @type data: C{str}
+        @return: The elements completed by C{data}, in stream order.
+        @rtype: C{list}
+        @raise DecodeError: The data is malformed.
+        """
+        stream = self.stream
+
+        if data:
+            pos = stream.tell()
+
+            stream.seek(0, 2)
+            stream.write(data)
+            stream.seek(pos)
+
+        read = self.decoder.readElement
+        context = self.context
+        elements = []
+
+        while not stream.at_eof():
+            if not self._scan():
+                break
+
+            pos = stream.tell()
+            checkpoint = context.checkpoint()
+
+            try:
+                elements.append(read())
+            except (IOError, EOStream):
+                context.rollback(checkpoint)
+                stream.seek(pos)
+
+                # the scan was wrong or skipped, leave it to the decoder
+                self._scanner = False
+
+                break
+
+            self._scanner = None
+
+        stream.consume()
+
+        return elements
+
+    def _scan(self):
+        """
+        Resumes scanning the element at the stream position.
+
+        @return: C{False} if the element is incomplete, otherwise C{True} and
+            it is ready to be decoded. C{True} is also returned if it cannot
+            be scanned, the decoder has to find out.
+        """
+        if self._scanner is False:
+            return True
+
+        stream = self.stream
+        pos = stream.tell()
+
+        if self._scanner is None:
+            self._scanner = _get_scanner(self.encoding)(stream, self.context)
+            self._scanned = 0
+
+        stream.seek(pos + self._scanned)
+
+        try:
+            self._scanner.next()
+        except StopIteration:
+            pass
+        except _SkipError:
+            self._scanner = False
+        else:
+            self._scanned = stream.tell() - pos
+            stream.seek(pos)
+
+            return False
+
+        stream.seek(pos)
+
+        return True
+
+    def remaining(self):
+        """
+        Returns the number of buffered bytes that belong to an incomplete
+        element.
+
+        @rtype: C{int}
+        """
+        return self.stream.remaining()
+
+
+class CustomTypeFunc(object):
+    """
+    Custom type mappings.
+    """
+
+    def __init__(self, encoder, func):
+        self.encoder = encoder
+        self.func = func
+
+    def __call__(self, data, *args, **kwargs):
+        self.encoder.writeElement(self.func(data, encoder=self.encoder))
+
+
+class BaseEncoder(object):
+    """
+    Base AMF encoder.
+
+    @ivar type_map: A list of types -> functions. The types is a list of
+        possible instances or functions to call (that return a C{bool}) to
+        determine the correct function to call to encode the data.
+    @type type_map: C{list}
+    @ivar context_class: Holds the class that will create context objects for
+        the implementing C{Encoder}.
+    @type context_class: C{type} or C{types.ClassType}
+    @ivar stream: The underlying data stream.
+    @type stream: L{BufferedByteStream<pyamf.util.BufferedByteStream>}
+    @ivar context: The context for the encoding.
+    @type context: An instance of C{BaseEncoder.context_class}
+    @ivar strict: Whether the encoder should operate in 'strict' mode. Nothing
+        is really affected by this for the time being - its just here for
+        flexibility.
+    @type strict: C{bool}, default is False.
+    @ivar timezone_offset: The offset from UTC for any datetime objects being
+        encoded. Default to C{None} means no offset.
+    @type timezone_offset: L{datetime.timedelta}
+    """
+
+    context_class = BaseContext
+    type_map = []
+
+    def __init__(self, stream=None, context=None, strict=False, timezone_offset=None):
+        if isinstance(stream, util.BufferedByteStream):
+            self.stream = stream
+        else:
+            self.stream = util.BufferedByteStream(stream)
+
+        if context is None:
+            self.context = self.context_class()
+        else:
+            self.context = context
+
+        self._write_elem_func_cache = {}
+        self.strict = strict
+        self.timezone_offset = timezone_offset
+
+    def writeProxy(self, obj, **kwargs):
+        """
+        Encodes a proxied object to the stream.
+
+        @since: 0.6
+        """
+        proxy = self.context.getProxyForObject(obj)
+
+        self.writeElement(proxy, use_proxies=False)
+
+    def writeFunc(self, obj, **kwargs):
+        """
+        Not possible to encode functions.
+
+        @raise EncodeError: Unable to encode function/methods.
+        """
+        raise EncodeError("Unable to encode function/methods")
+
+    def _resolveWriteElementFunc(self, data):
+        """
+        Finds the handler used to encode C{data}, without binding it to this
+        encoder.
+
+        @return: The L{TYPE_MAP} function, the name of the encoder method or
+            C{None} if C{data} cannot be encoded.
+        """
+        for type_, func in TYPE_MAP.iteritems():
             try:
                 if isinstance(data, type_):
-                    return CustomTypeFunc(self, func)
+                    return func
             except TypeError:
                 if callable(type_) and type_(data):
-                    return CustomTypeFunc(self, func)
+                    return func
 
         for tlist, method in self.type_map:
             for t in tlist:
                 try:
                     if isinstance(data, t):
-                        return getattr(self, method)
+                        return method
                 except TypeError:
                     if callable(t) and t(data):
-                        return getattr(self, method)
+                        return method
 
         return None
 
+    def _bindWriteElementFunc(self, handler):
+        """
+        Binds a handler returned by L{_resolveWriteElementFunc} to this
+        encoder.
+        """
+        if handler is None:
+            return None
+
+        if isinstance(handler, str):
+            return getattr(self, handler)
+
+        return CustomTypeFunc(self, handler)
+
+    def _getWriteElementFunc(self, data):
+        """
+        Gets a function used to encode the data.
+
+        @type   data: C{mixed}
+        @param  data: Python data.
+        @rtype: callable or C{None}.
+        @return: The function used to encode data to the stream.
+        """
+        return self._bindWriteElementFunc(self._resolveWriteElementFunc(data))
+
     def _writeElementFunc(self, data):
         """
         Gets a function used to encode the data.
 
+        The handler for each class is resolved once per process (see
+        L{get_dispatch_table}) and bound once per encoder.
+
         @type   data: C{mixed}
         @param  data: Python data.
         @rtype: callable or C{None}.
@@ -1058,9 +1828,24 @@ class BaseEncoder(object):
             return self._getWriteElementFunc(data)
 
         try:
-            t = self._write_elem_func_cache[key]
+            return self._write_elem_func_cache[key]
+        except KeyError:
+            pass
+
+        dispatch_key = (self.__class__, key)
+
+        if TYPE_MAP is not _dispatch_type_map:
+            _invalidate_dispatch_cache()
+
+        try:
+            handler = _dispatch_cache[dispatch_key]
         except KeyError:
-            t = self._write_elem_func_cache[key] = self._getWriteElementFunc(data)
+            generation = _dispatch_generation
+            handler = self._resolveWriteElementFunc(data)
+
+            _cache_dispatch(dispatch_key, handler, generation)
+
+        t = self._write_elem_func_cache[key] = self._bindWriteElementFunc(handler)
 
         return t
 
@@ -1074,6 +1859,137 @@ class BaseEncoder(object):
         raise NotImplementedError
 
 
+def _cache_dispatch(key, handler, generation):
+    """
+    Stores a resolved encoder handler in the process-wide dispatch cache,
+    unless the cache has been invalidated since C{generation} was read.
+
+    @since: 0.6
+    """
+    _dispatch_lock.acquire()
+
+    try:
+        if generation == _dispatch_generation:
+            _dispatch_cache[key] = handler
+    finally:
+        _dispatch_lock.release()
+
+
+def _invalidate_dispatch_cache():
+    """
+    Empties the process-wide dispatch cache. Called whenever L{TYPE_MAP} or
+    the registered classes change.
+
+    @since: 0.6
+    """
+    global _dispatch_generation, _dispatch_type_map
+
+    _dispatch_lock.acquire()
+
+    try:
+        _dispatch_generation += 1
+        _dispatch_type_map = TYPE_MAP
+        _dispatch_cache.clear()
+    finally:
+        _dispatch_lock.release()
+
+
+def get_dispatch_table():
+    """
+    Returns a snapshot of the process-wide encoder dispatch cache, for
+    debugging.
+
+    @return: A C{dict} of C{(encoder class, data class)} to the handler
+        resolved for that pair; the name of an encoder method, a L{TYPE_MAP}
+        function or C{None} for classes that cannot be encoded. The compiled
+        encoders store their internal type codes instead of method names.
+    @rtype: C{dict}
+    @since: 0.6
+    """
+    _dispatch_lock.acquire()
+
+    try:
+        return _dispatch_cache.copy()
+    finally:
+        _dispatch_lock.release()
+
+
+def _cache_alias(cache, klass, value, generation):
+    """
+    Stores C{value} in one of the process-wide alias caches, unless they have
+    been invalidated since C{generation} was read.
+
+    @since: 0.6
+    """
+    _alias_lock.acquire()
+
+    try:
+        if generation == _alias_generation:
+            cache[klass] = value
+    finally:
+        _alias_lock.release()
+
+
+def _invalidate_alias_cache():
+    """
+    Empties the process-wide alias caches. Called whenever the registered
+    classes or alias types change.
+
+    @since: 0.6
+    """
+    global _alias_generation
+
+    _alias_lock.acquire()
+
+    try:
+        _alias_generation += 1
+        _alias_type_cache.clear()
+        _unaliased_cache.clear()
+    finally:
+        _alias_lock.release()
+
+
+def _get_alias_type(klass):
+    """
+    Returns the L{ClassAlias} subclass to use for C{klass}, as selected by
+    L{util.get_class_alias}. The result is cached for the process.
+
+    @since: 0.6
+    """
+    try:
+        return _alias_type_cache[klass]
+    except KeyError:
+        pass
+
+    generation = _alias_generation
+    alias_klass = util.get_class_alias(klass)
+
+    _cache_alias(_alias_type_cache, klass, alias_klass, generation)
+
+    return alias_klass
+
+
+def _get_unaliased(klass):
+    """
+    Returns the anonymous L{ClassAlias} used for an unregistered C{klass}. The
+    result is cached for the process, so this is not repeated every time a
+    context is cleared.
+
+    @since: 0.6
+    """
+    try:
+        return _unaliased_cache[klass]
+    except KeyError:
+        pass
+
+    generation = _alias_generation
+    alias = _get_alias_type(klass)(klass)
+
+    _cache_alias(_unaliased_cache, klass, alias, generation)
+
+    return alias
+
+
 def register_class(klass, alias=None):
     """
     Registers a class to be used in the data streaming.
@@ -1094,6 +2010,9 @@ def register_class(klass, alias=None):
 
     CLASS_CACHE[klass] = x
 
+    _invalidate_dispatch_cache()
+    _invalidate_alias_cache()
+
     return x
 
 
@@ -1117,6 +2036,9 @@ def unregister_class(alias):
 
     del CLASS_CACHE[x.klass]
 
+    _invalidate_dispatch_cache()
+    _invalidate_alias_cache()
+
     return x
 
 
@@ -1287,10 +2209,21 @@ def decode(*args, **kwargs):
     @type   context: L{AMF0 Context<pyamf.amf0.Context>} or
     L{AMF3 Context<pyamf.amf3.Context>}
     @kwarg  context: Context.
+    @type use_ext: C{bool}
+    @kwarg use_ext: Whether to use the compiled decoder, if available.
+        Defaults to L{USE_EXTENSIONS}.
+    @type lazy: C{bool}
+    @kwarg lazy: Decode objects to L{LazyObject}s. Implies the pure Python
+        decoder.
     @return: Each element in the stream.
     """
     encoding = kwargs.pop('encoding', DEFAULT_ENCODING)
-    decoder = _get_decoder_class(encoding)(*args, **kwargs)
+    use_ext = kwargs.pop('use_ext', None)
+
+    if kwargs.get('lazy', False):
+        use_ext = False
+
+    decoder = _get_decoder_class(encoding, use_ext)(*args, **kwargs)
 
     while 1:
         try:
@@ -1310,13 +2243,17 @@ def encode(*args, **kwargs):
     @type context: L{amf0.Context<pyamf.amf0.Context>} or
     L{amf3.Context<pyamf.amf3.Context>}
     @keyword context: Context.
+    @type use_ext: C{bool}
+    @keyword use_ext: Whether to use the compiled encoder, if available.
+        Defaults to L{USE_EXTENSIONS}.
 
     @rtype: C{StringIO}
     @return: File-like object.
     """
     encoding = kwargs.pop('encoding', DEFAULT_ENCODING)
+    use_ext = kwargs.pop('use_ext', None)
 
-    encoder = _get_encoder_class(encoding)(**kwargs)
+    encoder = _get_encoder_class(encoding, use_ext)(**kwargs)
     stream = encoder.stream
 
     for el in args:
@@ -1327,32 +2264,356 @@ def encode(*args, **kwargs):
     return stream
 
 
+def pre_encode(obj, encoding=DEFAULT_ENCODING, **kwargs):
+    """
+    Encodes C{obj} once into a L{RawAMF} fragment that can be returned from
+    services (or nested in other objects) and is copied verbatim into any
+    number of output streams. No references are shared with the stream the
+    fragment is spliced into, so repeated strings, objects and traits inside
+    C{obj} are written in full and objects that appear more than once are
+    decoded as copies.
+
+    C{obj} must not contain cycles and an L{AMF0} fragment must not contain
+    anything that would be encoded as L{AMF3}.
+
+    @param kwargs: Passed to the encoder, e.g. C{use_proxies}.
+    @rtype: L{RawAMF}
+    @raise EncodeError: C{obj} cannot be pre-encoded in C{encoding}.
+    @since: 0.6
+    """
+    klass = _get_encoder_class(encoding, False)
+    encoder = klass(context=klass.raw_context_class(), **kwargs)
+
+    encoder.writeElement(obj)
+    data = encoder.stream.getvalue()
+
+    # count the references that a decoder will make for this fragment
+    decoder = _get_decoder_class(encoding, False)(data)
+    decoder.readElement()
+    context = decoder.context
+
+    if encoding == AMF0:
+        if hasattr(context, 'amf3_context'):
+            raise EncodeError('AMF0 fragments cannot contain AMF3 data')
+
+        return RawAMF(data, encoding, len(context.objects))
+
+    return RawAMF(data, encoding, len(context.objects), len(context.strings),
+        context.class_idx)
+
+
 def get_decoder(encoding, *args, **kwargs):
     """
-    Returns a subclassed instance of L{pyamf.BaseDecoder}, based on C{encoding}
+    Returns a decoder instance based on C{encoding}. If the compiled
+    L{cpyamf} decoder is available it will be used unless C{use_ext} is
+    C{False} (see L{USE_EXTENSIONS}).
+
+    Lazy decoding (the C{lazy} keyword) is only supported by the pure Python
+    decoders, so C{lazy=True} implies C{use_ext=False}.
+    """
+    use_ext = kwargs.pop('use_ext', None)
+
+    if kwargs.get('lazy', False):
+        use_ext = False
+
+    return _get_decoder_class(encoding, use_ext)(*args, **kwargs)
+
+
+def materialize(obj, **kwargs):
+    """
+    Returns the fully decoded object for a L{LazyObject}, decoding any members
+    that have not been accessed yet. The L{LazyObject}s nested in its members
+    (and in the lists and dicts they hold) are replaced by their decoded
+    objects too. Anything else is returned as is.
+
+    @since: 0.6
+    """
+    if not isinstance(obj, LazyObject):
+        return obj
+
+    return _materialize_all(obj, {})
+
+
+def _materialize(obj):
+    """
+    Returns the decoded object for the L{LazyObject} C{obj}, its members may
+    still be L{LazyObject}s.
+    """
+    if obj._lazy_obj is not None:
+        return obj._lazy_obj
+
+    ret = obj._lazy_create()
+    state = obj._lazy_state
+    attrs = {}
+
+    for name, member in obj._lazy_members.iteritems():
+        value = state.read(member)
+
+        if value is obj:
+            value = ret
+
+        attrs[name] = value
+
+    obj._lazy_apply(ret, attrs)
+    object.__setattr__(obj, '_lazy_obj', ret)
+
+    return ret
+
+
+def _materialize_all(obj, seen):
+    """
+    Materializes C{obj} and, in place, the L{LazyObject}s nested in it.
+    """
+    if isinstance(obj, LazyObject):
+        obj = _materialize(obj)
+
+    if id(obj) in seen:
+        return obj
+
+    seen[id(obj)] = obj
+
+    if isinstance(obj, list):
+        for i, v in enumerate(obj):
+            obj[i] = _materialize_all(v, seen)
+
+        return obj
+
+    if isinstance(obj, dict):
+        items = obj.items()
+    else:
+        items = getattr(obj, '__dict__', None)
+
+        if type(items) is not dict:
+            return obj
+
+        items = items.items()
+
+    for k, v in items:
+        value = _materialize_all(v, seen)
+
+        if value is v:
+            continue
+
+        if isinstance(obj, dict):
+            dict.__setitem__(obj, k, value)
+        else:
+            obj.__dict__[k] = value
+
+    return obj
+
+
+_path_re = re.compile(r'(?:^|\.)([A-Za-z_]\w*)|\[(\d+)\]')
+
+
+def parse_path(path):
+    """
+    Splits an L{extract} path into its keys, e.g. C{'body[0].operation'}
+    becomes C{['body', 0, 'operation']}.
+
+    @raise ValueError: C{path} is malformed.
+    @since: 0.6
+    """
+    keys = []
+    pos = 0
+
+    while pos < len(path):
+        m = _path_re.match(path, pos)
+
+        if m is None or m.end() == pos:
+            raise ValueError('Malformed path %r at %d' % (path, pos))
+
+        name, idx = m.groups()
+
+        if name is not None:
+            keys.append(name)
+        else:
+            keys.append(int(idx))
+
+        pos = m.end()
+
+    if not keys:
+        raise ValueError('Empty path')
+
+    return keys
+
+
+class ExtractFrame(dict):
+    """
+    A structure that is not an element of the stream but holds elements that
+    paths can be resolved against, e.g. the headers of a remoting envelope.
+
+    @see: L{extract_paths}
+    @since: 0.6
+    """
+
+
+_scalar_types = (basestring, int, long, float, bool, list, tuple)
+
+
+def _get_key(obj, key):
+    """
+    Returns the member C{key} of C{obj}, decoding only what is needed.
+    """
+    if isinstance(obj, _LazyElement):
+        obj = obj.get()
+
+    if isinstance(obj, LazyObject):
+        found, value = obj._lazy_get(key)
+
+        if found:
+            return value
+
+        obj = value
+
+    if isinstance(key, int) or isinstance(obj, dict):
+        return obj[key]
+
+    if isinstance(obj, _scalar_types):
+        # don't return the methods of builtins, e.g. str.upper
+        raise TypeError('%r has no members' % (type(obj),))
+
+    return getattr(obj, key)
+
+
+def _finish_value(value):
+    if isinstance(value, _LazyElement):
+        value = value.get()
+
+    if isinstance(value, ExtractFrame):
+        ret = {}
+
+        for k, v in value.iteritems():
+            ret[k] = _finish_value(v)
+
+        return ret
+
+    return _materialize_all(value, {})
+
+
+def extract_paths(root, paths):
+    """
+    Resolves each of C{paths} against C{root}, see L{extract}.
+
+    @return: A C{dict} of path to value. Paths that do not exist are left
+        out.
+    @since: 0.6
+    """
+    ret = {}
+
+    for path in paths:
+        value = root
+
+        try:
+            for key in parse_path(path):
+                value = _get_key(value, key)
+        except (KeyError, IndexError, AttributeError, TypeError):
+            continue
+
+        ret[path] = _finish_value(value)
+
+    return ret
+
+
+def extract(stream, paths, encoding=DEFAULT_ENCODING, strict=False,
+    timezone_offset=None):
+    """
+    Returns the values at C{paths} in an AMF stream, without decoding the
+    rest of the stream. The first key of a path is the index of the element,
+    e.g. C{'[1].user.name'}. Elements and members that are not on a path are
+    skipped over, only creating the references that later values may need.
+
+    Use L{pyamf.remoting.extract} for remoting envelopes.
+
+    @param paths: A list of paths. Keys are separated by C{.} and indexes
+        are written as C{[n]}.
+    @return: A C{dict} of path to value. Paths that do not exist in the
+        stream are left out.
+    @raise ValueError: A path is malformed.
+    @since: 0.6
+    """
+    last = -1
+
+    for path in paths:
+        key = parse_path(path)[0]
+
+        if not isinstance(key, int):
+            raise ValueError('Path %r must start with an element index' % (
+                path,))
+
+        last = max(last, key)
+
+    decoder = get_decoder(encoding, stream, strict=strict,
+        timezone_offset=timezone_offset, lazy=True)
+    elements = []
+
+    while len(elements) <= last and not decoder.stream.at_eof():
+        elements.append(decoder._skipLazyElement())
+
+    return extract_paths(elements, paths)
+
+
+def _get_scanner(encoding):
+    """
+    Returns the function that finds the end of the next element in a stream
+    of C{encoding} for L{IncrementalDecoder}.
+
+    @raise ValueError: AMF encoding version is unknown.
+    @since: 0.6
     """
-    return _get_decoder_class(encoding)(*args, **kwargs)
+    if encoding == AMF0:
+        from pyamf import amf0
+
+        return amf0._scan_element
+    elif encoding == AMF3:
+        from pyamf import amf3
+
+        return amf3._scan_element
+
+    raise ValueError("Unknown encoding %s" % (encoding,))
 
 
-def _get_decoder_class(encoding):
+def _get_decoder_class(encoding, use_ext=None):
     """
     Get compatible decoder.
 
     @type encoding: C{int}
     @param encoding: AMF encoding version.
+    @type use_ext: C{bool}
+    @param use_ext: Whether to prefer the compiled decoder. C{None} means use
+        L{USE_EXTENSIONS}.
     @raise ValueError: AMF encoding version is unknown.
 
-    @rtype: L{amf0.Decoder<pyamf.amf0.Decoder>} or
-    L{amf3.Decoder<pyamf.amf3.Decoder>}
+    @rtype: L{amf0.Decoder<pyamf.amf0.Decoder>},
+    L{amf3.Decoder<pyamf.amf3.Decoder>} or their compiled
+    L{cpyamf} counterparts
     @return: AMF0 or AMF3 decoder.
     """
+    if use_ext is None:
+        use_ext = USE_EXTENSIONS
+
     if encoding == AMF0:
         from pyamf import amf0
 
+        if use_ext:
+            try:
+                from cpyamf.amf0 import Decoder
+            except ImportError:
+                pass
+            else:
+                return Decoder
+
         return amf0.Decoder
     elif encoding == AMF3:
         from pyamf import amf3
 
+        if use_ext:
+            try:
+                from cpyamf.amf3 import Decoder
+            except ImportError:
+                pass
+            else:
+                return Decoder
+
         return amf3.Decoder
 
     raise ValueError("Unknown encoding %s" % (encoding,))
@@ -1360,30 +2621,57 @@ def _get_decoder_class(encoding):
 
 def get_encoder(encoding, *args, **kwargs):
     """
-    Returns a subclassed instance of L{pyamf.BaseEncoder}, based on C{encoding}
+    Returns an encoder instance based on C{encoding}. If the compiled
+    L{cpyamf} encoder is available it will be used unless C{use_ext} is
+    C{False} (see L{USE_EXTENSIONS}).
     """
-    return _get_encoder_class(encoding)(*args, **kwargs)
+    use_ext = kwargs.pop('use_ext', None)
 
+    return _get_encoder_class(encoding, use_ext)(*args, **kwargs)
 
-def _get_encoder_class(encoding):
+
+def _get_encoder_class(encoding, use_ext=None):
     """
     Get compatible encoder.
 
     @type encoding: C{int}
     @param encoding: AMF encoding version.
+    @type use_ext: C{bool}
+    @param use_ext: Whether to prefer the compiled encoder. C{None} means use
+        L{USE_EXTENSIONS}.
     @raise ValueError: AMF encoding version is unknown.
 
-    @rtype: L{amf0.Encoder<pyamf.amf0.Encoder>} or
-    L{amf3.Encoder<pyamf.amf3.Encoder>}
+    @rtype: L{amf0.Encoder<pyamf.amf0.Encoder>},
+    L{amf3.Encoder<pyamf.amf3.Encoder>} or their compiled
+    L{cpyamf} counterparts
     @return: AMF0 or AMF3 encoder.
     """
+    if use_ext is None:
+        use_ext = USE_EXTENSIONS
+
     if encoding == AMF0:
         from pyamf import amf0
 
+        if use_ext:
+            try:
+                from cpyamf.amf0 import Encoder
+            except ImportError:
+                pass
+            else:
+                return Encoder
+
         return amf0.Encoder
     elif encoding == AMF3:
         from pyamf import amf3
 
+        if use_ext:
+            try:
+                from cpyamf.amf3 import Encoder
+            except ImportError:
+                pass
+            else:
+                return Encoder
+
         return amf3.Encoder
 
     raise ValueError("Unknown encoding %s" % (encoding,))
@@ -1393,6 +2681,128 @@ def get_context(encoding, **kwargs):
     return _get_context_class(encoding)(**kwargs)
 
 
+class CodecPool(object):
+    """
+    A per thread pool of reusable encoders and decoders, together with their
+    contexts.
+
+    A codec taken from the pool is reset before it is handed out again.
+    Its context index tables, the AMF3 context and codecs attached to an AMF0
+    context, and its type caches are all reused, so they are not rebuilt for
+    every message. Return each codec with L{release} when it is finished.
+
+    >>> pool = pyamf.CodecPool()
+    >>> encoder = pool.getEncoder(pyamf.AMF0)
+    >>> try:
+    ...     encoder.writeElement('foo')
+    ...     data = encoder.stream.getvalue()
+    ... finally:
+    ...     pool.release(encoder)
+
+    @ivar max_size: The maximum number of idle codecs of each class that is
+        kept for each thread.
+    @type max_size: C{int}
+    @ivar use_ext: Whether to use the compiled codecs. C{None} means use
+        L{USE_EXTENSIONS}.
+    @since: 0.6
+    """
+
+    def __init__(self, max_size=4, use_ext=None):
+        self.max_size = max_size
+        self.use_ext = use_ext
+
+        self._local = threading.local()
+
+    def _getIdle(self, klass):
+        """
+        Returns the list of idle codecs of class C{klass} for this thread.
+        """
+        try:
+            pools = self._local.pools
+        except AttributeError:
+            pools = self._local.pools = {}
+
+        try:
+            return pools[klass]
+        except KeyError:
+            idle = pools[klass] = []
+
+            return idle
+
+    def _setStream(self, codec, stream):
+        """
+        Points C{codec}, and any AMF3 codec attached to its context, at
+        C{stream}.
+        """
+        codec.stream = stream
+
+        for name in ('amf3_encoder', 'amf3_decoder'):
+            sub = getattr(codec.context, name, None)
+
+            if sub is not None:
+                sub.stream = stream
+
+    def _get(self, klass, stream, strict, timezone_offset):
+        idle = self._getIdle(klass)
+
+        if not idle:
+            return klass(stream, strict=strict, timezone_offset=timezone_offset)
+
+        codec = idle.pop()
+
+        if not isinstance(stream, util.BufferedByteStream):
+            stream = util.BufferedByteStream(stream)
+
+        self._setStream(codec, stream)
+        codec.strict = strict
+        codec.timezone_offset = timezone_offset
+
+        return codec
+
+    def getEncoder(self, encoding, stream=None, strict=False,
+                   timezone_offset=None):
+        """
+        Returns an encoder for C{encoding} with a cleared context, reusing an
+        idle one if this thread has one.
+
+        @see: L{get_encoder}
+        """
+        encoder = self._get(_get_encoder_class(encoding, self.use_ext),
+            stream, strict, timezone_offset)
+
+        if encoding == AMF0:
+            encoder.use_amf3 = False
+
+        return encoder
+
+    def getDecoder(self, encoding, stream=None, strict=False,
+                   timezone_offset=None):
+        """
+        Returns a decoder for C{encoding} with a cleared context, reusing an
+        idle one if this thread has one.
+
+        @see: L{get_decoder}
+        """
+        return self._get(_get_decoder_class(encoding, self.use_ext),
+            stream, strict, timezone_offset)
+
+    def release(self, codec):
+        """
+        Returns C{codec} to the pool. Its context is cleared and its stream
+        dropped, so neither is kept alive by the pool. The codec must not be
+        used by the caller afterwards.
+        """
+        idle = self._getIdle(codec.__class__)
+
+        if len(idle) >= self.max_size:
+            return
+
+        codec.context.clear()
+        self._setStream(codec, None)
+
+        idle.append(codec)
+
+
 def _get_context_class(encoding):
     """
     Gets a compatible context class.
@@ -1482,6 +2892,8 @@ def add_type(type_, func=None):
 
     TYPE_MAP[type_] = func
 
+    _invalidate_dispatch_cache()
+
 
 def get_type(type_):
     """
@@ -1509,6 +2921,8 @@ def remove_type(type_):
 
     del TYPE_MAP[type_]
 
+    _invalidate_dispatch_cache()
+
     return declaration
 
 
@@ -1620,6 +3034,8 @@ def register_alias_type(klass, *args):
 
     ALIAS_TYPES[klass] = args
 
+    _invalidate_alias_cache()
+
 
 def unregister_alias_type(klass):
     """
@@ -1627,7 +3043,11 @@ def unregister_alias_type(klass):
 
     @see: L{register_alias_type}
     """
-    return ALIAS_TYPES.pop(klass, None)
+    ret = ALIAS_TYPES.pop(klass, None)
+
+    _invalidate_alias_cache()
+
+    return ret
 
 
 def register_package(module=None, package=None, separator='.', ignore=[], strict=True):
@@ -1768,5 +3188,6 @@ register_class_loader(flex_loader)
 register_class_loader(blaze_loader)
 register_alias_type(TypedObjectClassAlias, TypedObject)
 register_alias_type(ErrorAlias, Exception)
+add_type(LazyObject, materialize)
 
 register_adapters()
@@ -4,8 +4,9 @@
 """
 `array` adapter module.
 
-Will convert all array.array instances to a python list before encoding. All
-type information is lost (but degrades nicely).
+Will convert array.array instances to a python list before encoding. All
+type information is lost (but degrades nicely). Numeric arrays, including the
+AMF3 vector types (e.g. `amf3.IntVector`), are left to the encoders.
 
 @since: 0.5
 """
@@ -16,5 +17,18 @@ import pyamf
 from pyamf.adapters import util
 
 
+def is_plain_array(obj):
+    """
+    Returns whether C{obj} is an C{array.array} that the encoders do not
+    handle themselves, i.e. one of characters.
+
+    @since: 0.6
+    """
+    from pyamf import amf3
+
+    return isinstance(obj, array.ArrayType) and \
+        obj.typecode not in amf3.VECTOR_TYPECODES
+
+
 if hasattr(array, 'array'):
-    pyamf.add_type(array.ArrayType, util.to_list)
+    pyamf.add_type(is_plain_array, util.to_list)
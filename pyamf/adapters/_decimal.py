@@ -18,15 +18,14 @@ def convert_Decimal(x, encoder):
     an AMF stream.
 
     @param x: The L{decimal.Decimal} instance to encode.
-    @param encoder: The L{pyamf.BaseEncoder} instance about to perform the
-        operation.
+    @param encoder: The encoder instance (L{pyamf.BaseEncoder} or one of the
+        compiled L{cpyamf} encoders) about to perform the operation.
     @return: If the encoder is in 'strict' mode then C{x} will be converted to
         a float. Otherwise an L{pyamf.EncodeError} with a friendly message is
         raised.
     """
-    if encoder is not None and isinstance(encoder, pyamf.BaseEncoder):
-        if encoder.strict is False:
-            return float(x)
+    if encoder is not None and getattr(encoder, 'strict', None) is False:
+        return float(x)
 
     raise pyamf.EncodeError('Unable to encode decimal.Decimal instances as '
         'there is no way to guarantee exact conversion. Use strict=False to '
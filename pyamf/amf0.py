@@ -21,6 +21,8 @@ LocalConnection, SharedObjects and other classes in the Adobe Flash Player.
 import datetime
 import types
 import copy
+import array
+import struct
 
 import pyamf
 from pyamf import util
@@ -96,6 +98,11 @@ TYPE_TYPEDOBJECT = '\x10'
 #: reaches it’s logical conclusion (for example, an object has no more keys).
 TYPE_AMF3        = '\x11'
 
+#: If True decode objects to L{pyamf.LazyObject}s, see L{Decoder}.
+#:
+#: @since: 0.6
+lazy_default = False
+
 
 class Context(pyamf.BaseContext):
     """
@@ -103,10 +110,9 @@ class Context(pyamf.BaseContext):
 
     AMF0 object references start at index 1.
 
-    :IVariables:
-      amf3_objs : `util.IndexedCollection`
-        A list of objects that have been decoded in
-        `AMF3 <pyamf.amf3>`_
+    @ivar amf3_objs: A list of objects that have been decoded in
+        L{AMF3<pyamf.amf3>}.
+    @type amf3_objs: C{list}
     """
 
     def __init__(self, **kwargs):
@@ -143,6 +149,57 @@ class Context(pyamf.BaseContext):
         """
         return self.amf3_objs.append(obj)
 
+    def addRawAMF(self, raw):
+        """
+        Reserves the references that C{raw} creates when it is decoded. AMF3
+        fragments only touch the embedded AMF3 context.
+
+        @since: 0.6
+        """
+        if raw.encoding == pyamf.AMF0:
+            pyamf.BaseContext.addRawAMF(self, raw)
+
+            return
+
+        if not hasattr(self, 'amf3_context'):
+            self.amf3_context = pyamf.get_context(pyamf.AMF3)
+
+        self.amf3_context.addRawAMF(raw)
+
+    def checkpoint(self):
+        """
+        Returns a marker of the AMF0 and embedded AMF3 references held by this
+        context.
+
+        @since: 0.6
+        """
+        amf3_context = getattr(self, 'amf3_context', None)
+
+        if amf3_context is not None:
+            amf3_context = amf3_context.checkpoint()
+
+        return (pyamf.BaseContext.checkpoint(self), len(self.amf3_objs),
+            amf3_context)
+
+    def rollback(self, checkpoint):
+        """
+        Discards all references created since C{checkpoint} was taken.
+
+        @since: 0.6
+        """
+        objects, amf3_objs, amf3_context = checkpoint
+
+        pyamf.BaseContext.rollback(self, objects)
+        del self.amf3_objs[amf3_objs:]
+
+        if not hasattr(self, 'amf3_context'):
+            return
+
+        if amf3_context is None:
+            self.amf3_context.clear()
+        else:
+            self.amf3_context.rollback(amf3_context)
+
     def __copy__(self):
         cpy = self.__class__()
         cpy.amf3_objs = copy.copy(self.amf3_objs)
@@ -150,12 +207,43 @@ class Context(pyamf.BaseContext):
         return cpy
 
 
+class _RawContext(Context):
+    """
+    Never hands out a reference so that everything encoded against it is self
+    contained, see L{pyamf.pre_encode}.
+
+    @since: 0.6
+    """
+
+    def getObjectReference(self, obj):
+        return None
+
+
+class _LazyContext(Context):
+    """
+    Decodes a member of a L{pyamf.LazyObject} against the object references
+    of the original stream.
+
+    @since: 0.6
+    """
+
+    def __init__(self, state, ref):
+        Context.__init__(self)
+
+        self.objects = pyamf._LazyReferences(state.objects, ref)
+
+
 class Decoder(pyamf.BaseDecoder):
     """
     Decodes an AMF0 stream.
+
+    If C{lazy} is set (defaults to L{lazy_default}) anonymous and typed
+    objects are decoded to L{pyamf.LazyObject}s, which decode their members
+    on first access.
     """
 
     context_class = Context
+    lazy_context_class = _LazyContext
 
     # XXX nick: Do we need to support TYPE_MOVIECLIP here?
     type_map = {
@@ -177,6 +265,15 @@ class Decoder(pyamf.BaseDecoder):
         TYPE_AMF3:       'readAMF3'
     }
 
+    def __init__(self, *args, **kwargs):
+        self.lazy = kwargs.pop('lazy', lazy_default)
+
+        pyamf.BaseDecoder.__init__(self, *args, **kwargs)
+
+    def _getLazyDecoder(self, stream, context):
+        return self.__class__(stream, context, strict=self.strict,
+            timezone_offset=self.timezone_offset, lazy=self.lazy)
+
     def readNumber(self):
         """
         Reads a ActionScript C{Number} value.
@@ -269,12 +366,19 @@ class Decoder(pyamf.BaseDecoder):
 
         try:
             alias = pyamf.get_class_alias(classname)
-
-            ret = alias.createInstance(codec=self)
         except pyamf.UnknownClassAlias:
             if self.strict:
                 raise
 
+        if self._isLazy(alias):
+            ret = self._readLazyTypedObject(classname, alias)
+
+            if ret is not None:
+                return ret
+
+        if alias is not None:
+            ret = alias.createInstance(codec=self)
+        else:
             ret = pyamf.TypedObject(classname)
 
         self.context.addObject(ret)
@@ -289,14 +393,7 @@ class Decoder(pyamf.BaseDecoder):
         @rtype: C{mixed}
         @return: The AMF3 element read from the stream
         """
-        if not hasattr(self.context, 'amf3_context'):
-            self.context.amf3_context = pyamf.get_context(pyamf.AMF3)
-
-        if not hasattr(self.context, 'amf3_decoder'):
-            self.context.amf3_decoder = pyamf.get_decoder(
-                pyamf.AMF3, self.stream, self.context.amf3_context)
-
-        decoder = self.context.amf3_decoder
+        decoder = self._getAMF3Decoder()
         element = decoder.readElement()
         self.context.addAMF3Object(element)
 
@@ -335,6 +432,13 @@ class Decoder(pyamf.BaseDecoder):
 
         @rtype: L{ASObject<pyamf.ASObject>}
         """
+        if self._isLazy(None):
+            obj = pyamf.BaseDecoder._readLazyObject(self, pyamf.ASObject,
+                util.set_attrs)
+
+            if obj is not None:
+                return obj
+
         obj = pyamf.ASObject()
         self.context.addObject(obj)
 
@@ -342,6 +446,124 @@ class Decoder(pyamf.BaseDecoder):
 
         return obj
 
+    def _getAMF3Decoder(self, **kwargs):
+        """
+        Returns the AMF3 decoder used by L{readAMF3}, creating it if necessary
+        with C{kwargs}.
+        """
+        if not hasattr(self.context, 'amf3_context'):
+            self.context.amf3_context = pyamf.get_context(pyamf.AMF3)
+
+        if not hasattr(self.context, 'amf3_decoder'):
+            if self.lazy:
+                kwargs.setdefault('lazy', True)
+
+            self.context.amf3_decoder = pyamf.get_decoder(
+                pyamf.AMF3, self.stream, self.context.amf3_context, **kwargs)
+
+        return self.context.amf3_decoder
+
+    def _skipLazyElement(self):
+        """
+        Skips over the next element, handing embedded AMF3 data to the AMF3
+        decoder.
+        """
+        if self.stream.peek() != TYPE_AMF3:
+            return pyamf.BaseDecoder._skipLazyElement(self)
+
+        decoder = self._getAMF3Decoder(lazy=True)
+
+        if not hasattr(decoder, '_skipLazyElement'):
+            # a compiled decoder is already in use
+            return pyamf.BaseDecoder._skipLazyElement(self)
+
+        self.stream.read(1)
+
+        return decoder._skipLazyElement()
+
+    def _readLazyTypedObject(self, classname, alias):
+        """
+        Reads a typed object into a L{pyamf.LazyObject}.
+        """
+        def create():
+            if alias is None:
+                return pyamf.TypedObject(classname)
+
+            return alias.createInstance(codec=self)
+
+        def apply(obj, attrs):
+            if alias is None:
+                util.set_attrs(obj, attrs)
+            else:
+                alias.applyAttributes(obj, attrs, codec=self)
+
+        return pyamf.BaseDecoder._readLazyObject(self, create, apply)
+
+    def _skipLazyMembers(self, obj):
+        key = self.readString().encode('utf8')
+
+        while self.stream.peek() != TYPE_OBJECTTERM:
+            self._skipLazyMember(obj, key)
+            key = self.readString().encode('utf8')
+
+        # discard the end marker (TYPE_OBJECTTERM)
+        self.stream.read(1)
+
+    def _skipElement(self):
+        """
+        Skips over the next element in the stream, creating the object
+        references that decoding it would with placeholders that decode the
+        current L{pyamf.LazyObject} member when they are needed.
+
+        @raise pyamf._SkipError: The element is (or contains) AMF3 data.
+        """
+        t = self.stream.read(1)
+
+        if t == TYPE_NUMBER:
+            self._skipBytes(8)
+        elif t == TYPE_BOOL:
+            self._skipBytes(1)
+        elif t == TYPE_STRING:
+            self._skipBytes(self.stream.read_ushort())
+        elif t in (TYPE_LONGSTRING, TYPE_XML):
+            self._skipBytes(self.stream.read_ulong())
+
+            if t == TYPE_XML:
+                self._addLazySlot()
+        elif t in (TYPE_NULL, TYPE_UNDEFINED, TYPE_UNSUPPORTED):
+            pass
+        elif t == TYPE_REFERENCE:
+            self._skipBytes(2)
+        elif t == TYPE_DATE:
+            self._skipBytes(10)
+            self._addLazySlot()
+        elif t == TYPE_ARRAY:
+            self._addLazySlot()
+
+            for i in xrange(self.stream.read_ulong()):
+                self._skipElement()
+        elif t in (TYPE_OBJECT, TYPE_MIXEDARRAY, TYPE_TYPEDOBJECT):
+            if t == TYPE_MIXEDARRAY:
+                self._skipBytes(4)
+            elif t == TYPE_TYPEDOBJECT:
+                classname = self.readString()
+
+                if self.strict:
+                    pyamf.get_class_alias(classname)
+
+            self._addLazySlot()
+            self._skipBytes(self.stream.read_ushort())
+
+            while self.stream.peek() != TYPE_OBJECTTERM:
+                self._skipElement()
+                self._skipBytes(self.stream.read_ushort())
+
+            self.stream.read(1)
+        elif t == TYPE_AMF3:
+            raise pyamf._SkipError
+        else:
+            raise pyamf.DecodeError("Unsupported ActionScript type %r" % (t,))
+
     def readReference(self):
         """
         Reads a reference from the data stream.
@@ -401,6 +623,20 @@ class Decoder(pyamf.BaseDecoder):
         return xml
 
 
+def _is_dictionary(obj):
+    from pyamf import amf3
+
+    return isinstance(obj, amf3.Dictionary)
+
+
+def _has_string_keys(d):
+    for key in d:
+        if not isinstance(key, basestring):
+            return False
+
+    return True
+
+
 class Encoder(pyamf.BaseEncoder):
     """
     Encodes an AMF0 stream.
@@ -421,14 +657,18 @@ class Encoder(pyamf.BaseEncoder):
         ((types.StringTypes,), "writeString"),
         ((pyamf.ASObject,), "writeObject"),
         ((pyamf.MixedArray,), "writeMixedArray"),
-        ((types.ListType, types.TupleType,), "writeArray"),
+        ((types.ListType, types.TupleType, array.ArrayType), "writeArray"),
         ((datetime.date, datetime.datetime, datetime.time), "writeDate"),
         ((util.is_ET_element,), "writeXML"),
         ((lambda x: x is pyamf.Undefined,), "writeUndefined"),
+        ((pyamf.RawAMF,), "writeRawAMF"),
         ((types.ClassType, types.TypeType), "writeClass"),
+        ((_is_dictionary,), "writeDictionary"),
         ((types.InstanceType,types.ObjectType,), "writeObject"),
     ]
 
+    raw_context_class = _RawContext
+
     def __init__(self, *args, **kwargs):
         self.use_amf3 = kwargs.pop('use_amf3', False)
 
@@ -461,6 +701,20 @@ class Encoder(pyamf.BaseEncoder):
         """
         raise pyamf.EncodeError("Class objects cannot be serialised")
 
+    def writeRawAMF(self, raw):
+        """
+        Writes a pre-encoded element to the stream, AMF3 fragments are
+        preceded by L{TYPE_AMF3}.
+
+        @type raw: L{pyamf.RawAMF}
+        @since: 0.6
+        """
+        if raw.encoding == pyamf.AMF3:
+            self.writeType(TYPE_AMF3)
+
+        self.stream.write(raw.data)
+        self.context.addRawAMF(raw)
+
     def writeFunc(self, *args, **kwargs):
         """
         Functions cannot be serialised.
@@ -666,6 +920,22 @@ class Encoder(pyamf.BaseEncoder):
         self.stream.write('\x00\x00')
         self.writeType(TYPE_OBJECTTERM)
 
+    def writeDictionary(self, d):
+        """
+        Writes an L{amf3.Dictionary<pyamf.amf3.Dictionary>}, which has no
+        AMF0 type. If all the keys are strings it is written as a mixed
+        array, otherwise it is written in L{AMF3<pyamf.amf3>}.
+
+        @type d: L{amf3.Dictionary<pyamf.amf3.Dictionary>}
+        @since: 0.6
+        """
+        if self.use_amf3 or not _has_string_keys(d):
+            self.writeAMF3(d)
+
+            return
+
+        self.writeMixedArray(d)
+
     def writeObject(self, o):
         """
         Write object to the stream.
@@ -697,6 +967,18 @@ class Encoder(pyamf.BaseEncoder):
             self.writeType(TYPE_TYPEDOBJECT)
             self.writeString(alias.alias, False)
 
+        if alias.encode_attrs is not None:
+            # a sealed class, the static attributes come first
+            values = alias.getEncodableValues(o)
+
+            for key, value in zip(alias.encode_attrs, values):
+                self.writeString(key, False)
+                self.writeElement(value)
+
+            self._writeEndObject()
+
+            return
+
         attrs = alias.getEncodableAttributes(o, codec=self)
 
         if alias.static_attrs and attrs:
@@ -776,6 +1058,133 @@ class Encoder(pyamf.BaseEncoder):
         encoder.writeElement(data)
 
 
+def _scan_element(stream, context=None):
+    """
+    Finds the end of the next element in C{stream} without decoding it, so
+    that L{IncrementalDecoder} only decodes an element once all of it has
+    arrived.
+
+    This is a generator that behaves like
+    L{amf3._scan_element<pyamf.amf3._scan_element>}.
+
+    @param context: The L{Context} the element will be decoded with.
+    @raise pyamf._SkipError: The element can only be measured by decoding
+        it.
+    @since: 0.6
+    """
+    from pyamf import amf3
+
+    scan_more = amf3._scan_more
+    amf3_context = getattr(context, 'amf3_context', None)
+    traits = []
+
+    buf = stream.read(stream.remaining())
+    i = 0
+
+    # the number of elements left to skip in each container being scanned,
+    # None for the members of an object
+    stack = [1]
+
+    while stack:
+        if stack[-1] is None:
+            # the name and the byte after it
+            while len(buf) < i + 3:
+                yield None
+                buf, i = scan_more(stream, buf, i)
+
+            i += 2 + struct.unpack('>H', buf[i:i + 2])[0]
+
+            while len(buf) <= i:
+                yield None
+                buf, i = scan_more(stream, buf, i)
+
+            if buf[i] == TYPE_OBJECTTERM:
+                i += 1
+                stack.pop()
+            else:
+                stack.append(1)
+
+            continue
+
+        if stack[-1] == 0:
+            stack.pop()
+
+            continue
+
+        stack[-1] -= 1
+
+        while len(buf) <= i:
+            yield None
+            buf, i = scan_more(stream, buf, i)
+
+        t = buf[i]
+        i += 1
+
+        if t == TYPE_NUMBER:
+            i += 8
+        elif t == TYPE_BOOL:
+            i += 1
+        elif t in (TYPE_STRING, TYPE_TYPEDOBJECT):
+            while len(buf) < i + 2:
+                yield None
+                buf, i = scan_more(stream, buf, i)
+
+            i += 2 + struct.unpack('>H', buf[i:i + 2])[0]
+
+            if t == TYPE_TYPEDOBJECT:
+                stack.append(None)
+        elif t in (TYPE_LONGSTRING, TYPE_XML, TYPE_ARRAY):
+            while len(buf) < i + 4:
+                yield None
+                buf, i = scan_more(stream, buf, i)
+
+            size = struct.unpack('>L', buf[i:i + 4])[0]
+            i += 4
+
+            if t == TYPE_ARRAY:
+                stack.append(size)
+            else:
+                i += size
+        elif t in (TYPE_NULL, TYPE_UNDEFINED, TYPE_UNSUPPORTED):
+            pass
+        elif t == TYPE_REFERENCE:
+            i += 2
+        elif t == TYPE_DATE:
+            i += 10
+        elif t in (TYPE_OBJECT, TYPE_MIXEDARRAY):
+            if t == TYPE_MIXEDARRAY:
+                i += 4
+
+            stack.append(None)
+        elif t == TYPE_AMF3:
+            stream.seek(i - len(buf), 1)
+
+            for x in amf3._scan_element(stream, amf3_context, traits):
+                yield None
+
+            buf = stream.read(stream.remaining())
+            i = 0
+        else:
+            raise pyamf._SkipError
+
+    while len(buf) < i:
+        yield None
+        buf, i = scan_more(stream, buf, i)
+
+    stream.seek(i - len(buf), 1)
+
+
+class IncrementalDecoder(pyamf.IncrementalDecoder):
+    """
+    Decodes an AMF0 stream that arrives in chunks.
+
+    @see: L{pyamf.IncrementalDecoder}
+    @since: 0.6
+    """
+
+    encoding = pyamf.AMF0
+
+
 def decode(*args, **kwargs):
     """
     A helper function to decode an AMF0 datastream.
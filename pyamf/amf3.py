@@ -23,9 +23,12 @@ L{ByteArray} and L{ArrayCollection}.
 @since: 0.1
 """
 
+import sys
+import array
 import types
 import datetime
 import zlib
+import UserDict
 
 import pyamf
 from pyamf import util, flex
@@ -34,6 +37,19 @@ from pyamf import util, flex
 #: and dicts to L{ObjectProxy}
 use_proxies_default = False
 
+#: If True decode dense arrays that only contain numbers to C{array.array}
+#: instances, see L{Decoder.typed_arrays}.
+#: @since: 0.6
+typed_arrays_default = False
+
+#: If True decode objects to L{pyamf.LazyObject}s, see L{Decoder.lazy}.
+#: @since: 0.6
+lazy_default = False
+
+#: The maximum number of L{DecodePlan}s kept by L{get_decode_plan}.
+#: @since: 0.6
+MAX_DECODE_PLANS = 1024
+
 try:
     set()
 except NameError:
@@ -106,6 +122,29 @@ TYPE_XMLSTRING = '\x0B'
 #: @see: U{Parsing ByteArrays on OSFlash (external)
 #: <http://osflash.org/documentation/amf3/parsing_byte_arrays>}
 TYPE_BYTEARRAY = '\x0C'
+#: A C{Vector.<int>}, a dense list of signed 32 bit integers written as a
+#: contiguous block in network byte order.
+#: @see: L{IntVector}
+#: @since: 0.6
+TYPE_INT_VECTOR = '\x0D'
+#: A C{Vector.<uint>}, as L{TYPE_INT_VECTOR} but unsigned.
+#: @see: L{UintVector}
+#: @since: 0.6
+TYPE_UINT_VECTOR = '\x0E'
+#: A C{Vector.<Number>}, a dense list of 8 byte IEEE-754 doubles written as a
+#: contiguous block in network byte order.
+#: @see: L{NumberVector}
+#: @since: 0.6
+TYPE_NUMBER_VECTOR = '\x0F'
+#: A C{Vector.<Object>}, a dense list of AMF3 values of the same class.
+#: @see: L{ObjectVector}
+#: @since: 0.6
+TYPE_OBJECT_VECTOR = '\x10'
+#: An ActionScript C{flash.utils.Dictionary}, a map whose keys can be any
+#: AMF3 value.
+#: @see: L{Dictionary}
+#: @since: 0.6
+TYPE_DICTIONARY = '\x11'
 
 #: Reference bit.
 REFERENCE_BIT = 0x01
@@ -334,9 +373,10 @@ class DataInput(object):
     def __init__(self, decoder=None):
         """
         @param decoder: AMF3 decoder containing the stream.
-        @type decoder: L{amf3.Decoder<pyamf.amf3.Decoder>}
+        @type decoder: L{amf3.Decoder<pyamf.amf3.Decoder>} or
+            L{cpyamf.amf3.Decoder<cpyamf.amf3.Decoder>}
         """
-        assert isinstance(decoder, Decoder)
+        assert hasattr(decoder, 'readElement')
 
         self.decoder = decoder
         self.stream = decoder.stream
@@ -549,6 +589,195 @@ class ByteArray(util.BufferedByteStream, DataInput, DataOutput):
         self.compressed = True
 
 
+class _NumericVector(array.array):
+    """
+    Base class for the numeric vector types. The values are held in an
+    C{array.array} so that they can be read and written as a single block.
+
+    @ivar fixed: Whether the length of the vector is fixed.
+    @type fixed: C{bool}
+    @since: 0.6
+    """
+
+    typecode_ = None
+
+    def __new__(cls, data=(), fixed=False):
+        obj = array.array.__new__(cls, cls.typecode_, data)
+        obj.fixed = fixed
+
+        return obj
+
+    def __reduce__(self):
+        return (self.__class__, (self.tolist(), self.fixed))
+
+
+class IntVector(_NumericVector):
+    """
+    An ActionScript C{Vector.<int>}.
+
+    @since: 0.6
+    """
+
+    typecode_ = 'i'
+
+
+class UintVector(_NumericVector):
+    """
+    An ActionScript C{Vector.<uint>}.
+
+    @since: 0.6
+    """
+
+    typecode_ = 'I'
+
+
+class NumberVector(_NumericVector):
+    """
+    An ActionScript C{Vector.<Number>}.
+
+    @since: 0.6
+    """
+
+    typecode_ = 'd'
+
+
+class ObjectVector(list):
+    """
+    An ActionScript C{Vector.<Object>}, or a vector of any other class.
+
+    @ivar fixed: Whether the length of the vector is fixed.
+    @type fixed: C{bool}
+    @ivar classname: The alias of the class of the items, as sent by the
+        player. C{'*'} is used for an untyped C{Vector.<*>}.
+    @type classname: C{unicode}
+    @since: 0.6
+    """
+
+    def __init__(self, data=(), fixed=False, classname=u''):
+        list.__init__(self, data)
+
+        self.fixed = fixed
+        self.classname = classname
+
+
+class _IdentityKey(object):
+    """
+    Wraps an unhashable L{Dictionary} key so that it is stored by identity, as
+    ActionScript does for object keys.
+    """
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class Dictionary(UserDict.DictMixin, object):
+    """
+    An ActionScript C{flash.utils.Dictionary}.
+
+    Keys are not limited to strings. Hashable keys (numbers, strings, class
+    instances) behave as they do in a C{dict}. Unhashable keys, such as a
+    decoded anonymous object (a L{pyamf.ASObject}), are compared by identity.
+
+    @ivar weak_keys: Whether the dictionary holds weak references to its keys
+        in the player. The flag is only kept so it can be sent back, the keys
+        are held strongly.
+    @type weak_keys: C{bool}
+    @since: 0.6
+    """
+
+    def __init__(self, data=None, weak_keys=False):
+        self.weak_keys = weak_keys
+        self._items = {}
+
+        if data is not None:
+            self.update(data)
+
+    def _key(self, key):
+        try:
+            hash(key)
+        except TypeError:
+            return _IdentityKey(key)
+
+        return key
+
+    def __getitem__(self, key):
+        return self._items[self._key(key)][1]
+
+    def __setitem__(self, key, value):
+        self._items[self._key(key)] = (key, value)
+
+    def __delitem__(self, key):
+        del self._items[self._key(key)]
+
+    def __contains__(self, key):
+        return self._key(key) in self._items
+
+    def __iter__(self):
+        for key, value in self._items.itervalues():
+            yield key
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return [key for key, value in self._items.itervalues()]
+
+    def iteritems(self):
+        return self._items.itervalues()
+
+    def items(self):
+        return self._items.values()
+
+    def __eq__(self, other):
+        if not hasattr(other, 'iteritems') or len(self) != len(other):
+            return False
+
+        for key, value in self.iteritems():
+            try:
+                if other[key] != value:
+                    return False
+            except (KeyError, TypeError):
+                return False
+
+        return True
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return '<%s %r>' % (self.__class__.__name__, self.items())
+
+
+#: Maps an C{array.array} typecode to the vector type marker used to encode
+#: it and the typecode of the values on the wire.
+#: @since: 0.6
+VECTOR_TYPECODES = {
+    'b': (TYPE_INT_VECTOR, 'i'),
+    'h': (TYPE_INT_VECTOR, 'i'),
+    'i': (TYPE_INT_VECTOR, 'i'),
+    'l': (TYPE_INT_VECTOR, 'i'),
+    'B': (TYPE_UINT_VECTOR, 'I'),
+    'H': (TYPE_UINT_VECTOR, 'I'),
+    'I': (TYPE_UINT_VECTOR, 'I'),
+    'L': (TYPE_UINT_VECTOR, 'I'),
+    'f': (TYPE_NUMBER_VECTOR, 'd'),
+    'd': (TYPE_NUMBER_VECTOR, 'd'),
+}
+
+_swap_vectors = sys.byteorder == 'little'
+
+
 class ClassDefinition(object):
     """
     """
@@ -556,6 +785,7 @@ class ClassDefinition(object):
     def __init__(self, alias):
         self.alias = alias
         self.reference = None
+        self.plan = None
 
         alias.compile()
 
@@ -577,6 +807,157 @@ class ClassDefinition(object):
             self.__class__.__module__, self.reference, self.encoding, self.alias, id(self))
 
 
+class DecodePlan(object):
+    """
+    A precompiled recipe for applying the decoded attributes of objects that
+    share a trait - the class name, encoding and static property names read
+    from the stream. Plans are shared between decoders, see
+    L{get_decode_plan}.
+
+    @ivar alias: The L{ClassAlias<pyamf.ClassAlias>} the trait resolves to.
+    @ivar encoding: The L{ObjectEncoding} of the trait.
+    @ivar static_properties: The static property names of the trait.
+    @type static_properties: C{list}
+    @ivar trait: The C{(name, encoding, static_properties)} the trait was
+        read as, set by L{get_decode_plan}.
+    @type trait: C{tuple}
+    @since: 0.6
+    """
+
+    # how the attributes are applied to an object
+    APPLY_ALIAS = 0
+    APPLY_UPDATE = 1
+    APPLY_DICT = 2
+    APPLY_SET = 3
+    APPLY_FILTER = 4
+
+    def __init__(self, alias, encoding, static_properties, name=None,
+                 loaders=None):
+        self.alias = alias
+        self.encoding = encoding
+        self.static_properties = list(static_properties)
+        self.trait = None
+
+        # the CLASS_CACHE key the alias was found under and, for unresolved
+        # class names, the class loaders that were tried
+        self._name = name
+        self._loaders = loaders
+
+        self._compile()
+
+    def _compile(self):
+        alias = self.alias
+
+        alias.compile()
+
+        self._strategy = self.APPLY_ALIAS
+
+        func = getattr(alias.applyAttributes, 'im_func', None)
+
+        if func is not pyamf.ClassAlias.applyAttributes.im_func:
+            return
+
+        if alias.shortcut_decode:
+            if alias.is_dict:
+                self._strategy = self.APPLY_UPDATE
+            elif not alias.sealed:
+                self._strategy = self.APPLY_DICT
+            else:
+                self._strategy = self.APPLY_SET
+
+            return
+
+        func = getattr(alias.getDecodableAttributes, 'im_func', None)
+
+        if func is not pyamf.ClassAlias.getDecodableAttributes.im_func:
+            return
+
+        if alias.proxy_attrs is not None:
+            return
+
+        if alias.static_attrs:
+            for attr in alias.static_attrs:
+                if attr not in self.static_properties:
+                    # let the alias raise the error
+                    return
+
+        self._denied = set()
+        self._allowed = None
+
+        if alias.readonly_attrs:
+            self._denied.update(alias.readonly_attrs)
+
+        if alias.exclude_attrs:
+            self._denied.update(alias.exclude_attrs)
+
+        if not alias.dynamic:
+            self._allowed = set(alias.decodable_properties or [])
+            self._allowed.difference_update(self._denied)
+
+        self._keys = [attr for attr in self.static_properties
+            if self._isAllowed(attr)]
+
+        self._strategy = self.APPLY_FILTER
+
+    def _isAllowed(self, attr):
+        if self._allowed is not None:
+            return attr in self._allowed
+
+        return attr not in self._denied
+
+    def isValid(self, strict=False):
+        """
+        Whether the plan still reflects the registered classes and class
+        loaders.
+        """
+        if self._loaders is None:
+            return pyamf.CLASS_CACHE.get(self._name, None) is self.alias
+
+        if strict:
+            return False
+
+        return self._name not in pyamf.CLASS_CACHE and \
+            self._loaders == pyamf.CLASS_LOADERS
+
+    def getClassDefinition(self):
+        """
+        Returns a new L{ClassDefinition} for this trait, to be added to the
+        context of a decoder.
+        """
+        class_def = ClassDefinition(self.alias)
+
+        class_def.encoding = self.encoding
+        class_def.attr_len = len(self.static_properties)
+        class_def.static_properties = self.static_properties
+        class_def.plan = self
+
+        return class_def
+
+    def applyAttributes(self, obj, attrs, codec=None):
+        """
+        Applies the decoded C{attrs} to C{obj}. Equivalent to
+        L{ClassAlias.applyAttributes<pyamf.ClassAlias.applyAttributes>}.
+        """
+        strategy = self._strategy
+
+        if strategy == self.APPLY_FILTER:
+            if self.encoding == ObjectEncoding.STATIC:
+                attrs = dict([(k, attrs[k]) for k in self._keys])
+            else:
+                attrs = dict([(k, v) for k, v in attrs.iteritems()
+                    if self._isAllowed(k)])
+
+            util.set_attrs(obj, attrs)
+        elif strategy == self.APPLY_DICT:
+            obj.__dict__.update(attrs)
+        elif strategy == self.APPLY_UPDATE:
+            obj.update(attrs)
+        elif strategy == self.APPLY_SET:
+            util.set_attrs(obj, attrs)
+        else:
+            self.alias.applyAttributes(obj, attrs, codec=codec)
+
+
 class Context(pyamf.BaseContext):
     """
     I hold the AMF3 context for en/decoding streams.
@@ -731,15 +1112,115 @@ class Context(pyamf.BaseContext):
         """
         return self.legacy_xml.append(doc)
 
+    def addRawAMF(self, raw):
+        """
+        Reserves the object, string and class references that C{raw} creates
+        when it is decoded.
+
+        @type raw: L{pyamf.RawAMF}
+        @since: 0.6
+        """
+        pyamf.BaseContext.addRawAMF(self, raw)
+
+        for i in xrange(raw.strings):
+            self.strings.append(object())
+
+        for i in xrange(raw.classes):
+            self.class_ref[self.class_idx] = None
+            self.class_idx += 1
+
+    def checkpoint(self):
+        """
+        Returns a marker of the object, string, class and legacy XML
+        references held by this context.
+
+        @since: 0.6
+        """
+        return (pyamf.BaseContext.checkpoint(self), len(self.strings),
+            len(self.legacy_xml), self.class_idx)
+
+    def rollback(self, checkpoint):
+        """
+        Discards all references created since C{checkpoint} was taken.
+
+        @since: 0.6
+        """
+        objects, strings, legacy_xml, class_idx = checkpoint
+
+        pyamf.BaseContext.rollback(self, objects)
+        self.strings.truncate(strings)
+        self.legacy_xml.truncate(legacy_xml)
+
+        for ref in range(class_idx, self.class_idx):
+            class_def = self.class_ref.pop(ref, None)
+
+            for klass, cd in self.classes.items():
+                if cd is class_def:
+                    del self.classes[klass]
+
+        self.class_idx = class_idx
+
     def __copy__(self):
         return self.__class__()
 
 
+class _RawContext(Context):
+    """
+    Never hands out a reference so that everything encoded against it is self
+    contained, see L{pyamf.pre_encode}.
+
+    @since: 0.6
+    """
+
+    def getStringReference(self, s):
+        return None
+
+    def getObjectReference(self, obj):
+        return None
+
+    def getClass(self, klass):
+        return None
+
+    def getLegacyXMLReference(self, doc):
+        return None
+
+
+class _LazyContext(Context):
+    """
+    Decodes a member of a L{pyamf.LazyObject} against the string, class and
+    object references of the original stream. The references the member
+    creates were already made when it was skipped.
+
+    @since: 0.6
+    """
+
+    def __init__(self, state, ref):
+        Context.__init__(self)
+
+        self.objects = pyamf._LazyReferences(state.objects, ref)
+        self.strings = pyamf._LazyReferences(state.strings)
+        self.class_ref = state.classes
+
+    def addClass(self, alias, klass):
+        return None
+
+
 class Decoder(pyamf.BaseDecoder):
     """
     Decodes an AMF3 data stream.
+
+    @ivar typed_arrays: Whether dense arrays that only contain numbers are
+        decoded to an C{array.array} rather than a C{list}; C{'l'} if all
+        the elements are integers, otherwise C{'d'}. Defaults to
+        L{typed_arrays_default}.
+    @type typed_arrays: C{bool}
+    @ivar lazy: Whether static and dynamic objects are decoded to
+        L{pyamf.LazyObject}s, which decode their members on first access.
+        Defaults to L{lazy_default}.
+    @type lazy: C{bool}
     """
     context_class = Context
+    lazy_context_class = _LazyContext
 
     type_map = {
         TYPE_UNDEFINED:  'readUndefined',
@@ -755,13 +1236,36 @@ class Decoder(pyamf.BaseDecoder):
         TYPE_OBJECT:     'readObject',
         TYPE_XMLSTRING:  'readXMLString',
         TYPE_BYTEARRAY:  'readByteArray',
+        TYPE_INT_VECTOR: 'readIntVector',
+        TYPE_UINT_VECTOR: 'readUintVector',
+        TYPE_NUMBER_VECTOR: 'readNumberVector',
+        TYPE_OBJECT_VECTOR: 'readObjectVector',
+        TYPE_DICTIONARY: 'readDictionary',
     }
 
     def __init__(self, *args, **kwargs):
         self.use_proxies = kwargs.pop('use_proxies', use_proxies_default)
+        self.typed_arrays = kwargs.pop('typed_arrays', typed_arrays_default)
+        self.lazy = kwargs.pop('lazy', lazy_default)
 
         pyamf.BaseDecoder.__init__(self, *args, **kwargs)
 
+    def _getLazyState(self):
+        state = self._lazy_state
+        ret = pyamf.BaseDecoder._getLazyState(self)
+
+        if ret is not state:
+            ret.strings = self._getLazyReferences('strings', True)
+            ret.classes = self.context.class_ref
+
+        return ret
+
+    def _getLazyDecoder(self, stream, context):
+        return self.__class__(stream, context, strict=self.strict,
+            timezone_offset=self.timezone_offset,
+            use_proxies=self.use_proxies, typed_arrays=self.typed_arrays,
+            lazy=self.lazy)
+
     def readUndefined(self):
         """
         Read undefined.
@@ -893,6 +1397,14 @@ class Decoder(pyamf.BaseDecoder):
         key = self.readString(False)
 
         if key == '':
+            if self.typed_arrays:
+                result = self._readTypedArray(size)
+
+                if result is not None:
+                    self.context.addObject(result)
+
+                    return result
+
             # integer indexes only -> python list
             result = []
             self.context.addObject(result)
@@ -915,6 +1427,36 @@ class Decoder(pyamf.BaseDecoder):
 
         return result
 
+    def _readTypedArray(self, size):
+        """
+        Reads the C{size} elements of a dense array into an C{array.array},
+        if they are all numbers.
+
+        @return: The array or C{None}, with the stream position restored, if
+            an element is not a number.
+        """
+        if size == 0:
+            return None
+
+        pos = self.stream.tell()
+        values = []
+        typecode = 'l'
+
+        for i in xrange(size):
+            t = self.stream.read(1)
+
+            if t == TYPE_INTEGER:
+                values.append(decode_int(self.stream, True))
+            elif t == TYPE_NUMBER:
+                values.append(self.stream.read_double())
+                typecode = 'd'
+            else:
+                self.stream.seek(pos)
+
+                return None
+
+        return array.array(typecode, values)
+
     def _getClassDefinition(self, ref):
         """
         Reads class definition from the stream.
@@ -928,34 +1470,18 @@ class Decoder(pyamf.BaseDecoder):
             return class_def, class_def.alias
 
         name = self.readString()
-        alias = None
-
-        if name == '':
-            name = pyamf.ASObject
-
-        try:
-            alias = pyamf.get_class_alias(name)
-        except pyamf.UnknownClassAlias:
-            if self.strict:
-                raise
-
-            alias = pyamf.TypedObjectClassAlias(pyamf.TypedObject, name)
-
-        class_def = ClassDefinition(alias)
-
-        class_def.encoding = ref & 0x03
-        class_def.attr_len = ref >> 2
-        class_def.static_properties = []
+        static_properties = []
 
-        if class_def.attr_len > 0:
-            for i in xrange(class_def.attr_len):
-                key = self.readString(False)
+        for i in xrange(ref >> 2):
+            static_properties.append(self.readString(False))
 
-                class_def.static_properties.append(key)
+        plan = get_decode_plan(name, ref & 0x03, static_properties,
+            self.strict)
+        class_def = plan.getClassDefinition()
 
-        self.context.addClass(class_def, alias.klass)
+        self.context.addClass(class_def, plan.alias.klass)
 
-        return class_def, alias
+        return class_def, plan.alias
 
     def _readStatic(self, class_def, obj):
         for attr in class_def.static_properties:
@@ -996,6 +1522,13 @@ class Decoder(pyamf.BaseDecoder):
 
         class_def, alias = self._getClassDefinition(ref)
 
+        if class_def.encoding in (ObjectEncoding.DYNAMIC,
+                ObjectEncoding.STATIC) and self._isLazy(alias):
+            obj = self._readLazyObject(class_def, alias)
+
+            if obj is not None:
+                return obj
+
         obj = alias.createInstance(codec=self)
         obj_attrs = dict()
 
@@ -1011,13 +1544,131 @@ class Decoder(pyamf.BaseDecoder):
         else:
             raise pyamf.DecodeError("Unknown object encoding")
 
-        alias.applyAttributes(obj, obj_attrs, codec=self)
+        if class_def.plan is not None:
+            class_def.plan.applyAttributes(obj, obj_attrs, codec=self)
+        else:
+            alias.applyAttributes(obj, obj_attrs, codec=self)
 
         if use_proxies is True:
             obj = self.readProxy(obj)
 
         return obj
 
+    def _readLazyObject(self, class_def, alias):
+        """
+        Reads an object into a L{pyamf.LazyObject}.
+        """
+        plan = class_def.plan
+
+        if plan is None:
+            plan = alias
+
+        def create():
+            return alias.createInstance(codec=self)
+
+        def apply(obj, attrs):
+            plan.applyAttributes(obj, attrs, codec=self)
+
+        return pyamf.BaseDecoder._readLazyObject(self, create, apply,
+            class_def)
+
+    def _skipLazyMembers(self, obj, class_def):
+        for attr in class_def.static_properties:
+            self._skipLazyMember(obj, attr)
+
+        if class_def.encoding != ObjectEncoding.DYNAMIC:
+            return
+
+        attr = self.readString(False)
+
+        while attr:
+            self._skipLazyMember(obj, attr)
+            attr = self.readString(False)
+
+    def _skipElement(self):
+        """
+        Skips over the next element in the stream, creating the string, class
+        and object references that decoding it would. Objects are referenced
+        by placeholders that decode the current L{pyamf.LazyObject} member
+        when they are needed.
+
+        @raise pyamf._SkipError: The element contains an externalised object.
+        """
+        t = self.stream.read(1)
+
+        if t in (TYPE_UNDEFINED, TYPE_NULL, TYPE_BOOL_FALSE, TYPE_BOOL_TRUE):
+            return
+
+        if t == TYPE_INTEGER:
+            decode_int(self.stream)
+        elif t == TYPE_NUMBER:
+            self._skipBytes(8)
+        elif t == TYPE_STRING:
+            self.readString()
+        else:
+            ref = self.readUnsignedInteger()
+
+            if ref & REFERENCE_BIT == 0:
+                if t not in self.type_map:
+                    raise pyamf.DecodeError(
+                        "Unsupported ActionScript type %r" % (t,))
+
+                return
+
+            ref >>= 1
+
+            if t in (TYPE_XML, TYPE_XMLSTRING, TYPE_BYTEARRAY):
+                self._skipBytes(ref)
+                self._addLazySlot()
+            elif t == TYPE_DATE:
+                self._skipBytes(8)
+                self._addLazySlot()
+            elif t == TYPE_ARRAY:
+                self._addLazySlot()
+
+                while self.readString(False):
+                    self._skipElement()
+
+                for i in xrange(ref):
+                    self._skipElement()
+            elif t == TYPE_OBJECT:
+                class_def, alias = self._getClassDefinition(ref)
+
+                if class_def.encoding not in (ObjectEncoding.DYNAMIC,
+                        ObjectEncoding.STATIC):
+                    raise pyamf._SkipError
+
+                self._addLazySlot()
+
+                for i in xrange(len(class_def.static_properties)):
+                    self._skipElement()
+
+                if class_def.encoding == ObjectEncoding.DYNAMIC:
+                    while self.readString(False):
+                        self._skipElement()
+            elif t in (TYPE_INT_VECTOR, TYPE_UINT_VECTOR):
+                self._skipBytes(1 + ref * 4)
+                self._addLazySlot()
+            elif t == TYPE_NUMBER_VECTOR:
+                self._skipBytes(1 + ref * 8)
+                self._addLazySlot()
+            elif t == TYPE_OBJECT_VECTOR:
+                self._skipBytes(1)
+                self.readString()
+                self._addLazySlot()
+
+                for i in xrange(ref):
+                    self._skipElement()
+            elif t == TYPE_DICTIONARY:
+                self._skipBytes(1)
+                self._addLazySlot()
+
+                for i in xrange(ref * 2):
+                    self._skipElement()
+            else:
+                raise pyamf.DecodeError(
+                    "Unsupported ActionScript type %r" % (t,))
+
     def _readXML(self, legacy=False):
         """
         Reads an object from the stream.
@@ -1073,13 +1724,12 @@ class Decoder(pyamf.BaseDecoder):
         if ref & REFERENCE_BIT == 0:
             return self.context.getObject(ref >> 1)
 
-        buffer = self.stream.read(ref >> 1)
+        buffer = self.stream.read_view(ref >> 1)
+        data = _decompress(buffer)
+        compressed = data is not None
 
-        try:
-            buffer = zlib.decompress(buffer)
-            compressed = True
-        except zlib.error:
-            compressed = False
+        if compressed:
+            buffer = data
 
         obj = ByteArray(buffer)
         obj.compressed = compressed
@@ -1088,6 +1738,95 @@ class Decoder(pyamf.BaseDecoder):
 
         return obj
 
+    def _readVector(self, klass):
+        """
+        Reads a numeric vector from the stream. The values are read as one
+        block into a C{klass} instance.
+        """
+        ref = self.readUnsignedInteger()
+
+        if ref & REFERENCE_BIT == 0:
+            return self.context.getObject(ref >> 1)
+
+        fixed = self.stream.read_uchar()
+        result = _unpack_vector(klass, self.stream, ref >> 1, fixed)
+
+        self.context.addObject(result)
+
+        return result
+
+    def readIntVector(self):
+        """
+        Reads a C{Vector.<int>} from the stream.
+
+        @rtype: L{IntVector}
+        @since: 0.6
+        """
+        return self._readVector(IntVector)
+
+    def readUintVector(self):
+        """
+        Reads a C{Vector.<uint>} from the stream.
+
+        @rtype: L{UintVector}
+        @since: 0.6
+        """
+        return self._readVector(UintVector)
+
+    def readNumberVector(self):
+        """
+        Reads a C{Vector.<Number>} from the stream.
+
+        @rtype: L{NumberVector}
+        @since: 0.6
+        """
+        return self._readVector(NumberVector)
+
+    def readObjectVector(self):
+        """
+        Reads a C{Vector.<Object>} from the stream.
+
+        @rtype: L{ObjectVector}
+        @since: 0.6
+        """
+        ref = self.readUnsignedInteger()
+
+        if ref & REFERENCE_BIT == 0:
+            return self.context.getObject(ref >> 1)
+
+        fixed = self.stream.read_uchar()
+        result = ObjectVector(fixed=bool(fixed), classname=self.readString())
+
+        self.context.addObject(result)
+
+        for i in xrange(ref >> 1):
+            result.append(self.readElement())
+
+        return result
+
+    def readDictionary(self):
+        """
+        Reads a C{flash.utils.Dictionary} from the stream.
+
+        @rtype: L{Dictionary}
+        @since: 0.6
+        """
+        ref = self.readUnsignedInteger()
+
+        if ref & REFERENCE_BIT == 0:
+            return self.context.getObject(ref >> 1)
+
+        weak_keys = self.stream.read_uchar()
+        result = Dictionary(weak_keys=bool(weak_keys))
+
+        self.context.addObject(result)
+
+        for i in xrange(ref >> 1):
+            key = self.readElement()
+            result[key] = self.readElement()
+
+        return result
+
 
 class Encoder(pyamf.BaseEncoder):
     """
@@ -1105,13 +1844,20 @@ class Encoder(pyamf.BaseEncoder):
         ((float,), "writeNumber"),
         (types.StringTypes, "writeString"),
         ((ByteArray,), "writeByteArray"),
+        ((_NumericVector,), "writeVector"),
+        ((array.ArrayType,), "writeList"),
+        ((ObjectVector,), "writeObjectVector"),
+        ((Dictionary,), "writeDictionary"),
         ((datetime.date, datetime.datetime, datetime.time), "writeDate"),
         ((util.is_ET_element,), "writeXML"),
         ((pyamf.UndefinedType,), "writeUndefined"),
+        ((pyamf.RawAMF,), "writeRawAMF"),
         ((types.ClassType, types.TypeType), "writeClass"),
         ((types.InstanceType, types.ObjectType,), "writeInstance"),
     ]
 
+    raw_context_class = _RawContext
+
     def __init__(self, *args, **kwargs):
         self.use_proxies = kwargs.pop('use_proxies', use_proxies_default)
         self.string_references = kwargs.pop('string_references', True)
@@ -1145,6 +1891,21 @@ class Encoder(pyamf.BaseEncoder):
         """
         self.stream.write(TYPE_UNDEFINED)
 
+    def writeRawAMF(self, raw, **kwargs):
+        """
+        Writes a pre-encoded element to the stream.
+
+        @type raw: L{pyamf.RawAMF}
+        @raise EncodeError: C{raw} is not AMF3 encoded.
+        @since: 0.6
+        """
+        if raw.encoding != pyamf.AMF3:
+            raise pyamf.EncodeError('Cannot write an AMF%d fragment to an '
+                'AMF3 stream' % (raw.encoding,))
+
+        self.stream.write(raw.data)
+        self.context.addRawAMF(raw)
+
     def writeNull(self, *args, **kwargs):
         """
         Writes a C{null} value to the stream.
@@ -1309,6 +2070,18 @@ class Encoder(pyamf.BaseEncoder):
         self._writeInteger((len(n) << 1) | REFERENCE_BIT)
         self.stream.write_uchar(0x01)
 
+        if isinstance(n, array.ArrayType) and n.typecode in VECTOR_TYPECODES:
+            # numeric arrays skip the per element type lookup
+            if n.typecode in 'fd':
+                write = self.writeNumber
+            else:
+                write = self.writeInteger
+
+            for x in n:
+                write(x)
+
+            return
+
         [self.writeElement(x) for x in n]
 
     def writeDict(self, n, use_proxies=None):
@@ -1447,7 +2220,7 @@ class Encoder(pyamf.BaseEncoder):
             try:
                 alias = pyamf.get_class_alias(kls)
             except pyamf.UnknownClassAlias:
-                alias_klass = util.get_class_alias(kls)
+                alias_klass = pyamf._get_alias_type(kls)
                 meta = util.get_class_meta(kls)
 
                 alias = alias_klass(kls, defer=True, **meta)
@@ -1487,6 +2260,11 @@ class Encoder(pyamf.BaseEncoder):
 
             return
 
+        if alias.encode_attrs is not None:
+            self._writeSealedObject(obj, alias, definition, class_ref)
+
+            return
+
         attrs = alias.getEncodableAttributes(obj, codec=self)
 
         if alias.static_attrs:
@@ -1509,6 +2287,35 @@ class Encoder(pyamf.BaseEncoder):
 
             self.stream.write_uchar(0x01)
 
+    def _writeSealedObject(self, obj, alias, definition, class_ref):
+        """
+        Writes the attributes of C{obj} using the encode plan of C{alias}.
+
+        @see: L{pyamf.ClassAlias.getEncodableValues}
+        @since: 0.6
+        """
+        values = alias.getEncodableValues(obj)
+        static_len = 0
+
+        if alias.static_attrs:
+            static_len = len(alias.static_attrs)
+
+            if not class_ref:
+                for attr in alias.static_attrs:
+                    self._writeString(attr)
+
+            for value in values[:static_len]:
+                self.writeElement(value)
+
+        if definition.encoding == ObjectEncoding.DYNAMIC:
+            attrs = alias.encode_attrs
+
+            for i in xrange(static_len, len(attrs)):
+                self._writeString(attrs[i])
+                self.writeElement(values[i])
+
+            self.stream.write_uchar(0x01)
+
     def writeByteArray(self, n, **kwargs):
         """
         Writes a L{ByteArray} to the data stream.
@@ -1532,6 +2339,108 @@ class Encoder(pyamf.BaseEncoder):
         self._writeInteger(l << 1 | REFERENCE_BIT)
         self.stream.write(buf)
 
+    def writeVector(self, n, use_proxies=None):
+        """
+        Writes an C{array.array} (e.g. an L{IntVector}) to the data stream as
+        the matching AMF3 vector type, see L{VECTOR_TYPECODES}. The values are
+        written as one block. Arrays of other typecodes are written as lists.
+
+        Only the vector classes are written this way by L{writeElement}, plain
+        C{array.array} instances are sent as lists (see
+        L{pyamf.adapters._array}) as older players do not support vectors.
+
+        @type n: C{array.array}
+        @raise EncodeError: A value is out of range for the vector type.
+        @since: 0.6
+        """
+        try:
+            marker, typecode = VECTOR_TYPECODES[n.typecode]
+        except KeyError:
+            self.writeList(n.tolist(), use_proxies=use_proxies)
+
+            return
+
+        self.stream.write(marker)
+
+        ref = self.context.getObjectReference(n)
+
+        if ref is not None:
+            self._writeInteger(ref << 1)
+
+            return
+
+        self.context.addObject(n)
+
+        self._writeInteger(len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(int(bool(getattr(n, 'fixed', False))))
+        self.stream.write(_pack_vector(n, typecode))
+
+    def writeObjectVector(self, n, use_proxies=None):
+        """
+        Writes an L{ObjectVector} to the data stream.
+
+        @type n: L{ObjectVector}
+        @since: 0.6
+        """
+        self.stream.write(TYPE_OBJECT_VECTOR)
+
+        ref = self.context.getObjectReference(n)
+
+        if ref is not None:
+            self._writeInteger(ref << 1)
+
+            return
+
+        self.context.addObject(n)
+
+        self._writeInteger(len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(int(bool(n.fixed)))
+        self._writeString(n.classname)
+
+        for x in n:
+            self.writeElement(x)
+
+    def writeDictionary(self, n, use_proxies=None):
+        """
+        Writes a L{Dictionary} to the data stream. Unlike L{writeDict} the
+        keys are written as AMF3 values rather than coerced to strings.
+
+        If all the keys are C{int}s or all are strings, the encoding function
+        for the keys is only looked up once.
+
+        @type n: L{Dictionary}
+        @since: 0.6
+        """
+        self.stream.write(TYPE_DICTIONARY)
+
+        ref = self.context.getObjectReference(n)
+
+        if ref is not None:
+            self._writeInteger(ref << 1)
+
+            return
+
+        self.context.addObject(n)
+
+        self._writeInteger(len(n) << 1 | REFERENCE_BIT)
+        self.stream.write_uchar(int(bool(n.weak_keys)))
+
+        items = n.items()
+        key_types = set([key.__class__ for key, value in items])
+        write_key = self.writeElement
+
+        if len(key_types) == 1:
+            key_type = key_types.pop()
+
+            if key_type in (int, long):
+                write_key = self.writeInteger
+            elif key_type in (str, unicode):
+                write_key = self.writeString
+
+        for key, value in items:
+            write_key(key)
+            self.writeElement(value)
+
     def writeXML(self, n, use_proxies=None):
         """
         Writes a XML string to the data stream.
@@ -1563,6 +2472,364 @@ class Encoder(pyamf.BaseEncoder):
         self._writeString(util.ET.tostring(n, 'utf-8'))
 
 
+_decode_plans = {}
+
+
+def get_decode_plan(name, encoding, static_properties, strict=False):
+    """
+    Returns the L{DecodePlan} for a trait read from an AMF3 stream. Plans are
+    kept in a process-wide cache of at most L{MAX_DECODE_PLANS} entries so
+    that the class alias lookup and attribute filtering is only worked out
+    once per trait. A cached plan is discarded if the class alias it resolved
+    to is re-registered or, for unknown class names, if a class loader is
+    added.
+
+    @param name: The class name of the trait, C{''} for anonymous objects.
+    @param encoding: The L{ObjectEncoding} of the trait.
+    @param static_properties: The static property names of the trait.
+    @param strict: Raise L{UnknownClassAlias<pyamf.UnknownClassAlias>} if
+        C{name} is not registered.
+    @rtype: L{DecodePlan}
+    @since: 0.6
+    """
+    key = (name, encoding, tuple(static_properties))
+
+    try:
+        plan = _decode_plans[key]
+    except KeyError:
+        pass
+    else:
+        if plan.isValid(strict):
+            return plan
+
+    if name == '':
+        lookup = pyamf.ASObject
+    else:
+        lookup = name
+
+    try:
+        alias = pyamf.get_class_alias(lookup)
+        loaders = None
+    except pyamf.UnknownClassAlias:
+        if strict:
+            raise
+
+        alias = pyamf.TypedObjectClassAlias(pyamf.TypedObject, name)
+        loaders = list(pyamf.CLASS_LOADERS)
+
+    plan = DecodePlan(alias, encoding, static_properties, lookup, loaders)
+    plan.trait = key
+
+    if key not in _decode_plans and len(_decode_plans) >= MAX_DECODE_PLANS:
+        _decode_plans.popitem()
+
+    _decode_plans[key] = plan
+
+    return plan
+
+
+def _scan_more(stream, buf, i):
+    """
+    Returns the bytes of C{buf} from C{i} on with those that have been
+    appended to C{stream} since, and the new offset. C{i} may be past the end
+    of C{buf} after skipping over data that had not arrived yet.
+    """
+    n = len(buf)
+
+    if i > n:
+        skip = min(i - n, stream.remaining())
+        stream.seek(skip, 1)
+
+        return stream.read(stream.remaining()), i - n - skip
+
+    return buf[i:] + stream.read(stream.remaining()), 0
+
+
+def _scan_int(buf, i):
+    """
+    Reads an unsigned U29 from C{buf} at offset C{i}.
+
+    @return: The integer and the offset following it, or C{None} if it is
+        incomplete.
+    """
+    result = 0
+    j = i
+    end = min(i + 4, len(buf))
+
+    while j < end:
+        b = ord(buf[j])
+        j += 1
+
+        if j - i == 4:
+            result = (result << 8) | b
+
+            if result & 0x10000000 != 0:
+                result = (result << 1) + 1
+
+            return result, j
+
+        result = (result << 7) | (b & 0x7f)
+
+        if b & 0x80 == 0:
+            return result, j
+
+    return None
+
+
+def _scan_element(stream, context=None, traits=None):
+    """
+    Finds the end of the next element in C{stream} without decoding it, so
+    that L{IncrementalDecoder} only decodes an element once all of it has
+    arrived.
+
+    This is a generator. Whenever it runs out of data it yields, leaving the
+    stream at its end, and carries on from the same place when it is resumed
+    after more bytes have been appended to C{stream}. Once it is exhausted
+    the stream is positioned at the end of the element.
+
+    @param context: The L{Context} the element will be decoded with, needed
+        for the traits that the element refers to.
+    @param traits: The C{(encoding, static property count)} of each trait
+        that has been scanned but is not in C{context} yet. This is appended
+        to.
+    @type traits: C{list}
+    @raise pyamf._SkipError: The element can only be measured by decoding
+        it, e.g. it holds an externalised object.
+    @since: 0.6
+    """
+    if context is None:
+        class_idx = 0
+    else:
+        class_idx = context.class_idx
+
+    if traits is None:
+        traits = []
+
+    buf = stream.read(stream.remaining())
+    i = 0
+
+    # the number of elements left to skip in each container being scanned,
+    # None for a run of names and elements that ends with an empty name
+    stack = [1]
+
+    while stack:
+        if stack[-1] is None:
+            ret = _scan_int(buf, i)
+
+            while ret is None:
+                yield None
+                buf, i = _scan_more(stream, buf, i)
+                ret = _scan_int(buf, i)
+
+            ref, i = ret
+
+            if ref == REFERENCE_BIT:
+                stack.pop()
+            else:
+                if ref & REFERENCE_BIT != 0:
+                    i += ref >> 1
+
+                stack.append(1)
+
+            continue
+
+        if stack[-1] == 0:
+            stack.pop()
+
+            continue
+
+        stack[-1] -= 1
+
+        while len(buf) <= i:
+            yield None
+            buf, i = _scan_more(stream, buf, i)
+
+        t = buf[i]
+        i += 1
+
+        if t in (TYPE_UNDEFINED, TYPE_NULL, TYPE_BOOL_FALSE, TYPE_BOOL_TRUE):
+            continue
+
+        if t == TYPE_NUMBER:
+            i += 8
+
+            continue
+
+        ret = _scan_int(buf, i)
+
+        while ret is None:
+            yield None
+            buf, i = _scan_more(stream, buf, i)
+            ret = _scan_int(buf, i)
+
+        ref, i = ret
+
+        if t == TYPE_INTEGER or ref & REFERENCE_BIT == 0:
+            continue
+
+        ref >>= 1
+
+        if t in (TYPE_STRING, TYPE_XML, TYPE_XMLSTRING, TYPE_BYTEARRAY):
+            i += ref
+        elif t == TYPE_DATE:
+            i += 8
+        elif t in (TYPE_INT_VECTOR, TYPE_UINT_VECTOR):
+            i += 1 + ref * 4
+        elif t == TYPE_NUMBER_VECTOR:
+            i += 1 + ref * 8
+        elif t == TYPE_ARRAY:
+            stack.append(ref)
+            stack.append(None)
+        elif t == TYPE_DICTIONARY:
+            i += 1
+            stack.append(ref * 2)
+        elif t in (TYPE_OBJECT, TYPE_OBJECT_VECTOR):
+            if t == TYPE_OBJECT_VECTOR:
+                # the fixed flag and the type name
+                i += 1
+                names = 1
+            elif ref & REFERENCE_BIT == 0:
+                ref >>= 1
+                names = 0
+
+                if ref >= class_idx:
+                    try:
+                        encoding, count = traits[ref - class_idx]
+                    except IndexError:
+                        raise pyamf._SkipError
+                else:
+                    class_def = context.getClassByReference(ref)
+
+                    if class_def is None:
+                        raise pyamf._SkipError
+
+                    encoding = class_def.encoding
+                    count = len(class_def.static_properties)
+            else:
+                ref >>= 1
+                encoding = ref & 0x03
+                count = ref >> 2
+
+                # the class name and the static property names
+                names = count + 1
+                traits.append((encoding, count))
+
+            while names:
+                ret = _scan_int(buf, i)
+
+                while ret is None:
+                    yield None
+                    buf, i = _scan_more(stream, buf, i)
+                    ret = _scan_int(buf, i)
+
+                name, i = ret
+
+                if name & REFERENCE_BIT != 0:
+                    i += name >> 1
+
+                names -= 1
+
+            if t == TYPE_OBJECT_VECTOR:
+                stack.append(ref)
+
+                continue
+
+            if encoding not in (ObjectEncoding.STATIC, ObjectEncoding.DYNAMIC):
+                raise pyamf._SkipError
+
+            if encoding == ObjectEncoding.DYNAMIC:
+                stack.append(None)
+
+            stack.append(count)
+        else:
+            raise pyamf._SkipError
+
+    while len(buf) < i:
+        yield None
+        buf, i = _scan_more(stream, buf, i)
+
+    stream.seek(i - len(buf), 1)
+
+
+class IncrementalDecoder(pyamf.IncrementalDecoder):
+    """
+    Decodes an AMF3 stream that arrives in chunks.
+
+    @see: L{pyamf.IncrementalDecoder}
+    @since: 0.6
+    """
+
+    encoding = pyamf.AMF3
+
+
+def _decompress(buf):
+    """
+    Returns the inflated contents of C{buf} or C{None} if C{buf} does not hold
+    C{zlib} compressed data. The header is checked first so that uncompressed
+    data (and any view onto it) is not copied.
+
+    @type buf: C{str}, C{buffer} or C{memoryview}
+    """
+    if len(buf) < 2:
+        return None
+
+    cmf, flg = ord(buf[0]), ord(buf[1])
+
+    # see RFC 1950 (zlib), the same checks are made by zlib itself
+    if cmf & 0x0f != 8 or ((cmf << 8) + flg) % 31 != 0:
+        return None
+
+    if hasattr(buf, 'tobytes'):
+        buf = buf.tobytes()
+
+    try:
+        return zlib.decompress(buf)
+    except zlib.error:
+        return None
+
+
+def _unpack_vector(klass, stream, length, fixed):
+    """
+    Reads C{length} values from C{stream} into a new L{_NumericVector}
+    subclass C{klass} instance in one block.
+
+    @since: 0.6
+    """
+    result = klass(fixed=bool(fixed))
+    data = stream.read_view(length * result.itemsize)
+
+    if hasattr(data, 'tobytes'):
+        data = data.tobytes()
+
+    result.fromstring(data)
+
+    if _swap_vectors:
+        result.byteswap()
+
+    return result
+
+
+def _pack_vector(n, typecode):
+    """
+    Returns the values of the C{array.array} C{n} as a big endian block of
+    C{typecode} values.
+
+    @raise EncodeError: A value of C{n} does not fit C{typecode}.
+    @since: 0.6
+    """
+    if n.typecode != typecode or _swap_vectors:
+        try:
+            n = array.array(typecode, n)
+        except OverflowError, e:
+            raise pyamf.EncodeError('Unable to encode %r as a vector (%s)' % (
+                n, e))
+
+    if _swap_vectors:
+        n.byteswap()
+
+    return n.tostring()
+
+
 def decode(stream, context=None, strict=False):
     """
     A helper function to decode an AMF3 datastream.
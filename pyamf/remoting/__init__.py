@@ -30,7 +30,7 @@ import pyamf
 from pyamf import util
 
 
-__all__ = ['Envelope', 'Request', 'Response', 'decode', 'encode']
+__all__ = ['Envelope', 'Request', 'Response', 'decode', 'encode', 'extract']
 
 #: Succesful call.
 STATUS_OK = 0
@@ -231,7 +231,8 @@ class Message(object):
 
     :ivar envelope: The parent envelope of this AMF Message.
     :type envelope: :class:`Envelope`
-    :ivar body: The body of the message.
+    :ivar body: The body of the message. If the message was decoded with
+        ``lazy=True`` the body is decoded the first time it is accessed.
     :type body: `mixed`
     :ivar headers: The message headers.
     :type headers: `dict`
@@ -246,6 +247,19 @@ class Message(object):
 
     headers = property(_get_headers)
 
+    def _get_body(self):
+        body = self._body
+
+        if isinstance(body, _LazyBody):
+            body = self._body = body.decode()
+
+        return body
+
+    def _set_body(self, body):
+        self._body = body
+
+    body = property(_get_body, _set_body)
+
 
 class Request(Message):
     """
@@ -262,7 +276,7 @@ class Request(Message):
 
     def __repr__(self):
         return "<%s target=%s>%s</%s>" % (
-            type(self).__name__, repr(self.target), repr(self.body), type(self).__name__)
+            type(self).__name__, repr(self.target), repr(self._body), type(self).__name__)
 
 
 class Response(Message):
@@ -280,7 +294,7 @@ class Response(Message):
 
     def __repr__(self):
         return "<%s status=%s>%s</%s>" % (
-            type(self).__name__, _get_status(self.status), repr(self.body),
+            type(self).__name__, _get_status(self.status), repr(self._body),
             type(self).__name__
         )
 
@@ -416,7 +430,67 @@ def _write_header(name, header, required, stream, encoder, strict=False):
         stream.seek(new_pos)
 
 
-def _read_body(stream, decoder, strict=False, logger=None):
+class _LazyBody(object):
+    """
+    The undecoded arguments of a :class:`Request`, see :func:`decode`.
+
+    :ivar data: The encoded body.
+    :type data: `str`
+    """
+
+    def __init__(self, data, strict=False, timezone_offset=None):
+        self.data = data
+        self.strict = strict
+        self.timezone_offset = timezone_offset
+
+    def decode(self):
+        """
+        :raise DecodeError: Malformed body.
+        """
+        stream = util.BufferedByteStream(self.data)
+        decoder = pyamf.get_decoder(pyamf.AMF0, stream, strict=self.strict,
+            timezone_offset=self.timezone_offset)
+
+        data = _read_args(stream, decoder)
+
+        if self.strict and stream.remaining() > 0:
+            raise pyamf.DecodeError("Data read from stream does not match "
+                "body length")
+
+        return data
+
+    def __repr__(self):
+        return '<%s %d bytes>' % (type(self).__name__, len(self.data))
+
+
+def _read_args(stream, decoder):
+    """
+    Reads the arguments of a request body.
+
+    :raise pyamf.DecodeError: Array type required for request body.
+    """
+    if stream.read(1) != '\x0a':
+        raise pyamf.DecodeError("Array type required for request body")
+
+    x = stream.read_ulong()
+
+    return [decoder.readElement() for i in xrange(x)]
+
+
+def _skip_args(stream):
+    """
+    Moves past the arguments of a request body without decoding them.
+    """
+    if stream.read(1) != '\x0a':
+        raise pyamf.DecodeError("Array type required for request body")
+
+    decoder = pyamf.get_decoder(pyamf.AMF0, stream, lazy=True)
+
+    for i in xrange(stream.read_ulong()):
+        decoder._skipLazyElement()
+
+
+def _read_body(stream, decoder, strict=False, logger=None, lazy=False):
     """
     Read AMF message body.
 
@@ -430,23 +504,15 @@ def _read_body(stream, decoder, strict=False, logger=None):
     :param logger: Used to log interesting events whilst reading a remoting
         body.
     :type logger: A `logging.Logger` instance or `None`.
+    :param lazy: Leave the arguments of a request to be decoded when the
+        body of the :class:`Request` is first accessed.
+    :type lazy: `bool`
 
     :rtype: `tuple`
     :return: A `tuple` containing:
         - ID of the request
         - :class:`Request` or :class:`Response`
     """
-    def _read_args():
-        """
-        :raise pyamf.DecodeError: Array type required for request body.
-        """
-        if stream.read(1) != '\x0a':
-            raise pyamf.DecodeError("Array type required for request body")
-
-        x = stream.read_ulong()
-
-        return [decoder.readElement() for i in xrange(x)]
-
     target = stream.read_utf8_string(stream.read_ushort())
     response = stream.read_utf8_string(stream.read_ushort())
 
@@ -467,8 +533,17 @@ def _read_body(stream, decoder, strict=False, logger=None):
     data_len = stream.read_ulong()
     pos = stream.tell()
 
-    if is_request:
-        data = _read_args()
+    if is_request and lazy:
+        # the length is 0 if the encoder was not strict
+        if data_len in (0, 0xffffffff) or data_len > stream.remaining():
+            _skip_args(stream)
+            data_len = stream.tell() - pos
+            stream.seek(pos)
+
+        data = _LazyBody(stream.read(data_len), strict,
+            decoder.timezone_offset)
+    elif is_request:
+        data = _read_args(stream, decoder)
     else:
         data = decoder.readElement()
 
@@ -594,7 +669,8 @@ def get_fault(data):
     return get_fault_class(level, **e)(**e)
 
 
-def decode(stream, context=None, strict=False, logger=None, timezone_offset=None):
+def decode(stream, context=None, strict=False, logger=None, timezone_offset=None,
+           codec_pool=None, lazy=False):
     """
     Decodes the incoming stream as a remoting message.
 
@@ -612,6 +688,14 @@ def decode(stream, context=None, strict=False, logger=None, timezone_offset=None
         UTC. Date/times should always be handled in UTC to avoid confusion but
         this is required for legacy systems.
     :type timezone_offset: `datetime.timedelta`
+    :param codec_pool: If supplied (and `context` is not), the decoder is
+        taken from and returned to this pool.
+    :type codec_pool: :class:`pyamf.CodecPool`
+    :param lazy: Decode the arguments of each :class:`Request` the first
+        time its `body` is accessed, e.g. after the service and credentials
+        have been checked. Errors in the arguments are then raised on access.
+        Bodies are independent so only the raw bytes are kept.
+    :type lazy: `bool`
 
     :raise DecodeError: Malformed stream.
     :raise RuntimeError: Decoder is unable to fully consume the
@@ -635,28 +719,40 @@ def decode(stream, context=None, strict=False, logger=None, timezone_offset=None
         raise pyamf.DecodeError("Malformed stream (amfVersion=%d)" %
             msg.amfVersion)
 
-    if context is None:
-        context = pyamf.get_context(pyamf.AMF0)
+    if context is None and codec_pool is not None:
+        decoder = codec_pool.getDecoder(pyamf.AMF0, stream, strict=strict,
+            timezone_offset=timezone_offset)
+        context = decoder.context
+    else:
+        codec_pool = None
+
+        if context is None:
+            context = pyamf.get_context(pyamf.AMF0)
 
-    decoder = pyamf.get_decoder(pyamf.AMF0, stream, context=context,
-        strict=strict, timezone_offset=timezone_offset)
+        decoder = pyamf.get_decoder(pyamf.AMF0, stream, context=context,
+            strict=strict, timezone_offset=timezone_offset)
 
-    header_count = stream.read_ushort()
+    try:
+        header_count = stream.read_ushort()
 
-    for i in xrange(header_count):
-        name, required, data = _read_header(stream, decoder, strict)
-        msg.headers[name] = data
+        for i in xrange(header_count):
+            name, required, data = _read_header(stream, decoder, strict)
+            msg.headers[name] = data
 
-        if required:
-            msg.headers.set_required(name)
+            if required:
+                msg.headers.set_required(name)
 
-    body_count = stream.read_short()
+        body_count = stream.read_short()
 
-    for i in range(body_count):
-        context.clear()
+        for i in range(body_count):
+            context.clear()
 
-        target, payload = _read_body(stream, decoder, strict, logger)
-        msg[target] = payload
+            target, payload = _read_body(stream, decoder, strict, logger,
+                lazy)
+            msg[target] = payload
+    finally:
+        if codec_pool is not None:
+            codec_pool.release(decoder)
 
     if strict and stream.remaining() > 0:
         raise RuntimeError("Unable to fully consume the buffer")
@@ -667,7 +763,334 @@ def decode(stream, context=None, strict=False, logger=None, timezone_offset=None
     return msg
 
 
-def encode(msg, context=None, strict=False, logger=None, timezone_offset=None):
+def _skip_value(stream, decoder, data_len):
+    """
+    Moves past a header or body value that no path needs. The length prefix
+    is used if it is known, otherwise the value is skipped structurally. No
+    value encodes to 0 bytes so 0 (written by the non-strict encoders) is
+    treated as unknown, as is 0xffffffff.
+    """
+    if data_len not in (0, 0xffffffff) and data_len <= stream.remaining():
+        stream.seek(data_len, 1)
+    else:
+        decoder._skipLazyElement()
+
+
+def extract(stream, paths, strict=False, timezone_offset=None):
+    """
+    Returns the values at `paths` in a remoting envelope without decoding the
+    rest of it. Paths start with ``headers.<name>`` or ``body[i]``, where a
+    body has the keys ``target``, ``response``, ``status`` and ``body`` (the
+    list of arguments for a request, the value for a response), e.g.
+    ``body[0].body[0].operation`` for the first Flex message in a batch.
+
+    Headers and bodies that are not on a path are skipped over using their
+    length prefixes and bodies after the last one needed are not read at
+    all. See :func:`pyamf.extract`.
+
+    :param paths: A list of paths.
+    :param strict: Enforce strict decoding. Default is `False`.
+    :type strict: `bool`
+    :param timezone_offset: See :func:`decode`.
+    :raise ValueError: A path is malformed or does not start with
+        ``headers`` or ``body[i]``.
+    :raise DecodeError: Malformed stream.
+    :return: A `dict` of path to value. Paths that do not exist in the
+        envelope are left out.
+    :since: 0.6
+    """
+    header_paths = []
+    body_paths = {}
+
+    for path in paths:
+        keys = pyamf.parse_path(path)
+
+        if keys[0] == 'headers':
+            header_paths.append(path)
+        elif keys[0] == 'body' and len(keys) > 1 and isinstance(keys[1], int):
+            body_paths.setdefault(keys[1], []).append(path)
+        else:
+            raise ValueError('Path %r must start with headers or body[i]' % (
+                path,))
+
+    if not isinstance(stream, util.BufferedByteStream):
+        stream = util.BufferedByteStream(stream)
+
+    if stream.read_ushort() > 0x09:
+        raise pyamf.DecodeError("Malformed stream")
+
+    decoder = pyamf.get_decoder(pyamf.AMF0, stream, strict=strict,
+        timezone_offset=timezone_offset, lazy=True)
+    headers = pyamf.ExtractFrame()
+
+    for i in xrange(stream.read_ushort()):
+        name = stream.read_utf8_string(stream.read_ushort())
+        stream.read_uchar()
+        data_len = stream.read_ulong()
+
+        if header_paths:
+            headers[name] = decoder._skipLazyElement()
+        else:
+            _skip_value(stream, decoder, data_len)
+
+    ret = pyamf.extract_paths(pyamf.ExtractFrame(headers=headers),
+        header_paths)
+
+    if not body_paths:
+        return ret
+
+    last = max(body_paths.keys())
+    body_count = stream.read_short()
+
+    for i in xrange(min(body_count, last + 1)):
+        decoder.context.clear()
+
+        target = stream.read_utf8_string(stream.read_ushort())
+        response = stream.read_utf8_string(stream.read_ushort())
+        data_len = stream.read_ulong()
+
+        if i not in body_paths:
+            _skip_value(stream, decoder, data_len)
+
+            continue
+
+        status = STATUS_OK
+        is_request = True
+
+        for code, s in STATUS_CODES.iteritems():
+            if not target.endswith(s):
+                continue
+
+            is_request = False
+            status = code
+            target = target[:0 - len(s)]
+
+        if is_request:
+            if stream.read(1) != '\x0a':
+                raise pyamf.DecodeError("Array type required for request body")
+
+            data = [decoder._skipLazyElement()
+                for j in xrange(stream.read_ulong())]
+        else:
+            data = decoder._skipLazyElement()
+
+        frame = pyamf.ExtractFrame(target=target, response=response,
+            status=status, body=data)
+
+        ret.update(pyamf.extract_paths(
+            pyamf.ExtractFrame(body=pyamf.ExtractFrame({i: frame})),
+            body_paths[i]))
+
+    return ret
+
+
+def _get_frame_size(stream, strings, flags):
+    """
+    Returns the number of bytes, counted from the current position, that make
+    up the header or body starting there. The stream position is not changed.
+
+    :param strings: The number of length prefixed strings in the frame.
+    :param flags: The number of single byte fields following the strings.
+    :raise IOError: The frame preamble is not yet complete.
+    :return: The frame size or `None` if the sender did not declare the
+        length of the data.
+    """
+    pos = stream.tell()
+
+    try:
+        for i in xrange(strings):
+            n = stream.read_ushort()
+
+            if stream.remaining() < n:
+                raise IOError
+
+            stream.seek(n, 1)
+
+        if stream.remaining() < flags:
+            raise IOError
+
+        stream.seek(flags, 1)
+        data_len = stream.read_ulong()
+
+        if data_len == 0xffffffff:
+            return None
+
+        return stream.tell() - pos + data_len
+    finally:
+        stream.seek(pos)
+
+
+class IncrementalDecoder(object):
+    """
+    Decodes a remoting envelope that arrives in chunks, e.g. from a socket.
+
+    Each call to `feed` decodes the headers and bodies that have been
+    completed by the supplied bytes and discards the consumed data. Where the
+    sender declared the length of a header or body, no attempt is made to
+    decode it until all of its bytes have arrived.
+
+    :ivar envelope: The envelope being decoded, `None` until the preamble has
+        been read.
+    :type envelope: :class:`Envelope`
+    :ivar finished: Whether all the bodies of the envelope have been decoded.
+    :type finished: `bool`
+    :see: :class:`pyamf.IncrementalDecoder`
+    :since: 0.6
+    """
+
+    def __init__(self, context=None, strict=False, logger=None,
+        timezone_offset=None):
+        if context is None:
+            context = pyamf.get_context(pyamf.AMF0)
+
+        self.stream = util.BufferedByteStream()
+        self.context = context
+        self.strict = strict
+        self.logger = logger
+        self.decoder = pyamf.get_decoder(pyamf.AMF0, self.stream,
+            context=context, strict=strict, timezone_offset=timezone_offset)
+
+        self.envelope = None
+        self.finished = False
+
+        self._headers = None
+        self._bodies = None
+
+    def feed(self, data):
+        """
+        Adds `data` to the buffer and decodes as much of the envelope as
+        possible.
+
+        :param data: The next chunk of the remoting request/response.
+        :type data: `str`
+        :raise DecodeError: Malformed stream.
+        :raise RuntimeError: Data was supplied after the last body and
+            `strict` is set.
+        :return: A list of `(target, message)` tuples for each body that was
+            completed by `data`.
+        :rtype: `list`
+        """
+        stream = self.stream
+
+        if data:
+            pos = stream.tell()
+
+            stream.seek(0, 2)
+            stream.write(data)
+            stream.seek(pos)
+
+        bodies = []
+
+        try:
+            while not self.finished and self._step(bodies):
+                pass
+        finally:
+            stream.consume()
+
+        if self.finished and self.strict and stream.remaining() > 0:
+            raise RuntimeError("Unable to fully consume the buffer")
+
+        return bodies
+
+    def _step(self, bodies):
+        """
+        Decodes the next part of the envelope.
+
+        :return: `False` if more data is required.
+        """
+        stream = self.stream
+
+        if self.envelope is None:
+            if stream.remaining() < 4:
+                return False
+
+            msg = Envelope()
+            msg.amfVersion = stream.read_ushort()
+
+            if msg.amfVersion > 0x09:
+                raise pyamf.DecodeError("Malformed stream (amfVersion=%d)" %
+                    msg.amfVersion)
+
+            if self.logger is not None:
+                self.logger.debug('remoting.decode start')
+
+            self.envelope = msg
+            self._headers = stream.read_ushort()
+
+            return True
+
+        if self._headers:
+            if not self._attempt(1, 1, _read_header):
+                return False
+
+            name, required, data = self._result
+            self.envelope.headers[name] = data
+
+            if required:
+                self.envelope.headers.set_required(name)
+
+            self._headers -= 1
+
+            return True
+
+        if self._bodies is None:
+            if stream.remaining() < 2:
+                return False
+
+            self._bodies = stream.read_short()
+        elif self._bodies > 0:
+            self.context.clear()
+
+            if not self._attempt(2, 0, _read_body, self.logger):
+                return False
+
+            target, payload = self._result
+            self.envelope[target] = payload
+            bodies.append(self._result)
+
+            self._bodies -= 1
+
+        if self._bodies <= 0:
+            self.finished = True
+
+            if self.logger is not None:
+                self.logger.debug('remoting.decode end')
+
+        return True
+
+    def _attempt(self, strings, flags, func, *args):
+        """
+        Calls `func` to read the next header or body, rolling back the stream
+        and context if the data is incomplete.
+
+        :return: Whether `func` completed.
+        """
+        stream = self.stream
+        pos = stream.tell()
+
+        try:
+            size = _get_frame_size(stream, strings, flags)
+        except IOError:
+            return False
+
+        if size is not None and stream.remaining() < size:
+            return False
+
+        checkpoint = self.context.checkpoint()
+
+        try:
+            self._result = func(stream, self.decoder, self.strict, *args)
+        except (IOError, pyamf.EOStream):
+            self.context.rollback(checkpoint)
+            stream.seek(pos)
+
+            return False
+
+        return True
+
+
+def encode(msg, context=None, strict=False, logger=None, timezone_offset=None,
+           codec_pool=None):
     """
     Encodes AMF stream and returns file object.
 
@@ -684,34 +1107,47 @@ def encode(msg, context=None, strict=False, logger=None, timezone_offset=None):
         UTC. Date/times should always be handled in UTC to avoid confusion but
         this is required for legacy systems.
     :type timezone_offset: `datetime.timedelta`
+    :param codec_pool: If supplied (and `context` is not), the encoder is
+        taken from and returned to this pool.
+    :type codec_pool: :class:`pyamf.CodecPool`
     :rtype: `StringIO`
     :return: File object.
     """
     stream = util.BufferedByteStream()
 
-    if context is None:
-        context = pyamf.get_context(pyamf.AMF0)
+    if context is None and codec_pool is not None:
+        encoder = codec_pool.getEncoder(pyamf.AMF0, stream,
+            timezone_offset=timezone_offset, strict=strict)
+    else:
+        codec_pool = None
 
-    encoder = pyamf.get_encoder(pyamf.AMF0, stream, context=context,
-        timezone_offset=timezone_offset, strict=strict)
+        if context is None:
+            context = pyamf.get_context(pyamf.AMF0)
 
-    if msg.amfVersion == pyamf.AMF3:
-        encoder.use_amf3 = True
+        encoder = pyamf.get_encoder(pyamf.AMF0, stream, context=context,
+            timezone_offset=timezone_offset, strict=strict)
+
+    try:
+        if msg.amfVersion == pyamf.AMF3:
+            encoder.use_amf3 = True
 
-    stream.write_ushort(msg.amfVersion)
-    stream.write_ushort(len(msg.headers))
+        stream.write_ushort(msg.amfVersion)
+        stream.write_ushort(len(msg.headers))
 
-    for name, header in msg.headers.iteritems():
-        _write_header(
-            name, header, int(msg.headers.is_required(name)),
-            stream, encoder, strict)
+        for name, header in msg.headers.iteritems():
+            _write_header(
+                name, header, int(msg.headers.is_required(name)),
+                stream, encoder, strict)
 
-    stream.write_short(len(msg))
+        stream.write_short(len(msg))
 
-    for name, message in msg.iteritems():
-        encoder.context.clear()
+        for name, message in msg.iteritems():
+            encoder.context.clear()
 
-        _write_body(name, message, stream, encoder, strict)
+            _write_body(name, message, stream, encoder, strict)
+    finally:
+        if codec_pool is not None:
+            codec_pool.release(encoder)
 
     stream.seek(0)
 
@@ -7,11 +7,14 @@ Remoting client implementation.
 :since: 0.1.0
 """
 
+import sys
 import httplib
 import urlparse
+import threading
 
 import pyamf
 from pyamf import remoting
+from pyamf.remoting import gateway
 
 
 #: Default user agent is `PyAMF/x.x(.x)`.
@@ -27,6 +30,21 @@ def convert_args(args):
         return [x for x in args]
 
 
+def _get_body(response):
+    """
+    Returns the body of `response`.
+
+    :raise RemotingError: The remote gateway returned an error.
+    """
+    if response.status == remoting.STATUS_ERROR:
+        if hasattr(response.body, 'raiseException'):
+            response.body.raiseException()
+
+        raise remoting.RemotingError
+
+    return response.body
+
+
 class ServiceMethodProxy(object):
     """
     Serves as a proxy for calling a service method.
@@ -79,12 +97,17 @@ class ServiceProxy(object):
         response is returned. If set to `False`, a :class:`RequestWrapper`
         is returned, waiting for the underlying gateway to fire the
         :func:`execute <RemotingService.execute>` method.
+    :ivar _concurrent: If set to `True`, each method call is sent straight
+        away in its own envelope and a :class:`PendingCall` is returned, see
+        :func:`RemotingService.submit`. Takes precedence over
+        `_auto_execute`.
     """
 
-    def __init__(self, gw, name, auto_execute=True):
+    def __init__(self, gw, name, auto_execute=True, concurrent=False):
         self._gw = gw
         self._name = name
         self._auto_execute = auto_execute
+        self._concurrent = concurrent
 
     def __getattr__(self, name):
         return ServiceMethodProxy(self, name)
@@ -97,19 +120,15 @@ class ServiceProxy(object):
         """
         request = self._gw.addRequest(method_proxy, *args)
 
-        if self._auto_execute:
-            response = self._gw.execute_single(request)
+        if self._concurrent:
+            return self._gw.submit(request)
 
-            if response.status == remoting.STATUS_ERROR:
-                if hasattr(response.body, 'raiseException'):
-                    try:
-                        response.body.raiseException()
-                    except:
-                        raise
-                else:
-                    raise remoting.RemotingError
+        if self._auto_execute:
+            if getattr(self._gw, 'batch_window', None) is not None:
+                # share an envelope with the calls of other threads
+                return self._gw.submit(request).result()
 
-            return response.body
+            return _get_body(self._gw.execute_single(request))
 
         return request
 
@@ -176,6 +195,325 @@ class RequestWrapper(object):
     result = property(_get_result, _set_result)
 
 
+class PendingEnvelope(object):
+    """
+    The requests that :func:`RemotingService.submit` sends together in one
+    envelope.
+
+    :ivar requests: The requests in the envelope.
+    :type requests: `list` of :class:`RequestWrapper`
+    :ivar size: The estimated size of the arguments of the requests.
+    :type size: `int`
+    :ivar envelope: The response, once received.
+    :type envelope: :class:`Envelope<pyamf.remoting.Envelope>`
+    :since: 0.6
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.size = 0
+        self.flushed = False
+        self.timer = None
+        self.envelope = None
+        self.exc_info = None
+
+        self._done = threading.Event()
+
+    def finish(self, envelope=None, exc_info=None):
+        """
+        Called with the response envelope, or the error, to wake up the
+        waiting callers.
+        """
+        self.envelope = envelope
+        self.exc_info = exc_info
+
+        self._done.set()
+
+    def join(self, timeout=None):
+        """
+        Waits up to `timeout` seconds for the response.
+
+        :return: Whether the response has been received or sending failed.
+        :rtype: `bool`
+        """
+        self._done.wait(timeout)
+
+        return self._done.isSet()
+
+    def wait(self):
+        """
+        Waits for the response.
+
+        :rtype: :class:`Envelope<pyamf.remoting.Envelope>`
+        :raise Exception: The error raised while sending the envelope.
+        """
+        self.join()
+
+        if self.exc_info is not None:
+            raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+
+        return self.envelope
+
+
+class PendingCall(object):
+    """
+    A request that is being sent by a worker thread of a
+    :class:`RemotingService`, see :func:`RemotingService.submit`.
+
+    :ivar request: The request that was sent.
+    :type request: :class:`RequestWrapper`
+    :ivar envelope: The envelope that the request is sent in.
+    :type envelope: :class:`PendingEnvelope`
+    :since: 0.6
+    """
+
+    def __init__(self, request, envelope):
+        self.request = request
+        self.envelope = envelope
+
+    def __repr__(self):
+        return '<%s %s %s done=%r>' % (self.__class__.__name__,
+            self.request, self.request.service, self.done())
+
+    def done(self):
+        """
+        Whether the response has been received, or the call failed.
+        """
+        return self.envelope.join(0)
+
+    def getResponse(self, timeout=None):
+        """
+        Waits up to `timeout` seconds for the response.
+
+        :rtype: :class:`Response<pyamf.remoting.Response>`
+        :raise RemotingError: No response was received within `timeout`
+            seconds.
+        """
+        if not self.envelope.join(timeout):
+            raise remoting.RemotingError('No response to %s (%s) within %r '
+                'seconds' % (self.request, self.request.service, timeout))
+
+        return self.envelope.wait()[self.request.id]
+
+    def result(self, timeout=None):
+        """
+        Waits up to `timeout` seconds for the response and returns its body,
+        raising the error that the remote gateway returned, if any.
+
+        :raise RemotingError: No response was received within `timeout`
+            seconds.
+        """
+        return _get_body(self.getResponse(timeout))
+
+
+class ConnectionPool(object):
+    """
+    A bounded pool of keep-alive connections to the remote gateway, shared by
+    the worker threads of a :class:`RemotingService`.
+
+    :ivar factory: Called to open a new connection.
+    :ivar size: The maximum number of open connections.
+    :type size: `int`
+    :since: 0.6
+    """
+
+    def __init__(self, factory, size=4):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+
+        self.factory = factory
+        self.size = size
+        self.closed = False
+
+        self._idle = []
+        self._open = 0
+        self._lock = threading.Condition()
+
+    def acquire(self):
+        """
+        Returns an idle connection or opens a new one if fewer than `size`
+        are open, otherwise blocks until a connection is released.
+        """
+        self._lock.acquire()
+
+        try:
+            while not self._idle and self._open >= self.size:
+                self._lock.wait()
+
+            if self._idle:
+                return self._idle.pop()
+
+            self._open += 1
+        finally:
+            self._lock.release()
+
+        try:
+            return self.factory()
+        except:
+            self._forget()
+
+            raise
+
+    def _forget(self):
+        self._lock.acquire()
+
+        try:
+            self._open -= 1
+            self._lock.notify()
+        finally:
+            self._lock.release()
+
+    def release(self, connection, reuse=True):
+        """
+        Returns `connection` to the pool. It is closed instead if it cannot be
+        reused, e.g. after an error, or the pool has been closed.
+        """
+        self._lock.acquire()
+
+        try:
+            if reuse and not self.closed:
+                self._idle.append(connection)
+                self._lock.notify()
+
+                return
+        finally:
+            self._lock.release()
+
+        self._forget()
+        connection.close()
+
+    def close(self):
+        """
+        Closes the idle connections. The connections in use are closed when
+        they are released.
+        """
+        self._lock.acquire()
+
+        try:
+            self.closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._lock.notifyAll()
+        finally:
+            self._lock.release()
+
+        for connection in idle:
+            connection.close()
+
+
+class RequestCollection(object):
+    """
+    The pending requests of a :class:`RemotingService`, in the order they
+    were added and indexed by id. Supports indexing, slicing and `index` like
+    a `list` and compares equal to a `list` of the same requests.
+
+    :since: 0.6
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = {}
+        # may hold removed requests, which are skipped and compacted away
+        self._order = []
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._snapshot())
+
+    def __getitem__(self, i):
+        """
+        Returns the request at position `i`, or a `list` of requests if `i`
+        is a slice.
+        """
+        return self._snapshot()[i]
+
+    def index(self, request):
+        """
+        Returns the position of `request`.
+
+        :raise ValueError: `request` is not in the collection.
+        """
+        for i, r in enumerate(self._snapshot()):
+            if r is request:
+                return i
+
+        raise ValueError("Request %s not found" % (request,))
+
+    def _snapshot(self):
+        self._lock.acquire()
+
+        try:
+            return self._live()
+        finally:
+            self._lock.release()
+
+    def _live(self):
+        index = self._index
+
+        return [r for r in self._order if index.get(r.id) is r]
+
+    def __contains__(self, request):
+        return self._index.get(getattr(request, 'id', None)) is request
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, RequestCollection)):
+            return list(self) == list(other)
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, request):
+        """
+        Adds `request`, replacing any request with the same id.
+        """
+        self._lock.acquire()
+
+        try:
+            self._index[request.id] = request
+            self._order.append(request)
+        finally:
+            self._lock.release()
+
+    def get(self, id_):
+        """
+        Returns the request with the id `id_` or `None`.
+        """
+        return self._index.get(id_)
+
+    def remove(self, request):
+        """
+        :raise LookupError: `request` is not in the collection.
+        """
+        self._lock.acquire()
+
+        try:
+            if self._index.get(request.id) is not request:
+                raise LookupError("Request %s not found" % (request,))
+
+            del self._index[request.id]
+
+            if len(self._order) > 2 * len(self._index) + 16:
+                self._order = self._live()
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        self._lock.acquire()
+
+        try:
+            self._index = {}
+            self._order = []
+        finally:
+            self._lock.release()
+
+
 class RemotingService(object):
     """
     Acts as a client for AMF calls.
@@ -183,8 +521,8 @@ class RemotingService(object):
     :ivar url: The url of the remote gateway. Accepts `http` or `https`
         as valid schemes.
     :type url: `str`
-    :ivar requests: The list of pending requests to process.
-    :type requests: `list`
+    :ivar requests: The pending requests to process.
+    :type requests: :class:`RequestCollection`
     :ivar request_number: A unique identifier for tracking the number of
         requests.
     :ivar amf_version: The AMF version to use.
@@ -205,13 +543,31 @@ class RemotingService(object):
     :type http_headers: `dict`
     :ivar strict: Whether to use strict AMF en/decoding or not.
     :type strict: `bool`
+    :ivar pool_size: The number of worker threads and pooled connections
+        used by :func:`submit`.
+    :type pool_size: `int`
+    :ivar pool: The connections used by :func:`submit`.
+    :type pool: :class:`ConnectionPool`
+    :ivar timeout: The socket timeout of the connections, in seconds. Only
+        supported by `httplib` from Python 2.6.
+    :type timeout: `float` or `None`
+    :ivar batch_window: If set, the requests passed to :func:`submit` within
+        this number of seconds of each other are sent together in one
+        envelope, as are the calls of auto executing :class:`ServiceProxy`
+        objects. `None` disables batching.
+    :type batch_window: `float` or `None`
+    :ivar batch_size: The maximum number of requests in a batched envelope.
+    :type batch_size: `int`
+    :ivar batch_bytes: A batched envelope is sent straight away once the
+        arguments of its requests are estimated to take this number of bytes.
+    :type batch_bytes: `int`
     """
 
     def __init__(self, url, amf_version=pyamf.AMF0, **kwargs):
         self.original_url = url
         self.amf_version = amf_version
 
-        self.requests = []
+        self.requests = RequestCollection()
         self.request_number = 1
         self.headers = remoting.HeaderCollection()
         self.http_headers = {}
@@ -220,10 +576,20 @@ class RemotingService(object):
         self.referer = kwargs.pop('referer', None)
         self.strict = kwargs.pop('strict', False)
         self.logger = kwargs.pop('logger', None)
+        self.pool_size = kwargs.pop('pool_size', 4)
+        self.timeout = kwargs.pop('timeout', None)
+        self.batch_window = kwargs.pop('batch_window', None)
+        self.batch_size = kwargs.pop('batch_size', 100)
+        self.batch_bytes = kwargs.pop('batch_bytes', 65536)
 
         if kwargs:
             raise TypeError('Unexpected keyword arguments %r' % (kwargs,))
 
+        self.pool = None
+        self._thread_pool = None
+        self._pending = None
+        self._lock = threading.Lock()
+
         self._setUrl(url)
 
     def _setUrl(self, url):
@@ -259,15 +625,23 @@ class RemotingService(object):
             if port is None:
                 port = httplib.HTTP_PORT
 
-            self.connection = httplib.HTTPConnection(hostname, port)
+            connection_class = httplib.HTTPConnection
         elif self.url[0] == 'https':
             if port is None:
                 port = httplib.HTTPS_PORT
 
-            self.connection = httplib.HTTPSConnection(hostname, port)
+            connection_class = httplib.HTTPSConnection
         else:
             raise ValueError('Unknown scheme')
 
+        self._connection_args = (connection_class, hostname, port)
+        self.connection = self._createConnection()
+
+        if self.pool is not None:
+            self.pool.close()
+
+        self.pool = ConnectionPool(self._createConnection, self.pool_size)
+
         location = '%s://%s:%s%s' % (self.url[0], hostname, port, self.url[2])
 
         if self.logger:
@@ -275,6 +649,15 @@ class RemotingService(object):
             self.logger.debug('Referer: %s' % self.referer)
             self.logger.debug('User-Agent: %s' % self.user_agent)
 
+    def _createConnection(self):
+        klass, hostname, port = self._connection_args
+        connection = klass(hostname, port)
+
+        if self.timeout is not None:
+            connection.timeout = self.timeout
+
+        return connection
+
     def addHeader(self, name, value, must_understand=False):
         """
         Sets a persistent header to send with each request.
@@ -299,20 +682,23 @@ class RemotingService(object):
         """
         del self.http_headers[name]
 
-    def getService(self, name, auto_execute=True):
+    def getService(self, name, auto_execute=True, concurrent=False):
         """
         Returns a :class:`ServiceProxy` for the supplied name. Sets up an object that
         can have method calls made to it that build the AMF requests.
 
         :param auto_execute: Default is `True`.
         :type auto_execute: `bool`
+        :param concurrent: Calls return a :class:`PendingCall` instead of
+            blocking, see :func:`submit`. Default is `False`.
+        :type concurrent: `bool`
         :raise TypeError: `string` type required for `name`.
         :rtype: :class:`ServiceProxy`
         """
         if not isinstance(name, basestring):
             raise TypeError('string type required')
 
-        return ServiceProxy(self, name, auto_execute)
+        return ServiceProxy(self, name, auto_execute, concurrent)
 
     def getRequest(self, id_):
         """
@@ -320,20 +706,26 @@ class RemotingService(object):
 
         :raise LookupError: Request not found.
         """
-        for request in self.requests:
-            if request.id == id_:
-                return request
+        request = self.requests.get(id_)
+
+        if request is None:
+            raise LookupError("Request %s not found" % id_)
 
-        raise LookupError("Request %s not found" % id_)
+        return request
 
     def addRequest(self, service, *args):
         """
         Adds a request to be sent to the remoting gateway.
         """
-        wrapper = RequestWrapper(self, '/%d' % self.request_number,
-            service, *args)
+        self._lock.acquire()
+
+        try:
+            id_ = '/%d' % self.request_number
+            self.request_number += 1
+        finally:
+            self._lock.release()
 
-        self.request_number += 1
+        wrapper = RequestWrapper(self, id_, service, *args)
         self.requests.append(wrapper)
 
         if self.logger:
@@ -348,19 +740,19 @@ class RemotingService(object):
         :raise LookupError: Request not found.
         """
         if isinstance(service, RequestWrapper):
+            self.requests.remove(service)
+
             if self.logger:
-                self.logger.debug('Removing request: %s' % (
-                    self.requests[self.requests.index(service)]))
-            del self.requests[self.requests.index(service)]
+                self.logger.debug('Removing request: %s' % (service,))
 
             return
 
         for request in self.requests:
             if request.service == service and request.args == args:
+                self.requests.remove(request)
+
                 if self.logger:
-                    self.logger.debug('Removing request: %s' % (
-                        self.requests[self.requests.index(request)]))
-                del self.requests[self.requests.index(request)]
+                    self.logger.debug('Removing request: %s' % (request,))
 
                 return
 
@@ -428,11 +820,27 @@ class RemotingService(object):
 
         return envelope[request.id]
 
-    def execute(self):
+    def execute(self, max_bodies=None, max_bytes=None):
         """
         Builds, sends and handles the responses to all requests listed in
         `self.requests`.
+
+        :param max_bodies: Split the requests into envelopes of at most this
+            many requests.
+        :type max_bodies: `int` or `None`
+        :param max_bytes: Split the requests into envelopes whose arguments
+            are estimated to take at most this many bytes. A single larger
+            request is sent on its own.
+        :type max_bytes: `int` or `None`
+
+        If either is set, the envelopes are sent over the pooled connections
+        at the same time, see :func:`submit`.
         """
+        if max_bodies is not None or max_bytes is not None:
+            self._executeChunked(max_bodies, max_bytes)
+
+            return
+
         body = remoting.encode(self.getAMFRequest(self.requests), strict=self.strict)
 
         if self.logger:
@@ -453,17 +861,222 @@ class RemotingService(object):
 
             self.removeRequest(request)
 
-    def _getResponse(self):
+    def _executeChunked(self, max_bodies, max_bytes):
+        chunks = []
+        pending = None
+
+        for request in self.requests:
+            size = 0
+
+            if max_bytes is not None:
+                size = gateway.estimate_size(request.args, max_bytes)
+
+            if pending is None or (max_bodies is not None and
+                    len(pending.requests) >= max_bodies) or \
+                    (max_bytes is not None and pending.requests and
+                    pending.size + size > max_bytes):
+                pending = PendingEnvelope()
+                chunks.append(pending)
+
+            pending.requests.append(request)
+            pending.size += size
+
+        if self.logger:
+            self.logger.debug('Sending %d request(s) in %d envelope(s)' % (
+                len(self.requests), len(chunks)))
+
+        for pending in chunks:
+            self._flush(pending)
+
+        # every response is applied before the first error is raised, the
+        # requests of an envelope that could not be sent stay pending
+        exc_info = None
+
+        for pending in chunks:
+            try:
+                envelope = pending.wait()
+            except:
+                exc_info = exc_info or sys.exc_info()
+
+                continue
+
+            for name, response in envelope:
+                request = self.getRequest(name)
+                self.removeRequest(request)
+
+                try:
+                    request.setResponse(response)
+                except:
+                    exc_info = exc_info or sys.exc_info()
+
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+
+    def submit(self, request):
+        """
+        Sends `request` from a worker thread, over a pooled keep-alive
+        connection. Up to `pool_size` envelopes are in flight at once, the
+        others wait for a connection. The response is also decoded by the
+        worker thread.
+
+        The request is sent in its own envelope unless :attr:`batch_window`
+        is set, see :func:`flush`.
+
+        :type request: :class:`RequestWrapper`
+        :rtype: :class:`PendingCall`
+        :since: 0.6
+        """
+        size = 0
+
+        if self.batch_window is not None and self.batch_bytes:
+            size = gateway.estimate_size(request.args, self.batch_bytes)
+
+        self.removeRequest(request)
+
+        self._lock.acquire()
+
+        try:
+            pending = self._pending
+
+            if pending is None:
+                pending = PendingEnvelope()
+
+                if self.batch_window is not None:
+                    self._pending = pending
+
+                    pending.timer = threading.Timer(self.batch_window,
+                        self._flush, [pending])
+                    pending.timer.setDaemon(True)
+                    pending.timer.start()
+
+            pending.requests.append(request)
+            pending.size += size
+
+            full = self._pending is not pending or \
+                (self.batch_size and len(pending.requests) >= self.batch_size) \
+                or (self.batch_bytes and pending.size >= self.batch_bytes)
+        finally:
+            self._lock.release()
+
+        if full:
+            self._flush(pending)
+
+        return PendingCall(request, pending)
+
+    def flush(self):
+        """
+        Sends the requests that are waiting for the :attr:`batch_window` to
+        pass straight away.
+
+        :since: 0.6
+        """
+        pending = self._pending
+
+        if pending is not None:
+            self._flush(pending)
+
+    def _flush(self, pending):
+        self._lock.acquire()
+
+        try:
+            if pending.flushed:
+                return
+
+            pending.flushed = True
+
+            if self._pending is pending:
+                self._pending = None
+
+            if self._thread_pool is None:
+                self._thread_pool = gateway.ThreadPool(self.pool_size)
+
+            thread_pool = self._thread_pool
+        finally:
+            self._lock.release()
+
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        try:
+            body = remoting.encode(self.getAMFRequest(pending.requests),
+                strict=self.strict).getvalue()
+        except:
+            pending.finish(exc_info=sys.exc_info())
+
+            return
+
+        if self.logger:
+            self.logger.debug('Sending %d request(s) in one envelope' % (
+                len(pending.requests),))
+
+        thread_pool.submit(lambda body: self._send(pending, body), [body])
+
+    def _send(self, pending, body):
+        try:
+            envelope = self._post(body)
+        except:
+            pending.finish(exc_info=sys.exc_info())
+
+            return
+
+        pending.finish(envelope)
+
+    def _post(self, body):
+        """
+        Sends `body` over a connection from the pool and returns the decoded
+        response envelope.
+        """
+        pool = self.pool
+        connection = pool.acquire()
+
+        try:
+            if self.logger:
+                self.logger.debug('Sending POST request to %s' % self._root_url)
+
+            connection.request('POST', self._root_url, body,
+                self._get_execute_headers())
+
+            envelope = self._getResponse(connection)
+        except:
+            pool.release(connection, False)
+
+            raise
+
+        pool.release(connection)
+
+        return envelope
+
+    def close(self):
+        """
+        Sends any batched requests, then stops the worker threads used by
+        :func:`submit` and closes the pooled connections.
+
+        :since: 0.6
+        """
+        self.flush()
+
+        if self._thread_pool is not None:
+            self._thread_pool.stop()
+            self._thread_pool = None
+
+        self.pool.close()
+
+    def _getResponse(self, connection=None):
         """
         Gets and handles the HTTP response from the remote gateway.
 
+        :param connection: The connection the request was sent over, defaults
+            to `connection`.
         :raise RemotingError: HTTP Gateway reported error status.
         :raise RemotingError: Incorrect MIME type received.
         """
+        if connection is None:
+            connection = self.connection
+
         if self.logger:
             self.logger.debug('Waiting for response...')
 
-        http_response = self.connection.getresponse()
+        http_response = connection.getresponse()
 
         if self.logger:
             self.logger.debug('Got response status: %s' % http_response.status)
@@ -10,6 +10,15 @@ Remoting server implementations.
 import sys
 import types
 import datetime
+import threading
+import copy
+import time
+import Queue
+
+try:
+    from hashlib import sha1
+except ImportError:
+    from sha import new as sha1
 
 import pyamf
 from pyamf import remoting, util
@@ -61,14 +70,28 @@ class ServiceWrapper(object):
     @type service: C{callable}
     @ivar description: A description of the service.
     @type description: C{str}
+    @ivar thread_safe: Whether the service can be called by the L{ThreadPool}
+        of a gateway, concurrently with the other bodies of an envelope.
+    @type thread_safe: C{bool}
+    @ivar cache_ttl: The number of seconds the results of the service are
+        kept in the result cache of a gateway, C{0} for as long as the cache
+        allows. C{None} disables caching, see L{cacheable}.
+    @type cache_ttl: C{int} or C{None}
+    @ivar cache_encoded: Whether the results are cached as
+        L{pyamf.RawAMF} fragments rather than Python objects.
+    @type cache_encoded: C{bool}
     """
     def __init__(self, service, description=None, authenticator=None,
-        expose_request=None, preprocessor=None):
+        expose_request=None, preprocessor=None, thread_safe=True,
+        cache_ttl=None, cache_encoded=False):
         self.service = service
         self.description = description
         self.authenticator = authenticator
         self.expose_request = expose_request
         self.preprocessor = preprocessor
+        self.thread_safe = thread_safe
+        self.cache_ttl = cache_ttl
+        self.cache_encoded = cache_encoded
 
     def __cmp__(self, other):
         if isinstance(other, ServiceWrapper):
@@ -211,6 +234,29 @@ class ServiceWrapper(object):
 
         return self.preprocessor
 
+    def getCachePolicy(self, service_request=None):
+        """
+        Returns a C{(ttl, encoded)} tuple if the results of
+        C{service_request} are cacheable, otherwise C{None}.
+
+        @since: 0.6
+        """
+        policy = None
+
+        if self.cache_ttl is not None:
+            policy = (self.cache_ttl, self.cache_encoded)
+
+        if service_request == None:
+            return policy
+
+        if service_request.method is None:
+            return getattr(self.service, '_pyamf_cache', policy)
+
+        # called for every request, so only look up the method itself
+        method = getattr(self.service, str(service_request.method), None)
+
+        return getattr(method, '_pyamf_cache', policy)
+
 
 class ServiceRequest(object):
     """
@@ -223,7 +269,13 @@ class ServiceRequest(object):
     @ivar method: The method to call on the service. A value of C{None}
         means that the service will be called directly.
     @type method: C{None} or C{str}
+    @ivar target: The target the service was requested by, set by
+        L{BaseGateway.getServiceRequest}.
+    @type target: C{str} or C{None}
     """
+
+    target = None
+
     def __init__(self, amf_request, service, method):
         self.request = amf_request
         self.service = service
@@ -244,6 +296,403 @@ class ServiceCollection(dict):
         return value in self.values()
 
 
+class LRUCache(object):
+    """
+    An in-process, thread safe result cache that discards the least recently
+    used entry once C{size} entries are held. This is the default backend of
+    L{BaseGateway.result_cache}, any object with the same C{get}/C{set}
+    methods, e.g. a memcached client, can be used instead.
+
+    @ivar size: The maximum number of entries.
+    @type size: C{int}
+    @ivar ttl: The number of seconds an entry is kept if C{set} is called
+        without a C{time}, C{0} to keep it until it is discarded.
+    @type ttl: C{int}
+    @since: 0.6
+    """
+
+    def __init__(self, size=1000, ttl=0):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+
+        self.size = size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _unlink(self, entry):
+        entry[0][1] = entry[1]
+        entry[1][0] = entry[0]
+
+    def _link(self, entry):
+        # the most recently used entry is the first
+        entry[0] = self._head
+        entry[1] = self._head[1]
+        self._head[1][0] = entry
+        self._head[1] = entry
+
+    def get(self, key):
+        """
+        @return: The value for C{key} or C{None} if it is not in the cache or
+            has expired.
+        """
+        self._lock.acquire()
+
+        try:
+            try:
+                entry = self._entries[key]
+            except KeyError:
+                return None
+
+            if entry[4] and entry[4] <= _now():
+                self._unlink(entry)
+                del self._entries[key]
+
+                return None
+
+            self._unlink(entry)
+            self._link(entry)
+
+            return entry[3]
+        finally:
+            self._lock.release()
+
+    def set(self, key, value, time=0):
+        """
+        Stores C{value} for C{key}, expiring after C{time} seconds. If
+        C{time} is C{0}, L{ttl} is used.
+        """
+        if not time:
+            time = self.ttl
+
+        expires = 0
+
+        if time:
+            expires = _now() + time
+
+        self._lock.acquire()
+
+        try:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                self._unlink(entry)
+            elif len(self._entries) >= self.size:
+                lru = self._head[0]
+
+                self._unlink(lru)
+                del self._entries[lru[2]]
+
+            entry = self._entries[key] = [None, None, key, value, expires]
+            self._link(entry)
+        finally:
+            self._lock.release()
+
+        return True
+
+    def delete(self, key):
+        """
+        Removes C{key} from the cache.
+        """
+        self._lock.acquire()
+
+        try:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                self._unlink(entry)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """
+        Removes all the entries.
+        """
+        self._lock.acquire()
+
+        try:
+            self._entries = {}
+            self._head = [None, None, None, None, 0]
+            self._head[0] = self._head[1] = self._head
+        finally:
+            self._lock.release()
+
+
+def _now():
+    return time.time()
+
+
+def _canonical(obj, context, seen):
+    """
+    Converts C{obj} to a structure that encodes to the same bytes for equal
+    arguments, i.e. with the keys of dicts and the attributes of objects in
+    order.
+    """
+    if obj is None or isinstance(obj, (basestring, bool, int, long, float,
+            datetime.date, datetime.time, pyamf.UndefinedType)):
+        return obj
+
+    if id(obj) in seen:
+        return ['ref', seen[id(obj)]]
+
+    seen[id(obj)] = len(seen)
+
+    if isinstance(obj, dict):
+        ret = []
+
+        for key in sorted(obj.keys()):
+            ret.append([key, _canonical(obj[key], context, seen)])
+
+        return ['dict', ret]
+
+    if isinstance(obj, (list, tuple)):
+        return ['list', [_canonical(x, context, seen) for x in obj]]
+
+    if hasattr(obj, 'getvalue'):
+        return ['bytes', obj.getvalue()]
+
+    klass = obj.__class__
+    alias = context.getClassAlias(klass)
+    attrs = alias.getEncodableAttributes(obj) or {}
+
+    return [alias.alias or '%s.%s' % (klass.__module__, klass.__name__),
+        _canonical(attrs, context, seen)]
+
+
+def estimate_size(obj, limit=None):
+    """
+    Roughly estimates the number of bytes C{obj} will take to encode. Only
+    as much of C{obj} is walked as is needed to exceed C{limit}, so this is
+    cheap for large objects too.
+
+    @param limit: Stop once the estimate exceeds this number of bytes.
+    @type limit: C{int} or C{None}
+    @rtype: C{int}
+    @since: 0.6
+    """
+    total = 0
+    stack = [obj]
+    seen = {}
+
+    while stack:
+        obj = stack.pop()
+
+        if isinstance(obj, basestring):
+            total += len(obj) + 3
+        elif isinstance(obj, pyamf.RawAMF):
+            total += len(obj)
+        elif isinstance(obj, (list, tuple, dict)) or hasattr(obj, '__dict__'):
+            if id(obj) in seen:
+                # written as a reference
+                total += 2
+
+                continue
+
+            seen[id(obj)] = True
+
+            if not isinstance(obj, (list, tuple, dict)):
+                obj = obj.__dict__
+
+            # every element takes at least a byte
+            total += len(obj) + 3
+
+            if limit is not None and total > limit:
+                return total
+
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            else:
+                stack.extend(obj)
+        else:
+            total += 9
+
+        if limit is not None and total > limit:
+            return total
+
+    return total
+
+
+def exceeds_size(obj, size):
+    """
+    Whether C{obj} will roughly take more than C{size} bytes to encode, see
+    L{estimate_size}.
+
+    @type size: C{int}
+    @rtype: C{bool}
+    @since: 0.6
+    """
+    return estimate_size(obj, size) > size
+
+
+class Batch(object):
+    """
+    The calls submitted to a L{ThreadPool} together, see L{ThreadPool.submit}.
+
+    @since: 0.6
+    """
+
+    def __init__(self, func, items):
+        self.func = func
+        self.items = items
+        self.results = [None] * len(items)
+        self.errors = [None] * len(items)
+
+        self._remaining = len(items)
+        self._done = threading.Condition()
+
+    def run(self, i):
+        """
+        Makes call C{i}, in a worker thread.
+        """
+        try:
+            self.results[i] = self.func(self.items[i])
+        except:
+            self.errors[i] = sys.exc_info()
+
+        self._done.acquire()
+
+        try:
+            self._remaining -= 1
+            self._done.notifyAll()
+        finally:
+            self._done.release()
+
+    def join(self, timeout=None):
+        """
+        Waits up to C{timeout} seconds for all the calls to return.
+
+        @return: Whether all the calls have returned.
+        @rtype: C{bool}
+        """
+        self._done.acquire()
+
+        try:
+            if timeout is None:
+                while self._remaining:
+                    self._done.wait()
+            else:
+                deadline = time.time() + timeout
+
+                while self._remaining:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        break
+
+                    self._done.wait(remaining)
+
+            return self._remaining == 0
+        finally:
+            self._done.release()
+
+    def wait(self):
+        """
+        Waits for all the calls to return.
+
+        @return: The results in the order of the items.
+        @rtype: C{list}
+        @raise Exception: The first exception raised by a call, in the order
+            of the items.
+        """
+        self.join()
+
+        for exc_info in self.errors:
+            if exc_info is not None:
+                raise exc_info[0], exc_info[1], exc_info[2]
+
+        return self.results
+
+
+class ThreadPool(object):
+    """
+    A fixed number of worker threads that a gateway uses to process the
+    bodies of an envelope concurrently. The threads are started when the
+    pool is first used.
+
+    @ivar size: The number of worker threads.
+    @type size: C{int}
+    @since: 0.6
+    """
+
+    def __init__(self, size=4):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+
+        self.size = size
+        self._queue = Queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._lock.acquire()
+
+        try:
+            while len(self._workers) < self.size:
+                t = threading.Thread(target=self._work)
+                t.setDaemon(True)
+                t.start()
+
+                self._workers.append(t)
+        finally:
+            self._lock.release()
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+
+            if job is None:
+                return
+
+            batch, i = job
+            batch.run(i)
+
+    def submit(self, func, items):
+        """
+        Queues a call to C{func} for each of C{items}.
+
+        @rtype: L{Batch}
+        """
+        batch = Batch(func, items)
+
+        self._start()
+
+        for i in xrange(len(items)):
+            self._queue.put((batch, i))
+
+        return batch
+
+    def map(self, func, items):
+        """
+        Calls C{func} with each of C{items} in the worker threads.
+
+        @return: The results in the order of C{items}.
+        @rtype: C{list}
+        """
+        return self.submit(func, items).wait()
+
+    def stop(self):
+        """
+        Stops the worker threads once the queued calls have been made.
+        """
+        self._lock.acquire()
+
+        try:
+            workers, self._workers = self._workers, []
+
+            for t in workers:
+                self._queue.put(None)
+        finally:
+            self._lock.release()
+
+        for t in workers:
+            t.join()
+
+
 class BaseGateway(object):
     """
     Generic Remoting gateway.
@@ -267,6 +716,24 @@ class BaseGateway(object):
     @ivar debug: Provides debugging information when an error occurs. Use only
         in non production settings.
     @type debug: C{bool}
+    @ivar codec_pool: The pool the request decoder and response encoder are
+        taken from. A new pool is created by default, C{None} disables
+        pooling.
+    @type codec_pool: L{pyamf.CodecPool} or C{None}
+    @ivar thread_pool: If set, the bodies of an envelope are processed
+        concurrently by this pool, except for those calling services that are
+        not thread safe which are processed by the calling thread. The
+        responses keep the order of the bodies.
+    @type thread_pool: L{ThreadPool} or C{None}
+    @ivar lazy_bodies: Decode the arguments of each request only when its
+        service is called, so that requests for unknown services or that
+        fail authentication are never decoded. See L{remoting.decode}.
+    @type lazy_bodies: C{bool}
+    @ivar result_cache: Holds the results of the services that are cacheable,
+        see L{cacheable}. An L{LRUCache} is created by default, C{None}
+        disables caching.
+    @type result_cache: L{LRUCache} or an object with the same C{get}/C{set}
+        methods.
     """
 
     _request_class = ServiceRequest
@@ -282,9 +749,21 @@ class BaseGateway(object):
         self.strict = kwargs.pop('strict', False)
         self.logger = kwargs.pop('logger', None)
         self.timezone_offset = kwargs.pop('timezone_offset', None)
+        self.lazy_bodies = kwargs.pop('lazy_bodies', False)
+        self.thread_pool = kwargs.pop('thread_pool', None)
 
         self.debug = kwargs.pop('debug', False)
 
+        if 'codec_pool' in kwargs:
+            self.codec_pool = kwargs.pop('codec_pool')
+        else:
+            self.codec_pool = pyamf.CodecPool()
+
+        if 'result_cache' in kwargs:
+            self.result_cache = kwargs.pop('result_cache')
+        else:
+            self.result_cache = LRUCache()
+
         if kwargs:
             raise TypeError('Unknown kwargs: %r' % (kwargs,))
 
@@ -292,7 +771,8 @@ class BaseGateway(object):
             self.addService(service, name)
 
     def addService(self, service, name=None, description=None,
-        authenticator=None, expose_request=None, preprocessor=None):
+        authenticator=None, expose_request=None, preprocessor=None,
+        thread_safe=True, cache_ttl=None, cache_encoded=False):
         """
         Adds a service to the gateway.
 
@@ -300,6 +780,14 @@ class BaseGateway(object):
         @type service: C{callable}, class instance, or a module
         @param name: The name of the service.
         @type name: C{str}
+        @param thread_safe: Set to C{False} if the service must not be called
+            by the L{ThreadPool} of the gateway.
+        @type thread_safe: C{bool}
+        @param cache_ttl: Cache the results of the service for this number of
+            seconds, see L{ServiceWrapper.cache_ttl}.
+        @type cache_ttl: C{int} or C{None}
+        @param cache_encoded: Cache the results as L{pyamf.RawAMF} fragments.
+        @type cache_encoded: C{bool}
         @raise pyamf.remoting.RemotingError: Service already exists.
         @raise TypeError: C{service} cannot be a scalar value.
         @raise TypeError: C{service} must be C{callable} or a module.
@@ -328,7 +816,8 @@ class BaseGateway(object):
             raise remoting.RemotingError("Service %s already exists" % name)
 
         self.services[name] = ServiceWrapper(service, description,
-            authenticator, expose_request, preprocessor)
+            authenticator, expose_request, preprocessor, thread_safe,
+            cache_ttl, cache_encoded)
 
     def _get_timezone_offset(self):
         if self.timezone_offset is None:
@@ -364,22 +853,27 @@ class BaseGateway(object):
         @type request: L{Request<pyamf.remoting.Request>}
         @rtype: L{ServiceRequest}
         """
+        service_request = None
+
         try:
-            return self._request_class(
+            service_request = self._request_class(
                 request.envelope, self.services[target], None)
         except KeyError:
             pass
 
-        try:
-            sp = target.split('.')
-            name, meth = '.'.join(sp[:-1]), sp[-1]
+        if service_request is None:
+            try:
+                sp = target.split('.')
+                name, meth = '.'.join(sp[:-1]), sp[-1]
 
-            return self._request_class(
-                request.envelope, self.services[name], meth)
-        except (ValueError, KeyError):
-            pass
+                service_request = self._request_class(
+                    request.envelope, self.services[name], meth)
+            except (ValueError, KeyError):
+                raise UnknownServiceError("Unknown service %s" % target)
 
-        raise UnknownServiceError("Unknown service %s" % target)
+        service_request.target = target
+
+        return service_request
 
     def getProcessor(self, request):
         """
@@ -397,6 +891,93 @@ class BaseGateway(object):
 
             return amf0.RequestProcessor(self)
 
+    def isThreadSafe(self, request):
+        """
+        Whether the message C{request} can be processed by the L{ThreadPool},
+        see L{ServiceWrapper.thread_safe}. Flex messages other than
+        C{RemotingMessage}s are not.
+
+        The target of a Flex message is in its body, which is not decoded
+        here if it was read lazily (see L{lazy_bodies}) as that would happen
+        before authentication. Such messages are not thread safe, the
+        processor decodes them in turn.
+
+        @param request: The AMF message.
+        @type request: L{Request<remoting.Request>}
+        @rtype: C{bool}
+        @since: 0.6
+        """
+        target = request.target
+
+        if target == 'null':
+            from pyamf.flex import messaging
+
+            if isinstance(getattr(request, '_body', None), remoting._LazyBody):
+                return False
+
+            try:
+                ro_request = request.body[0]
+            except IndexError:
+                return False
+
+            if not isinstance(ro_request, messaging.RemotingMessage):
+                return False
+
+            target = ro_request.operation
+
+            if not isinstance(target, basestring):
+                # let the processor deal with it
+                return False
+
+            if ro_request.destination:
+                target = '%s.%s' % (ro_request.destination, target)
+
+        try:
+            service_request = self.getServiceRequest(request, target)
+        except UnknownServiceError:
+            return True
+
+        return service_request.service.thread_safe
+
+    def processConcurrently(self, amf_request, process):
+        """
+        Processes the bodies of C{amf_request} with the L{thread_pool}. The
+        bodies that are not thread safe (see L{isThreadSafe}) are processed
+        by the calling thread meanwhile.
+
+        @param process: Called with each message, returns the response.
+        @rtype: L{Envelope<pyamf.remoting.Envelope>}
+        @since: 0.6
+        """
+        safe = []
+        unsafe = []
+        responses = {}
+
+        for name, message in amf_request:
+            if self.isThreadSafe(message):
+                safe.append(name)
+            else:
+                unsafe.append((name, message))
+
+        batch = self.thread_pool.submit(lambda name: process(
+            amf_request[name]), safe)
+
+        try:
+            for name, message in unsafe:
+                responses[name] = process(message)
+        finally:
+            results = batch.wait()
+
+        for name, result in zip(safe, results):
+            responses[name] = result
+
+        response = remoting.Envelope(amf_request.amfVersion)
+
+        for name, message in amf_request:
+            response[name] = responses[name]
+
+        return response
+
     def getResponse(self, amf_request):
         """
         Returns the response to the request.
@@ -498,15 +1079,121 @@ class BaseGateway(object):
 
         return processor(*args)
 
+    def getCachePolicy(self, service_request):
+        """
+        Returns a C{(ttl, encoded)} tuple if the results of
+        C{service_request} are cacheable, otherwise C{None}. This is granular,
+        looking at the service method first, then at the service level.
+
+        Services that are exposed to the underlying http request (see
+        L{mustExposeRequest}) are never cached, the request is not part of
+        the cache key.
+
+        @since: 0.6
+        """
+        if self.result_cache is None:
+            return None
+
+        if self.mustExposeRequest(service_request):
+            return None
+
+        return service_request.service.getCachePolicy(service_request)
+
+    def getCacheKey(self, service_request, args):
+        """
+        Returns the key the result of calling C{service_request} with C{args}
+        is cached under, built from the target, the AMF version of the
+        request and a canonical AMF3 encoding of C{args}.
+
+        @raise pyamf.EncodeError: C{args} cannot be encoded.
+        @rtype: C{str}
+        @since: 0.6
+        """
+        args = _canonical(list(args), pyamf.BaseContext(), {})
+        data = pyamf.encode(args, encoding=pyamf.AMF3).getvalue()
+
+        target = service_request.target
+
+        if isinstance(target, unicode):
+            target = target.encode('utf-8')
+
+        encoding = _get_encoding(service_request)
+
+        return 'pyamf:' + sha1('%s\x00%d\x00%s' % (
+            target, encoding, data)).hexdigest()
+
     def callServiceRequest(self, service_request, *args, **kwargs):
         """
-        Executes the service_request call
+        Executes the service_request call. The result is taken from or stored
+        in the L{result_cache} if the service is cacheable, see
+        L{getCachePolicy}. Exceptions are never cached. Each caller gets its
+        own copy of a cached result, results that cannot be copied are not
+        cached.
         """
+        policy = self.getCachePolicy(service_request)
+        key = None
+
+        if policy is not None:
+            try:
+                key = self.getCacheKey(service_request, args)
+            except pyamf.EncodeError:
+                pass
+
+        if key is not None:
+            cached = self.result_cache.get(key)
+
+            if cached is not None:
+                return _copy_result(cached[0])
+
         if self.mustExposeRequest(service_request):
             http_request = kwargs.get('http_request', None)
             args = (http_request,) + args
 
-        return service_request(*args)
+        result = service_request(*args)
+
+        if key is None:
+            return result
+
+        ttl, encoded = policy
+
+        if encoded:
+            try:
+                result = pyamf.pre_encode(result,
+                    _get_encoding(service_request))
+            except pyamf.EncodeError:
+                pass
+
+        try:
+            cached = _copy_result(result)
+        except (TypeError, copy.Error):
+            return result
+
+        self.result_cache.set(key, (cached,), ttl)
+
+        return result
+
+
+def _copy_result(result):
+    """
+    Returns a copy of the cached C{result} that can be changed without
+    affecting the cache. L{pyamf.RawAMF} fragments are not changed by
+    encoding them, so they are shared.
+    """
+    if isinstance(result, pyamf.RawAMF):
+        return result
+
+    return copy.deepcopy(result)
+
+
+def _get_encoding(service_request):
+    """
+    Returns the AMF version the response to C{service_request} is encoded
+    with.
+    """
+    if getattr(service_request.request, 'amfVersion', None) == pyamf.AMF3:
+        return pyamf.AMF3
+
+    return pyamf.AMF0
 
 
 def authenticate(func, c, expose_request=False):
@@ -555,6 +1242,33 @@ def expose_request(func):
     return func
 
 
+def cacheable(func, ttl=0, encoded=False):
+    """
+    A decorator that makes the results of a service method cacheable in the
+    L{result cache<BaseGateway.result_cache>} of the gateway, keyed on the
+    target and the arguments. Only use it for methods whose result depends on
+    nothing but their arguments.
+
+    @param ttl: The number of seconds a result is cached, C{0} for as long as
+        the cache allows.
+    @param encoded: Cache the results as L{pyamf.RawAMF} fragments, which
+        are written to the responses without being encoded again.
+    @raise TypeError: C{func} must be callable.
+    @since: 0.6
+    """
+    if not callable(func):
+        raise TypeError('func must be callable')
+
+    attr = func
+
+    if isinstance(func, types.UnboundMethodType):
+        attr = func.im_func
+
+    setattr(attr, '_pyamf_cache', (ttl, encoded))
+
+    return func
+
+
 def preprocess(func, c, expose_request=False):
     """
     A decorator that facilitates preprocessing per method. Setting
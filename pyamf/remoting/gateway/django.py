@@ -16,8 +16,10 @@ http = django.http
 conf = __import__('django.conf')
 conf = conf.conf
 
+import copy
+
 import pyamf
-from pyamf import remoting
+from pyamf import remoting, util
 from pyamf.remoting import gateway
 
 __all__ = ['DjangoGateway']
@@ -73,6 +75,16 @@ class DjangoGateway(gateway.BaseGateway):
         :rtype: :class:`Envelope<pyamf.remoting.Envelope>`
         :return: The AMF Response.
         """
+        if self.thread_pool is not None and len(request) > 1:
+            def process(message):
+                # each body gets its own copy of the request
+                r = copy.copy(http_request)
+                r.amf_request = message
+
+                return self.getProcessor(message)(message, http_request=r)
+
+            return self.processConcurrently(request, process)
+
         response = remoting.Envelope(request.amfVersion)
 
         for name, message in request:
@@ -106,7 +118,8 @@ class DjangoGateway(gateway.BaseGateway):
                 raw_data = http_request.body
             request = remoting.decode(raw_data,
                 strict=self.strict, logger=self.logger,
-                timezone_offset=timezone_offset)
+                timezone_offset=timezone_offset, codec_pool=self.codec_pool,
+                lazy=self.lazy_bodies)
         except (pyamf.DecodeError, IOError):
             if self.logger:
                 self.logger.exception('Error decoding AMF request')
@@ -160,7 +173,8 @@ class DjangoGateway(gateway.BaseGateway):
         # Encode the response
         try:
             stream = remoting.encode(response, strict=self.strict,
-                logger=self.logger, timezone_offset=timezone_offset)
+                logger=self.logger, timezone_offset=timezone_offset,
+                codec_pool=self.codec_pool)
         except:
             if self.logger:
                 self.logger.exception('Error encoding AMF request')
@@ -173,12 +187,10 @@ class DjangoGateway(gateway.BaseGateway):
 
             return http.HttpResponseServerError(mimetype='text/plain', content=response)
 
-        buf = stream.getvalue()
+        buf = util.BufferChunks(stream)
 
-        http_response = http.HttpResponse(mimetype=remoting.CONTENT_TYPE)
+        http_response = http.HttpResponse(buf, mimetype=remoting.CONTENT_TYPE)
         http_response['Server'] = gateway.SERVER_NAME
-        http_response['Content-Length'] = str(len(buf))
-
-        http_response.write(buf)
+        http_response['Content-Length'] = str(buf.getSize())
 
         return http_response
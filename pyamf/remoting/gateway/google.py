@@ -75,7 +75,8 @@ class WebAppGateway(webapp.RequestHandler, gateway.BaseGateway):
         # Decode the request
         try:
             request = remoting.decode(body, strict=self.strict,
-                logger=self.logger, timezone_offset=timezone_offset)
+                logger=self.logger, timezone_offset=timezone_offset,
+                codec_pool=self.codec_pool, lazy=self.lazy_bodies)
         except (DecodeError, IOError):
             if self.logger:
                 self.logger.exception('Error decoding AMF request')
@@ -142,7 +143,8 @@ class WebAppGateway(webapp.RequestHandler, gateway.BaseGateway):
         # Encode the response
         try:
             stream = remoting.encode(response, strict=self.strict,
-                logger=self.logger, timezone_offset=timezone_offset)
+                logger=self.logger, timezone_offset=timezone_offset,
+                codec_pool=self.codec_pool)
         except:
             if self.logger:
                 self.logger.exception('Error encoding AMF request')
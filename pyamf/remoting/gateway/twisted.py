@@ -204,6 +204,12 @@ class TwistedGateway(gateway.BaseGateway, resource.Resource):
     @ivar expose_request: Forces the underlying HTTP request to be the first
         argument to any service call.
     @type expose_request: C{bool}
+    @ivar offload_size: Requests and responses larger than this number of
+        bytes are decoded/encoded in the reactor thread pool, smaller ones in
+        the reactor thread where a thread hop costs more than the work. C{0}
+        offloads everything, C{None} nothing. The size of a response is
+        estimated, see L{gateway.exceeds_size}.
+    @type offload_size: C{int} or C{None}
     """
 
     allowedMethods = ('POST',)
@@ -212,6 +218,8 @@ class TwistedGateway(gateway.BaseGateway, resource.Resource):
         if 'expose_request' not in kwargs:
             kwargs['expose_request'] = True
 
+        self.offload_size = kwargs.pop('offload_size', 16384)
+
         gateway.BaseGateway.__init__(self, *args, **kwargs)
         resource.Resource.__init__(self)
 
@@ -237,6 +245,19 @@ class TwistedGateway(gateway.BaseGateway, resource.Resource):
         request.write(content)
         request.finish()
 
+    def _callInThread(self, offload, func, *args, **kwargs):
+        """
+        Calls C{func} in the reactor thread pool if C{offload} is set,
+        otherwise straight away.
+
+        @rtype: C{twisted.internet.defer.Deferred}
+        @since: 0.6
+        """
+        if offload:
+            return threads.deferToThread(func, *args, **kwargs)
+
+        return defer.maybeDeferred(func, *args, **kwargs)
+
     def render_POST(self, request):
         """
         Read remoting request from the client.
@@ -264,10 +285,15 @@ class TwistedGateway(gateway.BaseGateway, resource.Resource):
 
         request.content.seek(0, 0)
         timezone_offset = self._get_timezone_offset()
+        data = request.content.read()
+
+        offload = self.offload_size is not None and \
+            len(data) > self.offload_size
 
-        d = threads.deferToThread(remoting.decode, request.content.read(),
+        d = self._callInThread(offload, remoting.decode, data,
             strict=self.strict, logger=self.logger,
-            timezone_offset=timezone_offset)
+            timezone_offset=timezone_offset, codec_pool=self.codec_pool,
+            lazy=self.lazy_bodies)
 
         def cb(amf_request):
             if self.logger:
@@ -306,9 +332,15 @@ class TwistedGateway(gateway.BaseGateway, resource.Resource):
             self._finaliseRequest(request, 500, body)
 
         timezone_offset = self._get_timezone_offset()
-        d = threads.deferToThread(remoting.encode, amf_response,
+        offload = False
+
+        if self.offload_size is not None:
+            bodies = [message.body for name, message in amf_response]
+            offload = gateway.exceeds_size(bodies, self.offload_size)
+
+        d = self._callInThread(offload, remoting.encode, amf_response,
             strict=self.strict, logger=self.logger,
-            timezone_offset=timezone_offset)
+            timezone_offset=timezone_offset, codec_pool=self.codec_pool)
 
         d.addCallback(cb).addErrback(eb)
 
@@ -23,7 +23,7 @@ of view.
 """
 
 import pyamf
-from pyamf import remoting
+from pyamf import remoting, util
 from pyamf.remoting import gateway
 
 __all__ = ['WSGIGateway']
@@ -43,6 +43,16 @@ class WSGIGateway(gateway.BaseGateway):
         @rtype: L{Envelope<pyamf.remoting.Envelope>}
         @return: The AMF Response.
         """
+        if self.thread_pool is not None and len(request) > 1:
+            def process(message):
+                # each body gets its own copy of the environ
+                env = environ.copy()
+                env['pyamf.request'] = message
+
+                return self.getProcessor(message)(message, http_request=env)
+
+            return self.processConcurrently(request, process)
+
         response = remoting.Envelope(request.amfVersion)
 
         for name, message in request:
@@ -69,8 +79,9 @@ class WSGIGateway(gateway.BaseGateway):
 
     def __call__(self, environ, start_response):
         """
-        @rtype: C{StringIO}
-        @return: File-like object.
+        @rtype: C{list} or L{BufferChunks<pyamf.util.BufferChunks>}
+        @return: The response body. A successful response is returned in
+            chunks, without being joined into a single string.
         """
         if environ['REQUEST_METHOD'] != 'POST':
             return self.badRequestMethod(environ, start_response)
@@ -82,7 +93,8 @@ class WSGIGateway(gateway.BaseGateway):
         # Decode the request
         try:
             request = remoting.decode(body, strict=self.strict,
-                logger=self.logger, timezone_offset=timezone_offset)
+                logger=self.logger, timezone_offset=timezone_offset,
+                codec_pool=self.codec_pool, lazy=self.lazy_bodies)
         except (pyamf.DecodeError, IOError):
             if self.logger:
                 self.logger.exception('Error decoding AMF request')
@@ -152,7 +164,7 @@ class WSGIGateway(gateway.BaseGateway):
         # Encode the response
         try:
             stream = remoting.encode(response, strict=self.strict,
-                timezone_offset=timezone_offset)
+                timezone_offset=timezone_offset, codec_pool=self.codec_pool)
         except:
             if self.logger:
                 self.logger.exception('Error encoding AMF request')
@@ -171,12 +183,12 @@ class WSGIGateway(gateway.BaseGateway):
 
             return [response]
 
-        response = stream.getvalue()
+        response = util.BufferChunks(stream)
 
         start_response('200 OK', [
             ('Content-Type', remoting.CONTENT_TYPE),
-            ('Content-Length', str(len(response))),
+            ('Content-Length', str(response.getSize())),
             ('Server', gateway.SERVER_NAME),
         ])
 
-        return [response]
+        return response
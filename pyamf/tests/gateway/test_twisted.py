@@ -407,6 +407,41 @@ class TwistedGatewayTestCase(unittest.TestCase):
         self.assertTrue(isinstance(gw.getProcessor(a3), _twisted.AMF3RequestProcessor))
         self.assertTrue(isinstance(gw.getProcessor(a0), _twisted.AMF0RequestProcessor))
 
+    def test_offload_size(self):
+        self.assertEquals(_twisted.TwistedGateway().offload_size, 16384)
+
+        offloaded = []
+        deferToThread = _twisted.threads.deferToThread
+
+        def defer_to_thread(func, *args, **kwargs):
+            offloaded.append(func)
+
+            return defer.maybeDeferred(func, *args, **kwargs)
+
+        gw = _twisted.TwistedGateway(offload_size=100, expose_request=False)
+        gw.addService(lambda x: x, 'echo')
+
+        def send(body):
+            env = remoting.Envelope(pyamf.AMF3)
+            env['/1'] = remoting.Request('echo', body=[body])
+
+            request = DummyHTTPRequest()
+            request.content = remoting.encode(env)
+            gw.render_POST(request)
+
+            return remoting.decode(request.content)['/1'].body
+
+        _twisted.threads.deferToThread = defer_to_thread
+
+        try:
+            self.assertEquals(send('spam'), 'spam')
+            self.assertEquals(offloaded, [])
+
+            self.assertEquals(send('spam' * 100), 'spam' * 100)
+            self.assertEquals(offloaded, [remoting.decode, remoting.encode])
+        finally:
+            _twisted.threads.deferToThread = deferToThread
+
 
 class AMF0RequestProcessorTestCase(unittest.TestCase):
     def test_unknown_service_request(self):
@@ -80,6 +80,68 @@ class WSGIServerTestCase(unittest.TestCase):
         self.assertEquals(body.code, 'Service.ResourceNotFound')
         self.assertTrue(self.executed)
 
+    def test_lazy_bodies(self):
+        # the arguments of the request to the unknown service are malformed
+        request = util.BufferedByteStream(
+            '\x00\x00\x00\x00\x00\x01\x00\x09test.test\x00\x02/1\x00\x00'
+            '\x00\x08\x0a\x00\x00\x00\x01\x07\x00\x05')
+
+        env = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(request)),
+            'wsgi.input': request
+        }
+
+        def start_response(status, headers):
+            self.executed = True
+            self.assertEquals(status, '200 OK')
+
+        self.gw.lazy_bodies = True
+        response = self.gw(env, start_response)
+        envelope = remoting.decode(''.join(response))
+
+        message = envelope['/1']
+
+        self.assertEquals(message.status, remoting.STATUS_ERROR)
+        self.assertEquals(message.body.code, 'Service.ResourceNotFound')
+        self.assertTrue(self.executed)
+
+    def test_thread_pool(self):
+        from pyamf.remoting import gateway
+
+        requests = []
+
+        def echo(environ, x):
+            requests.append(environ['pyamf.request'])
+
+            return x
+
+        self.gw.thread_pool = gateway.ThreadPool(2)
+        self.gw.addService(echo, 'echo', expose_request=True)
+
+        msg = remoting.Envelope(amfVersion=pyamf.AMF0)
+
+        for i in range(5):
+            msg['/%d' % i] = remoting.Request(target='echo', body=[i])
+
+        stream = remoting.encode(msg)
+
+        env = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(stream)),
+            'wsgi.input': stream
+        }
+
+        response = self.gw(env, lambda *args: None)
+        envelope = remoting.decode(''.join(response))
+
+        self.assertEquals([(k, v.body) for k, v in envelope],
+            [('/%d' % i, i) for i in range(5)])
+        self.assertEquals(sorted([x.body[0] for x in requests]), range(5))
+        self.assertFalse('pyamf.request' in env)
+
+        self.gw.thread_pool.stop()
+
     def test_eof_decode(self):
         request = util.BufferedByteStream()
 
@@ -220,6 +282,40 @@ class WSGIServerTestCase(unittest.TestCase):
 
         self.assertEquals(message.body, now)
 
+    def test_chunked_response(self):
+        self.gw.addService(lambda x: x, 'echo')
+
+        msg = remoting.Envelope(amfVersion=pyamf.AMF0)
+        msg['/1'] = remoting.Request(target='echo', body=['a' * 100])
+
+        stream = remoting.encode(msg)
+
+        env = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(stream)),
+            'wsgi.input': stream
+        }
+
+        headers = []
+
+        def start_response(status, response_headers):
+            headers.extend(response_headers)
+
+        response = self.gw(env, start_response)
+
+        self.assertTrue(isinstance(response, util.BufferChunks))
+
+        response.chunk_size = 16
+        chunks = list(response)
+
+        self.assertTrue(len(chunks) > 1)
+        self.assertEquals(dict(headers)['Content-Length'],
+            str(sum([len(x) for x in chunks])))
+
+        envelope = remoting.decode(''.join(chunks))
+
+        self.assertEquals(envelope['/1'].body, 'a' * 100)
+
 
 def suite():
     suite = unittest.TestSuite()
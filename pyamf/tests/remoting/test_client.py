@@ -9,7 +9,9 @@ Tests for Remoting client.
 @since: 0.1.0
 """
 
+import sys
 import unittest
+import threading
 
 import pyamf
 from pyamf import remoting
@@ -611,6 +613,423 @@ class RemotingServiceTestCase(unittest.TestCase):
         self.assertRaises(ValueError, gw._getResponse)
 
 
+class RequestCollectionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.requests = client.RequestCollection()
+        self.wrappers = [client.RequestWrapper(None, '/%d' % i, 'spam')
+            for i in range(50)]
+
+        for wrapper in self.wrappers:
+            self.requests.append(wrapper)
+
+    def test_order(self):
+        self.assertEquals(len(self.requests), 50)
+        self.assertEquals(self.requests, self.wrappers)
+        self.assertNotEquals(self.requests, self.wrappers[1:])
+        self.assertNotEquals(self.requests, None)
+
+    def test_get(self):
+        self.assertTrue(self.requests.get('/10') is self.wrappers[10])
+        self.assertEquals(self.requests.get('/100'), None)
+        self.assertTrue(self.wrappers[10] in self.requests)
+        self.assertFalse('/10' in self.requests)
+
+    def test_remove(self):
+        for wrapper in self.wrappers[::2]:
+            self.requests.remove(wrapper)
+
+        self.assertEquals(self.requests, self.wrappers[1::2])
+        self.assertFalse(self.wrappers[0] in self.requests)
+        self.assertRaises(LookupError, self.requests.remove, self.wrappers[0])
+
+        for wrapper in self.wrappers[1::2]:
+            self.requests.remove(wrapper)
+
+        self.assertEquals(self.requests, [])
+        self.assertTrue(len(self.requests._order) <= 16)
+
+    def test_clear(self):
+        self.requests.clear()
+
+        self.assertEquals(self.requests, [])
+        self.assertEquals(self.requests.get('/1'), None)
+
+    def test_sequence(self):
+        self.requests.remove(self.wrappers[0])
+
+        self.assertTrue(self.requests[0] is self.wrappers[1])
+        self.assertTrue(self.requests[-1] is self.wrappers[-1])
+        self.assertEquals(self.requests[1:3], self.wrappers[2:4])
+        self.assertEquals(self.requests[::10], self.wrappers[1::10])
+        self.assertRaises(IndexError, self.requests.__getitem__, 49)
+
+        self.assertEquals(self.requests.index(self.wrappers[1]), 0)
+        self.assertEquals(self.requests.index(self.wrappers[20]), 19)
+        self.assertRaises(ValueError, self.requests.index, self.wrappers[0])
+
+
+class DummyPoolConnection(object):
+    """
+    Answers each request by echoing the first argument of each body. A
+    request with a body of C{'fail'} is not answered at all.
+    """
+
+    def __init__(self, event=None):
+        self.event = event
+        self.requests = 0
+        self.closed = False
+
+    def request(self, method, url, body, headers=None):
+        self.requests += 1
+        request = remoting.decode(body)
+        response = remoting.Envelope(request.amfVersion)
+
+        for name, message in request:
+            if message.body and message.body[0] == 'fail':
+                raise IOError('Connection reset')
+
+            if message.body and message.body[0] == 'error':
+                response[name] = remoting.Response(remoting.ErrorFault(
+                    code='TypeError', description='error'),
+                    status=remoting.STATUS_ERROR)
+            else:
+                response[name] = remoting.Response(message.body[0])
+
+        self.response = DummyResponse(200, remoting.encode(response).getvalue(),
+            {'Content-Type': remoting.CONTENT_TYPE})
+
+    def getresponse(self):
+        if self.event is not None:
+            self.event.wait(5)
+
+        return self.response
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+
+        def factory():
+            connection = DummyPoolConnection()
+            self.opened.append(connection)
+
+            return connection
+
+        self.pool = client.ConnectionPool(factory, 2)
+
+    def test_create(self):
+        self.assertEquals(self.pool.size, 2)
+        self.assertRaises(ValueError, client.ConnectionPool, None, 0)
+
+    def test_reuse(self):
+        a = self.pool.acquire()
+        self.pool.release(a)
+
+        self.assertTrue(self.pool.acquire() is a)
+        self.assertEquals(len(self.opened), 1)
+
+        self.pool.release(a, False)
+
+        self.assertTrue(a.closed)
+        self.assertFalse(self.pool.acquire() is a)
+        self.assertEquals(len(self.opened), 2)
+
+    def test_bounded(self):
+        a = self.pool.acquire()
+        b = self.pool.acquire()
+        acquired = []
+
+        t = threading.Thread(target=lambda: acquired.append(self.pool.acquire()))
+        t.start()
+        t.join(0.1)
+
+        self.assertEquals(acquired, [])
+
+        self.pool.release(b)
+        t.join(5)
+
+        self.assertEquals(acquired, [b])
+        self.assertEquals(len(self.opened), 2)
+
+    def test_close(self):
+        a = self.pool.acquire()
+        b = self.pool.acquire()
+        self.pool.release(a)
+
+        self.pool.close()
+        self.assertTrue(a.closed)
+        self.assertFalse(b.closed)
+
+        self.pool.release(b)
+        self.assertTrue(b.closed)
+
+
+class ConcurrentTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gw = client.RemotingService('http://example.org/gw', pool_size=2)
+        self.connections = []
+        self.event = None
+
+        def factory():
+            connection = DummyPoolConnection(self.event)
+            self.connections.append(connection)
+
+            return connection
+
+        self.gw.pool = client.ConnectionPool(factory, 2)
+
+    def tearDown(self):
+        self.gw.close()
+
+    def test_create(self):
+        gw = client.RemotingService('http://example.org', pool_size=3,
+            timeout=5)
+
+        self.assertEquals(gw.pool.size, 3)
+        self.assertEquals(gw.timeout, 5)
+
+        service = gw.getService('spam', concurrent=True)
+
+        self.assertTrue(service._concurrent)
+
+    def test_submit(self):
+        service = self.gw.getService('spam', concurrent=True)
+        calls = [service.echo(i) for i in range(10)]
+
+        for i, call in enumerate(calls):
+            self.assertTrue(isinstance(call, client.PendingCall))
+            self.assertEquals(call.result(5), i)
+            self.assertTrue(call.done())
+
+        self.assertEquals(self.gw.requests, [])
+        self.assertTrue(len(self.connections) <= 2)
+        self.assertEquals(sum([c.requests for c in self.connections]), 10)
+
+    def test_error(self):
+        service = self.gw.getService('spam', concurrent=True)
+        call = service.echo('error')
+
+        self.assertEquals(call.getResponse(5).status, remoting.STATUS_ERROR)
+        self.assertRaises(TypeError, call.result)
+
+    def test_timeout(self):
+        self.event = threading.Event()
+        service = self.gw.getService('spam', concurrent=True)
+        call = service.echo('spam')
+
+        self.assertRaises(remoting.RemotingError, call.result, 0.05)
+        self.assertFalse(call.done())
+
+        self.event.set()
+
+        self.assertEquals(call.result(5), 'spam')
+
+
+class BatchingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.connections = []
+
+    def getService(self, **kwargs):
+        self.gw = client.RemotingService('http://example.org/gw', **kwargs)
+
+        def factory():
+            connection = DummyPoolConnection()
+            self.connections.append(connection)
+
+            return connection
+
+        self.gw.pool = client.ConnectionPool(factory, 2)
+
+        return self.gw.getService('spam', concurrent=True)
+
+    def tearDown(self):
+        self.gw.close()
+
+    def envelopes(self):
+        return sum([c.requests for c in self.connections])
+
+    def test_create(self):
+        gw = self.gw = client.RemotingService('http://example.org')
+
+        self.assertEquals(gw.batch_window, None)
+        self.assertEquals(gw.batch_size, 100)
+        self.assertEquals(gw.batch_bytes, 65536)
+
+    def test_flush(self):
+        service = self.getService(batch_window=10)
+        calls = [service.echo(i) for i in range(3)]
+
+        self.assertFalse(calls[0].done())
+        self.assertTrue(calls[0].envelope is calls[2].envelope)
+
+        self.gw.flush()
+
+        self.assertEquals([call.result(5) for call in calls], [0, 1, 2])
+        self.assertEquals(self.envelopes(), 1)
+        self.assertEquals(self.gw.requests, [])
+
+    def test_window(self):
+        service = self.getService(batch_window=0.01)
+        calls = [service.echo(i) for i in range(3)]
+
+        self.assertEquals([call.result(5) for call in calls], [0, 1, 2])
+
+    def test_threads(self):
+        service = self.getService(batch_window=0.01, batch_size=7)
+        results = {}
+
+        def caller(i):
+            results[i] = [service.echo((i, j)).result(5) for j in range(5)]
+
+        threads = [threading.Thread(target=caller, args=(i,))
+            for i in range(20)]
+
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+
+        try:
+            for t in threads:
+                t.start()
+
+            for t in threads:
+                t.join(10)
+        finally:
+            sys.setcheckinterval(interval)
+
+        for i in range(20):
+            self.assertEquals(results[i], [[i, j] for j in range(5)])
+
+        self.assertEquals(self.gw.request_number, 101)
+        self.assertEquals(self.gw.requests, [])
+
+    def test_size(self):
+        service = self.getService(batch_window=10, batch_size=2)
+        calls = [service.echo(i) for i in range(5)]
+
+        self.assertEquals([call.result(5) for call in calls[:4]], [0, 1, 2, 3])
+        self.assertEquals(self.envelopes(), 2)
+        self.assertFalse(calls[4].done())
+
+    def test_bytes(self):
+        service = self.getService(batch_window=10, batch_bytes=100)
+
+        small = service.echo('spam')
+        large = service.echo('spam' * 50)
+
+        self.assertEquals(small.result(5), 'spam')
+        self.assertEquals(large.result(5), 'spam' * 50)
+        self.assertEquals(self.envelopes(), 1)
+
+    def test_error(self):
+        service = self.getService(batch_window=10)
+
+        error = service.echo('error')
+        call = service.echo('spam')
+        self.gw.flush()
+
+        self.assertRaises(TypeError, error.result, 5)
+        self.assertEquals(call.result(5), 'spam')
+
+        bad = service.echo(lambda: None)
+        self.gw.flush()
+
+        self.assertRaises(pyamf.EncodeError, bad.result, 5)
+
+    def test_auto_execute(self):
+        self.getService(batch_window=10, batch_size=3)
+        service = self.gw.getService('spam')
+        results = []
+
+        def call(i):
+            results.append(service.echo(i))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(3)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join(5)
+
+        results.sort()
+
+        self.assertEquals(results, [0, 1, 2])
+        self.assertEquals(self.envelopes(), 1)
+
+
+class ChunkedExecuteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gw = client.RemotingService('http://example.org/gw')
+        self.connections = []
+
+        def factory():
+            connection = DummyPoolConnection()
+            self.connections.append(connection)
+
+            return connection
+
+        self.gw.pool = client.ConnectionPool(factory, 2)
+        self.service = self.gw.getService('spam', auto_execute=False)
+
+    def tearDown(self):
+        self.gw.close()
+
+    def envelopes(self):
+        return sum([c.requests for c in self.connections])
+
+    def test_max_bodies(self):
+        wrappers = [self.service.echo(i) for i in range(25)]
+
+        self.gw.execute(max_bodies=10)
+
+        self.assertEquals([w.result for w in wrappers], range(25))
+        self.assertEquals(self.gw.requests, [])
+        self.assertEquals(self.envelopes(), 3)
+
+    def test_max_bytes(self):
+        wrappers = [self.service.echo('x' * 40) for i in range(10)]
+        wrappers.append(self.service.echo('y' * 500))
+
+        self.gw.execute(max_bytes=100)
+
+        self.assertEquals([w.result for w in wrappers],
+            ['x' * 40] * 10 + ['y' * 500])
+        self.assertEquals(self.gw.requests, [])
+        # two small requests per envelope, the large one on its own
+        self.assertEquals(self.envelopes(), 6)
+
+    def test_error(self):
+        ok = self.service.echo('spam')
+        self.service.echo('error')
+
+        self.assertRaises(TypeError, self.gw.execute, max_bodies=1)
+        self.assertEquals(ok.result, 'spam')
+        self.assertFalse(ok in self.gw.requests)
+
+    def test_middle_error(self):
+        first = [self.service.echo(i) for i in range(2)]
+        self.service.echo('error')
+        self.service.echo('error')
+        last = [self.service.echo(i) for i in range(2)]
+
+        self.assertRaises(TypeError, self.gw.execute, max_bodies=2)
+        self.assertEquals([w.result for w in first + last], [0, 1, 0, 1])
+        self.assertEquals(self.gw.requests, [])
+        self.assertEquals(self.envelopes(), 3)
+
+    def test_send_error(self):
+        first = self.service.echo(0)
+        failed = self.service.echo('fail')
+        last = self.service.echo(1)
+
+        self.assertRaises(IOError, self.gw.execute, max_bodies=1)
+        self.assertEquals([first.result, last.result], [0, 1])
+        self.assertEquals(self.gw.requests, [failed])
+
+
 def suite():
     suite = unittest.TestSuite()
 
@@ -618,6 +1037,11 @@ def suite():
     suite.addTest(unittest.makeSuite(ServiceProxyTestCase))
     suite.addTest(unittest.makeSuite(RequestWrapperTestCase))
     suite.addTest(unittest.makeSuite(RemotingServiceTestCase))
+    suite.addTest(unittest.makeSuite(ConnectionPoolTestCase))
+    suite.addTest(unittest.makeSuite(ConcurrentTestCase))
+    suite.addTest(unittest.makeSuite(BatchingTestCase))
+    suite.addTest(unittest.makeSuite(RequestCollectionTestCase))
+    suite.addTest(unittest.makeSuite(ChunkedExecuteTestCase))
 
     return suite
 
@@ -204,6 +204,76 @@ class GetEncodableAttributesTestCase(unittest.TestCase):
         self.assertEquals(attrs['bar']._amf_object, {'foo': 'gak'})
 
 
+class GetEncodableValuesTestCase(unittest.TestCase):
+    """
+    Tests for L{ClassAlias.getEncodableValues}
+    """
+
+    def setUp(self):
+        self.alias = ClassAlias(Spam, 'foo', defer=True)
+        self.obj = Spam()
+
+    def test_dynamic(self):
+        self.alias.compile()
+
+        self.assertEquals(self.alias.encode_attrs, None)
+
+    def test_static(self):
+        self.alias.static_attrs = ['foo', 'bar']
+        self.alias.dynamic = False
+        self.alias.compile()
+
+        self.assertEquals(self.alias.encode_attrs, ('bar', 'foo'))
+
+        self.obj.foo = 'spam'
+        self.obj.bar = 'eggs'
+
+        self.assertEquals(self.alias.getEncodableValues(self.obj),
+            ('eggs', 'spam'))
+
+    def test_single(self):
+        self.alias.static_attrs = ['foo']
+        self.alias.dynamic = False
+        self.alias.compile()
+
+        self.obj.foo = 'spam'
+
+        self.assertEquals(self.alias.getEncodableValues(self.obj), ('spam',))
+
+    def test_missing_static(self):
+        self.alias.static_attrs = ['foo', 'bar']
+        self.alias.dynamic = False
+        self.alias.compile()
+
+        self.obj.foo = 'spam'
+
+        self.assertEquals(self.alias.getEncodableValues(self.obj),
+            (pyamf.Undefined, 'spam'))
+
+    def test_sealed(self):
+        class A(object):
+            __slots__ = ('foo', 'bar')
+
+        alias = ClassAlias(A, static_attrs=['bar'])
+        self.assertEquals(alias.encode_attrs, ('bar', 'foo'))
+
+        a = A()
+        a.foo, a.bar = 'spam', 'eggs'
+
+        self.assertEquals(alias.getEncodableValues(a), ('eggs', 'spam'))
+        self.assertEquals(alias.getEncodableAttributes(a),
+            dict(zip(alias.encode_attrs, alias.getEncodableValues(a))))
+
+    def test_overridden(self):
+        class SpamAlias(ClassAlias):
+            def getEncodableAttributes(self, obj, **kwargs):
+                return {'foo': 'bar'}
+
+        alias = SpamAlias(Spam, 'foo', static_attrs=['foo'], dynamic=False)
+
+        self.assertEquals(alias.encode_attrs, None)
+
+
 class GetDecodableAttributesTestCase(unittest.TestCase):
     """
     Tests for L{ClassAlias.getDecodableAttributes}
@@ -1071,6 +1141,7 @@ def suite():
         ClassAliasTestCase,
         GetDecodableAttributesTestCase,
         GetEncodableAttributesTestCase,
+        GetEncodableValuesTestCase,
         ApplyAttributesTestCase,
         SimpleCompliationTestCase,
         CompilationIntegrationTestCase,
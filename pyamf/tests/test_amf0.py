@@ -14,10 +14,15 @@ import datetime
 import types
 
 import pyamf
-from pyamf import amf0, util
+from pyamf import amf0, amf3, util
 from pyamf.tests.util import check_buffer, EncoderTester, DecoderTester, \
     ClassCacheClearingTestCase, Spam, ClassicSpam, isNaN, isPosInf, isNegInf
 
+try:
+    from cpyamf import amf0 as camf0
+except ImportError:
+    camf0 = None
+
 
 class TypesTestCase(unittest.TestCase):
     """
@@ -217,6 +222,13 @@ class EncoderTestCase(ClassCacheClearingTestCase):
 
         self._run(data)
 
+    def test_vector(self):
+        self._run([
+            (amf3.IntVector([1]), '\x0a\x00\x00\x00\x01\x00\x3f\xf0\x00'
+                '\x00\x00\x00\x00\x00'),
+            (amf3.ObjectVector([1]), '\x0a\x00\x00\x00\x01\x00\x3f\xf0\x00'
+                '\x00\x00\x00\x00\x00')])
+
     def test_longstring(self):
         self._run([('a' * 65537, '\x0c\x00\x01\x00\x01' + 'a' * 65537)])
 
@@ -232,6 +244,27 @@ class EncoderTestCase(ClassCacheClearingTestCase):
                 '\x00\x01b\x00@\x00\x00\x00\x00\x00\x00\x00'
             ), '\x00\x00\t')])
 
+    def test_dictionary(self):
+        self._run([
+            (amf3.Dictionary({'a': 1}),
+                '\x08\x00\x00\x00\x00\x00\x01a\x00?\xf0\x00\x00\x00'
+                '\x00\x00\x00\x00\x00\t'),
+            (amf3.Dictionary({1: 'a'}), '\x11\x11\x03\x00\x04\x01\x06\x03a')])
+
+    def test_dictionary_references(self):
+        k = pyamf.ASObject(a=1)
+        d = amf3.Dictionary([(k, u'b'), (u'c', k)])
+
+        self.encoder.writeElement(d)
+        self.encoder.writeElement(d)
+
+        ret = list(amf0.Decoder(self.buf.getvalue()))
+
+        self.assertTrue(isinstance(ret[0], amf3.Dictionary))
+        self.assertTrue(ret[0] is ret[1])
+        self.assertTrue(ret[0][u'c'] in ret[0])
+        self.assertEquals(ret[0][ret[0][u'c']], u'b')
+
     def test_date(self):
         self._run([
             (datetime.datetime(2005, 3, 18, 1, 58, 31),
@@ -579,6 +612,53 @@ class EncoderTestCase(ClassCacheClearingTestCase):
         self.assertEquals(self.buf.getvalue(), '\x0bBr>\xd8\x1f\xff\x80\x00\x00\x00')
 
 
+class CEncoderTestCase(EncoderTestCase):
+    """
+    Runs L{EncoderTestCase} against the compiled
+    L{Encoder<cpyamf.amf0.Encoder>}.
+    """
+
+    def setUp(self):
+        EncoderTestCase.setUp(self)
+
+        self.encoder = camf0.Encoder(self.buf)
+        self.context = self.encoder.context
+
+    def test_default_stream(self):
+        encoder = camf0.Encoder()
+
+        self.assertTrue(isinstance(encoder.stream, util.BufferedByteStream))
+        self.assertTrue(isinstance(encoder.context, amf0.Context))
+
+    def test_same_output(self):
+        class Foo(object):
+            pass
+
+        pyamf.register_class(Foo, 'foo.Foo')
+
+        x = Foo()
+        x.spam = u'eggs'
+        x.items = [1, 2.5, None, True, 'eggs']
+
+        y = pyamf.MixedArray(spam='eggs')
+        y[0] = 'foo'
+
+        rs = amf0.RecordSet(columns=['a', 'b'], items=[[1, 2], [3, 4]])
+
+        data = [x, x, Foo(), y, {'foo': [x, y]}, 'eggs', u'\xe9', 2 ** 40,
+            -1, datetime.datetime(2009, 9, 24, 14, 23, 23), pyamf.Undefined,
+            rs, 'a' * 0x10000]
+
+        stream = util.BufferedByteStream()
+        encoder = amf0.Encoder(stream)
+
+        for el in data:
+            self.encoder.writeElement(el)
+            encoder.writeElement(el)
+
+        self.assertEquals(self.buf.getvalue(), stream.getvalue())
+
+
 class DecoderTestCase(ClassCacheClearingTestCase):
     """
     Tests the output from the AMF0 L{Decoder<pyamf.amf0.Decoder>} class.
@@ -894,6 +974,58 @@ class DecoderTestCase(ClassCacheClearingTestCase):
         self.assertEquals(f, datetime.datetime(2009, 9, 24, 9, 23, 23))
 
 
+class CDecoderTestCase(DecoderTestCase):
+    """
+    Runs L{DecoderTestCase} against the compiled
+    L{Decoder<cpyamf.amf0.Decoder>}.
+    """
+
+    def setUp(self):
+        DecoderTestCase.setUp(self)
+
+        self.decoder = camf0.Decoder(self.buf)
+        self.context = self.decoder.context
+
+    def test_unsupported_type(self):
+        self.buf.write('\xff')
+        self.buf.seek(0)
+
+        self.assertRaises(pyamf.DecodeError, self.decoder.readElement)
+
+    def test_eof(self):
+        self.assertRaises(pyamf.EOStream, self.decoder.readElement)
+
+    def test_same_output(self):
+        class Foo(object):
+            pass
+
+        pyamf.register_class(Foo, 'foo.Foo')
+
+        x = Foo()
+        x.spam = u'eggs'
+
+        y = pyamf.MixedArray(spam='eggs')
+        y[0] = 'foo'
+
+        rs = amf0.RecordSet(columns=['a', 'b'], items=[[1, 2], [3, 4]])
+
+        data = [x, x, y, [y, 'eggs'], u'\xe9', 2 ** 40, -1, 0.5,
+            datetime.datetime(2009, 9, 24, 14, 23, 23), pyamf.Undefined, rs,
+            'a' * 0x10000]
+
+        bytes = amf0.encode(*data).getvalue()
+
+        self.buf.write(bytes)
+        self.buf.seek(0)
+
+        a = [self.decoder.readElement() for x in data]
+        b = list(amf0.decode(bytes))
+
+        self.assertEquals([type(i) for i in a], [type(i) for i in b])
+        self.assertEquals(amf0.encode(*a).getvalue(), bytes)
+        self.assertTrue(a[0] is a[1])
+
+
 class HelperTestCase(unittest.TestCase):
     def test_encode(self):
         buf = amf0.encode(1)
@@ -1170,6 +1302,197 @@ class ExceptionEncodingTestCase(ClassCacheClearingTestCase):
             '\x07message\x02\x00\x05blarg\x00\x04name\x02\x00\x03XYZ\x00\x00\t')
 
 
+class IncrementalDecoderTestCase(unittest.TestCase):
+    """
+    Tests for L{amf0.IncrementalDecoder}.
+    """
+
+    def test_bytewise(self):
+        l = ['a', 'b', 'c']
+        data = amf0.encode(l, {'a': l}, u'foo', amf3.ByteArray('spam')).getvalue()
+
+        decoder = amf0.IncrementalDecoder()
+        ret = []
+
+        for x in data:
+            ret.extend(decoder.feed(x))
+
+        self.assertEquals(ret[:3], [l, {'a': l}, u'foo'])
+        self.assertTrue(ret[1]['a'] is ret[0])
+        self.assertEquals(ret[3].getvalue(), 'spam')
+
+        self.assertEquals(len(decoder.context.objects), 2)
+        self.assertEquals(decoder.context.amf3_objs, [ret[3]])
+        self.assertEquals(len(decoder.context.amf3_context.objects), 1)
+        self.assertEquals(decoder.remaining(), 0)
+
+    def test_rollback(self):
+        context = amf0.Context()
+        checkpoint = context.checkpoint()
+
+        context.addObject({})
+        context.addAMF3Object([])
+        context.amf3_context = amf3.Context()
+        context.amf3_context.addString('spam')
+
+        context.rollback(checkpoint)
+
+        self.assertEquals(len(context.objects), 0)
+        self.assertEquals(context.amf3_objs, [])
+        self.assertEquals(len(context.amf3_context.strings), 0)
+
+    def _countReads(self, decoder):
+        calls = []
+        read = decoder.decoder.readElement
+
+        class CountingDecoder(object):
+            def readElement(self):
+                calls.append(None)
+
+                return read()
+
+        decoder.decoder = CountingDecoder()
+
+        return calls
+
+    def test_large_element(self):
+        obj = [pyamf.MixedArray(a=i, b=u'spam%d' % (i,), c=[1.5, None])
+            for i in xrange(2000)]
+        obj.append(amf3.ByteArray('x' * 5000))
+        obj.append(pyamf.ASObject(a=pyamf.ASObject(b=[1, 2]), d=u'x' * 70000))
+        data = amf0.encode(obj, u'eggs').getvalue()
+
+        decoder = amf0.IncrementalDecoder()
+        calls = self._countReads(decoder)
+        ret = []
+
+        for i in xrange(0, len(data), 100):
+            ret.extend(decoder.feed(data[i:i + 100]))
+
+        # each element is decoded once, when all of it has arrived
+        self.assertEquals(len(calls), 2)
+        self.assertEquals(ret[0][:2000], obj[:2000])
+        self.assertEquals(ret[0][2000].getvalue(), 'x' * 5000)
+        self.assertEquals(ret[0][2001], obj[2001])
+        self.assertEquals(ret[1], u'eggs')
+        self.assertEquals(decoder.remaining(), 0)
+
+
+class LazyDecoderTestCase(ClassCacheClearingTestCase):
+    """
+    Tests for decoding objects to L{pyamf.LazyObject}s.
+    """
+
+    def setUp(self):
+        ClassCacheClearingTestCase.setUp(self)
+
+        pyamf.register_class(Spam, 'spam.eggs')
+
+    def decode(self, data, **kwargs):
+        buf = pyamf.encode(data, encoding=pyamf.AMF0).getvalue()
+        kwargs.setdefault('lazy', True)
+        decoder = amf0.Decoder(buf, **kwargs)
+
+        return decoder, decoder.readElement()
+
+    def test_typed_object(self):
+        s = Spam()
+        s.foo = [1, 2]
+        s.bar = u'baz'
+        s.self = s
+
+        decoder, x = self.decode([s, s.foo])
+
+        self.assertTrue(isinstance(x[0], pyamf.LazyObject))
+        self.assertTrue(x[0].foo is x[1])
+        self.assertFalse(x[0]._lazy_members['bar'].decoded)
+        self.assertEquals(x[0].bar, u'baz')
+
+        obj = pyamf.materialize(x[0])
+
+        self.assertTrue(isinstance(obj, Spam))
+        self.assertTrue(obj.self is obj)
+        self.assertEquals(obj.foo, [1, 2])
+
+    def test_anonymous(self):
+        decoder, x = self.decode({'a': 1, 'b': {'c': u'd'}})
+
+        self.assertTrue(isinstance(x, pyamf.LazyObject))
+        self.assertEquals(x['a'], 1)
+        self.assertEquals(x.b.c, u'd')
+
+        obj = pyamf.materialize(x)
+
+        self.assertTrue(isinstance(obj, pyamf.ASObject))
+
+    def test_mapping(self):
+        decoder, x = self.decode([{'a': 1, 'b': {'c': u'd'}}, {}])
+        obj, empty = x
+
+        self.assertTrue(isinstance(obj, pyamf.LazyObject))
+        self.assertEquals(len(obj), 2)
+        self.assertTrue('a' in obj)
+        self.assertFalse('z' in obj)
+        self.assertEquals(sorted(obj), ['a', 'b'])
+        self.assertTrue(obj)
+        self.assertFalse(empty)
+        self.assertEquals(len(empty), 0)
+        self.assertEquals(list(empty), [])
+
+        ret = pyamf.materialize(obj)
+
+        self.assertEquals(type(ret['b']), pyamf.ASObject)
+        self.assertEquals(ret['b']['c'], u'd')
+
+    def test_nested_references(self):
+        s = pyamf.ASObject(spam=u'eggs')
+        d = pyamf.ASObject(f=pyamf.ASObject(g=pyamf.ASObject(h=s)))
+
+        decoder, x = self.decode([d, s])
+
+        # s is nested in members of three objects that were read lazily
+        self.assertTrue(isinstance(x[1], pyamf.LazyObject))
+        self.assertEquals(x[1].spam, u'eggs')
+        self.assertTrue(x[0].f.g.h is x[1])
+
+    def test_unknown_alias(self):
+        buf = '\x10\x00\x03foo\x00\x01a\x00?\xf0\x00\x00\x00\x00' \
+            '\x00\x00\x00\x00\t'
+        decoder = amf0.Decoder(buf, lazy=True)
+        x = decoder.readElement()
+
+        self.assertEquals(x.a, 1)
+        self.assertEquals(pyamf.materialize(x), {'a': 1})
+        self.assertEquals(pyamf.materialize(x).alias, 'foo')
+
+        decoder = amf0.Decoder(buf, lazy=True, strict=True)
+
+        self.assertRaises(pyamf.UnknownClassAlias, decoder.readElement)
+
+    def test_amf3(self):
+        s = Spam()
+        s.foo = u'bar'
+        s.bar = pyamf.ASObject(spam=u'eggs')
+
+        stream = util.BufferedByteStream()
+        stream.write('\x03\x00\x01a\x11\x04\x01\x00\x00\t')
+        amf0.Encoder(stream).writeAMF3(s)
+        stream.seek(0)
+
+        decoder = amf0.Decoder(stream, lazy=True)
+
+        # the embedded AMF3 member cannot be skipped
+        x = decoder.readElement()
+
+        self.assertTrue(isinstance(x, pyamf.ASObject))
+        self.assertEquals(x, {'a': 1})
+
+        x = decoder.readElement()
+
+        self.assertTrue(isinstance(x, pyamf.LazyObject))
+        self.assertEquals(x.bar.spam, u'eggs')
+
+
 def suite():
     suite = unittest.TestSuite()
 
@@ -1181,9 +1504,17 @@ def suite():
         RecordSetTestCase,
         HelperTestCase,
         ClassInheritanceTestCase,
-        ExceptionEncodingTestCase
+        ExceptionEncodingTestCase,
+        IncrementalDecoderTestCase,
+        LazyDecoderTestCase
     ]
 
+    if camf0 is not None:
+        test_cases.extend([
+            CEncoderTestCase,
+            CDecoderTestCase
+        ])
+
     for tc in test_cases:
         suite.addTest(unittest.makeSuite(tc))
 
@@ -12,12 +12,18 @@ Tests for AMF3 Implementation.
 import unittest
 import types
 import datetime
+import array
 
 import pyamf
 from pyamf import amf3, util
 from pyamf.tests import util as _util
 from pyamf.tests.util import Spam, check_buffer, assert_buffer
 
+try:
+    from cpyamf import amf3 as camf3
+except ImportError:
+    camf3 = None
+
 
 class MockAlias(object):
     def __init__(self):
@@ -313,6 +319,153 @@ class ClassDefinitionTestCase(_util.ClassCacheClearingTestCase):
         self.assertEquals(x.attr_len, 0)
 
 
+class DecodePlanTestCase(_util.ClassCacheClearingTestCase):
+    """
+    Tests for L{amf3.DecodePlan} and L{amf3.get_decode_plan}.
+    """
+
+    def setUp(self):
+        _util.ClassCacheClearingTestCase.setUp(self)
+
+        self._decode_plans = amf3._decode_plans.copy()
+        self._max_decode_plans = amf3.MAX_DECODE_PLANS
+
+        amf3._decode_plans.clear()
+
+    def tearDown(self):
+        _util.ClassCacheClearingTestCase.tearDown(self)
+
+        amf3._decode_plans.clear()
+        amf3._decode_plans.update(self._decode_plans)
+        amf3.MAX_DECODE_PLANS = self._max_decode_plans
+
+    def test_cache(self):
+        alias = pyamf.register_class(Spam, 'spam.eggs')
+
+        plan = amf3.get_decode_plan(u'spam.eggs', 0, ['foo'])
+
+        self.assertTrue(plan.alias is alias)
+        self.assertEquals(plan.encoding, 0)
+        self.assertEquals(plan.static_properties, ['foo'])
+
+        self.assertTrue(amf3.get_decode_plan('spam.eggs', 0, ['foo']) is plan)
+        self.assertFalse(amf3.get_decode_plan('spam.eggs', 2, ['foo']) is plan)
+        self.assertFalse(amf3.get_decode_plan('spam.eggs', 0, []) is plan)
+
+    def test_reregister(self):
+        pyamf.register_class(Spam, 'spam.eggs')
+        plan = amf3.get_decode_plan('spam.eggs', 0, ['foo'])
+
+        pyamf.unregister_class('spam.eggs')
+        alias = pyamf.register_class(Spam, 'spam.eggs')
+
+        new_plan = amf3.get_decode_plan('spam.eggs', 0, ['foo'])
+
+        self.assertFalse(plan.isValid())
+        self.assertTrue(new_plan.alias is alias)
+
+    def test_unknown(self):
+        plan = amf3.get_decode_plan('spam.eggs', 2, [])
+
+        self.assertEquals(plan.alias.klass, pyamf.TypedObject)
+        self.assertTrue(amf3.get_decode_plan('spam.eggs', 2, []) is plan)
+
+        self.assertRaises(pyamf.UnknownClassAlias, amf3.get_decode_plan,
+            'spam.eggs', 2, [], True)
+
+        pyamf.register_class_loader(lambda x: None)
+
+        self.assertFalse(plan.isValid())
+
+        pyamf.register_class(Spam, 'spam.eggs')
+
+        plan = amf3.get_decode_plan('spam.eggs', 2, [])
+        self.assertEquals(plan.alias.klass, Spam)
+
+    def test_anonymous(self):
+        plan = amf3.get_decode_plan('', 2, [])
+
+        self.assertTrue(plan.alias is pyamf.get_class_alias(pyamf.ASObject))
+
+    def test_bounded(self):
+        amf3.MAX_DECODE_PLANS = 2
+
+        for name in ['a', 'b', 'c', 'd']:
+            amf3.get_decode_plan(name, 2, [])
+
+        self.assertEquals(len(amf3._decode_plans), 2)
+
+    def test_class_definition(self):
+        plan = amf3.get_decode_plan('spam.eggs', 0, ['foo', 'bar'])
+
+        x = plan.getClassDefinition()
+        y = plan.getClassDefinition()
+
+        self.assertFalse(x is y)
+        self.assertTrue(x.plan is plan)
+        self.assertTrue(x.alias is plan.alias)
+        self.assertEquals(x.encoding, 0)
+        self.assertEquals(x.attr_len, 2)
+        self.assertEquals(x.static_properties, ['foo', 'bar'])
+
+    def test_apply_filter(self):
+        class A(object):
+            class __amf__:
+                exclude = ('baz',)
+                readonly = ('gak',)
+
+        pyamf.register_class(A, 'A')
+
+        plan = amf3.get_decode_plan('A', 2, ['foo'])
+
+        a = A()
+        plan.applyAttributes(a, {'foo': 1, 'bar': 2, 'baz': 3, 'gak': 4})
+
+        self.assertEquals(a.__dict__, {'foo': 1, 'bar': 2})
+
+    def test_apply_static(self):
+        class A(object):
+            class __amf__:
+                static = ('foo', 'bar')
+                readonly = ('bar',)
+                dynamic = False
+
+        pyamf.register_class(A, 'A')
+
+        plan = amf3.get_decode_plan('A', 0, ['bar', 'foo'])
+
+        a = A()
+        plan.applyAttributes(a, {'foo': 1, 'bar': 2})
+
+        self.assertEquals(a.__dict__, {'foo': 1})
+
+    def test_apply_alias(self):
+        class SpamAlias(pyamf.ClassAlias):
+            def applyAttributes(self, obj, attrs, codec=None):
+                obj.applied = attrs
+
+        pyamf.CLASS_CACHE['spam.eggs'] = SpamAlias(Spam, 'spam.eggs')
+
+        plan = amf3.get_decode_plan('spam.eggs', 2, [])
+
+        x = Spam()
+        plan.applyAttributes(x, {'foo': 'bar'})
+
+        self.assertEquals(x.applied, {'foo': 'bar'})
+
+    def test_shared(self):
+        pyamf.register_class(Spam, 'spam.eggs')
+
+        bytes = '\n\x13\x13spam.eggs\x07foo\x06\x07bar'
+
+        x = amf3.Decoder(bytes).readElement()
+        y = amf3.Decoder(bytes).readElement()
+
+        self.assertEquals(x.foo, 'bar')
+        self.assertEquals(y.foo, 'bar')
+        self.assertEquals(len(amf3._decode_plans), 1)
+
+
 class EncoderTestCase(_util.ClassCacheClearingTestCase):
     """
     Tests the output from the AMF3 L{Encoder<pyamf.amf3.Encoder>} class.
@@ -440,6 +593,81 @@ class EncoderTestCase(_util.ClassCacheClearingTestCase):
     def test_byte_array(self):
         self._run([(amf3.ByteArray('hello'), '\x0c\x0bhello')])
 
+    def test_int_vector(self):
+        self._run([
+            (amf3.IntVector(), '\x0d\x01\x00'),
+            (amf3.IntVector([1, -2], fixed=True),
+                '\x0d\x05\x01\x00\x00\x00\x01\xff\xff\xff\xfe')])
+
+    def test_uint_vector(self):
+        self._run([(amf3.UintVector([1, 0xffffffff]),
+            '\x0e\x05\x00\x00\x00\x00\x01\xff\xff\xff\xff')])
+
+    def test_number_vector(self):
+        self._run([(amf3.NumberVector([0.5]),
+            '\x0f\x03\x00\x3f\xe0\x00\x00\x00\x00\x00\x00')])
+
+    def test_object_vector(self):
+        self._run([
+            (amf3.ObjectVector([1, 'a'], classname=u'*'),
+                '\x10\x05\x00\x03*\x04\x01\x06\x03a'),
+            (amf3.ObjectVector(fixed=True), '\x10\x01\x01\x01')])
+
+    def test_vector_references(self):
+        x = amf3.IntVector([1])
+
+        self._run([([x, x], '\t\x05\x01\r\x03\x00\x00\x00\x00\x01\r\x02')])
+
+    def test_write_vector(self):
+        self.encoder.writeVector(array.array('h', [1, -2]))
+
+        self.assertEquals(self.buf.getvalue(),
+            '\x0d\x05\x00\x00\x00\x00\x01\xff\xff\xff\xfe')
+        self.buf.truncate()
+
+        self.encoder.writeVector(array.array('c', 'a'))
+        self.assertEquals(self.buf.getvalue(), '\t\x03\x01\x06\x03a')
+
+        if array.array('l').itemsize > 4:
+            self.assertRaises(pyamf.EncodeError, self.encoder.writeVector,
+                array.array('l', [2 ** 40]))
+
+    def test_dictionary(self):
+        self._run([
+            (amf3.Dictionary(), '\x11\x01\x00'),
+            (amf3.Dictionary({1: 'a'}, weak_keys=True),
+                '\x11\x03\x01\x04\x01\x06\x03a'),
+            (amf3.Dictionary({1.5: None}),
+                '\x11\x03\x00\x05\x3f\xf8\x00\x00\x00\x00\x00\x00\x01')])
+        self._run([
+            (amf3.Dictionary({'a': 1}), '\x11\x03\x00\x06\x03a\x04\x01')])
+
+    def test_dictionary_object_keys(self):
+        x = pyamf.ASObject(a=1)
+        d = amf3.Dictionary([(x, x)])
+
+        self._run([(d, '\x11\x03\x00\n\x0b\x01\x03a\x04\x01\x01\n\x02')])
+
+    def test_dictionary_references(self):
+        d = amf3.Dictionary()
+        d['self'] = d
+
+        self._run([([d, d], '\t\x05\x01\x11\x03\x00\x06\tself\x11\x02'
+            '\x11\x02')])
+
+    def test_plain_array(self):
+        self._run([(array.array('i', [1, 2]), '\t\x05\x01\x04\x01\x04\x02')])
+
+    def test_numeric_array(self):
+        self._run([
+            (array.array('d', [0.5, 1]), '\t\x05\x01\x05?\xe0\x00\x00'
+                '\x00\x00\x00\x00\x05?\xf0\x00\x00\x00\x00\x00\x00'),
+            (array.array('L', [0x10000000]), '\t\x03\x01\x05A\xb0\x00\x00'
+                '\x00\x00\x00\x00')])
+
+    def test_char_array(self):
+        self._run([(array.array('c', 'ab'), '\t\x05\x01\x06\x03a\x06\x03b')])
+
     def test_xml(self):
         x = util.ET.fromstring('<a><b>hello world</b></a>')
         self.context.addLegacyXML(x)
@@ -660,6 +888,64 @@ class EncoderTestCase(_util.ClassCacheClearingTestCase):
         self.assertEquals(self.buf.getvalue(), '\x08\x01Br>\xd8\x1f\xff\x80\x00')
 
 
+class CEncoderTestCase(EncoderTestCase):
+    """
+    Runs L{EncoderTestCase} against the compiled
+    L{Encoder<cpyamf.amf3.Encoder>}.
+    """
+
+    def setUp(self):
+        EncoderTestCase.setUp(self)
+
+        self.encoder = camf3.Encoder(self.buf, context=self.context)
+
+    def test_unknown_func(self):
+        self.assertRaises(pyamf.EncodeError, self.encoder.writeElement,
+            self.encoder.writeElement)
+
+    def test_default_stream(self):
+        encoder = camf3.Encoder()
+
+        self.assertTrue(isinstance(encoder.stream, util.BufferedByteStream))
+        self.assertTrue(isinstance(encoder.context, amf3.Context))
+
+        encoder = camf3.Encoder('spam')
+        self.assertEquals(encoder.stream.getvalue(), 'spam')
+
+    def test_same_output(self):
+        class Foo(object):
+            pass
+
+        pyamf.register_class(Foo, 'foo.Foo')
+
+        x = Foo()
+        x.spam = u'eggs'
+        x.items = [1, 2.5, None, True, 'eggs']
+
+        y = pyamf.MixedArray(spam='eggs')
+        y[0] = 'foo'
+
+        data = [x, x, Foo(), y, {'foo': [x, y]}, 'eggs', u'\xe9', 2 ** 40,
+            -1, datetime.datetime(2009, 9, 24, 14, 23, 23), pyamf.Undefined]
+
+        stream = util.BufferedByteStream()
+        encoder = amf3.Encoder(stream)
+
+        for el in data:
+            self.encoder.writeElement(el)
+            encoder.writeElement(el)
+
+        self.assertEquals(self.buf.getvalue(), stream.getvalue())
+
+    def test_string_references(self):
+        self.encoder.string_references = False
+
+        self.encoder.writeElement(['foo', 'foo'])
+
+        self.assertEquals(self.buf.getvalue(),
+            '\t\x05\x01\x06\x07foo\x06\x07foo')
+
+
 class DecoderTestCase(_util.ClassCacheClearingTestCase):
     """
     Tests the output from the AMF3 L{Decoder<pyamf.amf3.Decoder>} class.
@@ -880,6 +1166,124 @@ class DecoderTestCase(_util.ClassCacheClearingTestCase):
     def test_byte_array(self):
         self._run([(amf3.ByteArray('hello'), '\x0c\x0bhello')])
 
+    def test_int_vector(self):
+        self.buf.write('\x0d\x05\x01\x00\x00\x00\x01\xff\xff\xff\xfe')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertTrue(isinstance(x, amf3.IntVector))
+        self.assertEquals(x.tolist(), [1, -2])
+        self.assertTrue(x.fixed)
+
+    def test_uint_vector(self):
+        self.buf.write('\x0e\x05\x00\x00\x00\x00\x01\xff\xff\xff\xff')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertTrue(isinstance(x, amf3.UintVector))
+        self.assertEquals(x.tolist(), [1, 0xffffffff])
+        self.assertFalse(x.fixed)
+
+    def test_number_vector(self):
+        self._run([(amf3.NumberVector([0.5]),
+            '\x0f\x03\x00\x3f\xe0\x00\x00\x00\x00\x00\x00')])
+
+    def test_object_vector(self):
+        self.buf.write('\x10\x05\x01\x03*\x04\x01\x06\x03a')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertTrue(isinstance(x, amf3.ObjectVector))
+        self.assertEquals(x, [1, 'a'])
+        self.assertEquals(x.classname, '*')
+        self.assertTrue(x.fixed)
+
+    def test_vector_references(self):
+        self.buf.write('\t\x05\x01\r\x03\x00\x00\x00\x00\x01\r\x02')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertEquals(x, [amf3.IntVector([1]), amf3.IntVector([1])])
+        self.assertTrue(x[0] is x[1])
+
+    def test_dictionary(self):
+        self.buf.write('\x11\x05\x01\x04\x01\x06\x03a\x06\x03b\x04\x02')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertTrue(isinstance(x, amf3.Dictionary))
+        self.assertEquals(x, {1: 'a', 'b': 2})
+        self.assertTrue(x.weak_keys)
+
+    def test_dictionary_object_keys(self):
+        self.buf.write('\x11\x05\x00\n\x0b\x01\x03a\x04\x01\x01\x04\x01'
+            '\x09\x01\x01\x04\x02')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertEquals(len(x), 2)
+        self.assertFalse(x.weak_keys)
+
+        for key, value in x.iteritems():
+            if isinstance(key, list):
+                self.assertEquals((key, value), ([], 2))
+            else:
+                self.assertEquals((key, value), ({'a': 1}, 1))
+
+    def test_dictionary_references(self):
+        self.buf.write('\x11\x03\x00\x06\tself\x0a\x00')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertTrue(x['self'] is x)
+
+    def test_partial_vector(self):
+        self.buf.write('\x0d\x05\x01\x00\x00\x00\x01\xff\xff')
+        self.buf.seek(0)
+
+        self.assertRaises(IOError, self.decoder.readElement)
+        self.assertEquals(self.buf.tell(), 0)
+
+    def test_typed_arrays(self):
+        self.assertFalse(self.decoder.typed_arrays)
+        self._run([([1, 2], '\t\x05\x01\x04\x01\x04\x02')])
+
+        self.decoder.typed_arrays = True
+        self.buf.truncate()
+        self.context.clear()
+
+        self.buf.write('\t\x07\x01\x04\x01\x04\xff\xff\xff\xff\x04\x03')
+        self.buf.seek(0)
+
+        x = self.decoder.readElement()
+
+        self.assertEquals(x, array.array('l', [1, -1, 3]))
+        self.assertEquals(self.context.getObjectReference(x), 0)
+
+    def test_typed_arrays_float(self):
+        self.decoder.typed_arrays = True
+
+        self.buf.write('\t\x05\x01\x04\x01\x05?\xe0\x00\x00\x00\x00'
+            '\x00\x00')
+        self.buf.seek(0)
+
+        self.assertEquals(self.decoder.readElement(),
+            array.array('d', [1.0, 0.5]))
+
+    def test_typed_arrays_mixed(self):
+        self.decoder.typed_arrays = True
+
+        self._run([
+            ([1, u'a'], '\t\x05\x01\x04\x01\x06\x03a'),
+            ([], '\t\x01\x01')])
+
     def test_date(self):
         import datetime
 
@@ -1009,6 +1413,68 @@ class DecoderTestCase(_util.ClassCacheClearingTestCase):
         self.assertEquals(f, datetime.datetime(2009, 9, 24, 9, 23, 23))
 
 
+class CDecoderTestCase(DecoderTestCase):
+    """
+    Runs L{DecoderTestCase} against the compiled
+    L{Decoder<cpyamf.amf3.Decoder>}.
+    """
+
+    def setUp(self):
+        DecoderTestCase.setUp(self)
+
+        self.decoder = camf3.Decoder(context=self.context)
+        self.decoder.stream = self.buf
+
+    def test_string_references(self):
+        self._run([
+            ('hello', '\x06\x0bhello'),
+            ('hello', '\x06\x00'),
+            ('hello', '\x06\x00')])
+
+    def test_unsupported_type(self):
+        self.buf.write('\xff')
+        self.buf.seek(0)
+
+        self.assertRaises(pyamf.DecodeError, self.decoder.readElement)
+
+    def test_eof(self):
+        self.assertRaises(pyamf.EOStream, self.decoder.readElement)
+
+    def test_iter(self):
+        self.buf.write('\x04\x01\x06\x07foo\x01')
+        self.buf.seek(0)
+
+        self.assertEquals(list(self.decoder), [1, u'foo', None])
+
+    def test_same_output(self):
+        class Foo(object):
+            pass
+
+        pyamf.register_class(Foo, 'foo.Foo')
+
+        x = Foo()
+        x.spam = u'eggs'
+        x.items = [1, 2.5, None, True, u'eggs']
+
+        y = pyamf.MixedArray(spam='eggs')
+        y[0] = 'foo'
+
+        data = [x, x, Foo(), y, {'foo': [x, y]}, 'eggs', u'\xe9', 2 ** 40,
+            -1, datetime.datetime(2009, 9, 24, 14, 23, 23), pyamf.Undefined]
+
+        bytes = amf3.encode(*data).getvalue()
+
+        self.buf.write(bytes)
+        self.buf.seek(0)
+
+        a = [self.decoder.readElement() for x in data]
+        b = list(amf3.Decoder(bytes))
+
+        self.assertEquals(self.buf.remaining(), 0)
+        self.assertEquals(map(type, a), map(type, b))
+        self.assertEquals(amf3.encode(*a).getvalue(), bytes)
+
+
 class ObjectEncodingTestCase(_util.ClassCacheClearingTestCase):
     def setUp(self):
         _util.ClassCacheClearingTestCase.setUp(self)
@@ -1131,6 +1597,18 @@ class ObjectEncodingTestCase(_util.ClassCacheClearingTestCase):
         self.assertEquals(self.stream.getvalue(), '\t\x05\x01\n;\x01\x17description\x05id\tname\x01\x04\x01\x06\x07foo\x01\n\x01\x01\x04\x02\x06\x07bar\x01')
 
 
+class CObjectEncodingTestCase(ObjectEncodingTestCase):
+    """
+    Runs L{ObjectEncodingTestCase} against the compiled
+    L{Encoder<cpyamf.amf3.Encoder>}.
+    """
+
+    def setUp(self):
+        ObjectEncodingTestCase.setUp(self)
+
+        self.encoder = camf3.Encoder(self.stream, self.context)
+
+
 class ObjectDecodingTestCase(_util.ClassCacheClearingTestCase):
     def setUp(self):
         _util.ClassCacheClearingTestCase.setUp(self)
@@ -1228,6 +1706,18 @@ class ObjectDecodingTestCase(_util.ClassCacheClearingTestCase):
         self.assertEquals(x.__dict__, {})
 
 
+class CObjectDecodingTestCase(ObjectDecodingTestCase):
+    """
+    Runs L{ObjectDecodingTestCase} against the compiled
+    L{Decoder<cpyamf.amf3.Decoder>}.
+    """
+
+    def setUp(self):
+        ObjectDecodingTestCase.setUp(self)
+
+        self.decoder = camf3.Decoder(self.stream, self.context)
+
+
 class DataOutputTestCase(unittest.TestCase):
     def setUp(self):
         self.stream = util.BufferedByteStream()
@@ -1776,6 +2266,39 @@ class ByteArrayTestCase(unittest.TestCase):
         b.writeObject(obj)
         self.assertEquals(b.getvalue(), bytes)
 
+    def test_decode_view(self):
+        buf = bytearray('\x0c\x09spam')
+        decoder = amf3.Decoder(buf)
+
+        b = decoder.readElement()
+
+        self.assertTrue(isinstance(b, amf3.ByteArray))
+        self.assertFalse(b.compressed)
+        self.assertEquals(b.getvalue(), 'spam')
+
+        buf[2] = 'S'
+        self.assertEquals(b.getvalue(), 'Spam')
+
+        b.write('eggs')
+        self.assertEquals(b.getvalue(), 'eggs')
+        self.assertEquals(buf, bytearray('\x0c\x09Spam'))
+
+    def test_decode_compressed(self):
+        import zlib
+
+        data = zlib.compress('spam' * 10)
+        buf = bytearray('\x0c' + amf3.encode_int(len(data) << 1 | 1) + data)
+
+        b = amf3.Decoder(buf).readElement()
+
+        self.assertTrue(b.compressed)
+        self.assertEquals(b.getvalue(), 'spam' * 10)
+
+        b = amf3.Decoder(str(buf)).readElement()
+
+        self.assertTrue(b.compressed)
+        self.assertEquals(b.getvalue(), 'spam' * 10)
+
     def test_context(self):
         b = amf3.ByteArray()
         c = b.context
@@ -1802,12 +2325,367 @@ class ByteArrayTestCase(unittest.TestCase):
         self.assertRaises(pyamf.ReferenceError, b.readObject)
 
 
+class DictionaryTestCase(unittest.TestCase):
+    """
+    Tests for L{amf3.Dictionary}.
+    """
+
+    def test_create(self):
+        d = amf3.Dictionary({'a': 1}, weak_keys=True)
+
+        self.assertEquals(d, {'a': 1})
+        self.assertTrue(d.weak_keys)
+        self.assertFalse(amf3.Dictionary().weak_keys)
+
+    def test_unhashable_keys(self):
+        a = pyamf.ASObject()
+        b = pyamf.ASObject()
+        d = amf3.Dictionary()
+
+        d[a] = 1
+        d[b] = 2
+        d[1] = 3
+
+        self.assertEquals(len(d), 3)
+        self.assertEquals(d[a], 1)
+        self.assertEquals(d[b], 2)
+        self.assertTrue(a in d)
+        self.assertFalse(pyamf.ASObject() in d)
+        self.assertRaises(KeyError, d.__getitem__, pyamf.ASObject())
+
+        del d[a]
+
+        self.assertFalse(a in d)
+        self.assertEquals(d.get(b), 2)
+
+    def test_equality(self):
+        self.assertEquals(amf3.Dictionary({1: 2}), amf3.Dictionary({1: 2}))
+        self.assertNotEquals(amf3.Dictionary({1: 2}), {1: 3})
+        self.assertNotEquals(amf3.Dictionary({1: 2}), [1])
+
+
+class IncrementalDecoderTestCase(unittest.TestCase):
+    """
+    Tests for L{amf3.IncrementalDecoder}.
+    """
+
+    def setUp(self):
+        self.obj = pyamf.ASObject(foo='bar', spam=[1, 2, 'bar'])
+        self.data = amf3.encode(self.obj, self.obj, u'foobar', 1.5).getvalue()
+
+    def test_whole(self):
+        decoder = amf3.IncrementalDecoder()
+
+        ret = decoder.feed(self.data)
+
+        self.assertEquals(len(ret), 4)
+        self.assertEquals(ret[0], self.obj)
+        self.assertTrue(ret[0] is ret[1])
+        self.assertEquals(ret[2:], [u'foobar', 1.5])
+        self.assertEquals(decoder.remaining(), 0)
+
+    def test_bytewise(self):
+        decoder = amf3.IncrementalDecoder()
+        ret = []
+
+        for x in self.data:
+            ret.extend(decoder.feed(x))
+
+        self.assertEquals(len(ret), 4)
+        self.assertEquals(ret[0], self.obj)
+        self.assertTrue(ret[0] is ret[1])
+        self.assertEquals(ret[2:], [u'foobar', 1.5])
+
+        self.assertEquals(len(decoder.context.objects), 2)
+        self.assertEquals(len(decoder.context.strings), 4)
+        self.assertEquals(len(decoder.stream), 0)
+
+    def test_partial(self):
+        decoder = amf3.IncrementalDecoder()
+
+        self.assertEquals(decoder.feed('\x06\x0dfoo'), [])
+        self.assertEquals(decoder.remaining(), 5)
+        self.assertEquals(len(decoder.context.strings), 0)
+
+        self.assertEquals(decoder.feed('bar'), [u'foobar'])
+        self.assertEquals(decoder.feed('\x06\x00'), [u'foobar'])
+        self.assertEquals(decoder.feed(''), [])
+
+    def test_rollback(self):
+        decoder = amf3.IncrementalDecoder()
+        decoder.feed(self.data)
+
+        context = decoder.context
+        checkpoint = context.checkpoint()
+        self.assertEquals(checkpoint, (2, 4, 0, 1))
+
+        context.addObject(object())
+        context.addString('spam')
+        context.addClass(amf3.ClassDefinition(pyamf.ClassAlias(Spam,
+            'spam.eggs')), Spam)
+
+        context.rollback(checkpoint)
+
+        self.assertEquals(context.checkpoint(), checkpoint)
+        self.assertEquals(context.getClassByReference(1), None)
+        self.assertEquals(context.getClass(Spam), None)
+
+    def _countReads(self, decoder):
+        calls = []
+        read = decoder.decoder.readElement
+
+        class CountingDecoder(object):
+            def readElement(self):
+                calls.append(None)
+
+                return read()
+
+        decoder.decoder = CountingDecoder()
+
+        return calls
+
+    def test_large_element(self):
+        obj = [pyamf.ASObject(a=i, b=u'spam%d' % (i,), c=[1.5, None])
+            for i in xrange(2000)]
+        obj.append(amf3.ByteArray('x' * 5000))
+        data = amf3.encode(obj, u'eggs').getvalue()
+
+        decoder = amf3.IncrementalDecoder()
+        calls = self._countReads(decoder)
+        ret = []
+
+        for i in xrange(0, len(data), 100):
+            ret.extend(decoder.feed(data[i:i + 100]))
+
+        # each element is decoded once, when all of it has arrived
+        self.assertEquals(len(calls), 2)
+        self.assertEquals(ret[0][:-1], obj[:-1])
+        self.assertEquals(ret[0][-1].getvalue(), 'x' * 5000)
+        self.assertEquals(ret[1], u'eggs')
+        self.assertEquals(decoder.remaining(), 0)
+
+    def test_trait_reference(self):
+        data = amf3.encode(pyamf.ASObject(a=1), [pyamf.ASObject(a=2)]).getvalue()
+
+        decoder = amf3.IncrementalDecoder()
+        calls = self._countReads(decoder)
+        ret = []
+
+        for x in data:
+            ret.extend(decoder.feed(x))
+
+        self.assertEquals(ret, [{'a': 1}, [{'a': 2}]])
+        self.assertEquals(len(calls), 2)
+
+    def test_externalised(self):
+        from pyamf import flex
+
+        obj = flex.ArrayCollection([1, 2, 3])
+        data = amf3.encode(obj, u'spam').getvalue()
+
+        decoder = amf3.IncrementalDecoder()
+        calls = self._countReads(decoder)
+        ret = []
+
+        for x in data:
+            ret.extend(decoder.feed(x))
+
+        self.assertEquals(ret, [obj, u'spam'])
+        self.assertTrue(len(calls) > 2)
+
+
+class LazyDecoderTestCase(_util.ClassCacheClearingTestCase):
+    """
+    Tests for decoding objects to L{pyamf.LazyObject}s.
+    """
+
+    def setUp(self):
+        _util.ClassCacheClearingTestCase.setUp(self)
+
+        pyamf.register_class(Spam, 'spam.eggs')
+
+    def decode(self, data, **kwargs):
+        buf = pyamf.encode(data, encoding=pyamf.AMF3).getvalue()
+        kwargs.setdefault('lazy', True)
+        decoder = amf3.Decoder(buf, **kwargs)
+
+        return decoder, decoder.readElement()
+
+    def test_get_decoder(self):
+        decoder = pyamf.get_decoder(pyamf.AMF3, lazy=True)
+
+        self.assertTrue(isinstance(decoder, amf3.Decoder))
+        self.assertTrue(decoder.lazy)
+        self.assertFalse(amf3.Decoder().lazy)
+
+    def test_members(self):
+        s = Spam()
+        s.foo = [1, 2]
+        s.bar = u'baz'
+
+        decoder, x = self.decode(s)
+
+        self.assertTrue(isinstance(x, pyamf.LazyObject))
+        self.assertFalse(x._lazy_members['foo'].decoded)
+        self.assertEquals(x.bar, u'baz')
+        self.assertFalse(x._lazy_members['foo'].decoded)
+        self.assertEquals(x.foo, [1, 2])
+        self.assertRaises(AttributeError, getattr, x, 'spam')
+
+        obj = pyamf.materialize(x)
+
+        self.assertTrue(isinstance(obj, Spam))
+        self.assertEquals(obj.__dict__, {'foo': [1, 2], 'bar': u'baz'})
+        self.assertTrue(pyamf.materialize(x) is obj)
+        self.assertTrue(obj.foo is x.foo)
+
+    def test_anonymous(self):
+        decoder, x = self.decode({'a': 1, 'b': u'c'})
+
+        self.assertTrue(isinstance(x, pyamf.LazyObject))
+        self.assertEquals(x['a'], 1)
+        self.assertEquals(x.b, u'c')
+        self.assertEquals(x, {'a': 1, 'b': u'c'})
+
+    def test_set_member(self):
+        s = Spam()
+        s.foo = u'bar'
+
+        decoder, x = self.decode(s)
+        x.foo = u'baz'
+        x.spam = u'eggs'
+
+        self.assertEquals(x.foo, u'baz')
+        self.assertEquals(pyamf.materialize(x).__dict__,
+            {'foo': u'baz', 'spam': u'eggs'})
+
+    def test_references(self):
+        s = Spam()
+        l = [u'foo', u'bar']
+        s.items = l
+        s.self = s
+
+        decoder, x = self.decode([s, l, u'bar', {'spam': s}])
+
+        # the reference to the list decoded the member that holds it
+        self.assertTrue(x[0]._lazy_members['items'].decoded)
+        self.assertFalse(x[0]._lazy_members['self'].decoded)
+        self.assertEquals(x[1], [u'foo', u'bar'])
+        self.assertTrue(x[0].items is x[1])
+        self.assertEquals(x[2], u'bar')
+        self.assertTrue(x[3]['spam'] is x[0])
+        self.assertTrue(x[0].self is x[0])
+
+        obj = pyamf.materialize(x[0])
+
+        self.assertTrue(obj.self is obj)
+
+    def test_mapping(self):
+        decoder, x = self.decode([{'a': 1, 'b': {'c': u'd'}}, {}])
+        obj, empty = x
+
+        self.assertTrue(isinstance(obj, pyamf.LazyObject))
+        self.assertEquals(len(obj), 2)
+        self.assertTrue('a' in obj)
+        self.assertFalse('z' in obj)
+        self.assertEquals(sorted(obj), ['a', 'b'])
+        self.assertTrue(obj)
+        self.assertFalse(empty)
+        self.assertEquals(len(empty), 0)
+        self.assertEquals(list(empty), [])
+
+        ret = pyamf.materialize(obj)
+
+        self.assertEquals(type(ret['b']), pyamf.ASObject)
+        self.assertEquals(ret['b']['c'], u'd')
+
+    def test_nested_references(self):
+        s = pyamf.ASObject(spam=u'eggs')
+        d = pyamf.ASObject(f=pyamf.ASObject(g=pyamf.ASObject(h=s)))
+
+        decoder, x = self.decode([d, s])
+
+        # s is nested in members of three objects that were read lazily
+        self.assertTrue(isinstance(x[1], pyamf.LazyObject))
+        self.assertEquals(x[1].spam, u'eggs')
+        self.assertTrue(x[0].f.g.h is x[1])
+
+    def test_context_cleared(self):
+        s = Spam()
+        s.foo = {'bar': [u'baz']}
+
+        decoder, x = self.decode(s)
+        decoder.context.clear()
+
+        self.assertEquals(x.foo['bar'], [u'baz'])
+
+    def test_alias(self):
+        class A(object):
+            class __amf__:
+                lazy = True
+
+        class B(object):
+            class __amf__:
+                lazy = False
+
+        pyamf.register_class(A, 'a')
+        pyamf.register_class(B, 'b')
+
+        decoder, x = self.decode([A(), B(), Spam()], lazy=False)
+
+        self.assertTrue(isinstance(x[0], pyamf.LazyObject))
+        self.assertTrue(isinstance(x[1], B))
+        self.assertTrue(isinstance(x[2], Spam))
+
+        decoder, x = self.decode([A(), B(), Spam()])
+
+        self.assertTrue(isinstance(x[0], pyamf.LazyObject))
+        self.assertTrue(isinstance(x[1], B))
+        self.assertTrue(isinstance(x[2], pyamf.LazyObject))
+
+    def test_external(self):
+        from pyamf import flex
+
+        s = Spam()
+        s.foo = flex.ArrayCollection([u'a'])
+        s.bar = u'a'
+
+        decoder, x = self.decode([s, u'a'])
+
+        self.assertTrue(isinstance(x[0], Spam))
+        self.assertEquals(x[0].foo, [u'a'])
+        self.assertEquals(x[1], u'a')
+
+    def test_encode(self):
+        s = Spam()
+        s.foo = [1, 2]
+
+        data = [s, s.foo]
+        buf = pyamf.encode(data, encoding=pyamf.AMF3).getvalue()
+
+        decoder, x = self.decode(data)
+
+        self.assertEquals(pyamf.encode(x, encoding=pyamf.AMF3).getvalue(),
+            buf)
+
+    def test_truncated(self):
+        s = Spam()
+        s.foo = 1.5
+
+        buf = pyamf.encode(s, encoding=pyamf.AMF3).getvalue()
+        decoder = amf3.Decoder(buf[:-1], lazy=True)
+
+        self.assertRaises(IOError, decoder.readElement)
+        self.assertEquals(decoder.stream.tell(), 0)
+
+
 def suite():
     suite = unittest.TestSuite()
 
     test_cases = [
         TypesTestCase,
         ClassDefinitionTestCase,
+        DecodePlanTestCase,
         ContextTestCase,
         EncoderTestCase,
         DecoderTestCase,
@@ -1819,9 +2697,20 @@ def suite():
         HelperTestCase,
         ComplexEncodingTestCase,
         ExceptionEncodingTestCase,
-        ByteArrayTestCase
+        ByteArrayTestCase,
+        DictionaryTestCase,
+        IncrementalDecoderTestCase,
+        LazyDecoderTestCase
     ]
 
+    if camf3 is not None:
+        test_cases.extend([
+            CEncoderTestCase,
+            CDecoderTestCase,
+            CObjectEncodingTestCase,
+            CObjectDecodingTestCase
+        ])
+
     for tc in test_cases:
         suite.addTest(unittest.makeSuite(tc))
 
@@ -91,12 +91,16 @@ class HelperTestCase(unittest.TestCase):
     def test_get_decoder(self):
         from pyamf import amf0, amf3
 
-        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF0), amf0.Decoder)
-        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF3), amf3.Decoder)
+        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF0, False),
+            amf0.Decoder)
+        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF3, False),
+            amf3.Decoder)
         self.assertRaises(ValueError, pyamf._get_decoder_class, 'spam')
 
-        self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF0), amf0.Decoder))
-        self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF3), amf3.Decoder))
+        self.assertTrue(isinstance(
+            pyamf.get_decoder(pyamf.AMF0, use_ext=False), amf0.Decoder))
+        self.assertTrue(isinstance(
+            pyamf.get_decoder(pyamf.AMF3, use_ext=False), amf3.Decoder))
         self.assertRaises(ValueError, pyamf.get_decoder, 'spam')
 
         context = amf0.Context()
@@ -111,15 +115,46 @@ class HelperTestCase(unittest.TestCase):
         self.assertEquals(decoder.context, context)
         self.assertTrue(decoder.strict)
 
+    def test_get_decoder_extension(self):
+        from pyamf import amf0, amf3
+
+        try:
+            from cpyamf.amf0 import Decoder as Decoder0
+            from cpyamf.amf3 import Decoder as Decoder3
+        except ImportError:
+            Decoder0, Decoder3 = amf0.Decoder, amf3.Decoder
+
+        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF0), Decoder0)
+        self.assertEquals(pyamf._get_decoder_class(pyamf.AMF3), Decoder3)
+        self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF0), Decoder0))
+        self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF3), Decoder3))
+
+        use_ext = pyamf.USE_EXTENSIONS
+        pyamf.USE_EXTENSIONS = False
+
+        try:
+            self.assertEquals(pyamf._get_decoder_class(pyamf.AMF0), amf0.Decoder)
+            self.assertEquals(pyamf._get_decoder_class(pyamf.AMF3), amf3.Decoder)
+            self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF0), amf0.Decoder))
+            self.assertTrue(isinstance(pyamf.get_decoder(pyamf.AMF3), amf3.Decoder))
+            self.assertEquals(pyamf._get_decoder_class(pyamf.AMF0, True), Decoder0)
+            self.assertEquals(pyamf._get_decoder_class(pyamf.AMF3, True), Decoder3)
+        finally:
+            pyamf.USE_EXTENSIONS = use_ext
+
     def test_get_encoder(self):
         from pyamf import amf0, amf3
 
-        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF0), amf0.Encoder)
-        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF3), amf3.Encoder)
+        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF0, False),
+            amf0.Encoder)
+        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF3, False),
+            amf3.Encoder)
         self.assertRaises(ValueError, pyamf._get_encoder_class, 'spam')
 
-        self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF0), amf0.Encoder))
-        self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF3), amf3.Encoder))
+        self.assertTrue(isinstance(
+            pyamf.get_encoder(pyamf.AMF0, use_ext=False), amf0.Encoder))
+        self.assertTrue(isinstance(
+            pyamf.get_encoder(pyamf.AMF3, use_ext=False), amf3.Encoder))
         self.assertRaises(ValueError, pyamf.get_encoder, 'spam')
 
         context = amf0.Context()
@@ -138,6 +173,33 @@ class HelperTestCase(unittest.TestCase):
         encoder = pyamf.get_encoder(pyamf.AMF3, strict=True)
         self.assertTrue(encoder.strict)
 
+    def test_get_encoder_extension(self):
+        from pyamf import amf0, amf3
+
+        try:
+            from cpyamf.amf0 import Encoder as Encoder0
+            from cpyamf.amf3 import Encoder as Encoder3
+        except ImportError:
+            Encoder0, Encoder3 = amf0.Encoder, amf3.Encoder
+
+        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF0), Encoder0)
+        self.assertEquals(pyamf._get_encoder_class(pyamf.AMF3), Encoder3)
+        self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF0), Encoder0))
+        self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF3), Encoder3))
+
+        use_ext = pyamf.USE_EXTENSIONS
+        pyamf.USE_EXTENSIONS = False
+
+        try:
+            self.assertEquals(pyamf._get_encoder_class(pyamf.AMF0), amf0.Encoder)
+            self.assertEquals(pyamf._get_encoder_class(pyamf.AMF3), amf3.Encoder)
+            self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF0), amf0.Encoder))
+            self.assertTrue(isinstance(pyamf.get_encoder(pyamf.AMF3), amf3.Encoder))
+            self.assertEquals(pyamf._get_encoder_class(pyamf.AMF0, True), Encoder0)
+            self.assertEquals(pyamf._get_encoder_class(pyamf.AMF3, True), Encoder3)
+        finally:
+            pyamf.USE_EXTENSIONS = use_ext
+
     def test_encode(self):
         self.assertEquals('\x06\x0fconnect\x05?\xf0\x00\x00\x00\x00\x00\x00',
             pyamf.encode(u'connect', 1.0).getvalue())
@@ -331,6 +393,167 @@ class TypeMapTestCase(unittest.TestCase):
         self.assertEquals(td, td2)
 
 
+class DispatchCacheTestCase(unittest.TestCase):
+    """
+    Tests for the process-wide encoder dispatch cache.
+    """
+
+    def setUp(self):
+        self.tm = dict(pyamf.TYPE_MAP)
+
+        class Foo(object):
+            pass
+
+        self.klass = Foo
+
+    def tearDown(self):
+        pyamf.TYPE_MAP = self.tm
+
+    def encode(self, obj):
+        encoder = pyamf.get_encoder(pyamf.AMF3)
+        encoder.writeElement(obj)
+
+        return encoder
+
+    def getKey(self, encoder):
+        return (encoder.__class__, self.klass)
+
+    def test_shared(self):
+        encoder = self.encode(self.klass())
+        key = self.getKey(encoder)
+
+        self.assertTrue(key in pyamf.get_dispatch_table())
+
+        other = self.encode(self.klass())
+
+        self.assertNotEquals(encoder, other)
+        self.assertTrue(key in pyamf.get_dispatch_table())
+
+    def test_snapshot(self):
+        table = pyamf.get_dispatch_table()
+        table['spam'] = 'eggs'
+
+        self.assertFalse('spam' in pyamf.get_dispatch_table())
+
+    def test_add_type(self):
+        encoder = self.encode(self.klass())
+        self.assertTrue(self.getKey(encoder) in pyamf.get_dispatch_table())
+
+        pyamf.add_type(self.klass, lambda obj, encoder: 'spam')
+        self.assertFalse(self.getKey(encoder) in pyamf.get_dispatch_table())
+
+        encoder = self.encode(self.klass())
+        self.assertEquals(encoder.stream.getvalue(), '\x06\tspam')
+
+        pyamf.remove_type(self.klass)
+        self.assertFalse(self.getKey(encoder) in pyamf.get_dispatch_table())
+
+        encoder = self.encode(self.klass())
+        self.assertEquals(encoder.stream.getvalue(), '\n\x0b\x01\x01')
+
+    def test_register_class(self):
+        encoder = self.encode(self.klass())
+        self.assertTrue(self.getKey(encoder) in pyamf.get_dispatch_table())
+
+        pyamf.register_class(self.klass, 'foo.Bar')
+
+        try:
+            self.assertFalse(self.getKey(encoder) in pyamf.get_dispatch_table())
+        finally:
+            pyamf.unregister_class(self.klass)
+
+    def test_type_map_replaced(self):
+        encoder = self.encode(self.klass())
+
+        pyamf.TYPE_MAP = {self.klass: lambda obj, encoder: 'spam'}
+
+        encoder = self.encode(self.klass())
+        self.assertEquals(encoder.stream.getvalue(), '\x06\tspam')
+
+
+class CodecPoolTestCase(unittest.TestCase):
+    """
+    Tests for L{pyamf.CodecPool}.
+    """
+
+    def setUp(self):
+        self.pool = pyamf.CodecPool()
+
+    def test_reuse(self):
+        encoder = self.pool.getEncoder(pyamf.AMF3)
+        encoder.writeElement('foo')
+        context = encoder.context
+
+        self.assertEquals(encoder.stream.getvalue(), '\x06\x07foo')
+        self.pool.release(encoder)
+
+        self.assertEquals(encoder.stream, None)
+        self.assertEquals(len(context.strings), 0)
+
+        other = self.pool.getEncoder(pyamf.AMF3, strict=True)
+
+        self.assertTrue(other is encoder)
+        self.assertTrue(other.context is context)
+        self.assertTrue(other.strict)
+
+        other.writeElement('foo')
+        self.assertEquals(other.stream.getvalue(), '\x06\x07foo')
+
+    def test_decoder(self):
+        decoder = self.pool.getDecoder(pyamf.AMF0, '\x02\x00\x03foo')
+        self.assertEquals(decoder.readElement(), 'foo')
+        self.pool.release(decoder)
+
+        other = self.pool.getDecoder(pyamf.AMF0, '\x02\x00\x03bar')
+
+        self.assertTrue(other is decoder)
+        self.assertEquals(other.readElement(), 'bar')
+
+    def test_amf3_switch(self):
+        for i in range(2):
+            encoder = self.pool.getEncoder(pyamf.AMF0)
+            encoder.use_amf3 = True
+            encoder.writeElement(pyamf.ASObject(a='b'))
+
+            self.assertEquals(encoder.stream.getvalue(),
+                '\x11\n\x0b\x01\x03a\x06\x03b\x01')
+            self.pool.release(encoder)
+
+        encoder = self.pool.getEncoder(pyamf.AMF0)
+        self.assertFalse(encoder.use_amf3)
+
+    def test_max_size(self):
+        self.pool.max_size = 1
+
+        a = self.pool.getEncoder(pyamf.AMF0)
+        b = self.pool.getEncoder(pyamf.AMF0)
+
+        self.assertFalse(a is b)
+
+        self.pool.release(a)
+        self.pool.release(b)
+
+        self.assertTrue(self.pool.getEncoder(pyamf.AMF0) is a)
+        self.assertFalse(self.pool.getEncoder(pyamf.AMF0) is b)
+
+    def test_thread_local(self):
+        import threading
+
+        released = []
+
+        def release():
+            encoder = self.pool.getEncoder(pyamf.AMF0)
+            self.pool.release(encoder)
+            released.append(encoder)
+
+        t = threading.Thread(target=release)
+        t.start()
+        t.join()
+
+        self.assertEquals(len(released), 1)
+        self.assertFalse(self.pool.getEncoder(pyamf.AMF0) is released[0])
+
+
 class ErrorClassMapTestCase(unittest.TestCase):
     """
     I test all functionality related to manipulating L{pyamf.ERROR_CLASS_MAP}
@@ -502,6 +725,69 @@ class BaseContextTestCase(unittest.TestCase):
         self.assertEquals(alias.__class__, DummyAlias)
         self.assertEquals(alias.klass, B)
 
+    def test_alias_cache_clear(self):
+        x = pyamf.BaseContext()
+
+        class A:
+            pass
+
+        calls = []
+        get_class_alias = pyamf.util.get_class_alias
+
+        def wrapped(klass):
+            calls.append(klass)
+
+            return get_class_alias(klass)
+
+        pyamf.util.get_class_alias = wrapped
+
+        try:
+            alias = x.getClassAlias(A)
+            x.clear()
+
+            self.assertEquals(x.class_aliases, {})
+            self.assertTrue(x.getClassAlias(A) is alias)
+            self.assertTrue(pyamf.BaseContext().getClassAlias(A) is alias)
+        finally:
+            pyamf.util.get_class_alias = get_class_alias
+
+        self.assertEquals(calls, [A])
+
+    def test_alias_cache_alias_type(self):
+        class A:
+            pass
+
+        alias = pyamf.BaseContext().getClassAlias(A)
+        self.assertEquals(alias.__class__, pyamf.ClassAlias)
+
+        pyamf.register_alias_type(DummyAlias, A)
+
+        try:
+            alias = pyamf.BaseContext().getClassAlias(A)
+            self.assertEquals(alias.__class__, DummyAlias)
+        finally:
+            pyamf.unregister_alias_type(DummyAlias)
+
+        alias = pyamf.BaseContext().getClassAlias(A)
+        self.assertEquals(alias.__class__, pyamf.ClassAlias)
+
+    def test_alias_cache_register_class(self):
+        class A:
+            pass
+
+        unaliased = pyamf.BaseContext().getClassAlias(A)
+        self.assertTrue(A in pyamf._unaliased_cache)
+
+        alias = pyamf.register_class(A, 'spam.eggs')
+
+        try:
+            self.assertFalse(A in pyamf._unaliased_cache)
+            self.assertTrue(pyamf.BaseContext().getClassAlias(A) is alias)
+        finally:
+            pyamf.unregister_class(A)
+
+        self.assertFalse(pyamf.BaseContext().getClassAlias(A) is unaliased)
+
     def test_object_references(self):
         x = pyamf.BaseContext()
 
@@ -526,6 +812,155 @@ class TypedObjectTestCase(unittest.TestCase):
         self.assertNotEqual(alias.klass, Foo)
 
 
+class ExtractTestCase(unittest.TestCase):
+    """
+    Tests for L{pyamf.extract}
+    """
+
+    def setUp(self):
+        self.obj = pyamf.ASObject(name='spam', seq=[1, 2, {'a': 'eggs'}])
+        self.ref = pyamf.ASObject(obj=self.obj, name='spam')
+
+    def extract(self, paths, encoding):
+        stream = pyamf.encode('foo', self.obj, self.ref, encoding=encoding)
+
+        return pyamf.extract(stream.getvalue(), paths, encoding=encoding)
+
+    def test_parse_path(self):
+        self.assertEquals(pyamf.parse_path('[0].foo[1][2].bar'),
+            [0, 'foo', 1, 2, 'bar'])
+        self.assertEquals(pyamf.parse_path('headers.Credentials'),
+            ['headers', 'Credentials'])
+
+        for path in ('', '[x]', 'foo..bar', 'foo[1', '[0]bar'):
+            self.assertRaises(ValueError, pyamf.parse_path, path)
+
+    def test_paths(self):
+        paths = ['[0]', '[1].name', '[1].seq[2].a', '[2].obj.name', '[2]']
+
+        for encoding in pyamf.ENCODING_TYPES:
+            ret = self.extract(paths, encoding)
+
+            self.assertEquals(ret['[0]'], 'foo')
+            self.assertEquals(ret['[1].name'], 'spam')
+            self.assertEquals(ret['[1].seq[2].a'], 'eggs')
+            self.assertEquals(ret['[2].obj.name'], 'spam')
+            self.assertEquals(ret['[2]'], self.ref)
+            self.assertFalse(isinstance(ret['[2]'], pyamf.LazyObject))
+
+    def test_references(self):
+        s = pyamf.ASObject(name='spam')
+        d = pyamf.ASObject(f=pyamf.ASObject(g=s))
+        d['self'] = d
+        paths = ['[0]', '[1][0]', '[1][0].name', '[0].f.g.name']
+
+        for encoding in pyamf.ENCODING_TYPES:
+            stream = pyamf.encode(d, [s], encoding=encoding)
+            ret = pyamf.extract(stream.getvalue(), paths, encoding=encoding)
+
+            self.assertEquals(ret['[1][0]'], {'name': 'spam'})
+            self.assertEquals(ret['[1][0].name'], 'spam')
+            self.assertEquals(ret['[0].f.g.name'], 'spam')
+
+            obj = ret['[0]']
+
+            self.assertEquals(type(obj['f']), pyamf.ASObject)
+            self.assertEquals(type(obj['f']['g']), pyamf.ASObject)
+            self.assertEquals(obj['f']['g'], {'name': 'spam'})
+            self.assertTrue(obj['self'] is obj)
+
+    def test_missing(self):
+        paths = ['[1].nope', '[1].seq[5]', '[0].upper', '[9]']
+
+        for encoding in pyamf.ENCODING_TYPES:
+            self.assertEquals(self.extract(paths, encoding), {})
+
+    def test_element_index(self):
+        self.assertRaises(ValueError, pyamf.extract, '', ['foo'])
+
+
+class RawAMFTestCase(unittest.TestCase):
+    """
+    Tests for L{pyamf.RawAMF} and L{pyamf.pre_encode}
+    """
+
+    def setUp(self):
+        self.obj = pyamf.ASObject(name='spam', seq=['spam', 'eggs'])
+        self.ref = pyamf.ASObject(a=self.obj, b=self.obj, name='eggs')
+
+    def splice(self, raw, encoding, use_ext):
+        stream = pyamf.encode('spam', self.obj, raw, raw, 'eggs', self.obj,
+            encoding=encoding, use_ext=use_ext)
+
+        return list(pyamf.decode(stream.getvalue(), encoding=encoding))
+
+    def test_pre_encode(self):
+        for encoding in pyamf.ENCODING_TYPES:
+            raw = pyamf.pre_encode(self.ref, encoding)
+
+            self.assertTrue(isinstance(raw, pyamf.RawAMF))
+            self.assertEquals(raw.encoding, encoding)
+            self.assertEquals(raw.objects, 5)
+            self.assertEquals(pyamf.decode(raw.data, encoding=encoding).next(),
+                self.ref)
+
+    def test_self_contained(self):
+        raw = pyamf.pre_encode(self.ref, pyamf.AMF3)
+        stream = pyamf.encode('spam', raw, encoding=pyamf.AMF3)
+
+        self.assertTrue(stream.getvalue().endswith(raw.data))
+        self.assertEquals(raw.strings, 14)
+        self.assertEquals(raw.classes, 3)
+
+    def test_splice(self):
+        for encoding in pyamf.ENCODING_TYPES:
+            raw = pyamf.pre_encode(self.ref, encoding)
+
+            for use_ext in (False, None):
+                ret = self.splice(raw, encoding, use_ext)
+
+                self.assertEquals(ret[0], 'spam')
+                self.assertEquals(ret[2], self.ref)
+                self.assertEquals(ret[3], self.ref)
+                self.assertFalse(ret[2] is ret[3])
+                self.assertFalse(ret[2]['a'] is ret[2]['b'])
+                self.assertEquals(ret[4], 'eggs')
+                self.assertTrue(ret[5] is ret[1])
+
+    def test_amf3_in_amf0(self):
+        raw = pyamf.pre_encode(self.ref, pyamf.AMF3)
+
+        for use_ext in (False, None):
+            ret = self.splice(raw, pyamf.AMF0, use_ext)
+
+            self.assertEquals(ret[2], self.ref)
+            self.assertEquals(ret[3], self.ref)
+            self.assertTrue(ret[5] is ret[1])
+
+    def test_amf0_in_amf3(self):
+        raw = pyamf.pre_encode(self.ref, pyamf.AMF0)
+
+        for use_ext in (False, None):
+            self.assertRaises(pyamf.EncodeError, pyamf.encode, raw,
+                encoding=pyamf.AMF3, use_ext=use_ext)
+
+    def test_amf0_with_amf3(self):
+        self.assertRaises(pyamf.EncodeError, pyamf.pre_encode, self.ref,
+            pyamf.AMF0, use_amf3=True)
+
+    def test_nested(self):
+        raw = pyamf.pre_encode(self.ref, pyamf.AMF3)
+        obj = pyamf.ASObject(raw=raw, ref=self.obj)
+
+        for use_ext in (False, None):
+            stream = pyamf.encode(obj, self.obj, encoding=pyamf.AMF3,
+                use_ext=use_ext)
+            ret = list(pyamf.decode(stream.getvalue(), encoding=pyamf.AMF3))
+
+            self.assertEquals(ret[0]['raw'], self.ref)
+            self.assertTrue(ret[1] is ret[0]['ref'])
+
+
 class PackageTestCase(ClassCacheClearingTestCase):
     """
     Tests for L{pyamf.register_package}
@@ -690,10 +1125,14 @@ def suite():
         UnregisterClassTestCase,
         ClassLoaderTestCase,
         TypeMapTestCase,
+        DispatchCacheTestCase,
+        CodecPoolTestCase,
         ErrorClassMapTestCase,
         RegisterAliasTypeTestCase,
         BaseContextTestCase,
         TypedObjectTestCase,
+        ExtractTestCase,
+        RawAMFTestCase,
         PackageTestCase
     ]
 
@@ -9,6 +9,7 @@ General gateway tests.
 
 import unittest
 import sys
+import threading
 
 import pyamf
 from pyamf import remoting
@@ -202,6 +203,106 @@ class BaseGatewayTestCase(unittest.TestCase):
         self.assertRaises(TypeError, gateway.BaseGateway, [])
         self.assertRaises(TypeError, gateway.BaseGateway, foo='bar')
 
+    def test_codec_pool(self):
+        x = gateway.BaseGateway()
+        self.assertTrue(isinstance(x.codec_pool, pyamf.CodecPool))
+
+        pool = pyamf.CodecPool()
+        x = gateway.BaseGateway(codec_pool=pool)
+        self.assertTrue(x.codec_pool is pool)
+
+        x = gateway.BaseGateway(codec_pool=None)
+        self.assertEquals(x.codec_pool, None)
+
+    def test_thread_pool(self):
+        x = gateway.BaseGateway()
+        self.assertEquals(x.thread_pool, None)
+
+        pool = gateway.ThreadPool()
+        x = gateway.BaseGateway(thread_pool=pool)
+        self.assertTrue(x.thread_pool is pool)
+
+    def test_thread_safe(self):
+        from pyamf.flex import messaging
+
+        gw = gateway.BaseGateway()
+        gw.addService(TestService, 'safe')
+        gw.addService(TestService, 'unsafe', thread_safe=False)
+
+        self.assertTrue(gw.services['safe'].thread_safe)
+        self.assertFalse(gw.services['unsafe'].thread_safe)
+
+        self.assertTrue(gw.isThreadSafe(remoting.Request('safe.spam')))
+        self.assertFalse(gw.isThreadSafe(remoting.Request('unsafe.spam')))
+        self.assertTrue(gw.isThreadSafe(remoting.Request('foo')))
+
+        ro = messaging.RemotingMessage(destination='unsafe', operation='spam')
+        self.assertFalse(gw.isThreadSafe(remoting.Request('null', [ro])))
+        ro.destination = 'safe'
+        self.assertTrue(gw.isThreadSafe(remoting.Request('null', [ro])))
+
+        ro = messaging.CommandMessage()
+        self.assertFalse(gw.isThreadSafe(remoting.Request('null', [ro])))
+        self.assertFalse(gw.isThreadSafe(remoting.Request('null', [])))
+
+    def test_thread_safe_lazy(self):
+        from pyamf.flex import messaging
+
+        gw = gateway.BaseGateway()
+        gw.addService(TestService, 'safe')
+
+        envelope = remoting.Envelope(pyamf.AMF3)
+        envelope['/1'] = remoting.Request('null', [messaging.RemotingMessage(
+            destination='safe', operation='spam')])
+        envelope['/2'] = remoting.Request('safe.spam', [1])
+
+        data = remoting.encode(envelope).getvalue()
+        request = remoting.decode(data, lazy=True)
+
+        # the body of a Flex message is not decoded before authentication
+        self.assertFalse(gw.isThreadSafe(request['/1']))
+        self.assertTrue(isinstance(request['/1']._body, remoting._LazyBody))
+        self.assertTrue(gw.isThreadSafe(request['/2']))
+
+        # nor are malformed bodies
+        request['/1']._body.data = '\x02\x00\x00'
+        self.assertFalse(gw.isThreadSafe(request['/1']))
+        self.assertRaises(pyamf.DecodeError, getattr, request['/1'], 'body')
+
+    def test_process_concurrently(self):
+        gw = gateway.BaseGateway(thread_pool=gateway.ThreadPool(2))
+        gw.addService(TestService, 'safe')
+        gw.addService(TestService, 'unsafe', thread_safe=False)
+
+        envelope = remoting.Envelope(pyamf.AMF0)
+        threads = {}
+
+        for i, target in enumerate(['safe.x', 'unsafe.x', 'safe.y']):
+            envelope[str(i)] = remoting.Request(target, [i])
+
+        def process(message):
+            threads[message.body[0]] = threading.currentThread()
+
+            return remoting.Response(message.body[0] * 2)
+
+        response = gw.processConcurrently(envelope, process)
+
+        self.assertEquals(response.keys(), ['0', '1', '2'])
+        self.assertEquals([x.body for k, x in response], [0, 2, 4])
+
+        self.assertTrue(threads[1] is threading.currentThread())
+        self.assertFalse(threads[0] is threading.currentThread())
+        self.assertFalse(threads[2] is threading.currentThread())
+
+        gw.thread_pool.stop()
+
+    def test_lazy_bodies(self):
+        x = gateway.BaseGateway()
+        self.assertFalse(x.lazy_bodies)
+
+        x = gateway.BaseGateway(lazy_bodies=True)
+        self.assertTrue(x.lazy_bodies)
+
     def test_add_service(self):
         gw = gateway.BaseGateway()
         self.assertEquals(gw.services, {})
@@ -445,6 +546,399 @@ class BaseGatewayTestCase(unittest.TestCase):
         self.assertTrue(gw.authenticateRequest(sr, 'spam', 'eggs'))
 
 
+class ThreadPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.pool = gateway.ThreadPool(3)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def test_create(self):
+        self.assertEquals(self.pool.size, 3)
+        self.assertEquals(gateway.ThreadPool().size, 4)
+        self.assertRaises(ValueError, gateway.ThreadPool, 0)
+
+    def test_map(self):
+        self.assertEquals(self.pool.map(lambda x: x * 2, range(10)),
+            [x * 2 for x in range(10)])
+        self.assertEquals(self.pool.map(lambda x: x, []), [])
+        self.assertEquals(len(self.pool._workers), 3)
+
+    def test_concurrent(self):
+        # each call waits for the others to start
+        started = []
+        ready = threading.Event()
+
+        def func(x):
+            started.append(x)
+
+            if len(started) == 3:
+                ready.set()
+
+            ready.wait(5)
+
+            return ready.isSet()
+
+        self.assertEquals(self.pool.map(func, range(3)), [True] * 3)
+
+    def test_error(self):
+        def func(x):
+            if x == 2:
+                raise ValueError(x)
+
+            return x
+
+        batch = self.pool.submit(func, range(4))
+
+        self.assertRaises(ValueError, batch.wait)
+        self.assertEquals(batch.results, [0, 1, None, 3])
+
+    def test_join(self):
+        event = threading.Event()
+        batch = self.pool.submit(lambda x: event.wait(5), range(2))
+
+        self.assertFalse(batch.join(0.01))
+
+        event.set()
+
+        self.assertTrue(batch.join(5))
+        self.assertTrue(batch.join(0))
+
+    def test_stop(self):
+        self.pool.map(lambda x: x, range(3))
+        workers = self.pool._workers
+
+        self.pool.stop()
+
+        self.assertEquals(self.pool._workers, [])
+
+        for t in workers:
+            self.assertFalse(t.isAlive())
+
+        # restarted on demand
+        self.assertEquals(self.pool.map(lambda x: x, [1]), [1])
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self._now = gateway._now
+        gateway._now = lambda: self.now
+
+        self.cache = gateway.LRUCache(3)
+
+    def tearDown(self):
+        gateway._now = self._now
+
+    def test_create(self):
+        self.assertEquals(self.cache.size, 3)
+        self.assertEquals(self.cache.ttl, 0)
+        self.assertRaises(ValueError, gateway.LRUCache, 0)
+
+    def test_get_set(self):
+        self.assertEquals(self.cache.get('a'), None)
+        self.assertTrue(self.cache.set('a', 1))
+        self.assertEquals(self.cache.get('a'), 1)
+
+        self.cache.set('a', 2)
+        self.assertEquals(self.cache.get('a'), 2)
+        self.assertEquals(len(self.cache), 1)
+
+        self.cache.delete('a')
+        self.cache.delete('b')
+        self.assertEquals(self.cache.get('a'), None)
+
+    def test_evict(self):
+        for key in 'abc':
+            self.cache.set(key, key)
+
+        # 'a' is now the most recently used
+        self.cache.get('a')
+        self.cache.set('d', 'd')
+
+        self.assertEquals(len(self.cache), 3)
+        self.assertEquals(self.cache.get('b'), None)
+
+        for key in 'acd':
+            self.assertEquals(self.cache.get(key), key)
+
+        self.cache.clear()
+        self.assertEquals(len(self.cache), 0)
+
+    def test_ttl(self):
+        self.cache.set('a', 1, 10)
+        self.cache.set('b', 2)
+
+        self.now += 10
+
+        self.assertEquals(self.cache.get('a'), None)
+        self.assertEquals(self.cache.get('b'), 2)
+        self.assertEquals(len(self.cache), 1)
+
+        cache = gateway.LRUCache(ttl=5)
+        cache.set('a', 1)
+        cache.set('b', 2, 20)
+
+        self.now += 5
+
+        self.assertEquals(cache.get('a'), None)
+        self.assertEquals(cache.get('b'), 2)
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def echo(*args):
+            self.calls.append(args)
+
+            return list(args)
+
+        self.echo = echo
+
+    def call(self, gw, target, *args, **kwargs):
+        envelope = remoting.Envelope(kwargs.get('encoding', pyamf.AMF3))
+        request = remoting.Request(target, list(args), envelope=envelope)
+
+        processor = gw.getProcessor(request)
+        response = processor(request)
+
+        self.assertEquals(response.status, remoting.STATUS_OK)
+
+        return response.body
+
+    def test_default(self):
+        gw = gateway.BaseGateway({'echo': self.echo})
+
+        self.assertTrue(isinstance(gw.result_cache, gateway.LRUCache))
+        self.assertEquals(gateway.BaseGateway(
+            result_cache=None).result_cache, None)
+
+        self.call(gw, 'echo', 1)
+        self.call(gw, 'echo', 1)
+
+        self.assertEquals(len(self.calls), 2)
+
+    def test_service(self):
+        gw = gateway.BaseGateway()
+        gw.addService(self.echo, 'echo', cache_ttl=0)
+
+        self.assertEquals(self.call(gw, 'echo', 1, {'a': 1, 'b': 2}),
+            [1, {'a': 1, 'b': 2}])
+        self.assertEquals(self.call(gw, 'echo', 1, {'b': 2, 'a': 1}),
+            [1, {'a': 1, 'b': 2}])
+        self.assertEquals(len(self.calls), 1)
+
+        self.call(gw, 'echo', 2)
+        self.assertEquals(len(self.calls), 2)
+
+        gw.result_cache = None
+        self.call(gw, 'echo', 2)
+        self.assertEquals(len(self.calls), 3)
+
+    def test_none(self):
+        def func():
+            self.calls.append(())
+
+        gw = gateway.BaseGateway()
+        gw.addService(func, 'func', cache_ttl=0)
+
+        self.assertEquals(self.call(gw, 'func'), None)
+        self.assertEquals(self.call(gw, 'func'), None)
+        self.assertEquals(len(self.calls), 1)
+
+    def test_decorator(self):
+        calls = self.calls
+
+        class Service(object):
+            def spam(self, x):
+                calls.append(x)
+
+                return x
+
+            def eggs(self, x):
+                calls.append(x)
+
+                return x
+
+        gateway.cacheable(Service.spam, 60)
+
+        gw = gateway.BaseGateway({'svc': Service})
+        sr = gw.getServiceRequest(remoting.Request('svc.spam'), 'svc.spam')
+
+        self.assertEquals(sr.target, 'svc.spam')
+        self.assertEquals(gw.getCachePolicy(sr), (60, False))
+
+        for i in range(2):
+            self.assertEquals(self.call(gw, 'svc.spam', 'a'), 'a')
+            self.assertEquals(self.call(gw, 'svc.eggs', 'a'), 'a')
+
+        self.assertEquals(calls, ['a', 'a', 'a'])
+        self.assertRaises(TypeError, gateway.cacheable, 'foo')
+
+    def test_error(self):
+        def fail(x):
+            self.calls.append(x)
+
+            raise ValueError(x)
+
+        gw = gateway.BaseGateway()
+        gw.addService(fail, 'fail', cache_ttl=0)
+
+        envelope = remoting.Envelope(pyamf.AMF3)
+        request = remoting.Request('fail', [1], envelope=envelope)
+
+        for i in range(2):
+            response = gw.getProcessor(request)(request)
+            self.assertEquals(response.status, remoting.STATUS_ERROR)
+
+        self.assertEquals(self.calls, [1, 1])
+
+    def test_encoded(self):
+        gw = gateway.BaseGateway()
+        gw.addService(self.echo, 'echo', cache_ttl=0, cache_encoded=True)
+
+        body = self.call(gw, 'echo', 'spam', 'spam')
+
+        self.assertTrue(isinstance(body, pyamf.RawAMF))
+        self.assertEquals(body.encoding, pyamf.AMF3)
+        self.assertTrue(self.call(gw, 'echo', 'spam', 'spam') is body)
+        self.assertEquals(len(self.calls), 1)
+
+        envelope = remoting.Envelope(pyamf.AMF3)
+        envelope['/1'] = remoting.Response(body)
+        envelope['/2'] = remoting.Response(['spam', body])
+
+        data = remoting.encode(envelope).getvalue()
+        response = remoting.decode(data)
+
+        self.assertEquals(response['/1'].body, ['spam', 'spam'])
+        self.assertEquals(response['/2'].body, ['spam', ['spam', 'spam']])
+
+    def test_encoded_versions(self):
+        gw = gateway.BaseGateway()
+        gw.addService(self.echo, 'echo', cache_ttl=0, cache_encoded=True)
+
+        amf0 = self.call(gw, 'echo', 'spam', encoding=pyamf.AMF0)
+        amf3 = self.call(gw, 'echo', 'spam', encoding=pyamf.AMF3)
+
+        self.assertEquals(amf0.encoding, pyamf.AMF0)
+        self.assertEquals(amf3.encoding, pyamf.AMF3)
+        self.assertEquals(len(self.calls), 2)
+
+        self.assertTrue(self.call(gw, 'echo', 'spam',
+            encoding=pyamf.AMF0) is amf0)
+        self.assertTrue(self.call(gw, 'echo', 'spam',
+            encoding=pyamf.AMF3) is amf3)
+        self.assertEquals(len(self.calls), 2)
+
+        envelope = remoting.Envelope(pyamf.AMF3)
+        envelope['/1'] = remoting.Response(amf3)
+        response = remoting.decode(remoting.encode(envelope).getvalue())
+
+        self.assertEquals(response['/1'].body, ['spam'])
+
+    def test_expose_request(self):
+        def echo(http_request, x):
+            self.calls.append(x)
+
+            return x
+
+        gw = gateway.BaseGateway()
+        gw.addService(gateway.expose_request(echo), 'echo', cache_ttl=0)
+
+        sr = gw.getServiceRequest(remoting.Request('echo'), 'echo')
+        self.assertEquals(gw.getCachePolicy(sr), None)
+
+        self.call(gw, 'echo', 1)
+        self.call(gw, 'echo', 1)
+        self.assertEquals(self.calls, [1, 1])
+
+        gw = gateway.BaseGateway(expose_request=True)
+        gw.addService(echo, 'echo', cache_ttl=0)
+
+        self.call(gw, 'echo', 2)
+        self.call(gw, 'echo', 2)
+        self.assertEquals(self.calls, [1, 1, 2, 2])
+
+    def test_copy(self):
+        gw = gateway.BaseGateway()
+        gw.addService(self.echo, 'echo', cache_ttl=0)
+
+        body = self.call(gw, 'echo', {'a': [1]})
+        body[0]['a'].append(2)
+        body.append('spam')
+
+        self.assertEquals(self.call(gw, 'echo', {'a': [1]}), [{'a': [1]}])
+
+        body = self.call(gw, 'echo', {'a': [1]})
+        body[0]['b'] = 3
+
+        self.assertEquals(self.call(gw, 'echo', {'a': [1]}), [{'a': [1]}])
+        self.assertEquals(len(self.calls), 1)
+
+    def test_uncopyable(self):
+        import thread
+
+        def func(x):
+            self.calls.append(x)
+
+            return thread.allocate_lock()
+
+        gw = gateway.BaseGateway()
+        gw.addService(func, 'func', cache_ttl=0)
+
+        self.call(gw, 'func', 1)
+        self.call(gw, 'func', 1)
+        self.assertEquals(self.calls, [1, 1])
+
+    def test_key(self):
+        gw = gateway.BaseGateway({'svc': TestService})
+        sr = gw.getServiceRequest(remoting.Request('svc.echo'), 'svc.echo')
+        other = gw.getServiceRequest(remoting.Request('svc.spam'), 'svc.spam')
+
+        obj = pyamf.ASObject(a=1)
+        obj['self'] = obj
+
+        key = gw.getCacheKey(sr, (1, obj))
+
+        self.assertEquals(key, gw.getCacheKey(sr, (1, obj)))
+        self.assertNotEquals(key, gw.getCacheKey(other, (1, obj)))
+        self.assertNotEquals(key, gw.getCacheKey(sr, (2, obj)))
+        self.assertNotEquals(gw.getCacheKey(sr, ('a',)),
+            gw.getCacheKey(sr, ([u'a'],)))
+
+
+class ExceedsSizeTestCase(unittest.TestCase):
+    def test_scalars(self):
+        self.assertFalse(gateway.exceeds_size(None, 10))
+        self.assertFalse(gateway.exceeds_size('spam', 10))
+        self.assertTrue(gateway.exceeds_size('spam' * 3, 10))
+        self.assertTrue(gateway.exceeds_size(1, 0))
+
+    def test_containers(self):
+        self.assertFalse(gateway.exceeds_size([1, 'a', {'b': 2}], 50))
+        self.assertTrue(gateway.exceeds_size(range(100), 50))
+        self.assertTrue(gateway.exceeds_size({'a': 'b' * 100}, 50))
+
+        obj = TestService()
+        obj.data = 'x' * 100
+
+        self.assertTrue(gateway.exceeds_size([obj], 50))
+
+    def test_references(self):
+        x = ['spam' * 10]
+        x.append(x)
+
+        self.assertFalse(gateway.exceeds_size([x] * 10, 100))
+
+    def test_raw(self):
+        raw = pyamf.pre_encode(range(100))
+
+        self.assertTrue(gateway.exceeds_size(raw, len(raw) - 1))
+        self.assertFalse(gateway.exceeds_size(raw, len(raw)))
+
+
 class QueryBrowserTestCase(unittest.TestCase):
     def test_request(self):
         gw = gateway.BaseGateway()
@@ -764,6 +1258,10 @@ def suite():
     suite.addTest(unittest.makeSuite(ServiceRequestTestCase))
     suite.addTest(unittest.makeSuite(ServiceCollectionTestCase))
     suite.addTest(unittest.makeSuite(BaseGatewayTestCase))
+    suite.addTest(unittest.makeSuite(ThreadPoolTestCase))
+    suite.addTest(unittest.makeSuite(LRUCacheTestCase))
+    suite.addTest(unittest.makeSuite(ResultCacheTestCase))
+    suite.addTest(unittest.makeSuite(ExceedsSizeTestCase))
     suite.addTest(unittest.makeSuite(QueryBrowserTestCase))
     suite.addTest(unittest.makeSuite(AuthenticatorTestCase))
     suite.addTest(unittest.makeSuite(ExposeRequestTestCase))
@@ -366,6 +366,51 @@ class ContextTextCase(unittest.TestCase):
             '\x02\x00\x01c')
 
 
+class CodecPoolTestCase(unittest.TestCase):
+    """
+    Tests for en/decoding with a L{pyamf.CodecPool}.
+    """
+
+    def setUp(self):
+        self.pool = pyamf.CodecPool()
+
+    def test_encode(self):
+        msg = remoting.Envelope(pyamf.AMF3)
+        msg['/1'] = remoting.Response(pyamf.ASObject(a='b'))
+
+        expected = remoting.encode(msg).getvalue()
+
+        for i in range(2):
+            stream = remoting.encode(msg, codec_pool=self.pool)
+
+            self.assertEquals(stream.getvalue(), expected)
+
+        self.assertEquals(len(self.pool._getIdle(
+            pyamf._get_encoder_class(pyamf.AMF0))), 1)
+
+    def test_decode(self):
+        msg = remoting.Envelope(pyamf.AMF3)
+        msg['/1'] = remoting.Request('foo', body=[pyamf.ASObject(a='b')])
+
+        data = remoting.encode(msg).getvalue()
+
+        for i in range(2):
+            msg = remoting.decode(data, codec_pool=self.pool)
+
+            self.assertEquals(msg['/1'].body, [{'a': 'b'}])
+
+        self.assertEquals(len(self.pool._getIdle(
+            pyamf._get_decoder_class(pyamf.AMF0))), 1)
+
+    def test_release_on_error(self):
+        self.assertRaises(pyamf.DecodeError, remoting.decode,
+            '\x00\x00\x00\x00\x00\x01\x00\x03foo\x00\x02/1\x00\x00\x00\x00\xff',
+            codec_pool=self.pool)
+
+        self.assertEquals(len(self.pool._getIdle(
+            pyamf._get_decoder_class(pyamf.AMF0))), 1)
+
+
 class FunctionalTestCase(unittest.TestCase):
     def test_encode_bytearray(self):
         from pyamf.amf3 import ByteArray
@@ -402,6 +447,208 @@ class ReprTestCase(unittest.TestCase):
             "BaseFault level=None code=u'\\xe5' type=u'\\xe5' description=u'\\xe5'\nTraceback:\nu'\\xe5'")
 
 
+class IncrementalDecoderTestCase(unittest.TestCase):
+    """
+    Tests for L{remoting.IncrementalDecoder}.
+    """
+
+    def setUp(self):
+        self.msg = remoting.Envelope(pyamf.AMF0)
+        self.msg.headers['spam'] = 'eggs'
+        self.msg.headers.set_required('spam')
+
+        self.msg['/1'] = remoting.Request('foo', body=[['a', 'b']])
+        self.msg['/2'] = remoting.Request('bar', body=[u'baz'])
+
+    def check(self, msg):
+        self.assertEquals(msg.amfVersion, pyamf.AMF0)
+        self.assertEquals(msg.headers['spam'], 'eggs')
+        self.assertTrue(msg.headers.is_required('spam'))
+
+        self.assertEquals(msg['/1'].target, 'foo')
+        self.assertEquals(msg['/1'].body, [['a', 'b']])
+        self.assertEquals(msg['/2'].target, 'bar')
+        self.assertEquals(msg['/2'].body, [u'baz'])
+
+    def _test_bytewise(self, strict):
+        data = remoting.encode(self.msg, strict=strict).getvalue()
+        decoder = remoting.IncrementalDecoder(strict=strict)
+        bodies = []
+
+        for x in data[:-1]:
+            bodies.extend(decoder.feed(x))
+
+        self.assertEquals([x[0] for x in bodies], ['/1'])
+        self.assertFalse(decoder.finished)
+
+        bodies.extend(decoder.feed(data[-1]))
+
+        self.assertEquals([x[0] for x in bodies], ['/1', '/2'])
+        self.assertTrue(decoder.finished)
+        self.check(decoder.envelope)
+
+    def test_bytewise(self):
+        self._test_bytewise(False)
+
+    def test_strict(self):
+        self._test_bytewise(True)
+
+    def test_whole(self):
+        decoder = remoting.IncrementalDecoder()
+
+        ret = decoder.feed(remoting.encode(self.msg).getvalue())
+
+        self.assertEquals(len(ret), 2)
+        self.assertTrue(decoder.finished)
+        self.check(decoder.envelope)
+
+    def test_declared_length(self):
+        data = remoting.encode(self.msg, strict=True).getvalue()
+        decoder = remoting.IncrementalDecoder()
+        calls = []
+
+        def read_header(*args):
+            calls.append(args)
+
+            return remoting._read_header(*args)
+
+        decoder.feed(data[:10])
+        decoder._attempt = lambda s, f, func, *args: \
+            remoting.IncrementalDecoder._attempt(decoder, s, f, read_header)
+
+        for x in data[10:21]:
+            decoder.feed(x)
+
+        self.assertEquals(calls, [])
+
+        decoder.feed(data[21])
+        self.assertEquals(len(calls), 1)
+        self.assertEquals(decoder.envelope.headers['spam'], 'eggs')
+
+    def test_version(self):
+        decoder = remoting.IncrementalDecoder()
+
+        self.assertEquals(decoder.feed('\x00'), [])
+        self.assertEquals(decoder.envelope, None)
+        self.assertRaises(pyamf.DecodeError, decoder.feed, '\x10\x00\x00')
+
+    def test_trailing(self):
+        data = remoting.encode(self.msg, strict=True).getvalue()
+        decoder = remoting.IncrementalDecoder(strict=True)
+
+        self.assertRaises(RuntimeError, decoder.feed, data + '\x00')
+
+
+class LazyDecodeTestCase(unittest.TestCase):
+    """
+    Tests for L{remoting.decode} with C{lazy=True}
+    """
+
+    def setUp(self):
+        self.msg = remoting.Envelope(pyamf.AMF0)
+        self.msg.headers['spam'] = 'eggs'
+        self.msg['/1'] = remoting.Request('echo', body=[{'a': [1, 2]}, 'b'])
+        self.msg['/2'] = remoting.Request('echo', body=[])
+        self.msg['/3'] = remoting.Response('foo')
+
+    def test_decode(self):
+        for strict in (False, True):
+            data = remoting.encode(self.msg, strict=strict).getvalue()
+            msg = remoting.decode(data, strict=strict, lazy=True)
+
+            self.assertEquals(msg.headers['spam'], 'eggs')
+            self.assertEquals(msg['/1'].target, 'echo')
+            self.assertTrue(isinstance(msg['/1']._body, remoting._LazyBody))
+            self.assertTrue(msg['/1']._body.data.startswith('\x0a'))
+            self.assertEquals(msg['/3']._body, 'foo')
+
+            self.assertEquals(msg['/1'].body, [{'a': [1, 2]}, 'b'])
+            self.assertEquals(msg['/1']._body, [{'a': [1, 2]}, 'b'])
+            self.assertEquals(msg['/2'].body, [])
+
+    def test_repr(self):
+        data = remoting.encode(self.msg, strict=True).getvalue()
+        msg = remoting.decode(data, lazy=True)
+
+        self.assertEquals(repr(msg['/2']),
+            "<Request target=u'echo'><_LazyBody 5 bytes></Request>")
+        self.assertTrue(isinstance(msg['/2']._body, remoting._LazyBody))
+
+    def test_set_body(self):
+        data = remoting.encode(self.msg).getvalue()
+        msg = remoting.decode(data, lazy=True)
+
+        msg['/1'].body = ['spam']
+        self.assertEquals(msg['/1'].body, ['spam'])
+
+    def test_error(self):
+        # the second body is malformed but has a length
+        data = ('\x00\x00\x00\x00\x00\x02\x00\x04echo\x00\x02/1\x00\x00\x00'
+            '\x05\x0a\x00\x00\x00\x00\x00\x04echo\x00\x02/2\x00\x00\x00\x08'
+            '\x0a\x00\x00\x00\x01\x07\x00\x05')
+
+        self.assertRaises(pyamf.ReferenceError, remoting.decode, data)
+
+        msg = remoting.decode(data, lazy=True)
+
+        self.assertEquals(msg['/1'].body, [])
+        self.assertRaises(pyamf.ReferenceError, getattr, msg['/2'], 'body')
+
+
+class ExtractTestCase(unittest.TestCase):
+    """
+    Tests for L{remoting.extract}
+    """
+
+    def setUp(self):
+        from pyamf.flex import messaging
+
+        self.msg = remoting.Envelope(pyamf.AMF3)
+        self.msg.headers['Credentials'] = {'userid': 'fred', 'password': 'x'}
+        self.msg['/1'] = remoting.Request('echo', body=[{'a': [1, 2]}, 'b'])
+        self.msg['/2'] = remoting.Request('null', body=[
+            messaging.RemotingMessage(operation='getUser', body=[5])])
+        self.msg['/3'] = remoting.Response(u'spam',
+            status=remoting.STATUS_ERROR)
+
+    def extract(self, paths, strict=False):
+        stream = remoting.encode(self.msg, strict=strict)
+
+        return remoting.extract(stream.getvalue(), paths, strict=strict)
+
+    def test_paths(self):
+        paths = ['headers.Credentials.userid', 'body[0].target',
+            'body[0].response', 'body[0].body[0].a[1]',
+            'body[1].body[0].operation', 'body[1].body[0].body',
+            'body[2].status', 'body[2].body']
+
+        for strict in (False, True):
+            self.assertEquals(self.extract(paths, strict), {
+                'headers.Credentials.userid': 'fred',
+                'body[0].target': 'echo',
+                'body[0].response': '/1',
+                'body[0].body[0].a[1]': 2,
+                'body[1].body[0].operation': 'getUser',
+                'body[1].body[0].body': [5],
+                'body[2].status': remoting.STATUS_ERROR,
+                'body[2].body': 'spam'
+            })
+
+    def test_skip(self):
+        for strict in (False, True):
+            self.assertEquals(self.extract(['body[1].body[0].operation'],
+                strict), {'body[1].body[0].operation': 'getUser'})
+
+    def test_missing(self):
+        paths = ['headers.spam', 'body[0].body[2]', 'body[5].target']
+
+        self.assertEquals(self.extract(paths), {})
+
+    def test_bad_path(self):
+        self.assertRaises(ValueError, remoting.extract, '', ['foo'])
+        self.assertRaises(ValueError, remoting.extract, '', ['body.target'])
+
+
 def suite():
     """
     Add tests.
@@ -414,8 +661,12 @@ def suite():
         StrictEncodingTestCase,
         FaultTestCase,
         ContextTextCase,
+        CodecPoolTestCase,
         FunctionalTestCase,
-        ReprTestCase
+        ReprTestCase,
+        IncrementalDecoderTestCase,
+        LazyDecodeTestCase,
+        ExtractTestCase
     ]
 
     for tc in test_cases:
@@ -680,6 +680,136 @@ class BufferedByteStreamTestCase(unittest.TestCase):
         self.assertEquals(a.tell(), 0)
         self.assertEquals(len(a), 3)
 
+
+class BufferWrappingTestCase(unittest.TestCase):
+    """
+    Tests for wrapping L{util.buffer_types} in a
+    L{BufferedByteStream<util.BufferedByteStream>}.
+    """
+
+    def test_shared(self):
+        buf = bytearray('spameggs')
+        x = util.BufferedByteStream(buf)
+
+        buf[0] = 'S'
+
+        self.assertEquals(len(x), 8)
+        self.assertEquals(x.read(4), 'Spam')
+        self.assertEquals(x.getvalue(), 'Spameggs')
+
+    def test_copy_on_write(self):
+        buf = bytearray('spameggs')
+        x = util.BufferedByteStream(buf)
+
+        x.seek(4)
+        x.write('ham')
+
+        self.assertEquals(x.getvalue(), 'spamhams')
+        self.assertEquals(x.tell(), 7)
+        self.assertEquals(buf, bytearray('spameggs'))
+
+        buf[0] = 'S'
+        self.assertEquals(x.getvalue(), 'spamhams')
+
+    def test_consume(self):
+        buf = bytearray('spameggs')
+        x = util.BufferedByteStream(buf)
+
+        x.seek(4)
+        x.consume()
+
+        self.assertEquals(x.getvalue(), 'eggs')
+        self.assertEquals(buf, bytearray('spameggs'))
+
+    def test_pinned(self):
+        buf = bytearray('spameggs')
+        x = util.BufferedByteStream(buf)
+
+        self.assertRaises(BufferError, buf.extend, 'x' * 4096)
+        self.assertEquals(x.read(4), 'spam')
+
+        x.write('ham')
+        buf.extend('x' * 4096)
+
+        self.assertEquals(x.getvalue(), 'spamhams')
+
+    def test_old_buffer(self):
+        buf = bytearray('spameggs')
+        x = util.BufferedByteStream(buffer(buf))
+
+        # an old style buffer cannot be pinned so it is copied
+        buf.extend('x' * 4096)
+        buf[0] = 'S'
+
+        self.assertEquals(x.getvalue(), 'spameggs')
+        self.assertEquals(x.read_view(4), 'spam')
+
+    def test_read_view(self):
+        x = util.BufferedByteStream(bytearray('spameggs'))
+
+        view = x.read_view(4)
+
+        self.assertEquals(type(view), memoryview)
+        self.assertEquals(view.tobytes(), 'spam')
+        self.assertEquals(x.tell(), 4)
+
+        self.assertRaises(IOError, x.read_view, 5)
+        self.assertEquals(x.tell(), 4)
+        self.assertEquals(x.read_view().tobytes(), 'eggs')
+
+    def test_memoryview(self):
+        x = util.BufferedByteStream(memoryview('spameggs'))
+
+        self.assertEquals(x.read_uchar(), ord('s'))
+
+        view = x.read_view(3)
+
+        self.assertEquals(type(view), memoryview)
+        self.assertEquals(view.tobytes(), 'pam')
+
+    def test_mmap(self):
+        import mmap
+        import tempfile
+
+        f = tempfile.TemporaryFile()
+        f.write('\x00\x03foo')
+        f.flush()
+
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        x = util.BufferedByteStream(m)
+
+        self.assertEquals(x.read_utf8_string(x.read_ushort()), u'foo')
+
+        x.write('bar')
+        self.assertEquals(x.getvalue(), '\x00\x03foobar')
+
+        m.close()
+        f.close()
+
+    def test_readinto(self):
+        x = util.BufferedByteStream('spameggs')
+        buf = bytearray(6)
+
+        x.seek(2)
+
+        self.assertEquals(x.readinto(buf), 6)
+        self.assertEquals(buf, bytearray('ameggs'))
+        self.assertEquals(x.tell(), 8)
+        self.assertEquals(x.readinto(buf), 0)
+
+        x.seek(5)
+        view = memoryview(buf)
+
+        self.assertEquals(x.readinto(view), 3)
+        self.assertEquals(buf, bytearray('ggsggs'))
+
+    def test_not_wrapped(self):
+        x = util.BufferedByteStream('spam')
+
+        self.assertEquals(x.read_view(2), 'sp')
+        self.assertEquals(x.read_view(), 'am')
+        self.assertRaises(IOError, x.read_view, 1)
+
     def test_append_unicode(self):
         """
         Test L{util.BufferedByteStream.append} with C{unicode} objects.
@@ -920,6 +1050,55 @@ class IndexedCollectionTestCase(unittest.TestCase):
         idx = self.collection.append(test_obj)
         self.assertEquals(id(test_obj), id(self.collection.getByReference(idx)))
 
+    def test_truncate(self):
+        a, b, c = TestObject(), TestObject(), TestObject()
+
+        self.collection.append(a)
+        self.collection.append(b)
+        self.collection.append(c)
+
+        self.collection.truncate(1)
+
+        self.assertEquals(len(self.collection), 1)
+        self.assertEquals(self.collection.getReferenceTo(a), 0)
+        self.assertEquals(self.collection.getReferenceTo(b), None)
+        self.assertEquals(self.collection.getByReference(1), None)
+
+        self.assertEquals(self.collection.append(c), 1)
+
+        self.collection.truncate(5)
+        self.assertEquals(len(self.collection), 2)
+
+
+class BufferChunksTestCase(unittest.TestCase):
+    """
+    Tests for L{util.BufferChunks}
+    """
+
+    def test_chunks(self):
+        stream = util.BufferedByteStream('spameggsham')
+        stream.seek(3)
+
+        chunks = util.BufferChunks(stream, 4)
+
+        self.assertEquals(chunks.getSize(), 11)
+        self.assertFalse(hasattr(chunks, '__len__'))
+        self.assertEquals(list(chunks), ['spam', 'eggs', 'ham'])
+        self.assertEquals(list(chunks), ['spam', 'eggs', 'ham'])
+        self.assertEquals(stream.tell(), 3)
+
+    def test_empty(self):
+        chunks = util.BufferChunks(util.BufferedByteStream())
+
+        self.assertEquals(chunks.getSize(), 0)
+        self.assertEquals(list(chunks), [])
+
+    def test_default(self):
+        stream = util.BufferedByteStream('x' * (util.CHUNK_SIZE + 1))
+
+        self.assertEquals([len(x) for x in util.BufferChunks(stream)],
+            [util.CHUNK_SIZE, 1])
+
 
 class IsClassSealedTestCase(unittest.TestCase):
     """
@@ -984,6 +1163,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'exclude_attrs': None,
             'proxy_attrs': None,
             'external': None
@@ -1008,6 +1188,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': 'foo.bar.Spam',
             'amf3': None,
+            'lazy': None,
             'proxy_attrs': None,
             'exclude_attrs': None,
             'external': None
@@ -1032,6 +1213,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'exclude_attrs': None,
             'external': None
         }
@@ -1055,6 +1237,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'static_attrs': None,
             'proxy_attrs': None,
             'external': None
@@ -1079,6 +1262,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'static_attrs': None,
             'external': None,
             'proxy_attrs': None,
@@ -1104,6 +1288,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': True,
+            'lazy': None,
             'static_attrs': None,
             'external': None
         }
@@ -1128,6 +1313,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': False,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'static_attrs': None,
             'external': None
         }
@@ -1152,6 +1338,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
             'static_attrs': None,
             'external': True
         }
@@ -1168,7 +1355,8 @@ class GetClassMetaTestCase(unittest.TestCase):
             'proxy_attrs': None,
             'amf3': True,
             'static': ['baz'],
-            'external': True
+            'external': True,
+            'lazy': True
         }
 
         class A:
@@ -1184,6 +1372,7 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': False,
             'alias': 'spam.eggs',
             'amf3': True,
+            'lazy': True,
             'exclude_attrs': ['foo'],
             'proxy_attrs': None,
             'external': True
@@ -1208,6 +1397,32 @@ class GetClassMetaTestCase(unittest.TestCase):
             'dynamic': None,
             'alias': None,
             'amf3': None,
+            'lazy': None,
+            'static_attrs': None,
+            'external': None
+        }
+
+        self.assertEquals(util.get_class_meta(A), meta)
+        self.assertEquals(util.get_class_meta(B), meta)
+
+
+    def test_lazy(self):
+        class A:
+            class __amf__:
+                lazy = True
+
+        class B(object):
+            class __amf__:
+                lazy = True
+
+        meta = {
+            'exclude_attrs': None,
+            'readonly_attrs': None,
+            'proxy_attrs': None,
+            'dynamic': None,
+            'alias': None,
+            'amf3': None,
+            'lazy': True,
             'static_attrs': None,
             'external': None
         }
@@ -1216,6 +1431,97 @@ class GetClassMetaTestCase(unittest.TestCase):
         self.assertEquals(util.get_class_meta(B), meta)
 
 
+class StreamIndexTestCase(unittest.TestCase):
+    """
+    Tests for L{util.index_stream}
+    """
+
+    def setUp(self):
+        self.obj = pyamf.ASObject(name=u'caf\xe9', seq=[1, 2, 'spam'])
+        self.elements = [u'foo', self.obj, {'obj': self.obj, 'name': 'spam'},
+            [10, self.obj], u'caf\xe9', 3.5]
+
+    def encode(self, encoding):
+        return pyamf.encode(*self.elements, **{
+            'encoding': encoding}).getvalue()
+
+    def test_elements(self):
+        for encoding in pyamf.ENCODING_TYPES:
+            data = self.encode(encoding)
+            index = util.index_stream(data, encoding)
+
+            self.assertEquals(len(index), len(self.elements))
+            self.assertEquals(index.elements[0][:2], (0, len(pyamf.encode(
+                u'foo', encoding=encoding).getvalue())))
+            self.assertEquals(index.elements[-1][1], len(data))
+
+            for i, x in enumerate(index.elements):
+                self.assertEquals(chr(x[2]), data[x[0]])
+
+    def test_read(self):
+        for encoding in pyamf.ENCODING_TYPES:
+            data = self.encode(encoding)
+            index = util.index_stream(data, encoding)
+
+            for n in (5, 3, 0, 2, 4, 1):
+                self.assertEquals(index.read(data, n), self.elements[n])
+
+            ret = index.read(data, 3)
+
+            self.assertEquals(ret[1], self.obj)
+            self.assertRaises(IndexError, index.read, data, 6)
+
+    def test_references(self):
+        data = self.encode(pyamf.AMF3)
+        index = util.index_stream(data, pyamf.AMF3)
+
+        # element 2 references the strings and object of element 1
+        self.assertEquals(index.elements[2][3:], (2, 5, 1))
+        self.assertEquals(index.traits, [(u'', 2, ())] * 2)
+
+        ret = index.read(data, 2)
+
+        self.assertEquals(ret['obj'], self.obj)
+        self.assertEquals(type(ret['obj']['name']), unicode)
+
+    def test_dump(self):
+        import pickle
+
+        for encoding in pyamf.ENCODING_TYPES:
+            data = self.encode(encoding)
+            index = util.index_stream(data, encoding)
+
+            for x in (util.load_index(index.dump()),
+                    pickle.loads(pickle.dumps(index))):
+                self.assertEquals(x.encoding, index.encoding)
+                self.assertEquals(x.elements, index.elements)
+                self.assertEquals(x.strings, index.strings)
+                self.assertEquals([(a, b, tuple(c)) for a, b, c in x.traits],
+                    index.traits)
+                self.assertEquals(x.read(data, 2), self.elements[2])
+
+        self.assertRaises(ValueError, util.load_index, 'spam')
+        self.assertRaises(ValueError, util.load_index,
+            pyamf.encode([0, 0, None, [], [], []]).getvalue())
+
+    def test_amf3_in_amf0(self):
+        stream = util.BufferedByteStream()
+        encoder = pyamf.get_encoder(pyamf.AMF0, stream)
+
+        encoder.writeElement(u'foo')
+        encoder.writeAMF3(self.obj)
+        encoder.writeAMF3(self.obj)
+        encoder.writeElement(u'bar')
+
+        data = stream.getvalue()
+        index = util.index_stream(data, pyamf.AMF0)
+
+        self.assertEquals(index.amf3_from, 1)
+
+        for n, x in enumerate([u'foo', self.obj, self.obj, u'bar']):
+            self.assertEquals(index.read(data, n), x)
+
+
 def suite():
     """
     Unit tests for AMF utilities.
@@ -1227,10 +1533,13 @@ def suite():
         StringIOProxyTestCase,
         DataTypeMixInTestCase,
         BufferedByteStreamTestCase,
+        BufferWrappingTestCase,
+        BufferChunksTestCase,
         ClassAliasTestCase,
         IndexedCollectionTestCase,
         IsClassSealedTestCase,
-        GetClassMetaTestCase
+        GetClassMetaTestCase,
+        StreamIndexTestCase
     ]
 
     try:
@@ -9,6 +9,7 @@ AMF Utilities.
 @since: 0.1.0
 """
 
+import __builtin__
 import struct
 import calendar
 import datetime
@@ -27,6 +28,11 @@ try:
 except NameError:
     from sets import Set as set
 
+try:
+    from cStringIO import StringIO as _wrap_buffer
+except ImportError:
+    _wrap_buffer = None
+
 
 #: XML types.
 xml_types = None
@@ -54,11 +60,40 @@ int_types = tuple(int_types)
 #: String types.
 str_types = tuple(str_types)
 
+buffer_types = []
+# buffer types whose memory is not pinned by an export, so it can be
+# resized or freed while a stream points at it
+_unpinned_types = []
+
+for x in ('bytearray', 'memoryview', 'buffer'):
+    if hasattr(__builtin__, x):
+        buffer_types.append(getattr(__builtin__, x))
+
+if hasattr(__builtin__, 'buffer'):
+    _unpinned_types.append(buffer)
+
+try:
+    import mmap
+except ImportError:
+    pass
+else:
+    buffer_types.append(mmap.mmap)
+    _unpinned_types.append(mmap.mmap)
+
+#: Buffer types that L{BufferedByteStream} accepts. They are wrapped without
+#: copying, except for C{buffer} and C{mmap} objects which cannot be pinned
+#: while they are wrapped and are copied instead.
+buffer_types = tuple(buffer_types)
+_unpinned_types = tuple(_unpinned_types)
+
 PosInf = 1e300000
 NegInf = -1e300000
 # we do this instead of float('nan') because windows throws a wobbler.
 NaN = PosInf / PosInf
 
+#: Default size of the chunks yielded by L{BufferChunks}.
+CHUNK_SIZE = 64 * 1024
+
 
 class StringIOProxy(object):
     """
@@ -74,12 +109,35 @@ class StringIOProxy(object):
 
     def __init__(self, buf=None):
         """
+        Objects in L{buffer_types} are wrapped read-only without being
+        copied, C{cStringIO} holds an export of the object so it cannot be
+        resized or freed while it is wrapped. The first write to the stream
+        takes a private copy. C{buffer} and C{mmap} objects cannot be pinned
+        that way and are copied.
+
         @raise TypeError: Unable to coerce C{buf} to C{StringIO}.
         """
+        self._source = None
+
+        if _wrap_buffer is not None and isinstance(buf, buffer_types) and \
+                not isinstance(buf, _unpinned_types):
+            self._buffer = _wrap_buffer(buf)
+            self._source = buf
+
+            self._get_len()
+            self._len_changed = False
+
+            return
+
         self._buffer = StringIOProxy._wrapped_class()
 
         if isinstance(buf, (str, unicode)):
             self._buffer.write(buf)
+        elif isinstance(buf, buffer_types):
+            if hasattr(buf, 'tobytes'):
+                self._buffer.write(buf.tobytes())
+            else:
+                self._buffer.write(str(buf[:]))
         elif hasattr(buf, 'getvalue'):
             self._buffer.write(buf.getvalue())
         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
@@ -135,6 +193,8 @@ class StringIOProxy(object):
         @param size: The length of the stream, in bytes.
         @type size: C{int}
         """
+        self._source = None
+
         if size == 0:
             self._buffer = StringIOProxy._wrapped_class()
             self._len_changed = True
@@ -157,9 +217,25 @@ class StringIOProxy(object):
         @param s:
         @type s:
         """
+        if self._source is not None:
+            self._own()
+
         self._buffer.write(s)
         self._len_changed = True
 
+    def _own(self):
+        """
+        Replaces a wrapped buffer with a private, writable copy.
+        """
+        pos = self._buffer.tell()
+        buf = StringIOProxy._wrapped_class()
+
+        buf.write(self._buffer.getvalue())
+        buf.seek(pos)
+
+        self._buffer = buf
+        self._source = None
+
     def _get_len(self):
         """
         Return total number of bytes in buffer.
@@ -581,6 +657,39 @@ class BufferedByteStream(StringIOProxy, DataTypeMixIn):
 
         return StringIOProxy.read(self, length)
 
+    def read_view(self, length=-1):
+        """
+        Reads C{length} bytes from the stream. If the stream wraps a buffer
+        (see L{buffer_types}) a C{memoryview} onto that buffer is returned
+        instead of a copy, which holds an export of the buffer like the
+        stream does. Otherwise this is the same as L{read}.
+
+        @raise IOError: Attempted to read past the end of the buffer.
+        @rtype: C{str} or C{memoryview}
+        @since: 0.6
+        """
+        if self._source is None:
+            return self.read(length)
+
+        pos = self.tell()
+
+        if length == -1:
+            if self.at_eof():
+                raise IOError('Attempted to read from the buffer but already '
+                    'at the end')
+
+            length = len(self) - pos
+        elif pos + length > len(self):
+            raise IOError('Attempted to read %d bytes from the buffer but '
+                'only %d remain' % (length, len(self) - pos))
+
+        self.seek(pos + length)
+
+        if hasattr(self._source, 'tobytes'):
+            return self._source[pos:pos + length]
+
+        return memoryview(self._source)[pos:pos + length]
+
     def peek(self, size=1):
         """
         Looks C{size} bytes ahead in the stream, returning what it finds,
@@ -609,6 +718,22 @@ class BufferedByteStream(StringIOProxy, DataTypeMixIn):
 
         return bytes
 
+    def readinto(self, buf):
+        """
+        Reads up to C{len(buf)} bytes from the stream into the writable
+        buffer C{buf}, e.g. a C{bytearray} or C{mmap}.
+
+        @return: The number of bytes read.
+        @rtype: C{int}
+        @since: 0.6
+        """
+        n = min(len(buf), self.remaining())
+
+        if n > 0:
+            buf[:n] = self.read(n)
+
+        return n
+
     def remaining(self):
         """
         Returns number of remaining bytes.
@@ -664,6 +789,53 @@ class BufferedByteStream(StringIOProxy, DataTypeMixIn):
         return new
 
 
+class BufferChunks(object):
+    """
+    An iterable over the contents of a stream in chunks of at most
+    C{chunk_size} bytes, to be handed to a WSGI server (or any other writer)
+    as a response body.
+
+    Each chunk is read from the stream as it is needed, as a C{str} because
+    that is what WSGI servers accept. Only the chunk being written is copied,
+    the contents are never joined into a second string the size of the
+    whole stream.
+
+    The stream position is not changed and the chunks can be iterated over
+    more than once. There is deliberately no C{len()}, WSGI servers take it
+    to be the number of chunks. Use L{getSize} for the number of bytes.
+
+    @since: 0.6
+    """
+
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+
+    def getSize(self):
+        """
+        Returns the total number of bytes in the chunks.
+
+        @rtype: C{int}
+        """
+        return len(self.stream)
+
+    def __iter__(self):
+        stream = self.stream
+        total = len(stream)
+        offset = 0
+
+        while offset < total:
+            pos = stream.tell()
+
+            stream.seek(offset)
+            chunk = stream.read(min(self.chunk_size, total - offset))
+            stream.seek(pos)
+
+            offset += len(chunk)
+
+            yield chunk
+
+
 class IndexedCollection(object):
     """
     A class that provides a quick and clean way to store references and
@@ -731,6 +903,27 @@ class IndexedCollection(object):
 
         return idx
 
+    def truncate(self, length):
+        """
+        Discards every reference from index C{length} onwards. Used by the
+        decoders to roll back the references created by a partially decoded
+        element.
+
+        @param length: The number of references to keep.
+        @type length: C{int}
+        @since: 0.6
+        """
+        if length >= len(self.list):
+            return
+
+        for obj in self.list[length:]:
+            h = self.func(obj)
+
+            if self.dict.get(h, -1) >= length:
+                del self.dict[h]
+
+        del self.list[length:]
+
     def __eq__(self, other):
         if isinstance(other, list):
             return self.list == other
@@ -981,7 +1174,8 @@ def get_class_meta(klass):
         'amf3': None,
         'dynamic': None,
         'alias': None,
-        'external': None
+        'external': None,
+        'lazy': None
     }
 
     if not hasattr(klass, '__amf__'):
@@ -996,7 +1190,7 @@ def get_class_meta(klass):
         in_func = lambda x: hasattr(a, x)
         get_func = lambda x: getattr(a, x)
 
-    for prop in ['alias', 'amf3', 'dynamic', 'external']:
+    for prop in ['alias', 'amf3', 'dynamic', 'external', 'lazy']:
         if in_func(prop):
             meta[prop] = get_func(prop)
 
@@ -1049,6 +1243,246 @@ def isNegInf(val):
     return str(float(val)) == str(NegInf)
 
 
+class _StringOffsets(IndexedCollection):
+    """
+    The string references of an AMF3 context that also records where each
+    string is in the stream, see L{index_stream}.
+
+    @ivar offsets: The C{(offset, length, is_unicode)} of each string.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+        PyIndexedCollection.__init__(self, use_hash=True)
+
+    def clear(self):
+        PyIndexedCollection.clear(self)
+
+        self.offsets = []
+
+    def append(self, obj):
+        is_unicode = isinstance(obj, unicode)
+
+        if is_unicode:
+            length = len(obj.encode('utf8'))
+        else:
+            length = len(obj)
+
+        self.offsets.append((self.stream.tell() - length, length, is_unicode))
+
+        return PyIndexedCollection.append(self, obj)
+
+    def truncate(self, length):
+        PyIndexedCollection.truncate(self, length)
+
+        del self.offsets[length:]
+
+
+class StreamIndex(object):
+    """
+    The offsets of the elements in an AMF stream and the references they
+    create, built by L{index_stream}. L{read} decodes any one element by
+    seeking straight to it, only decoding the earlier elements that it
+    references.
+
+    The index only holds numbers and strings so it can be stored alongside
+    the stream, see L{dump} and L{load_index}.
+
+    @ivar encoding: The encoding of the stream.
+    @ivar elements: The C{(start, end, marker, objects, strings, classes)} of
+        each element: its offsets, type marker and the number of object,
+        string and class (trait) references that precede it.
+    @type elements: C{list}
+    @ivar strings: The C{(offset, length, is_unicode)} of each AMF3 string
+        reference.
+    @type strings: C{list}
+    @ivar traits: The C{(name, encoding, static_properties)} of each AMF3
+        class reference.
+    @type traits: C{list}
+    @ivar amf3_from: For an AMF0 stream, the first element that uses AMF3
+        data. The references of the embedded AMF3 data are not indexed so the
+        elements after it are decoded from the start of the stream.
+    @since: 0.6
+    """
+
+    #: The version of the L{dump} format.
+    version = 1
+
+    def __init__(self, encoding, elements=None, strings=None, traits=None,
+                 amf3_from=None):
+        self.encoding = encoding
+        self.elements = elements or []
+        self.strings = strings or []
+        self.traits = traits or []
+        self.amf3_from = amf3_from
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __repr__(self):
+        return '<%s encoding=%r elements=%d at 0x%x>' % (
+            self.__class__.__name__, self.encoding, len(self.elements),
+            id(self))
+
+    def _getContext(self, stream, n, strict=False):
+        """
+        Returns a context holding the string and class references that
+        precede element C{n}.
+        """
+        context = pyamf.get_context(self.encoding)
+
+        if self.encoding != pyamf.AMF3:
+            return context
+
+        from pyamf import amf3
+
+        strings, classes = self.elements[n][4:]
+
+        for offset, length, is_unicode in self.strings[:strings]:
+            stream.seek(offset)
+            s = stream.read(length)
+
+            if is_unicode:
+                s = s.decode('utf8')
+
+            context.addString(s)
+
+        for name, encoding, static_properties in self.traits[:classes]:
+            plan = amf3.get_decode_plan(name, encoding, static_properties,
+                strict)
+            context.addClass(plan.getClassDefinition(), plan.alias.klass)
+
+        return context
+
+    def read(self, stream, n, **kwargs):
+        """
+        Decodes element C{n} of C{stream}, which must be the stream that was
+        indexed. The objects of earlier elements are decoded only if element
+        C{n} references them.
+
+        @param kwargs: Passed to L{pyamf.get_decoder}, e.g. C{strict}.
+        @raise IndexError: There is no element C{n}.
+        """
+        if not isinstance(stream, BufferedByteStream):
+            stream = BufferedByteStream(stream)
+
+        start = self.elements[n][0]
+        kwargs['use_ext'] = False
+
+        if self.amf3_from is not None and n > self.amf3_from:
+            decoder = pyamf.get_decoder(self.encoding, stream, **kwargs)
+            stream.seek(self.elements[0][0])
+
+            for i in xrange(n):
+                decoder.readElement()
+
+            return decoder.readElement()
+
+        context = self._getContext(stream, n, kwargs.get('strict', False))
+        decoder = pyamf.get_decoder(self.encoding, stream, context=context,
+            **kwargs)
+        state = decoder._getLazyState()
+
+        for i in xrange(n):
+            element = self.elements[i]
+            member = pyamf._LazyMember(element[0], element[3])
+
+            for ref in xrange(element[3], self.elements[i + 1][3]):
+                slot = pyamf._LazySlot(state, member)
+                slot.ref = decoder.context.addObject(slot)
+
+        stream.seek(start)
+
+        return decoder.readElement()
+
+    def dump(self):
+        """
+        Returns the index encoded as AMF3.
+
+        @rtype: C{str}
+        """
+        return pyamf.encode([self.version, self.encoding, self.amf3_from,
+            self.elements, self.strings, self.traits],
+            encoding=pyamf.AMF3).getvalue()
+
+
+def load_index(data):
+    """
+    Loads a L{StreamIndex} from the output of L{StreamIndex.dump}.
+
+    @raise ValueError: C{data} is not a dumped index.
+    @since: 0.6
+    """
+    try:
+        version, encoding, amf3_from, elements, strings, traits = \
+            pyamf.decode(data, encoding=pyamf.AMF3).next()
+    except (pyamf.BaseError, IOError, KeyError, TypeError, ValueError):
+        raise ValueError('Not a stream index')
+
+    if version != StreamIndex.version:
+        raise ValueError('Unsupported stream index version %r' % (version,))
+
+    # large offsets are encoded as doubles
+    elements = [tuple([int(y) for y in x]) for x in elements]
+    strings = [(int(x[0]), int(x[1]), bool(x[2])) for x in strings]
+    traits = [(x[0], x[1], list(x[2])) for x in traits]
+
+    return StreamIndex(encoding, elements, strings, traits, amf3_from)
+
+
+def index_stream(stream, encoding=None, strict=False):
+    """
+    Scans over every element of an AMF stream without decoding it, noting
+    where each element is and the references it creates.
+
+    @param encoding: Defaults to L{pyamf.DEFAULT_ENCODING}.
+    @rtype: L{StreamIndex}
+    @raise pyamf.DecodeError: Malformed stream.
+    @since: 0.6
+    """
+    if encoding is None:
+        encoding = pyamf.DEFAULT_ENCODING
+
+    if not isinstance(stream, BufferedByteStream):
+        stream = BufferedByteStream(stream)
+
+    context = pyamf.get_context(encoding)
+
+    if encoding == pyamf.AMF3:
+        context.strings = _StringOffsets(stream)
+
+    decoder = pyamf.get_decoder(encoding, stream, context=context,
+        strict=strict, lazy=True)
+    index = StreamIndex(encoding)
+
+    while not stream.at_eof():
+        start = stream.tell()
+        marker = ord(stream.peek())
+
+        if encoding == pyamf.AMF3:
+            strings, classes = len(context.strings), context.class_idx
+        else:
+            strings, classes = 0, 0
+
+        objects = len(decoder.context.objects)
+
+        decoder._skipLazyElement()
+
+        index.elements.append((start, stream.tell(), marker, objects,
+            strings, classes))
+
+        if index.amf3_from is None and hasattr(context, 'amf3_context'):
+            index.amf3_from = len(index.elements) - 1
+
+    if encoding == pyamf.AMF3:
+        index.strings = list(context.strings.offsets)
+        index.traits = [context.class_ref[i].plan.trait
+            for i in xrange(context.class_idx)]
+
+    return index
+
+
 # init the module from here ..
 
 find_xml_lib()
@@ -1122,6 +1556,12 @@ if is_float_broken():
     write_double_workaround.old_func = x
 
 
+#: The pure Python L{IndexedCollection}. Clearing it does not affect the list
+#: of references that it held.
+#: @since: 0.6
+PyIndexedCollection = IndexedCollection
+
+
 try:
     from cpyamf.util import BufferedByteStream, IndexedCollection, IndexedMap
 
@@ -81,11 +81,15 @@ def get_cpyamf_extensions():
 
         ext_modules.extend([
             Extension('cpyamf.util', ['cpyamf/util.pyx']),
+            Extension('cpyamf.codec', ['cpyamf/codec.pyx']),
+            Extension('cpyamf.amf0', ['cpyamf/amf0.pyx']),
             Extension('cpyamf.amf3', ['cpyamf/amf3.pyx'])
         ])
     except ImportError:
         ext_modules.extend([
             Extension('cpyamf.util', ['cpyamf/util.c']),
+            Extension('cpyamf.codec', ['cpyamf/codec.c']),
+            Extension('cpyamf.amf0', ['cpyamf/amf0.c']),
             Extension('cpyamf.amf3', ['cpyamf/amf3.c'])
         ])
 